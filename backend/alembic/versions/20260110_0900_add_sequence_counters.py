@@ -0,0 +1,36 @@
+"""add sequence_counters table
+
+Counters for LOT / WIP / serial numbering. Rows are created lazily and
+seeded from existing numbers on first allocation, so no data migration
+is needed.
+
+Revision ID: 20260110_0900
+Revises: 20260109_1100
+Create Date: 2026-01-10 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260110_0900'
+down_revision: Union[str, None] = '20260109_1100'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sequence_counters',
+        sa.Column('scope', sa.String(length=100), nullable=False),
+        sa.Column('last_value', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('scope'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sequence_counters')
@@ -0,0 +1,38 @@
+"""add daily_report_snapshots table
+
+Immutable per-day production and defect aggregates, written by the nightly
+materialize_daily_reports task so historical reports do not scan
+process_data.
+
+Revision ID: 20260112_0900
+Revises: 20260111_0900
+Create Date: 2026-01-12 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260112_0900'
+down_revision: Union[str, None] = '20260111_0900'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'daily_report_snapshots',
+        sa.Column('report_date', sa.Date(), nullable=False),
+        sa.Column('production', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('defects', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('report_date'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_report_snapshots')
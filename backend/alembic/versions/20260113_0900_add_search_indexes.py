@@ -0,0 +1,47 @@
+"""add full-text and trigram search indexes
+
+Stored generated tsvector over process_data.notes with a GIN index, so notes
+searches stop computing to_tsvector per row, and pg_trgm GIN indexes on
+serial, LOT and WIP numbers for substring lookups. The same structures are
+built by create_all through app.models.search_index.
+
+Revision ID: 20260113_0900
+Revises: 20260112_0900
+Create Date: 2026-01-13 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260113_0900'
+down_revision: Union[str, None] = '20260112_0900'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGRAM_INDEXES = (
+    ('idx_serials_serial_number_trgm', 'serials', 'serial_number'),
+    ('idx_lots_lot_number_trgm', 'lots', 'lot_number'),
+    ('idx_wip_items_wip_id_trgm', 'wip_items', 'wip_id'),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE process_data ADD COLUMN IF NOT EXISTS notes_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', coalesce(notes, ''))) STORED"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS idx_process_data_notes_tsv ON process_data USING gin (notes_tsv)")
+    for index, table, column in TRIGRAM_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {table} USING gin ({column} gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    for index, _, _ in TRIGRAM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+    op.execute("DROP INDEX IF EXISTS idx_process_data_notes_tsv")
+    op.execute("ALTER TABLE process_data DROP COLUMN IF EXISTS notes_tsv")
@@ -0,0 +1,40 @@
+"""gin index on process_data.measurements
+
+Measurement predicates of the dynamic filter engine compile to JSONB
+containment (@>) and key-exists (?), which only a GIN index answers.
+Databases migrated from the initial schema still store measurements as
+json; those are converted to jsonb first (rewrites the table once).
+
+Revision ID: 20260114_0900
+Revises: 20260113_0900
+Create Date: 2026-01-14 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260114_0900'
+down_revision: Union[str, None] = '20260113_0900'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        DO $$
+        BEGIN
+            IF (SELECT data_type FROM information_schema.columns
+                WHERE table_name = 'process_data' AND column_name = 'measurements') = 'json' THEN
+                ALTER TABLE process_data ALTER COLUMN measurements TYPE jsonb USING measurements::jsonb;
+            END IF;
+        END $$
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_process_data_measurements")
+    op.execute("CREATE INDEX idx_process_data_measurements ON process_data USING gin (measurements)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_process_data_measurements")
@@ -0,0 +1,90 @@
+"""keyset pagination indexes
+
+List endpoints page by a cursor over their sort key plus a unique
+tiebreaker (WHERE (created_at, id) < (:c, :i) ORDER BY created_at DESC,
+id DESC LIMIT n). The indexes below carry the full sort key after the
+equality filters of each endpoint, so every page is a short index range
+scan whatever its depth. Indexes that were a strict prefix of a new one are
+replaced under the same name; audit_logs and error_logs are created by the
+SQL schema, so their indexes are only rebuilt where the tables exist.
+
+Revision ID: 20260115_0900
+Revises: 20260114_0900
+Create Date: 2026-01-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260115_0900'
+down_revision: Union[str, None] = '20260114_0900'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index, table, keyset definition, definition before this revision or None)
+INDEXES = (
+    ('idx_lots_created_at', 'lots', '(created_at DESC, id DESC)', None),
+    ('idx_lots_production_date', 'lots', '(production_date DESC, lot_number DESC)', '(production_date)'),
+    ('idx_lots_status', 'lots', '(status, production_date DESC, lot_number DESC)', '(status)'),
+    ('idx_lots_model_date', 'lots', '(product_model_id, production_date DESC, lot_number DESC)',
+     '(product_model_id, production_date)'),
+    ('idx_serials_status', 'serials', '(status, lot_id, sequence_in_lot, id)', '(status)'),
+    ('idx_wip_items_created_at', 'wip_items', '(created_at DESC, id DESC)', None),
+    ('idx_wip_items_status', 'wip_items', '(status, created_at DESC, id DESC)', '(status)'),
+    ('idx_process_data_created_at', 'process_data', '(created_at DESC, id DESC)', None),
+    ('idx_process_data_lot', 'process_data', '(lot_id, created_at DESC, id DESC)', '(lot_id)'),
+    ('idx_process_data_process', 'process_data', '(process_id, created_at DESC, id DESC)', '(process_id)'),
+    ('idx_process_data_operator', 'process_data', '(operator_id, created_at DESC, id DESC)', '(operator_id)'),
+    ('idx_process_data_started_at', 'process_data', '(started_at, id)', '(started_at)'),
+    ('idx_process_data_incomplete', 'process_data', '(started_at, id) WHERE completed_at IS NULL', None),
+    ('idx_users_created_at', 'users', '(created_at DESC, id DESC)', None),
+    ('idx_users_role', 'users', '(role, created_at DESC, id DESC)', '(role)'),
+    ('idx_equipment_next_maintenance', 'equipment', '(next_maintenance_date, id)', None),
+    ('idx_alerts_status', 'alerts', '(status, created_at DESC, id DESC)', '(status, created_at)'),
+    ('idx_alerts_severity', 'alerts', '(severity, created_at DESC, id DESC)', '(severity, created_at)'),
+    ('idx_alerts_type', 'alerts', '(alert_type, created_at DESC, id DESC)', '(alert_type, created_at)'),
+    ('idx_alerts_lot', 'alerts', '(lot_id, created_at DESC, id DESC)', '(lot_id, created_at)'),
+    ('idx_alerts_serial', 'alerts', '(serial_id, created_at DESC, id DESC)', '(serial_id)'),
+    ('idx_alerts_created_at', 'alerts', '(created_at DESC, id DESC)', '(created_at)'),
+    ('idx_audit_logs_created_at', 'audit_logs', '(created_at DESC, id DESC)', '(created_at)'),
+    ('idx_audit_logs_action', 'audit_logs', '(action, created_at DESC, id DESC)', '(action, created_at)'),
+    ('idx_audit_logs_user_activity', 'audit_logs', '(user_id, created_at DESC, id DESC)', '(user_id, created_at)'),
+    ('idx_audit_logs_entity_history', 'audit_logs', '(entity_type, entity_id, created_at DESC, id DESC)',
+     '(entity_type, entity_id, created_at)'),
+    ('idx_error_logs_timestamp', 'error_logs', '(timestamp DESC, id DESC)', '(timestamp DESC)'),
+    ('idx_error_logs_error_code_timestamp', 'error_logs', '(error_code, timestamp DESC, id DESC)',
+     '(error_code, timestamp DESC)'),
+    ('idx_error_logs_status_code_timestamp', 'error_logs', '(status_code, timestamp DESC, id DESC)',
+     '(status_code, timestamp DESC)'),
+    ('idx_error_logs_user_id_timestamp', 'error_logs', '(user_id, timestamp DESC, id DESC) WHERE user_id IS NOT NULL',
+     '(user_id, timestamp DESC) WHERE user_id IS NOT NULL'),
+    ('idx_error_logs_path_timestamp', 'error_logs', '(path, timestamp DESC, id DESC) WHERE path IS NOT NULL',
+     '(path, timestamp DESC) WHERE path IS NOT NULL'),
+)
+
+
+def _rebuild(index: str, table: str, definition: Union[str, None]) -> None:
+    create = f"CREATE INDEX {index} ON {table} {definition};" if definition else ""
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF to_regclass('{table}') IS NOT NULL THEN
+                DROP INDEX IF EXISTS {index};
+                {create}
+            END IF;
+        END $$
+    """)
+
+
+def upgrade() -> None:
+    for index, table, definition, _ in INDEXES:
+        _rebuild(index, table, definition)
+
+
+def downgrade() -> None:
+    for index, table, _, previous in reversed(INDEXES):
+        _rebuild(index, table, previous)
@@ -0,0 +1,88 @@
+"""audit log BRIN, covering entity history and changed-values indexes
+
+audit_logs is append-only and grows with every shop-floor transaction.
+created_at gets a BRIN index for date range scans, the entity history index
+covers action and user_id (and replaces the redundant (entity_type,
+entity_id) index), and a jsonb_path_ops GIN index over
+audit_changed_values(old_values, new_values) answers changed field / value
+searches without loading history into Python. Snapshots still stored as json
+are converted to jsonb first. The same structures are built by create_all
+through app.models.audit_search.
+
+Revision ID: 20260116_0900
+Revises: 20260115_0900
+Create Date: 2026-01-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260116_0900'
+down_revision: Union[str, None] = '20260115_0900'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CHANGES_FUNCTION = """
+    CREATE OR REPLACE FUNCTION audit_changed_values(old_values jsonb, new_values jsonb)
+    RETURNS jsonb LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT coalesce(
+            jsonb_object_agg(key, jsonb_build_object('old', old_values -> key, 'new', new_values -> key)),
+            '{}'::jsonb
+        )
+        FROM (
+            SELECT jsonb_object_keys(CASE WHEN jsonb_typeof(old_values) = 'object' THEN old_values ELSE '{}' END)
+            UNION
+            SELECT jsonb_object_keys(CASE WHEN jsonb_typeof(new_values) = 'object' THEN new_values ELSE '{}' END)
+        ) AS fields (key)
+        WHERE jsonb_typeof(old_values) = 'object'
+            AND jsonb_typeof(new_values) = 'object'
+            AND old_values -> key IS DISTINCT FROM new_values -> key
+    $$
+"""
+
+
+def upgrade() -> None:
+    op.execute(CHANGES_FUNCTION)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF to_regclass('audit_logs') IS NULL THEN
+                RETURN;
+            END IF;
+            IF (SELECT data_type FROM information_schema.columns
+                WHERE table_name = 'audit_logs' AND column_name = 'old_values') = 'json' THEN
+                ALTER TABLE audit_logs
+                    ALTER COLUMN old_values TYPE jsonb USING old_values::jsonb,
+                    ALTER COLUMN new_values TYPE jsonb USING new_values::jsonb;
+            END IF;
+            DROP INDEX IF EXISTS idx_audit_logs_entity;
+            DROP INDEX IF EXISTS idx_audit_logs_entity_history;
+            CREATE INDEX idx_audit_logs_entity_history ON audit_logs
+                (entity_type, entity_id, created_at DESC, id DESC) INCLUDE (action, user_id);
+            CREATE INDEX IF NOT EXISTS idx_audit_logs_created_at_brin ON audit_logs USING brin (created_at);
+            CREATE INDEX IF NOT EXISTS idx_audit_logs_changes ON audit_logs
+                USING gin (audit_changed_values(old_values, new_values) jsonb_path_ops);
+        END $$
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        DO $$
+        BEGIN
+            IF to_regclass('audit_logs') IS NULL THEN
+                RETURN;
+            END IF;
+            DROP INDEX IF EXISTS idx_audit_logs_changes;
+            DROP INDEX IF EXISTS idx_audit_logs_created_at_brin;
+            DROP INDEX IF EXISTS idx_audit_logs_entity_history;
+            CREATE INDEX idx_audit_logs_entity_history ON audit_logs
+                (entity_type, entity_id, created_at DESC, id DESC);
+            CREATE INDEX IF NOT EXISTS idx_audit_logs_entity ON audit_logs (entity_type, entity_id);
+        END $$
+    """)
+    op.execute("DROP FUNCTION IF EXISTS audit_changed_values(jsonb, jsonb)")
@@ -0,0 +1,49 @@
+"""add error_log_hourly table
+
+Hourly error counts per error code, route template, method and status code,
+flushed by the in-memory aggregator in app.core.error_rates, so the
+/error-logs/stats queries no longer group the raw error_logs table. The last
+7 days (the longest stats range) are backfilled from error_logs; those rows
+carry concrete paths rather than route templates.
+
+Revision ID: 20260117_0900
+Revises: 20260116_0900
+Create Date: 2026-01-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260117_0900'
+down_revision: Union[str, None] = '20260116_0900'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'error_log_hourly',
+        sa.Column('hour', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('error_code', sa.String(length=20), nullable=False),
+        sa.Column('path', sa.String(length=500), nullable=False),
+        sa.Column('method', sa.String(length=10), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('hour', 'error_code', 'path', 'method', 'status_code'),
+    )
+    op.execute("""
+        INSERT INTO error_log_hourly (hour, error_code, path, method, status_code, count)
+        SELECT date_trunc('hour', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+               error_code, coalesce(path, ''), coalesce(method, ''), status_code, count(*)
+        FROM error_logs
+        WHERE timestamp >= date_trunc('hour', now()) - interval '7 days'
+        GROUP BY 1, 2, 3, 4, 5
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('error_log_hourly')
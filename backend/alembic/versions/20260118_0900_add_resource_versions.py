@@ -0,0 +1,36 @@
+"""add resource_versions table
+
+Change counters per tracked table for ETags and saved-filter cache keys,
+shared by all API processes. Rows are created lazily on the first write,
+so no data migration is needed.
+
+Revision ID: 20260118_0900
+Revises: 20260117_0900
+Create Date: 2026-01-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260118_0900'
+down_revision: Union[str, None] = '20260117_0900'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'resource_versions',
+        sa.Column('resource', sa.String(length=100), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('resource'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('resource_versions')
@@ -0,0 +1,653 @@
+"""
+Event-driven alert rules over sliding-window counters.
+
+AlertManager checks one process or machine on demand by querying
+process_data. The engine here is driven by events instead:
+    - completion: a process_data row gets its completed_at (result, duration,
+      process / equipment / operator)
+    - equipment_status: an equipment row is created or changes status
+    - error: an API error counted by app.core.error_rates
+
+Completion and equipment events are collected from committed ORM sessions
+(like the change tracker, writes that bypass the ORM are not seen); errors
+come from an error_rates subscription. Both only queue the event: rules are
+evaluated and alerts written on the engine's own thread, so a committing
+request never waits for rule evaluation or the alert insert. When the queue
+is full new events are dropped and counted (see metrics()).
+
+Each event updates the counters of the
+rules listening for its kind, keyed by the rule's scope (process_id,
+equipment_id, operator_id, ...): a ring of WINDOW_BUCKETS time buckets
+(count, failures, duration sum), a consecutive failure streak and an EWMA
+cycle-time baseline. Evaluating a rule reads those totals, so an event costs
+O(rules for its kind), independent of history.
+
+A rule fires when its condition starts to hold (it re-arms once it no longer
+does) and at most once per cooldown per key. Alerts are written through
+crud.alert; an alert with the same type and title created within the
+cooldown (by another API process) suppresses the new one.
+
+Like error_rates, counters live in the API process, so with
+``WEB_CONCURRENCY`` workers each one sees about 1/N of the events:
+    - failure_rate and cycle_time_drift are ratios of a worker's own events,
+      which estimate the same ratio as all events; min_events and
+      baseline_events are needed per worker
+    - consecutive_failures counts failures in a row among a worker's events,
+      which fires about as often for a failing process as a global streak
+    - event_count thresholds (and min_events) are declared for the whole
+      API and split evenly across the workers
+Rule evaluation latency is kept per rule (see metrics()).
+
+Example:
+    alert_engine.start()  # application startup
+
+    alert_engine.submit(AlertEvent(kind="completion", process_id=3, failed=True))
+"""
+
+import logging
+import math
+import queue
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.error_rates import error_rates
+from app.crud import alert as alert_crud
+from app.models.alert import AlertSeverity, AlertType
+from app.models.equipment import Equipment
+from app.models.process_data import ProcessData, ProcessResult
+from app.schemas.alert import AlertCreate
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "alert_engine_pending"
+
+# Time buckets per sliding window
+WINDOW_BUCKETS = 60
+# Weight of a new duration in the cycle-time baseline
+BASELINE_ALPHA = 0.02
+# Evaluation latencies kept per rule for percentiles
+LATENCY_SAMPLES = 1024
+
+EVENT_KINDS = ("completion", "equipment_status", "error")
+METRICS = ("failure_rate", "consecutive_failures", "cycle_time_drift", "event_count")
+
+
+@dataclass(frozen=True)
+class AlertEvent:
+    """
+    Something that happened on the shop floor or in the API.
+
+    Attributes:
+        kind: completion, equipment_status or error
+        at: Unix time (default: now)
+        process_id, equipment_id, operator_id, lot_id: Related entities
+        failed: Completion result was FAIL
+        duration: Completion cycle time in seconds
+        status: New equipment status
+        error_code, path, status_code: API error (path is the route template)
+    """
+
+    kind: str
+    at: float = field(default_factory=time.time)
+    process_id: Optional[int] = None
+    equipment_id: Optional[int] = None
+    operator_id: Optional[int] = None
+    lot_id: Optional[int] = None
+    failed: bool = False
+    duration: Optional[float] = None
+    status: Optional[str] = None
+    error_code: Optional[str] = None
+    path: Optional[str] = None
+    status_code: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """
+    Declarative alert rule.
+
+    Attributes:
+        name: Unique rule name
+        event: Event kind the rule listens to
+        metric: What is compared with threshold:
+            failure_rate: failed / completions in the window (> threshold)
+            consecutive_failures: failed completions in a row (>= threshold)
+            cycle_time_drift: window mean duration / baseline - 1 (> threshold)
+            event_count: matching events in the window (>= threshold)
+        threshold: Limit of the metric (event_count: for the whole API, split
+            across workers like min_events; see the module docstring)
+        scope: AlertEvent attribute the counters are kept per (None: one
+            counter); events without it are ignored
+        match: AlertEvent attribute -> accepted values; other events are ignored
+        window_seconds: Sliding window length
+        min_events: Events needed in a worker's window before the rule can fire
+        baseline_events: Durations a worker needs before cycle_time_drift can fire
+        cooldown_seconds: Minimum time between alerts of one key
+        alert_type, severity: Alert to create
+        title, message: Alert text; format fields: key, value, threshold,
+            events, window_minutes
+    """
+
+    name: str
+    event: str
+    metric: str
+    threshold: float
+    alert_type: AlertType
+    severity: AlertSeverity
+    title: str
+    message: str
+    scope: Optional[str] = None
+    match: Mapping[str, Tuple[Any, ...]] = field(default_factory=dict)
+    window_seconds: float = 3600.0
+    min_events: int = 1
+    baseline_events: int = 30
+    cooldown_seconds: float = 1800.0
+
+    def __post_init__(self) -> None:
+        if self.event not in EVENT_KINDS:
+            raise ValueError(f"Unknown event kind for rule {self.name}: {self.event}")
+        if self.metric not in METRICS:
+            raise ValueError(f"Unknown metric for rule {self.name}: {self.metric}")
+
+
+DEFAULT_RULES: Tuple[AlertRule, ...] = (
+    AlertRule(
+        name="process_failure_rate",
+        event="completion", metric="failure_rate", threshold=0.10, scope="process_id", min_events=6,
+        alert_type=AlertType.QUALITY_THRESHOLD, severity=AlertSeverity.MEDIUM,
+        title="Process {key} failure rate high",
+        message="{value:.1%} of {events} runs failed in the last {window_minutes} minutes "
+                "(threshold {threshold:.0%})",
+    ),
+    AlertRule(
+        name="process_consecutive_failures",
+        event="completion", metric="consecutive_failures", threshold=3, scope="process_id",
+        alert_type=AlertType.QUALITY_THRESHOLD, severity=AlertSeverity.HIGH,
+        title="Process {key} failed {value:.0f} times in a row",
+        message="The last {value:.0f} runs of process {key} failed",
+    ),
+    AlertRule(
+        name="equipment_consecutive_failures",
+        event="completion", metric="consecutive_failures", threshold=3, scope="equipment_id",
+        alert_type=AlertType.EQUIPMENT_FAILURE, severity=AlertSeverity.HIGH,
+        title="Equipment {key} failed {value:.0f} times in a row",
+        message="The last {value:.0f} runs on equipment {key} failed",
+    ),
+    AlertRule(
+        name="operator_failure_rate",
+        event="completion", metric="failure_rate", threshold=0.20, scope="operator_id", min_events=10,
+        alert_type=AlertType.QUALITY_THRESHOLD, severity=AlertSeverity.MEDIUM,
+        title="Operator {key} failure rate high",
+        message="{value:.1%} of {events} runs failed in the last {window_minutes} minutes "
+                "(threshold {threshold:.0%})",
+    ),
+    AlertRule(
+        name="process_cycle_time_drift",
+        event="completion", metric="cycle_time_drift", threshold=0.5, scope="process_id",
+        window_seconds=1800, min_events=5,
+        alert_type=AlertType.PROCESS_DELAY, severity=AlertSeverity.MEDIUM,
+        title="Process {key} cycle time drifting",
+        message="Mean cycle time of the last {window_minutes} minutes ({events} runs) is "
+                "{value:.0%} above the baseline",
+    ),
+    AlertRule(
+        name="equipment_cycle_time_drift",
+        event="completion", metric="cycle_time_drift", threshold=0.5, scope="equipment_id",
+        window_seconds=1800, min_events=5,
+        alert_type=AlertType.PROCESS_DELAY, severity=AlertSeverity.MEDIUM,
+        title="Equipment {key} cycle time drifting",
+        message="Mean cycle time of the last {window_minutes} minutes ({events} runs) is "
+                "{value:.0%} above the baseline",
+    ),
+    AlertRule(
+        name="equipment_down",
+        event="equipment_status", metric="event_count", threshold=1, scope="equipment_id",
+        match={"status": ("OUT_OF_SERVICE", "ERROR")}, window_seconds=60, cooldown_seconds=600,
+        alert_type=AlertType.EQUIPMENT_FAILURE, severity=AlertSeverity.HIGH,
+        title="Equipment {key} is down",
+        message="Equipment {key} went out of service",
+    ),
+    AlertRule(
+        name="server_errors",
+        event="error", metric="event_count", threshold=10, window_seconds=300, cooldown_seconds=900,
+        match={"error_code": ("SRV_001", "SRV_002", "SRV_003", "SRV_004")},
+        alert_type=AlertType.SYSTEM_ERROR, severity=AlertSeverity.HIGH,
+        title="API server errors",
+        message="{value:.0f} server errors in one API worker in the last {window_minutes} minutes",
+    ),
+)
+
+
+class SlidingWindow:
+    """Event count, failures and duration sum of the last window_seconds."""
+
+    __slots__ = (
+        "width", "head", "counts", "failures", "sums", "durations",
+        "count", "failed", "total", "timed",
+    )
+
+    def __init__(self, window_seconds: float) -> None:
+        self.width = window_seconds / WINDOW_BUCKETS
+        self.head: Optional[int] = None
+        self.counts = [0] * WINDOW_BUCKETS
+        self.failures = [0] * WINDOW_BUCKETS
+        self.sums = [0.0] * WINDOW_BUCKETS
+        self.durations = [0] * WINDOW_BUCKETS
+        self.count = self.failed = self.timed = 0
+        self.total = 0.0
+
+    def advance(self, at: float) -> None:
+        """Expire the buckets that fell out of the window at time at."""
+        index = int(at // self.width)
+        if self.head is None:
+            self.head = index
+            return
+        steps = min(index - self.head, WINDOW_BUCKETS)
+        for step in range(1, steps + 1):
+            slot = (self.head + step) % WINDOW_BUCKETS
+            self.count -= self.counts[slot]
+            self.failed -= self.failures[slot]
+            self.total -= self.sums[slot]
+            self.timed -= self.durations[slot]
+            self.counts[slot] = self.failures[slot] = self.durations[slot] = 0
+            self.sums[slot] = 0.0
+        self.head = max(self.head, index)
+
+    def add(self, at: float, failed: bool = False, duration: Optional[float] = None) -> None:
+        """Count an event (late events go into the newest bucket)."""
+        self.advance(at)
+        slot = self.head % WINDOW_BUCKETS
+        self.counts[slot] += 1
+        self.count += 1
+        if failed:
+            self.failures[slot] += 1
+            self.failed += 1
+        if duration is not None:
+            self.sums[slot] += duration
+            self.durations[slot] += 1
+            self.total += duration
+            self.timed += 1
+
+
+class _RuleState:
+    """Counters of one rule for one key."""
+
+    __slots__ = ("window", "streak", "baseline", "samples", "active", "fired_at")
+
+    def __init__(self, rule: AlertRule) -> None:
+        self.window = SlidingWindow(rule.window_seconds)
+        self.streak = 0
+        self.baseline: Optional[float] = None
+        self.samples = 0
+        self.active = False
+        self.fired_at: Optional[float] = None
+
+
+class _RuleStats:
+    """Evaluation latency and outcome counters of one rule."""
+
+    __slots__ = ("evaluations", "fired", "suppressed", "total_ns", "max_ns", "samples", "next")
+
+    def __init__(self) -> None:
+        self.evaluations = self.fired = self.suppressed = self.total_ns = self.max_ns = 0
+        self.samples: List[int] = []
+        self.next = 0
+
+    def observe(self, elapsed_ns: int) -> None:
+        self.evaluations += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        if len(self.samples) < LATENCY_SAMPLES:
+            self.samples.append(elapsed_ns)
+        else:
+            self.samples[self.next] = elapsed_ns
+            self.next = (self.next + 1) % LATENCY_SAMPLES
+
+    def summary(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] / 1000, 2)
+
+        return {
+            "evaluations": self.evaluations,
+            "fired": self.fired,
+            "suppressed": self.suppressed,
+            "mean_us": round(self.total_ns / self.evaluations / 1000, 2) if self.evaluations else None,
+            "p50_us": percentile(0.50),
+            "p99_us": percentile(0.99),
+            "max_us": round(self.max_ns / 1000, 2) if self.evaluations else None,
+        }
+
+
+class AlertEngine:
+    """
+    Thread-safe sliding-window rule evaluation over in-process events.
+
+    Args:
+        rules: Alert rules
+        session_factory: Sessions alerts are written with (default: SessionLocal)
+        workers: API worker processes sharing the events (splits event_count
+            thresholds)
+        queue_size: Events waiting for evaluation before new ones are dropped
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[AlertRule] = DEFAULT_RULES,
+        session_factory: Optional[Callable[[], Session]] = None,
+        workers: int = 1,
+        queue_size: int = 10_000,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._session_factory = session_factory
+        self.workers = max(1, workers)
+        self._queue: "queue.Queue[Optional[AlertEvent]]" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._dropped = 0
+        self._started = False
+        self._subscribed = False
+        self.set_rules(rules)
+
+    def set_rules(self, rules: Sequence[AlertRule]) -> None:
+        """Replace the rules (drops all counters)."""
+        names = [rule.name for rule in rules]
+        if len(names) != len(set(names)):
+            raise ValueError("Alert rule names must be unique")
+        rules = [_per_worker(rule, self.workers) for rule in rules]
+        with self._lock:
+            self._rules = tuple(rules)
+            self._by_event: Dict[str, Tuple[AlertRule, ...]] = {
+                kind: tuple(rule for rule in rules if rule.event == kind) for kind in EVENT_KINDS
+            }
+            self._states: Dict[Tuple[str, Any], _RuleState] = {}
+            self._stats = {rule.name: _RuleStats() for rule in rules}
+            self._events = {kind: 0 for kind in EVENT_KINDS}
+
+    def start(self) -> None:
+        """Consume completion and equipment events of committed sessions and API errors."""
+        with self._lock:
+            if self._started:
+                return
+            event.listen(Session, "after_flush", self._after_flush)
+            event.listen(Session, "after_commit", self._after_commit)
+            event.listen(Session, "after_rollback", self._after_rollback)
+            self._thread = threading.Thread(target=self._consume, name="alert-engine", daemon=True)
+            self._thread.start()
+            self._started = True
+            subscribe, self._subscribed = not self._subscribed, True
+        if subscribe:
+            error_rates.subscribe(self._on_error)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop consuming events (counters are kept).
+
+        Events already queued are evaluated first, waiting up to timeout seconds.
+        """
+        with self._lock:
+            if not self._started:
+                return
+            event.remove(Session, "after_flush", self._after_flush)
+            event.remove(Session, "after_commit", self._after_commit)
+            event.remove(Session, "after_rollback", self._after_rollback)
+            self._started = False
+            thread, self._thread = self._thread, None
+        self._queue.put(None)
+        thread.join(timeout)
+
+    def submit(self, alert_event: AlertEvent) -> bool:
+        """
+        Queue an event for evaluation on the engine's thread (never blocks).
+
+        Args:
+            alert_event: Event to consume
+
+        Returns:
+            False if the queue was full and the event was dropped
+        """
+        try:
+            self._queue.put_nowait(alert_event)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+                dropped = self._dropped
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning(f"Alert engine queue full, {dropped} events dropped so far")
+            return False
+        return True
+
+    def drain(self) -> None:
+        """Wait until every queued event has been evaluated."""
+        self._queue.join()
+
+    def publish(self, alert_event: AlertEvent) -> List[AlertCreate]:
+        """
+        Evaluate the rules of an event and write the alerts that fire.
+
+        Args:
+            alert_event: Event to consume
+
+        Returns:
+            Alerts created (after de-duplication)
+        """
+        firing: List[Tuple[AlertRule, AlertCreate]] = []
+        with self._lock:
+            self._events[alert_event.kind] += 1
+            for rule in self._by_event[alert_event.kind]:
+                started = time.perf_counter_ns()
+                alert_in = self._evaluate(rule, alert_event)
+                self._stats[rule.name].observe(time.perf_counter_ns() - started)
+                if alert_in is not None:
+                    firing.append((rule, alert_in))
+        return [alert_in for rule, alert_in in firing if self._persist(rule, alert_in)]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Rules with their evaluation latency and outcome counters, and events seen per kind."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "events": dict(self._events),
+                "queued": self._queue.qsize(),
+                "dropped": self._dropped,
+                "rules": [
+                    {
+                        "name": rule.name,
+                        "event": rule.event,
+                        "metric": rule.metric,
+                        "scope": rule.scope,
+                        "threshold": rule.threshold,
+                        "window_seconds": rule.window_seconds,
+                        "cooldown_seconds": rule.cooldown_seconds,
+                        "keys": sum(1 for name, _ in self._states if name == rule.name),
+                        **self._stats[rule.name].summary(),
+                    }
+                    for rule in self._rules
+                ],
+            }
+
+    def _evaluate(self, rule: AlertRule, alert_event: AlertEvent) -> Optional[AlertCreate]:
+        for attribute, accepted in rule.match.items():
+            if getattr(alert_event, attribute) not in accepted:
+                return None
+        key = getattr(alert_event, rule.scope) if rule.scope else None
+        if rule.scope and key is None:
+            return None
+
+        state = self._states.get((rule.name, key))
+        if state is None:
+            state = self._states[(rule.name, key)] = _RuleState(rule)
+        window = state.window
+        at = alert_event.at
+
+        if rule.metric == "failure_rate":
+            window.add(at, failed=alert_event.failed)
+            value = window.failed / window.count
+            breached = window.count >= rule.min_events and value > rule.threshold
+        elif rule.metric == "consecutive_failures":
+            window.add(at, failed=alert_event.failed)
+            state.streak = state.streak + 1 if alert_event.failed else 0
+            value = state.streak
+            breached = value >= rule.threshold
+        elif rule.metric == "cycle_time_drift":
+            if alert_event.duration is None:
+                return None
+            window.add(at, duration=alert_event.duration)
+            baseline = state.baseline
+            value = window.total / window.timed / baseline - 1 if baseline else 0.0
+            breached = (
+                state.samples >= rule.baseline_events
+                and window.timed >= rule.min_events
+                and value > rule.threshold
+            )
+            state.samples += 1
+            state.baseline = (
+                alert_event.duration if baseline is None
+                else baseline + BASELINE_ALPHA * (alert_event.duration - baseline)
+            )
+        else:
+            window.add(at)
+            value = window.count
+            breached = window.count >= rule.min_events and value >= rule.threshold
+
+        if not breached:
+            state.active = False
+            return None
+        if state.active:
+            return None
+        state.active = True
+        if state.fired_at is not None and at - state.fired_at < rule.cooldown_seconds:
+            self._stats[rule.name].suppressed += 1
+            return None
+        state.fired_at = at
+
+        fields = {
+            "key": key if key is not None else "",
+            "value": value,
+            "threshold": rule.threshold,
+            "events": window.count,
+            "window_minutes": round(rule.window_seconds / 60),
+        }
+        return AlertCreate(
+            alert_type=rule.alert_type,
+            severity=rule.severity,
+            title=rule.title.format(**fields)[:200],
+            message=rule.message.format(**fields)[:1000],
+            process_id=key if rule.scope == "process_id" else None,
+            equipment_id=str(key) if rule.scope == "equipment_id" else None,
+        )
+
+    def _persist(self, rule: AlertRule, alert_in: AlertCreate) -> bool:
+        if self._session_factory is None:
+            from app.database import SessionLocal
+            self._session_factory = SessionLocal
+        db = self._session_factory()
+        try:
+            since = datetime.utcnow() - timedelta(seconds=rule.cooldown_seconds)
+            duplicate = alert_crud.get_recent_duplicate(
+                db, alert_type=alert_in.alert_type, title=alert_in.title, since=since
+            )
+            if duplicate is None:
+                alert_crud.create(db, alert_in)
+                logger.warning(f"ALERT TRIGGERED: [{alert_in.severity.value}] {alert_in.title}")
+        except Exception as e:
+            logger.error(f"Failed to write alert for rule {rule.name}: {e}")
+            return False
+        finally:
+            db.close()
+
+        with self._lock:
+            if duplicate is None:
+                self._stats[rule.name].fired += 1
+            else:
+                self._stats[rule.name].suppressed += 1
+        return duplicate is None
+
+    # Event sources
+
+    def _consume(self) -> None:
+        while True:
+            alert_event = self._queue.get()
+            try:
+                if alert_event is None:
+                    return
+                self.publish(alert_event)
+            except Exception as e:
+                logger.error(f"Alert rule evaluation failed for {alert_event.kind} event: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _on_error(self, error_code: str, path: str, method: str, status_code: int, at: float) -> None:
+        if not self._started:
+            return
+        self.submit(AlertEvent(
+            kind="error", at=at, error_code=error_code, path=path, status_code=status_code,
+        ))
+
+    def _after_flush(self, session: Session, flush_context: Any) -> None:
+        # Attribute history still shows this flush's changes here
+        events = []
+        for obj in chain(session.new, session.dirty):
+            if isinstance(obj, ProcessData):
+                completed = inspect(obj).attrs.completed_at.history
+                if obj.completed_at is not None and (completed.added or obj in session.new):
+                    events.append(_completion_event(obj))
+            elif isinstance(obj, Equipment):
+                status = inspect(obj).attrs.status.history
+                if obj in session.new or status.added:
+                    events.append(AlertEvent(kind="equipment_status", equipment_id=obj.id, status=obj.status))
+        if events:
+            session.info.setdefault(_PENDING_KEY, []).extend(events)
+
+    def _after_commit(self, session: Session) -> None:
+        for alert_event in session.info.pop(_PENDING_KEY, ()):
+            self.submit(alert_event)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def _per_worker(rule: AlertRule, workers: int) -> AlertRule:
+    """Rule with the event count limits of an event_count rule split across workers."""
+    if rule.metric != "event_count" or workers == 1:
+        return rule
+    return replace(
+        rule,
+        threshold=math.ceil(rule.threshold / workers),
+        min_events=math.ceil(rule.min_events / workers),
+    )
+
+
+def _completion_event(process_data: ProcessData) -> AlertEvent:
+    duration = process_data.duration_seconds
+    if duration is None and process_data.started_at is not None:
+        try:
+            duration = (process_data.completed_at - process_data.started_at).total_seconds()
+        except TypeError:  # naive and aware timestamps
+            duration = None
+    return AlertEvent(
+        kind="completion",
+        process_id=process_data.process_id,
+        equipment_id=process_data.equipment_id,
+        operator_id=process_data.operator_id,
+        lot_id=process_data.lot_id,
+        failed=process_data.result == ProcessResult.FAIL.value,
+        duration=duration,
+    )
+
+
+# Global alert engine instance
+alert_engine = AlertEngine(
+    workers=settings.WEB_CONCURRENCY,
+    queue_size=settings.ALERT_ENGINE_QUEUE_SIZE,
+)
@@ -13,6 +13,8 @@ class AlertManager:
     """
     Manages system alerts and notifications.
     Checks for anomalies and triggers notifications.
+    On-demand checks; continuous monitoring is event-driven in
+    app.analytics.alert_engine.
     """
 
     def __init__(self, db: Session):
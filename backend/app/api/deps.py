@@ -6,16 +6,25 @@ All dependencies are now defined in app.core.deps.
 
 Provides:
     - get_db: Database session injection
+    - get_db_ops / get_db_analytics: Session on the operations / analytics pool
     - get_current_user: Get current authenticated user
     - get_current_active_user: Get current active user
     - get_current_admin_user: Get current admin user
     - get_current_manager_user: Get current manager/admin user
     - check_role_permission: Factory for role-based access control
+    - conditional_get: Factory for ETag / 304 revalidation of GET endpoints
+    - conditional_get_async: conditional_get for async endpoints (async session and auth)
+    - keyset_page: Factory for cursor pagination of list endpoints
+    - get_current_active_user_async / get_auth_context_async: Async auth for hot paths
+    - hot_path: Select a route's sync endpoint or its async variant
+    - no_compression: Exclude a route from response compression
 """
 
 # Re-export all dependencies from core.deps
 from app.core.deps import (
     get_db,
+    get_db_ops,
+    get_db_analytics,
     get_async_db,
     get_current_user,
     get_current_active_user,
@@ -25,10 +34,22 @@ from app.core.deps import (
     StationAuth,
     get_station_auth,
     get_auth_context,
+    get_current_user_async,
+    get_current_active_user_async,
+    get_auth_context_async,
+    hot_path,
+    conditional_get,
+    conditional_get_async,
+    KeysetPage,
+    keyset_page,
+    NEXT_CURSOR_HEADER,
+    no_compression,
 )
 
 __all__ = [
     "get_db",
+    "get_db_ops",
+    "get_db_analytics",
     "get_async_db",
     "get_current_user",
     "get_current_active_user",
@@ -38,4 +59,14 @@ __all__ = [
     "StationAuth",
     "get_station_auth",
     "get_auth_context",
+    "get_current_user_async",
+    "get_current_active_user_async",
+    "get_auth_context_async",
+    "hot_path",
+    "conditional_get",
+    "conditional_get_async",
+    "KeysetPage",
+    "keyset_page",
+    "NEXT_CURSOR_HEADER",
+    "no_compression",
 ]
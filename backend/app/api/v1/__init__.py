@@ -6,6 +6,7 @@ This package contains all version 1 API endpoint routers.
 Available routers:
     - auth: Authentication (login, logout, token refresh)
     - analytics: Dashboard metrics and reporting
+    - reports: Production reports served from daily snapshots
     - dashboard: Dashboard-specific aggregated endpoints
     - product_models: Product model management
     - processes: Manufacturing process definitions (8 processes)
@@ -24,6 +25,7 @@ Available routers:
 from app.api.v1 import (
     auth,
     analytics,
+    reports,
     dashboard,
     product_models,
     processes,
@@ -49,6 +51,7 @@ from app.api.v1 import (
 __all__ = [
     "auth",
     "analytics",
+    "reports",
     "dashboard",
     "product_models",
     "processes",
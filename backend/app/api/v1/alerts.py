@@ -5,12 +5,13 @@ This module implements RESTful API endpoints for alert management including:
     - Standard CRUD operations (GET, POST, PUT, DELETE)
     - Alert filtering by status, severity, type, date range
     - Mark single or multiple alerts as read
-    - Unread count for notification badges
+    - Unread count for notification badges, pushed to subscribed clients
 
 Endpoints:
     GET    /alerts/              - List all alerts with pagination and filters
     GET    /alerts/{id}          - Get alert by ID
     GET    /alerts/unread/count  - Get count of unread alerts
+    GET    /alerts/stream        - Server-sent events of new alerts and unread count changes
     POST   /alerts/              - Create new alert
     PUT    /alerts/{id}          - Update alert (status change)
     PUT    /alerts/{id}/read     - Mark single alert as read
@@ -22,9 +23,12 @@ from datetime import date
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.core.alert_notifications import alert_notifier
+from app.crud import alert as alert_crud
 from app.models import User
 from app.models.alert import AlertType, AlertSeverity, AlertStatus
 from app.schemas.alert import (
@@ -87,17 +91,24 @@ def list_alerts(
         None,
         description="Filter by creation date (to)",
     ),
+    approximate_total: bool = Query(
+        False,
+        description="Return the planner's row estimate as total instead of an exact count",
+    ),
+    page: deps.KeysetPage = Depends(deps.keyset_page(alert_crud.NEWEST)),
 ):
     """
     Retrieve a paginated list of alerts.
 
     Query parameters allow filtering by status, severity, type, lot, and date range.
-    Results are ordered by creation timestamp (newest first).
+    Results are ordered by creation timestamp (newest first). Pass the
+    X-Next-Cursor header of a page as ``cursor`` to get the next one without
+    skipping rows; ``approximate_total`` estimates the total from the query plan.
 
     Returns:
         AlertListResponse with alerts list, total count, and unread count
     """
-    return notification_service.list_alerts(
+    alerts = notification_service.list_alerts(
         db,
         skip=skip,
         limit=limit,
@@ -107,7 +118,11 @@ def list_alerts(
         lot_id=lot_id,
         start_date=start_date,
         end_date=end_date,
+        after=page.after,
+        approximate_total=approximate_total,
     )
+    page.respond(alerts.alerts, limit)
+    return alerts
 
 
 @router.get(
@@ -130,6 +145,37 @@ def get_unread_count(
     return notification_service.get_unread_count(db)
 
 
+@router.get(
+    "/stream",
+    summary="Stream alert notifications",
+    description="Server-sent events with new alerts and unread count changes, replacing unread count polling.",
+    response_class=StreamingResponse,
+)
+def stream_alerts(
+    *,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user),
+):
+    """
+    Subscribe to alert notifications.
+
+    The stream starts with an ``unread_count`` event and then sends
+    ``alert_created`` (the new alert) and ``unread_count`` events as alerts
+    change, plus a keepalive comment while idle.
+
+    Returns:
+        text/event-stream response
+    """
+    unread_count = alert_notifier.unread_count(db)
+    # The stream never touches the database; don't hold a connection for it
+    db.close()
+    return StreamingResponse(
+        alert_notifier.stream(unread_count),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.put(
     "/bulk-read",
     response_model=dict,
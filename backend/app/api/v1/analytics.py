@@ -28,6 +28,7 @@ from app.models import User
 from app.services.analytics_service import analytics_service
 from app.analytics.metrics_aggregator import MetricsAggregator
 from app.analytics.alert_manager import AlertManager
+from app.analytics.alert_engine import alert_engine
 
 
 router = APIRouter()
@@ -35,7 +36,7 @@ router = APIRouter()
 
 @router.get("/operations/metrics")
 def get_operations_metrics(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -44,6 +45,21 @@ def get_operations_metrics(
     return MetricsAggregator.get_realtime_dashboard_metrics(db)
 
 
+@router.get("/alert-rules")
+def get_alert_rules(
+    current_user: User = Depends(deps.get_current_admin_user),
+) -> Any:
+    """
+    Get the event-driven alert rules of this API process.
+
+    Per rule: definition (event_count thresholds as applied in one worker),
+    keys tracked, alerts fired / suppressed and evaluation latency (mean,
+    p50, p99, max in microseconds). Also events seen per kind, and events
+    queued for evaluation or dropped because the queue was full.
+    """
+    return alert_engine.metrics()
+
+
 @router.websocket("/ws/metrics/live")
 async def websocket_live_metrics(websocket: WebSocket):
     """
@@ -54,8 +70,8 @@ async def websocket_live_metrics(websocket: WebSocket):
     try:
         while True:
             # Create a fresh DB session for each iteration to avoid stale data
-            from app.database import SessionLocal
-            db = SessionLocal()
+            from app.database import AnalyticsSessionLocal
+            db = AnalyticsSessionLocal()
             try:
                 metrics = MetricsAggregator.get_realtime_dashboard_metrics(db)
                 await websocket.send_json(metrics)
@@ -76,7 +92,7 @@ async def websocket_live_metrics(websocket: WebSocket):
 
 @router.get("/dashboard")
 def get_dashboard_summary(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -96,7 +112,7 @@ def get_dashboard_summary(
 def get_production_statistics(
     start_date: Optional[date] = Query(None, description="Start date for statistics"),
     end_date: Optional[date] = Query(None, description="End date for statistics"),
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -118,7 +134,7 @@ def get_production_statistics(
 
 @router.get("/process-performance")
 def get_process_performance(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -137,7 +153,7 @@ def get_process_performance(
 def get_quality_metrics(
     start_date: Optional[date] = Query(None, description="Start date for metrics"),
     end_date: Optional[date] = Query(None, description="End date for metrics"),
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -160,7 +176,7 @@ def get_quality_metrics(
 @router.get("/operator-performance")
 def get_operator_performance(
     days: int = Query(7, description="Number of days to analyze", ge=1, le=90),
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -176,7 +192,7 @@ def get_operator_performance(
 
 @router.get("/realtime-status")
 def get_realtime_status(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -189,7 +205,7 @@ def get_realtime_status(
 
 @router.get("/defects")
 def get_defects_analysis(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     start_date: Optional[date] = Query(None, description="Start date for analysis"),
     end_date: Optional[date] = Query(None, description="End date for analysis"),
     current_user: User = Depends(deps.get_current_active_user),
@@ -213,7 +229,7 @@ def get_defects_analysis(
 
 @router.get("/defect-trends")
 def get_defect_trends(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     period: str = Query("daily", description="Aggregation period: daily, weekly, monthly"),
     days: int = Query(30, ge=1, le=365, description="Number of days to analyze"),
     current_user: User = Depends(deps.get_current_active_user),
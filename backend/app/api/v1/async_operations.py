@@ -1,17 +1,26 @@
+import os
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Depends, BackgroundTasks
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.api import deps
 from app.models import User
 from app.models.job import ProcessJob
-from app.tasks.process_tasks import complete_process_batch, export_process_data
-from app.core.celery_app import celery_app
-from app.core.exceptions import ResourceNotFoundException
+from app.core.exceptions import ResourceNotFoundException, StateConflictException, ValidationException
+from app.services.export_service import ExportQuery, export_service
 
 router = APIRouter()
 
+
+def _process_tasks():
+    """Import Celery and the task module on first use (keeps API startup fast)."""
+    from app.tasks import process_tasks
+    return process_tasks
+
+
 # --- Schemas ---
 class BatchCompleteRequest(BaseModel):
     lot_id: int
@@ -19,9 +28,13 @@ class BatchCompleteRequest(BaseModel):
     batch_data: List[Dict[str, Any]]
 
 class ExportRequest(BaseModel):
-    start_date: str
-    end_date: str
+    start_date: datetime
+    end_date: datetime
     format: str = "csv"
+    source: str = "process_data"
+    gzip: bool = True
+    process_id: Optional[int] = None
+    lot_id: Optional[int] = None
 
 # --- Endpoints ---
 
@@ -36,7 +49,7 @@ def batch_complete_process(
     Returns a Job ID to track progress.
     """
     # 1. Trigger Celery Task
-    task = complete_process_batch.delay(
+    task = _process_tasks().complete_process_batch.delay(
         lot_id=request.lot_id,
         process_id=request.process_id,
         batch_data=request.batch_data
@@ -72,30 +85,57 @@ def export_data(
 ):
     """
     Trigger asynchronous data export.
+
+    The file is written by a background job; fetch it from download_url
+    once the job is COMPLETED.
     """
-    task = export_process_data.delay(
-        start_date=request.start_date,
-        end_date=request.end_date,
-        format=request.format
-    )
-    
-    job = ProcessJob(
-        task_id=task.id,
-        job_type="DATA_EXPORT",
-        status="QUEUED",
-        params=request.dict()
-    )
-    db.add(job)
-    db.commit()
-    db.refresh(job)
-    
+    try:
+        query = ExportQuery(
+            source=request.source,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            process_id=request.process_id,
+            lot_id=request.lot_id,
+        )
+        job = export_service.queue_job(db, query, request.format, request.gzip)
+    except ValueError as e:
+        raise ValidationException(str(e))
+
     return {
         "job_id": job.id,
-        "task_id": task.id,
+        "task_id": job.task_id,
         "status": "QUEUED",
-        "status_url": f"/api/v1/async/jobs/{job.id}"
+        "status_url": f"/api/v1/async/jobs/{job.id}",
+        "download_url": f"/api/v1/async/exports/{job.id}/download"
     }
 
+@router.get("/exports/{job_id}/download")
+def download_export(
+    job_id: int,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user),
+):
+    """
+    Download a completed export file.
+
+    Supports Range requests (206 Partial Content) for resumable downloads.
+    """
+    job = db.get(ProcessJob, job_id)
+    if not job or job.job_type != "DATA_EXPORT":
+        raise ResourceNotFoundException(resource_type="Export", resource_id=job_id)
+    if job.status != "COMPLETED":
+        raise StateConflictException(f"Export {job_id} is not ready (status: {job.status})")
+
+    path = export_service.job_path(job)
+    if not os.path.exists(path):
+        raise ResourceNotFoundException(resource_type="Export file", resource_id=job_id)
+
+    return FileResponse(
+        path,
+        media_type=job.result["media_type"],
+        filename=job.result["filename"],
+    )
+
 @router.get("/jobs/{job_id}")
 def get_job_status(
     job_id: int,
@@ -108,9 +148,20 @@ def get_job_status(
     job = db.query(ProcessJob).get(job_id)
     if not job:
         raise ResourceNotFoundException(resource_type="Job", resource_id=job_id)
-        
+
+    # Export jobs record their own status and progress on the job
+    if job.job_type == "DATA_EXPORT":
+        return {
+            "job_id": job.id,
+            "task_id": job.task_id,
+            "status": job.status,
+            "progress": job.result if job.status == "PROCESSING" else None,
+            "result": job.result,
+            "error": job.error_message
+        }
+
     # Check Celery status
-    task_result = celery_app.AsyncResult(job.task_id)
+    task_result = _process_tasks().celery_app.AsyncResult(job.task_id)
     
     # Update local DB status if changed
     if task_result.state != job.status:
@@ -19,6 +19,8 @@ READ-ONLY API DESIGN:
         - Only GET endpoints are implemented (no POST/PUT/PATCH/DELETE)
         - No create_audit or update_audit functions in CRUD layer
         - API schema does not expose create/update operations
+        - Reads use the analytics pool (deps.get_db_analytics), so long history
+          scans are not cut off by the operations statement timeout
 
     3. Compliance Requirements:
         - Immutable audit trail required for regulatory compliance
@@ -35,6 +37,16 @@ ENDPOINTS:
         Returns:
             - List[AuditLogInDB]: Audit log entries
 
+    GET /audit-logs/changes
+        Search UPDATEs that changed a field, filtered in the database
+        Query parameters:
+            - field: str - Changed field name (e.g. target_quantity)
+            - old_value / new_value: str (optional) - Value before / after (JSON literal or string)
+            - entity_type, entity_id, user_id, start_date, end_date (optional) - Narrowing filters
+            - skip, limit, cursor - Pagination
+        Returns:
+            - List[AuditLogInDB]: Matching changes, most recent first
+
     GET /audit-logs/{id}
         Get a single audit log by ID
         Path parameters:
@@ -143,16 +155,21 @@ Example Usage:
 
     # Get complete history of serial 789
     GET /api/v1/audit-logs/entity/serials/789/history
+
+    # Who changed the target quantity of lot 123
+    GET /api/v1/audit-logs/changes?field=target_quantity&entity_type=lots&entity_id=123
 """
 
+import json
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, Path, Query, status
 from sqlalchemy.orm import Session
 
 from app import crud
 from app.api import deps
+from app.core.responses import FastJSONResponse, trusted_json
 from app.models import User
 from app.models.audit_log import AuditAction
 from app.schemas.audit_log import AuditLogInDB
@@ -195,9 +212,10 @@ router = APIRouter(
 def list_audit_logs(
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
-    db: Session = Depends(deps.get_db),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.audit_log.NEWEST)),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
-) -> List[AuditLogInDB]:
+) -> FastJSONResponse:
     """
     List all audit logs with pagination.
 
@@ -206,6 +224,7 @@ def list_audit_logs(
     Query Parameters:
         - skip: Number of records to skip for pagination (default: 0)
         - limit: Maximum number of records to return (default: 100, max: 100)
+        - cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of AuditLogInDB objects ordered by created_at descending
@@ -215,7 +234,95 @@ def list_audit_logs(
         They cannot be created, modified, or deleted via API. This endpoint
         provides read-only access for compliance and audit analysis.
     """
-    return crud.audit_log.get_multi(db, skip=skip, limit=limit)
+    rows = crud.audit_log.get_multi_rows(db, skip=skip, limit=limit, after=page.after)
+    return trusted_json(page.respond(rows, limit), page.response)
+
+
+def _snapshot_value(raw: str) -> Any:
+    """Read a value filter as JSON (100, true, null, "A"), else as a plain string."""
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+
+@router.get(
+    "/changes",
+    response_model=List[AuditLogInDB],
+    status_code=status.HTTP_200_OK,
+    summary="Search field changes",
+    responses={
+        200: {
+            "description": "UPDATE audit logs that changed the field, most recent first",
+        },
+        400: {
+            "description": "Invalid date range",
+            "example": {"detail": "start_date must be before end_date"}
+        }
+    }
+)
+def search_field_changes(
+    field: str = Query(..., min_length=1, max_length=100, description="Changed field name, e.g. target_quantity"),
+    old_value: Optional[str] = Query(None, description="Value before the change (JSON literal or plain string)"),
+    new_value: Optional[str] = Query(None, description="Value after the change (JSON literal or plain string)"),
+    entity_type: Optional[str] = Query(None, max_length=50, description="Entity type, e.g. lots"),
+    entity_id: Optional[int] = Query(None, gt=0, description="Entity record ID"),
+    user_id: Optional[int] = Query(None, gt=0, description="User who made the change"),
+    start_date: Optional[datetime] = Query(None, description="Start of date range (inclusive)"),
+    end_date: Optional[datetime] = Query(None, description="End of date range (inclusive)"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
+    limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.audit_log.NEWEST)),
+    db: Session = Depends(deps.get_db_analytics),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> List[AuditLogInDB]:
+    """
+    Find UPDATEs that changed a field, optionally from or to a given value.
+
+    The search runs in the database against the changed-values index, so
+    "who changed target_quantity on this LOT" does not load the entity's
+    history.
+
+    Query Parameters:
+        - field: Changed field name (a key of old_values / new_values)
+        - old_value / new_value: Value before / after the change. Parsed as JSON
+          (100, true, null, "A"), otherwise taken as a plain string
+        - entity_type, entity_id, user_id: Narrow to an entity or a user
+        - start_date / end_date: Date range (inclusive)
+        - skip, limit, cursor: Pagination as on the other audit log lists
+
+    Returns:
+        List of AuditLogInDB objects, most recent first
+
+    Example:
+        Who set LOT 123's target quantity to 50:
+        GET /api/v1/audit-logs/changes?field=target_quantity&new_value=50&entity_type=lots&entity_id=123
+    """
+    if start_date and end_date and start_date > end_date:
+        raise ValidationException(
+            message="start_date must be before or equal to end_date"
+        )
+
+    values = {}
+    if old_value is not None:
+        values["old_value"] = _snapshot_value(old_value)
+    if new_value is not None:
+        values["new_value"] = _snapshot_value(new_value)
+
+    records = crud.audit_log.get_field_changes(
+        db,
+        field=field,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+        skip=skip,
+        limit=limit,
+        after=page.after,
+        **values,
+    )
+    return page.respond(records, limit)
 
 
 @router.get(
@@ -236,7 +343,7 @@ def list_audit_logs(
 )
 def get_audit_log(
     id: int = Path(..., gt=0, description="Audit log ID"),
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
 ) -> AuditLogInDB:
     """
     Get a single audit log entry by ID.
@@ -287,7 +394,8 @@ def get_entity_audit_logs(
     ),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
-    db: Session = Depends(deps.get_db),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.audit_log.NEWEST)),
+    db: Session = Depends(deps.get_db_analytics),
 ) -> List[AuditLogInDB]:
     """
     Get all audit logs for a specific entity.
@@ -300,6 +408,7 @@ def get_entity_audit_logs(
         - entity_id: Primary key of the entity record
         - skip: Number of records to skip for pagination (default: 0)
         - limit: Maximum records to return (default: 100, max: 100)
+        - cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of AuditLogInDB objects for the specified entity, most recent first
@@ -312,13 +421,15 @@ def get_entity_audit_logs(
         This provides a complete change history for compliance analysis.
         Logs are immutable - they cannot be modified or deleted.
     """
-    return crud.audit_log.get_by_entity(
+    records = crud.audit_log.get_by_entity(
         db,
         entity_type=entity_type,
         entity_id=entity_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        after=page.after,
     )
+    return page.respond(records, limit)
 
 
 @router.get(
@@ -340,7 +451,8 @@ def get_user_activity(
     ),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
-    db: Session = Depends(deps.get_db),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.audit_log.NEWEST)),
+    db: Session = Depends(deps.get_db_analytics),
 ) -> List[AuditLogInDB]:
     """
     Get all audit logs for actions performed by a user.
@@ -352,6 +464,7 @@ def get_user_activity(
         - user_id: ID of the user
         - skip: Number of records to skip for pagination (default: 0)
         - limit: Maximum records to return (default: 100, max: 100)
+        - cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of AuditLogInDB objects for actions by the user, most recent first
@@ -364,12 +477,14 @@ def get_user_activity(
         Useful for user accountability analysis and security auditing.
         Logs are immutable and cannot be deleted.
     """
-    return crud.audit_log.get_by_user(
+    records = crud.audit_log.get_by_user(
         db,
         user_id=user_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        after=page.after,
     )
+    return page.respond(records, limit)
 
 
 @router.get(
@@ -395,7 +510,8 @@ def get_logs_by_action(
     ),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
-    db: Session = Depends(deps.get_db),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.audit_log.NEWEST)),
+    db: Session = Depends(deps.get_db_analytics),
 ) -> List[AuditLogInDB]:
     """
     Get audit logs filtered by action type.
@@ -407,6 +523,7 @@ def get_logs_by_action(
         - action: Action type ('CREATE', 'UPDATE', or 'DELETE')
         - skip: Number of records to skip for pagination (default: 0)
         - limit: Maximum records to return (default: 100, max: 100)
+        - cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of AuditLogInDB objects for the specified action, most recent first
@@ -430,12 +547,14 @@ def get_logs_by_action(
         )
 
     try:
-        return crud.audit_log.get_by_action(
+        records = crud.audit_log.get_by_action(
             db,
             action=action.upper(),
             skip=skip,
-            limit=limit
+            limit=limit,
+            after=page.after,
         )
+        return page.respond(records, limit)
     except ValueError as e:
         raise ValidationException(message=str(e))
 
@@ -466,7 +585,8 @@ def get_logs_by_date_range(
     ),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
-    db: Session = Depends(deps.get_db),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.audit_log.NEWEST)),
+    db: Session = Depends(deps.get_db_analytics),
 ) -> List[AuditLogInDB]:
     """
     Get audit logs within a specific date range.
@@ -479,6 +599,7 @@ def get_logs_by_date_range(
         - end_date: End of range (inclusive), ISO 8601 format (e.g., 2025-11-18T23:59:59Z)
         - skip: Number of records to skip for pagination (default: 0)
         - limit: Maximum records to return (default: 100, max: 100)
+        - cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of AuditLogInDB objects within the date range, most recent first
@@ -500,13 +621,15 @@ def get_logs_by_date_range(
             message="start_date must be before or equal to end_date"
         )
 
-    return crud.audit_log.get_by_date_range(
+    records = crud.audit_log.get_by_date_range(
         db,
         start_date=start_date,
         end_date=end_date,
         skip=skip,
-        limit=limit
+        limit=limit,
+        after=page.after,
     )
+    return page.respond(records, limit)
 
 
 @router.get(
@@ -534,7 +657,8 @@ def get_entity_change_history(
     ),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
-    db: Session = Depends(deps.get_db),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.audit_log.NEWEST)),
+    db: Session = Depends(deps.get_db_analytics),
 ) -> List[AuditLogInDB]:
     """
     Get the complete change history for a specific entity.
@@ -552,6 +676,7 @@ def get_entity_change_history(
         - entity_id: Primary key of the entity record
         - skip: Number of records to skip for pagination (default: 0)
         - limit: Maximum records to return (default: 100, max: 100)
+        - cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of AuditLogInDB objects representing the complete history, most recent first
@@ -575,10 +700,12 @@ def get_entity_change_history(
         - Understanding record lifecycle
         - Security incident investigation
     """
-    return crud.audit_log.get_entity_history(
+    records = crud.audit_log.get_entity_history(
         db,
         entity_type=entity_type,
         entity_id=entity_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        after=page.after,
     )
+    return page.respond(records, limit)
@@ -24,10 +24,20 @@ from app.services.analytics_service import analytics_service
 
 router = APIRouter()
 
-
-@router.get("/summary")
+# ETag revalidation: dashboard polls get 304 Not Modified while no production
+# data changed (per day, as the endpoints default to today). Dashboards read
+# on the analytics pool, so the versions are read there too.
+dashboard_not_modified = deps.conditional_get(
+    "wip_items", "lots", "processes", "process_data", "product_models",
+    auth=deps.get_current_active_user,
+    per_day=True,
+    get_session=deps.get_db_analytics,
+)
+
+
+@router.get("/summary", dependencies=[Depends(dashboard_not_modified)])
 def get_dashboard_summary(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     target_date: Optional[str] = Query(None, description="Target date (default: today, format: YYYY-MM-DD)"),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
@@ -59,9 +69,9 @@ def get_dashboard_summary(
     return analytics_service.get_dashboard_summary(db, target_date_obj)
 
 
-@router.get("/lots")
+@router.get("/lots", dependencies=[Depends(dashboard_not_modified)])
 def get_dashboard_lots(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     status: Optional[LotStatus] = Query(None, description="Filter by LOT status"),
     limit: int = Query(20, ge=1, le=100, description="Maximum LOTs to return"),
     current_user: User = Depends(deps.get_current_active_user),
@@ -82,9 +92,9 @@ def get_dashboard_lots(
     return analytics_service.get_dashboard_lots(db, status, limit)
 
 
-@router.get("/process-wip")
+@router.get("/process-wip", dependencies=[Depends(dashboard_not_modified)])
 def get_process_wip(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -99,9 +109,9 @@ def get_process_wip(
     return analytics_service.get_process_wip(db)
 
 
-@router.get("/cycle-times")
+@router.get("/cycle-times", dependencies=[Depends(dashboard_not_modified)])
 def get_cycle_times(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     days: int = Query(7, ge=1, le=30, description="Number of days to analyze"),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
@@ -31,6 +31,7 @@ from fastapi import APIRouter, Depends, Query, status, Path
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.crud import equipment as equipment_crud
 from app.models import User
 from app.schemas.equipment import (
     EquipmentCreate,
@@ -50,16 +51,21 @@ router = APIRouter(
     },
 )
 
+# ETag revalidation: polls get 304 Not Modified while no equipment changed
+equipment_not_modified = deps.conditional_get("equipment", auth=deps.get_current_active_user)
+
 
 @router.get(
     "/",
     response_model=List[EquipmentInDB],
     summary="List all equipment",
     description="Retrieve a paginated list of all equipment ordered by equipment code (ascending)",
+    dependencies=[Depends(equipment_not_modified)],
 )
 def list_equipment(
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(equipment_crud.BY_CODE)),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> List[EquipmentInDB]:
@@ -71,13 +77,15 @@ def list_equipment(
     Args:
         skip: Number of records to skip (offset) for pagination.
         limit: Maximum number of records to return.
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
         current_user: Current authenticated user (injected via dependency).
 
     Returns:
         List[EquipmentInDB]: List of equipment records with database fields.
     """
-    return equipment_service.list_equipment(db, skip=skip, limit=limit)
+    return page.respond(equipment_service.list_equipment(db, skip=skip, limit=limit, after=page.after), limit)
 
 
 @router.get(
@@ -85,10 +93,12 @@ def list_equipment(
     response_model=List[EquipmentInDB],
     summary="List active equipment",
     description="Retrieve paginated list of active equipment (is_active=True)",
+    dependencies=[Depends(equipment_not_modified)],
 )
 def get_active_equipment(
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(equipment_crud.BY_CODE)),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> List[EquipmentInDB]:
@@ -100,13 +110,20 @@ def get_active_equipment(
     Args:
         skip: Number of records to skip (offset) for pagination.
         limit: Maximum number of records to return.
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
         current_user: Current authenticated user (injected via dependency).
 
     Returns:
         List[EquipmentInDB]: List of active equipment records.
     """
-    return equipment_service.get_active_equipment(db, skip=skip, limit=limit)
+    return page.respond(
+        equipment_service.get_active_equipment(
+            db, skip=skip, limit=limit, after=page.after
+        ),
+        limit,
+    )
 
 
 @router.get(
@@ -114,10 +131,12 @@ def get_active_equipment(
     response_model=List[EquipmentInDB],
     summary="Get equipment needing maintenance",
     description="Retrieve equipment where next_maintenance_date has passed",
+    dependencies=[Depends(equipment_not_modified)],
 )
 def get_equipment_needs_maintenance(
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(equipment_crud.BY_MAINTENANCE_DATE)),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> List[EquipmentInDB]:
@@ -129,13 +148,20 @@ def get_equipment_needs_maintenance(
     Args:
         skip: Number of records to skip (offset) for pagination.
         limit: Maximum number of records to return.
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
         current_user: Current authenticated user (injected via dependency).
 
     Returns:
         List[EquipmentInDB]: List of equipment needing maintenance.
     """
-    return equipment_service.get_equipment_needs_maintenance(db, skip=skip, limit=limit)
+    return page.respond(
+        equipment_service.get_equipment_needs_maintenance(
+            db, skip=skip, limit=limit, after=page.after
+        ),
+        limit,
+    )
 
 
 @router.get(
@@ -143,11 +169,13 @@ def get_equipment_needs_maintenance(
     response_model=List[EquipmentInDB],
     summary="Filter equipment by type",
     description="Retrieve paginated list of equipment filtered by type",
+    dependencies=[Depends(equipment_not_modified)],
 )
 def get_equipment_by_type(
     equipment_type: str = Path(..., min_length=1, description="Equipment type (e.g., LASER_MARKER, SENSOR)"),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(equipment_crud.BY_CODE)),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> List[EquipmentInDB]:
@@ -160,13 +188,20 @@ def get_equipment_by_type(
         equipment_type: Equipment type to filter by.
         skip: Number of records to skip (offset) for pagination.
         limit: Maximum number of records to return.
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
         current_user: Current authenticated user (injected via dependency).
 
     Returns:
         List[EquipmentInDB]: List of equipment of the specified type.
     """
-    return equipment_service.get_equipment_by_type(db, equipment_type=equipment_type, skip=skip, limit=limit)
+    return page.respond(
+        equipment_service.get_equipment_by_type(
+            db, equipment_type=equipment_type, skip=skip, limit=limit, after=page.after
+        ),
+        limit,
+    )
 
 
 @router.get(
@@ -174,11 +209,13 @@ def get_equipment_by_type(
     response_model=List[EquipmentInDB],
     summary="Filter equipment by production line",
     description="Retrieve paginated list of equipment for a specific production line",
+    dependencies=[Depends(equipment_not_modified)],
 )
 def get_equipment_by_production_line(
     production_line_id: int = Path(..., gt=0, description="Production line identifier"),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(equipment_crud.BY_CODE)),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> List[EquipmentInDB]:
@@ -191,14 +228,19 @@ def get_equipment_by_production_line(
         production_line_id: Production line ID to filter by.
         skip: Number of records to skip (offset) for pagination.
         limit: Maximum number of records to return.
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
         current_user: Current authenticated user (injected via dependency).
 
     Returns:
         List[EquipmentInDB]: List of equipment for the specified production line.
     """
-    return equipment_service.get_equipment_by_production_line(
-        db, production_line_id=production_line_id, skip=skip, limit=limit
+    return page.respond(
+        equipment_service.get_equipment_by_production_line(
+            db, production_line_id=production_line_id, skip=skip, limit=limit, after=page.after
+        ),
+        limit,
     )
 
 
@@ -207,11 +249,13 @@ def get_equipment_by_production_line(
     response_model=List[EquipmentInDB],
     summary="Filter equipment by process",
     description="Retrieve paginated list of equipment for a specific process",
+    dependencies=[Depends(equipment_not_modified)],
 )
 def get_equipment_by_process(
     process_id: int = Path(..., gt=0, description="Process identifier"),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(equipment_crud.BY_CODE)),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> List[EquipmentInDB]:
@@ -224,13 +268,20 @@ def get_equipment_by_process(
         process_id: Process ID to filter by.
         skip: Number of records to skip (offset) for pagination.
         limit: Maximum number of records to return.
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
         current_user: Current authenticated user (injected via dependency).
 
     Returns:
         List[EquipmentInDB]: List of equipment for the specified process.
     """
-    return equipment_service.get_equipment_by_process(db, process_id=process_id, skip=skip, limit=limit)
+    return page.respond(
+        equipment_service.get_equipment_by_process(
+            db, process_id=process_id, skip=skip, limit=limit, after=page.after
+        ),
+        limit,
+    )
 
 
 @router.get(
@@ -239,6 +290,7 @@ def get_equipment_by_process(
     summary="Get equipment by code",
     description="Retrieve equipment using its unique equipment code",
     responses={404: {"description": "Equipment not found"}},
+    dependencies=[Depends(equipment_not_modified)],
 )
 def get_equipment_by_code(
     equipment_code: str = Path(..., min_length=1, description="Unique equipment code identifier"),
@@ -269,6 +321,7 @@ def get_equipment_by_code(
     summary="Get equipment by ID",
     description="Retrieve a specific equipment using its primary key identifier",
     responses={404: {"description": "Equipment not found"}},
+    dependencies=[Depends(equipment_not_modified)],
 )
 def get_equipment(
     id: int = Path(..., gt=0, description="Primary key identifier of the equipment"),
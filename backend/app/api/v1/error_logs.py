@@ -16,6 +16,9 @@ Security:
     - All endpoints require admin role
     - Error logs are read-only (no create/update/delete via API)
     - Error logs are created automatically by ErrorLoggingMiddleware
+
+All endpoints read on the analytics pool (deps.get_db_analytics): drill-down
+queries get its long statement timeout and never take shop-floor connections.
 """
 
 from datetime import datetime
@@ -28,6 +31,8 @@ from sqlalchemy.orm import Session
 
 from app import crud
 from app.api import deps
+from app.core.error_rates import error_rates
+from app.core.responses import trusted_json
 from app.models import User
 from app.schemas.error_log import (
     ErrorLogResponse,
@@ -55,7 +60,7 @@ router = APIRouter(
 )
 def list_error_logs(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_admin_user),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(
@@ -103,12 +108,19 @@ def list_error_logs(
         lt=600,
         description="Maximum HTTP status code (4xx or 5xx)",
     ),
+    approximate_total: bool = Query(
+        False,
+        description="Return the planner's row estimate as total instead of an exact count",
+    ),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.error_log.NEWEST)),
 ):
     """
     Retrieve a paginated list of error logs.
 
     Query parameters allow filtering by error code, date range, user, path, method,
-    and status code. Results are ordered by timestamp (newest first).
+    and status code. Results are ordered by timestamp (newest first). Pass the
+    X-Next-Cursor header of a page as ``cursor`` to get the next one without
+    skipping rows; ``approximate_total`` estimates the total from the query plan.
 
     Returns:
         ErrorLogListResponse with error logs list and pagination info
@@ -117,11 +129,7 @@ def list_error_logs(
         - Requires admin role (enforced via get_current_admin_user dependency)
     """
     try:
-        # Get filtered error logs
-        error_logs = crud.error_log.get_multi(
-            db,
-            skip=skip,
-            limit=limit,
+        filters = dict(
             error_code=error_code,
             start_date=start_date,
             end_date=end_date,
@@ -132,27 +140,21 @@ def list_error_logs(
             max_status_code=max_status_code,
         )
 
-        # Get total count (for pagination)
-        total = crud.error_log.count_total(
-            db,
-            since=start_date,
+        # Get filtered error logs
+        error_logs = crud.error_log.get_multi_rows(
+            db, skip=skip, limit=limit, after=page.after, **filters
         )
 
-        # Convert to response format with username
-        error_log_responses = []
-        for error_log in error_logs:
-            error_log_dict = {
-                **error_log.to_dict(),
-                "username": error_log.user.username if error_log.user else None,
-            }
-            error_log_responses.append(ErrorLogResponse(**error_log_dict))
-
-        return ErrorLogListResponse(
-            items=error_log_responses,
-            total=total,
-            skip=skip,
-            limit=limit,
-        )
+        # Get total count (for pagination)
+        total = crud.error_log.count(db, approximate=approximate_total, **filters)
+
+        # Rows already carry username; render without re-validation
+        return trusted_json({
+            "items": page.respond(error_logs, limit),
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+        }, page.response)
 
     except SQLAlchemyError as e:
         raise DatabaseException(message=f"Database error: {str(e)}")
@@ -166,7 +168,7 @@ def list_error_logs(
 )
 def get_error_stats(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_admin_user),
     hours: int = Query(
         24,
@@ -182,7 +184,10 @@ def get_error_stats(
         - Total error count
         - Error distribution by error code
         - Hourly error trend
-        - Top error-prone API endpoints
+        - Top error-prone API endpoints (route templates)
+
+    Counts come from the hourly summary (whole hours); this process's pending
+    counts are flushed first, other workers' after their next flush.
 
     Args:
         hours: Number of hours to look back (default: 24, max: 168)
@@ -194,6 +199,7 @@ def get_error_stats(
         - Requires admin role (enforced via get_current_admin_user dependency)
     """
     try:
+        error_rates.flush(db)
         stats = crud.error_log.get_stats(db, hours=hours)
         return ErrorLogStats(**stats)
 
@@ -209,7 +215,7 @@ def get_error_stats(
 )
 def get_error_log(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_admin_user),
     error_log_id: int = Path(..., gt=0, description="Error log ID"),
 ):
@@ -258,7 +264,7 @@ def get_error_log(
 )
 def get_error_by_trace_id(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_admin_user),
     trace_id: UUID = Path(..., description="Trace ID from StandardErrorResponse"),
 ):
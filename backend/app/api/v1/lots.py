@@ -5,7 +5,7 @@ in the F2X NeuroHub MES system. It implements standard CRUD operations plus
 additional query endpoints for filtering LOTs by various criteria.
 
 Provides:
-    - GET /: List all LOTs with pagination
+    - GET /: List all LOTs with pagination (offset or keyset cursor)
     - GET /{id}: Get LOT by primary key
     - GET /number/{lot_number}: Get LOT by unique LOT number (WF-KR-YYMMDD{D|N}-nnn)
     - GET /active: List active LOTs (CREATED or IN_PROGRESS status)
@@ -13,6 +13,7 @@ Provides:
     - GET /product/{product_model_id}: Filter LOTs by product model
     - GET /status/{status}: Filter LOTs by status
     - GET /{id}/quantities: Get current quantities (actual, passed, failed)
+    - GET /{id}/labels: Render all WIP labels as one ZPL stream or PDF
     - POST /: Create new LOT
     - POST /{id}/start-wip-generation: Generate WIP IDs for LOT (BR-001, BR-002)
     - POST /{id}/close: Close completed LOT (transition to CLOSED status)
@@ -29,11 +30,15 @@ All endpoints include:
 """
 
 from datetime import date
-from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status, Path
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response, status, Path
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.core.change_tracker import etag_matches
+from app.core.exceptions import ValidationException
+from app.core.responses import FastJSONResponse, trusted_json
+from app.crud import lot as lot_crud
 from app.models import User
 from app.schemas.lot import (
     LotCreate,
@@ -42,6 +47,7 @@ from app.schemas.lot import (
     LotStatus,
 )
 from app.schemas.wip_item import WIPItemInDB
+from app.services.label_service import label_service
 from app.services.lot_service import lot_service
 
 
@@ -55,20 +61,29 @@ router = APIRouter(
     },
 )
 
+# ETag revalidation: polls get 304 Not Modified while no LOT changed
+lots_not_modified = deps.conditional_get(
+    "lots", "product_models", auth=deps.get_current_active_user
+)
+public_lots_not_modified = deps.conditional_get("lots", "product_models")
+
 
 @router.get(
     "/",
     response_model=List[LotInDB],
     summary="List all LOTs",
     description="Retrieve a paginated list of LOTs ordered by production date (newest first), optionally filtered by status",
+    dependencies=[Depends(lots_not_modified)],
 )
 def list_lots(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=10000, description="Maximum number of records to return"),
     status: Optional[str] = Query(None, description="Filter by LOT status (CREATED, IN_PROGRESS, COMPLETED, CLOSED)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(lot_crud.NEWEST)),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
-) -> List[LotInDB]:
+) -> FastJSONResponse:
     """List all LOTs with pagination and optional status filter.
 
     Retrieves a paginated list of LOTs from the database, ordered by
@@ -77,6 +92,7 @@ def list_lots(
     status filtering.
 
     Args:
+        response: Response carrying the ETag headers (injected).
         skip: Number of records to skip (offset) for pagination.
             Defaults to 0. Must be non-negative.
         limit: Maximum number of records to return.
@@ -84,10 +100,13 @@ def list_lots(
         status: Optional LOT status filter.
             If provided, only LOTs with this status are returned.
             Valid values: CREATED, IN_PROGRESS, COMPLETED, CLOSED
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
 
     Returns:
-        List[LotInDB]: List of LOT records with database fields.
+        List[LotInDB]: List of LOT records with database fields, rendered
+            from response rows without re-validation.
             Empty list if no records match criteria.
     """
     # Convert empty string to None, validate non-empty strings
@@ -102,7 +121,9 @@ def list_lots(
                 details={"field": "status", "value": status, "allowed_values": [s.value for s in LotStatus]}
             )
     
-    return lot_service.get_lots(db, skip=skip, limit=limit, status=status_enum)
+    rows = lot_service.get_lot_rows(db, skip=skip, limit=limit, status=status_enum, after=page.after)
+    page.respond(rows, limit, lot_crud.BY_PRODUCTION_DATE if status_enum else lot_crud.NEWEST)
+    return trusted_json(rows, response)
 
 
 @router.get(
@@ -111,6 +132,7 @@ def list_lots(
     summary="Get LOT by LOT number",
     description="Retrieve a LOT using its unique LOT number (11 characters)",
     responses={404: {"description": "Lot not found"}},
+    dependencies=[Depends(public_lots_not_modified)],
 )
 def get_lot_by_number(
     lot_number: str = Path(..., pattern=r"^[A-Z0-9]{10,15}$", description="Unique LOT identifier"),
@@ -144,10 +166,12 @@ def get_lot_by_number(
     response_model=List[LotInDB],
     summary="List active LOTs",
     description="Retrieve paginated list of active LOTs (CREATED or IN_PROGRESS status)",
+    dependencies=[Depends(public_lots_not_modified)],
 )
 def get_active_lots(
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=10000, description="Maximum number of records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(lot_crud.BY_PRODUCTION_DATE)),
     db: Session = Depends(deps.get_db),
 ) -> List[LotInDB]:
     """Get active LOTs with pagination.
@@ -162,13 +186,15 @@ def get_active_lots(
             Defaults to 0. Must be non-negative.
         limit: Maximum number of records to return.
             Defaults to 100. Must be positive (1-10000).
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
 
     Returns:
         List[LotInDB]: List of active LOT records.
             Empty list if no active LOTs exist.
     """
-    return lot_service.get_active_lots(db, skip=skip, limit=limit)
+    return page.respond(lot_service.get_active_lots(db, skip=skip, limit=limit, after=page.after), limit)
 
 
 @router.get(
@@ -176,12 +202,14 @@ def get_active_lots(
     response_model=List[LotInDB],
     summary="Filter LOTs by date range",
     description="Retrieve LOTs within a specified production date range",
+    dependencies=[Depends(public_lots_not_modified)],
 )
 def get_lots_by_date_range(
     start_date: date = Query(..., description="Start of date range (inclusive, YYYY-MM-DD)"),
     end_date: date = Query(..., description="End of date range (inclusive, YYYY-MM-DD)"),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=10000, description="Maximum number of records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(lot_crud.BY_PRODUCTION_DATE)),
     db: Session = Depends(deps.get_db),
 ) -> List[LotInDB]:
     """Get LOTs within production date range.
@@ -197,13 +225,20 @@ def get_lots_by_date_range(
             Defaults to 0. Must be non-negative.
         limit: Maximum number of records to return.
             Defaults to 100. Must be positive (1-10000).
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
 
     Returns:
         List[LotInDB]: List of LOTs within the date range.
             Empty list if no LOTs exist in range.
     """
-    return lot_service.get_lots_by_date_range(db, start_date=start_date, end_date=end_date, skip=skip, limit=limit)
+    return page.respond(
+        lot_service.get_lots_by_date_range(
+            db, start_date=start_date, end_date=end_date, skip=skip, limit=limit, after=page.after
+        ),
+        limit,
+    )
 
 
 @router.get(
@@ -211,11 +246,13 @@ def get_lots_by_date_range(
     response_model=List[LotInDB],
     summary="Filter LOTs by product model",
     description="Retrieve paginated list of LOTs for a specific product model",
+    dependencies=[Depends(public_lots_not_modified)],
 )
 def get_lots_by_product_model(
     product_model_id: int = Path(..., gt=0, description="Product model identifier"),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=10000, description="Maximum number of records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(lot_crud.BY_PRODUCTION_DATE)),
     db: Session = Depends(deps.get_db),
 ) -> List[LotInDB]:
     """Get LOTs filtered by product model with pagination.
@@ -231,13 +268,20 @@ def get_lots_by_product_model(
             Defaults to 0. Must be non-negative.
         limit: Maximum number of records to return.
             Defaults to 100. Must be positive (1-10000).
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
 
     Returns:
         List[LotInDB]: List of LOTs for the specified product model.
             Empty list if no LOTs exist for product.
     """
-    return lot_service.get_lots_by_product_model(db, product_model_id=product_model_id, skip=skip, limit=limit)
+    return page.respond(
+        lot_service.get_lots_by_product_model(
+            db, product_model_id=product_model_id, skip=skip, limit=limit, after=page.after
+        ),
+        limit,
+    )
 
 
 @router.get(
@@ -245,11 +289,13 @@ def get_lots_by_product_model(
     response_model=List[LotInDB],
     summary="Filter LOTs by status",
     description="Retrieve paginated list of LOTs filtered by status",
+    dependencies=[Depends(public_lots_not_modified)],
 )
 def get_lots_by_status(
     status: str = Path(..., description="LOT status: CREATED, IN_PROGRESS, COMPLETED, CLOSED"),
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
     limit: int = Query(100, ge=1, le=10000, description="Maximum number of records to return"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(lot_crud.BY_PRODUCTION_DATE)),
     db: Session = Depends(deps.get_db),
 ) -> List[LotInDB]:
     """Get LOTs filtered by status with pagination.
@@ -265,13 +311,15 @@ def get_lots_by_status(
             Defaults to 0. Must be non-negative.
         limit: Maximum number of records to return.
             Defaults to 100. Must be positive (1-10000).
+        page: Keyset position from the ``cursor`` query parameter (injected);
+            the next page's cursor is returned in the X-Next-Cursor header.
         db: SQLAlchemy database session (injected via dependency).
 
     Returns:
         List[LotInDB]: List of LOTs with specified status.
             Empty list if no LOTs exist with status.
     """
-    return lot_service.get_lots_by_status(db, status=status, skip=skip, limit=limit)
+    return page.respond(lot_service.get_lots_by_status(db, status=status, skip=skip, limit=limit, after=page.after), limit)
 
 
 @router.get(
@@ -280,6 +328,7 @@ def get_lots_by_status(
     summary="Get LOT by ID",
     description="Retrieve a specific LOT using its primary key identifier",
     responses={404: {"description": "Lot not found"}},
+    dependencies=[Depends(public_lots_not_modified)],
 )
 def get_lot(
     id: int = Path(..., gt=0, description="Primary key identifier of the LOT"),
@@ -310,6 +359,7 @@ def get_lot(
     summary="Get LOT quantities",
     description="Retrieve current quantity metrics (actual, passed, failed) for a LOT",
     responses={404: {"description": "Lot not found"}},
+    dependencies=[Depends(public_lots_not_modified)],
 )
 def get_lot_quantities(
     id: int = Path(..., gt=0, description="Primary key identifier of the LOT"),
@@ -341,6 +391,65 @@ def get_lot_quantities(
     return lot_service.get_lot(db, lot_id=id)
 
 
+@router.get(
+    "/{id}/labels",
+    summary="Render LOT WIP labels",
+    description=(
+        "Render all WIP labels of a LOT as one multi-label ZPL stream or one "
+        "multi-page PDF (one barcode per page)"
+    ),
+    responses={
+        304: {"description": "Labels unchanged since the given ETag"},
+        404: {"description": "Lot not found"},
+    },
+)
+def get_lot_labels(
+    request: Request,
+    id: int = Path(..., gt=0, description="Primary key identifier of the LOT"),
+    format: Literal["zpl", "pdf"] = Query("zpl", description="Output format (zpl or pdf)"),
+    barcode_type: Literal["code128", "qr"] = Query("qr", description="Barcode type for PDF pages"),
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Response:
+    """Render the WIP labels of a LOT in one response.
+
+    Replaces fetching and rendering one barcode per WIP after WIP generation.
+    Labels are served from the label cache; missing barcodes for PDF sheets
+    are rasterized in parallel.
+
+    Args:
+        request: Incoming request (If-None-Match).
+        id: Primary key identifier of the LOT.
+        format: "zpl" for a Zebra print stream, "pdf" for a printable sheet.
+        barcode_type: Barcode symbology of PDF pages (ZPL uses the label template).
+        db: SQLAlchemy database session (injected via dependency).
+        current_user: Current authenticated user.
+
+    Returns:
+        Response: ZPL text or PDF document, or 304 Not Modified.
+
+    Raises:
+        LotNotFoundException: 404 Not Found if LOT does not exist.
+        ValidationException: 400 Bad Request if the LOT has no WIP items.
+    """
+    wip_ids = lot_service.get_wip_ids(db, lot_id=id)
+    if not wip_ids:
+        raise ValidationException(message=f"LOT {id} has no WIP items to label")
+
+    symbology = "WIP_LABEL" if format == "zpl" else barcode_type
+    etag = f'"{label_service.batch_key(format, wip_ids, symbology)}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    headers["Content-Disposition"] = f"inline; filename=lot_{id}_labels.{format}"
+    if format == "zpl":
+        content = label_service.render_zpl_batch("WIP_LABEL", wip_ids)
+        return Response(content=content, media_type="text/plain; charset=utf-8", headers=headers)
+    content = label_service.render_pdf(wip_ids, barcode_type)
+    return Response(content=content, media_type="application/pdf", headers=headers)
+
+
 @router.post(
     "/",
     response_model=LotInDB,
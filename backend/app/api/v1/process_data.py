@@ -8,6 +8,7 @@ status, operator, date range, and failure analysis.
 
 Endpoints:
     GET /process-data - List all process data records with pagination
+    GET /process-data/export - Export as CSV/NDJSON/Parquet (streamed or background job)
     GET /process-data/{id} - Get process data record by ID
     GET /process-data/serial/{serial_id} - Get all process data for a serial
     GET /process-data/lot/{lot_id} - Get all process data for a LOT
@@ -22,6 +23,9 @@ Endpoints:
     PUT /process-data/{id} - Update process data record
     DELETE /process-data/{id} - Delete process data record
 
+List endpoints accept ``cursor`` (the X-Next-Cursor header of the previous
+page) instead of ``skip`` for keyset pagination.
+
 Key Features:
     - JSONB fields: measurements, defects
     - Data level: LOT or SERIAL
@@ -32,11 +36,14 @@ Key Features:
 
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app import crud
 from app.api import deps
+from app.config import settings
+from app.core.responses import FastJSONResponse, trusted_json
 from app.models import User
 from app.models.process_data import DataLevel, ProcessResult
 from app.schemas.process_data import (
@@ -52,6 +59,7 @@ from app.schemas.process_data import (
     MeasurementCodeInfo,
     MeasurementCodesResponse,
 )
+from app.services.export_service import ExportQuery, export_service
 # New exception imports
 from app.core.exceptions import (
     ResourceNotFoundException,
@@ -74,15 +82,17 @@ router = APIRouter(
 def list_process_data(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum records to return (max 100)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.process_data.NEWEST)),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
-):
+) -> FastJSONResponse:
     """
     List all process data records with pagination.
 
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of records to return (default: 50, max: 100)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of ProcessData objects ordered by creation time (descending)
@@ -90,8 +100,77 @@ def list_process_data(
     Raises:
         HTTPException 422: If query parameters are invalid
     """
-    process_data_records = crud.process_data.get_multi(db, skip=skip, limit=limit)
-    return process_data_records
+    rows = crud.process_data.get_multi_rows(db, skip=skip, limit=limit, after=page.after)
+    return trusted_json(page.respond(rows, limit), page.response)
+
+
+@router.get(
+    "/export",
+    response_model=None,
+    summary="Export process data",
+    description=(
+        "Export process data or WIP process history as CSV, NDJSON or Parquet with "
+        "measurements flattened into columns. Small exports stream back directly; "
+        "larger ones are queued as a background job (202 Accepted)."
+    ),
+    responses={202: {"description": "Export queued as a background job"}},
+)
+def export_process_data(
+    source: str = Query("process_data", description="process_data or wip_history"),
+    format: str = Query("csv", description="csv, ndjson or parquet"),
+    gzip: bool = Query(True, description="gzip csv/ndjson output"),
+    start_date: Optional[datetime] = Query(None, description="started_at from (inclusive) - ISO 8601"),
+    end_date: Optional[datetime] = Query(None, description="started_at to (inclusive) - ISO 8601"),
+    process_id: Optional[int] = Query(None, gt=0, description="Filter by process"),
+    lot_id: Optional[int] = Query(None, gt=0, description="Filter by LOT"),
+    db: Session = Depends(deps.get_db),
+    analytics_db: Session = Depends(deps.get_db_analytics),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Response:
+    """
+    Export process data records.
+
+    Exports of up to EXPORT_STREAM_MAX_ROWS rows are encoded while they are
+    read and streamed in the response. Larger exports are written to disk
+    by a background job; poll its status_url and fetch the file from its
+    download_url once it is COMPLETED. Rows are read on the analytics pool.
+
+    Returns:
+        StreamingResponse with the export file, or 202 with the queued job
+
+    Raises:
+        ValidationException: If source, format or the date range is invalid
+    """
+    try:
+        query = ExportQuery(
+            source=source,
+            start_date=start_date,
+            end_date=end_date,
+            process_id=process_id,
+            lot_id=lot_id,
+        )
+        if export_service.count(analytics_db, query) > settings.EXPORT_STREAM_MAX_ROWS:
+            job = export_service.queue_job(db, query, format, gzip)
+            return trusted_json(
+                {
+                    "job_id": job.id,
+                    "task_id": job.task_id,
+                    "status": job.status,
+                    "status_url": f"{settings.API_V1_PREFIX}/async/jobs/{job.id}",
+                    "download_url": f"{settings.API_V1_PREFIX}/async/exports/{job.id}/download",
+                },
+                status_code=status.HTTP_202_ACCEPTED,
+            )
+        chunks = export_service.stream(analytics_db, query, format, gzip)
+    except ValueError as e:
+        raise ValidationException(str(e))
+
+    filename = export_service.filename(query, format, gzip)
+    return StreamingResponse(
+        chunks,
+        media_type=export_service.media_type(format, gzip),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get(
@@ -166,6 +245,7 @@ def get_process_data_by_lot(
     lot_id: int = Path(..., gt=0, description="LOT ID"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return (max 100)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.process_data.NEWEST)),
     db: Session = Depends(deps.get_db),
 ):
     """
@@ -177,6 +257,7 @@ def get_process_data_by_lot(
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of records to return (default: 100, max: 100)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of ProcessData objects for the LOT, ordered by creation time
@@ -185,9 +266,9 @@ def get_process_data_by_lot(
         HTTPException 422: If query parameters are invalid
     """
     process_data_records = crud.process_data.get_by_lot(
-        db, lot_id=lot_id, skip=skip, limit=limit
+        db, lot_id=lot_id, skip=skip, limit=limit, after=page.after
     )
-    return process_data_records
+    return page.respond(process_data_records, limit)
 
 
 @router.get(
@@ -200,6 +281,7 @@ def get_process_data_by_process(
     process_id: int = Path(..., gt=0, description="Process ID"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return (max 100)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.process_data.NEWEST)),
     db: Session = Depends(deps.get_db),
 ):
     """
@@ -211,6 +293,7 @@ def get_process_data_by_process(
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of records to return (default: 100, max: 100)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of ProcessData objects for the specified process, ordered by creation time
@@ -219,9 +302,9 @@ def get_process_data_by_process(
         HTTPException 422: If query parameters are invalid
     """
     process_data_records = crud.process_data.get_by_process(
-        db, process_id=process_id, skip=skip, limit=limit
+        db, process_id=process_id, skip=skip, limit=limit, after=page.after
     )
-    return process_data_records
+    return page.respond(process_data_records, limit)
 
 
 @router.get(
@@ -234,6 +317,7 @@ def get_process_data_by_result(
     result: str = Path(..., description="Result filter: PASS, FAIL, or REWORK"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return (max 100)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.process_data.NEWEST)),
     db: Session = Depends(deps.get_db),
 ):
     """
@@ -245,6 +329,7 @@ def get_process_data_by_result(
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of records to return (default: 100, max: 100)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of ProcessData objects with specified result, ordered by creation time
@@ -255,9 +340,9 @@ def get_process_data_by_result(
     """
     try:
         process_data_records = crud.process_data.get_by_result(
-            db, result=result, skip=skip, limit=limit
+            db, result=result, skip=skip, limit=limit, after=page.after
         )
-        return process_data_records
+        return page.respond(process_data_records, limit)
     except ValueError as e:
         raise ValidationException(message=str(e))
 
@@ -271,6 +356,7 @@ def get_process_data_by_result(
 def get_failed_process_data(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return (max 100)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.process_data.NEWEST)),
     db: Session = Depends(deps.get_db),
 ):
     """
@@ -279,6 +365,7 @@ def get_failed_process_data(
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of records to return (default: 100, max: 100)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of ProcessData objects with result=FAIL, ordered by creation time (descending)
@@ -286,8 +373,8 @@ def get_failed_process_data(
     Raises:
         HTTPException 422: If query parameters are invalid
     """
-    process_data_records = crud.process_data.get_failures(db, skip=skip, limit=limit)
-    return process_data_records
+    process_data_records = crud.process_data.get_failures(db, skip=skip, limit=limit, after=page.after)
+    return page.respond(process_data_records, limit)
 
 
 @router.get(
@@ -300,6 +387,7 @@ def get_process_data_by_operator(
     operator_id: int = Path(..., gt=0, description="Operator (User) ID"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return (max 100)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.process_data.NEWEST)),
     db: Session = Depends(deps.get_db),
 ):
     """
@@ -311,6 +399,7 @@ def get_process_data_by_operator(
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of records to return (default: 100, max: 100)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of ProcessData objects performed by the operator, ordered by creation time
@@ -319,9 +408,9 @@ def get_process_data_by_operator(
         HTTPException 422: If query parameters are invalid
     """
     process_data_records = crud.process_data.get_by_operator(
-        db, operator_id=operator_id, skip=skip, limit=limit
+        db, operator_id=operator_id, skip=skip, limit=limit, after=page.after
     )
-    return process_data_records
+    return page.respond(process_data_records, limit)
 
 
 @router.get(
@@ -335,6 +424,7 @@ def get_process_data_by_date_range(
     end_date: datetime = Query(..., description="End of date range (inclusive) - ISO 8601 format"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return (max 100)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.process_data.NEWEST)),
     db: Session = Depends(deps.get_db),
 ):
     """
@@ -345,6 +435,7 @@ def get_process_data_by_date_range(
         end_date: End of date range (inclusive) - ISO 8601 format (e.g., 2025-01-31T23:59:59Z)
         skip: Offset for pagination (default: 0)
         limit: Number of records to return (default: 100, max: 100)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of ProcessData objects within the date range, ordered by creation time
@@ -359,9 +450,9 @@ def get_process_data_by_date_range(
         )
 
     process_data_records = crud.process_data.get_by_date_range(
-        db, start_date=start_date, end_date=end_date, skip=skip, limit=limit
+        db, start_date=start_date, end_date=end_date, skip=skip, limit=limit, after=page.after
     )
-    return process_data_records
+    return page.respond(process_data_records, limit)
 
 
 @router.get(
@@ -408,6 +499,7 @@ def get_process_data_by_serial_and_process(
 def get_incomplete_process_data(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return (max 100)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.process_data.OLDEST_STARTED)),
     db: Session = Depends(deps.get_db),
 ):
     """
@@ -416,6 +508,7 @@ def get_incomplete_process_data(
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of records to return (default: 100, max: 100)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of ProcessData objects with completed_at=NULL, ordered by started_at (ascending)
@@ -424,9 +517,9 @@ def get_incomplete_process_data(
         HTTPException 422: If query parameters are invalid
     """
     process_data_records = crud.process_data.get_incomplete_processes(
-        db, skip=skip, limit=limit
+        db, skip=skip, limit=limit, after=page.after
     )
-    return process_data_records
+    return page.respond(process_data_records, limit)
 
 
 @router.post(
@@ -731,6 +824,7 @@ def get_measurement_history(
     result: Optional[str] = Query(None, description="Filter by result: PASS, FAIL, or REWORK"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=500, description="Maximum records to return (max 500)"),
+    approximate_total: bool = Query(False, description="Return the planner's row estimate as total instead of an exact count"),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ):
@@ -750,6 +844,8 @@ def get_measurement_history(
         result: Filter by result status (PASS, FAIL, REWORK)
         skip: Offset for pagination
         limit: Maximum records per page (max 500)
+        approximate_total: Estimate total from the query plan (constant time
+            on large tables) instead of counting
 
     Returns:
         MeasurementHistoryListResponse with paginated measurement records
@@ -776,6 +872,7 @@ def get_measurement_history(
         result_filter=result,
         skip=0,  # Get all for now, will sort and paginate combined results
         limit=limit + skip,  # Get enough for pagination
+        approximate_total=approximate_total,
     )
 
     # Transform WIP records to response format
@@ -809,6 +906,7 @@ def get_measurement_history(
         result=result,
         skip=0,
         limit=limit + skip,
+        approximate_total=approximate_total,
     )
 
     # Transform ProcessData records to response format
@@ -837,12 +935,13 @@ def get_measurement_history(
     total = wip_total + pd_total
     paginated_items = items[skip:skip + limit]
 
-    return MeasurementHistoryListResponse(
+    # Items were validated when built; render without re-validating them
+    return trusted_json(MeasurementHistoryListResponse(
         items=paginated_items,
         total=total,
         skip=skip,
         limit=limit,
-    )
+    ))
 
 
 @router.get(
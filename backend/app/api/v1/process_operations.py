@@ -8,14 +8,19 @@ Provides operational endpoints for:
 
 These endpoints are separate from the CRUD operations in processes.py
 and handle the actual manufacturing workflow operations.
+
+Start and complete are shop-floor hot paths: each can be served by an
+async variant on the async engine (settings.ASYNC_HOT_PATHS).
 """
 
 from fastapi import APIRouter, Depends, Path, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
 from app.models import User
 from app.services.process_service import process_service
+from app.services.process_service_async import async_process_service
 from app.schemas.process_operations import (
     ProcessStartRequest,
     ProcessStartResponse,
@@ -27,6 +32,24 @@ from app.schemas.process_operations import (
 router = APIRouter()
 
 
+async def start_process_async(
+    request: ProcessStartRequest,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user_async),
+) -> ProcessStartResponse:
+    """Register process start (착공 등록) on the async engine."""
+    return await async_process_service.start_process(db, request)
+
+
+async def complete_process_async(
+    request: ProcessCompleteRequest,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user_async),
+) -> ProcessCompleteResponse:
+    """Register process completion (완공 등록) on the async engine."""
+    return await async_process_service.complete_process(db, request)
+
+
 @router.post(
     "/start",
     response_model=ProcessStartResponse,
@@ -35,6 +58,7 @@ router = APIRouter()
     description="Start a new process for a LOT/Serial. Validates process sequence and previous process completion.",
 )
 @router.post("/start/", response_model=ProcessStartResponse, status_code=status.HTTP_201_CREATED, include_in_schema=False)
+@deps.hot_path("process-operations.start", start_process_async)
 def start_process(
     request: ProcessStartRequest,
     db: Session = Depends(deps.get_db),
@@ -75,6 +99,7 @@ def start_process(
     description="Complete a process with result and measurement data.",
 )
 @router.post("/complete/", response_model=ProcessCompleteResponse, include_in_schema=False)
+@deps.hot_path("process-operations.complete", complete_process_async)
 def complete_process(
     request: ProcessCompleteRequest,
     db: Session = Depends(deps.get_db),
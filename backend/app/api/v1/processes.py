@@ -51,12 +51,17 @@ router = APIRouter(
     },
 )
 
+# ETag revalidation: polls get 304 Not Modified while no process changed
+processes_not_modified = deps.conditional_get("processes", auth=deps.get_current_active_user)
+public_processes_not_modified = deps.conditional_get("processes")
+
 
 @router.get(
     "/",
     response_model=List[ProcessInDB],
     summary="List all processes",
     description="Retrieve a paginated list of all manufacturing processes ordered by sort_order",
+    dependencies=[Depends(processes_not_modified)],
 )
 def list_processes(
     skip: int = 0,
@@ -93,6 +98,7 @@ def list_processes(
     summary="Get process by process number",
     description="Retrieve a specific process using its unique sequence number (1-8)",
     responses={404: {"description": "Process not found"}},
+    dependencies=[Depends(processes_not_modified)],
 )
 def get_process_by_number(
     process_number: int,
@@ -125,6 +131,7 @@ def get_process_by_number(
     summary="Get process by process code",
     description="Retrieve a specific process using its unique code identifier",
     responses={404: {"description": "Process not found"}},
+    dependencies=[Depends(processes_not_modified)],
 )
 def get_process_by_code(
     process_code: str,
@@ -156,6 +163,7 @@ def get_process_by_code(
     response_model=List[ProcessInDB],
     summary="List active processes",
     description="Retrieve list of all active processes ordered by sort_order. No authentication required.",
+    dependencies=[Depends(public_processes_not_modified)],
 )
 def get_active_processes(
     db: Session = Depends(deps.get_db),
@@ -188,6 +196,7 @@ def get_active_processes(
     response_model=List[ProcessInDB],
     summary="Get manufacturing process sequence",
     description="Retrieve all 8 manufacturing processes in sequential order (1-8)",
+    dependencies=[Depends(processes_not_modified)],
 )
 def get_process_sequence(
     db: Session = Depends(deps.get_db),
@@ -223,6 +232,7 @@ def get_process_sequence(
     summary="Get process by ID",
     description="Retrieve a specific process using its primary key identifier",
     responses={404: {"description": "Process not found"}},
+    dependencies=[Depends(public_processes_not_modified)],
 )
 def get_process(
     id: int = Path(..., gt=0, description="Primary key identifier of the process"),
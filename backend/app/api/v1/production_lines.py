@@ -54,12 +54,18 @@ router = APIRouter(
     },
 )
 
+# ETag revalidation: polls get 304 Not Modified while no line changed
+production_lines_not_modified = deps.conditional_get(
+    "production_lines", "equipment", auth=deps.get_current_active_user
+)
+
 
 @router.get(
     "/",
     response_model=List[ProductionLineInDB],
     summary="List all production lines",
     description="Retrieve a paginated list of all production lines ordered by line code (ascending)",
+    dependencies=[Depends(production_lines_not_modified)],
 )
 def list_production_lines(
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
@@ -89,6 +95,7 @@ def list_production_lines(
     response_model=List[ProductionLineInDB],
     summary="List active production lines",
     description="Retrieve paginated list of active production lines (is_active=True)",
+    dependencies=[Depends(production_lines_not_modified)],
 )
 def get_active_production_lines(
     skip: int = Query(0, ge=0, description="Number of records to skip (offset)"),
@@ -118,6 +125,7 @@ def get_active_production_lines(
     response_model=List[ProductionLineInDB],
     summary="Filter production lines by capacity range",
     description="Retrieve production lines within a specified capacity range",
+    dependencies=[Depends(production_lines_not_modified)],
 )
 def get_production_lines_by_capacity_range(
     min_capacity: int = Query(..., gt=0, description="Minimum capacity per shift (inclusive)"),
@@ -159,6 +167,7 @@ def get_production_lines_by_capacity_range(
     summary="Get production line by code",
     description="Retrieve a production line using its unique line code",
     responses={404: {"description": "Production line not found"}},
+    dependencies=[Depends(production_lines_not_modified)],
 )
 def get_production_line_by_code(
     line_code: str = Path(..., min_length=1, description="Unique line code identifier"),
@@ -192,6 +201,7 @@ def get_production_line_by_code(
     summary="Get production line by ID",
     description="Retrieve a specific production line using its primary key identifier",
     responses={404: {"description": "Production line not found"}},
+    dependencies=[Depends(production_lines_not_modified)],
 )
 def get_production_line(
     id: int = Path(..., gt=0, description="Primary key identifier of the production line"),
@@ -0,0 +1,184 @@
+"""
+Production Reports API endpoints.
+
+Reports consumed by the desktop client's report dialog and its Excel/PDF
+exporters. Each returns one page of flat rows plus a summary over all rows
+(see app.services.report_service):
+    - GET /daily-production: Production per process and line for one day
+    - GET /process-performance: Yield, throughput and cycle time per process
+    - GET /defect-analysis: Defect counts per process and defect type
+    - GET /lot-progress: LOT quantities and completion by production date
+    - GET /wip-status: Active WIP items by status and current process
+    - POST /snapshots: Materialize closed days (normally done nightly)
+
+Closed days are served from daily report snapshots; only today is
+aggregated live. All reads use the analytics pool.
+"""
+
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.core.exceptions import ValidationException
+from app.core.responses import FastJSONResponse, trusted_json
+from app.models import User
+from app.services.report_service import report_service
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/daily-production",
+    response_class=FastJSONResponse,
+    summary="Daily production report",
+)
+def get_daily_production_report(
+    day: date = Query(..., alias="date", description="Report date (YYYY-MM-DD)"),
+    line_id: Optional[int] = Query(None, gt=0, description="Filter by production line"),
+    process_id: Optional[int] = Query(None, gt=0, description="Filter by process"),
+    skip: int = Query(0, ge=0, description="Number of rows to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum rows to return (max 1000)"),
+    db: Session = Depends(deps.get_db_analytics),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> FastJSONResponse:
+    """
+    Get started/completed/pass/fail counts and cycle time per process and line.
+
+    Returns:
+        Page of rows with a day summary (pass_rate, avg_cycle_time, ...)
+    """
+    return trusted_json(report_service.daily_production(db, day, line_id, process_id, skip, limit))
+
+
+@router.get(
+    "/process-performance",
+    response_class=FastJSONResponse,
+    summary="Process performance report",
+)
+def get_process_performance_report(
+    start_date: date = Query(..., description="First day (inclusive)"),
+    end_date: date = Query(..., description="Last day (inclusive)"),
+    process_id: Optional[int] = Query(None, gt=0, description="Filter by process"),
+    skip: int = Query(0, ge=0, description="Number of rows to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum rows to return (max 1000)"),
+    db: Session = Depends(deps.get_db_analytics),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> FastJSONResponse:
+    """
+    Get yield rate, throughput and average cycle time per process.
+
+    Raises:
+        ValidationException: If the date range is invalid or too long
+    """
+    try:
+        report = report_service.process_performance(db, start_date, end_date, process_id, skip, limit)
+    except ValueError as e:
+        raise ValidationException(str(e))
+    return trusted_json(report)
+
+
+@router.get(
+    "/defect-analysis",
+    response_class=FastJSONResponse,
+    summary="Defect analysis report",
+)
+def get_defect_analysis_report(
+    start_date: date = Query(..., description="First day (inclusive)"),
+    end_date: date = Query(..., description="Last day (inclusive)"),
+    process_id: Optional[int] = Query(None, gt=0, description="Filter by process"),
+    skip: int = Query(0, ge=0, description="Number of rows to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum rows to return (max 1000)"),
+    db: Session = Depends(deps.get_db_analytics),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> FastJSONResponse:
+    """
+    Get defect counts and rates per process and defect type, most frequent first.
+
+    Raises:
+        ValidationException: If the date range is invalid or too long
+    """
+    try:
+        report = report_service.defect_analysis(db, start_date, end_date, process_id, skip, limit)
+    except ValueError as e:
+        raise ValidationException(str(e))
+    return trusted_json(report)
+
+
+@router.get(
+    "/lot-progress",
+    response_class=FastJSONResponse,
+    summary="LOT progress report",
+)
+def get_lot_progress_report(
+    start_date: date = Query(..., description="First production date (inclusive)"),
+    end_date: date = Query(..., description="Last production date (inclusive)"),
+    status: Optional[str] = Query(None, description="Filter by LOT status"),
+    skip: int = Query(0, ge=0, description="Number of rows to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum rows to return (max 1000)"),
+    db: Session = Depends(deps.get_db_analytics),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> FastJSONResponse:
+    """
+    Get LOT quantities, progress and yield, newest production date first.
+
+    Raises:
+        ValidationException: If the date range is invalid or too long
+    """
+    try:
+        report = report_service.lot_progress(db, start_date, end_date, status, skip, limit)
+    except ValueError as e:
+        raise ValidationException(str(e))
+    return trusted_json(report)
+
+
+@router.get(
+    "/wip-status",
+    response_class=FastJSONResponse,
+    summary="WIP status report",
+)
+def get_wip_status_report(
+    process_id: Optional[int] = Query(None, gt=0, description="Filter by current process"),
+    line_id: Optional[int] = Query(None, gt=0, description="Filter by production line"),
+    skip: int = Query(0, ge=0, description="Number of rows to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum rows to return (max 1000)"),
+    db: Session = Depends(deps.get_db_analytics),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> FastJSONResponse:
+    """
+    Get active (not yet converted) WIP items with counts by status and process.
+    """
+    return trusted_json(report_service.wip_status(db, process_id, line_id, skip, limit))
+
+
+@router.post(
+    "/snapshots",
+    response_class=FastJSONResponse,
+    summary="Materialize daily report snapshots",
+)
+def materialize_report_snapshots(
+    start_date: date = Query(..., description="First day (inclusive)"),
+    end_date: Optional[date] = Query(None, description="Last day (inclusive, default: yesterday)"),
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_manager_user),
+) -> FastJSONResponse:
+    """
+    Write snapshots for closed days that have none, e.g. to backfill history.
+
+    Existing snapshots are left unchanged, except those of the last
+    REPORT_SNAPSHOT_GRACE_DAYS closed days, which are refreshed. Requires
+    manager role.
+
+    Raises:
+        ValidationException: If the date range is invalid or too long
+    """
+    end_date = end_date or report_service.today() - timedelta(days=1)
+    try:
+        report_service.check_range(start_date, end_date)
+    except ValueError as e:
+        raise ValidationException(str(e))
+    written = report_service.materialize(db, start_date, end_date)
+    return trusted_json({"start": start_date.isoformat(), "end": end_date.isoformat(), "written": written})
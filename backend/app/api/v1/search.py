@@ -1,59 +1,128 @@
+"""
+Search API endpoints.
+
+    - GET /: Ranked search across process data notes and LOT / serial / WIP
+      identifiers, paginated by keyset cursor
+    - GET /process-data: Ranked notes search returning process data rows
+    - POST /process-data/filter: Compiled dynamic filter trees, keyset paginated
+    - /filters/*: Saved filters (applied pages cached per data version)
+
+Notes are matched through the indexed notes_tsv column (FTS5 shadow table on
+SQLite) and identifiers through pg_trgm indexes (see app.crud.search).
+"""
+
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app.api import deps
-from app.models import User, ProcessData, SavedFilter
+from app.models import User, SavedFilter
 from app.schemas.search import (
     SearchFilters,
     FilterRequest,
-    DateRange,
     SaveFilterRequest
 )
+from app.crud import filters as filters_crud
 from app.crud import search as search_crud
-from app.core.exceptions import ResourceNotFoundException
+from app.core.exceptions import ResourceNotFoundException, ValidationException
+from app.core.responses import FastJSONResponse, trusted_json
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = deps.NEXT_CURSOR_HEADER
+
+
+@router.get(
+    "",
+    response_class=FastJSONResponse,
+    summary="Search process data, LOTs, serials and WIP items",
+)
+def search(
+    q: str = Query(..., min_length=2, description="Notes terms or LOT / serial / WIP number substring"),
+    types: Optional[List[str]] = Query(
+        None, description=f"Entity types to search: {', '.join(search_crud.SEARCH_TYPES)} (default: all)"
+    ),
+    limit: int = Query(20, ge=1, le=100, description="Maximum hits to return (max 100)"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    db: Session = Depends(deps.get_db_analytics),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> FastJSONResponse:
+    """
+    Ranked search across entity types.
+
+    Returns:
+        items (type, id, label, rank) ordered by rank, and next_cursor
+        (null on the last page)
+
+    Raises:
+        ValidationException: If a type is unknown or the cursor is malformed
+    """
+    try:
+        return trusted_json(search_crud.search(db, q, types, limit, cursor))
+    except ValueError as e:
+        raise ValidationException(str(e))
+
+
 @router.get("/process-data")
 def search_process_data(
+    response: Response,
     q: Optional[str] = Query(None, min_length=2, description="Search query"),
     process_id: Optional[int] = None,
     result: Optional[str] = None,
-    # Simple date range params for GET convenience
-    limit: int = 100,
-    db: Session = Depends(deps.get_db),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description=f"{NEXT_CURSOR_HEADER} of the previous page"),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
 ):
     """
     Search process data using full-text search and basic filters.
+
+    Results are ordered by rank; the cursor of the next page, if any, is
+    returned in the X-Next-Cursor header.
     """
     filters = SearchFilters(
         process_id=process_id,
         result=result
     )
-    
-    results = search_crud.search_process_data(db, q, filters)
+
+    try:
+        results, next_cursor = search_crud.search_process_data(db, q, filters, limit, cursor)
+    except ValueError as e:
+        raise ValidationException(str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return results
 
-@router.post("/process-data/filter")
+@router.post("/process-data/filter", response_class=FastJSONResponse)
 def filter_process_data(
     request: FilterRequest,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
-):
+) -> FastJSONResponse:
     """
-    Apply complex dynamic filters to process data.
+    Apply a dynamic filter tree (AND / OR groups) to process data.
+
+    Returns:
+        items (process data rows), next_cursor (null on the last page),
+        total, and warnings for predicates that cannot use an index
+
+    Raises:
+        ValidationException: If the filter, sort field or cursor is invalid
     """
-    results = search_crud.apply_dynamic_filters(
-        db, 
-        ProcessData, 
-        request.filters,
-        request.sort_by,
-        request.sort_order,
-        request.limit
-    )
-    return results
+    try:
+        page = filters_crud.run(
+            db,
+            filters_crud.PROCESS_DATA,
+            request.filters,
+            request.sort_by,
+            request.sort_order,
+            request.limit,
+            request.cursor,
+            request.include_total,
+        )
+    except ValueError as e:
+        raise ValidationException(str(e))
+    return trusted_json(page)
 
 @router.post("/filters/save")
 def save_filter(
@@ -63,12 +132,26 @@ def save_filter(
 ):
     """
     Save a filter configuration for later use.
+
+    Raises:
+        ValidationException: If the filter does not compile
     """
+    try:
+        filters_crud.compile_filters(db, filters_crud.PROCESS_DATA, filters_crud.parse_filters(request.filters))
+        if request.sort_by and request.sort_by not in filters_crud.PROCESS_DATA.sortable:
+            raise ValueError(f"Cannot sort by '{request.sort_by}'")
+    except ValueError as e:
+        raise ValidationException(str(e))
+
     saved_filter = SavedFilter(
         user_id=current_user.id,
         name=request.name,
         description=request.description,
-        filters=request.filters, # Store raw dict/list
+        filters={
+            "filters": request.filters,
+            "sort_by": request.sort_by,
+            "sort_order": request.sort_order,
+        },
         is_shared=request.is_shared
     )
     db.add(saved_filter)
@@ -88,30 +171,41 @@ def get_my_filters(
         SavedFilter.user_id == current_user.id
     ).all()
 
-@router.post("/filters/{filter_id}/apply")
+@router.post("/filters/{filter_id}/apply", response_class=FastJSONResponse)
 def apply_saved_filter(
     filter_id: int,
-    db: Session = Depends(deps.get_db),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum rows to return (max 1000)"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    db: Session = Depends(deps.get_db_analytics),
     current_user: User = Depends(deps.get_current_active_user),
-):
+) -> FastJSONResponse:
     """
     Load and apply a saved filter.
+
+    Pages are cached until the next process data write, so dashboards
+    refreshing a saved filter do not re-run the query.
+
+    Raises:
+        ResourceNotFoundException: If the filter does not exist
+        ValidationException: If the stored filter or the cursor is invalid
     """
-    saved_filter = db.query(SavedFilter).get(filter_id)
+    saved_filter = db.get(SavedFilter, filter_id)
     if not saved_filter:
         raise ResourceNotFoundException(resource_type="Filter", resource_id=filter_id)
-        
-    # Convert stored dict back to FilterExpression objects if needed
-    # For now, we assume the stored JSON structure matches what apply_dynamic_filters expects
-    # We might need to deserialize properly if strict typing is enforced
-    
-    # Simple deserialization attempt (assuming stored as list of dicts)
-    from app.schemas.search import FilterExpression
-    filter_exprs = [FilterExpression(**f) for f in saved_filter.filters]
-    
-    results = search_crud.apply_dynamic_filters(
-        db,
-        ProcessData,
-        filter_exprs
-    )
-    return results
+
+    stored = saved_filter.filters
+    if not isinstance(stored, dict):
+        stored = {"filters": stored}
+    try:
+        page = filters_crud.run_saved(
+            db,
+            filters_crud.PROCESS_DATA,
+            filters_crud.parse_filters(stored.get("filters") or []),
+            stored.get("sort_by"),
+            stored.get("sort_order") or "asc",
+            limit,
+            cursor,
+        )
+    except ValueError as e:
+        raise ValidationException(str(e))
+    return trusted_json(page)
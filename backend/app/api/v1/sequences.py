@@ -11,13 +11,22 @@ import zipfile
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
-import httpx
 import yaml
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_async_db, get_station_auth, get_auth_context, StationAuth
+from app.api.deps import (
+    StationAuth,
+    conditional_get_async,
+    get_async_db,
+    get_auth_context,
+    get_auth_context_async,
+    get_current_user,
+    get_current_user_async,
+    get_station_auth,
+    no_compression,
+)
 from app.crud.sequence import sequence_crud
 from app.models.sequence import Sequence
 from app.models.user import User, UserRole
@@ -39,9 +48,19 @@ from app.schemas.sequence import (
     SequenceUploadResponse,
     SequenceVersionResponse,
 )
+from app.services.git_fetcher import GitFetchError, GitHubFetcher
 
 router = APIRouter(prefix="/sequences", tags=["sequences"])
 
+# ETag revalidation: station polls get 304 Not Modified while no sequence changed
+# (async session and auth, like the async endpoints they guard)
+sequences_not_modified = conditional_get_async(
+    "sequences", "sequence_versions", auth=get_auth_context_async
+)
+deployments_not_modified = conditional_get_async(
+    "sequence_deployments", auth=get_current_user_async
+)
+
 
 # ============================================================================
 # Helper Functions
@@ -209,7 +228,8 @@ async def download_github_folder_as_zip(
     """
     Download a GitHub folder as a ZIP file.
 
-    Uses GitHub API to list files and download them, then creates a ZIP.
+    Delegates to the shared GitHub fetch engine (archive download with a
+    pooled, concurrent contents-API fallback).
 
     Args:
         owner: Repository owner
@@ -220,96 +240,41 @@ async def download_github_folder_as_zip(
     Returns:
         ZIP file contents as bytes
     """
-    base_api_url = f"https://api.github.com/repos/{owner}/{repo}/contents"
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "F2X-NeuroHub-Sequence-Uploader",
-    }
-
-    async def fetch_contents(path: str) -> list:
-        """Recursively fetch directory contents."""
-        url = f"{base_api_url}/{path}" if path else base_api_url
-        url = f"{url}?ref={branch}"
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-
-            if response.status_code == 404:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Path not found: {path}",
-                )
-            elif response.status_code == 403:
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail="GitHub API rate limit exceeded. Please try again later.",
-                )
-            elif response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_BAD_GATEWAY,
-                    detail=f"GitHub API error: {response.status_code}",
-                )
-
-            return response.json()
-
-    async def download_file(download_url: str) -> bytes:
-        """Download a single file."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(download_url, headers=headers)
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_BAD_GATEWAY,
-                    detail=f"Failed to download file: {download_url}",
-                )
-            return response.content
-
-    async def process_contents(path: str, files: dict) -> None:
-        """Recursively process directory contents."""
-        contents = await fetch_contents(path)
-
-        if not isinstance(contents, list):
-            # Single file
-            contents = [contents]
-
-        for item in contents:
-            item_path = item["path"]
-            # Calculate relative path from folder_path
-            if folder_path:
-                rel_path = item_path[len(folder_path):].lstrip("/")
-            else:
-                rel_path = item_path
-
-            if item["type"] == "file":
-                file_content = await download_file(item["download_url"])
-                files[rel_path] = file_content
-            elif item["type"] == "dir":
-                await process_contents(item_path, files)
-
-    # Collect all files
-    files: Dict[str, bytes] = {}
-    await process_contents(folder_path, files)
-
-    if not files:
+    try:
+        async with GitHubFetcher(user_agent="F2X-NeuroHub-Sequence-Uploader") as fetcher:
+            return await fetcher.download_folder_as_zip(owner, repo, branch, folder_path)
+    except GitFetchError as e:
+        if e.status_code == 404:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Path not found: {folder_path}",
+            )
+        elif e.status_code == 403:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="GitHub API rate limit exceeded. Please try again later.",
+            )
+        elif e.status_code is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No files found in the specified path",
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=str(e),
         )
 
-    # Create ZIP
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        for file_path, content in files.items():
-            zf.writestr(file_path, content)
-
-    return zip_buffer.getvalue()
-
 
 # ============================================================================
 # List & Get Endpoints
 # ============================================================================
 
 
-@router.get("", response_model=Dict[str, Any])
+@router.get(
+    "",
+    response_model=Dict[str, Any],
+    dependencies=[Depends(sequences_not_modified)],
+)
 async def list_sequences(
     is_active: Optional[bool] = Query(None),
     is_deprecated: Optional[bool] = Query(None),
@@ -318,7 +283,7 @@ async def list_sequences(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     db: AsyncSession = Depends(get_async_db),
-    auth: Union[User, StationAuth] = Depends(get_auth_context),
+    auth: Union[User, StationAuth] = Depends(get_auth_context_async),
 ) -> Dict[str, Any]:
     """
     List all sequences with filtering and pagination.
@@ -345,23 +310,31 @@ async def list_sequences(
     }
 
 
-@router.get("/{sequence_name}", response_model=SequenceResponse)
+@router.get(
+    "/{sequence_name}",
+    response_model=SequenceResponse,
+    dependencies=[Depends(sequences_not_modified)],
+)
 async def get_sequence(
     sequence_name: str,
     db: AsyncSession = Depends(get_async_db),
-    auth: Union[User, StationAuth] = Depends(get_auth_context),
+    auth: Union[User, StationAuth] = Depends(get_auth_context_async),
 ) -> SequenceResponse:
     """Get sequence details by name. Supports JWT and X-API-Key authentication."""
     sequence = await get_sequence_or_404(db, sequence_name=sequence_name)
     return SequenceResponse.model_validate(sequence)
 
 
-@router.get("/{sequence_name}/versions", response_model=List[SequenceVersionResponse])
+@router.get(
+    "/{sequence_name}/versions",
+    response_model=List[SequenceVersionResponse],
+    dependencies=[Depends(sequences_not_modified)],
+)
 async def get_sequence_versions(
     sequence_name: str,
     limit: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_async_db),
-    auth: Union[User, StationAuth] = Depends(get_auth_context),
+    auth: Union[User, StationAuth] = Depends(get_auth_context_async),
 ) -> List[SequenceVersionResponse]:
     """Get version history for a sequence. Supports JWT and X-API-Key authentication."""
     sequence = await get_sequence_or_404(db, sequence_name=sequence_name)
@@ -545,7 +518,7 @@ async def upload_sequence_from_github(
         raise
     except Exception as e:
         raise HTTPException(
-            status_code=status.HTTP_BAD_GATEWAY,
+            status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"Failed to download from GitHub: {str(e)}",
         )
 
@@ -667,7 +640,8 @@ async def upload_sequence_from_github(
 # ============================================================================
 
 
-@router.get("/{sequence_name}/download")
+# Packages are already-compressed ZIPs; stations stream them to disk byte for byte
+@router.get("/{sequence_name}/download", dependencies=[Depends(no_compression)])
 async def download_sequence(
     sequence_name: str,
     version: Optional[str] = Query(None, description="Specific version to download"),
@@ -807,14 +781,18 @@ async def deploy_sequence(
     )
 
 
-@router.get("/{sequence_name}/deployments", response_model=List[SequenceDeploymentResponse])
+@router.get(
+    "/{sequence_name}/deployments",
+    response_model=List[SequenceDeploymentResponse],
+    dependencies=[Depends(deployments_not_modified)],
+)
 async def get_sequence_deployments(
     sequence_name: str,
     station_id: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     limit: int = Query(50, ge=1, le=100),
     db: AsyncSession = Depends(get_async_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_async),
 ) -> List[SequenceDeploymentResponse]:
     """Get deployment history for a sequence."""
     sequence = await get_sequence_or_404(db, sequence_name=sequence_name)
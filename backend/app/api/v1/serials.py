@@ -29,6 +29,7 @@ from fastapi import APIRouter, Depends, Path, Query, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.crud import serial as serial_crud
 from app.models import User
 from app.schemas.serial import SerialCreate, SerialInDB, SerialUpdate, SerialListItem
 from app.api import deps
@@ -55,6 +56,7 @@ def list_serials(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=10000, description="Maximum records to return (max 10000)"),
     status: Optional[str] = Query(None, description="Filter by status: CREATED, IN_PROGRESS, PASSED, FAILED"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(serial_crud.BY_SEQUENCE)),
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ):
@@ -64,6 +66,7 @@ def list_serials(
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of serials to return (default: 50, max: 10000)
+        cursor: X-Next-Cursor of the previous page, instead of skip
         status: Optional filter for serial status
 
     Returns:
@@ -73,7 +76,9 @@ def list_serials(
         HTTPException 400: If status filter is invalid
         HTTPException 422: If query parameters are invalid
     """
-    return serial_service.list_serials(db, skip=skip, limit=limit, status=status)
+    return page.respond(
+        serial_service.list_serials(db, skip=skip, limit=limit, status=status, after=page.after), limit
+    )
 
 
 @router.get(
@@ -85,6 +90,7 @@ def list_serials(
 def get_failed_serials(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=10000, description="Maximum records to return (max 10000)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(serial_crud.BY_LOT)),
     db: Session = Depends(get_db),
 ):
     """
@@ -93,6 +99,7 @@ def get_failed_serials(
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of serials to return (default: 50, max: 10000)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of FAILED Serial objects with rework_count < 3
@@ -100,7 +107,7 @@ def get_failed_serials(
     Raises:
         HTTPException 422: If query parameters are invalid
     """
-    return serial_service.get_failed_serials(db, skip=skip, limit=limit)
+    return page.respond(serial_service.get_failed_serials(db, skip=skip, limit=limit, after=page.after), limit)
 
 
 @router.get(
@@ -145,6 +152,7 @@ def get_serials_by_lot(
     lot_id: int = Path(..., gt=0, description="Lot ID"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=10000, description="Maximum records to return (max 10000)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(serial_crud.BY_SEQUENCE)),
     db: Session = Depends(get_db),
 ):
     """
@@ -156,6 +164,7 @@ def get_serials_by_lot(
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of serials to return (default: 100, max: 10000)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of Serial objects in the lot, ordered by sequence
@@ -163,7 +172,9 @@ def get_serials_by_lot(
     Raises:
         HTTPException 422: If query parameters are invalid
     """
-    return serial_service.get_serials_by_lot(db, lot_id=lot_id, skip=skip, limit=limit)
+    return page.respond(
+        serial_service.get_serials_by_lot(db, lot_id=lot_id, skip=skip, limit=limit, after=page.after), limit
+    )
 
 
 @router.get(
@@ -176,6 +187,7 @@ def get_serials_by_status(
     status_filter: str = Path(..., description="Status filter: CREATED, IN_PROGRESS, PASSED, FAILED"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=10000, description="Maximum records to return (max 10000)"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(serial_crud.BY_LOT)),
     db: Session = Depends(get_db),
 ):
     """
@@ -187,6 +199,7 @@ def get_serials_by_status(
     Query Parameters:
         skip: Offset for pagination (default: 0)
         limit: Number of serials to return (default: 50, max: 10000)
+        cursor: X-Next-Cursor of the previous page, instead of skip
 
     Returns:
         List of Serial objects with specified status
@@ -195,7 +208,12 @@ def get_serials_by_status(
         HTTPException 400: If status is invalid
         HTTPException 422: If query parameters are invalid
     """
-    return serial_service.get_serials_by_status(db, status_filter=status_filter, skip=skip, limit=limit)
+    return page.respond(
+        serial_service.get_serials_by_status(
+            db, status_filter=status_filter, skip=skip, limit=limit, after=page.after
+        ),
+        limit,
+    )
 
 
 @router.get(
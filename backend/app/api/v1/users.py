@@ -89,12 +89,14 @@ def list_users(
         None,
         description="Filter by active status",
     ),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.user.NEWEST)),
 ):
     """
     Retrieve a paginated list of users.
 
     Query parameters allow filtering by role and active status. Results are
-    ordered by creation timestamp (newest first).
+    ordered by creation timestamp (newest first); pass the X-Next-Cursor
+    header of a page as ``cursor`` to get the next one.
 
     Returns:
         List of UserInDB schemas (password_hash excluded)
@@ -106,8 +108,9 @@ def list_users(
             limit=limit,
             role=role,
             is_active=is_active,
+            after=page.after,
         )
-        return users
+        return page.respond(users, limit)
     except ValueError as e:
         raise ValidationException(message=str(e))
 
@@ -220,6 +223,7 @@ def get_users_by_role(
         le=1000,
         description="Maximum number of records to return (max: 1000)",
     ),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.user.NEWEST)),
 ):
     """
     Get all users with a specific role.
@@ -231,6 +235,7 @@ def get_users_by_role(
         role: UserRole to filter by (ADMIN, MANAGER, OPERATOR)
         skip: Pagination offset
         limit: Maximum records to return
+        page: Keyset position (cursor query parameter, instead of skip)
 
     Returns:
         List of UserInDB schemas with the specified role
@@ -241,8 +246,9 @@ def get_users_by_role(
             role=role,
             skip=skip,
             limit=limit,
+            after=page.after,
         )
-        return users
+        return page.respond(users, limit)
     except ValueError as e:
         raise ValidationException(message=str(e))
 
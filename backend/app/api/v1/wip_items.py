@@ -15,16 +15,21 @@ Endpoints:
     GET /wip-items/statistics: Get WIP statistics
 
 Note: WIP generation endpoint moved to /lots/{lot_id}/start-wip-generation in lots.py
+
+Scan, start-process and complete-process are shop-floor hot paths: each
+can be served by an async variant on the async engine (settings.ASYNC_HOT_PATHS).
 """
 
-from typing import List, Optional, Union
-from fastapi import APIRouter, Depends, Query, Path
-from fastapi.responses import StreamingResponse
+from typing import List, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, Query, Path, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
-from app.core.deps import StationAuth, get_auth_context
-from app.models import User
+from app.core.change_tracker import etag_matches
+from app.core.deps import StationAuth, get_auth_context, get_auth_context_async
+from app.core.responses import FastJSONResponse, trusted_json
+from app.models import User, WIPItem
 from app.crud import wip_item as crud
 from app.schemas.wip_item import (
     WIPItemCreate,
@@ -37,7 +42,7 @@ from app.schemas.wip_item import (
     WIPStatus,
     WIPScanResponse,
 )
-from app.utils.barcode_generator import generate_barcode_image
+from app.services.label_service import label_service
 from app.services.wip_service import WIPValidationError
 from app.services.printer_service import printer_service
 from app.models.process import Process
@@ -61,6 +66,11 @@ router = APIRouter(
     },
 )
 
+# ETag revalidation: statistics polls get 304 Not Modified while no WIP changed
+statistics_not_modified = deps.conditional_get(
+    "wip_items", "lots", "processes", auth=deps.get_current_active_user
+)
+
 
 @router.get(
     "/",
@@ -74,15 +84,17 @@ def list_wip_items(
     lot_id: Optional[int] = Query(None, description="Filter by LOT ID"),
     status: Optional[WIPStatus] = Query(None, description="Filter by status"),
     process_id: Optional[int] = Query(None, description="Filter by current process"),
+    page: deps.KeysetPage = Depends(deps.keyset_page(crud.NEWEST)),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
-) -> List[WIPItemInDB]:
+) -> FastJSONResponse:
     """
     List WIP items with pagination and filters.
 
     Args:
         skip: Number of records to skip (pagination)
         limit: Maximum records to return
+        page: Keyset position (cursor query parameter, instead of skip)
         lot_id: Optional LOT ID filter
         status: Optional status filter
         process_id: Optional process ID filter
@@ -90,21 +102,30 @@ def list_wip_items(
         current_user: Current authenticated user
 
     Returns:
-        List of WIP items
+        List of WIP items (response rows, not re-validated)
     """
-    if lot_id:
-        return crud.get_by_lot(db, lot_id, skip=skip, limit=limit)
-    elif status:
-        return crud.get_by_status(db, status.value, skip=skip, limit=limit)
-    else:
-        return crud.get_multi(db, skip=skip, limit=limit)
+    rows = crud.get_multi_rows(
+        db,
+        lot_id=lot_id,
+        status=status.value if status else None,
+        skip=skip,
+        limit=limit,
+        after=page.after,
+    )
+    page.respond(rows, limit, crud.BY_SEQUENCE if lot_id else crud.NEWEST)
+    return trusted_json(rows, page.response)
 
 
 @router.get(
     "/statistics",
     response_model=WIPStatistics,
     summary="Get WIP statistics",
-    description="Get WIP statistics by LOT or process",
+    description=(
+        "Get WIP statistics by LOT or process. Responses carry an ETag; send it "
+        "back in If-None-Match to get 304 Not Modified while no WIP changed."
+    ),
+    responses={304: {"description": "Statistics unchanged since the given ETag"}},
+    dependencies=[Depends(statistics_not_modified)],
 )
 def get_wip_statistics(
     lot_id: Optional[int] = Query(None, description="Filter by LOT ID"),
@@ -122,7 +143,7 @@ def get_wip_statistics(
         current_user: Current authenticated user
 
     Returns:
-        WIP statistics
+        WIP statistics, or 304 Not Modified if unchanged
     """
     stats = crud.get_statistics(db, lot_id, process_id)
     return WIPStatistics(**stats)
@@ -146,52 +167,64 @@ def get_wip_item(
     return wip_item
 
 
+# Barcode images are content-addressed: the URL always yields the same image
+BARCODE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
 @router.get(
     "/barcode/{wip_id}",
     summary="Generate barcode image",
-    description="Generate Code128 barcode image for WIP ID",
+    description=(
+        "Generate Code128 or QR barcode image for WIP ID. Images are cached "
+        "server-side and marked immutable for browsers."
+    ),
+    responses={304: {"description": "Client already has this barcode image"}},
 )
 def get_wip_barcode(
+    request: Request,
     wip_id: str = Path(..., description="WIP ID (e.g., WIP-KR01PSA2511-001)"),
     barcode_type: str = Query("code128", description="Barcode type (code128 or qr)"),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
-):
+) -> Response:
     """
     Generate barcode image for WIP ID.
 
     Args:
+        request: Incoming request (If-None-Match)
         wip_id: WIP ID string
         barcode_type: Type of barcode (code128 or qr)
         db: Database session
         current_user: Current authenticated user
 
     Returns:
-        PNG image as StreamingResponse
+        PNG image, or 304 Not Modified if the client has it already
 
     Raises:
         HTTPException: 404 if WIP not found, 400 if barcode generation fails
     """
-    # Verify WIP exists
-    wip_item = crud.get_by_wip_id(db, wip_id)
+    # Verify WIP exists (also before a 304, so deleted WIPs are not revalidated)
+    wip_item = crud.get_by_wip_id(db, wip_id, eager_loading="minimal")
     if not wip_item:
         raise WIPItemNotFoundException(wip_id=wip_id)
 
     try:
-        # Generate barcode image
-        barcode_image = generate_barcode_image(wip_id, barcode_type=barcode_type)
-
-        # Return as streaming response
-        return StreamingResponse(
-            barcode_image,
-            media_type="image/png",
-            headers={
-                "Content-Disposition": f"inline; filename=wip_{wip_id}_barcode.png"
-            }
-        )
+        etag = f'"{label_service.png_key(wip_id, barcode_type)}"'
+    except ValueError as e:
+        raise ValidationException(message=f"Failed to generate barcode: {str(e)}")
+
+    headers = {"ETag": etag, "Cache-Control": BARCODE_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    try:
+        image = label_service.render_png(wip_id, barcode_type)
     except Exception as e:
         raise ValidationException(message=f"Failed to generate barcode: {str(e)}")
 
+    headers["Content-Disposition"] = f"inline; filename=wip_{wip_id}_barcode.png"
+    return Response(content=image, media_type="image/png", headers=headers)
+
 
 @router.post(
     "/{wip_id}/print-label",
@@ -241,12 +274,60 @@ def print_wip_label(
 
 
 
+def _pass_for_process(db: Session, wip_item_id: int, process_id: Optional[int]) -> Tuple[bool, Optional[str]]:
+    """
+    Check if WIP already has COMPLETED PASS for the requested process (BR-004 pre-check).
+
+    Returns:
+        (has_pass, warning message)
+    """
+    if not process_id:
+        return False, None
+
+    # Only check for PASS records that have completed_at set (truly completed)
+    existing_pass = db.query(WIPProcessHistory).filter(
+        WIPProcessHistory.wip_item_id == wip_item_id,
+        WIPProcessHistory.process_id == process_id,
+        WIPProcessHistory.result == ProcessResult.PASS.value,
+        WIPProcessHistory.completed_at.isnot(None),  # Must be completed
+    ).first()
+    if not existing_pass:
+        return False, None
+
+    process = db.query(Process).filter(Process.id == process_id).first()
+    process_name = process.process_name_ko if process else f"공정 {process_id}"
+    return True, f"이 WIP는 이미 '{process_name}'을 PASS했습니다. 다시 실행하면 완공 시 에러가 발생합니다."
+
+
+async def scan_wip_barcode_async(
+    wip_id: str = Path(..., description="WIP ID from barcode scan"),
+    process_id: Optional[int] = Query(None, description="Process ID for validation"),
+    db: AsyncSession = Depends(deps.get_async_db),
+    auth: Union[User, StationAuth] = Depends(get_auth_context_async),
+) -> WIPScanResponse:
+    """Process WIP barcode scan on the async engine."""
+    try:
+        wip_item = await crud.scan_async(db, wip_id, process_id)
+        if not wip_item:
+            raise WIPItemNotFoundException(wip_id=wip_id)
+
+        has_pass, warning_msg = await db.run_sync(_pass_for_process, wip_item.id, process_id)
+
+        response = WIPScanResponse.model_validate(wip_item)
+        response.has_pass_for_process = has_pass
+        response.pass_warning_message = warning_msg
+        return response
+    except ValueError as e:
+        raise ValidationException(message=str(e))
+
+
 @router.post(
     "/{wip_id}/scan",
     response_model=WIPScanResponse,
     summary="Scan WIP barcode",
     description="Process WIP barcode scan. Supports both JWT and API Key authentication.",
 )
+@deps.hot_path("wip-items.scan", scan_wip_barcode_async)
 def scan_wip_barcode(
     wip_id: str = Path(..., description="WIP ID from barcode scan"),
     process_id: Optional[int] = Query(None, description="Process ID for validation"),
@@ -278,21 +359,7 @@ def scan_wip_barcode(
             raise WIPItemNotFoundException(wip_id=wip_id)
 
         # Check if WIP already has COMPLETED PASS for the requested process (BR-004 pre-check)
-        # Only check for PASS records that have completed_at set (truly completed)
-        has_pass = False
-        warning_msg = None
-        if process_id:
-            existing_pass = db.query(WIPProcessHistory).filter(
-                WIPProcessHistory.wip_item_id == wip_item.id,
-                WIPProcessHistory.process_id == process_id,
-                WIPProcessHistory.result == ProcessResult.PASS.value,
-                WIPProcessHistory.completed_at.isnot(None),  # Must be completed
-            ).first()
-            if existing_pass:
-                has_pass = True
-                process = db.query(Process).filter(Process.id == process_id).first()
-                process_name = process.process_name_ko if process else f"공정 {process_id}"
-                warning_msg = f"이 WIP는 이미 '{process_name}'을 PASS했습니다. 다시 실행하면 완공 시 에러가 발생합니다."
+        has_pass, warning_msg = _pass_for_process(db, wip_item.id, process_id)
 
         # Convert to response with additional fields
         response = WIPScanResponse.model_validate(wip_item)
@@ -303,12 +370,36 @@ def scan_wip_barcode(
         raise ValidationException(message=str(e))
 
 
+async def start_wip_process_async(
+    wip_id: int = Path(..., gt=0, description="WIP item identifier"),
+    process_start: WIPItemProcessStart = ...,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user_async),
+) -> WIPItemInDB:
+    """Start a process on WIP item (BR-003) on the async engine."""
+    try:
+        return await crud.start_process_async(
+            db,
+            wip_id,
+            process_start.process_id,
+            process_start.operator_id,
+            process_start.equipment_id,
+            process_start.started_at,
+            process_start.process_session_id,
+        )
+    except WIPValidationError as e:
+        raise BusinessRuleException(message=str(e))
+    except ValueError:
+        raise WIPItemNotFoundException(wip_id=wip_id)
+
+
 @router.post(
     "/{wip_id}/start-process",
     response_model=WIPItemInDB,
     summary="Start process on WIP",
     description="Start a manufacturing process on WIP item (BR-003)",
 )
+@deps.hot_path("wip-items.start-process", start_wip_process_async)
 def start_wip_process(
     wip_id: int = Path(..., gt=0, description="WIP item identifier"),
     process_start: WIPItemProcessStart = ...,
@@ -350,12 +441,49 @@ def start_wip_process(
         raise WIPItemNotFoundException(wip_id=wip_id)
 
 
+async def complete_wip_process_async(
+    wip_id: int = Path(..., gt=0, description="WIP item identifier"),
+    process_id: int = Query(..., ge=1, le=6, description="Process identifier (1-6)"),
+    operator_id: int = Query(..., gt=0, description="Operator identifier"),
+    process_complete: WIPItemProcessComplete = ...,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user_async),
+) -> dict:
+    """Complete a process on WIP item (BR-004) on the async engine."""
+    try:
+        history = await crud.complete_process_async(
+            db,
+            wip_id,
+            process_id,
+            operator_id,
+            process_complete.result,
+            process_complete.measurements,
+            process_complete.defects,
+            process_complete.notes,
+            started_at=process_complete.started_at,
+            completed_at=process_complete.completed_at,
+        )
+
+        # Refreshed by complete_process; served from the identity map
+        wip_item = await db.get(WIPItem, wip_id)
+
+        return {
+            "process_history": history.to_dict(),
+            "wip_item": wip_item.to_dict(),
+        }
+    except WIPValidationError as e:
+        raise BusinessRuleException(message=str(e))
+    except ValueError:
+        raise WIPItemNotFoundException(wip_id=wip_id)
+
+
 @router.post(
     "/{wip_id}/complete-process",
     response_model=dict,
     summary="Complete process on WIP",
     description="Complete a manufacturing process on WIP item (BR-004)",
 )
+@deps.hot_path("wip-items.complete-process", complete_wip_process_async)
 def complete_wip_process(
     wip_id: int = Path(..., gt=0, description="WIP item identifier"),
     process_id: int = Query(..., ge=1, le=6, description="Process identifier (1-6)"),
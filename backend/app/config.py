@@ -23,10 +23,36 @@ class Settings(BaseSettings):
     APP_NAME: str = "F2X NeuroHub MES API"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = False
+    WEB_CONCURRENCY: int = 1  # API worker processes (also uvicorn's default for --workers)
 
     # Database
     DATABASE_URL: str = "sqlite:///./dev.db"  # Force SQLite for local development
     DB_ECHO: bool = False  # SQLAlchemy echo SQL statements
+    # Startup side effects; disable both when the schema is managed by Alembic
+    # so workers start without touching the database
+    DB_CREATE_ALL_ON_STARTUP: bool = True  # Base.metadata.create_all in every worker
+    INIT_DEFAULT_ADMIN_ON_STARTUP: bool = True  # Create default admin if none exists
+    # Hot path routes served on the async engine instead of the threadpool, e.g.
+    # ASYNC_HOT_PATHS=["process-operations.start","process-operations.complete","wip-items.scan",
+    #                  "wip-items.start-process","wip-items.complete-process"]
+    # Auto-print processes talk to the printer on the event loop; keep their routes sync.
+    ASYNC_HOT_PATHS: list[str] = []
+
+    # Workload pools (PostgreSQL): shop-floor operations, analytics/reports and
+    # background jobs each get their own engine. Statement timeouts in ms (0 = none).
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a pooled connection
+    DB_OPS_POOL_SIZE: int = 10
+    DB_OPS_MAX_OVERFLOW: int = 20
+    DB_OPS_STATEMENT_TIMEOUT_MS: int = 15_000
+    DB_ANALYTICS_URL: Optional[str] = None  # Read replica for reports (default: DATABASE_URL)
+    DB_ANALYTICS_POOL_SIZE: int = 5
+    DB_ANALYTICS_MAX_OVERFLOW: int = 5
+    DB_ANALYTICS_STATEMENT_TIMEOUT_MS: int = 300_000
+    DB_ANALYTICS_MAX_REPLICA_LAG: float = 30.0  # Seconds; a lagging/down replica falls back to primary
+    DB_REPLICA_CHECK_INTERVAL: float = 10.0  # Seconds between replica lag checks
+    DB_JOBS_POOL_SIZE: int = 4
+    DB_JOBS_MAX_OVERFLOW: int = 4
+    DB_JOBS_STATEMENT_TIMEOUT_MS: int = 0
 
     # Security
     # SECRET_KEY must be set via environment variable in production (DEBUG=False)
@@ -62,6 +88,35 @@ class Settings(BaseSettings):
     PRINTER_IP: str = "192.168.35.79"  # Zebra printer IP address
     PRINTER_PORT: int = 9100  # Zebra printer port (default: 9100 for raw TCP)
 
+    # Label rendering
+    LABEL_CACHE_DIR: Optional[str] = None  # On-disk label cache (default: <tmp>/f2x-neurohub-labels)
+    LABEL_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # Rendered labels kept in memory (bytes)
+    LABEL_CACHE_DISK_MAX_BYTES: int = 1024 * 1024 * 1024  # On-disk labels; least recently used pruned (0 = unbounded)
+    LABEL_RENDER_WORKERS: int = 4  # Processes for batch barcode rasterization
+
+    # Data export
+    EXPORT_DIR: Optional[str] = None  # Background export files (default: <tmp>/f2x-neurohub-exports)
+    EXPORT_STREAM_MAX_ROWS: int = 50_000  # Larger exports run as a background job
+
+    # Reports (closed days are read from daily_report_snapshots)
+    REPORT_MAX_RANGE_DAYS: int = 366  # Longest date range of one report
+    REPORT_TIMEZONE: str = "Asia/Seoul"  # Time zone of report days (same as the celery beat schedule)
+    REPORT_SNAPSHOT_BACKFILL_DAYS: int = 31  # Closed days the nightly job fills in if missing
+    REPORT_SNAPSHOT_GRACE_DAYS: int = 3  # Last closed days re-materialized every night (late data, corrections)
+
+    # Event-driven alert rules (app.analytics.alert_engine)
+    ALERT_ENGINE_ENABLED: bool = True
+    ALERT_ENGINE_QUEUE_SIZE: int = 10_000  # Events waiting for evaluation; newer ones are dropped when full
+
+    # Unread alert counter and push stream (app.core.alert_notifications)
+    ALERT_STREAM_POLL_SECONDS: float = 2.0  # How often each worker checks for alert changes while clients listen
+    ALERT_STREAM_KEEPALIVE_SECONDS: float = 15.0  # Comment line sent to idle /alerts/stream clients
+    ALERT_STREAM_QUEUE_SIZE: int = 100  # Messages buffered per client; older ones are dropped
+
+    # Error rate aggregates (per-minute ring in memory, hourly rows in error_log_hourly)
+    ERROR_RATE_WINDOW_HOURS: int = 48  # Per-minute buckets kept in memory
+    ERROR_RATE_FLUSH_INTERVAL: float = 60.0  # Seconds between flushes to error_log_hourly
+
     # CORS - Configure via environment variable CORS_ORIGINS as comma-separated list
     # Example: CORS_ORIGINS=["http://localhost:3000","https://production.example.com"]
     CORS_ORIGINS: list[str] = [
@@ -83,10 +138,30 @@ class Settings(BaseSettings):
     RATE_LIMIT_DEFAULT_REQUESTS: int = 100  # Requests per window
     RATE_LIMIT_DEFAULT_WINDOW: int = 60  # Window in seconds
 
+    # Idempotency-Key replay for retried write requests
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_TTL_SECONDS: int = 24 * 3600  # How long a response can be replayed
+    IDEMPOTENCY_WAIT_TIMEOUT: float = 30.0  # Seconds a duplicate waits for the in-flight original
+    IDEMPOTENCY_LEASE_SECONDS: float = 60.0  # In-flight claim lease, renewed while the request runs (crashed worker takeover)
+    IDEMPOTENCY_SWEEP_INTERVAL: float = 600.0  # Seconds between sweeps of expired keys
+    IDEMPOTENCY_MAX_RESPONSE_BYTES: int = 1024 * 1024  # Larger responses are not stored
+
+    # Response compression (br needs the optional brotli package)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # Smaller bodies are sent uncompressed (bytes)
+    COMPRESSION_GZIP_LEVEL: int = 5
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
     # Caching
     CACHE_ENABLED: bool = True
     CACHE_DEFAULT_TTL: int = 300  # 5 minutes default TTL
     CACHE_MAX_SIZE: int = 1000  # Maximum cache entries
+    SAVED_FILTER_CACHE_TTL: int = 300  # Saved filter pages (keyed on the shared data version)
+    ETAG_MAX_AGE_SECONDS: int = 300  # ETags also change this often, bounding a missed version bump (0 = never)
+
+    # Git Sync
+    GITHUB_API_URL: str = "https://api.github.com"
+    GIT_FETCH_CONCURRENCY: int = 8  # Max concurrent downloads per fetch
 
     # API
     API_V1_PREFIX: str = "/api/v1"
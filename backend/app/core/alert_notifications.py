@@ -0,0 +1,238 @@
+"""
+Cached unread-alert counter and push notifications for alert changes.
+
+Notification badges used to run ``SELECT count(*) ... WHERE status = 'UNREAD'``
+on every poll. The notifier caches that number under the ``alerts`` change
+version (app.core.change_tracker): every committed alert write, by any API
+process, moves the version, so a poll costs a primary key lookup and the
+count only runs again after a change. Alert read state is global
+(Alert.status), so there is one count rather than one per user.
+
+Clients subscribe to a stream of changes instead of polling (see stream()):
+    - alert_created: a new alert (Alert.to_dict())
+    - unread_count: the unread count changed
+
+While a process has subscribers it checks the alerts version every
+``ALERT_STREAM_POLL_SECONDS`` (one lookup per process, not per client).
+After a change it recounts and publishes the alerts created since, so
+alerts written by any worker, the alert engine or a Celery task reach the
+subscribers of every worker within one interval.
+
+Example:
+    count = alert_notifier.unread_count(db)
+
+    return StreamingResponse(alert_notifier.stream(count), media_type="text/event-stream")
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.change_tracker import change_tracker
+from app.crud import alert as alert_crud
+from app.models.alert import Alert
+
+logger = logging.getLogger(__name__)
+
+# Alerts created this long before a check are looked up again, so an alert
+# whose transaction committed late is not missed
+LOOKBACK = timedelta(minutes=2)
+# Most new alerts published per check
+MAX_NEW_ALERTS = 500
+
+
+class AlertNotifier:
+    """Thread-safe unread-alert counter with asyncio subscribers."""
+
+    def __init__(
+        self,
+        poll_interval: float,
+        queue_size: int = 100,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ) -> None:
+        self.poll_interval = poll_interval
+        self.queue_size = queue_size
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self._count: Optional[Tuple[int, int]] = None  # (alerts version, unread count)
+        self._version: Optional[int] = None  # alerts version of the last poll
+        self._published: Dict[int, float] = {}  # alert id -> monotonic time first seen
+        self._subscribers: Dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+        self._poller: Optional[asyncio.Task] = None
+
+    # Counter
+
+    def unread_count(self, db: Session) -> int:
+        """
+        Number of unread alerts.
+
+        Counts only if an alert changed since the last count; a new count
+        that differs from the cached one is published to subscribers.
+
+        Args:
+            db: SQLAlchemy database session
+
+        Returns:
+            Number of unread alerts
+        """
+        version = change_tracker.version(db, Alert.__tablename__)
+        with self._lock:
+            cached = self._count
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        # Counted after the version read: a concurrent write is recounted next time
+        count = alert_crud.get_unread_count(db)
+        with self._lock:
+            self._count = (version, count)
+        if cached is not None and cached[1] != count:
+            self.publish({"type": "unread_count", "unread_count": count})
+        return count
+
+    def poll(self, db: Optional[Session] = None) -> None:
+        """
+        Publish alert changes committed since the last poll, by any process.
+
+        The first poll only records the current state.
+
+        Args:
+            db: SQLAlchemy database session (default: a new one)
+        """
+        if db is None:
+            with self._new_session() as session:
+                return self.poll(session)
+
+        version = change_tracker.version(db, Alert.__tablename__)
+        with self._lock:
+            previous, self._version = self._version, version
+        if previous == version:
+            return
+
+        alerts = alert_crud.get_created_since(
+            db, datetime.now(timezone.utc) - LOOKBACK, limit=MAX_NEW_ALERTS
+        )
+        now = time.monotonic()
+        with self._lock:
+            new = [alert for alert in alerts if alert.id not in self._published]
+            self._published.update((alert.id, now) for alert in new)
+            horizon = now - 2 * LOOKBACK.total_seconds()
+            self._published = {id_: seen for id_, seen in self._published.items() if seen >= horizon}
+        if previous is not None:
+            for alert in new:
+                self.publish({"type": "alert_created", "alert": alert.to_dict()})
+        self.unread_count(db)
+
+    def _new_session(self) -> Session:
+        if self._session_factory is None:
+            from app.database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    # Subscribers
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Register a queue for change messages (call from the event loop).
+
+        Starts polling for changes while the process has subscribers.
+
+        Returns:
+            Queue receiving message dicts; if a subscriber falls behind by
+            queue_size messages the oldest ones are dropped
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers[queue] = loop
+            if self._poller is None or self._poller.done():
+                self._poller = loop.create_task(self._poll_loop())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop delivering messages to a queue (polling stops with the last one)."""
+        with self._lock:
+            self._subscribers.pop(queue, None)
+            if self._subscribers or self._poller is None:
+                return
+            poller, self._poller, self._version = self._poller, None, None
+        try:
+            poller.get_loop().call_soon_threadsafe(poller.cancel)
+        except RuntimeError:
+            pass  # Event loop closed
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        """
+        Deliver a message to this process's subscribers (from any thread).
+
+        Args:
+            message: JSON-serializable dict with a ``type`` field
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(_put_latest, queue, message)
+            except RuntimeError:
+                self.unsubscribe(queue)  # Event loop closed
+
+    async def stream(self, unread_count: int, keepalive: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        Server-sent events of alert changes.
+
+        Starts with the current unread count, then sends one event per
+        message and a comment line every ``keepalive`` seconds without one,
+        so proxies keep the connection open.
+
+        Args:
+            unread_count: Current unread count (see unread_count())
+            keepalive: Seconds between keepalive comments
+                (default: ALERT_STREAM_KEEPALIVE_SECONDS)
+
+        Yields:
+            text/event-stream chunks
+        """
+        keepalive = settings.ALERT_STREAM_KEEPALIVE_SECONDS if keepalive is None else keepalive
+        queue = self.subscribe()
+        try:
+            yield _server_sent_event({"type": "unread_count", "unread_count": unread_count})
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _server_sent_event(message)
+        finally:
+            self.unsubscribe(queue)
+
+    async def _poll_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.poll)
+            except Exception as e:
+                logger.error(f"Alert change poll failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+
+def _put_latest(queue: asyncio.Queue, message: Dict[str, Any]) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
+def _server_sent_event(message: Dict[str, Any]) -> str:
+    return f"event: {message['type']}\ndata: {json.dumps(message, default=str)}\n\n"
+
+
+# Global alert notifier instance
+alert_notifier = AlertNotifier(
+    poll_interval=settings.ALERT_STREAM_POLL_SECONDS,
+    queue_size=settings.ALERT_STREAM_QUEUE_SIZE,
+)
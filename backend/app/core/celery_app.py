@@ -1,4 +1,5 @@
 from celery import Celery
+from celery.schedules import crontab
 import os
 
 # Use Redis as broker and result backend
@@ -8,7 +9,8 @@ REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 celery_app = Celery(
     "f2x_neurohub",
     broker=REDIS_URL,
-    backend=REDIS_URL
+    backend=REDIS_URL,
+    include=["app.tasks.process_tasks", "app.tasks.report_tasks"],
 )
 
 celery_app.conf.update(
@@ -18,3 +20,11 @@ celery_app.conf.update(
     timezone="Asia/Seoul",
     enable_utc=True,
 )
+
+# Closed days are materialized into daily report snapshots after midnight
+celery_app.conf.beat_schedule = {
+    "materialize-daily-reports": {
+        "task": "app.tasks.report_tasks.materialize_daily_reports",
+        "schedule": crontab(minute=15, hour=0),
+    },
+}
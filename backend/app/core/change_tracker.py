@@ -0,0 +1,274 @@
+"""
+Per-resource change versions for conditional GET (ETag / 304).
+
+Models registered with ``change_tracker.track()`` bump the version of their
+table every time a session commits inserts, updates or deletes of that model
+(ORM unit-of-work and ORM-enabled bulk ``update()``/``delete()`` statements).
+Endpoints derive strong ETags from these versions, so an unchanged resource
+can be answered with ``304 Not Modified`` without running its query.
+
+Versions live in the resource_versions table, shared by every API process
+(``uvicorn --workers N``). They are incremented right after the write
+commits, in a short transaction of their own on a separate connection
+(without waiting for the WAL flush on PostgreSQL), so the write transaction
+never locks a shared version row and concurrent writers do not commit one
+after another; a rolled-back write never changes a version. Between the
+commit and the bump a reader can still get the previous version with the
+new data, and a bump lost to a crash is never made: ETags therefore also
+change every ``ETAG_MAX_AGE_SECONDS``, which bounds how long such a stale
+ETag can be revalidated. Reading versions is a primary key lookup on the
+request's own session; on a read replica the versions replicate together
+with the data they describe. Writes that bypass the ORM (raw SQL, other
+services) must call ``bump()``.
+
+Server-side caches of data derived from tracked tables must be dropped on
+change (``subscribe()``), otherwise a fresh ETag could be attached to a stale
+cached body. Listeners are called after this process commits a change and
+when a version read shows a change committed by another process. Endpoints
+normally use the ``conditional_get`` dependency from app.core.deps rather
+than calling ``etag()`` directly.
+
+Example:
+    change_tracker.track(WIPItem)
+
+    etag = change_tracker.etag(db, ["wip_items"], lot_id, process_id)
+    if etag_matches(request, etag):
+        ...  # 304 Not Modified
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from itertools import chain
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Set, Type, Optional
+
+from fastapi import Request
+from sqlalchemy import Connection, event, func, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.config import settings
+from app.models.resource_version import ResourceVersion
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "change_tracker_pending"
+_BUMPED_KEY = "change_tracker_bumped"
+
+
+class ChangeTracker:
+    """Per-table change versions in resource_versions, fed by SQLAlchemy session events."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tracked: Dict[Type[Any], str] = {}
+        self._seen: Dict[str, int] = {}
+        self._listeners: List[Callable[[FrozenSet[str]], None]] = []
+        self._listening = False
+
+    def track(self, model: Type[Any], resource: Optional[str] = None) -> str:
+        """
+        Start versioning committed changes to a model.
+
+        Args:
+            model: SQLAlchemy model class
+            resource: Version name (default: the model's table name)
+
+        Returns:
+            The resource name
+        """
+        resource = resource or model.__tablename__
+        with self._lock:
+            self._tracked[model] = resource
+            if not self._listening:
+                event.listen(Session, "after_flush", self._after_flush)
+                event.listen(Session, "do_orm_execute", self._do_orm_execute)
+                event.listen(Session, "before_commit", self._before_commit)
+                event.listen(Session, "after_commit", self._after_commit)
+                event.listen(Session, "after_rollback", self._after_rollback)
+                self._listening = True
+        return resource
+
+    def subscribe(self, listener: Callable[[FrozenSet[str]], None]) -> None:
+        """
+        Call a listener with the changed resources after each change.
+
+        Args:
+            listener: Callback receiving the set of changed resource names
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def versions(self, db: Session, resources: Iterable[str]) -> Dict[str, int]:
+        """
+        Current versions of resources.
+
+        Args:
+            db: SQLAlchemy database session (read in its transaction)
+            resources: Resource names
+
+        Returns:
+            Version per resource (0 for a resource never changed)
+        """
+        names = sorted(set(resources))
+        rows = dict(db.execute(
+            select(ResourceVersion.resource, ResourceVersion.version)
+            .where(ResourceVersion.resource.in_(names))
+        ).all())
+        current = {name: rows.get(name, 0) for name in names}
+
+        with self._lock:
+            changed = frozenset(
+                name for name, version in current.items() if self._seen.get(name) != version
+            )
+            self._seen.update(current)
+        if changed:
+            self._notify(changed)
+        return current
+
+    def version(self, db: Session, resource: str) -> int:
+        """Current version of a resource (0 if it never changed)."""
+        return self.versions(db, [resource])[resource]
+
+    def bump(self, db: Session, *resources: str) -> None:
+        """
+        Record a change to resources (for writes outside the ORM).
+
+        The versions change when db's transaction commits.
+        """
+        self._pending(db).update(resources)
+
+    def etag(self, db: Session, resources: Iterable[str], *variant: Any) -> str:
+        """
+        Build a strong ETag from resource versions and request variant.
+
+        The ETag also changes every ETAG_MAX_AGE_SECONDS (0 = never), so a
+        representation tagged with a stale version is not revalidated for
+        longer than that.
+
+        Args:
+            db: SQLAlchemy database session the response is read with
+            resources: Resources the response depends on
+            *variant: Values that select the representation (filters, page, ...)
+
+        Returns:
+            Quoted ETag value
+        """
+        versions = [f"{name}:{version}" for name, version in self.versions(db, resources).items()]
+        if settings.ETAG_MAX_AGE_SECONDS:
+            versions.append(f"age:{int(time.time() // settings.ETAG_MAX_AGE_SECONDS)}")
+        key = "|".join(versions + [repr(v) for v in variant])
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return f'"{digest}"'
+
+    def _resource_for(self, obj: Any) -> Optional[str]:
+        return self._tracked.get(type(obj))
+
+    def _pending(self, session: Session) -> Set[str]:
+        return session.info.setdefault(_PENDING_KEY, set())
+
+    def _notify(self, changed: FrozenSet[str]) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(changed)
+            except Exception as e:
+                logger.error(f"Change listener failed for {sorted(changed)}: {e}")
+
+    def _after_flush(self, session: Session, flush_context: Any) -> None:
+        # new/dirty/deleted still hold the pre-flush state here
+        changed = {
+            resource
+            for resource in map(
+                self._resource_for, chain(session.new, session.dirty, session.deleted)
+            )
+            if resource is not None
+        }
+        if changed:
+            self._pending(session).update(changed)
+
+    def _do_orm_execute(self, state: ORMExecuteState) -> None:
+        if not (state.is_insert or state.is_update or state.is_delete):
+            return
+        mapper = state.bind_mapper
+        resource = self._tracked.get(mapper.class_) if mapper is not None else None
+        if resource is not None:
+            self._pending(state.session).add(resource)
+
+    def _before_commit(self, session: Session) -> None:
+        # Flush first so the final flush's changes are bumped too
+        if session.new or session.dirty or session.deleted:
+            session.flush()
+        pending = session.info.pop(_PENDING_KEY, None)
+        if pending:
+            session.info.setdefault(_BUMPED_KEY, set()).update(pending)
+
+    def _after_commit(self, session: Session) -> None:
+        changed = session.info.pop(_BUMPED_KEY, None)
+        if not changed:
+            return
+        # The session cannot run SQL after its commit; its connection is
+        # still checked out, so the bump takes a second one briefly
+        try:
+            with session.get_bind().engine.begin() as connection:
+                if connection.dialect.name == "postgresql":
+                    connection.execute(text("SET LOCAL synchronous_commit TO OFF"))
+                _increment(connection, sorted(changed))
+        except Exception as e:
+            logger.error(f"Failed to bump change versions of {sorted(changed)}: {e}")
+        self._notify(frozenset(changed))
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_PENDING_KEY, None)
+        session.info.pop(_BUMPED_KEY, None)
+
+
+def _increment(db: Connection, resources: List[str]) -> None:
+    """Increment versions in the connection's transaction, creating missing rows."""
+    # A new row starts at the current time in ms, never at an earlier version
+    start = int(time.time() * 1000)
+    dialect = db.dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        statement = insert(ResourceVersion).values(
+            [{"resource": resource, "version": start} for resource in resources]
+        )
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[ResourceVersion.resource],
+            set_={"version": ResourceVersion.version + 1, "updated_at": func.now()},
+        ))
+        return
+
+    for resource in resources:
+        updated = db.execute(
+            update(ResourceVersion)
+            .where(ResourceVersion.resource == resource)
+            .values(version=ResourceVersion.version + 1)
+        )
+        if updated.rowcount == 0:
+            db.execute(ResourceVersion.__table__.insert().values(resource=resource, version=start))
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check the request's If-None-Match header against an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current quoted ETag
+
+    Returns:
+        True if the client already has this representation
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+# Global change tracker instance
+change_tracker = ChangeTracker()
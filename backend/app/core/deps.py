@@ -2,29 +2,39 @@
 Dependency injection utilities for FastAPI.
 
 Provides:
-    - Database session dependency
+    - Database session dependencies (operations / analytics pools)
     - Authentication dependencies (current user, permissions)
     - Role-based access control (RBAC) dependencies
     - Hybrid authentication (JWT + API Key for stations)
+    - Conditional GET (ETag / 304 Not Modified) for polled read endpoints
+    - Keyset (cursor) pagination of list endpoints
+    - Per-route opt-out from response compression
+    - Async variants of the authentication dependencies and hot path
+      route selection (sync threadpool vs async engine per route)
 """
 
 from dataclasses import dataclass
-from typing import AsyncGenerator, Generator, Optional, Union
+from datetime import date
+from typing import Any, AsyncGenerator, Callable, Generator, List, Optional, Sequence, Union
 
-from fastapi import Depends, Header
+from fastapi import Depends, Header, HTTPException, Query, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.core import security
+from app.core.change_tracker import change_tracker, etag_matches
 from app.core.exceptions import (
     InvalidTokenException,
     UserNotFoundException,
     ValidationException,
     InsufficientPermissionsException,
 )
+from app.crud import keyset
 from app.crud import user as user_crud
-from app.database import SessionLocal, AsyncSessionLocal
+from app.database import AnalyticsSessionLocal, SessionLocal, AsyncSessionLocal
+from app.middleware.compression import NO_COMPRESSION_SCOPE_KEY
 from app.models import User
 from app.schemas import UserRole
 
@@ -123,6 +133,28 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+# Shop-floor reads/writes: get_db already uses the operations pool
+get_db_ops = get_db
+
+
+def get_db_analytics() -> Generator[Session, None, None]:
+    """
+    Dependency that provides a session on the analytics pool.
+
+    For read-only reports and exports: long statement timeout, and the
+    DB_ANALYTICS_URL read replica while it is within the lag limit, so
+    heavy queries never take operations connections. Do not write with it.
+
+    Yields:
+        SQLAlchemy session
+    """
+    db = AnalyticsSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides an async database session.
@@ -178,18 +210,12 @@ def get_auth_context(
                 log.info(f"User {auth.username} accessed")
     """
     # Try JWT first (user authentication)
-    if token:
+    user_id = _user_token_subject(token)
+    if user_id is not None:
         try:
-            payload = security.decode_access_token(token)
-            if payload is not None:
-                # Check if this is a user token (has 'sub' but no 'type' or type != 'station')
-                token_type = payload.get("type")
-                if token_type != "station":
-                    user_id = payload.get("sub")
-                    if user_id:
-                        user = user_crud.get(db, user_id=int(user_id))
-                        if user:
-                            return user
+            user = user_crud.get(db, user_id=user_id)
+            if user:
+                return user
         except Exception:
             pass  # Fall through to API key
 
@@ -202,6 +228,24 @@ def get_auth_context(
     )
 
 
+def _user_token_subject(token: Optional[str]) -> Optional[int]:
+    """
+    User ID of a user (non-station) JWT, or None if the token is missing or invalid.
+    """
+    if not token:
+        return None
+    try:
+        payload = security.decode_access_token(token)
+        # Check if this is a user token (has 'sub' but no 'type' or type != 'station')
+        if payload is not None and payload.get("type") != "station":
+            user_id = payload.get("sub")
+            if user_id:
+                return int(user_id)
+    except Exception:
+        pass
+    return None
+
+
 def get_optional_auth_context(
     token: Optional[str] = Depends(oauth2_scheme),
     api_key: Optional[str] = Depends(get_api_key_header),
@@ -276,6 +320,23 @@ def get_current_user(
         def read_current_user(current_user: User = Depends(get_current_user)):
             return current_user
     """
+    user_id = _access_token_user_id(token)
+
+    # Get user from database
+    user = user_crud.get(db, user_id=user_id)
+    if user is None:
+        raise UserNotFoundException(user_id=user_id)
+
+    return user
+
+
+def _access_token_user_id(token: Optional[str]) -> int:
+    """
+    Decode an access token and return its user ID.
+
+    Raises:
+        InvalidTokenException: If the token is missing, invalid or expired
+    """
     if not token:
         raise InvalidTokenException(message="Authentication token is missing")
 
@@ -289,17 +350,11 @@ def get_current_user(
     if user_id is None:
         raise InvalidTokenException(message="Invalid token payload")
 
-    # Get user from database
     try:
-        user = user_crud.get(db, user_id=int(user_id))
+        return int(user_id)
     except ValueError as exc:
         raise InvalidTokenException(message="Invalid user ID in token") from exc
 
-    if user is None:
-        raise UserNotFoundException(user_id=user_id)
-
-    return user
-
 
 def get_current_active_user(
     current_user: User = Depends(get_current_user),
@@ -450,3 +505,325 @@ def get_station_auth(
         )
 
     return verify_station_api_key(api_key)
+
+
+# ============================================================
+# Async hot path
+# ============================================================
+# Shop-floor hot paths (scan / start / complete) have an async variant
+# that runs on the async engine instead of Starlette's threadpool. Its
+# dependencies must not be sync functions either, or every request
+# still takes a threadpool hop.
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    token: Optional[str] = Depends(oauth2_scheme),
+) -> User:
+    """
+    Async variant of get_current_user (user loaded through the async session).
+
+    Raises:
+        InvalidTokenException: If token is missing or invalid
+        UserNotFoundException: If user not found
+    """
+    user_id = _access_token_user_id(token)
+    user = await db.get(User, user_id)
+    if user is None:
+        raise UserNotFoundException(user_id=user_id)
+    return user
+
+
+async def get_current_active_user_async(
+    current_user: User = Depends(get_current_user_async),
+) -> User:
+    """Async variant of get_current_active_user."""
+    return get_current_active_user(current_user)
+
+
+async def get_auth_context_async(
+    token: Optional[str] = Depends(oauth2_scheme),
+    api_key: Optional[str] = Header(None, alias="X-API-Key"),
+    db: AsyncSession = Depends(get_async_db),
+) -> Union[User, StationAuth]:
+    """
+    Async variant of get_auth_context (JWT Bearer token OR X-API-Key).
+
+    Raises:
+        InvalidTokenException: If neither auth method succeeds
+    """
+    user_id = _user_token_subject(token)
+    if user_id is not None:
+        try:
+            user = await db.get(User, user_id)
+            if user:
+                return user
+        except Exception:
+            pass  # Fall through to API key
+
+    if api_key:
+        return verify_station_api_key(api_key)
+
+    raise InvalidTokenException(
+        message="Authentication required (Bearer token or X-API-Key)"
+    )
+
+
+def hot_path(name: str, async_endpoint: Callable[..., Any]):
+    """
+    Decorator choosing between a route's sync endpoint and its async variant.
+
+    The async variant serves the route if ``name`` is listed in
+    settings.ASYNC_HOT_PATHS, otherwise the decorated sync endpoint does.
+    Apply it below the route decorators.
+
+    Args:
+        name: Route name in ASYNC_HOT_PATHS (e.g. "wip-items.scan")
+        async_endpoint: Async variant with the same parameters, using
+            get_async_db and the *_async auth dependencies
+
+    Usage:
+        @router.post("/{wip_id}/scan")
+        @hot_path("wip-items.scan", scan_wip_barcode_async)
+        def scan_wip_barcode(...):
+            ...
+    """
+    def select(sync_endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        return async_endpoint if name in settings.ASYNC_HOT_PATHS else sync_endpoint
+
+    return select
+
+
+# ============================================================
+# Conditional GET (ETag / 304)
+# ============================================================
+
+def conditional_get(
+    *resources: str,
+    auth: Optional[Callable[..., Any]] = None,
+    cache_control: str = "private, no-cache",
+    per_day: bool = False,
+    get_session: Callable[..., Any] = get_db,
+):
+    """
+    Dependency factory for ETag revalidation of read endpoints.
+
+    The ETag is derived from the change versions of the given resources
+    (see app.core.change_tracker) and the request path and query string.
+    If the client's If-None-Match matches, the request is answered with
+    304 Not Modified before the endpoint queries or serializes anything;
+    otherwise ETag and Cache-Control are added to the normal response.
+
+    Versions are read with the endpoint's own session (pass the endpoint's
+    session dependency as ``get_session``), so a response read from the
+    analytics replica is tagged with the versions of that replica.
+
+    Args:
+        *resources: Tracked resources (table names) the response depends on
+        auth: Authentication dependency of the endpoint, resolved first so
+            that a 304 is never sent to an unauthenticated client
+        cache_control: Cache-Control header value
+        per_day: Also vary by today's date (endpoints defaulting to "today")
+        get_session: Session dependency of the endpoint (default: get_db)
+
+    Returns:
+        Dependency function for ``dependencies=[Depends(...)]``
+
+    Usage:
+        @router.get(
+            "/",
+            dependencies=[Depends(conditional_get("processes", auth=get_current_active_user))],
+        )
+        def list_processes(...):
+            ...
+    """
+    def check_not_modified(request: Request, response: Response, db: Session) -> None:
+        etag = change_tracker.etag(db, resources, *_etag_variant(request, per_day))
+        _respond_not_modified(request, response, etag, cache_control)
+
+    if auth is None:
+        def check_not_modified_public(
+            request: Request,
+            response: Response,
+            db: Session = Depends(get_session),
+        ) -> None:
+            check_not_modified(request, response, db)
+
+        return check_not_modified_public
+
+    def check_not_modified_authenticated(
+        request: Request,
+        response: Response,
+        _auth: Any = Depends(auth),
+        db: Session = Depends(get_session),
+    ) -> None:
+        check_not_modified(request, response, db)
+
+    return check_not_modified_authenticated
+
+
+def conditional_get_async(
+    *resources: str,
+    auth: Optional[Callable[..., Any]] = None,
+    cache_control: str = "private, no-cache",
+    per_day: bool = False,
+    get_session: Callable[..., Any] = get_async_db,
+):
+    """
+    Async variant of conditional_get for ``async def`` endpoints.
+
+    Versions are read through the endpoint's async session, so a
+    revalidation takes no threadpool hop and no sync pool connection.
+
+    Args:
+        *resources: Tracked resources (table names) the response depends on
+        auth: Async authentication dependency of the endpoint (an *_async
+            dependency), resolved first
+        cache_control: Cache-Control header value
+        per_day: Also vary by today's date
+        get_session: Async session dependency of the endpoint (default: get_async_db)
+
+    Returns:
+        Dependency function for ``dependencies=[Depends(...)]``
+
+    Usage:
+        @router.get(
+            "/",
+            dependencies=[Depends(conditional_get_async("sequences", auth=get_auth_context_async))],
+        )
+        async def list_sequences(...):
+            ...
+    """
+    async def check_not_modified(request: Request, response: Response, db: AsyncSession) -> None:
+        variant = _etag_variant(request, per_day)
+        etag = await db.run_sync(lambda session: change_tracker.etag(session, resources, *variant))
+        _respond_not_modified(request, response, etag, cache_control)
+
+    if auth is None:
+        async def check_not_modified_public(
+            request: Request,
+            response: Response,
+            db: AsyncSession = Depends(get_session),
+        ) -> None:
+            await check_not_modified(request, response, db)
+
+        return check_not_modified_public
+
+    async def check_not_modified_authenticated(
+        request: Request,
+        response: Response,
+        _auth: Any = Depends(auth),
+        db: AsyncSession = Depends(get_session),
+    ) -> None:
+        await check_not_modified(request, response, db)
+
+    return check_not_modified_authenticated
+
+
+def _etag_variant(request: Request, per_day: bool) -> List[Any]:
+    """Request values an ETag varies by: path, query and optionally the date."""
+    variant: List[Any] = [request.url.path, sorted(request.query_params.multi_items())]
+    if per_day:
+        variant.append(date.today().isoformat())
+    return variant
+
+
+def _respond_not_modified(request: Request, response: Response, etag: str, cache_control: str) -> None:
+    """Answer 304 if the client has the ETag, otherwise tag the response."""
+    if etag_matches(request, etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": cache_control},
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+# ============================================================
+# Keyset (cursor) pagination
+# ============================================================
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class KeysetPage:
+    """
+    Keyset position of a list request.
+
+    Attributes:
+        after: Decoded sort key of the previous page's last row, passed to
+            the CRUD list function as ``after`` (None on the first page)
+        response: Response the X-Next-Cursor header is set on
+    """
+
+    def __init__(self, keys: keyset.SortKey, response: Response, after: Optional[Sequence[Any]] = None):
+        self.keys = keys
+        self.response = response
+        self.after = after
+
+    def respond(self, rows: List[Any], limit: int, keys: Optional[keyset.SortKey] = None) -> List[Any]:
+        """
+        Set X-Next-Cursor if rows is a full page and return rows.
+
+        keys overrides the sort key for endpoints that pick the CRUD list
+        function (and so the order) by filter; it must have as many columns.
+        """
+        cursor = keyset.next_cursor(rows, keys or self.keys, limit)
+        if cursor:
+            self.response.headers[NEXT_CURSOR_HEADER] = cursor
+        return rows
+
+
+def keyset_page(keys: keyset.SortKey):
+    """
+    Dependency factory for cursor pagination of a list endpoint.
+
+    Adds a ``cursor`` query parameter, an alternative to ``skip``: the
+    X-Next-Cursor header of the previous page. Unlike skip, a cursor page
+    costs the same however deep it is and does not shift when rows are
+    inserted ahead of it.
+
+    Args:
+        keys: Sort key of the CRUD list function (e.g. crud.lot.NEWEST)
+
+    Returns:
+        Dependency resolving to a KeysetPage
+
+    Usage:
+        @router.get("/")
+        def list_lots(..., page: KeysetPage = Depends(keyset_page(lot_crud.NEWEST))):
+            lots = lot_crud.get_multi(db, skip=skip, limit=limit, after=page.after)
+            return page.respond(lots, limit)
+    """
+    def resolve_keyset_page(
+        response: Response,
+        cursor: Optional[str] = Query(
+            None, description="X-Next-Cursor of the previous page; replaces skip"
+        ),
+    ) -> KeysetPage:
+        if not cursor:
+            return KeysetPage(keys, response)
+        try:
+            return KeysetPage(keys, response, keyset.decode_cursor(cursor, len(keys)))
+        except ValueError as e:
+            raise ValidationException(str(e))
+
+    return resolve_keyset_page
+
+
+# ============================================================
+# Response compression opt-out
+# ============================================================
+
+def no_compression(request: Request) -> None:
+    """
+    Dependency excluding a route from response compression.
+
+    For payloads that are already compressed but sent with a generic media
+    type, or whose exact bytes the client verifies (checksums).
+    Well-known compressed media types (ZIP, PNG, gzip...) are skipped by
+    CompressionMiddleware without it.
+
+    Usage:
+        @router.get("/{name}/download", dependencies=[Depends(no_compression)])
+    """
+    request.scope[NO_COMPRESSION_SCOPE_KEY] = True
@@ -0,0 +1,229 @@
+"""
+Rolling per-minute error counts with hourly flushes to error_log_hourly.
+
+Every logged API error is counted in memory by error code, route template,
+method and status code, in one bucket per minute. The buckets form a fixed
+ring of ``ERROR_RATE_WINDOW_HOURS`` hours: a new minute reuses the slot of the
+minute one window earlier, so memory stays bounded however many errors come
+in. Counts are keyed by the route template (``/api/v1/lots/{lot_id}``), not
+the concrete URL, so the number of keys per bucket stays small.
+
+Like the change tracker, counts live in the API process. ``flush()`` adds the
+counts not yet written, summed per hour, to error_log_hourly with an
+``ON CONFLICT`` upsert, so every worker contributes to the same rows. The
+error statistics read those rows (O(hours x keys)) instead of grouping the raw
+error_logs table, which is only needed to drill down into single errors.
+Counts of other workers show up after their next flush; counts of a worker
+that dies before flushing are lost.
+
+Example:
+    error_rates.record("RES_002", route_path(request), "GET", 404)
+
+    if error_rates.flush_due():
+        error_rates.flush(db)
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.crud import error_log as error_log_crud
+
+logger = logging.getLogger(__name__)
+
+# Path counted for requests no route matched (arbitrary URLs would explode the keys)
+UNMATCHED_PATH = "(unmatched)"
+
+# (error_code, path, method, status_code)
+ErrorKey = Tuple[str, str, str, int]
+
+# listener(error_code, path, method, status_code, at)
+ErrorListener = Callable[[str, str, str, int, float], None]
+
+
+def route_path(request: Request) -> str:
+    """Route template of the request, or UNMATCHED_PATH if no route matched."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_PATH
+
+
+class _Bucket:
+    """Counts of one minute and the part of them already flushed."""
+
+    __slots__ = ("minute", "counts", "flushed")
+
+    def __init__(self, minute: int) -> None:
+        self.minute = minute
+        self.counts: Counter = Counter()
+        self.flushed: Counter = Counter()
+
+
+class ErrorRateAggregator:
+    """Thread-safe ring of per-minute error counts."""
+
+    def __init__(self, window_minutes: int, flush_interval: float) -> None:
+        if window_minutes < 60:
+            raise ValueError("window_minutes must cover at least one hour")
+        self.window_minutes = window_minutes
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buckets: List[Optional[_Bucket]] = [None] * window_minutes
+        self._dirty: Set[int] = set()
+        self._newest = 0
+        self._listeners: List[ErrorListener] = []
+        self._last_flush = time.monotonic()
+
+    def subscribe(self, listener: ErrorListener) -> None:
+        """
+        Call a listener with every recorded error.
+
+        Args:
+            listener: Callback receiving error_code, path, method,
+                status_code and the Unix time of the error
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def record(
+        self,
+        error_code: str,
+        path: str,
+        method: str,
+        status_code: int,
+        at: Optional[float] = None,
+    ) -> None:
+        """
+        Count one error.
+
+        Args:
+            error_code: Standardized error code (e.g., RES_002)
+            path: Route template (see route_path())
+            method: HTTP method
+            status_code: HTTP status code
+            at: Unix time of the error (default: now)
+        """
+        at = time.time() if at is None else at
+        minute = int(at // 60)
+        slot = minute % self.window_minutes
+        with self._lock:
+            if minute <= self._newest - self.window_minutes:
+                return  # Older than the window
+            self._newest = max(self._newest, minute)
+            bucket = self._buckets[slot]
+            if bucket is None or bucket.minute != minute:
+                if bucket is not None and slot in self._dirty:
+                    logger.warning(
+                        "Dropping %d unflushed error counts of minute %d",
+                        sum((bucket.counts - bucket.flushed).values()), bucket.minute,
+                    )
+                bucket = self._buckets[slot] = _Bucket(minute)
+            bucket.counts[(error_code, path, method, status_code)] += 1
+            self._dirty.add(slot)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(error_code, path, method, status_code, at)
+            except Exception as e:
+                logger.error(f"Error rate listener failed for {error_code}: {e}")
+
+    def counts(self, since: float, until: Optional[float] = None) -> Dict[ErrorKey, int]:
+        """
+        Sum this process's counts of the minutes in [since, until).
+
+        Args:
+            since: Unix time; minutes before the window are not available
+            until: Unix time (default: now, including the current minute)
+
+        Returns:
+            Count per (error_code, path, method, status_code)
+        """
+        first = int(since // 60)
+        last = int((time.time() + 60 if until is None else until) // 60)
+        total: Counter = Counter()
+        with self._lock:
+            for bucket in self._buckets:
+                if bucket is not None and first <= bucket.minute < last:
+                    total.update(bucket.counts)
+        return dict(total)
+
+    def flush_due(self) -> bool:
+        """True once flush_interval seconds passed since the last flush."""
+        return time.monotonic() - self._last_flush >= self.flush_interval
+
+    def flush(self, db: Session) -> int:
+        """
+        Add the counts recorded since the last flush to error_log_hourly.
+
+        Runs at most once at a time per process; a concurrent call returns
+        immediately. If the write fails the counts stay pending for the next
+        flush.
+
+        Args:
+            db: SQLAlchemy database session (committed)
+
+        Returns:
+            Number of errors written
+        """
+        if not self._flush_lock.acquire(blocking=False):
+            return 0
+        try:
+            self._last_flush = time.monotonic()
+            with self._lock:
+                pending = [
+                    (slot, bucket.minute, bucket.counts.copy(), bucket.flushed)
+                    for slot, bucket in ((slot, self._buckets[slot]) for slot in self._dirty)
+                ]
+                self._dirty.clear()
+
+            hourly: Counter = Counter()
+            for _, minute, counts, flushed in pending:
+                hour = datetime.fromtimestamp(minute // 60 * 3600, tz=timezone.utc)
+                for key, count in (counts - flushed).items():
+                    hourly[(hour, *key)] += count
+
+            try:
+                if hourly:
+                    error_log_crud.add_hourly_counts(db, [
+                        {"hour": hour, "error_code": code, "path": path, "method": method,
+                         "status_code": status_code, "count": count}
+                        for (hour, code, path, method, status_code), count in hourly.items()
+                    ])
+            except Exception:
+                with self._lock:
+                    self._dirty.update(
+                        slot for slot, minute, _, _ in pending if self._buckets[slot].minute == minute
+                    )
+                raise
+
+            with self._lock:
+                for slot, minute, counts, _ in pending:
+                    bucket = self._buckets[slot]
+                    if bucket.minute != minute:
+                        continue
+                    bucket.flushed = counts
+                    if bucket.counts != counts:
+                        self._dirty.add(slot)
+            return sum(hourly.values())
+        finally:
+            self._flush_lock.release()
+
+    def reset(self) -> None:
+        """Drop all counts (tests)."""
+        with self._lock:
+            self._buckets = [None] * self.window_minutes
+            self._dirty.clear()
+            self._newest = 0
+
+
+error_rates = ErrorRateAggregator(
+    window_minutes=settings.ERROR_RATE_WINDOW_HOURS * 60,
+    flush_interval=settings.ERROR_RATE_FLUSH_INTERVAL,
+)
@@ -0,0 +1,81 @@
+"""
+Fast JSON responses for F2X NeuroHub MES.
+
+FastJSONResponse is the application's default response class: it renders
+with orjson instead of the standard library encoder.
+
+Large list endpoints can additionally skip the response model pipeline.
+For a returned ORM list FastAPI validates every item into the
+response_model, dumps it back to a dict, validates it again and converts
+it to JSON-compatible Python before encoding. Rows that come straight
+from the database (see app.crud.rows) are already in response shape, so
+those endpoints return ``trusted_json(rows, response)`` instead; the
+response_model stays on the route for the OpenAPI schema. An already
+validated response model can be passed as well and is serialized by
+Pydantic directly.
+
+Output matches the Pydantic serializer for database values: UTC datetimes
+end in ``Z``, UUIDs and dates are strings, Decimals are numbers.
+"""
+
+from decimal import Decimal
+from typing import Any, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """Encode types orjson does not support natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes with the response encoder."""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode()
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def trusted_json(
+    content: Any,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+    background: Optional[BackgroundTask] = None,
+) -> FastJSONResponse:
+    """
+    Render trusted database rows without response_model validation.
+
+    Args:
+        content: Rows already in response schema shape, or a validated
+            response model
+        response: The endpoint's injected Response; headers set on it by
+            dependencies (ETag, Cache-Control, ...) are carried over
+        status_code: HTTP status code
+        background: Optional background task
+
+    Returns:
+        FastJSONResponse with the rendered rows
+    """
+    rendered = FastJSONResponse(content, status_code=status_code, background=background)
+    if response is not None:
+        rendered.raw_headers.extend(
+            (key, value) for key, value in response.raw_headers if key != b"content-length"
+        )
+    return rendered
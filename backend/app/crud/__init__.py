@@ -21,6 +21,8 @@ from app.crud import (
     production_line,
     equipment,
     error_log,
+    sequence_counter,
+    idempotency_key,
 )
 
 __all__ = [
@@ -36,4 +38,6 @@ __all__ = [
     "production_line",
     "equipment",
     "error_log",
+    "sequence_counter",
+    "idempotency_key",
 ]
@@ -8,32 +8,46 @@ alerts with filters (status, severity, type, date range), and updating alert sta
 Functions:
     get: Get a single alert by ID
     get_multi: Get multiple alerts with pagination and filtering
+    count: Count alerts matching the get_multi filters (exact or estimated)
     create: Create a new alert
     update: Update an alert (primarily for status changes)
     delete: Delete an alert
     mark_as_read: Mark a single alert as read
     bulk_mark_as_read: Mark multiple alerts as read
     get_unread_count: Get count of unread alerts
+    get_created_since: Get alerts created since a time, oldest first
+    get_recent_duplicate: Get a same-type, same-title alert created since a time
     get_by_status: Get alerts filtered by status
     get_by_severity: Get alerts filtered by severity
     get_by_type: Get alerts filtered by type
     get_by_lot: Get alerts related to a specific LOT
     get_by_serial: Get alerts related to a specific serial
+
+List functions take ``after`` (a decoded keyset cursor, see app.crud.keyset)
+as an alternative to ``skip``; NEWEST is their sort key.
 """
 
 from datetime import datetime, date
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.change_tracker import change_tracker
+from app.crud import keyset
 from app.models.alert import Alert, AlertType, AlertSeverity, AlertStatus
 from app.models.lot import Lot
 from app.models.serial import Serial
 from app.models.process import Process
 from app.schemas.alert import AlertCreate, AlertUpdate
 
+# Keyset sort key of every list function
+NEWEST = [(Alert.created_at, True), (Alert.id, True)]
+
+# Version committed alert changes (unread count cache, alert stream)
+change_tracker.track(Alert)
+
 
 def get(db: Session, alert_id: int) -> Optional[Alert]:
     """
@@ -71,6 +85,7 @@ def get_multi(
     *,
     skip: int = 0,
     limit: int = 50,
+    after: Optional[Sequence[Any]] = None,
     status: Optional[AlertStatus] = None,
     severity: Optional[AlertSeverity] = None,
     alert_type: Optional[AlertType] = None,
@@ -89,6 +104,7 @@ def get_multi(
         db: SQLAlchemy database session
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 50)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
         status: Optional filter by AlertStatus (UNREAD, READ, ARCHIVED)
         severity: Optional filter by AlertSeverity (HIGH, MEDIUM, LOW)
         alert_type: Optional filter by AlertType
@@ -123,7 +139,31 @@ def get_multi(
         joinedload(Alert.process)
     )
 
-    # Apply filters
+    query = _apply_filters(
+        query,
+        status=status,
+        severity=severity,
+        alert_type=alert_type,
+        lot_id=lot_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    # Order by creation timestamp (newest first)
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
+
+
+def _apply_filters(
+    query,
+    *,
+    status: Optional[AlertStatus] = None,
+    severity: Optional[AlertSeverity] = None,
+    alert_type: Optional[AlertType] = None,
+    lot_id: Optional[int] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """Apply get_multi filters to a Query or Select."""
     if status is not None:
         query = query.filter(Alert.status == status)
 
@@ -143,14 +183,25 @@ def get_multi(
         # Include the entire end_date day
         query = query.filter(Alert.created_at < datetime.combine(end_date, datetime.max.time()))
 
-    # Order by creation timestamp (newest first)
-    return (
-        query
-        .order_by(desc(Alert.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    return query
+
+
+def count(db: Session, *, approximate: bool = False, **filters: Any) -> int:
+    """
+    Count the alerts matching the get_multi filters.
+
+    Args:
+        db: SQLAlchemy database session
+        approximate: Return the planner's row estimate (PostgreSQL) instead
+            of counting every matching row
+        **filters: get_multi filters (status, severity, alert_type, lot_id,
+            start_date, end_date)
+
+    Returns:
+        Number of matching alerts (estimated if approximate)
+    """
+    statement = _apply_filters(select(Alert.id), **filters)
+    return keyset.count(db, statement, approximate=approximate)
 
 
 def create(
@@ -429,12 +480,72 @@ def get_unread_count(db: Session) -> int:
     )
 
 
+def get_created_since(db: Session, since: datetime, *, limit: int = 100) -> List[Alert]:
+    """
+    Get alerts created at or after a time, oldest first.
+
+    Used by app.core.alert_notifications to find alerts committed by any API
+    process. Served by idx_alerts_created_at.
+
+    Args:
+        db: SQLAlchemy database session
+        since: Oldest creation timestamp to include
+        limit: Maximum number of alerts to return
+
+    Returns:
+        List of Alert instances ordered by created_at, id
+    """
+    return (
+        db.query(Alert)
+        .filter(Alert.created_at >= since)
+        .order_by(Alert.created_at, Alert.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_recent_duplicate(
+    db: Session,
+    *,
+    alert_type: AlertType,
+    title: str,
+    since: datetime,
+) -> Optional[Alert]:
+    """
+    Get the newest alert of a type and title created since a time.
+
+    Used to de-duplicate system alerts raised by several API processes
+    (app.analytics.alert_engine); the title identifies the rule and the
+    process / equipment / operator it fired for. Served by idx_alerts_type.
+
+    Args:
+        db: SQLAlchemy database session
+        alert_type: AlertType of the alert
+        title: Exact alert title
+        since: Oldest creation timestamp to consider
+
+    Returns:
+        Alert instance if one exists, None otherwise
+    """
+    return (
+        db.query(Alert)
+        .filter(
+            Alert.alert_type == alert_type,
+            Alert.created_at >= since,
+            Alert.title == title,
+        )
+        .order_by(Alert.created_at.desc(), Alert.id.desc())
+        .first()
+    )
+
+
 def get_by_status(
     db: Session,
     status: AlertStatus,
     *,
     skip: int = 0,
     limit: int = 50,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Alert]:
     """
     Get alerts filtered by status.
@@ -444,6 +555,7 @@ def get_by_status(
         status: AlertStatus to filter by
         skip: Number of records to skip
         limit: Maximum number of records to return
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Alert instances with specified status
@@ -451,7 +563,7 @@ def get_by_status(
     Example:
         unread_alerts = get_by_status(db, AlertStatus.UNREAD)
     """
-    return (
+    query = (
         db.query(Alert)
         .options(
             joinedload(Alert.lot),
@@ -459,11 +571,8 @@ def get_by_status(
             joinedload(Alert.process)
         )
         .filter(Alert.status == status)
-        .order_by(desc(Alert.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_severity(
@@ -472,6 +581,7 @@ def get_by_severity(
     *,
     skip: int = 0,
     limit: int = 50,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Alert]:
     """
     Get alerts filtered by severity.
@@ -481,6 +591,7 @@ def get_by_severity(
         severity: AlertSeverity to filter by
         skip: Number of records to skip
         limit: Maximum number of records to return
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Alert instances with specified severity
@@ -488,7 +599,7 @@ def get_by_severity(
     Example:
         high_alerts = get_by_severity(db, AlertSeverity.HIGH)
     """
-    return (
+    query = (
         db.query(Alert)
         .options(
             joinedload(Alert.lot),
@@ -496,11 +607,8 @@ def get_by_severity(
             joinedload(Alert.process)
         )
         .filter(Alert.severity == severity)
-        .order_by(desc(Alert.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_type(
@@ -509,6 +617,7 @@ def get_by_type(
     *,
     skip: int = 0,
     limit: int = 50,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Alert]:
     """
     Get alerts filtered by type.
@@ -518,6 +627,7 @@ def get_by_type(
         alert_type: AlertType to filter by
         skip: Number of records to skip
         limit: Maximum number of records to return
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Alert instances with specified type
@@ -525,7 +635,7 @@ def get_by_type(
     Example:
         defect_alerts = get_by_type(db, AlertType.DEFECT_DETECTED)
     """
-    return (
+    query = (
         db.query(Alert)
         .options(
             joinedload(Alert.lot),
@@ -533,11 +643,8 @@ def get_by_type(
             joinedload(Alert.process)
         )
         .filter(Alert.alert_type == alert_type)
-        .order_by(desc(Alert.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_lot(
@@ -546,6 +653,7 @@ def get_by_lot(
     *,
     skip: int = 0,
     limit: int = 50,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Alert]:
     """
     Get alerts related to a specific LOT.
@@ -555,6 +663,7 @@ def get_by_lot(
         lot_id: LOT ID to filter by
         skip: Number of records to skip
         limit: Maximum number of records to return
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Alert instances related to the specified LOT
@@ -562,7 +671,7 @@ def get_by_lot(
     Example:
         lot_alerts = get_by_lot(db, lot_id=1)
     """
-    return (
+    query = (
         db.query(Alert)
         .options(
             joinedload(Alert.lot),
@@ -570,11 +679,8 @@ def get_by_lot(
             joinedload(Alert.process)
         )
         .filter(Alert.lot_id == lot_id)
-        .order_by(desc(Alert.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_serial(
@@ -583,6 +689,7 @@ def get_by_serial(
     *,
     skip: int = 0,
     limit: int = 50,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Alert]:
     """
     Get alerts related to a specific serial.
@@ -592,6 +699,7 @@ def get_by_serial(
         serial_id: Serial ID to filter by
         skip: Number of records to skip
         limit: Maximum number of records to return
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Alert instances related to the specified serial
@@ -599,7 +707,7 @@ def get_by_serial(
     Example:
         serial_alerts = get_by_serial(db, serial_id=5)
     """
-    return (
+    query = (
         db.query(Alert)
         .options(
             joinedload(Alert.lot),
@@ -607,8 +715,5 @@ def get_by_serial(
             joinedload(Alert.process)
         )
         .filter(Alert.serial_id == serial_id)
-        .order_by(desc(Alert.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
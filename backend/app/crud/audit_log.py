@@ -26,21 +26,38 @@ Database Enforcement:
 Functions:
     get: Get a single audit log by ID
     get_multi: Get multiple audit logs with pagination (most recent first)
+    get_multi_rows: get_multi page as response rows (no ORM hydration)
     get_by_entity: Filter audit logs by entity type and ID
     get_by_user: Filter audit logs by user who performed the action
     get_by_action: Filter audit logs by action type (CREATE/UPDATE/DELETE)
     get_by_date_range: Filter audit logs by date range
     get_entity_history: Get complete change history for a specific entity
     get_user_activity: Get activity log for a specific user
+    get_field_changes: Find UPDATEs that changed a field (optionally from / to a value)
+
+List functions take ``after`` (a decoded keyset cursor, see app.crud.keyset)
+as an alternative to ``skip``; NEWEST is their sort key.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from sqlalchemy import and_
+from sqlalchemy import and_, func, or_
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.crud import keyset
+from app.crud.rows import RowProjection
 from app.models.audit_log import AuditLog, AuditAction
+from app.models.audit_search import CHANGES_FUNCTION
+from app.schemas.audit_log import AuditLogInDB
+
+# Keyset sort key of every list function
+NEWEST = [(AuditLog.created_at, True), (AuditLog.id, True)]
+
+# Default of get_field_changes value filters: None is a value (json null)
+_UNSET: Any = object()
 
 
 def get(db: Session, id: int) -> Optional[AuditLog]:
@@ -70,6 +87,7 @@ def get_multi(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[AuditLog]:
     """
     Get multiple audit log entries with pagination (most recent first).
@@ -82,6 +100,7 @@ def get_multi(
         db: SQLAlchemy database session
         skip: Number of records to skip (offset for pagination, default: 0)
         limit: Maximum number of records to return (default: 100, max: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of AuditLog instances ordered by created_at descending
@@ -95,13 +114,37 @@ def get_multi(
         >>> # Get the next 10 (pagination)
         >>> next_logs = get_multi(db, skip=10, limit=10)
     """
-    return (
-        db.query(AuditLog)
-        .order_by(AuditLog.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = db.query(AuditLog)
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
+
+
+_ROWS = RowProjection(AuditLog, AuditLogInDB, nested={"user": AuditLog.user})
+
+
+def get_multi_rows(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get the get_multi page as AuditLogInDB-shaped dicts.
+
+    Selects only the response columns, with the acting user through a LEFT
+    OUTER JOIN, instead of building AuditLog objects and lazy-loading each
+    entry's user.
+
+    Args:
+        db: SQLAlchemy database session
+        skip: Number of records to skip (offset for pagination, default: 0)
+        limit: Maximum number of records to return (default: 100, max: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
+
+    Returns:
+        List of response rows ordered by created_at descending
+    """
+    return _ROWS.rows(db, keyset.paginate(_ROWS.select(), NEWEST, skip, limit, after))
 
 
 def get_by_entity(
@@ -111,6 +154,7 @@ def get_by_entity(
     entity_id: int,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[AuditLog]:
     """
     Get audit logs for a specific entity type and ID.
@@ -125,6 +169,7 @@ def get_by_entity(
         entity_id: Primary key of the specific entity record
         skip: Number of records to skip for pagination (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of AuditLog instances for the specified entity, ordered by created_at desc
@@ -144,7 +189,7 @@ def get_by_entity(
         ...     limit=50
         ... )
     """
-    return (
+    query = (
         db.query(AuditLog)
         .filter(
             and_(
@@ -152,11 +197,8 @@ def get_by_entity(
                 AuditLog.entity_id == entity_id,
             )
         )
-        .order_by(AuditLog.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_user(
@@ -165,6 +207,7 @@ def get_by_user(
     user_id: int,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[AuditLog]:
     """
     Get audit logs for actions performed by a specific user.
@@ -178,6 +221,7 @@ def get_by_user(
         user_id: ID of the user who performed the actions
         skip: Number of records to skip for pagination (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of AuditLog instances for the specified user, ordered by created_at desc
@@ -192,14 +236,11 @@ def get_by_user(
         >>> page_1 = get_by_user(db, user_id=5, skip=0, limit=50)
         >>> page_2 = get_by_user(db, user_id=5, skip=50, limit=50)
     """
-    return (
+    query = (
         db.query(AuditLog)
         .filter(AuditLog.user_id == user_id)
-        .order_by(AuditLog.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_action(
@@ -208,6 +249,7 @@ def get_by_action(
     action: str,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[AuditLog]:
     """
     Get audit logs filtered by action type.
@@ -222,6 +264,7 @@ def get_by_action(
         action: Type of action to filter: 'CREATE', 'UPDATE', or 'DELETE'
         skip: Number of records to skip for pagination (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of AuditLog instances matching the action type, ordered by created_at desc
@@ -249,14 +292,11 @@ def get_by_action(
             f"Invalid action '{action}'. Must be one of: {', '.join(valid_actions)}"
         )
 
-    return (
+    query = (
         db.query(AuditLog)
         .filter(AuditLog.action == action)
-        .order_by(AuditLog.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_date_range(
@@ -266,6 +306,7 @@ def get_by_date_range(
     end_date: datetime,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[AuditLog]:
     """
     Get audit logs within a specific date range.
@@ -281,6 +322,7 @@ def get_by_date_range(
         end_date: End of date range (inclusive)
         skip: Number of records to skip for pagination (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of AuditLog instances within the date range, ordered by created_at desc
@@ -301,7 +343,7 @@ def get_by_date_range(
         ...     end_date=next_day
         ... )
     """
-    return (
+    query = (
         db.query(AuditLog)
         .filter(
             and_(
@@ -309,11 +351,8 @@ def get_by_date_range(
                 AuditLog.created_at <= end_date,
             )
         )
-        .order_by(AuditLog.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_entity_history(
@@ -323,6 +362,7 @@ def get_entity_history(
     entity_id: int,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[AuditLog]:
     """
     Get the complete change history for a specific entity.
@@ -342,6 +382,7 @@ def get_entity_history(
         entity_id: Primary key of the entity
         skip: Number of records to skip for pagination (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of AuditLog instances representing the complete history for the entity,
@@ -371,7 +412,7 @@ def get_entity_history(
         ...     changed_fields = last_update.get_changed_fields()
         ...     print(f"Fields changed: {changed_fields}")
     """
-    return (
+    query = (
         db.query(AuditLog)
         .filter(
             and_(
@@ -379,11 +420,8 @@ def get_entity_history(
                 AuditLog.entity_id == entity_id,
             )
         )
-        .order_by(AuditLog.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_user_activity(
@@ -392,6 +430,7 @@ def get_user_activity(
     user_id: int,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[AuditLog]:
     """
     Get the activity log for a specific user.
@@ -409,6 +448,7 @@ def get_user_activity(
         user_id: ID of the user whose activity should be retrieved
         skip: Number of records to skip for pagination (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of AuditLog instances representing all actions by the user,
@@ -436,11 +476,119 @@ def get_user_activity(
         ...     if yesterday <= log.created_at <= today
         ... ]
     """
-    return (
+    query = (
         db.query(AuditLog)
         .filter(AuditLog.user_id == user_id)
-        .order_by(AuditLog.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
+
+
+def _changed(
+    db: Session,
+    field: str,
+    old_value: Any = _UNSET,
+    new_value: Any = _UNSET,
+) -> ColumnElement[bool]:
+    """
+    Build the predicate "this UPDATE changed `field` (from old_value, to new_value)".
+
+    On PostgreSQL this is a containment test on the changed-values document,
+    answered by the idx_audit_logs_changes GIN index; {"field": {}} matches any
+    change of the field. SQLite compares json_extract() of both snapshots.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        change: Dict[str, Any] = {}
+        if old_value is not _UNSET:
+            change["old"] = old_value
+        if new_value is not _UNSET:
+            change["new"] = new_value
+        changes = getattr(func, CHANGES_FUNCTION)(AuditLog.old_values, AuditLog.new_values, type_=JSONB)
+        return changes.contains({field: change})
+
+    # json_type tells a missing key (NULL) from a json null ('null')
+    path = '$."' + field.replace('"', '""') + '"'
+    old, old_type = func.json_extract(AuditLog.old_values, path), func.json_type(AuditLog.old_values, path)
+    new, new_type = func.json_extract(AuditLog.new_values, path), func.json_type(AuditLog.new_values, path)
+    clauses = [
+        func.json_type(AuditLog.old_values) == "object",
+        func.json_type(AuditLog.new_values) == "object",
+        or_(old_type.is_not(new_type), old.is_not(new)),
+    ]
+    for value, extracted, json_type in ((old_value, old, old_type), (new_value, new, new_type)):
+        if value is not _UNSET:
+            # None matches json null and a missing key, as on PostgreSQL
+            clauses.append(func.coalesce(json_type, "null") == "null" if value is None else extracted == value)
+    return and_(*clauses)
+
+
+def get_field_changes(
+    db: Session,
+    *,
+    field: str,
+    old_value: Any = _UNSET,
+    new_value: Any = _UNSET,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
+) -> List[AuditLog]:
+    """
+    Get UPDATE audit logs that changed a field, filtered in the database.
+
+    Answers questions like "who changed target_quantity on this LOT" without
+    loading the entity history and calling get_changed_fields() on every entry.
+    A field counts as changed exactly when get_changed_fields() would report it.
+    Results are ordered by creation time descending (most recent first).
+
+    Args:
+        db: SQLAlchemy database session
+        field: Name of the changed field (a key of the old/new snapshots)
+        old_value: Only changes away from this value (omit for any; None matches null)
+        new_value: Only changes to this value (omit for any; None matches null)
+        entity_type: Only this entity type (e.g., 'lots')
+        entity_id: Only this entity record (with entity_type)
+        user_id: Only changes made by this user
+        start_date: Start of date range (inclusive)
+        end_date: End of date range (inclusive)
+        skip: Number of records to skip for pagination (default: 0)
+        limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
+
+    Returns:
+        List of AuditLog instances that changed the field, ordered by created_at desc
+
+    Example:
+        >>> # Who changed the target quantity of lot 123, and to what?
+        >>> changes = get_field_changes(db, field="target_quantity", entity_type="lots", entity_id=123)
+        >>> for log in changes:
+        ...     print(log.user_id, log.get_field_change("target_quantity"))
+
+        >>> # Every LOT closed by hand in November
+        >>> closed = get_field_changes(
+        ...     db,
+        ...     field="status",
+        ...     new_value="CLOSED",
+        ...     entity_type="lots",
+        ...     start_date=datetime(2025, 11, 1),
+        ...     end_date=datetime(2025, 11, 30, 23, 59, 59),
+        ... )
+    """
+    query = db.query(AuditLog).filter(
+        AuditLog.action == AuditAction.UPDATE.value,
+        _changed(db, field, old_value, new_value),
+    )
+    if entity_type is not None:
+        query = query.filter(AuditLog.entity_type == entity_type)
+    if entity_id is not None:
+        query = query.filter(AuditLog.entity_id == entity_id)
+    if user_id is not None:
+        query = query.filter(AuditLog.user_id == user_id)
+    if start_date is not None:
+        query = query.filter(AuditLog.created_at >= start_date)
+    if end_date is not None:
+        query = query.filter(AuditLog.created_at <= end_date)
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
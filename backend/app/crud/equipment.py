@@ -18,18 +18,31 @@ Functions:
     get_by_production_line: Get equipment by production line
     get_by_process: Get equipment by process
     get_needs_maintenance: Get equipment that needs maintenance
+
+List functions take ``after`` (a decoded keyset cursor, see app.crud.keyset)
+as an alternative to ``skip``; BY_CODE and BY_MAINTENANCE_DATE are their
+sort keys.
 """
 
 from datetime import datetime, date
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 
 from sqlalchemy import and_, desc
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from app.core.change_tracker import change_tracker
+from app.crud import keyset
 from app.models.equipment import Equipment
 from app.schemas.equipment import EquipmentCreate, EquipmentUpdate
 
+# Keyset sort keys: equipment_code is unique; get_needs_maintenance
+BY_CODE = [(Equipment.equipment_code, False)]
+BY_MAINTENANCE_DATE = [(Equipment.next_maintenance_date, False), (Equipment.id, False)]
+
+# Count committed equipment changes for ETag-based conditional GET
+change_tracker.track(Equipment)
+
 
 def get(db: Session, equipment_id: int) -> Optional[Equipment]:
     """
@@ -57,6 +70,7 @@ def get_multi(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Equipment]:
     """
     Get multiple equipment with pagination.
@@ -68,6 +82,7 @@ def get_multi(
         db: SQLAlchemy database session
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Equipment instances matching the criteria
@@ -79,13 +94,8 @@ def get_multi(
         # Get all equipment (with default limit)
         all_equipment = get_multi(db)
     """
-    return (
-        db.query(Equipment)
-        .order_by(Equipment.equipment_code.asc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = db.query(Equipment)
+    return keyset.paginate(query, BY_CODE, skip, limit, after).all()
 
 
 def create(
@@ -278,6 +288,7 @@ def get_active(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Equipment]:
     """
     Get active equipment.
@@ -289,6 +300,7 @@ def get_active(
         db: SQLAlchemy database session
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of active Equipment instances
@@ -300,14 +312,11 @@ def get_active(
         # Get first 50 active equipment
         active_equipment = get_active(db, skip=0, limit=50)
     """
-    return (
+    query = (
         db.query(Equipment)
         .filter(Equipment.is_active == True)
-        .order_by(Equipment.equipment_code.asc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, BY_CODE, skip, limit, after).all()
 
 
 def get_by_type(
@@ -316,6 +325,7 @@ def get_by_type(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Equipment]:
     """
     Get equipment by type.
@@ -328,6 +338,7 @@ def get_by_type(
         equipment_type: Equipment type to filter by
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Equipment instances of the specified type
@@ -336,14 +347,11 @@ def get_by_type(
         # Get all laser markers
         lasers = get_by_type(db, equipment_type="LASER_MARKER")
     """
-    return (
+    query = (
         db.query(Equipment)
         .filter(Equipment.equipment_type == equipment_type.upper())
-        .order_by(Equipment.equipment_code.asc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, BY_CODE, skip, limit, after).all()
 
 
 def get_by_production_line(
@@ -352,6 +360,7 @@ def get_by_production_line(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Equipment]:
     """
     Get equipment by production line.
@@ -364,6 +373,7 @@ def get_by_production_line(
         production_line_id: Production line ID to filter by
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Equipment instances assigned to the production line
@@ -372,14 +382,11 @@ def get_by_production_line(
         # Get all equipment on LINE-A
         line_equipment = get_by_production_line(db, production_line_id=1)
     """
-    return (
+    query = (
         db.query(Equipment)
         .filter(Equipment.production_line_id == production_line_id)
-        .order_by(Equipment.equipment_code.asc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, BY_CODE, skip, limit, after).all()
 
 
 def get_by_process(
@@ -388,6 +395,7 @@ def get_by_process(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Equipment]:
     """
     Get equipment by process.
@@ -400,6 +408,7 @@ def get_by_process(
         process_id: Process ID to filter by
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Equipment instances used for the process
@@ -408,14 +417,11 @@ def get_by_process(
         # Get all equipment for LASER_MARKING process
         process_equipment = get_by_process(db, process_id=1)
     """
-    return (
+    query = (
         db.query(Equipment)
         .filter(Equipment.process_id == process_id)
-        .order_by(Equipment.equipment_code.asc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, BY_CODE, skip, limit, after).all()
 
 
 def get_needs_maintenance(
@@ -423,6 +429,7 @@ def get_needs_maintenance(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Equipment]:
     """
     Get equipment that needs maintenance.
@@ -434,6 +441,7 @@ def get_needs_maintenance(
         db: SQLAlchemy database session
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Equipment instances that need maintenance
@@ -443,14 +451,11 @@ def get_needs_maintenance(
         overdue = get_needs_maintenance(db)
     """
     today = date.today()
-    return (
+    query = (
         db.query(Equipment)
         .filter(and_(
             Equipment.next_maintenance_date.isnot(None),
             Equipment.next_maintenance_date <= today
         ))
-        .order_by(Equipment.next_maintenance_date.asc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, BY_MAINTENANCE_DATE, skip, limit, after).all()
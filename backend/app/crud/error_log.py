@@ -9,31 +9,51 @@ Functions:
     get: Get a single error log by ID
     get_by_trace_id: Get an error log by trace_id
     get_multi: Get multiple error logs with pagination and filtering
+    get_multi_rows: get_multi page as response rows (no ORM hydration)
     create: Create a new error log entry
+    count: Count error logs matching the get_multi filters (exact or estimated)
+    add_hourly_counts: Add error counts to the hourly summary (upsert)
     count_total: Count total errors in time range
     count_by_error_code: Get error distribution by error code
     count_by_hour: Get hourly error counts for trend analysis
     get_top_paths: Get most error-prone API endpoints
     get_stats: Get comprehensive error statistics
+
+get_multi / get_multi_rows take ``after`` (a decoded keyset cursor, see
+app.crud.keyset) as an alternative to ``skip``; NEWEST is their sort key.
+
+The statistics functions read error_log_hourly, filled by
+app.core.error_rates, instead of grouping error_logs: they cost one row per
+hour and key whatever the error volume, work on every dialect, and count
+whole hours (``since`` is rounded down to the hour). Paths there are route
+templates.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Dict, Any, Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, desc, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.crud import keyset
+from app.crud.rows import RowProjection
 from app.models.error_log import ErrorLog
+from app.models.error_log_hourly import ErrorLogHourly
 from app.models.user import User
 from app.schemas.error_log import (
     ErrorLogCreate,
+    ErrorLogResponse,
     ErrorCodeCount,
     HourlyErrorCount,
     TopErrorPath,
 )
 
+# Keyset sort key of get_multi / get_multi_rows
+NEWEST = [(ErrorLog.timestamp, True), (ErrorLog.id, True)]
+
 
 def get(db: Session, error_log_id: int) -> Optional[ErrorLog]:
     """
@@ -91,6 +111,7 @@ def get_multi(
     *,
     skip: int = 0,
     limit: int = 50,
+    after: Optional[Sequence[Any]] = None,
     error_code: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
@@ -111,6 +132,7 @@ def get_multi(
         db: SQLAlchemy database session
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 50)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
         error_code: Optional filter by error code (e.g., "RES_002")
         start_date: Optional filter by timestamp (from)
         end_date: Optional filter by timestamp (to)
@@ -142,8 +164,73 @@ def get_multi(
         )
     """
     query = db.query(ErrorLog).options(joinedload(ErrorLog.user))
+    query = _apply_filters(
+        query,
+        error_code=error_code,
+        start_date=start_date,
+        end_date=end_date,
+        user_id=user_id,
+        path=path,
+        method=method,
+        min_status_code=min_status_code,
+        max_status_code=max_status_code,
+    )
+
+    # Order by timestamp (newest first) with partition pruning
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
+
+
+_ROWS = RowProjection(
+    ErrorLog,
+    ErrorLogResponse,
+    expressions={
+        "username": select(User.username).where(User.id == ErrorLog.user_id).scalar_subquery(),
+    },
+)
+
+
+def get_multi_rows(
+    db: Session,
+    *,
+    skip: int = 0,
+    limit: int = 50,
+    after: Optional[Sequence[Any]] = None,
+    **filters: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Get the get_multi page as ErrorLogResponse-shaped dicts.
 
-    # Apply filters
+    Takes the same filters as get_multi; selects only the response columns
+    (username as a scalar subquery) without building ErrorLog objects.
+
+    Args:
+        db: SQLAlchemy database session
+        skip: Number of records to skip (default: 0)
+        limit: Maximum number of records to return (default: 50)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
+        **filters: get_multi filters (error_code, start_date, end_date,
+            user_id, path, method, min_status_code, max_status_code)
+
+    Returns:
+        List of response rows ordered by timestamp (newest first)
+    """
+    statement = _apply_filters(_ROWS.select(), **filters)
+    return _ROWS.rows(db, keyset.paginate(statement, NEWEST, skip, limit, after))
+
+
+def _apply_filters(
+    query,
+    *,
+    error_code: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    user_id: Optional[int] = None,
+    path: Optional[str] = None,
+    method: Optional[str] = None,
+    min_status_code: Optional[int] = None,
+    max_status_code: Optional[int] = None,
+):
+    """Apply get_multi filters to a Query or Select."""
     if error_code is not None:
         query = query.filter(ErrorLog.error_code == error_code)
 
@@ -168,14 +255,7 @@ def get_multi(
     if max_status_code is not None:
         query = query.filter(ErrorLog.status_code <= max_status_code)
 
-    # Order by timestamp (newest first) with partition pruning
-    return (
-        query
-        .order_by(desc(ErrorLog.timestamp))
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    return query
 
 
 def create(db: Session, *, error_log_in: ErrorLogCreate) -> ErrorLog:
@@ -224,13 +304,89 @@ def create(db: Session, *, error_log_in: ErrorLogCreate) -> ErrorLog:
     return db_error_log
 
 
+def count(db: Session, *, approximate: bool = False, **filters: Any) -> int:
+    """
+    Count the error logs matching the get_multi filters.
+
+    Args:
+        db: SQLAlchemy database session
+        approximate: Return the planner's row estimate (PostgreSQL) instead
+            of counting every matching row
+        **filters: get_multi filters
+
+    Returns:
+        Number of matching error logs (estimated if approximate)
+    """
+    statement = _apply_filters(select(ErrorLog.id), **filters)
+    return keyset.count(db, statement, approximate=approximate)
+
+
+def add_hourly_counts(db: Session, rows: Iterable[Dict[str, Any]]) -> None:
+    """
+    Add error counts to the hourly summary.
+
+    Each row is added to the existing count of its (hour, error_code, path,
+    method, status_code) row, or inserted, in one statement on PostgreSQL and
+    SQLite, so API processes flushing the same hour do not overwrite each
+    other. Commits.
+
+    Args:
+        db: SQLAlchemy database session
+        rows: Dicts with hour, error_code, path, method, status_code and count
+
+    Raises:
+        SQLAlchemyError: If the write fails
+    """
+    rows = list(rows)
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+
+    try:
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            statement = insert(ErrorLogHourly)
+            db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[
+                        ErrorLogHourly.hour, ErrorLogHourly.error_code, ErrorLogHourly.path,
+                        ErrorLogHourly.method, ErrorLogHourly.status_code,
+                    ],
+                    set_={"count": ErrorLogHourly.count + statement.excluded.count},
+                ),
+                rows,
+            )
+        else:
+            for row in rows:
+                key = {name: value for name, value in row.items() if name != "count"}
+                updated = db.execute(
+                    update(ErrorLogHourly)
+                    .filter_by(**key)
+                    .values(count=ErrorLogHourly.count + row["count"])
+                    .execution_options(synchronize_session=False)
+                )
+                if updated.rowcount == 0:
+                    db.execute(ErrorLogHourly.__table__.insert().values(**row))
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+
+
+def _hour_floor(since: datetime) -> datetime:
+    """Start of the hour containing since, as aware UTC (naive means UTC)."""
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return since.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
 def count_total(db: Session, *, since: Optional[datetime] = None) -> int:
     """
     Count total errors in time range.
 
     Args:
         db: SQLAlchemy database session
-        since: Optional start datetime (default: all time)
+        since: Optional start datetime, rounded down to the hour (default: all time)
 
     Returns:
         Total count of error logs
@@ -240,10 +396,10 @@ def count_total(db: Session, *, since: Optional[datetime] = None) -> int:
         from datetime import datetime, timedelta
         count = count_total(db, since=datetime.utcnow() - timedelta(hours=24))
     """
-    query = db.query(func.count(ErrorLog.id))
+    query = db.query(func.sum(ErrorLogHourly.count))
 
     if since is not None:
-        query = query.filter(ErrorLog.timestamp >= since)
+        query = query.filter(ErrorLogHourly.hour >= _hour_floor(since))
 
     return query.scalar() or 0
 
@@ -262,7 +418,7 @@ def count_by_error_code(
 
     Args:
         db: SQLAlchemy database session
-        since: Optional start datetime for filtering
+        since: Optional start datetime for filtering, rounded down to the hour
         limit: Maximum number of error codes to return (default: 20)
 
     Returns:
@@ -280,16 +436,16 @@ def count_by_error_code(
             print(f"{item.error_code}: {item.count} errors")
     """
     query = db.query(
-        ErrorLog.error_code,
-        func.count(ErrorLog.id).label("count")
-    ).group_by(ErrorLog.error_code)
+        ErrorLogHourly.error_code,
+        func.sum(ErrorLogHourly.count).label("count")
+    ).group_by(ErrorLogHourly.error_code)
 
     if since is not None:
-        query = query.filter(ErrorLog.timestamp >= since)
+        query = query.filter(ErrorLogHourly.hour >= _hour_floor(since))
 
     results = (
         query
-        .order_by(desc("count"))
+        .order_by(desc("count"), ErrorLogHourly.error_code)
         .limit(limit)
         .all()
     )
@@ -314,11 +470,12 @@ def count_by_hour(
 
     Args:
         db: SQLAlchemy database session
-        since: Optional start datetime (default: {hours} hours ago)
+        since: Optional start datetime, rounded down to the hour
+            (default: {hours} hours ago)
         hours: Number of hours to look back (default: 24)
 
     Returns:
-        List of HourlyErrorCount with hour and count
+        List of HourlyErrorCount with hour and count (newest first)
 
     Example:
         # Get hourly error counts for last 24 hours
@@ -329,17 +486,14 @@ def count_by_hour(
     if since is None:
         since = datetime.utcnow() - timedelta(hours=hours)
 
-    # Truncate timestamp to hour
-    hour_column = func.date_trunc('hour', ErrorLog.timestamp).label('hour')
-
     query = db.query(
-        hour_column,
-        func.count(ErrorLog.id).label("count")
+        ErrorLogHourly.hour,
+        func.sum(ErrorLogHourly.count).label("count")
     ).filter(
-        ErrorLog.timestamp >= since
-    ).group_by(hour_column)
+        ErrorLogHourly.hour >= _hour_floor(since)
+    ).group_by(ErrorLogHourly.hour)
 
-    results = query.order_by(desc(hour_column)).all()
+    results = query.order_by(desc(ErrorLogHourly.hour)).all()
 
     return [
         HourlyErrorCount(hour=row.hour, count=row.count)
@@ -356,12 +510,12 @@ def get_top_paths(
     """
     Get most error-prone API endpoints.
 
-    Returns API paths with the highest error counts, useful for identifying
-    problematic endpoints that need attention.
+    Returns API route templates with the highest error counts, useful for
+    identifying problematic endpoints that need attention.
 
     Args:
         db: SQLAlchemy database session
-        since: Optional start datetime for filtering
+        since: Optional start datetime for filtering, rounded down to the hour
         limit: Maximum number of paths to return (default: 10)
 
     Returns:
@@ -379,19 +533,19 @@ def get_top_paths(
             print(f"{item.method} {item.path}: {item.count} errors")
     """
     query = db.query(
-        ErrorLog.path,
-        ErrorLog.method,
-        func.count(ErrorLog.id).label("count")
+        ErrorLogHourly.path,
+        ErrorLogHourly.method,
+        func.sum(ErrorLogHourly.count).label("count")
     ).filter(
-        ErrorLog.path.isnot(None)
-    ).group_by(ErrorLog.path, ErrorLog.method)
+        ErrorLogHourly.path != ""
+    ).group_by(ErrorLogHourly.path, ErrorLogHourly.method)
 
     if since is not None:
-        query = query.filter(ErrorLog.timestamp >= since)
+        query = query.filter(ErrorLogHourly.hour >= _hour_floor(since))
 
     results = (
         query
-        .order_by(desc("count"))
+        .order_by(desc("count"), ErrorLogHourly.path, ErrorLogHourly.method)
         .limit(limit)
         .all()
     )
@@ -416,7 +570,7 @@ def get_stats(
 
     Args:
         db: SQLAlchemy database session
-        hours: Number of hours to look back (default: 24)
+        hours: Number of hours to look back, including the current one (default: 24)
 
     Returns:
         Dictionary with keys: total_errors, by_error_code, by_hour, top_paths
@@ -426,7 +580,7 @@ def get_stats(
         print(f"Total errors: {stats['total_errors']}")
         print(f"Error types: {len(stats['by_error_code'])}")
     """
-    since = datetime.utcnow() - timedelta(hours=hours)
+    since = _hour_floor(datetime.now(timezone.utc)) - timedelta(hours=hours - 1)
 
     return {
         "total_errors": count_total(db, since=since),
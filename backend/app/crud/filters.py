@@ -0,0 +1,443 @@
+"""
+Compiled dynamic filters with keyset pagination and saved-filter caching.
+
+A filter tree (FilterExpression leaves in nested AND / OR FilterGroups) is
+validated against the target's field registry and compiled once per shape
+(fields, operators and group structure; not values) into a WHERE clause of
+named bind parameters. The compiled SELECT and COUNT statements are kept in
+an LRU cache, so repeated filters skip validation and expression building
+and SQLAlchemy reuses the compiled SQL.
+
+Index awareness (PostgreSQL indexes of the target table):
+    - Substring matches (contains / icontains / endswith) need a leading
+      wildcard and are rejected; GET /api/v1/search covers substring search
+    - Predicates that cannot use an index (unindexed columns, neq,
+      startswith, measurement ranges) are accepted with a warning, and a
+      tree with no index-backed branch is flagged as a full scan
+
+Measurement values are filtered as ``measurements.<key>``: eq compiles to
+JSONB containment and exists to the key-exists operator, both answered by
+the measurements GIN index.
+
+Saved filter pages are cached under the filter's content hash and the
+change_tracker version of the target table: refreshing a dashboard without
+an intervening write is served from memory, and a write committed by any API
+process makes the old pages unreachable, since the version is read from the
+shared resource_versions table on every call (they are also dropped on change).
+
+Functions:
+    parse_filters: Validate a stored filter list
+    compile_filters: Validate and compile a filter tree
+    run: Execute one page of a filter
+    run_saved: run() through the saved-filter result cache
+    filter_hash: Content hash of a filter tree and its sort
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import and_, bindparam, func, literal, or_, select, true
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.cache import cache, invalidate_cache
+from app.core.change_tracker import change_tracker
+from app.crud import process_data as process_data_crud
+from app.crud.keyset import after, decode_cursor, encode_cursor, order_by
+from app.crud.rows import RowProjection
+from app.models.process_data import ProcessData
+from app.schemas.search import FilterExpression, FilterGroup, FilterNode
+
+_CACHE_PREFIX = "saved_filter"
+
+# Operators answered by a btree index on the column (neq and startswith are not)
+_INDEXABLE = frozenset({"eq", "in", "gt", "gte", "lt", "lte", "between", "is_null"})
+# Leading-wildcard LIKE: rejected
+_SUBSTRING = frozenset({"contains", "icontains", "endswith"})
+_JSON_OPS = frozenset({"eq", "exists", "gt", "gte", "lt", "lte", "between"})
+_JSON_INDEXABLE = frozenset({"eq", "exists"})
+
+_RANGE = {
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+}
+
+_NODES = TypeAdapter(List[FilterNode])
+
+
+@dataclass(frozen=True)
+class FilterField:
+    """A filterable column; json fields hold named values (``<field>.<key>``)."""
+    column: Any
+    indexed: bool = False
+    json: bool = False
+
+
+@dataclass(eq=False)
+class FilterTarget:
+    """
+    An entity that can be filtered.
+
+    Attributes:
+        name: Table name (change_tracker resource)
+        model: Mapped model class
+        rows: Response row projection
+        fields: Filterable fields by name
+        sortable: Fields allowed as sort key (NOT NULL, in the row schema)
+    """
+    name: str
+    model: Any
+    rows: RowProjection
+    fields: Mapping[str, FilterField]
+    sortable: Tuple[str, ...]
+
+
+PROCESS_DATA = FilterTarget(
+    name="process_data",
+    model=ProcessData,
+    rows=process_data_crud.ROWS,
+    fields={
+        "id": FilterField(ProcessData.id, indexed=True),
+        "lot_id": FilterField(ProcessData.lot_id, indexed=True),
+        "serial_id": FilterField(ProcessData.serial_id, indexed=True),
+        "wip_id": FilterField(ProcessData.wip_id, indexed=True),
+        "process_id": FilterField(ProcessData.process_id, indexed=True),
+        "operator_id": FilterField(ProcessData.operator_id, indexed=True),
+        "equipment_id": FilterField(ProcessData.equipment_id, indexed=True),
+        "data_level": FilterField(ProcessData.data_level, indexed=True),
+        "started_at": FilterField(ProcessData.started_at, indexed=True),
+        "completed_at": FilterField(ProcessData.completed_at, indexed=True),
+        "result": FilterField(ProcessData.result),
+        "process_session_id": FilterField(ProcessData.process_session_id),
+        "duration_seconds": FilterField(ProcessData.duration_seconds),
+        "created_at": FilterField(ProcessData.created_at),
+        "notes": FilterField(ProcessData.notes),
+        "measurements": FilterField(ProcessData.measurements, indexed=True, json=True),
+    },
+    sortable=("id", "started_at", "created_at", "lot_id", "process_id"),
+)
+
+TARGETS: Dict[str, FilterTarget] = {PROCESS_DATA.name: PROCESS_DATA}
+
+
+@dataclass(frozen=True)
+class CompiledFilter:
+    """Statements of one filter shape; execute with the values as p0, p1, ..."""
+    select: Any
+    count: Any
+    warnings: Tuple[str, ...]
+
+
+def parse_filters(raw: Sequence[Any]) -> List[FilterNode]:
+    """
+    Validate a stored filter list (saved filters keep it as plain JSON).
+
+    Raises:
+        ValueError: If the list is not a valid filter tree
+    """
+    try:
+        return _NODES.validate_python(list(raw))
+    except ValidationError as e:
+        raise ValueError(f"Invalid filter: {e.errors()[0]['msg']}") from e
+
+
+def filter_hash(filters: Sequence[FilterNode], sort_by: Optional[str] = None, sort_order: str = "asc") -> str:
+    """Content hash of a filter tree and its sort (equal filters share cached pages)."""
+    payload = json.dumps(
+        [[node.model_dump() for node in filters], sort_by, sort_order], sort_keys=True, default=str
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def _coerce(name: str, field: FilterField, value: Any) -> Any:
+    """Convert a JSON filter value to the column's Python type."""
+    try:
+        python_type = field.column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        if python_type is datetime and isinstance(value, str):
+            return datetime.fromisoformat(value)
+        if python_type in (int, float) and not isinstance(value, bool):
+            return python_type(value)
+        if isinstance(value, python_type):
+            return value
+    except (TypeError, ValueError):
+        pass
+    raise ValueError(f"Invalid value for {name}: {value!r}")
+
+
+def _json_kind(name: str, value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "str"
+    raise ValueError(f"Invalid value for {name}: {value!r}")
+
+
+def _shape(target: FilterTarget, node: FilterNode, values: List[Any]) -> Tuple:
+    """Validate a node; return its hashable shape and append its values in bind order."""
+    if isinstance(node, FilterGroup):
+        return (node.op, tuple(_shape(target, child, values) for child in node.filters))
+
+    name, _, key = node.field.partition(".")
+    field = target.fields.get(name)
+    op = node.operator
+    if field is None or bool(key) != field.json:
+        raise ValueError(f"Cannot filter on '{node.field}'")
+    if op in _SUBSTRING:
+        raise ValueError(
+            f"'{node.field} {op}' needs a substring scan; use GET /api/v1/search for substring search"
+        )
+
+    if field.json:
+        if not key.isidentifier():
+            raise ValueError(f"Invalid measurement key: {key!r}")
+        if op not in _JSON_OPS:
+            raise ValueError(f"Unsupported operator for measurements: {op}")
+        if op == "exists":
+            return ("json", name, key, op, None)
+        if op == "between":
+            low, high = _pair(node)
+            values.extend([float(low), float(high)])
+            return ("json", name, key, op, "number")
+        if op in _RANGE:
+            values.append(float(_number(node)))
+            return ("json", name, key, op, "number")
+        values.append(node.value)
+        return ("json", name, key, op, _json_kind(node.field, node.value))
+
+    if op == "is_null":
+        return ("leaf", name, op, bool(node.value if node.value is not None else True))
+    if op == "between":
+        low, high = _pair(node)
+        values.extend([_coerce(name, field, low), _coerce(name, field, high)])
+    elif op == "in":
+        if not isinstance(node.value, list) or not node.value:
+            raise ValueError(f"'{node.field} in' needs a non-empty list")
+        values.append([_coerce(name, field, item) for item in node.value])
+    elif op in _RANGE or op in ("eq", "neq", "startswith"):
+        values.append(_coerce(name, field, node.value))
+    else:
+        raise ValueError(f"Unsupported operator: {op}")
+    return ("leaf", name, op, None)
+
+
+def _pair(node: FilterExpression) -> Tuple[Any, Any]:
+    if not isinstance(node.value, list) or len(node.value) != 2:
+        raise ValueError(f"'{node.field} between' needs [low, high]")
+    return node.value[0], node.value[1]
+
+
+def _number(node: FilterExpression) -> float:
+    if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+        raise ValueError(f"Invalid value for {node.field}: {node.value!r}")
+    return node.value
+
+
+class _Builder:
+    """Turns a shape into SQL, numbering bind parameters in _shape's order."""
+
+    def __init__(self, target: FilterTarget, dialect: str):
+        self.target = target
+        self.dialect = dialect
+        self.count = 0
+        self.warnings: List[str] = []
+
+    def bind(self, expanding: bool = False):
+        name = f"p{self.count}"
+        self.count += 1
+        return bindparam(name, expanding=expanding)
+
+    def build(self, shape: Tuple) -> Tuple[Any, bool]:
+        """Return (clause, index_backed)."""
+        if shape[0] in ("and", "or"):
+            built = [self.build(child) for child in shape[1]]
+            clauses = [clause for clause, _ in built]
+            if shape[0] == "and":
+                return and_(*clauses), any(indexed for _, indexed in built)
+            return or_(*clauses), all(indexed for _, indexed in built)
+        if shape[0] == "json":
+            return self.json(*shape[1:])
+        return self.leaf(*shape[1:])
+
+    def leaf(self, name: str, op: str, is_null: Optional[bool]) -> Tuple[Any, bool]:
+        field = self.target.fields[name]
+        column = field.column
+        if op == "is_null":
+            clause = column.is_(None) if is_null else column.is_not(None)
+        elif op == "eq":
+            clause = column == self.bind()
+        elif op == "neq":
+            clause = column != self.bind()
+        elif op == "in":
+            clause = column.in_(self.bind(expanding=True))
+        elif op == "between":
+            clause = column.between(self.bind(), self.bind())
+        elif op == "startswith":
+            clause = column.startswith(self.bind(), autoescape=False)
+        else:
+            clause = _RANGE[op](column, self.bind())
+
+        indexed = field.indexed and op in _INDEXABLE
+        if not indexed:
+            self.warnings.append(f"'{name} {op}' cannot use an index")
+        return clause, indexed
+
+    def json(self, name: str, key: str, op: str, kind: Optional[str]) -> Tuple[Any, bool]:
+        column = self.target.fields[name].column
+        postgresql = self.dialect == "postgresql"
+        if op == "exists":
+            if postgresql:
+                clause = column.op("?")(literal(key))
+            else:
+                clause = func.json_type(column, f"$.{key}").is_not(None)
+        elif op == "eq" and postgresql:
+            clause = column.op("@>")(func.jsonb_build_object(literal(key), self.bind()))
+        elif op == "eq":
+            value = column[key]
+            value = {"bool": value.as_boolean, "number": value.as_float, "str": value.as_string}[kind]()
+            clause = value == self.bind()
+        elif op == "between":
+            clause = column[key].as_float().between(self.bind(), self.bind())
+        else:
+            clause = _RANGE[op](column[key].as_float(), self.bind())
+
+        indexed = op in _JSON_INDEXABLE
+        if not indexed:
+            self.warnings.append(f"'{name}.{key} {op}' cannot use an index")
+        return clause, indexed
+
+
+@lru_cache(maxsize=256)
+def _compile(target_name: str, dialect: str, shape: Tuple) -> CompiledFilter:
+    target = TARGETS[target_name]
+    builder = _Builder(target, dialect)
+    where, indexed = builder.build(shape) if shape[1] else (true(), True)
+    warnings = builder.warnings
+    if not indexed:
+        warnings.append(f"No index-backed predicate: the filter scans the whole {target.name} table")
+    return CompiledFilter(
+        select=target.rows.select().where(where),
+        count=select(func.count()).select_from(target.model).where(where),
+        warnings=tuple(warnings),
+    )
+
+
+def compile_filters(
+    db: Session, target: FilterTarget, filters: Sequence[FilterNode]
+) -> Tuple[CompiledFilter, Dict[str, Any]]:
+    """
+    Validate and compile a filter tree (top-level nodes are combined with AND).
+
+    Returns:
+        Tuple of (compiled statements, bind parameter values)
+
+    Raises:
+        ValueError: If a field, operator or value is invalid, or a predicate
+            needs a substring scan
+    """
+    values: List[Any] = []
+    shape = ("and", tuple(_shape(target, node, values) for node in filters))
+    compiled = _compile(target.name, db.get_bind().dialect.name, shape)
+    return compiled, {f"p{i}": value for i, value in enumerate(values)}
+
+
+def run(
+    db: Session,
+    target: FilterTarget,
+    filters: Sequence[FilterNode],
+    sort_by: Optional[str] = None,
+    sort_order: str = "asc",
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> Dict[str, Any]:
+    """
+    Execute one keyset page of a filter.
+
+    Args:
+        db: Database session
+        target: Entity to filter
+        filters: Filter tree (top-level nodes combined with AND)
+        sort_by: Sort field from target.sortable (default: id)
+        sort_order: asc or desc
+        limit: Maximum rows to return
+        cursor: next_cursor of the previous page
+        include_total: Also count all matching rows
+
+    Returns:
+        Dictionary with items (response rows), next_cursor, total and warnings
+
+    Raises:
+        ValueError: If the filter, sort field or cursor is invalid
+    """
+    compiled, params = compile_filters(db, target, filters)
+    sort_by = sort_by or "id"
+    if sort_by not in target.sortable:
+        raise ValueError(f"Cannot sort by '{sort_by}' (allowed: {', '.join(target.sortable)})")
+    descending = sort_order == "desc"
+    keys = [(target.fields[sort_by].column, descending)]
+    if sort_by != "id":
+        keys.append((target.fields["id"].column, descending))
+
+    statement = compiled.select.order_by(*order_by(keys))
+    if cursor:
+        statement = statement.where(after(keys, decode_cursor(cursor, len(keys))))
+    items = target.rows.rows(db, statement.limit(limit + 1), params)
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(*(last[name] for name in dict.fromkeys([sort_by, "id"])))
+    total = db.execute(compiled.count, params).scalar_one() if include_total else None
+    return {"items": items, "next_cursor": next_cursor, "total": total, "warnings": list(compiled.warnings)}
+
+
+def run_saved(
+    db: Session,
+    target: FilterTarget,
+    filters: Sequence[FilterNode],
+    sort_by: Optional[str] = None,
+    sort_order: str = "asc",
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    run() for saved filters, cached by filter hash and data version.
+
+    The version is the target table's shared change version, read before the
+    query, so a page computed while a write commits is stored under the old
+    version and never served afterwards, whichever process wrote.
+    """
+    if not settings.CACHE_ENABLED:
+        return run(db, target, filters, sort_by, sort_order, limit, cursor)
+
+    version = change_tracker.version(db, target.name)
+    key = ":".join([
+        _CACHE_PREFIX, target.name, filter_hash(filters, sort_by, sort_order),
+        str(version), str(limit), cursor or "",
+    ])
+    page = cache.get(key)
+    if page is None:
+        page = run(db, target, filters, sort_by, sort_order, limit, cursor)
+        cache.set(key, page, ttl=settings.SAVED_FILTER_CACHE_TTL)
+    return page
+
+
+def _drop_stale_pages(changed: FrozenSet[str]) -> None:
+    for name in changed & TARGETS.keys():
+        invalidate_cache(f"{_CACHE_PREFIX}:{name}:")
+
+
+change_tracker.subscribe(_drop_stale_pages)
@@ -0,0 +1,223 @@
+"""
+CRUD operations for idempotency keys (stored responses of write requests).
+
+Used by app.middleware.idempotency. A key is claimed with a single
+``INSERT ... ON CONFLICT DO NOTHING`` so exactly one request per key runs
+the endpoint; the others read the stored response by primary key and
+never touch the business tables.
+
+A claim is a lease: it expires after ``lease_seconds`` unless the claiming
+request renews it while it runs, so a claim left behind by a crashed worker
+is taken over by the next request instead of blocking the key for the whole
+TTL. A claim is identified by its claim time (created_at): renew(),
+complete() and release() only touch the claim they were given, so a request
+whose claim was taken over never overwrites its successor's row.
+complete() extends a key to the response TTL.
+
+Functions:
+    - claim: Claim a key for a new request, or get the existing row
+    - get: Current row of a key
+    - renew: Extend the lease of an in-flight claim
+    - complete: Store the response of the claiming request
+    - release: Drop an in-flight claim so the request can be retried
+    - purge_expired: TTL sweep
+"""
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.idempotency_key import IdempotencyKey
+
+
+async def claim(
+    db: AsyncSession,
+    key: str,
+    request_hash: str,
+    lease_seconds: float,
+    now: Optional[datetime] = None,
+) -> Optional[IdempotencyKey]:
+    """
+    Claim a key for a new request.
+
+    An expired row for the key (a stored response past its TTL, or an
+    in-flight claim past its lease) is replaced. Commits.
+
+    Args:
+        db: Async database session
+        key: Scoped key (see IdempotencyKey.key)
+        request_hash: Fingerprint of the request
+        lease_seconds: How long the claim blocks other requests with the key
+            unless renewed
+        now: Claim time, identifying the claim (default: current UTC time)
+
+    Returns:
+        None if the caller claimed the key and must run the request,
+        otherwise the existing row (completed or still in flight)
+    """
+    now = now or datetime.now(timezone.utc)
+    values = {
+        "key": key,
+        "request_hash": request_hash,
+        "created_at": now,
+        "expires_at": now + timedelta(seconds=lease_seconds),
+    }
+    await db.execute(
+        delete(IdempotencyKey)
+        .where(IdempotencyKey.key == key, IdempotencyKey.expires_at < now)
+        .execution_options(synchronize_session=False)
+    )
+
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        result = await db.execute(
+            insert(IdempotencyKey)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[IdempotencyKey.key])
+            .returning(IdempotencyKey.key)
+        )
+        claimed = result.scalar_one_or_none() is not None
+        await db.commit()
+    else:
+        try:
+            await db.execute(IdempotencyKey.__table__.insert().values(**values))
+            await db.commit()
+            claimed = True
+        except IntegrityError:
+            await db.rollback()
+            claimed = False
+
+    if claimed:
+        return None
+    return await get(db, key)
+
+
+async def get(db: AsyncSession, key: str) -> Optional[IdempotencyKey]:
+    """
+    Get the current row of a key, bypassing the session's identity map.
+
+    Args:
+        db: Async database session
+        key: Scoped key
+
+    Returns:
+        IdempotencyKey or None
+    """
+    result = await db.execute(
+        select(IdempotencyKey)
+        .where(IdempotencyKey.key == key)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+async def renew(db: AsyncSession, key: str, claimed_at: datetime, lease_seconds: float) -> bool:
+    """
+    Extend the lease of an in-flight claim. Commits.
+
+    Args:
+        db: Async database session
+        key: Scoped key
+        claimed_at: Claim time passed to claim()
+        lease_seconds: New lease, from now
+
+    Returns:
+        False if the claim no longer exists (completed, released or taken over)
+    """
+    result = await db.execute(
+        update(IdempotencyKey)
+        .where(*_in_flight(key, claimed_at))
+        .values(expires_at=datetime.now(timezone.utc) + timedelta(seconds=lease_seconds))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount > 0
+
+
+async def complete(
+    db: AsyncSession,
+    key: str,
+    claimed_at: datetime,
+    status_code: int,
+    content_type: Optional[str],
+    body: bytes,
+    ttl_seconds: int,
+) -> bool:
+    """
+    Store the response of the request that claimed a key. Commits.
+
+    Args:
+        db: Async database session
+        key: Scoped key
+        claimed_at: Claim time passed to claim()
+        status_code: Response status
+        content_type: Response Content-Type
+        body: Response body
+        ttl_seconds: How long the response can be replayed
+
+    Returns:
+        False if the claim no longer exists (taken over after its lease)
+    """
+    result = await db.execute(
+        update(IdempotencyKey)
+        .where(*_in_flight(key, claimed_at))
+        .values(
+            expires_at=datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds),
+            status_code=status_code,
+            content_type=content_type,
+            response_body=body,
+            response_hash=hashlib.sha256(body).hexdigest(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount > 0
+
+
+async def release(db: AsyncSession, key: str, claimed_at: datetime) -> None:
+    """
+    Drop an in-flight claim (the request failed and may be retried). Commits.
+
+    Args:
+        db: Async database session
+        key: Scoped key
+        claimed_at: Claim time passed to claim()
+    """
+    await db.execute(
+        delete(IdempotencyKey)
+        .where(*_in_flight(key, claimed_at))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+async def purge_expired(db: AsyncSession, now: Optional[datetime] = None) -> int:
+    """
+    Delete expired keys (uses idx_idempotency_keys_expires_at). Commits.
+
+    Args:
+        db: Async database session
+        now: Reference time (default: current UTC time)
+
+    Returns:
+        Number of deleted rows
+    """
+    now = now or datetime.now(timezone.utc)
+    result = await db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at < now))
+    await db.commit()
+    return result.rowcount
+
+
+def _in_flight(key: str, claimed_at: datetime) -> tuple:
+    """Conditions matching one in-flight claim of a key."""
+    return (
+        IdempotencyKey.key == key,
+        IdempotencyKey.created_at == claimed_at,
+        IdempotencyKey.status_code.is_(None),
+    )
@@ -0,0 +1,191 @@
+"""
+Keyset pagination: opaque cursors and "rows after the cursor" predicates.
+
+Offset pagination re-reads and discards every skipped row; a keyset page
+instead continues from the sort key of the previous page's last row, so
+page N costs the same as page 1 when the sort key is indexed. The sort key
+always ends with a unique column (normally id) to make it a total order.
+
+CRUD list functions take the decoded position as ``after`` next to
+``skip`` and apply both with paginate(); list endpoints decode the
+``cursor`` query parameter and return the next one in the X-Next-Cursor
+header (see app.core.deps.keyset_page).
+
+Example:
+    >>> keys = [(ProcessData.started_at, True), (ProcessData.id, True)]
+    >>> statement = select(ProcessData).order_by(*order_by(keys))
+    >>> if cursor:
+    ...     statement = statement.where(after(keys, decode_cursor(cursor, 2)))
+    >>> rows = db.execute(statement.limit(limit + 1)).scalars().all()
+    >>> next_cursor = encode_cursor(rows[limit - 1].started_at, rows[limit - 1].id) if len(rows) > limit else None
+"""
+
+import base64
+import json
+import logging
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, or_, select, tuple_
+from sqlalchemy.exc import CompileError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_DATETIME = "$dt"
+_DATE = "$d"
+
+# (column, descending) pairs, most significant first
+SortKey = Sequence[Tuple[Any, bool]]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return {_DATETIME: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE: value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if _DATETIME in value:
+            return datetime.fromisoformat(value[_DATETIME])
+        if _DATE in value:
+            return date.fromisoformat(value[_DATE])
+        raise ValueError(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of a page's last row as an opaque URL-safe token."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: Optional[int]) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Token from a previous page
+        size: Expected number of sort key values (None: any)
+
+    Returns:
+        The sort key values
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or (size is not None and len(values) != size):
+            raise ValueError(values)
+        return tuple(_decode_value(value) for value in values)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def order_by(keys: SortKey) -> List[Any]:
+    """ORDER BY clauses for a sort key."""
+    return [column.desc() if descending else column.asc() for column, descending in keys]
+
+
+def after(keys: SortKey, values: Sequence[Any]):
+    """
+    Predicate selecting the rows that sort after the given key values.
+
+    When every column sorts the same way this is a row value comparison,
+    ``(a, b) < (x, y)``, which PostgreSQL answers with a range scan of an
+    index on (a, b). Mixed directions expand into ``a > x OR (a = x AND
+    b > y)`` with the comparison flipped for descending columns, bounded
+    by the leading column so its index can still be used.
+    """
+    directions = {descending for _, descending in keys}
+    if len(keys) == 1 or len(directions) == 1:
+        columns = tuple_(*(column for column, _ in keys)) if len(keys) > 1 else keys[0][0]
+        bound = tuple_(*values) if len(keys) > 1 else values[0]
+        return columns < bound if keys[0][1] else columns > bound
+
+    clauses = []
+    for position, (column, descending) in enumerate(keys):
+        value = values[position]
+        beyond = column < value if descending else column > value
+        ties = [keys[i][0] == values[i] for i in range(position)]
+        clauses.append(and_(*ties, beyond) if ties else beyond)
+    leading, descending = keys[0]
+    return and_(leading <= values[0] if descending else leading >= values[0], or_(*clauses))
+
+
+def paginate(query: Any, keys: SortKey, skip: int = 0, limit: int = 100, after_values: Optional[Sequence[Any]] = None):
+    """
+    Order a query by a sort key and select one page of it.
+
+    Args:
+        query: ORM Query or select() statement
+        keys: Sort key; replaces any ORDER BY already on the query
+        skip: Offset, used when no keyset position is given
+        limit: Page size
+        after_values: Sort key of the previous page's last row; the page
+            starts after it and skip is ignored
+
+    Returns:
+        The query, ordered and limited
+    """
+    query = query.order_by(None).order_by(*order_by(keys))
+    if after_values is not None:
+        query = query.where(after(keys, after_values))
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def _row_value(row: Any, column: Any) -> Any:
+    if isinstance(row, Mapping):
+        return row[column.key]
+    return getattr(row, column.key)
+
+
+def next_cursor(rows: Sequence[Any], keys: SortKey, limit: int) -> Optional[str]:
+    """
+    Cursor of the page after rows, or None when rows is not a full page.
+
+    Rows are ORM objects or response dicts holding the sort key columns.
+    A last page that happens to be exactly full yields one empty page.
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(*(_row_value(last, column) for column, _ in keys))
+
+
+def count(db: Session, statement: Any, approximate: bool = False) -> int:
+    """
+    Count the rows of a select() statement.
+
+    Args:
+        db: Database session
+        statement: Row-returning statement without ORDER BY / LIMIT
+        approximate: On PostgreSQL, return the planner's row estimate
+            instead of running COUNT(*) (constant time, typically within
+            a few percent once the table is analyzed)
+
+    Returns:
+        The exact count, or the estimate
+    """
+    dialect = db.get_bind().dialect
+    if approximate and dialect.name == "postgresql":
+        try:
+            sql = statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        except (CompileError, NotImplementedError) as e:
+            logger.debug("Row estimate unavailable, counting instead: %s", e)
+        else:
+            plan = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+    return db.execute(select(func.count()).select_from(statement.order_by(None).subquery())).scalar() or 0
@@ -17,20 +17,35 @@ Functions:
     get_by_date_range: Filter LOTs by production date range
     get_by_product_model: Filter LOTs by product model
     get_by_status: Filter LOTs by status
+    get_multi_rows: get_multi / get_by_status page as response rows (no ORM hydration)
     update_quantities: Recalculate quantities from serials
     close_lot: Close completed LOT (set status to CLOSED and closed_at timestamp)
+
+List functions take ``after`` (a decoded keyset cursor, see app.crud.keyset)
+as an alternative to ``skip``; NEWEST and BY_PRODUCTION_DATE are their sort keys.
 """
 
 from datetime import date, datetime
-from typing import List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal, Sequence
 
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session, selectinload, joinedload, Query
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from app.core.change_tracker import change_tracker
+from app.crud import keyset, sequence_counter
+from app.crud.rows import RowProjection
 from app.models.lot import Lot, LotStatus
 from app.models.serial import Serial, SerialStatus
-from app.schemas.lot import LotCreate, LotUpdate
+from app.models.wip_item import WIPItem
+from app.schemas.lot import LotCreate, LotInDB, LotUpdate
+
+# Count committed LOT changes for ETag-based conditional GET
+change_tracker.track(Lot)
+
+# Keyset sort keys: get_multi / get_multi_rows, and the filtered lists
+NEWEST = [(Lot.created_at, True), (Lot.id, True)]
+BY_PRODUCTION_DATE = [(Lot.production_date, True), (Lot.lot_number, True)]
 
 
 def _build_optimized_query(
@@ -119,6 +134,7 @@ def get_multi(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
     eager_loading: Literal["minimal", "standard", "full"] = "standard"
 ) -> List[Lot]:
     """
@@ -136,6 +152,7 @@ def get_multi(
         db: SQLAlchemy database session
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
         eager_loading: Control eager loading depth ("minimal", "standard", "full")
 
     Returns:
@@ -150,9 +167,8 @@ def get_multi(
         # Get LOTs without relationship loading for listing
         lots = get_multi(db, eager_loading="minimal")
     """
-    query = db.query(Lot).order_by(Lot.created_at.desc(), Lot.id.desc())
-    query = _build_optimized_query(query, eager_loading)
-    return query.offset(skip).limit(limit).all()
+    query = _build_optimized_query(db.query(Lot), eager_loading)
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def create(
@@ -228,27 +244,30 @@ def create(
     # Generate base LOT number
     lot_number_base = f"{line_prefix}{model_code}{production_month}"
 
-    # 4. Find the last sequence number for this base LOT number
-    last_lot = (
-        db.query(Lot)
-        .filter(Lot.lot_number.like(f"{lot_number_base}%"))
-        .order_by(Lot.lot_number.desc())
-        .first()
-    )
-
-    # Calculate next sequence number
-    if last_lot and len(last_lot.lot_number) >= 13:
-        try:
-            last_seq = int(last_lot.lot_number[-2:])
-            new_seq = last_seq + 1
-        except ValueError:
-            # If last 2 chars are not numeric, start from 1
-            new_seq = 1
-    else:
-        new_seq = 1
+    # 4. Allocate the next sequence for this base LOT number (atomic counter;
+    #    seeded once from existing LOT numbers that predate the counter)
+    def last_existing_sequence() -> int:
+        last_lot = (
+            db.query(Lot)
+            .filter(Lot.lot_number.like(f"{lot_number_base}%"))
+            .order_by(Lot.lot_number.desc())
+            .first()
+        )
+        if last_lot and len(last_lot.lot_number) >= 13:
+            try:
+                return int(last_lot.lot_number[-2:])
+            except ValueError:
+                # If last 2 chars are not numeric, start from 1
+                pass
+        return 0
+
+    new_seq = sequence_counter.allocate(
+        db, sequence_counter.lot_scope(lot_number_base), seed=last_existing_sequence
+    )[0]
 
     # Validate sequence doesn't exceed 99 (2-digit limit)
     if new_seq > 99:
+        db.rollback()
         raise ValueError(
             f"LOT sequence limit exceeded for {lot_number_base}. "
             f"Maximum 99 LOTs per line/model/month combination."
@@ -418,6 +437,7 @@ def get_active(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
     eager_loading: Literal["minimal", "standard", "full"] = "standard"
 ) -> List[Lot]:
     """
@@ -433,6 +453,7 @@ def get_active(
         db: SQLAlchemy database session
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
         eager_loading: Control eager loading depth ("minimal", "standard", "full")
 
     Returns:
@@ -447,13 +468,9 @@ def get_active(
         # Get first 50 active LOTs with minimal loading
         active_lots = get_active(db, skip=0, limit=50, eager_loading="minimal")
     """
-    query = (
-        db.query(Lot)
-        .filter(Lot.status.in_([LotStatus.CREATED, LotStatus.IN_PROGRESS]))
-        .order_by(desc(Lot.production_date), desc(Lot.lot_number))
-    )
+    query = db.query(Lot).filter(Lot.status.in_([LotStatus.CREATED, LotStatus.IN_PROGRESS]))
     query = _build_optimized_query(query, eager_loading)
-    return query.offset(skip).limit(limit).all()
+    return keyset.paginate(query, BY_PRODUCTION_DATE, skip, limit, after).all()
 
 
 def get_by_date_range(
@@ -463,6 +480,7 @@ def get_by_date_range(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Lot]:
     """
     Get LOTs by production date range.
@@ -476,6 +494,7 @@ def get_by_date_range(
         end_date: End of date range (inclusive)
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Lot instances within the date range
@@ -491,17 +510,11 @@ def get_by_date_range(
         # Get LOTs from November 2025
         lots = get_by_date_range(db, date(2025, 11, 1), date(2025, 11, 30))
     """
-    return (
-        db.query(Lot)
-        .filter(and_(
-            Lot.production_date >= start_date,
-            Lot.production_date <= end_date
-        ))
-        .order_by(desc(Lot.production_date), desc(Lot.lot_number))
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = db.query(Lot).filter(and_(
+        Lot.production_date >= start_date,
+        Lot.production_date <= end_date
+    ))
+    return keyset.paginate(query, BY_PRODUCTION_DATE, skip, limit, after).all()
 
 
 def get_by_product_model(
@@ -510,6 +523,7 @@ def get_by_product_model(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Lot]:
     """
     Get LOTs by product model.
@@ -522,6 +536,7 @@ def get_by_product_model(
         product_model_id: Product model ID to filter by
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Lot instances for the specified product model
@@ -533,14 +548,8 @@ def get_by_product_model(
         # Get first 50 LOTs for product model 2
         lots = get_by_product_model(db, product_model_id=2, limit=50)
     """
-    return (
-        db.query(Lot)
-        .filter(Lot.product_model_id == product_model_id)
-        .order_by(desc(Lot.production_date), desc(Lot.lot_number))
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = db.query(Lot).filter(Lot.product_model_id == product_model_id)
+    return keyset.paginate(query, BY_PRODUCTION_DATE, skip, limit, after).all()
 
 
 def get_by_status(
@@ -549,6 +558,7 @@ def get_by_status(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
     eager_loading: Literal["minimal", "standard", "full"] = "standard"
 ) -> List[Lot]:
     """
@@ -565,6 +575,7 @@ def get_by_status(
         status: LOT status to filter by (CREATED, IN_PROGRESS, COMPLETED, CLOSED)
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
         eager_loading: Control eager loading depth ("minimal", "standard", "full")
 
     Returns:
@@ -579,13 +590,68 @@ def get_by_status(
         # Get all closed LOTs with minimal loading for listing
         closed = get_by_status(db, LotStatus.CLOSED, limit=50, eager_loading="minimal")
     """
-    query = (
-        db.query(Lot)
-        .filter(Lot.status == status)
-        .order_by(desc(Lot.production_date), desc(Lot.lot_number))
-    )
-    query = _build_optimized_query(query, eager_loading)
-    return query.offset(skip).limit(limit).all()
+    query = _build_optimized_query(db.query(Lot).filter(Lot.status == status), eager_loading)
+    return keyset.paginate(query, BY_PRODUCTION_DATE, skip, limit, after).all()
+
+
+def _rate(row: Dict[str, Any], quantity: str) -> Optional[float]:
+    """Percentage of actual_quantity, as Lot.defect_rate / Lot.pass_rate."""
+    if not row["actual_quantity"]:
+        return None
+    return round((row[quantity] / row["actual_quantity"]) * 100, 2)
+
+
+def _count(model: Any) -> Any:
+    """Correlated count of a LOT's child rows."""
+    return select(func.count(model.id)).where(model.lot_id == Lot.id).scalar_subquery()
+
+
+_ROWS = RowProjection(
+    Lot,
+    LotInDB,
+    nested={"product_model": Lot.product_model, "production_line": Lot.production_line},
+    expressions={"serial_count": _count(Serial), "wip_count": _count(WIPItem)},
+    computed={
+        "defect_rate": lambda row: _rate(row, "failed_quantity"),
+        "pass_rate": lambda row: _rate(row, "passed_quantity"),
+    },
+)
+
+
+def get_multi_rows(
+    db: Session,
+    *,
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get a LOT page as LotInDB-shaped dicts.
+
+    Same filter and ordering as get_multi (or get_by_status when status is
+    given), but selects only the response columns in one statement: product
+    model and production line through LEFT OUTER JOINs, serial and WIP
+    counts as correlated subqueries instead of loading the collections.
+
+    Args:
+        db: SQLAlchemy database session
+        status: Optional LOT status filter
+        skip: Number of records to skip (default: 0)
+        limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
+
+    Returns:
+        List of response rows
+    """
+    statement = _ROWS.select()
+    if status:
+        statement = keyset.paginate(
+            statement.where(Lot.status == status), BY_PRODUCTION_DATE, skip, limit, after
+        )
+    else:
+        statement = keyset.paginate(statement, NEWEST, skip, limit, after)
+    return _ROWS.rows(db, statement)
 
 
 def update_quantities(db: Session, lot_id: int) -> Optional[Lot]:
@@ -22,9 +22,13 @@ from typing import List, Optional, Literal
 from sqlalchemy.orm import Session, selectinload, Query
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from app.core.change_tracker import change_tracker
 from app.models.process import Process, ProcessType
 from app.schemas.process import ProcessCreate, ProcessUpdate
 
+# Count committed process changes for ETag-based conditional GET
+change_tracker.track(Process)
+
 
 class ProcessValidationError(Exception):
     """Custom exception for process validation errors."""
@@ -8,6 +8,7 @@ process type, result status, operator, and date range with advanced query capabi
 Functions:
     - get: Retrieve a single ProcessData record by ID
     - get_multi: Retrieve multiple ProcessData records with pagination
+    - get_multi_rows: Same page as response rows (no ORM hydration)
     - create: Create a new ProcessData record
     - update: Update an existing ProcessData record
     - delete: Delete a ProcessData record
@@ -19,6 +20,10 @@ Functions:
     - get_by_operator: Filter process data by operator
     - get_by_date_range: Filter process data by date range
 
+List functions take ``after`` (a decoded keyset cursor, see app.crud.keyset)
+as an alternative to ``skip``; NEWEST, OLDEST_STARTED and LATEST_STARTED are
+their sort keys.
+
 Key Features:
     - Type-safe with comprehensive type hints
     - Pydantic schema validation for input
@@ -28,11 +33,14 @@ Key Features:
 """
 
 from datetime import datetime
-from typing import List, Optional, Literal, Tuple
+from typing import Any, Dict, List, Optional, Literal, Sequence, Tuple
 
 from sqlalchemy import and_, desc, func, case
 from sqlalchemy.orm import Session, joinedload, selectinload, Query
 
+from app.core.change_tracker import change_tracker
+from app.crud import keyset
+from app.crud.rows import RowProjection
 from app.models.process_data import ProcessData, ProcessResult, DataLevel
 from app.models.process import Process
 from app.models.serial import Serial
@@ -40,7 +48,15 @@ from app.models.lot import Lot
 from app.models.user import User
 from app.models.wip_item import WIPItem, WIPStatus
 from app.models.wip_process_history import WIPProcessHistory
-from app.schemas.process_data import ProcessDataCreate, ProcessDataUpdate
+from app.schemas.process_data import ProcessDataCreate, ProcessDataInDB, ProcessDataUpdate
+
+# Count committed process data changes for ETag-based conditional GET
+change_tracker.track(ProcessData)
+
+# Keyset sort keys: most lists, get_incomplete_processes, get_with_measurements
+NEWEST = [(ProcessData.created_at, True), (ProcessData.id, True)]
+OLDEST_STARTED = [(ProcessData.started_at, False), (ProcessData.id, False)]
+LATEST_STARTED = [(ProcessData.started_at, True), (ProcessData.id, True)]
 
 
 def _build_optimized_query(
@@ -139,6 +155,7 @@ def get_multi(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
     eager_loading: Literal["minimal", "standard", "full"] = "standard"
 ) -> List[ProcessData]:
     """
@@ -156,6 +173,7 @@ def get_multi(
         db: SQLAlchemy Session for database operations
         skip: Number of records to skip (default 0, for pagination)
         limit: Maximum number of records to return (default 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
         eager_loading: Control eager loading depth
 
     Returns:
@@ -169,9 +187,55 @@ def get_multi(
         ...     print(f"Serial: {pd.serial.serial_number}")  # No N+1
         ...     print(f"Process: {pd.process.name}")
     """
-    query = db.query(ProcessData).order_by(desc(ProcessData.created_at))
-    query = _build_optimized_query(query, eager_loading)
-    return query.offset(skip).limit(limit).all()
+    query = _build_optimized_query(db.query(ProcessData), eager_loading)
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
+
+
+def _duration_seconds(row: Dict[str, Any]) -> Optional[int]:
+    """Stored duration, or derived from the timestamps (as ProcessDataInDB does)."""
+    if row["duration_seconds"] is not None:
+        return row["duration_seconds"]
+    if row["started_at"] and row["completed_at"]:
+        return int((row["completed_at"] - row["started_at"]).total_seconds())
+    return None
+
+
+# Response rows, shared with the dynamic filters in app.crud.filters
+ROWS = RowProjection(
+    ProcessData,
+    ProcessDataInDB,
+    nested={
+        "process": ProcessData.process,
+        "operator": ProcessData.operator,
+        "equipment": ProcessData.equipment,
+    },
+    computed={
+        "measurements": lambda row: row["measurements"] or {},
+        "duration_seconds": _duration_seconds,
+    },
+)
+
+
+def get_multi_rows(
+    db: Session, *, skip: int = 0, limit: int = 100, after: Optional[Sequence[Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve the get_multi page as ProcessDataInDB-shaped dicts.
+
+    Selects only the response columns (process, operator and equipment
+    through LEFT OUTER JOINs) in one statement without building ORM
+    objects; return the rows with app.core.responses.trusted_json.
+
+    Args:
+        db: SQLAlchemy Session for database operations
+        skip: Number of records to skip (default 0, for pagination)
+        limit: Maximum number of records to return (default 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
+
+    Returns:
+        List of response rows ordered by creation time (newest first)
+    """
+    return ROWS.rows(db, keyset.paginate(ROWS.select(), NEWEST, skip, limit, after))
 
 
 def create(db: Session, *, obj_in: ProcessDataCreate) -> ProcessData:
@@ -353,7 +417,8 @@ def get_by_serial(
 
 
 def get_by_lot(
-    db: Session, *, lot_id: int, skip: int = 0, limit: int = 100
+    db: Session, *, lot_id: int, skip: int = 0, limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[ProcessData]:
     """
     Get all process data for a specific LOT.
@@ -367,6 +432,7 @@ def get_by_lot(
         lot_id: Primary key of the LOT to fetch process data for
         skip: Number of records to skip for pagination (default 0)
         limit: Maximum number of records to return (default 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of ProcessData objects for the LOT, ordered by creation time
@@ -377,18 +443,16 @@ def get_by_lot(
         >>> lot_data = get_by_lot(db, lot_id=5, limit=200)
         >>> print(f"Total records for LOT: {len(lot_data)}")
     """
-    return (
+    query = (
         db.query(ProcessData)
         .filter(ProcessData.lot_id == lot_id)
-        .order_by(desc(ProcessData.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_process(
-    db: Session, *, process_id: int, skip: int = 0, limit: int = 100
+    db: Session, *, process_id: int, skip: int = 0, limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[ProcessData]:
     """
     Filter process data by process type.
@@ -402,6 +466,7 @@ def get_by_process(
         process_id: Primary key of the process to filter by
         skip: Number of records to skip for pagination (default 0)
         limit: Maximum number of records to return (default 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of ProcessData objects for the specified process
@@ -413,14 +478,11 @@ def get_by_process(
         >>> pass_count = sum(1 for pd in laser_marking_data if pd.result == "PASS")
         >>> print(f"Pass rate: {pass_count}/{len(laser_marking_data)}")
     """
-    return (
+    query = (
         db.query(ProcessData)
         .filter(ProcessData.process_id == process_id)
-        .order_by(desc(ProcessData.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_result(
@@ -428,7 +490,8 @@ def get_by_result(
     *,
     result: str,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[ProcessData]:
     """
     Filter process data by result status.
@@ -441,6 +504,7 @@ def get_by_result(
         result: Result status to filter by ("PASS", "FAIL", or "REWORK")
         skip: Number of records to skip for pagination (default 0)
         limit: Maximum number of records to return (default 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of ProcessData objects with the specified result status
@@ -456,18 +520,16 @@ def get_by_result(
         >>> for pd in failures:
         ...     print(f"Process {pd.process_id}: {pd.defects}")
     """
-    return (
+    query = (
         db.query(ProcessData)
         .filter(ProcessData.result == result)
-        .order_by(desc(ProcessData.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_failures(
-    db: Session, *, skip: int = 0, limit: int = 100
+    db: Session, *, skip: int = 0, limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[ProcessData]:
     """
     Get failed process records for defect analysis.
@@ -480,6 +542,7 @@ def get_failures(
         db: SQLAlchemy Session for database operations
         skip: Number of records to skip for pagination (default 0)
         limit: Maximum number of records to return (default 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of ProcessData objects with result=FAIL
@@ -493,18 +556,16 @@ def get_failures(
         ...     for defect in (pd.defects or []):
         ...         print(f"  - {defect.get('code')}: {defect.get('description')}")
     """
-    return (
+    query = (
         db.query(ProcessData)
         .filter(ProcessData.result == ProcessResult.FAIL.value)
-        .order_by(desc(ProcessData.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_operator(
-    db: Session, *, operator_id: int, skip: int = 0, limit: int = 100
+    db: Session, *, operator_id: int, skip: int = 0, limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[ProcessData]:
     """
     Filter process data by operator.
@@ -518,6 +579,7 @@ def get_by_operator(
         operator_id: Primary key of the operator (user) to filter by
         skip: Number of records to skip for pagination (default 0)
         limit: Maximum number of records to return (default 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of ProcessData objects performed by the specified operator
@@ -530,14 +592,11 @@ def get_by_operator(
         >>> failure_rate = len(failures) / len(operator_records) if operator_records else 0
         >>> print(f"Operator failure rate: {failure_rate:.2%}")
     """
-    return (
+    query = (
         db.query(ProcessData)
         .filter(ProcessData.operator_id == operator_id)
-        .order_by(desc(ProcessData.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_date_range(
@@ -546,7 +605,8 @@ def get_by_date_range(
     start_date: datetime,
     end_date: datetime,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[ProcessData]:
     """
     Filter process data by date range.
@@ -561,6 +621,7 @@ def get_by_date_range(
         end_date: End of date range (inclusive) for filtering
         skip: Number of records to skip for pagination (default 0)
         limit: Maximum number of records to return (default 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of ProcessData objects within the date range, ordered by creation time
@@ -575,7 +636,7 @@ def get_by_date_range(
         >>> today_data = get_by_date_range(db, start_date=start, end_date=end)
         >>> print(f"Records created today: {len(today_data)}")
     """
-    return (
+    query = (
         db.query(ProcessData)
         .filter(
             and_(
@@ -583,11 +644,8 @@ def get_by_date_range(
                 ProcessData.started_at <= end_date
             )
         )
-        .order_by(desc(ProcessData.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_serial_and_process(
@@ -710,7 +768,8 @@ def get_failures_by_process(
     *,
     process_id: int,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[ProcessData]:
     """
     Get failed process records for a specific process.
@@ -723,6 +782,7 @@ def get_failures_by_process(
         process_id: Primary key of the process to analyze
         skip: Number of records to skip for pagination (default 0)
         limit: Maximum number of records to return (default 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of ProcessData objects with result=FAIL for the specified process
@@ -739,7 +799,7 @@ def get_failures_by_process(
         >>> most_common = max(defect_counts.items(), key=lambda x: x[1])
         >>> print(f"Most common defect: {most_common[0]} ({most_common[1]} occurrences)")
     """
-    return (
+    query = (
         db.query(ProcessData)
         .filter(
             and_(
@@ -747,15 +807,13 @@ def get_failures_by_process(
                 ProcessData.result == ProcessResult.FAIL.value
             )
         )
-        .order_by(desc(ProcessData.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_incomplete_processes(
-    db: Session, *, skip: int = 0, limit: int = 100
+    db: Session, *, skip: int = 0, limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[ProcessData]:
     """
     Get in-progress process records (not yet completed).
@@ -767,6 +825,7 @@ def get_incomplete_processes(
         db: SQLAlchemy Session for database operations
         skip: Number of records to skip for pagination (default 0)
         limit: Maximum number of records to return (default 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of ProcessData objects with completed_at=NULL
@@ -780,14 +839,11 @@ def get_incomplete_processes(
         ...     elapsed = (datetime.utcnow() - pd.started_at).total_seconds()
         ...     print(f"Serial {pd.serial_id}: {elapsed:.0f} seconds elapsed")
     """
-    return (
+    query = (
         db.query(ProcessData)
         .filter(ProcessData.completed_at.is_(None))
-        .order_by(ProcessData.started_at.asc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, OLDEST_STARTED, skip, limit, after).all()
 
 
 def count_by_result(db: Session, *, result: str) -> int:
@@ -879,6 +935,8 @@ def get_with_measurements(
     result: Optional[str] = None,
     skip: int = 0,
     limit: int = 50,
+    after: Optional[Sequence[Any]] = None,
+    approximate_total: bool = False,
     eager_loading: Literal["minimal", "standard", "full"] = "standard"
 ) -> Tuple[List[ProcessData], int]:
     """
@@ -898,6 +956,9 @@ def get_with_measurements(
         result: Filter by result status (PASS, FAIL, REWORK)
         skip: Number of records to skip for pagination (default 0)
         limit: Maximum number of records to return (default 50)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
+        approximate_total: Return the planner's row estimate as the total
+            (PostgreSQL) instead of counting every matching row
         eager_loading: Control eager loading depth
 
     Returns:
@@ -935,17 +996,11 @@ def get_with_measurements(
         base_query = base_query.filter(ProcessData.result == result)
 
     # Get total count before pagination
-    total_count = base_query.count()
+    total_count = keyset.count(db, base_query.statement, approximate=approximate_total)
 
     # Apply eager loading and pagination
     query = _build_optimized_query(base_query, eager_loading)
-    records = (
-        query
-        .order_by(desc(ProcessData.started_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    records = keyset.paginate(query, LATEST_STARTED, skip, limit, after).all()
 
     return records, total_count
 
@@ -1153,6 +1208,7 @@ def get_wip_measurements(
     result_filter: Optional[str] = None,
     skip: int = 0,
     limit: int = 50,
+    approximate_total: bool = False,
 ) -> Tuple[List[WIPProcessHistory], int]:
     """
     Get measurement data from wip_process_history for Serial-converted WIPs.
@@ -1169,6 +1225,8 @@ def get_wip_measurements(
         result_filter: Filter by result (PASS, FAIL)
         skip: Pagination offset
         limit: Maximum records to return
+        approximate_total: Return the planner's row estimate as the total
+            (PostgreSQL) instead of counting every matching row
 
     Returns:
         Tuple of (List of WIPProcessHistory records, total count)
@@ -1219,7 +1277,7 @@ def get_wip_measurements(
         base_query = base_query.filter(WIPProcessHistory.result == result_filter)
 
     # Get total count before pagination
-    total_count = base_query.count()
+    total_count = keyset.count(db, base_query.statement, approximate=approximate_total)
 
     # Apply eager loading for relationships
     query = base_query.options(
@@ -22,12 +22,15 @@ Functions:
     get_by_station: Get all headers for a station
     get_by_batch: Get all headers for a batch
     get_stats: Get statistics for headers
+    add_counts: Atomically add to a header's counters
+    increment_counts: Atomically add one result to a header's counters
 """
 
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any, Tuple
 
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import Integer, and_, column, desc, func, insert, literal, or_, select, values
+from sqlalchemy import update as sql_update
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
@@ -140,10 +143,35 @@ def get_used_slots(db: Session, station_id: str) -> List[int]:
     return [r[0] for r in results]
 
 
+MAX_SLOTS = 12
+
+# Each lost claim means another header took a slot, so this bounds retries
+_SLOT_CLAIM_ATTEMPTS = MAX_SLOTS
+
+
+def _free_slot_query(station_id: str):
+    """Select the lowest slot (1-12) without an OPEN header at the station."""
+    slots = values(column("slot", Integer), name="slots").data(
+        [(slot,) for slot in range(1, MAX_SLOTS + 1)]
+    )
+    used = (
+        select(ProcessHeader.id)
+        .where(
+            ProcessHeader.station_id == station_id,
+            ProcessHeader.status == HeaderStatus.OPEN.value,
+            ProcessHeader.slot_id == slots.c.slot,
+        )
+        .exists()
+    )
+    return select(func.min(slots.c.slot)).where(~used).scalar_subquery()
+
+
 def get_available_slot(db: Session, station_id: str) -> Optional[int]:
     """
     Get the lowest available slot ID for a station.
 
+    Informational only: use open_or_get to claim a slot atomically.
+
     Args:
         db: SQLAlchemy database session
         station_id: Station identifier
@@ -151,11 +179,50 @@ def get_available_slot(db: Session, station_id: str) -> Optional[int]:
     Returns:
         Lowest available slot ID (1-12), or None if all slots are occupied
     """
-    used_slots = set(get_used_slots(db, station_id))
-    for slot in range(1, 13):  # 1-12
-        if slot not in used_slots:
-            return slot
-    return None
+    return db.execute(select(_free_slot_query(station_id))).scalar()
+
+
+def _claim_slot(db: Session, header_in: ProcessHeaderOpen) -> Optional[int]:
+    """
+    Insert an OPEN header into the lowest free slot in one INSERT ... SELECT.
+
+    Two concurrent claims of the same slot are rejected by the unique
+    partial index uk_process_headers_station_slot.
+
+    Returns:
+        ID of the inserted header, or None if all slots are occupied
+
+    Raises:
+        IntegrityError: If a concurrent insert took the slot or the
+            station+batch+process combination
+    """
+    table = ProcessHeader.__table__
+    free_slot = _free_slot_query(header_in.station_id).label("slot_id")
+    row = {
+        "station_id": header_in.station_id,
+        "batch_id": header_in.batch_id,
+        "process_id": header_in.process_id,
+        "sequence_package": header_in.sequence_package,
+        "sequence_version": header_in.sequence_version,
+        "parameters": header_in.parameters or {},
+        "hardware_config": header_in.hardware_config or {},
+        "status": HeaderStatus.OPEN.value,
+        "opened_at": datetime.now(timezone.utc),
+    }
+    candidate = select(
+        *(literal(value, table.c[name].type).label(name) for name, value in row.items()),
+        free_slot,
+    ).subquery()
+
+    statement = (
+        insert(ProcessHeader)
+        .from_select(
+            [*row, "slot_id"],
+            select(candidate).where(candidate.c.slot_id.isnot(None)),
+        )
+        .returning(ProcessHeader.id)
+    )
+    return db.execute(statement).scalar()
 
 
 def get_open(
@@ -267,22 +334,14 @@ def open_or_get(db: Session, header_in: ProcessHeaderOpen) -> Tuple[ProcessHeade
     if existing:
         return existing, False
 
-    # Determine slot_id
-    slot_id = header_in.slot_id
-    if slot_id is None:
-        # Auto-assign to lowest available slot
-        slot_id = get_available_slot(db, header_in.station_id)
-        if slot_id is None:
-            raise ValueError(
-                f"All 12 slots are occupied for station '{header_in.station_id}'. "
-                f"Close an existing header to free up a slot."
-            )
+    if header_in.slot_id is None:
+        return _open_in_free_slot(db, header_in)
 
-    # Create new header
+    # Create new header in the requested slot
     db_header = ProcessHeader(
         station_id=header_in.station_id,
         batch_id=header_in.batch_id,
-        slot_id=slot_id,
+        slot_id=header_in.slot_id,
         process_id=header_in.process_id,
         sequence_package=header_in.sequence_package,
         sequence_version=header_in.sequence_version,
@@ -312,6 +371,38 @@ def open_or_get(db: Session, header_in: ProcessHeaderOpen) -> Tuple[ProcessHeade
     return db_header, True
 
 
+def _open_in_free_slot(db: Session, header_in: ProcessHeaderOpen) -> Tuple[ProcessHeader, bool]:
+    """Open a header in the lowest free slot, retrying lost slot races."""
+    attempts = 0
+    while True:
+        try:
+            header_id = _claim_slot(db, header_in)
+            db.commit()
+            break
+        except IntegrityError:
+            db.rollback()
+            # Race condition: another header was created, try to get it
+            existing = get_open(
+                db,
+                station_id=header_in.station_id,
+                batch_id=header_in.batch_id,
+                process_id=header_in.process_id,
+            )
+            if existing:
+                return existing, False
+            # Otherwise the slot was claimed concurrently: claim the next one
+            attempts += 1
+            if attempts >= _SLOT_CLAIM_ATTEMPTS:
+                raise
+
+    if header_id is None:
+        raise ValueError(
+            f"All 12 slots are occupied for station '{header_in.station_id}'. "
+            f"Close an existing header to free up a slot."
+        )
+    return get(db, header_id), True
+
+
 def close(db: Session, header_id: int) -> Optional[ProcessHeader]:
     """
     Close an open header.
@@ -579,90 +670,105 @@ def get_stats(
         - by_station: Stats grouped by station_id
         - by_process: Stats grouped by process_id
     """
-    query = db.query(ProcessHeader)
-
-    # Apply filters
+    conditions = []
     if station_id:
-        query = query.filter(ProcessHeader.station_id == station_id)
+        conditions.append(ProcessHeader.station_id == station_id)
     if process_id:
-        query = query.filter(ProcessHeader.process_id == process_id)
+        conditions.append(ProcessHeader.process_id == process_id)
     if opened_after:
-        query = query.filter(ProcessHeader.opened_at >= opened_after)
+        conditions.append(ProcessHeader.opened_at >= opened_after)
     if opened_before:
-        query = query.filter(ProcessHeader.opened_at <= opened_before)
-
-    # Get all matching headers
-    headers = query.all()
-
-    # Calculate stats
-    total_headers = len(headers)
-    open_headers = sum(1 for h in headers if h.status == HeaderStatus.OPEN.value)
-    closed_headers = sum(1 for h in headers if h.status == HeaderStatus.CLOSED.value)
-    cancelled_headers = sum(1 for h in headers if h.status == HeaderStatus.CANCELLED.value)
-    total_items = sum(h.total_count for h in headers)
-    total_pass = sum(h.pass_count for h in headers)
-    total_fail = sum(h.fail_count for h in headers)
-
-    overall_pass_rate = (total_pass / total_items * 100) if total_items > 0 else 0.0
-
-    # Group by station
-    by_station: Dict[str, Dict[str, Any]] = {}
-    for h in headers:
-        if h.station_id not in by_station:
-            by_station[h.station_id] = {
-                "total_headers": 0,
-                "total_items": 0,
-                "pass_count": 0,
-                "fail_count": 0,
-            }
-        by_station[h.station_id]["total_headers"] += 1
-        by_station[h.station_id]["total_items"] += h.total_count
-        by_station[h.station_id]["pass_count"] += h.pass_count
-        by_station[h.station_id]["fail_count"] += h.fail_count
-
-    # Calculate pass rates for each station
-    for station_stats in by_station.values():
-        items = station_stats["total_items"]
-        station_stats["pass_rate"] = (
-            (station_stats["pass_count"] / items * 100) if items > 0 else 0.0
-        )
+        conditions.append(ProcessHeader.opened_at <= opened_before)
 
-    # Group by process
-    by_process: Dict[int, Dict[str, Any]] = {}
-    for h in headers:
-        if h.process_id not in by_process:
-            by_process[h.process_id] = {
-                "total_headers": 0,
-                "total_items": 0,
-                "pass_count": 0,
-                "fail_count": 0,
+    totals = (
+        func.count(ProcessHeader.id).label("total_headers"),
+        func.coalesce(func.sum(ProcessHeader.total_count), 0).label("total_items"),
+        func.coalesce(func.sum(ProcessHeader.pass_count), 0).label("pass_count"),
+        func.coalesce(func.sum(ProcessHeader.fail_count), 0).label("fail_count"),
+    )
+
+    # Overall counts, one pass with FILTER clauses per status
+    overall = db.execute(
+        select(
+            *totals,
+            *(
+                func.count(ProcessHeader.id)
+                .filter(ProcessHeader.status == header_status.value)
+                .label(header_status.value)
+                for header_status in HeaderStatus
+            ),
+        ).where(*conditions)
+    ).one()
+
+    def grouped(key) -> Dict[Any, Dict[str, Any]]:
+        rows = db.execute(select(key, *totals).where(*conditions).group_by(key))
+        return {
+            row[0]: {
+                "total_headers": row.total_headers,
+                "total_items": row.total_items,
+                "pass_count": row.pass_count,
+                "fail_count": row.fail_count,
+                "pass_rate": _pass_rate(row.pass_count, row.total_items),
             }
-        by_process[h.process_id]["total_headers"] += 1
-        by_process[h.process_id]["total_items"] += h.total_count
-        by_process[h.process_id]["pass_count"] += h.pass_count
-        by_process[h.process_id]["fail_count"] += h.fail_count
-
-    # Calculate pass rates for each process
-    for process_stats in by_process.values():
-        items = process_stats["total_items"]
-        process_stats["pass_rate"] = (
-            (process_stats["pass_count"] / items * 100) if items > 0 else 0.0
-        )
+            for row in rows
+        }
 
     return {
-        "total_headers": total_headers,
-        "open_headers": open_headers,
-        "closed_headers": closed_headers,
-        "cancelled_headers": cancelled_headers,
-        "total_items_processed": total_items,
-        "total_pass": total_pass,
-        "total_fail": total_fail,
-        "overall_pass_rate": round(overall_pass_rate, 2),
-        "by_station": by_station,
-        "by_process": by_process,
+        "total_headers": overall.total_headers,
+        "open_headers": overall.OPEN,
+        "closed_headers": overall.CLOSED,
+        "cancelled_headers": overall.CANCELLED,
+        "total_items_processed": overall.total_items,
+        "total_pass": overall.pass_count,
+        "total_fail": overall.fail_count,
+        "overall_pass_rate": round(_pass_rate(overall.pass_count, overall.total_items), 2),
+        "by_station": grouped(ProcessHeader.station_id),
+        "by_process": grouped(ProcessHeader.process_id),
     }
 
 
+def _pass_rate(passed: int, total: int) -> float:
+    return (passed / total * 100) if total > 0 else 0.0
+
+
+def add_counts(
+    db: Session,
+    header_id: int,
+    *,
+    total: int,
+    passed: int = 0,
+    failed: int = 0,
+) -> Optional[ProcessHeader]:
+    """
+    Add to a header's counters with one atomic UPDATE ... RETURNING.
+
+    The increment happens in the database, so concurrent completions in
+    the same session never lose updates. Does not commit.
+
+    Args:
+        db: SQLAlchemy database session
+        header_id: ID of the header
+        total: Amount added to total_count
+        passed: Amount added to pass_count
+        failed: Amount added to fail_count
+
+    Returns:
+        Updated ProcessHeader instance if found, None otherwise
+    """
+    statement = (
+        sql_update(ProcessHeader)
+        .where(ProcessHeader.id == header_id)
+        .values(
+            total_count=ProcessHeader.total_count + total,
+            pass_count=ProcessHeader.pass_count + passed,
+            fail_count=ProcessHeader.fail_count + failed,
+        )
+        .returning(ProcessHeader)
+        .execution_options(populate_existing=True)
+    )
+    return db.scalars(statement).one_or_none()
+
+
 def increment_counts(
     db: Session,
     header_id: int,
@@ -671,8 +777,8 @@ def increment_counts(
     """
     Increment the counts for a header based on process result.
 
-    Note: This is typically handled by database triggers, but can be
-    called manually if needed.
+    Note: This is typically handled by database triggers on process_data
+    and wip_process_history, but can be called manually if needed.
 
     Args:
         db: SQLAlchemy database session
@@ -682,21 +788,18 @@ def increment_counts(
     Returns:
         Updated ProcessHeader instance if successful, None if not found
     """
-    db_header = get(db, header_id)
-
-    if not db_header:
-        return None
-
-    db_header.total_count += 1
-    if result.upper() == "PASS":
-        db_header.pass_count += 1
-    elif result.upper() == "FAIL":
-        db_header.fail_count += 1
-    # REWORK counts as total but not pass or fail
+    result = result.upper()
 
     try:
+        # REWORK counts as total but not pass or fail
+        db_header = add_counts(
+            db,
+            header_id,
+            total=1,
+            passed=int(result == "PASS"),
+            failed=int(result == "FAIL"),
+        )
         db.commit()
-        db.refresh(db_header)
     except SQLAlchemyError:
         db.rollback()
         raise
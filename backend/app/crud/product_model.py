@@ -24,6 +24,7 @@ All operations include:
 from typing import Optional, List, Literal
 from sqlalchemy.orm import Session, selectinload, joinedload, Query
 
+from app.core.change_tracker import change_tracker
 from app.models import ProductModel
 from app.schemas.product_model import (
     ProductModelCreate,
@@ -31,6 +32,9 @@ from app.schemas.product_model import (
     ProductStatusEnum,
 )
 
+# Count committed product model changes for ETag-based conditional GET
+change_tracker.track(ProductModel)
+
 
 def _build_optimized_query(
     query: Query,
@@ -23,9 +23,13 @@ from sqlalchemy import and_, desc
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from app.core.change_tracker import change_tracker
 from app.models.production_line import ProductionLine
 from app.schemas.production_line import ProductionLineCreate, ProductionLineUpdate
 
+# Count committed production line changes for ETag-based conditional GET
+change_tracker.track(ProductionLine)
+
 
 def get(db: Session, production_line_id: int) -> Optional[ProductionLine]:
     """
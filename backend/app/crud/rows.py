@@ -0,0 +1,129 @@
+"""
+Row projections: read response-shaped dicts without ORM hydration.
+
+Listing through the ORM builds one mapped object per row (plus one per
+eagerly loaded relationship) that is only used to feed a response schema.
+A RowProjection selects exactly the columns a response schema needs,
+loads to-one relationships through LEFT OUTER JOINs in the same statement
+and returns plain dicts in the schema's shape, ready for
+``app.core.responses.trusted_json``.
+
+Example:
+    >>> LOT_ROWS = RowProjection(
+    ...     Lot, LotInDB,
+    ...     nested={"product_model": Lot.product_model},
+    ... )
+    >>> statement = LOT_ROWS.select().order_by(Lot.id.desc()).limit(500)
+    >>> rows = LOT_ROWS.rows(db, statement)
+"""
+
+import types
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, aliased
+
+_NESTED_SEPARATOR = "__"
+
+
+def _nested_schema(schema: Type[BaseModel], field: str) -> Type[BaseModel]:
+    """Resolve the schema of a nested field (unwrapping Optional[...])."""
+    annotation = schema.model_fields[field].annotation
+    if get_origin(annotation) in (Union, types.UnionType):
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+        raise TypeError(f"{schema.__name__}.{field} is not a nested schema")
+    return annotation
+
+
+class RowProjection:
+    """
+    Column projection of a mapped model onto a response schema.
+
+    Every schema field is filled from, in order of precedence:
+        - nested: a to-one relationship, as a nested dict (or None)
+        - expressions: a SQL expression (e.g. a correlated count)
+        - the model column of the same name
+        - the schema field's default
+
+    computed functions run last on the assembled row; they fill fields
+    with no column or replace a selected value (e.g. derive a NULL).
+
+    Args:
+        model: Mapped model class to select from
+        schema: Response schema the rows must match
+        nested: Field name -> relationship attribute (to-one)
+        expressions: Field name -> SQL expression
+        computed: Field name -> function(row) -> value
+
+    Raises:
+        TypeError: If a required schema field has no source
+    """
+
+    def __init__(
+        self,
+        model: Type[Any],
+        schema: Type[BaseModel],
+        *,
+        nested: Optional[Dict[str, Any]] = None,
+        expressions: Optional[Dict[str, Any]] = None,
+        computed: Optional[Dict[str, Callable[[Dict[str, Any]], Any]]] = None,
+    ):
+        self.model = model
+        self.schema = schema
+        self.computed = computed or {}
+        nested = nested or {}
+        expressions = expressions or {}
+        table_columns = model.__table__.c
+
+        self._columns: List[Any] = []
+        self._joins: List[tuple] = []
+        self._nested: List[tuple] = []
+        self._defaults: Dict[str, Any] = {}
+
+        for name, field in schema.model_fields.items():
+            if name in nested:
+                relationship = nested[name]
+                target = aliased(relationship.property.mapper.class_)
+                fields = list(_nested_schema(schema, name).model_fields)
+                self._joins.append((target, relationship.of_type(target)))
+                self._columns.extend(
+                    getattr(target, column).label(f"{name}{_NESTED_SEPARATOR}{column}")
+                    for column in fields
+                )
+                self._nested.append((name, fields))
+            elif name in expressions:
+                self._columns.append(expressions[name].label(name))
+            elif name in table_columns:
+                self._columns.append(table_columns[name].label(name))
+            elif name in self.computed:
+                continue
+            elif field.is_required():
+                raise TypeError(f"No source for required field {schema.__name__}.{name}")
+            else:
+                self._defaults[name] = field.get_default(call_default_factory=True)
+
+    def select(self) -> Select:
+        """Build the SELECT statement; add filters, ordering and paging to it."""
+        statement = select(*self._columns).select_from(self.model)
+        for target, onclause in self._joins:
+            statement = statement.outerjoin(target, onclause)
+        return statement
+
+    def to_dict(self, row: Mapping[str, Any]) -> Dict[str, Any]:
+        """Assemble one result row into the schema's shape."""
+        data = dict(row)
+        for name, fields in self._nested:
+            values = {field: data.pop(f"{name}{_NESTED_SEPARATOR}{field}") for field in fields}
+            data[name] = values if values.get("id") is not None else None
+        data.update(self._defaults)
+        for name, compute in self.computed.items():
+            data[name] = compute(data)
+        return data
+
+    def rows(
+        self, db: Session, statement: Select, params: Optional[Mapping[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a statement built from select() and return response rows."""
+        return [self.to_dict(row) for row in db.execute(statement, params).mappings()]
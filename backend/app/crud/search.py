@@ -1,109 +1,231 @@
-from typing import List, Optional, Type
+"""
+Search over process data notes and LOT / serial / WIP identifiers.
+
+Notes are matched against the stored ``process_data.notes_tsv`` column
+(GIN indexed) on PostgreSQL and against the ``process_data_fts`` FTS5 shadow
+table on SQLite (see app.models.search_index). Identifiers are matched by
+substring with ILIKE, which PostgreSQL answers from the pg_trgm indexes.
+
+Results are ranked (ts_rank / bm25 for notes, trigram similarity for
+identifiers) and paginated with an opaque keyset cursor over
+(rank DESC, type, id DESC), so later pages cost the same as the first.
+
+Functions:
+    search: Ranked search across entity types with keyset pagination
+    search_process_data: Ranked notes search returning ProcessData rows
+
+Dynamic filter expressions live in app.crud.filters.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Float, and_, cast, column, func, literal, literal_column, or_, select, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Session
-from sqlalchemy import text, func, desc, asc
-from sqlalchemy.ext.declarative import DeclarativeMeta
 
+from app.crud.keyset import decode_cursor, encode_cursor
+from app.models.lot import Lot
 from app.models.process_data import ProcessData
-from app.schemas.search import SearchFilters, FilterExpression
+from app.models.search_index import NOTES_FTS_TABLE, NOTES_TSV_COLUMN
+from app.models.serial import Serial
+from app.models.wip_item import WIPItem
+from app.schemas.search import SearchFilters
 
-def search_process_data(
-    db: Session,
-    query: str,
-    filters: Optional[SearchFilters] = None
-):
+# Entity types in tie-break order
+SEARCH_TYPES = ("process_data", "lot", "serial", "wip")
+
+_IDENTIFIERS = {
+    "lot": (Lot.id, Lot.lot_number),
+    "serial": (Serial.id, Serial.serial_number),
+    "wip": (WIPItem.id, WIPItem.wip_id),
+}
+
+_NOTES_TSV = literal_column(f"process_data.{NOTES_TSV_COLUMN}", TSVECTOR)
+_NOTES_FTS = table(NOTES_FTS_TABLE, column("rowid"))
+
+Cursor = Tuple[float, str, int]
+
+
+def _decode_position(cursor: str) -> Cursor:
     """
-    Full-text search across process data notes/metadata.
-    Uses PostgreSQL to_tsvector/plainto_tsquery.
+    Decode a search cursor: (rank, type, id) of the previous page's last hit.
+
+    Raises:
+        ValueError: If the cursor is malformed
     """
-    # Base query
-    search_query = db.query(ProcessData)
-    
-    # Apply Full-Text Search if query is provided
-    if query and len(query.strip()) > 0:
-        # Note: This assumes 'notes' or similar text field exists and is indexed.
-        # If notes is JSONB or not indexed, this might be slow or need adjustment.
-        # For now, we'll use a simple ILIKE for compatibility if TS vector isn't set up,
-        # or try the TS syntax if we assume Postgres.
-        
-        # Using simple ILIKE for broader compatibility in this phase without migration
-        # search_query = search_query.filter(ProcessData.notes.ilike(f"%{query}%"))
-        
-        # Proper Postgres TS Search (commented out until migration adds index)
-        search_query = search_query.filter(
-            func.to_tsvector('english', func.coalesce(ProcessData.notes, ''))
-            .match(func.plainto_tsquery('english', query))
+    rank, entity_type, entity_id = decode_cursor(cursor, 3)
+    if entity_type not in SEARCH_TYPES or not isinstance(rank, (int, float)) or not isinstance(entity_id, int):
+        raise ValueError("Invalid cursor")
+    return float(rank), entity_type, entity_id
+
+
+def _is_sqlite(db: Session) -> bool:
+    return db.get_bind().dialect.name == "sqlite"
+
+
+def _after(rank, id_column, entity_type: str, cursor: Optional[Cursor]):
+    """Keyset predicate: rows of entity_type ordered after the cursor."""
+    if cursor is None:
+        return None
+    cursor_rank, cursor_type, cursor_id = cursor
+    position = SEARCH_TYPES.index(entity_type) - SEARCH_TYPES.index(cursor_type)
+    if position < 0:
+        return rank < cursor_rank
+    if position > 0:
+        return rank <= cursor_rank
+    return or_(rank < cursor_rank, and_(rank == cursor_rank, id_column < cursor_id))
+
+
+def _page(db: Session, statement, rank, id_column, entity_type: str, cursor: Optional[Cursor], limit: int):
+    """Execute a ranked statement after the cursor, fetching one extra row."""
+    predicate = _after(rank, id_column, entity_type, cursor)
+    if predicate is not None:
+        statement = statement.where(predicate)
+    return db.execute(statement.order_by(rank.desc(), id_column.desc()).limit(limit + 1)).all()
+
+
+def _fts_query(query: str) -> str:
+    """Quote every term so FTS5 treats user input as an implicit AND, like plainto_tsquery."""
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in query.split())
+
+
+def _like_pattern(query: str) -> str:
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _notes_select(db: Session, query: Optional[str], *columns):
+    """Select columns plus a notes rank, restricted to rows matching the query."""
+    if not query or not query.strip():
+        rank = literal(0.0, Float)
+        return select(*columns, rank.label("rank")), rank
+
+    if _is_sqlite(db):
+        fts = literal_column(NOTES_FTS_TABLE)
+        rank = -func.bm25(fts)
+        statement = (
+            select(*columns, rank.label("rank"))
+            .join_from(ProcessData, _NOTES_FTS, ProcessData.id == _NOTES_FTS.c.rowid)
+            .where(fts.op("MATCH")(_fts_query(query)))
         )
+        return statement, rank
+
+    tsquery = func.plainto_tsquery("english", query)
+    # double precision so cursor ranks compare exactly
+    rank = cast(func.ts_rank(_NOTES_TSV, tsquery), Float(precision=53))
+    statement = select(*columns, rank.label("rank")).where(_NOTES_TSV.op("@@")(tsquery))
+    return statement, rank
+
+
+def _apply_filters(statement, filters: Optional[SearchFilters]):
+    if not filters:
+        return statement
+    if filters.process_id:
+        statement = statement.where(ProcessData.process_id == filters.process_id)
+    if filters.result:
+        statement = statement.where(ProcessData.result == filters.result)
+    if filters.date_range:
+        statement = statement.where(
+            ProcessData.created_at.between(filters.date_range.start, filters.date_range.end)
+        )
+    return statement
+
+
+def _identifier_hits(db: Session, entity_type: str, query: str, cursor: Optional[Cursor], limit: int) -> List[Dict]:
+    id_column, identifier = _IDENTIFIERS[entity_type]
+    if _is_sqlite(db):
+        # Shorter identifiers containing the query share a larger part of it
+        rank = cast(len(query), Float) / func.length(identifier)
+    else:
+        rank = cast(func.similarity(identifier, query), Float(precision=53))
+    statement = select(id_column, identifier, rank.label("rank")).where(
+        identifier.ilike(_like_pattern(query), escape="\\")
+    )
+    rows = _page(db, statement, rank, id_column, entity_type, cursor, limit)
+    return [{"type": entity_type, "id": row[0], "label": row[1], "rank": row.rank} for row in rows]
 
-    # Apply additional static filters
-    if filters:
-        if filters.process_id:
-            search_query = search_query.filter(
-                ProcessData.process_id == filters.process_id
-            )
-        if filters.result:
-            search_query = search_query.filter(
-                ProcessData.result == filters.result
-            )
-        if filters.date_range:
-            search_query = search_query.filter(
-                ProcessData.created_at.between(
-                    filters.date_range.start,
-                    filters.date_range.end
-                )
-            )
-
-    return search_query.limit(100).all()
-
-def apply_dynamic_filters(
-    db: Session, 
-    model: Type[DeclarativeMeta], 
-    filters: List[FilterExpression],
-    sort_by: Optional[str] = None,
-    sort_order: str = "asc",
-    limit: int = 100
-):
+
+def _notes_hits(db: Session, query: str, cursor: Optional[Cursor], limit: int) -> List[Dict]:
+    statement, rank = _notes_select(db, query, ProcessData.id, ProcessData.notes)
+    rows = _page(db, statement, rank, ProcessData.id, "process_data", cursor, limit)
+    return [{"type": "process_data", "id": row.id, "label": row.notes, "rank": row.rank} for row in rows]
+
+
+def search(
+    db: Session,
+    query: str,
+    types: Optional[Sequence[str]] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
     """
-    Build query from dynamic filters list.
+    Ranked search across process data notes and LOT / serial / WIP identifiers.
+
+    Each entity type contributes at most limit + 1 hits after the cursor; the
+    merged hits are ordered by (rank DESC, type, id DESC) and cut to limit.
+
+    Args:
+        db: Database session
+        query: Search text (notes terms or identifier substring)
+        types: Entity types to search (default: all of SEARCH_TYPES)
+        limit: Maximum number of hits to return
+        cursor: next_cursor of the previous page
+
+    Returns:
+        Dictionary with items (type, id, label, rank) and next_cursor
+
+    Raises:
+        ValueError: If a type is unknown or the cursor is malformed
     """
-    query = db.query(model)
+    types = list(types or SEARCH_TYPES)
+    unknown = set(types) - set(SEARCH_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown search types: {', '.join(sorted(unknown))}")
+    position = _decode_position(cursor) if cursor else None
 
-    for filter_expr in filters:
-        if not hasattr(model, filter_expr.field):
+    hits: List[Dict] = []
+    for entity_type in SEARCH_TYPES:
+        if entity_type not in types:
             continue
-            
-        column = getattr(model, filter_expr.field)
-        val = filter_expr.value
-        op = filter_expr.operator
-        
-        if op == "eq":
-            query = query.filter(column == val)
-        elif op == "neq":
-            query = query.filter(column != val)
-        elif op == "gt":
-            query = query.filter(column > val)
-        elif op == "gte":
-            query = query.filter(column >= val)
-        elif op == "lt":
-            query = query.filter(column < val)
-        elif op == "lte":
-            query = query.filter(column <= val)
-        elif op == "contains":
-            query = query.filter(column.contains(val))
-        elif op == "icontains":
-            query = query.filter(column.ilike(f"%{val}%"))
-        elif op == "in":
-            query = query.filter(column.in_(val))
-        elif op == "startswith":
-            query = query.filter(column.startswith(val))
-        elif op == "endswith":
-            query = query.filter(column.endswith(val))
-
-    # Sorting
-    if sort_by and hasattr(model, sort_by):
-        sort_col = getattr(model, sort_by)
-        if sort_order.lower() == "desc":
-            query = query.order_by(desc(sort_col))
+        if entity_type == "process_data":
+            hits.extend(_notes_hits(db, query, position, limit))
         else:
-            query = query.order_by(asc(sort_col))
-            
-    return query.limit(limit).all()
+            hits.extend(_identifier_hits(db, entity_type, query, position, limit))
+
+    hits.sort(key=lambda hit: (-hit["rank"], SEARCH_TYPES.index(hit["type"]), -hit["id"]))
+    page = hits[:limit]
+    next_cursor = None
+    if len(hits) > limit:
+        last = page[-1]
+        next_cursor = encode_cursor(last["rank"], last["type"], last["id"])
+    return {"items": page, "next_cursor": next_cursor}
+
+
+def search_process_data(
+    db: Session,
+    query: Optional[str],
+    filters: Optional[SearchFilters] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Tuple[List[ProcessData], Optional[str]]:
+    """
+    Ranked full-text search over process data notes with basic filters.
+
+    Without a query, rows matching the filters are returned newest first.
+
+    Returns:
+        Tuple of (ProcessData rows, next_cursor or None)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    position = _decode_position(cursor) if cursor else None
+    statement, rank = _notes_select(db, query, ProcessData)
+    statement = _apply_filters(statement, filters)
+    rows = _page(db, statement, rank, ProcessData.id, "process_data", position, limit)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].rank, "process_data", rows[-1][0].id)
+    return [row[0] for row in rows], next_cursor
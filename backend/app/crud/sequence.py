@@ -14,6 +14,7 @@ from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.change_tracker import change_tracker
 from app.models.sequence import Sequence, SequenceDeployment, SequenceVersion
 from app.schemas.sequence import (
     SequenceCreate,
@@ -22,6 +23,11 @@ from app.schemas.sequence import (
     SequenceUpdate,
 )
 
+# Count committed sequence changes for ETag-based conditional GET
+change_tracker.track(Sequence)
+change_tracker.track(SequenceVersion)
+change_tracker.track(SequenceDeployment)
+
 
 class SequenceCRUD:
     """CRUD operations for sequences."""
@@ -0,0 +1,134 @@
+"""
+CRUD operations for sequence counters (LOT / WIP / serial numbering).
+
+Next numbers used to be derived by scanning the numbered table (``LIKE``
+prefix search, ``ORDER BY ... DESC LIMIT 1``, ``COUNT(*) + 1``), which gets
+slower as tables grow and lets concurrent writers pick the same number
+until a unique constraint rejects one of them.
+
+Here every scope has one counter row that is advanced with a single
+``UPDATE ... SET last_value = last_value + n RETURNING last_value``. The
+row lock is held until the caller's transaction ends, so:
+    - concurrent allocators of a scope queue on one row instead of retrying
+    - numbers are collision-free
+    - numbering is gap-free, because a rolled-back transaction also rolls
+      back its increment
+
+Allocate as late as possible in the transaction (right before inserting
+the numbered rows) to keep the lock short.
+
+Functions:
+    - allocate: Reserve one number or a block of consecutive numbers
+    - peek: Last allocated number of a scope (read-only)
+    - lot_scope / wip_scope / serial_scope: Scope keys
+"""
+
+from typing import Callable, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.sequence_counter import SequenceCounter
+
+
+def lot_scope(lot_number_base: str) -> str:
+    """Scope of LOT sequences within a line/model/month base."""
+    return f"lot:{lot_number_base}"
+
+
+def wip_scope(lot_id: int) -> str:
+    """Scope of WIP sequences within a LOT."""
+    return f"wip:{lot_id}"
+
+
+def serial_scope(lot_id: int) -> str:
+    """Scope of serial sequences within a LOT."""
+    return f"serial:{lot_id}"
+
+
+def allocate(
+    db: Session,
+    scope: str,
+    count: int = 1,
+    *,
+    seed: Optional[Callable[[], int]] = None,
+) -> range:
+    """
+    Reserve consecutive numbers in a scope within the current transaction.
+
+    Args:
+        db: Database session (the allocation commits or rolls back with it)
+        scope: Numbering scope key
+        count: Size of the block to reserve (e.g. 100 for a WIP batch)
+        seed: Returns the last number already in use, called once when the
+            scope has no counter yet (numbering that predates the counter)
+
+    Returns:
+        range of the reserved numbers
+
+    Raises:
+        ValueError: If count is less than 1
+
+    Example:
+        sequences = allocate(db, wip_scope(lot.id), 100)
+        # range(1, 101) for a new LOT, range(101, 201) for the next batch
+    """
+    if count < 1:
+        raise ValueError("count must be at least 1")
+
+    last_value = _increment(db, scope, count)
+    if last_value is None:
+        _create_counter(db, scope, seed() if seed else 0)
+        last_value = _increment(db, scope, count)
+    return range(last_value - count + 1, last_value + 1)
+
+
+def peek(db: Session, scope: str) -> int:
+    """
+    Get the last allocated number of a scope without allocating.
+
+    Args:
+        db: Database session
+        scope: Numbering scope key
+
+    Returns:
+        Last allocated number (0 if the scope has no counter)
+    """
+    value = db.execute(
+        select(SequenceCounter.last_value).where(SequenceCounter.scope == scope)
+    ).scalar_one_or_none()
+    return value or 0
+
+
+def _increment(db: Session, scope: str, count: int) -> Optional[int]:
+    statement = (
+        update(SequenceCounter)
+        .where(SequenceCounter.scope == scope)
+        .values(last_value=SequenceCounter.last_value + count)
+        .returning(SequenceCounter.last_value)
+        .execution_options(synchronize_session=False)
+    )
+    return db.execute(statement).scalar_one_or_none()
+
+
+def _create_counter(db: Session, scope: str, last_value: int) -> None:
+    """Insert a counter row unless a concurrent transaction already did."""
+    values = {"scope": scope, "last_value": last_value}
+    dialect = db.get_bind().dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        db.execute(
+            insert(SequenceCounter).values(**values).on_conflict_do_nothing(
+                index_elements=[SequenceCounter.scope]
+            )
+        )
+        return
+
+    try:
+        with db.begin_nested():
+            db.execute(SequenceCounter.__table__.insert().values(**values))
+    except IntegrityError:
+        pass
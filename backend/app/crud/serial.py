@@ -19,16 +19,26 @@ Functions:
     increment_rework: Increment rework count and reset status to IN_PROGRESS
     update_status: Update serial status with validation and failure reason
     can_rework: Check if a serial is eligible for rework
+    next_sequence: Allocate the next serial sequence within a LOT
+
+List functions take ``after`` (a decoded keyset cursor, see app.crud.keyset)
+as an alternative to ``skip``; BY_SEQUENCE and BY_LOT are their sort keys.
 """
 
 from datetime import datetime
-from typing import List, Optional, Literal
+from typing import Any, List, Optional, Literal, Sequence
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload, Query
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from app.crud import keyset, sequence_counter
 from app.models.serial import Serial, SerialStatus
 from app.schemas.serial import SerialCreate, SerialUpdate
 
+# Keyset sort keys: get_multi / get_by_lot, and get_by_status / get_failed
+BY_SEQUENCE = [(Serial.sequence_in_lot, False), (Serial.id, False)]
+BY_LOT = [(Serial.lot_id, False), (Serial.sequence_in_lot, False), (Serial.id, False)]
+
 
 def _build_optimized_query(
     query: Query,
@@ -109,7 +119,8 @@ def get_multi(
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
-    eager_loading: Literal["minimal", "standard", "full"] = "standard"
+    eager_loading: Literal["minimal", "standard", "full"] = "standard",
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Serial]:
     """
     Get multiple serials with pagination and optional filtering.
@@ -128,6 +139,7 @@ def get_multi(
         limit: Maximum number of records to return (default: 100, max: 100)
         status: Optional filter for serial status
         eager_loading: Control eager loading depth
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Serial instances matching the criteria
@@ -158,12 +170,7 @@ def get_multi(
         query = query.filter(Serial.status == status)
 
     query = _build_optimized_query(query, eager_loading)
-    return (
-        query.order_by(Serial.sequence_in_lot)
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    return keyset.paginate(query, BY_SEQUENCE, skip, limit, after).all()
 
 
 def create(
@@ -379,6 +386,7 @@ def get_by_lot(
     lot_id: int,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
     eager_loading: Literal["minimal", "standard", "full"] = "standard"
 ) -> List[Serial]:
     """
@@ -394,6 +402,7 @@ def get_by_lot(
         lot_id: ID of the lot to retrieve serials from
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
         eager_loading: Control eager loading depth
 
     Returns:
@@ -410,13 +419,8 @@ def get_by_lot(
         page_2 = get_by_lot(db, lot_id=5, skip=10, limit=10,
                            eager_loading="minimal")
     """
-    query = (
-        db.query(Serial)
-        .filter(Serial.lot_id == lot_id)
-        .order_by(Serial.sequence_in_lot)
-    )
-    query = _build_optimized_query(query, eager_loading)
-    return query.offset(skip).limit(limit).all()
+    query = _build_optimized_query(db.query(Serial).filter(Serial.lot_id == lot_id), eager_loading)
+    return keyset.paginate(query, BY_SEQUENCE, skip, limit, after).all()
 
 
 def get_by_status(
@@ -424,6 +428,7 @@ def get_by_status(
     status: str,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Serial]:
     """
     Get serials filtered by status with pagination.
@@ -436,6 +441,7 @@ def get_by_status(
         status: Serial status filter (CREATED, IN_PROGRESS, PASSED, FAILED)
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of Serial instances with the specified status
@@ -460,20 +466,15 @@ def get_by_status(
             f"status must be one of {valid_statuses}, got '{status}'"
         )
 
-    return (
-        db.query(Serial)
-        .filter(Serial.status == status)
-        .order_by(Serial.lot_id, Serial.sequence_in_lot)
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = db.query(Serial).filter(Serial.status == status)
+    return keyset.paginate(query, BY_LOT, skip, limit, after).all()
 
 
 def get_failed(
     db: Session,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[Serial]:
     """
     Get FAILED serials available for rework.
@@ -485,6 +486,7 @@ def get_failed(
         db: SQLAlchemy database session
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of failed Serial instances available for rework
@@ -501,17 +503,11 @@ def get_failed(
             print(f"Rework {serial.sequence_in_lot}: {serial.failure_reason}")
             increment_rework(db, serial_id=serial.id)
     """
-    return (
-        db.query(Serial)
-        .filter(
-            Serial.status == SerialStatus.FAILED,
-            Serial.rework_count < 3
-        )
-        .order_by(Serial.lot_id, Serial.sequence_in_lot)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = db.query(Serial).filter(
+        Serial.status == SerialStatus.FAILED,
+        Serial.rework_count < 3
     )
+    return keyset.paginate(query, BY_LOT, skip, limit, after).all()
 
 
 def increment_rework(db: Session, serial_id: int) -> Optional[Serial]:
@@ -711,7 +707,7 @@ def count_by_lot(db: Session, lot_id: int) -> int:
     Count total serials in a specific LOT.
 
     Returns the number of serial records associated with the given lot.
-    Used for determining the next sequence number when generating new serials.
+    Serial sequence numbers are allocated by next_sequence, not from this count.
 
     Args:
         db: SQLAlchemy database session
@@ -721,12 +717,41 @@ def count_by_lot(db: Session, lot_id: int) -> int:
         Integer count of serials in the lot
 
     Example:
-        current_count = count_by_lot(db, lot_id=5)
-        next_sequence = current_count + 1
-        print(f"Next serial will be #{next_sequence}")
+        total = count_by_lot(db, lot_id=5)
+        print(f"LOT has {total} serials")
     """
     return db.query(Serial).filter(Serial.lot_id == lot_id).count()
 
 
 # Alias for backward compatibility
 get_by_serial_number = get_by_number
+
+
+def next_sequence(db: Session, lot_id: int) -> int:
+    """
+    Allocate the next serial sequence number within a LOT.
+
+    Increments the LOT's serial counter in the current transaction, so
+    concurrent conversions of the same LOT get distinct numbers without
+    counting serials. The counter is seeded once from the highest existing
+    sequence_in_lot. Rolling back the transaction releases the number.
+
+    Args:
+        db: SQLAlchemy database session
+        lot_id: ID of the lot to allocate from
+
+    Returns:
+        Next sequence_in_lot for the lot
+
+    Example:
+        sequence = next_sequence(db, lot_id=5)
+        serial = create(db, SerialCreate(lot_id=5, sequence_in_lot=sequence))
+    """
+    def last_existing_sequence() -> int:
+        return db.query(func.max(Serial.sequence_in_lot)).filter(
+            Serial.lot_id == lot_id
+        ).scalar() or 0
+
+    return sequence_counter.allocate(
+        db, sequence_counter.serial_scope(lot_id), seed=last_existing_sequence
+    )[0]
@@ -23,18 +23,25 @@ Functions:
     is_active: Check if user account is active
     update_last_login: Update last_login_at timestamp for user
     get_by_role: Filter and retrieve users by role with pagination
+
+get_multi / get_by_role take ``after`` (a decoded keyset cursor, see
+app.crud.keyset) as an alternative to ``skip``; NEWEST is their sort key.
 """
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from passlib.context import CryptContext
 
+from app.crud import keyset
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserUpdate, UserInDB
 
 
+# Keyset sort key of get_multi / get_by_role
+NEWEST = [(User.created_at, True), (User.id, True)]
+
 # Password hashing context configuration
 # Uses bcrypt algorithm with default cost factor of 12
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -118,6 +125,7 @@ def get_multi(
     limit: int = 100,
     role: Optional[UserRole] = None,
     is_active: Optional[bool] = None,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[User]:
     """
     Get multiple users with pagination and optional filtering.
@@ -132,6 +140,7 @@ def get_multi(
         limit: Maximum number of records to return (default: 100, max: 1000)
         role: Optional filter by UserRole enum (ADMIN, MANAGER, OPERATOR)
         is_active: Optional filter by active status (True/False/None for all)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of User instances matching the criteria (may be empty)
@@ -165,7 +174,7 @@ def get_multi(
         query = query.filter(User.is_active == is_active)
 
     # Order by creation date (newest first) and apply pagination
-    return query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def create(db: Session, user_in: UserCreate) -> User:
@@ -527,6 +536,7 @@ def get_by_role(
     role: UserRole,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
 ) -> List[User]:
     """
     Get users filtered by role with pagination.
@@ -540,6 +550,7 @@ def get_by_role(
         role: UserRole enum to filter by (ADMIN, MANAGER, OPERATOR)
         skip: Number of records to skip for pagination (default: 0)
         limit: Maximum number of records to return (default: 100, max: 1000)
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
 
     Returns:
         List of User instances with specified role (may be empty)
@@ -570,11 +581,8 @@ def get_by_role(
     if limit > 1000:
         limit = 1000
 
-    return (
+    query = (
         db.query(User)
         .filter(User.role == role)
-        .order_by(User.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
@@ -12,33 +12,51 @@ Functions:
     get_by_wip_id: Get WIP by unique WIP ID
     get_by_lot: Get all WIPs for a LOT
     get_by_status: Get WIPs by status
+    get_multi_rows: get_multi / get_by_lot / get_by_status page as response rows
     create_batch: Create multiple WIP IDs in batch (BR-001, BR-002)
     update_status: Update WIP status with validation
     scan: Process barcode scan
     start_process: Start a process on WIP (BR-003)
     complete_process: Complete a process on WIP (BR-004)
+    scan_async / start_process_async / complete_process_async: Hot path
+        variants of the above on an AsyncSession
     convert_to_serial: Convert WIP to serial number (BR-005)
     get_statistics: Get WIP statistics by LOT or process
+
+List functions take ``after`` (a decoded keyset cursor, see app.crud.keyset)
+as an alternative to ``skip``; NEWEST and BY_SEQUENCE are their sort keys.
 """
 
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Literal
-from sqlalchemy import and_, func, desc
+from typing import Any, List, Optional, Dict, Literal, Sequence
+from sqlalchemy import and_, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload, joinedload, Query
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 logger = logging.getLogger(__name__)
 
+from app.core.change_tracker import change_tracker
+from app.crud import keyset, sequence_counter
+from app.crud.rows import RowProjection
 from app.models.lot import Lot, LotStatus
 from app.models.wip_item import WIPItem, WIPStatus
 from app.models.wip_process_history import WIPProcessHistory, ProcessResult
 from app.models.process import Process, ProcessType
 from app.models.process_data import ProcessData, DataLevel
 from app.models.serial import Serial, SerialStatus
+from app.schemas.wip_item import WIPItemInDB
 from app.utils.wip_number import generate_batch_wip_ids
 from app.services import wip_service
 
+# Count committed WIP changes for ETag-based conditional GET
+change_tracker.track(WIPItem)
+
+# Keyset sort keys: get_multi / get_by_status, and get_by_lot
+NEWEST = [(WIPItem.created_at, True), (WIPItem.id, True)]
+BY_SEQUENCE = [(WIPItem.sequence_in_lot, False), (WIPItem.id, False)]
+
 
 def _build_optimized_query(
     query: Query,
@@ -113,6 +131,7 @@ def get_multi(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
     eager_loading: Literal["minimal", "standard", "full"] = "standard"
 ) -> List[WIPItem]:
     """
@@ -128,14 +147,14 @@ def get_multi(
         db: Database session
         skip: Number of records to skip (offset)
         limit: Maximum number of records to return
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
         eager_loading: Control eager loading depth ("minimal", "standard", "full")
 
     Returns:
         List of WIPItem instances
     """
-    query = db.query(WIPItem).order_by(desc(WIPItem.created_at), desc(WIPItem.id))
-    query = _build_optimized_query(query, eager_loading)
-    return query.offset(skip).limit(limit).all()
+    query = _build_optimized_query(db.query(WIPItem), eager_loading)
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def get_by_wip_id(db: Session, wip_id: str, eager_loading: Literal["minimal", "standard", "full"] = "standard") -> Optional[WIPItem]:
@@ -163,6 +182,7 @@ def get_by_lot(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
     eager_loading: Literal["minimal", "standard", "full"] = "standard"
 ) -> List[WIPItem]:
     """
@@ -175,14 +195,76 @@ def get_by_lot(
         lot_id: LOT identifier to filter by
         skip: Number of records to skip (offset)
         limit: Maximum number of records to return
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
         eager_loading: Control eager loading depth ("minimal", "standard", "full")
 
     Returns:
         List of WIPItem instances for the specified LOT
     """
-    query = db.query(WIPItem).filter(WIPItem.lot_id == lot_id).order_by(WIPItem.sequence_in_lot)
-    query = _build_optimized_query(query, eager_loading)
-    return query.offset(skip).limit(limit).all()
+    query = _build_optimized_query(db.query(WIPItem).filter(WIPItem.lot_id == lot_id), eager_loading)
+    return keyset.paginate(query, BY_SEQUENCE, skip, limit, after).all()
+
+
+_ROWS = RowProjection(WIPItem, WIPItemInDB)
+
+
+def get_multi_rows(
+    db: Session,
+    *,
+    lot_id: Optional[int] = None,
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get a WIP page as WIPItemInDB-shaped dicts without ORM hydration.
+
+    Filters and orders like get_by_lot (lot_id given), get_by_status
+    (status given) or get_multi.
+
+    Args:
+        db: Database session
+        lot_id: Optional LOT filter
+        status: Optional status filter
+        skip: Number of records to skip (offset)
+        limit: Maximum number of records to return
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
+
+    Returns:
+        List of response rows
+    """
+    statement = _ROWS.select()
+    if lot_id:
+        statement = keyset.paginate(statement.where(WIPItem.lot_id == lot_id), BY_SEQUENCE, skip, limit, after)
+    elif status:
+        statement = keyset.paginate(statement.where(WIPItem.status == status), NEWEST, skip, limit, after)
+    else:
+        statement = keyset.paginate(statement, NEWEST, skip, limit, after)
+    return _ROWS.rows(db, statement)
+
+
+def get_wip_ids_by_lot(db: Session, lot_id: int) -> List[str]:
+    """
+    Get the WIP IDs of a LOT in sequence order.
+
+    Selects only the wip_id column, for label rendering and similar bulk
+    uses that do not need full WIP rows.
+
+    Args:
+        db: Database session
+        lot_id: LOT identifier
+
+    Returns:
+        WIP ID strings ordered by sequence_in_lot
+    """
+    rows = (
+        db.query(WIPItem.wip_id)
+        .filter(WIPItem.lot_id == lot_id)
+        .order_by(WIPItem.sequence_in_lot)
+        .all()
+    )
+    return [row.wip_id for row in rows]
 
 
 def get_by_status(
@@ -191,6 +273,7 @@ def get_by_status(
     *,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Sequence[Any]] = None,
     eager_loading: Literal["minimal", "standard", "full"] = "standard"
 ) -> List[WIPItem]:
     """
@@ -203,14 +286,14 @@ def get_by_status(
         status: WIP status to filter by (CREATED, IN_PROGRESS, etc.)
         skip: Number of records to skip (offset)
         limit: Maximum number of records to return
+        after: Sort key of the previous page's last row (keyset cursor); replaces skip
         eager_loading: Control eager loading depth ("minimal", "standard", "full")
 
     Returns:
         List of WIPItem instances with the specified status
     """
-    query = db.query(WIPItem).filter(WIPItem.status == status).order_by(desc(WIPItem.created_at))
-    query = _build_optimized_query(query, eager_loading)
-    return query.offset(skip).limit(limit).all()
+    query = _build_optimized_query(db.query(WIPItem).filter(WIPItem.status == status), eager_loading)
+    return keyset.paginate(query, NEWEST, skip, limit, after).all()
 
 
 def create_batch(
@@ -245,17 +328,24 @@ def create_batch(
     # BR-001: Validate LOT can generate WIP IDs
     wip_service.validate_lot_for_wip_generation(db, lot, quantity)
 
-    # Find next sequence number
-    last_wip = (
-        db.query(WIPItem)
-        .filter(WIPItem.lot_id == lot_id)
-        .order_by(desc(WIPItem.sequence_in_lot))
-        .first()
-    )
-    start_sequence = (last_wip.sequence_in_lot + 1) if last_wip else 1
+    # Lease a block of sequence numbers in one statement (seeded once from
+    # WIP items that predate the counter)
+    def last_existing_sequence() -> int:
+        return db.query(func.max(WIPItem.sequence_in_lot)).filter(
+            WIPItem.lot_id == lot_id
+        ).scalar() or 0
+
+    start_sequence = sequence_counter.allocate(
+        db, sequence_counter.wip_scope(lot_id), quantity, seed=last_existing_sequence
+    ).start
 
     # Generate WIP IDs
-    wip_ids = generate_batch_wip_ids(lot.lot_number, quantity, start_sequence=start_sequence)
+    try:
+        wip_ids = generate_batch_wip_ids(lot.lot_number, quantity, start_sequence=start_sequence)
+    except ValueError:
+        # Release the leased block
+        db.rollback()
+        raise
 
     # Create WIP items
     wip_items = []
@@ -621,6 +711,58 @@ def complete_process(
     return history
 
 
+# ---------------------------------------------------------------------------
+# Async variants (shop-floor hot path)
+# ---------------------------------------------------------------------------
+# The sync functions run unchanged on the async session's connection via
+# AsyncSession.run_sync: BR-003 / BR-004 stay in one place, while every
+# query awaits the async driver instead of holding a threadpool thread.
+
+async def scan_async(
+    db: AsyncSession,
+    wip_id_str: str,
+    process_id: Optional[int] = None,
+) -> Optional[WIPItem]:
+    """Async variant of scan."""
+    return await db.run_sync(scan, wip_id_str, process_id)
+
+
+async def start_process_async(
+    db: AsyncSession,
+    wip_id: int,
+    process_id: int,
+    operator_id: int,
+    equipment_id: Optional[int] = None,
+    started_at: Optional[datetime] = None,
+    process_session_id: Optional[int] = None,
+) -> WIPItem:
+    """Async variant of start_process (BR-003)."""
+    return await db.run_sync(
+        start_process, wip_id, process_id, operator_id,
+        equipment_id, started_at, process_session_id,
+    )
+
+
+async def complete_process_async(
+    db: AsyncSession,
+    wip_id: int,
+    process_id: int,
+    operator_id: int,
+    result: str,
+    measurements: Optional[dict] = None,
+    defects: Optional[list] = None,
+    notes: Optional[str] = None,
+    started_at: Optional[datetime] = None,
+    completed_at: Optional[datetime] = None,
+    equipment_id: Optional[int] = None,
+) -> WIPProcessHistory:
+    """Async variant of complete_process (BR-004)."""
+    return await db.run_sync(
+        complete_process, wip_id, process_id, operator_id, result,
+        measurements, defects, notes, started_at, completed_at, equipment_id,
+    )
+
+
 def convert_to_serial(
     db: Session,
     wip_id: int,
@@ -704,6 +846,11 @@ def get_statistics(
     """
     Get WIP statistics by LOT or process.
 
+    Counts are aggregated in SQL (GROUP BY lot, current process, status), so
+    the cost depends on the number of groups rather than the number of WIPs.
+    A LOT's current process is the process holding most of its in-progress
+    WIPs.
+
     Args:
         db: Database session
         lot_id: Optional LOT identifier for filtering
@@ -712,9 +859,17 @@ def get_statistics(
     Returns:
         Dictionary with statistics
     """
-    query = db.query(WIPItem).options(
-        joinedload(WIPItem.lot),
-        joinedload(WIPItem.current_process)
+    query = (
+        db.query(
+            WIPItem.lot_id,
+            Lot.lot_number,
+            WIPItem.current_process_id,
+            Process.process_name_ko,
+            WIPItem.status,
+            func.count(WIPItem.id),
+        )
+        .join(Lot, WIPItem.lot_id == Lot.id)
+        .outerjoin(Process, WIPItem.current_process_id == Process.id)
     )
 
     if lot_id:
@@ -723,69 +878,66 @@ def get_statistics(
     if process_id:
         query = query.filter(WIPItem.current_process_id == process_id)
 
-    wip_items = query.all()
-
-    total = len(wip_items)
-    created = sum(1 for w in wip_items if w.status == WIPStatus.CREATED.value)
-    in_progress = sum(1 for w in wip_items if w.status == WIPStatus.IN_PROGRESS.value)
-    completed = sum(1 for w in wip_items if w.status == WIPStatus.COMPLETED.value)
-    failed = sum(1 for w in wip_items if w.status == WIPStatus.FAILED.value)
-    converted = sum(1 for w in wip_items if w.status == WIPStatus.CONVERTED.value)
-
-    # Calculate by_lot statistics
-    by_lot = {}
-    for wip in wip_items:
-        if wip.lot_id not in by_lot:
-            lot_number = wip.lot.lot_number if wip.lot else f"LOT-{wip.lot_id}"
-            by_lot[wip.lot_id] = {
-                "lot_id": wip.lot_id,
-                "lot_number": lot_number,
-                "total_quantity": 0,
-                "completed_quantity": 0,
-                "in_progress_quantity": 0,
-                "current_process": None,
-                "current_process_id": None,
-            }
-
-        by_lot[wip.lot_id]["total_quantity"] += 1
-
-        if wip.status == WIPStatus.COMPLETED.value or wip.status == WIPStatus.CONVERTED.value:
-            by_lot[wip.lot_id]["completed_quantity"] += 1
-        elif wip.status == WIPStatus.IN_PROGRESS.value:
-            by_lot[wip.lot_id]["in_progress_quantity"] += 1
-            # Update current process (use the most recent in-progress item's process)
-            if wip.current_process:
-                by_lot[wip.lot_id]["current_process"] = wip.current_process.name
-                by_lot[wip.lot_id]["current_process_id"] = wip.current_process_id
-
-    # Calculate by_process statistics
-    by_process = {}
-    for wip in wip_items:
-        if wip.current_process_id:
-            process_id_key = wip.current_process_id
-            if process_id_key not in by_process:
-                process_name = wip.current_process.name if wip.current_process else f"Process-{process_id_key}"
-                by_process[process_id_key] = {
-                    "process_id": process_id_key,
-                    "process_name": process_name,
-                    "count": 0,
-                    "in_progress": 0,
-                    "completed": 0,
-                }
-
-            by_process[process_id_key]["count"] += 1
-            if wip.status == WIPStatus.IN_PROGRESS.value:
-                by_process[process_id_key]["in_progress"] += 1
-            elif wip.status == WIPStatus.COMPLETED.value or wip.status == WIPStatus.CONVERTED.value:
-                by_process[process_id_key]["completed"] += 1
+    rows = query.group_by(
+        WIPItem.lot_id,
+        Lot.lot_number,
+        WIPItem.current_process_id,
+        Process.process_name_ko,
+        WIPItem.status,
+    ).all()
+
+    done_statuses = {WIPStatus.COMPLETED.value, WIPStatus.CONVERTED.value}
+    by_status = {wip_status.value: 0 for wip_status in WIPStatus}
+    by_lot: Dict[int, Dict] = {}
+    by_process: Dict[int, Dict] = {}
+    lot_in_progress: Dict[int, Dict[int, int]] = {}
+
+    for row_lot_id, lot_number, row_process_id, process_name, wip_status, count in rows:
+        by_status[wip_status] = by_status.get(wip_status, 0) + count
+
+        lot_stats = by_lot.setdefault(row_lot_id, {
+            "lot_id": row_lot_id,
+            "lot_number": lot_number or f"LOT-{row_lot_id}",
+            "total_quantity": 0,
+            "completed_quantity": 0,
+            "in_progress_quantity": 0,
+            "current_process": None,
+            "current_process_id": None,
+        })
+        lot_stats["total_quantity"] += count
+
+        if wip_status in done_statuses:
+            lot_stats["completed_quantity"] += count
+        elif wip_status == WIPStatus.IN_PROGRESS.value:
+            lot_stats["in_progress_quantity"] += count
+            if row_process_id:
+                per_process = lot_in_progress.setdefault(row_lot_id, {})
+                per_process[row_process_id] = per_process.get(row_process_id, 0) + count
+                if per_process[row_process_id] >= per_process.get(lot_stats["current_process_id"], 0):
+                    lot_stats["current_process_id"] = row_process_id
+                    lot_stats["current_process"] = process_name
+
+        if row_process_id:
+            process_stats = by_process.setdefault(row_process_id, {
+                "process_id": row_process_id,
+                "process_name": process_name or f"Process-{row_process_id}",
+                "count": 0,
+                "in_progress": 0,
+                "completed": 0,
+            })
+            process_stats["count"] += count
+            if wip_status == WIPStatus.IN_PROGRESS.value:
+                process_stats["in_progress"] += count
+            elif wip_status in done_statuses:
+                process_stats["completed"] += count
 
     return {
-        "total": total,
-        "created": created,
-        "in_progress": in_progress,
-        "completed": completed,
-        "failed": failed,
-        "converted": converted,
+        "total": sum(by_status.values()),
+        "created": by_status[WIPStatus.CREATED.value],
+        "in_progress": by_status[WIPStatus.IN_PROGRESS.value],
+        "completed": by_status[WIPStatus.COMPLETED.value],
+        "failed": by_status[WIPStatus.FAILED.value],
+        "converted": by_status[WIPStatus.CONVERTED.value],
         "by_lot": list(by_lot.values()),
         "by_process": by_process,
     }
@@ -2,23 +2,32 @@
 Database connection and session management using SQLAlchemy 2.0.
 
 Provides:
-    - Engine creation with connection pooling
+    - Engine creation with connection pooling (deferred to first use / lifespan)
+    - Separate pools for operations, analytics (optional read replica) and jobs
+    - Per-pool usage metrics
     - Session factory for dependency injection
     - Base class for ORM models
     - Database initialization utilities
     - Cross-database JSONB type support
 """
 
-from typing import AsyncGenerator, Generator, Any, Optional, Type as TypingType, Union
+import logging
+import threading
+import time
+from typing import AsyncGenerator, Dict, Generator, Any, Optional, Tuple, Type as TypingType, Union
 from sqlalchemy import create_engine, event, text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
-from sqlalchemy.pool import Pool, StaticPool, NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool, StaticPool, NullPool
 from sqlalchemy.types import JSON, TypeDecorator
 from sqlalchemy.dialects.postgresql import JSONB as PostgreSQL_JSONB
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 class JSONBType(TypeDecorator):
     """
@@ -78,6 +87,8 @@ class JSONBDict(JSONBType):
             metadata: Mapped[dict] = mapped_column(JSONBDict, default=dict)
     """
 
+    cache_ok = True  # Not inherited: SQLAlchemy checks each subclass
+
     def process_bind_param(self, value, dialect):
         """Validate that value is a dictionary before storage."""
         if value is None:
@@ -100,6 +111,8 @@ class JSONBList(JSONBType):
             items: Mapped[list] = mapped_column(JSONBList, default=list)
     """
 
+    cache_ok = True  # Not inherited: SQLAlchemy checks each subclass
+
     def process_bind_param(self, value, dialect):
         """Validate that value is a list before storage."""
         if value is None:
@@ -132,6 +145,17 @@ __all__ = [
     'async_engine',
     'SessionLocal',
     'AsyncSessionLocal',
+    'AnalyticsSessionLocal',
+    'JobsSessionLocal',
+    'OPERATIONS',
+    'ANALYTICS',
+    'JOBS',
+    'init_engines',
+    'get_engine',
+    'get_async_engine',
+    'get_workload_engine',
+    'pool_metrics',
+    'dispose_engines',
     'get_db',
     'get_async_db',
     'set_audit_context',
@@ -156,43 +180,83 @@ def is_postgresql() -> bool:
     return "postgresql" in settings.DATABASE_URL
 
 
-# Create SQLAlchemy engine
-# SQLite doesn't support pool_size and max_overflow, so we check the dialect
-if "sqlite" in settings.DATABASE_URL:
-    engine = create_engine(
-        settings.DATABASE_URL,
-        echo=settings.DB_ECHO,
-        connect_args={
-            "check_same_thread": False,  # SQLite specific
-            "timeout": 30,  # Connection timeout in seconds
-        },
-        poolclass=StaticPool,  # Use static pool for SQLite
-    )
-else:
-    engine = create_engine(
-        settings.DATABASE_URL,
-        echo=settings.DB_ECHO,
-        pool_pre_ping=True,  # Verify connections before using
-        pool_size=10,
-        max_overflow=20,
-    )
+# ============================================================================
+# Engines
+# ============================================================================
+# Engines are created on first use (or by init_engines() in the application
+# lifespan), not at import time, so importing the app opens no pools and
+# scripts/workers that never touch the database do not pay for them.
+#
+# Each workload has its own pool so a long report or export can never take
+# the connections shop-floor start/complete need:
+#   operations - SessionLocal / get_db and the async engine; short statement timeout
+#   analytics  - AnalyticsSessionLocal; long timeout, DB_ANALYTICS_URL replica if set
+#   jobs       - JobsSessionLocal for Celery tasks
+# On SQLite every workload shares the single engine.
+
+OPERATIONS = "operations"
+ANALYTICS = "analytics"
+JOBS = "jobs"
+_REPLICA = "analytics_replica"
+
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_workload_engines: Dict[str, Engine] = {}
+_engine_lock = threading.Lock()
+
+# Replica lag in seconds; 0 on a primary or a replica that has replayed all received WAL
+_REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class _CheckoutMetrics:
+    """
+    Pool mixin recording how long checkouts wait for a connection.
 
+    Waits include opening a new connection when the pool grows; timeouts
+    count checkouts that gave up after DB_POOL_TIMEOUT.
+    """
 
-# Session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
+    def __init__(self, *args: Any, **kw: Any):
+        super().__init__(*args, **kw)
+        self._metrics_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
 
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._metrics_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._metrics_lock:
+                self.checkouts += 1
+                self.wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
 
-# ============================================================================
-# Async Database Setup (for async endpoints like sequences)
-# ============================================================================
 
-def _get_async_database_url() -> str:
+class _MeteredQueuePool(_CheckoutMetrics, QueuePool):
+    pass
+
+
+class _MeteredAsyncQueuePool(_CheckoutMetrics, AsyncAdaptedQueuePool):
+    pass
+
+
+def _get_async_database_url(url: Optional[str] = None) -> str:
     """Convert sync database URL to async driver URL."""
-    url = settings.DATABASE_URL
+    url = url or settings.DATABASE_URL
     if url.startswith("postgresql://"):
         # Use asyncpg driver for PostgreSQL
         return url.replace("postgresql://", "postgresql+asyncpg://")
@@ -202,29 +266,297 @@ def _get_async_database_url() -> str:
     return url
 
 
-# Create async engine
-if "sqlite" in settings.DATABASE_URL:
-    async_engine = create_async_engine(
-        _get_async_database_url(),
-        echo=settings.DB_ECHO,
-        connect_args={
-            "check_same_thread": False,
-        },
-        poolclass=StaticPool,
-    )
-else:
-    async_engine = create_async_engine(
-        _get_async_database_url(),
+def _workload_options(workload: str) -> Dict[str, int]:
+    if workload == OPERATIONS:
+        return {
+            "pool_size": settings.DB_OPS_POOL_SIZE,
+            "max_overflow": settings.DB_OPS_MAX_OVERFLOW,
+            "statement_timeout": settings.DB_OPS_STATEMENT_TIMEOUT_MS,
+        }
+    if workload == JOBS:
+        return {
+            "pool_size": settings.DB_JOBS_POOL_SIZE,
+            "max_overflow": settings.DB_JOBS_MAX_OVERFLOW,
+            "statement_timeout": settings.DB_JOBS_STATEMENT_TIMEOUT_MS,
+        }
+    return {
+        "pool_size": settings.DB_ANALYTICS_POOL_SIZE,
+        "max_overflow": settings.DB_ANALYTICS_MAX_OVERFLOW,
+        "statement_timeout": settings.DB_ANALYTICS_STATEMENT_TIMEOUT_MS,
+    }
+
+
+def _create_postgresql_engine(workload: str, url: str) -> Engine:
+    options = _workload_options(workload)
+    connect_args: Dict[str, Any] = {}
+    if options["statement_timeout"]:
+        connect_args["options"] = f"-c statement_timeout={options['statement_timeout']}"
+    if workload == _REPLICA:
+        connect_args["connect_timeout"] = 3  # A down replica must not stall reports
+    return create_engine(
+        url,
         echo=settings.DB_ECHO,
-        pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20,
+        pool_pre_ping=True,  # Verify connections before using
+        poolclass=_MeteredQueuePool,
+        pool_size=options["pool_size"],
+        max_overflow=options["max_overflow"],
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        connect_args=connect_args,
     )
 
 
+def _create_engines() -> Tuple[Engine, AsyncEngine]:
+    # SQLite doesn't support pool_size and max_overflow, so we check the dialect
+    if "sqlite" in settings.DATABASE_URL:
+        sync_engine = create_engine(
+            settings.DATABASE_URL,
+            echo=settings.DB_ECHO,
+            connect_args={
+                "check_same_thread": False,  # SQLite specific
+                "timeout": 30,  # Connection timeout in seconds
+            },
+            poolclass=StaticPool,  # Use static pool for SQLite
+        )
+        async_engine = create_async_engine(
+            _get_async_database_url(),
+            echo=settings.DB_ECHO,
+            connect_args={
+                "check_same_thread": False,
+            },
+            poolclass=StaticPool,
+        )
+    else:
+        sync_engine = _create_postgresql_engine(OPERATIONS, settings.DATABASE_URL)
+        options = _workload_options(OPERATIONS)
+        server_settings = {}
+        if options["statement_timeout"]:
+            server_settings["statement_timeout"] = str(options["statement_timeout"])
+        async_engine = create_async_engine(
+            _get_async_database_url(),
+            echo=settings.DB_ECHO,
+            pool_pre_ping=True,
+            poolclass=_MeteredAsyncQueuePool,
+            pool_size=options["pool_size"],
+            max_overflow=options["max_overflow"],
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            connect_args={"server_settings": server_settings},
+        )
+    return sync_engine, async_engine
+
+
+def init_engines() -> Engine:
+    """
+    Create the operations sync and async engines and bind the session factories.
+
+    Idempotent and thread-safe. Called from the application lifespan; any
+    earlier SessionLocal()/AsyncSessionLocal() call or access to
+    ``app.database.engine`` creates them on demand. The analytics and jobs
+    engines are created on their first session.
+
+    Returns:
+        The sync engine
+    """
+    global _engine, _async_engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                sync_engine, async_engine = _create_engines()
+                SessionLocal.configure(bind=sync_engine)
+                AsyncSessionLocal.configure(bind=async_engine)
+                _async_engine = async_engine
+                _engine = sync_engine
+    return _engine
+
+
+def get_engine() -> Engine:
+    """Get the sync engine, creating it on first use."""
+    return init_engines()
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the async engine, creating it on first use."""
+    init_engines()
+    return _async_engine
+
+
+def _get_workload_engine(workload: str) -> Engine:
+    engine = _workload_engines.get(workload)
+    if engine is None:
+        with _engine_lock:
+            engine = _workload_engines.get(workload)
+            if engine is None:
+                url = settings.DB_ANALYTICS_URL if workload == _REPLICA else settings.DATABASE_URL
+                engine = _create_postgresql_engine(workload, url)
+                _workload_engines[workload] = engine
+    return engine
+
+
+# Last replica check: {"checked_at": monotonic, "healthy": bool, "lag_seconds": float | None, "error": str | None}
+_replica_state: Dict[str, Any] = {}
+
+
+def _replica_lag(conn) -> float:
+    return float(conn.execute(_REPLICA_LAG_SQL).scalar())
+
+
+def _replica_healthy() -> bool:
+    """Whether the analytics replica is reachable and within DB_ANALYTICS_MAX_REPLICA_LAG (cached)."""
+    now = time.monotonic()
+    if _replica_state and now - _replica_state["checked_at"] < settings.DB_REPLICA_CHECK_INTERVAL:
+        return _replica_state["healthy"]
+
+    lag, error = None, None
+    try:
+        with _get_workload_engine(_REPLICA).connect() as conn:
+            lag = _replica_lag(conn)
+        healthy = lag <= settings.DB_ANALYTICS_MAX_REPLICA_LAG
+    except SQLAlchemyError as e:
+        healthy, error = False, str(e)
+    if not healthy and _replica_state.get("healthy", True):
+        logger.warning(
+            "Analytics replica unavailable (lag=%s, error=%s); using the primary", lag, error
+        )
+    _replica_state.update(checked_at=now, healthy=healthy, lag_seconds=lag, error=error)
+    return healthy
+
+
+def get_workload_engine(workload: str) -> Engine:
+    """
+    Get the engine for a workload, creating it on first use.
+
+    Analytics uses the DB_ANALYTICS_URL replica while it is reachable and
+    within DB_ANALYTICS_MAX_REPLICA_LAG, and its own pool on the primary
+    otherwise.
+
+    Args:
+        workload: OPERATIONS, ANALYTICS or JOBS
+
+    Returns:
+        The workload's sync engine
+    """
+    if workload == OPERATIONS or "sqlite" in settings.DATABASE_URL:
+        return get_engine()
+    if workload == ANALYTICS:
+        if settings.DB_ANALYTICS_URL and _replica_healthy():
+            return _get_workload_engine(_REPLICA)
+        return _get_workload_engine(ANALYTICS)
+    if workload == JOBS:
+        return _get_workload_engine(JOBS)
+    raise ValueError(f"Unknown database workload: {workload}")
+
+
+def pool_metrics() -> Dict[str, Any]:
+    """
+    Connection pool usage per workload engine created so far.
+
+    Returns:
+        {"pools": {name: {size, checked_out, overflow, checkouts, timeouts,
+        wait_ms_avg, wait_ms_max}}, "replica": last replica check or None}
+    """
+    engines: Dict[str, Any] = {}
+    if _engine is not None:
+        engines[OPERATIONS] = _engine
+        engines[f"{OPERATIONS}_async"] = _async_engine.sync_engine
+    engines.update(_workload_engines)
+
+    pools = {}
+    for name, engine in engines.items():
+        pool = engine.pool
+        if not isinstance(pool, _CheckoutMetrics):
+            pools[name] = {"status": pool.status()}
+            continue
+        pools[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "checkouts": pool.checkouts,
+            "timeouts": pool.timeouts,
+            "wait_ms_avg": round(pool.wait_seconds / pool.checkouts * 1000, 2) if pool.checkouts else 0.0,
+            "wait_ms_max": round(pool.max_wait_seconds * 1000, 2),
+        }
+
+    replica = None
+    if _replica_state:
+        replica = {key: value for key, value in _replica_state.items() if key != "checked_at"}
+    return {"pools": pools, "replica": replica}
+
+
+async def dispose_engines() -> None:
+    """Close all pooled connections (application shutdown)."""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    if _engine is not None:
+        _engine.dispose()
+    for engine in list(_workload_engines.values()):
+        engine.dispose()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy module attributes: ``from app.database import engine`` still works
+    if name == "engine":
+        return get_engine()
+    if name == "async_engine":
+        return get_async_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazySessionMaker(sessionmaker):
+    """sessionmaker that creates the engines on its first session."""
+
+    def __call__(self, **local_kw: Any) -> Session:
+        if self.kw.get("bind") is None:
+            init_engines()
+        return super().__call__(**local_kw)
+
+
+class _LazyAsyncSessionMaker(async_sessionmaker):
+    """async_sessionmaker that creates the engines on its first session."""
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        if self.kw.get("bind") is None:
+            init_engines()
+        return super().__call__(**local_kw)
+
+
+class _WorkloadSessionMaker(sessionmaker):
+    """sessionmaker binding each new session to its workload's engine."""
+
+    def __init__(self, workload: str, **kw: Any):
+        super().__init__(**kw)
+        self.workload = workload
+
+    def __call__(self, **local_kw: Any) -> Session:
+        local_kw.setdefault("bind", get_workload_engine(self.workload))
+        return super().__call__(**local_kw)
+
+
+# Session factory
+SessionLocal = _LazySessionMaker(
+    autocommit=False,
+    autoflush=False,
+)
+
+# Reports, dashboards and exports; may read from the replica
+AnalyticsSessionLocal = _WorkloadSessionMaker(
+    ANALYTICS,
+    autocommit=False,
+    autoflush=False,
+)
+
+# Celery tasks
+JobsSessionLocal = _WorkloadSessionMaker(
+    JOBS,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+# ============================================================================
+# Async Database Setup (for async endpoints like sequences)
+# ============================================================================
+
 # Async session factory
-AsyncSessionLocal = async_sessionmaker(
-    async_engine,
+AsyncSessionLocal = _LazyAsyncSessionMaker(
     class_=AsyncSession,
     autocommit=False,
     autoflush=False,
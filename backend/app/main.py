@@ -20,13 +20,17 @@ import uuid
 from datetime import datetime
 
 from app.config import settings
+from app.core.error_rates import error_rates, route_path
 from app.core.exceptions import AppException
 from app.schemas.error import StandardErrorResponse, ErrorDetail, ErrorCode
 from app.core.errors import get_http_status_for_error_code
-from app.database import SessionLocal, engine, Base
+from app.core.responses import FastJSONResponse
+from app.database import SessionLocal, Base, dispose_engines, init_engines
 from app.models import User
 from app.schemas import UserRole
 from app.core.security import get_password_hash
+from app.services.label_service import label_service
+from app.analytics.alert_engine import alert_engine
 from contextlib import asynccontextmanager
 
 
@@ -50,6 +54,7 @@ from app.api.v1 import (
     equipment,
     error_logs,
     printer_monitoring,
+    reports,
     async_operations,
     search,
     stations,
@@ -58,7 +63,12 @@ from app.api.v1 import (
 )
 
 # Import middleware
-from app.middleware import ErrorLoggingMiddleware, RateLimitMiddleware
+from app.middleware import (
+    CompressionMiddleware,
+    ErrorLoggingMiddleware,
+    IdempotencyMiddleware,
+    RateLimitMiddleware,
+)
 
 
 # Configure logging
@@ -140,17 +150,37 @@ def init_default_admin():
         db.close()
 
 
+def flush_error_rates():
+    """Write this process's pending error counts before it exits."""
+    db = SessionLocal()
+    try:
+        error_rates.flush(db)
+    except Exception as e:
+        logger.error(f"Failed to flush error rates: {e}")
+    finally:
+        db.close()
+
+
 @asynccontextmanager
 async def lifespan(app):
     """Application lifespan manager for startup/shutdown events."""
     # Startup
     logger.info("Starting F2X NeuroHub MES API...")
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
-    init_default_admin()
+    engine = init_engines()
+    # Create all tables (skip when the schema is managed by Alembic)
+    if settings.DB_CREATE_ALL_ON_STARTUP:
+        Base.metadata.create_all(bind=engine)
+    if settings.INIT_DEFAULT_ADMIN_ON_STARTUP:
+        init_default_admin()
+    if settings.ALERT_ENGINE_ENABLED:
+        alert_engine.start()
     yield
     # Shutdown
     logger.info("Shutting down F2X NeuroHub MES API...")
+    label_service.shutdown()
+    alert_engine.stop()
+    flush_error_rates()
+    await dispose_engines()
 
 
 # Create FastAPI application
@@ -162,10 +192,23 @@ app = FastAPI(
     redoc_url=f"{settings.API_V1_PREFIX}/redoc",
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     redirect_slashes=False,  # POST 요청에서 trailing slash로 인한 307 리다이렉트 방지
 )
 
 
+# Add Idempotency Middleware (innermost, so replayed responses still get
+# CORS headers; replays skip the endpoints and business tables)
+if settings.IDEMPOTENCY_ENABLED:
+    app.add_middleware(
+        IdempotencyMiddleware,
+        ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+        wait_timeout=settings.IDEMPOTENCY_WAIT_TIMEOUT,
+        lease_seconds=settings.IDEMPOTENCY_LEASE_SECONDS,
+        sweep_interval=settings.IDEMPOTENCY_SWEEP_INTERVAL,
+        max_response_bytes=settings.IDEMPOTENCY_MAX_RESPONSE_BYTES,
+    )
+
 # Configure CORS (from settings for environment-specific configuration)
 app.add_middleware(
     CORSMiddleware,
@@ -187,6 +230,16 @@ if settings.RATE_LIMIT_ENABLED:
 # Add Error Logging Middleware (after CORS for proper request handling)
 app.add_middleware(ErrorLoggingMiddleware)
 
+# Add Response Compression Middleware (outermost, so it also covers error
+# responses and sees the final headers)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 
 # ============================================================================
 # Global Exception Handlers
@@ -367,6 +420,12 @@ async def general_exception_handler(request: Request, exc: Exception):
         extra={"trace_id": trace_id, "path": request.url.path},
     )
 
+    # Answered outside the middleware stack, so ErrorLoggingMiddleware never sees it
+    error_rates.record(
+        ErrorCode.INTERNAL_SERVER_ERROR.value, route_path(request), request.method,
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+
     error_response = create_error_response(
         error_code=ErrorCode.INTERNAL_SERVER_ERROR,
         message="An unexpected error occurred. Please contact support if the problem persists.",
@@ -426,7 +485,7 @@ async def health_check_detailed():
     Detailed health check with comprehensive system diagnostics.
 
     Returns detailed information about all service components including:
-    - Database connectivity and basic stats
+    - Database connectivity and connection pool usage per workload
     - Cache statistics
     - Rate limiter status
     - Memory usage
@@ -453,6 +512,14 @@ async def health_check_detailed():
         db_error = str(e)
         logger.error(f"Health check database ping failed: {e}")
 
+    # Connection pool usage per workload (operations / analytics / jobs)
+    pool_stats = None
+    try:
+        from app.database import pool_metrics
+        pool_stats = pool_metrics()
+    except Exception as e:
+        logger.warning(f"Failed to get pool metrics: {e}")
+
     # Cache statistics
     cache_stats = None
     try:
@@ -475,6 +542,7 @@ async def health_check_detailed():
                 "status": db_status,
                 "latency_ms": db_latency_ms,
                 "error": db_error,
+                "pools": pool_stats,
             },
             "cache": cache_stats,
         },
@@ -500,6 +568,7 @@ async def root():
 # Include API routers
 app.include_router(auth.router, prefix=f"{settings.API_V1_PREFIX}/auth", tags=["Authentication"])
 app.include_router(analytics.router, prefix=f"{settings.API_V1_PREFIX}/analytics", tags=["Analytics"])
+app.include_router(reports.router, prefix=f"{settings.API_V1_PREFIX}/reports", tags=["Reports"])
 app.include_router(dashboard.router, prefix=f"{settings.API_V1_PREFIX}/dashboard", tags=["Dashboard"])
 app.include_router(product_models.router, prefix=settings.API_V1_PREFIX, tags=["Product Models"])
 app.include_router(processes.router, prefix=settings.API_V1_PREFIX, tags=["Processes"])
@@ -4,13 +4,22 @@ Middleware for F2X NeuroHub MES.
 This package contains all FastAPI middleware components.
 
 Usage:
-    from app.middleware import ErrorLoggingMiddleware, RateLimitMiddleware
+    from app.middleware import (
+        CompressionMiddleware,
+        ErrorLoggingMiddleware,
+        IdempotencyMiddleware,
+        RateLimitMiddleware,
+    )
 """
 
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.error_logging import ErrorLoggingMiddleware
+from app.middleware.idempotency import IdempotencyMiddleware
 from app.middleware.rate_limiting import RateLimitMiddleware
 
 __all__ = [
+    "CompressionMiddleware",
     "ErrorLoggingMiddleware",
+    "IdempotencyMiddleware",
     "RateLimitMiddleware",
 ]
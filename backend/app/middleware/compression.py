@@ -0,0 +1,267 @@
+"""
+Response Compression Middleware for F2X NeuroHub MES.
+
+Negotiates Content-Encoding from the client's Accept-Encoding header and
+compresses response bodies on the fly. Statistics, measurement history
+and sequence lists shrink several times over, which matters on plant
+Wi-Fi.
+
+Features:
+    - Brotli (when the ``brotli`` package is installed) and gzip, chosen by
+      Accept-Encoding q-values
+    - Minimum size threshold: small responses are sent as-is
+    - Streaming responses are compressed chunk by chunk and flushed, so
+      exports and other streams are not buffered
+    - Already-compressed payloads (ZIP, PNG, gzip, PDF, Parquet...) are
+      skipped by media type; routes can opt out with ``no_compression``
+    - Responses that are already encoded, partial (206) or advertise
+      byte ranges are never touched
+    - ETags of compressed responses are weakened, since the bytes differ
+      from the identity representation; a 304 repeats the weak form when
+      the client revalidates a compressed copy
+"""
+
+import gzip
+import zlib
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional: pip install f2x-neurohub-backend[compression]
+    brotli = None
+
+
+# Scope key set by app.core.deps.no_compression to opt a route out
+NO_COMPRESSION_SCOPE_KEY = "neurohub.no_compression"
+
+# Payloads that are already compressed (or are event streams that must not
+# be held back by a compressor)
+INCOMPRESSIBLE_MEDIA_TYPES = frozenset({
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "application/x-zip-compressed",
+    "application/pdf",
+    "application/octet-stream",
+    "application/vnd.apache.parquet",
+    "image/png",
+    "image/jpeg",
+    "image/gif",
+    "image/webp",
+    "text/event-stream",
+})
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """Content codings this server can produce, in order of preference."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the content coding for a response.
+
+    Args:
+        accept_encoding: Value of the request's Accept-Encoding header
+
+    Returns:
+        "br" or "gzip", or None to send the identity representation
+    """
+    if not accept_encoding:
+        return None
+    qualities = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        qualities[coding.strip()] = q
+
+    best, best_q = None, 0.0
+    for coding in supported_encodings():
+        q = qualities.get(coding, qualities.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class _Compressor:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+            self._process = self._compressor.process
+            self._flush = self._compressor.flush
+            self._finish = self._compressor.finish
+        else:
+            # wbits 16 + MAX_WBITS produces a gzip container
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._process = self._compressor.compress
+            self._flush = lambda: self._compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._compressor.flush
+
+    def chunk(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it so the client can decode it now."""
+        return self._process(data) + self._flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        """Compress the last chunk and close the stream."""
+        return self._process(data) + self._finish()
+
+
+def compress(data: bytes, encoding: str, gzip_level: int = 5, brotli_quality: int = 4) -> bytes:
+    """Compress a complete body with the given content coding."""
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware compressing responses with br or gzip.
+
+    Implemented without BaseHTTPMiddleware so streaming responses keep
+    streaming.
+
+    Args:
+        app: ASGI application
+        minimum_size: Bodies smaller than this (bytes) are not compressed
+        gzip_level: zlib compression level (1-9)
+        brotli_quality: Brotli quality (0-11); low values suit dynamic responses
+        excluded_media_types: Media types never compressed
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 5,
+        brotli_quality: int = 4,
+        excluded_media_types: frozenset = INCOMPRESSIBLE_MEDIA_TYPES,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.excluded_media_types = excluded_media_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, scope, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Wraps ``send`` for one request, deciding at the first body chunk."""
+
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, encoding: str, send: Send):
+        self.middleware = middleware
+        self.scope = scope
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._compressor: Optional[_Compressor] = None
+        self._passthrough = False
+
+    def _compressible(self, start: Message, body: bytes, more_body: bool) -> bool:
+        if self.scope.get(NO_COMPRESSION_SCOPE_KEY):
+            return False
+        if start["status"] < 200 or start["status"] in (204, 206, 304):
+            return False
+        headers = Headers(raw=start.get("headers", []))
+        if "content-encoding" in headers or headers.get("accept-ranges", "none") != "none":
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if media_type in self.middleware.excluded_media_types:
+            return False
+        return more_body or len(body) >= self.middleware.minimum_size
+
+    def _encoded_headers(self, start: Message) -> MutableHeaders:
+        headers = MutableHeaders(raw=list(start.get("headers", [])))
+        start["headers"] = headers.raw
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        return headers
+
+    def _match_weak_etag(self, start: Message) -> None:
+        """Send a 304's ETag in the weak form the client holds, if it holds that one."""
+        headers = MutableHeaders(raw=list(start.get("headers", [])))
+        etag = headers.get("etag")
+        if not etag or etag.startswith("W/"):
+            return
+        if_none_match = Headers(scope=self.scope).get("if-none-match", "")
+        if f"W/{etag}" in (tag.strip() for tag in if_none_match.split(",")):
+            headers["ETag"] = f"W/{etag}"
+            start["headers"] = headers.raw
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self._start = message
+            return
+        if message_type != "http.response.body" or self._passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor is None:
+            start = self._start
+            if not self._compressible(start, body, more_body):
+                self._passthrough = True
+                if start["status"] == 304:
+                    self._match_weak_etag(start)
+                await self._flush_start()
+                await self._send(message)
+                return
+
+            headers = self._encoded_headers(start)
+            if not more_body:
+                # Whole body in one message: compress it and set its length
+                body = compress(
+                    body, self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+                )
+                headers["Content-Length"] = str(len(body))
+                await self._flush_start()
+                await self._send({"type": "http.response.body", "body": body})
+                return
+
+            del headers["Content-Length"]
+            self._compressor = _Compressor(
+                self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+            )
+            await self._flush_start()
+
+        if more_body:
+            data = self._compressor.chunk(body)
+            if data:
+                await self._send({"type": "http.response.body", "body": data, "more_body": True})
+        else:
+            await self._send({"type": "http.response.body", "body": self._compressor.finish(body)})
+
+    async def _flush_start(self) -> None:
+        if self._start is not None:
+            start, self._start = self._start, None
+            await self._send(start)
+
@@ -6,6 +6,8 @@ to the error_logs table for monitoring, debugging, and analytics purposes.
 
 The middleware integrates with the custom exception system, extracting trace_id
 and error details from StandardErrorResponse to correlate frontend-backend errors.
+Each logged error is also counted in app.core.error_rates, which the middleware
+flushes to the hourly summary behind /error-logs/stats.
 """
 
 import json
@@ -17,6 +19,7 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from app.core.error_rates import error_rates, route_path
 from app.database import SessionLocal
 from app.crud import error_log as error_log_crud
 from app.schemas.error_log import ErrorLogCreate
@@ -35,6 +38,7 @@ class ErrorLoggingMiddleware(BaseHTTPMiddleware):
 
     Features:
         - Automatic error logging for all 4xx/5xx responses
+        - Per-minute error counts by code and route (app.core.error_rates)
         - Trace ID extraction for correlation
         - User tracking (when available from request.state)
         - Non-blocking (errors in logging don't affect API response)
@@ -133,6 +137,11 @@ class ErrorLoggingMiddleware(BaseHTTPMiddleware):
                 )
                 return
 
+            error_rates.record(
+                error_data["error_code"], route_path(request), request.method, response.status_code
+            )
+            self._flush_error_rates(db)
+
             # Extract and normalize details field
             details = error_data.get("details")
             # If details is a list (e.g., from validation errors), wrap it in a dict
@@ -173,3 +182,13 @@ class ErrorLoggingMiddleware(BaseHTTPMiddleware):
                     db.close()
                 except Exception as e:
                     logger.error(f"Failed to close database session: {str(e)}")
+
+    @staticmethod
+    def _flush_error_rates(db) -> None:
+        """Flush error counts to the hourly summary when the flush interval has passed."""
+        if not error_rates.flush_due():
+            return
+        try:
+            error_rates.flush(db)
+        except Exception as e:
+            logger.error(f"Failed to flush error rates: {str(e)}")
@@ -0,0 +1,338 @@
+"""
+Idempotency Middleware for F2X NeuroHub MES.
+
+Makes write requests safe to retry. Stations retry POSTs after 5xx errors
+and timeouts, and equipment integrations can re-submit the same
+completion; without this a retried complete either runs twice or fails
+with "No active process found".
+
+A client sends an ``Idempotency-Key`` header (any unique string, up to
+255 characters) with a POST/PUT/PATCH/DELETE request:
+    - The first request with a key claims it in the idempotency_keys
+      table, runs normally, and its 2xx response is stored.
+    - Later requests with the same key (from the same user or station) get
+      the stored response replayed, marked ``Idempotent-Replayed: true``,
+      without running the endpoint or touching the business tables.
+    - Concurrent duplicates are coalesced: in this worker they queue on a
+      lock per key, across workers they wait for the in-flight claim, and
+      are then answered from the stored response.
+    - Error responses are not stored; the claim is released so a retry
+      runs the request again.
+    - Reusing a key for a different request is rejected with 422.
+
+An in-flight claim is a lease of settings.IDEMPOTENCY_LEASE_SECONDS,
+renewed every third of it while the original request runs, however long
+that takes. If its worker dies the renewals stop and, once the lease
+expires, the next request with the key runs instead of getting 409 for the
+whole TTL. Duplicates give up waiting with 409 after
+settings.IDEMPOTENCY_WAIT_TIMEOUT, independently of the lease. Stored responses expire after settings.IDEMPOTENCY_TTL_SECONDS
+and are swept periodically. Requests without the header are not affected.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import security
+from app.crud import idempotency_key as idempotency_crud
+from app.database import AsyncSessionLocal
+from app.models.idempotency_key import IdempotencyKey
+from app.schemas.error import ErrorCode, StandardErrorResponse
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class _KeyLocks:
+    """asyncio locks per key, dropped when nobody holds or waits for them."""
+
+    def __init__(self):
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._users: Dict[str, int] = {}
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[None]:
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._users[key] = self._users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._users[key] -= 1
+            if not self._users[key]:
+                del self._users[key]
+                del self._locks[key]
+
+
+class IdempotencyMiddleware:
+    """
+    Pure ASGI middleware storing and replaying responses by Idempotency-Key.
+
+    Args:
+        app: ASGI application
+        ttl_seconds: How long a stored response can be replayed
+        wait_timeout: Seconds a duplicate waits for the in-flight original
+            before giving up with 409
+        lease_seconds: Lease of an in-flight claim, renewed while the
+            original runs; a claim of a crashed worker is taken over after it
+        sweep_interval: Seconds between sweeps of expired keys
+        max_response_bytes: Larger responses are not stored
+        poll_interval: Seconds between checks of an in-flight key held by
+            another worker
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        ttl_seconds: int = 86400,
+        wait_timeout: float = 30.0,
+        lease_seconds: float = 60.0,
+        sweep_interval: float = 600.0,
+        max_response_bytes: int = 1024 * 1024,
+        poll_interval: float = 0.05,
+    ):
+        self.app = app
+        self.ttl_seconds = ttl_seconds
+        self.wait_timeout = wait_timeout
+        self.lease_seconds = lease_seconds
+        self.sweep_interval = sweep_interval
+        self.max_response_bytes = max_response_bytes
+        self.poll_interval = poll_interval
+        self._locks = _KeyLocks()
+        self._last_sweep = time.monotonic()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in _WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        client_key = headers.get(IDEMPOTENCY_HEADER)
+        if client_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not client_key or len(client_key) > MAX_KEY_LENGTH:
+            response = _error_response(
+                scope, 400, ErrorCode.VALIDATION_ERROR,
+                f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters",
+            )
+            await response(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        receive = _replay_body(body, receive)
+
+        # Scope the key to the caller so nobody can replay another client's response
+        key = _sha256(_principal(headers).encode(), client_key.encode())
+        request_hash = _sha256(
+            scope["method"].encode(), scope["path"].encode(), scope.get("query_string", b""), body
+        )
+
+        async with self._locks.hold(key):
+            try:
+                record, claimed_at = await self._claim(key, request_hash)
+            except Exception as e:
+                # The key store must not take shop-floor writes down with it
+                logger.error(f"Idempotency store unavailable, running request without it: {e}")
+                await self.app(scope, receive, send)
+                return
+
+            if record is None:
+                await self._run(key, claimed_at, scope, receive, send)
+                return
+
+        if record.request_hash != request_hash:
+            response = _error_response(
+                scope, 422, ErrorCode.VALIDATION_ERROR,
+                "Idempotency-Key was already used for a different request",
+            )
+        elif record.completed:
+            response = Response(
+                content=record.response_body,
+                status_code=record.status_code,
+                media_type=record.content_type,
+                headers={REPLAYED_HEADER: "true"},
+            )
+        else:
+            response = _error_response(
+                scope, 409, ErrorCode.CONCURRENT_MODIFICATION,
+                "A request with this Idempotency-Key is still being processed",
+            )
+        await response(scope, receive, send)
+
+    async def _claim(self, key: str, request_hash: str) -> Tuple[Optional[IdempotencyKey], datetime]:
+        """
+        Claim the key, waiting while another worker's request holds it.
+
+        Returns:
+            Tuple of (existing row or None if claimed, claim time)
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        async with AsyncSessionLocal() as db:
+            while True:
+                claimed_at = datetime.now(timezone.utc)
+                record = await idempotency_crud.claim(
+                    db, key, request_hash, self.lease_seconds, now=claimed_at
+                )
+                if record is None or record.completed or record.request_hash != request_hash:
+                    return record, claimed_at
+                if time.monotonic() >= deadline:
+                    return record, claimed_at
+                await asyncio.sleep(self.poll_interval)
+
+    async def _renew_lease(self, key: str, claimed_at: datetime) -> None:
+        """Keep a claim alive while its request runs (cancelled when it ends)."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with AsyncSessionLocal() as db:
+                    if not await idempotency_crud.renew(db, key, claimed_at, self.lease_seconds):
+                        logger.warning("Idempotency claim lost while its request was running")
+                        return
+            except Exception as e:
+                logger.error(f"Failed to renew idempotency claim: {e}")
+
+    async def _run(
+        self, key: str, claimed_at: datetime, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Run the request, renewing its claim, and store its response if it succeeded."""
+        status_code = 500
+        content_type: Optional[str] = None
+        chunks: List[bytes] = []
+        size = 0
+
+        async def capture(message: Message) -> None:
+            nonlocal status_code, content_type, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = Headers(raw=message.get("headers", [])).get("content-type")
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+                if size <= self.max_response_bytes:
+                    chunks.append(message.get("body", b""))
+            await send(message)
+
+        heartbeat = asyncio.create_task(self._renew_lease(key, claimed_at))
+        try:
+            await self.app(scope, receive, capture)
+        except BaseException:
+            heartbeat.cancel()
+            await self._finish(key, claimed_at, None, None, b"")
+            raise
+        heartbeat.cancel()
+
+        if 200 <= status_code < 300 and size <= self.max_response_bytes:
+            await self._finish(key, claimed_at, status_code, content_type, b"".join(chunks))
+        else:
+            await self._finish(key, claimed_at, None, None, b"")
+
+    async def _finish(
+        self,
+        key: str,
+        claimed_at: datetime,
+        status_code: Optional[int],
+        content_type: Optional[str],
+        body: bytes,
+    ) -> None:
+        """Store the response (status_code set) or release the claim, then sweep if due."""
+        try:
+            async with AsyncSessionLocal() as db:
+                if status_code is None:
+                    await idempotency_crud.release(db, key, claimed_at)
+                elif not await idempotency_crud.complete(
+                    db, key, claimed_at, status_code, content_type, body, self.ttl_seconds
+                ):
+                    logger.warning("Idempotency claim was taken over; response not stored")
+
+                if time.monotonic() - self._last_sweep >= self.sweep_interval:
+                    self._last_sweep = time.monotonic()
+                    purged = await idempotency_crud.purge_expired(db)
+                    if purged:
+                        logger.info(f"Purged {purged} expired idempotency keys")
+        except Exception as e:
+            logger.error(f"Failed to record idempotency key outcome: {e}")
+
+
+def _principal(headers: Headers) -> str:
+    """
+    Authenticated caller of a request: ``user:<id>`` or ``station:<id>``.
+
+    Keyed on the identity rather than the token, so a retry after a token
+    refresh still finds its key. Empty for anonymous or invalid credentials
+    (the endpoint rejects those, and rejections are not stored).
+    """
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    tokens = [token] if scheme.lower() == "bearer" and token else []
+    if headers.get("x-api-key"):
+        tokens.append(headers["x-api-key"])
+
+    for token in tokens:
+        payload = security.decode_access_token(token)
+        if payload is None:
+            continue
+        if payload.get("type") == "station":
+            if payload.get("station_id"):
+                return f"station:{payload['station_id']}"
+        elif payload.get("sub"):
+            return f"user:{payload['sub']}"
+    return ""
+
+
+def _sha256(*parts: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Receive callable yielding the already-read body, then the original stream."""
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+def _error_response(scope: Scope, status_code: int, error_code: ErrorCode, message: str) -> JSONResponse:
+    """Error in the application's standard error format."""
+    error = StandardErrorResponse(
+        error_code=error_code,
+        message=message,
+        timestamp=datetime.utcnow().isoformat(),
+        path=scope["path"],
+        trace_id=str(uuid.uuid4()),
+    )
+    return JSONResponse(status_code=status_code, content=error.model_dump(exclude_none=True))
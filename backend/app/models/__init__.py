@@ -18,6 +18,13 @@ Models:
     - ProductionLine: Production line definitions and capacity
     - Equipment: Manufacturing equipment tracking and maintenance
     - ErrorLog: Centralized error logging for monitoring and debugging
+    - ErrorLogHourly: Hourly error counts behind the error statistics dashboard
+    - SequenceCounter: Atomic LOT / WIP / serial number allocation
+    - ResourceVersion: Per-table change counters behind ETags, shared by all API processes
+    - IdempotencyKey: Stored responses for retried write requests
+    - DailyReportSnapshot: Materialized production/defect aggregates per closed day
+    - search_index: Notes tsvector / FTS5 and identifier trigram search DDL (no model)
+    - audit_search: Audit log BRIN and changed-values GIN index DDL (no model)
 
 Usage:
     from app.models import ProductModel, Process, User, Lot, WIPItem, Serial, ProcessData, WIPProcessHistory, AuditLog, Alert, ProductionLine, Equipment, ErrorLog
@@ -37,6 +44,7 @@ from app.models.wip_process_history import WIPProcessHistory
 from app.models.audit_log import AuditLog, AuditAction
 from app.models.alert import Alert, AlertType, AlertSeverity, AlertStatus
 from app.models.error_log import ErrorLog
+from app.models.error_log_hourly import ErrorLogHourly
 from app.models.print_log import PrintLog, PrintStatus
 
 from app.models.saved_filter import SavedFilter
@@ -44,6 +52,12 @@ from app.models.refresh_token import RefreshToken
 from app.models.station import Station, StationStatus
 from app.models.sequence import Sequence, SequenceVersion, SequenceDeployment
 from app.models.git_sync import GitSyncConfig
+from app.models.sequence_counter import SequenceCounter
+from app.models.resource_version import ResourceVersion
+from app.models.idempotency_key import IdempotencyKey
+from app.models.report_snapshot import DailyReportSnapshot
+from app.models import search_index  # noqa: F401  (registers search DDL on Base.metadata)
+from app.models import audit_search  # noqa: F401  (registers audit log DDL on Base.metadata)
 
 
 __all__ = [
@@ -62,6 +76,7 @@ __all__ = [
     "ProductionLine",
     "Equipment",
     "ErrorLog",
+    "ErrorLogHourly",
     "PrintLog",
     "SavedFilter",
     "RefreshToken",
@@ -70,6 +85,10 @@ __all__ = [
     "SequenceVersion",
     "SequenceDeployment",
     "GitSyncConfig",
+    "SequenceCounter",
+    "ResourceVersion",
+    "IdempotencyKey",
+    "DailyReportSnapshot",
     # Enums
     "UserRole",
     "LotStatus",
@@ -132,12 +132,12 @@ class Alert(Base):
         - FK: fk_alerts_archived_by on archived_by_id → users.id
 
     Indexes:
-        - idx_alerts_status: (status, created_at DESC) WHERE status IN ('UNREAD', 'READ')
-        - idx_alerts_severity: (severity, created_at DESC)
-        - idx_alerts_type: (alert_type, created_at DESC)
-        - idx_alerts_lot: (lot_id, created_at DESC) WHERE lot_id IS NOT NULL
-        - idx_alerts_serial: (serial_id) WHERE serial_id IS NOT NULL
-        - idx_alerts_created_at: (created_at DESC)
+        - idx_alerts_status: (status, created_at DESC, id DESC) WHERE status IN ('UNREAD', 'READ')
+        - idx_alerts_severity: (severity, created_at DESC, id DESC)
+        - idx_alerts_type: (alert_type, created_at DESC, id DESC)
+        - idx_alerts_lot: (lot_id, created_at DESC, id DESC) WHERE lot_id IS NOT NULL
+        - idx_alerts_serial: (serial_id, created_at DESC, id DESC) WHERE serial_id IS NOT NULL
+        - idx_alerts_created_at: (created_at DESC, id DESC)
     """
 
     __tablename__ = "alerts"
@@ -286,30 +286,37 @@ class Alert(Base):
         Index(
             "idx_alerts_status",
             "status",
-            "created_at"
+            "created_at",
+            "id"
         ),
         Index(
             "idx_alerts_severity",
             "severity",
-            "created_at"
+            "created_at",
+            "id"
         ),
         Index(
             "idx_alerts_type",
             "alert_type",
-            "created_at"
+            "created_at",
+            "id"
         ),
         Index(
             "idx_alerts_lot",
             "lot_id",
-            "created_at"
+            "created_at",
+            "id"
         ),
         Index(
             "idx_alerts_serial",
-            "serial_id"
+            "serial_id",
+            "created_at",
+            "id"
         ),
         Index(
             "idx_alerts_created_at",
-            "created_at"
+            "created_at",
+            "id"
         ),
     )
 
@@ -93,14 +93,15 @@ class AuditLog(Base):
 
     Indexes:
         - idx_audit_logs_user: User lookups (B-tree)
-        - idx_audit_logs_entity: Entity history by type and ID (B-tree)
         - idx_audit_logs_action: Action type filtering with time ordering (B-tree)
         - idx_audit_logs_created_at: Time-based queries, primary access pattern (B-tree)
         - idx_audit_logs_user_activity: User activity analysis (B-tree)
-        - idx_audit_logs_entity_history: Complete entity history queries (B-tree)
+        - idx_audit_logs_entity_history: Entity history, covering action and user (B-tree)
         - idx_audit_logs_old_values: JSONB field search on old_values (GIN)
         - idx_audit_logs_new_values: JSONB field search on new_values (GIN)
         - idx_audit_logs_ip_address: IP-based security analysis, partial index (B-tree)
+        - idx_audit_logs_created_at_brin: Date range scans (BRIN, see audit_search)
+        - idx_audit_logs_changes: Changed field / value search (GIN, see audit_search)
 
     Constraints:
         - pk_audit_logs: Composite primary key (id, created_at) due to partitioning
@@ -232,30 +233,30 @@ class AuditLog(Base):
             "idx_audit_logs_user",
             "user_id",
         ),
-        Index(
-            "idx_audit_logs_entity",
-            "entity_type",
-            "entity_id",
-        ),
         Index(
             "idx_audit_logs_action",
             "action",
             "created_at",
+            "id",
         ),
         Index(
             "idx_audit_logs_created_at",
             "created_at",
+            "id",
         ),
         Index(
             "idx_audit_logs_user_activity",
             "user_id",
             "created_at",
+            "id",
         ),
         Index(
             "idx_audit_logs_entity_history",
             "entity_type",
             "entity_id",
             "created_at",
+            "id",
+            postgresql_include=["action", "user_id"],
         ),
 
         # =====================================================================
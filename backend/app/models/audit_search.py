@@ -0,0 +1,62 @@
+"""
+Audit log range and change search structures.
+
+Like search_index, these are not ORM models: the DDL is attached to
+Base.metadata so that create_all (dev databases, tests) builds the same
+structures that migration 20260116_0900 adds to deployed PostgreSQL
+databases. Every statement is idempotent.
+
+PostgreSQL:
+    - audit_changed_values(old_values, new_values): immutable function
+      returning the changed-values document of an UPDATE,
+      {"<field>": {"old": <before>, "new": <after>}, ...} for every field
+      get_changed_fields() reports; empty unless both snapshots are objects
+      (CREATE and DELETE)
+    - idx_audit_logs_changes: GIN (jsonb_path_ops) index on that document, so
+      "who changed field X (to value Y)" is a containment (@>) lookup
+    - idx_audit_logs_created_at_brin: BRIN index on created_at; the table is
+      append-only, so block ranges follow time and date range scans read only
+      the matching ranges from an index of a few pages
+
+SQLite has neither index type; crud.audit_log compares json_extract() of the
+two snapshots there instead.
+"""
+
+from sqlalchemy import event, text
+
+from app.database import Base
+
+CHANGES_FUNCTION = "audit_changed_values"
+
+_POSTGRESQL_DDL = (
+    f"""
+    CREATE OR REPLACE FUNCTION {CHANGES_FUNCTION}(old_values jsonb, new_values jsonb)
+    RETURNS jsonb LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT coalesce(
+            jsonb_object_agg(key, jsonb_build_object('old', old_values -> key, 'new', new_values -> key)),
+            '{{}}'::jsonb
+        )
+        FROM (
+            SELECT jsonb_object_keys(CASE WHEN jsonb_typeof(old_values) = 'object' THEN old_values ELSE '{{}}' END)
+            UNION
+            SELECT jsonb_object_keys(CASE WHEN jsonb_typeof(new_values) = 'object' THEN new_values ELSE '{{}}' END)
+        ) AS fields (key)
+        WHERE jsonb_typeof(old_values) = 'object'
+            AND jsonb_typeof(new_values) = 'object'
+            AND old_values -> key IS DISTINCT FROM new_values -> key
+    $$
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_audit_logs_changes ON audit_logs "
+    f"USING gin ({CHANGES_FUNCTION}(old_values, new_values) jsonb_path_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_audit_logs_created_at_brin ON audit_logs USING brin (created_at)",
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_audit_search_structures(target, connection, **kw):
+    """Create the change document function and audit log indexes on PostgreSQL."""
+    dialect = connection.dialect
+    if dialect.name != "postgresql" or not dialect.has_table(connection, "audit_logs"):
+        return
+    for statement in _POSTGRESQL_DDL:
+        connection.execute(text(statement))
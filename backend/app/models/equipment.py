@@ -246,6 +246,11 @@ class Equipment(Base):
             "idx_equipment_code",
             equipment_code,
         ),
+        Index(
+            "idx_equipment_next_maintenance",
+            next_maintenance_date,
+            id,
+        ),
     )
 
     def __repr__(self) -> str:
@@ -65,12 +65,12 @@ class ErrorLog(Base):
         - CHECK: chk_error_logs_method - method IN ('GET', 'POST', 'PUT', 'DELETE', 'PATCH', etc.)
 
     Indexes:
-        - idx_error_logs_timestamp: (timestamp DESC)
-        - idx_error_logs_error_code: (error_code, timestamp DESC)
+        - idx_error_logs_timestamp: (timestamp DESC, id DESC)
+        - idx_error_logs_error_code: (error_code, timestamp DESC, id DESC)
         - idx_error_logs_trace_id: (trace_id) UNIQUE
-        - idx_error_logs_user_id: (user_id, timestamp DESC) WHERE user_id IS NOT NULL
-        - idx_error_logs_path: (path, timestamp DESC) WHERE path IS NOT NULL
-        - idx_error_logs_status_code: (status_code, timestamp DESC)
+        - idx_error_logs_user_id: (user_id, timestamp DESC, id DESC) WHERE user_id IS NOT NULL
+        - idx_error_logs_path: (path, timestamp DESC, id DESC) WHERE path IS NOT NULL
+        - idx_error_logs_status_code: (status_code, timestamp DESC, id DESC)
         - idx_error_logs_details: GIN index on details JSONB
 
     Partitioning:
@@ -160,13 +160,15 @@ class ErrorLog(Base):
         Index(
             "idx_error_logs_timestamp",
             "timestamp",
-            postgresql_ops={"timestamp": "DESC"}
+            "id",
+            postgresql_ops={"timestamp": "DESC", "id": "DESC"}
         ),
         Index(
             "idx_error_logs_error_code_timestamp",
             "error_code",
             "timestamp",
-            postgresql_ops={"timestamp": "DESC"}
+            "id",
+            postgresql_ops={"timestamp": "DESC", "id": "DESC"}
         ),
         Index(
             "idx_error_logs_trace_id",
@@ -177,21 +179,24 @@ class ErrorLog(Base):
             "idx_error_logs_user_id_timestamp",
             "user_id",
             "timestamp",
-            postgresql_ops={"timestamp": "DESC"},
+            "id",
+            postgresql_ops={"timestamp": "DESC", "id": "DESC"},
             postgresql_where=user_id.isnot(None)
         ),
         Index(
             "idx_error_logs_path_timestamp",
             "path",
             "timestamp",
-            postgresql_ops={"timestamp": "DESC"},
+            "id",
+            postgresql_ops={"timestamp": "DESC", "id": "DESC"},
             postgresql_where=path.isnot(None)
         ),
         Index(
             "idx_error_logs_status_code_timestamp",
             "status_code",
             "timestamp",
-            postgresql_ops={"timestamp": "DESC"}
+            "id",
+            postgresql_ops={"timestamp": "DESC", "id": "DESC"}
         ),
         Index(
             "idx_error_logs_details_gin",
@@ -0,0 +1,69 @@
+"""
+Hourly error count model for the error statistics dashboard.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class ErrorLogHourly(Base):
+    """
+    Number of logged errors per hour, error code, path template, method and status.
+
+    Written by app.core.error_rates (``INSERT ... ON CONFLICT`` adding to
+    count), so every API process can flush its share of an hour into the same
+    row. The /error-logs/stats queries read these rows instead of grouping
+    error_logs, which stays the source for drill-down.
+
+    Attributes:
+        hour: Start of the hour (UTC)
+        error_code: Standardized error code (e.g., RES_002)
+        path: Route template (e.g., /api/v1/lots/{lot_id}); "(unmatched)" when
+            no route matched
+        method: HTTP method
+        status_code: HTTP status code
+        count: Errors in the hour
+    """
+
+    __tablename__ = "error_log_hourly"
+
+    hour: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True
+    )
+
+    error_code: Mapped[str] = mapped_column(
+        String(20),
+        primary_key=True
+    )
+
+    path: Mapped[str] = mapped_column(
+        String(500),
+        primary_key=True
+    )
+
+    method: Mapped[str] = mapped_column(
+        String(10),
+        primary_key=True
+    )
+
+    status_code: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True
+    )
+
+    count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ErrorLogHourly(hour={self.hour}, error_code='{self.error_code}', "
+            f"{self.method} {self.path}, count={self.count})>"
+        )
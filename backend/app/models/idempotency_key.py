@@ -0,0 +1,91 @@
+"""
+Idempotency Key model for safe retries of write requests.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import DateTime, Index, Integer, LargeBinary, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Stored outcome of a write request sent with an ``Idempotency-Key`` header.
+
+    A row is claimed (status_code NULL) when the first request with a key
+    starts and completed with its response when it succeeds, so retries and
+    concurrent duplicates are answered from this table by
+    app.middleware.idempotency without running the endpoint again. A claim
+    is leased for settings.IDEMPOTENCY_LEASE_SECONDS and renewed while its
+    request runs, a completed row expires after
+    settings.IDEMPOTENCY_TTL_SECONDS; expired rows are swept periodically.
+
+    Attributes:
+        key: SHA-256 of the authenticated caller (user or station) and the client's key
+        request_hash: SHA-256 of method, path, query and body of the first request
+        status_code: Response status (NULL while the first request is in flight)
+        content_type: Response Content-Type
+        response_body: Response body
+        response_hash: SHA-256 of the response body
+        created_at: Claim timestamp (identifies the claim)
+        expires_at: End of the claim's lease, or of the stored response's TTL
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True
+    )
+
+    request_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False
+    )
+
+    status_code: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True
+    )
+
+    content_type: Mapped[Optional[str]] = mapped_column(
+        String(100),
+        nullable=True
+    )
+
+    response_body: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary,
+        nullable=True
+    )
+
+    response_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=text("CURRENT_TIMESTAMP")
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
+
+    __table_args__ = (
+        Index("idx_idempotency_keys_expires_at", "expires_at"),
+    )
+
+    @property
+    def completed(self) -> bool:
+        """Whether the first request finished and its response is stored."""
+        return self.status_code is not None
+
+    def __repr__(self) -> str:
+        return f"<IdempotencyKey(key={self.key[:12]!r}, status_code={self.status_code})>"
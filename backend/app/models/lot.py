@@ -248,7 +248,7 @@ class Lot(Base):
         Index("idx_lots_production_line", "production_line_id"),
 
         # Status-based queries
-        Index("idx_lots_status", "status"),
+        Index("idx_lots_status", "status", "production_date", "lot_number"),
 
         # Active LOTs index (frequently queried)
         Index(
@@ -258,13 +258,16 @@ class Lot(Base):
         ),
 
         # Date range queries
-        Index("idx_lots_production_date", "production_date"),
+        Index("idx_lots_production_date", "production_date", "lot_number"),
 
         # Composite index for filtering
-        Index("idx_lots_model_date", "product_model_id", "production_date"),
+        Index("idx_lots_model_date", "product_model_id", "production_date", "lot_number"),
 
         # Closed LOTs index (for archival)
         Index("idx_lots_closed_at", "closed_at"),
+
+        # Keyset pagination (newest first)
+        Index("idx_lots_created_at", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
@@ -337,6 +337,8 @@ class ProcessData(Base):
         Index(
             "idx_process_data_lot",
             lot_id,
+            created_at,
+            id,
         ),
         Index(
             "idx_process_data_serial",
@@ -349,10 +351,14 @@ class ProcessData(Base):
         Index(
             "idx_process_data_process",
             process_id,
+            created_at,
+            id,
         ),
         Index(
             "idx_process_data_operator",
             operator_id,
+            created_at,
+            id,
         ),
         Index(
             "idx_process_data_equipment",
@@ -382,12 +388,24 @@ class ProcessData(Base):
         # TIME-BASED INDEXES FOR ANALYTICS
         Index(
             "idx_process_data_started_at",
-            "started_at"
+            "started_at",
+            "id",
         ),
         Index(
             "idx_process_data_completed_at",
             "completed_at"
         ),
+        Index(
+            "idx_process_data_created_at",
+            created_at,
+            id,
+        ),
+        Index(
+            "idx_process_data_incomplete",
+            started_at,
+            id,
+            postgresql_where=completed_at.is_(None),
+        ),
 
         # SPECIALIZED INDEXES
         Index(
@@ -400,6 +418,7 @@ class ProcessData(Base):
         Index(
             "idx_process_data_measurements",
             measurements,
+            postgresql_using="gin",
         ),
         Index(
             "idx_process_data_defects",
@@ -88,6 +88,7 @@ class ProcessHeader(Base):
         - closed_at must be >= opened_at if both set
         - All count fields must be >= 0
         - Unique partial index: one OPEN header per station+batch+process
+        - Unique partial index: one OPEN header per station slot (1-12)
 
     Business Rules:
         - A header is created when a batch starts processing for a specific process
@@ -267,6 +268,10 @@ class ProcessHeader(Base):
             "total_count >= 0 AND pass_count >= 0 AND fail_count >= 0",
             name="chk_process_headers_counts",
         ),
+        CheckConstraint(
+            "slot_id IS NULL OR (slot_id >= 1 AND slot_id <= 12)",
+            name="chk_process_headers_slot_id_range",
+        ),
 
         # INDEXES
         Index("idx_process_headers_station", station_id),
@@ -285,6 +290,14 @@ class ProcessHeader(Base):
             unique=True,
             postgresql_where=text("status = 'OPEN'"),
         ),
+        # Unique partial index: one OPEN header per station slot
+        Index(
+            "uk_process_headers_station_slot",
+            station_id, slot_id,
+            unique=True,
+            postgresql_where=text("status = 'OPEN' AND slot_id IS NOT NULL"),
+        ),
+        Index("idx_process_headers_slot_id", slot_id),
         # GIN indexes for JSONB
         Index(
             "idx_process_headers_parameters",
@@ -0,0 +1,58 @@
+"""
+Daily Report Snapshot model for materialized production reports.
+"""
+
+from datetime import date, datetime, timezone
+
+from sqlalchemy import Date, DateTime, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base, JSONBList
+
+
+class DailyReportSnapshot(Base):
+    """
+    Production and defect aggregates of one closed day.
+
+    Written by the nightly app.tasks.report_tasks.materialize_daily_reports
+    task, which rewrites the last few closed days (late uploads, corrections)
+    and then leaves a row alone, so historical reports read one row per day
+    instead of scanning process_data. Only today is aggregated live (see
+    app.services.report_service).
+
+    Attributes:
+        report_date: Day the aggregates cover (in settings.REPORT_TIMEZONE)
+        production: Rows per (process, production line): started, completed,
+            pass_count, fail_count, rework_count, duration_sum, duration_count
+        defects: Rows per (process, defect type): defect_count
+        created_at: Timestamp of the latest materialization
+    """
+
+    __tablename__ = "daily_report_snapshots"
+
+    report_date: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True
+    )
+
+    production: Mapped[list] = mapped_column(
+        JSONBList,
+        nullable=False,
+        default=list
+    )
+
+    defects: Mapped[list] = mapped_column(
+        JSONBList,
+        nullable=False,
+        default=list
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=text("CURRENT_TIMESTAMP")
+    )
+
+    def __repr__(self) -> str:
+        return f"<DailyReportSnapshot(report_date={self.report_date}, rows={len(self.production)})>"
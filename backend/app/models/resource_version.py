@@ -0,0 +1,50 @@
+"""
+Resource Version model for change tracking shared by all API processes.
+"""
+
+from datetime import datetime, timezone
+from sqlalchemy import BigInteger, String, DateTime, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class ResourceVersion(Base):
+    """
+    Change counter of a tracked table.
+
+    One row per resource (table name), incremented by app.core.change_tracker
+    right after a write commits, so every API process derives the same ETags
+    and cache keys from it. New rows start at the current time in
+    milliseconds, so a recreated row never repeats an earlier version.
+
+    Attributes:
+        resource: Resource name (table name of a tracked model)
+        version: Current version
+        updated_at: Last change timestamp
+    """
+
+    __tablename__ = "resource_versions"
+
+    resource: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True
+    )
+
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default=text("0")
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=text("CURRENT_TIMESTAMP")
+    )
+
+    def __repr__(self) -> str:
+        return f"<ResourceVersion(resource={self.resource!r}, version={self.version})>"
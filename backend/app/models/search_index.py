@@ -0,0 +1,88 @@
+"""
+Full-text and identifier search structures.
+
+These are not ORM models: the DDL is attached to Base.metadata so that
+create_all (dev databases, tests) builds the same search structures that
+migration 20260113_0900 adds to deployed PostgreSQL databases. Every statement
+is idempotent, so existing databases pick them up on the next create_all.
+
+PostgreSQL:
+    - process_data.notes_tsv: stored generated tsvector over notes (GIN indexed),
+      so searches no longer compute to_tsvector per row
+    - pg_trgm GIN indexes on serials.serial_number, lots.lot_number and
+      wip_items.wip_id for substring (ILIKE '%...%') lookups
+
+SQLite:
+    - process_data_fts: external-content FTS5 shadow table over
+      process_data.notes, kept in sync by triggers
+"""
+
+from sqlalchemy import event, text
+
+from app.database import Base
+
+NOTES_TSV_COLUMN = "notes_tsv"
+NOTES_FTS_TABLE = "process_data_fts"
+
+# (index, table, column) of the identifier trigram indexes
+TRIGRAM_INDEXES = (
+    ("idx_serials_serial_number_trgm", "serials", "serial_number"),
+    ("idx_lots_lot_number_trgm", "lots", "lot_number"),
+    ("idx_wip_items_wip_id_trgm", "wip_items", "wip_id"),
+)
+
+_POSTGRESQL_NOTES_DDL = (
+    "ALTER TABLE process_data ADD COLUMN IF NOT EXISTS notes_tsv tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('english', coalesce(notes, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS idx_process_data_notes_tsv ON process_data USING gin (notes_tsv)",
+)
+
+_SQLITE_NOTES_DDL = (
+    "CREATE VIRTUAL TABLE process_data_fts USING fts5(notes, content='process_data', content_rowid='id')",
+    """
+    CREATE TRIGGER process_data_fts_insert AFTER INSERT ON process_data BEGIN
+        INSERT INTO process_data_fts (rowid, notes) VALUES (new.id, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER process_data_fts_delete AFTER DELETE ON process_data BEGIN
+        INSERT INTO process_data_fts (process_data_fts, rowid, notes) VALUES ('delete', old.id, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER process_data_fts_update AFTER UPDATE OF notes ON process_data BEGIN
+        INSERT INTO process_data_fts (process_data_fts, rowid, notes) VALUES ('delete', old.id, old.notes);
+        INSERT INTO process_data_fts (rowid, notes) VALUES (new.id, new.notes);
+    END
+    """,
+    # Index rows written before the shadow table existed
+    "INSERT INTO process_data_fts (process_data_fts) VALUES ('rebuild')",
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_search_structures(target, connection, **kw):
+    """Create the search column, indexes or FTS5 table for the connection's dialect."""
+    dialect = connection.dialect
+    if not dialect.has_table(connection, "process_data"):
+        return
+
+    if dialect.name == "postgresql":
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for statement in _POSTGRESQL_NOTES_DDL:
+            connection.execute(text(statement))
+        for index, table, column in TRIGRAM_INDEXES:
+            if dialect.has_table(connection, table):
+                connection.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index} ON {table} USING gin ({column} gin_trgm_ops)"
+                ))
+    elif dialect.name == "sqlite" and not dialect.has_table(connection, NOTES_FTS_TABLE):
+        for statement in _SQLITE_NOTES_DDL:
+            connection.execute(text(statement))
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def drop_search_structures(target, connection, **kw):
+    """Drop the SQLite shadow table; PostgreSQL objects go with their tables."""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {NOTES_FTS_TABLE}"))
@@ -0,0 +1,50 @@
+"""
+Sequence Counter model for contention-free number allocation.
+"""
+
+from datetime import datetime, timezone
+from sqlalchemy import BigInteger, String, DateTime, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class SequenceCounter(Base):
+    """
+    Last allocated number per numbering scope.
+
+    One row per scope, e.g. ``lot:KR01PSA2511`` (LOT sequence within a
+    line/model/month), ``wip:42`` or ``serial:42`` (sequence within LOT 42).
+    Rows are incremented with a single ``UPDATE ... RETURNING`` by
+    app.crud.sequence_counter.
+
+    Attributes:
+        scope: Numbering scope key
+        last_value: Last allocated number (0 = nothing allocated yet)
+        updated_at: Last allocation timestamp
+    """
+
+    __tablename__ = "sequence_counters"
+
+    scope: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True
+    )
+
+    last_value: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default=text("0")
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=text("CURRENT_TIMESTAMP")
+    )
+
+    def __repr__(self) -> str:
+        return f"<SequenceCounter(scope={self.scope!r}, last_value={self.last_value})>"
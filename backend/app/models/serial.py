@@ -221,7 +221,10 @@ class Serial(Base):
         # Status-based queries
         Index(
             "idx_serials_status",
-            "status"
+            "status",
+            "lot_id",
+            "sequence_in_lot",
+            "id"
         ),
         # Active serials (partial index for performance)
         Index(
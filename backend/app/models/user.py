@@ -183,7 +183,9 @@ class User(Base):
             "role"),
         Index(
             "idx_users_role",
-            "role"
+            "role",
+            "created_at",
+            "id",
         ),
         Index(
             "idx_users_department",
@@ -192,6 +194,11 @@ class User(Base):
             "idx_users_last_login",
             "last_login_at"
         ),
+        Index(
+            "idx_users_created_at",
+            "created_at",
+            "id",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -269,6 +269,8 @@ class WIPItem(Base):
         Index(
             "idx_wip_items_status",
             status,
+            created_at,
+            id,
         ),
         Index(
             "idx_wip_items_active",
@@ -285,6 +287,11 @@ class WIPItem(Base):
             "idx_wip_items_converted_at",
             converted_at,
         ),
+        Index(
+            "idx_wip_items_created_at",
+            created_at,
+            id,
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1,5 +1,5 @@
-from typing import List, Optional, Any, Union, Dict
-from pydantic import BaseModel
+from typing import List, Optional, Any, Union, Dict, Literal
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 class DateRange(BaseModel):
@@ -12,21 +12,28 @@ class SearchFilters(BaseModel):
     date_range: Optional[DateRange] = None
 
 class FilterExpression(BaseModel):
-    field: str
-    operator: str  # eq, gt, lt, contains, in, etc.
-    value: Any
+    field: str  # column name, or measurements.<key> for JSONB measurement values
+    operator: str  # eq, neq, gt, gte, lt, lte, between, in, is_null, startswith, exists
+    value: Any = None
+
+class FilterGroup(BaseModel):
+    op: Literal["and", "or"] = "and"
+    filters: List[Union["FilterGroup", FilterExpression]] = Field(..., min_length=1)
+
+FilterNode = Union[FilterGroup, FilterExpression]
 
 class FilterRequest(BaseModel):
-    filters: List[FilterExpression]
+    filters: List[FilterNode]  # combined with AND
     sort_by: Optional[str] = None
-    sort_order: str = "asc"
-    limit: int = 100
+    sort_order: Literal["asc", "desc"] = "asc"
+    limit: int = Field(100, ge=1, le=1000)
+    cursor: Optional[str] = None  # next_cursor of the previous page
+    include_total: bool = True
 
 class SaveFilterRequest(BaseModel):
     name: str
     description: Optional[str] = None
-    filters: List[Dict[str, Any]] # Serialized FilterExpressions
+    filters: List[Dict[str, Any]] # Serialized FilterExpressions / FilterGroups
+    sort_by: Optional[str] = None
+    sort_order: Literal["asc", "desc"] = "asc"
     is_shared: bool = False
-
-# Helper for type checking
-from typing import Dict
@@ -417,9 +417,9 @@ class WIPStatistics(BaseModel):
     completed: int = Field(..., ge=0, description="WIP items in COMPLETED status")
     failed: int = Field(..., ge=0, description="WIP items in FAILED status")
     converted: int = Field(..., ge=0, description="WIP items in CONVERTED status")
-    by_lot: Optional[dict] = Field(
+    by_lot: Optional[list] = Field(
         None,
-        description="Statistics grouped by LOT identifier"
+        description="Statistics per LOT (lot_id, lot_number, quantities, current process)"
     )
     by_process: Optional[dict] = Field(
         None,
@@ -1,7 +1,7 @@
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 from sqlalchemy import func, and_, or_, Integer
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.models import (
     Lot, Serial, ProcessData, Process, User,
@@ -9,6 +9,7 @@ from app.models import (
 )
 from app.models.wip_item import WIPItem, WIPStatus
 from app.core.cache import cached, invalidate_cache
+from app.core.change_tracker import change_tracker
 
 
 class AnalyticsService:
@@ -624,53 +625,31 @@ class AnalyticsService:
 
         active_lots = (
             db.query(Lot)
+            .options(joinedload(Lot.product_model))
             .order_by(Lot.created_at.desc())
             .limit(10)
             .all()
         )
 
+        # WIP counts per LOT and status in one grouped query
+        lot_status_counts: Dict[int, Dict[str, int]] = {lot.id: {} for lot in active_lots}
+        if active_lots:
+            rows = db.query(WIPItem.lot_id, WIPItem.status, func.count(WIPItem.id)).filter(
+                WIPItem.lot_id.in_(lot_status_counts)
+            ).group_by(WIPItem.lot_id, WIPItem.status).all()
+            for lot_id, status, count in rows:
+                lot_status_counts[lot_id][status] = count
+
         lots_summary = []
         for lot in active_lots:
-            wip_started = db.query(func.count(WIPItem.id)).filter(
-                WIPItem.lot_id == lot.id
-            ).scalar() or 0
-
-            wip_completed = db.query(func.count(WIPItem.id)).filter(
-                and_(
-                    WIPItem.lot_id == lot.id,
-                    WIPItem.status.in_([WIPStatus.COMPLETED, WIPStatus.CONVERTED])
-                )
-            ).scalar() or 0
-
-            wip_failed = db.query(func.count(WIPItem.id)).filter(
-                and_(
-                    WIPItem.lot_id == lot.id,
-                    WIPItem.status == WIPStatus.FAILED
-                )
-            ).scalar() or 0
-
-            wip_in_progress = db.query(func.count(WIPItem.id)).filter(
-                and_(
-                    WIPItem.lot_id == lot.id,
-                    WIPItem.status == WIPStatus.IN_PROGRESS
-                )
-            ).scalar() or 0
-
-            # Count WIPs with CREATED status (newly created, not started)
-            wip_created = db.query(func.count(WIPItem.id)).filter(
-                and_(
-                    WIPItem.lot_id == lot.id,
-                    WIPItem.status == WIPStatus.CREATED
-                )
-            ).scalar() or 0
-
+            counts = lot_status_counts[lot.id]
+            wip_started = sum(counts.values())
+            wip_created = counts.get(WIPStatus.CREATED.value, 0)
+            wip_in_progress = counts.get(WIPStatus.IN_PROGRESS.value, 0)
+            wip_failed = counts.get(WIPStatus.FAILED.value, 0)
             # Count only CONVERTED WIPs (converted to serial)
-            wip_converted = db.query(func.count(WIPItem.id)).filter(
-                and_(
-                    WIPItem.lot_id == lot.id,
-                    WIPItem.status == WIPStatus.CONVERTED
-                )
-            ).scalar() or 0
+            wip_converted = counts.get(WIPStatus.CONVERTED.value, 0)
+            wip_completed = counts.get(WIPStatus.COMPLETED.value, 0) + wip_converted
 
             # Progress based on converted/target
             progress = (wip_converted / lot.target_quantity * 100) if lot.target_quantity > 0 else 0
@@ -693,55 +672,43 @@ class AnalyticsService:
 
         process_wip = []
         processes = db.query(Process).filter(Process.is_active == True).order_by(Process.sort_order).all()
-
+        by_number = {}
         for process in processes:
-            wip_at_process = db.query(func.count(WIPItem.id)).filter(
+            by_number.setdefault(process.process_number, process)
+
+        in_progress_at = dict(
+            db.query(WIPItem.current_process_id, func.count(WIPItem.id)).filter(
+                WIPItem.status == WIPStatus.IN_PROGRESS
+            ).group_by(WIPItem.current_process_id).all()
+        )
+
+        # Passed processes of the active WIPs, fetched once instead of per WIP and process
+        active_wips = db.query(WIPItem.id).filter(
+            WIPItem.status.in_([WIPStatus.CREATED.value, WIPStatus.IN_PROGRESS.value])
+        )
+        wip_ids = [wip_id for (wip_id,) in active_wips.all()]
+        passed = set(
+            db.query(ProcessData.wip_id, ProcessData.process_id).filter(
                 and_(
-                    WIPItem.current_process_id == process.id,
-                    WIPItem.status == WIPStatus.IN_PROGRESS
+                    ProcessData.wip_id.in_(active_wips.scalar_subquery()),
+                    ProcessData.result == ProcessResult.PASS.value,
+                    ProcessData.completed_at.isnot(None)
                 )
-            ).scalar() or 0
-            
-            wips_active = db.query(WIPItem.id).filter(
-                WIPItem.status.in_([WIPStatus.CREATED.value, WIPStatus.IN_PROGRESS.value])
-            ).all()
-            
+            ).distinct().all()
+        ) if wip_ids else set()
+
+        for process in processes:
+            prev_process = by_number.get(process.process_number - 1)
             waiting_count = 0
-            for (wip_id,) in wips_active:
-                has_completed = db.query(func.count(ProcessData.id)).filter(
-                    and_(
-                        ProcessData.wip_id == wip_id,
-                        ProcessData.process_id == process.id,
-                        ProcessData.result == ProcessResult.PASS.value,
-                        ProcessData.completed_at.isnot(None)
-                    )
-                ).scalar() or 0
-                
-                if has_completed == 0:
-                    if process.process_number == 1:
-                        waiting_count += 1
-                    else:
-                        prev_process = db.query(Process).filter(
-                            and_(
-                                Process.process_number == process.process_number - 1,
-                                Process.is_active == True
-                            )
-                        ).first()
-                        
-                        if prev_process:
-                            prev_completed = db.query(func.count(ProcessData.id)).filter(
-                                and_(
-                                    ProcessData.wip_id == wip_id,
-                                    ProcessData.process_id == prev_process.id,
-                                    ProcessData.result == ProcessResult.PASS.value,
-                                    ProcessData.completed_at.isnot(None)
-                                )
-                            ).scalar() or 0
-                            
-                            if prev_completed > 0:
-                                waiting_count += 1
-            
-            total_wip = wip_at_process + waiting_count
+            for wip_id in wip_ids:
+                if (wip_id, process.id) in passed:
+                    continue
+                if process.process_number == 1:
+                    waiting_count += 1
+                elif prev_process and (wip_id, prev_process.id) in passed:
+                    waiting_count += 1
+
+            total_wip = in_progress_at.get(process.id, 0) + waiting_count
 
             process_wip.append({
                 "process_name": process.process_name_en,
@@ -891,3 +858,16 @@ class AnalyticsService:
         ]
 
 analytics_service = AnalyticsService()
+
+
+# Dashboard endpoints answer with ETags from these counters; drop the cached
+# aggregates on change so a new ETag is never paired with a pre-change body
+_DASHBOARD_RESOURCES = frozenset({"wip_items", "lots", "processes", "process_data", "product_models"})
+
+
+def _invalidate_dashboard_cache(changed: FrozenSet[str]) -> None:
+    if changed & _DASHBOARD_RESOURCES:
+        invalidate_cache("dashboard")
+
+
+change_tracker.subscribe(_invalidate_dashboard_cache)
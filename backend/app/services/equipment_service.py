@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, List, Optional, Sequence
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
@@ -36,11 +36,12 @@ class EquipmentService(BaseService[Equipment]):
         self,
         db: Session,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[EquipmentInDB]:
         """List all equipment with pagination."""
         try:
-            return crud.equipment.get_multi(db, skip=skip, limit=limit)
+            return crud.equipment.get_multi(db, skip=skip, limit=limit, after=after)
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="list")
 
@@ -48,11 +49,12 @@ class EquipmentService(BaseService[Equipment]):
         self,
         db: Session,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[EquipmentInDB]:
         """Get active equipment with pagination."""
         try:
-            return crud.equipment.get_active(db, skip=skip, limit=limit)
+            return crud.equipment.get_active(db, skip=skip, limit=limit, after=after)
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_active")
 
@@ -60,12 +62,13 @@ class EquipmentService(BaseService[Equipment]):
         self,
         db: Session,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[EquipmentInDB]:
         """Get equipment that needs maintenance."""
         try:
             return crud.equipment.get_needs_maintenance(
-                db, skip=skip, limit=limit
+                db, skip=skip, limit=limit, after=after
             )
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_needs_maintenance")
@@ -75,12 +78,13 @@ class EquipmentService(BaseService[Equipment]):
         db: Session,
         equipment_type: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[EquipmentInDB]:
         """Get equipment filtered by type."""
         try:
             return crud.equipment.get_by_type(
-                db, equipment_type=equipment_type, skip=skip, limit=limit
+                db, equipment_type=equipment_type, skip=skip, limit=limit, after=after
             )
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_by_type")
@@ -90,13 +94,14 @@ class EquipmentService(BaseService[Equipment]):
         db: Session,
         production_line_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[EquipmentInDB]:
         """Get equipment filtered by production line."""
         try:
             return crud.equipment.get_by_production_line(
                 db, production_line_id=production_line_id,
-                skip=skip, limit=limit
+                skip=skip, limit=limit, after=after
             )
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_by_production_line")
@@ -106,12 +111,13 @@ class EquipmentService(BaseService[Equipment]):
         db: Session,
         process_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[EquipmentInDB]:
         """Get equipment filtered by process."""
         try:
             return crud.equipment.get_by_process(
-                db, process_id=process_id, skip=skip, limit=limit
+                db, process_id=process_id, skip=skip, limit=limit, after=after
             )
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_by_process")
@@ -0,0 +1,591 @@
+"""
+Streaming export of process data and WIP process history.
+
+Rows are read from a server-side cursor (``stream_results`` + ``yield_per``)
+and encoded batch by batch, so memory stays constant regardless of how
+many rows an export has:
+    - csv / ndjson: one encoded chunk per batch, optionally gzip-compressed
+      on the fly
+    - parquet: one row group per batch (needs the optional pyarrow
+      dependency; compressed with the Parquet gzip codec)
+
+Measurements are flattened into ``m.<code>`` columns. The column set is
+collected by a first streamed pass over the measurements column only.
+
+Small exports stream straight into the HTTP response. Large ones run as a
+background job (see app.tasks.process_tasks.export_process_data) that
+writes the file to EXPORT_DIR and reports progress through its ProcessJob;
+the finished file is served with Range support.
+
+Example:
+    query = ExportQuery(source="process_data", start_date=start, end_date=end)
+    for chunk in export_service.stream(db, query, "csv", compress=True):
+        out.write(chunk)
+"""
+
+import csv
+import io
+import logging
+import os
+import tempfile
+import uuid
+import zlib
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import Select, func, literal, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import settings
+from app.core.responses import dumps
+from app.models.equipment import Equipment
+from app.models.job import ProcessJob
+from app.models.lot import Lot
+from app.models.process import Process
+from app.models.process_data import ProcessData
+from app.models.serial import Serial
+from app.models.user import User
+from app.models.wip_item import WIPItem
+from app.models.wip_process_history import WIPProcessHistory
+
+logger = logging.getLogger(__name__)
+
+EXPORT_SOURCES = ("process_data", "wip_history")
+EXPORT_FORMATS = ("csv", "ndjson", "parquet")
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Columns before the flattened measurements, in file order
+BASE_COLUMNS = (
+    "id",
+    "lot_number",
+    "wip_id",
+    "serial_number",
+    "process_number",
+    "process_code",
+    "data_level",
+    "result",
+    "operator",
+    "equipment_code",
+    "started_at",
+    "completed_at",
+    "duration_seconds",
+)
+MEASUREMENT_PREFIX = "m."
+
+# Rows fetched per round trip / encoded per chunk (and per Parquet row group)
+BATCH_SIZE = 5000
+
+# ProcessJob progress is written at most once per this many rows
+_PROGRESS_EVERY = 5 * BATCH_SIZE
+
+
+@dataclass
+class ExportQuery:
+    """Rows to export: a source table and optional filters."""
+
+    source: str = "process_data"
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    process_id: Optional[int] = None
+    lot_id: Optional[int] = None
+
+    def __post_init__(self):
+        if self.source not in EXPORT_SOURCES:
+            raise ValueError(
+                f"Invalid export source: {self.source}. Valid values: {', '.join(EXPORT_SOURCES)}"
+            )
+        if self.start_date and self.end_date and self.start_date > self.end_date:
+            raise ValueError("start_date must be before or equal to end_date")
+
+
+def flatten_measurements(measurements: Optional[dict]) -> Dict[str, Any]:
+    """
+    Flatten a measurements JSONB value into {code: value}.
+
+    Handles both stored formats: ``{"items": [{"code", "value", ...}]}``
+    from equipment, and direct ``{code: value | {"value": ...}}`` dicts.
+    """
+    if not measurements:
+        return {}
+    items = measurements.get("items")
+    if items:
+        return {item.get("code", ""): item.get("value") for item in items}
+    return {
+        code: value.get("value") if isinstance(value, dict) else value
+        for code, value in measurements.items()
+        if code != "items"
+    }
+
+
+def _statement(query: ExportQuery) -> Select:
+    """SELECT of the export columns (plus raw measurements), oldest first."""
+    if query.source == "process_data":
+        record = ProcessData
+        statement = select(
+            ProcessData.id,
+            Lot.lot_number,
+            WIPItem.wip_id,
+            Serial.serial_number,
+            Process.process_number,
+            Process.process_code,
+            ProcessData.data_level,
+            ProcessData.result,
+            User.username.label("operator"),
+            Equipment.equipment_code,
+            ProcessData.started_at,
+            ProcessData.completed_at,
+            ProcessData.duration_seconds,
+            ProcessData.measurements,
+        ).select_from(ProcessData).join(Lot, Lot.id == ProcessData.lot_id).outerjoin(
+            WIPItem, WIPItem.id == ProcessData.wip_id
+        ).outerjoin(Serial, Serial.id == ProcessData.serial_id)
+        lot_id = ProcessData.lot_id
+    else:
+        record = WIPProcessHistory
+        statement = select(
+            WIPProcessHistory.id,
+            Lot.lot_number,
+            WIPItem.wip_id,
+            Serial.serial_number,
+            Process.process_number,
+            Process.process_code,
+            literal("WIP").label("data_level"),
+            WIPProcessHistory.result,
+            User.username.label("operator"),
+            Equipment.equipment_code,
+            WIPProcessHistory.started_at,
+            WIPProcessHistory.completed_at,
+            WIPProcessHistory.duration_seconds,
+            WIPProcessHistory.measurements,
+        ).select_from(WIPProcessHistory).join(
+            WIPItem, WIPItem.id == WIPProcessHistory.wip_item_id
+        ).join(Lot, Lot.id == WIPItem.lot_id).outerjoin(Serial, Serial.id == WIPItem.serial_id)
+        lot_id = WIPItem.lot_id
+
+    statement = (
+        statement
+        .outerjoin(Process, Process.id == record.process_id)
+        .outerjoin(User, User.id == record.operator_id)
+        .outerjoin(Equipment, Equipment.id == record.equipment_id)
+    )
+    return _filter(statement, query, record, lot_id).order_by(record.started_at, record.id)
+
+
+def _filter(statement: Select, query: ExportQuery, record: Any, lot_id: Any) -> Select:
+    if query.start_date is not None:
+        statement = statement.where(record.started_at >= query.start_date)
+    if query.end_date is not None:
+        statement = statement.where(record.started_at <= query.end_date)
+    if query.process_id is not None:
+        statement = statement.where(record.process_id == query.process_id)
+    if query.lot_id is not None:
+        statement = statement.where(lot_id == query.lot_id)
+    return statement
+
+
+def _stream(db: Session, statement: Select) -> Iterator[Any]:
+    """Execute on a server-side cursor, fetching BATCH_SIZE rows per round trip."""
+    return db.execute(
+        statement.execution_options(stream_results=True, yield_per=BATCH_SIZE)
+    ).mappings()
+
+
+def _batches(rows: Iterable[Any]) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip-compress a byte stream on the fly (one gzip member)."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return dumps(value).decode()
+    return value
+
+
+def _encode_csv(columns: List[str], batches: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for batch in batches:
+        writer.writerows([_csv_value(row.get(column)) for column in columns] for row in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _encode_ndjson(columns: List[str], batches: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    for batch in batches:
+        yield b"".join(
+            dumps({column: row.get(column) for column in columns}) + b"\n" for row in batch
+        )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose written bytes are drained as chunks."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def _measurement_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _pyarrow():
+    """Import pyarrow (optional dependency) on first parquet export."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("parquet export requires pyarrow (install the 'export' extra)") from None
+    return pyarrow
+
+
+def _encode_parquet(columns: List[str], batches: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """One Parquet row group per batch; measurement columns are float64."""
+    pa = _pyarrow()
+    pq = pa.parquet
+
+    timestamp = pa.timestamp("us", tz="UTC")
+    base_types = {
+        "id": pa.int64(),
+        "process_number": pa.int32(),
+        "started_at": timestamp,
+        "completed_at": timestamp,
+        "duration_seconds": pa.int64(),
+    }
+    schema = pa.schema([
+        (column, base_types.get(column, pa.string()) if column in BASE_COLUMNS else pa.float64())
+        for column in columns
+    ])
+    measurement_columns = set(columns) - set(BASE_COLUMNS)
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="gzip")
+    try:
+        for batch in batches:
+            data = {
+                column: [
+                    _measurement_float(row.get(column)) if column in measurement_columns else row.get(column)
+                    for row in batch
+                ]
+                for column in columns
+            }
+            writer.write_table(pa.Table.from_pydict(data, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+_ENCODERS = {"csv": _encode_csv, "ndjson": _encode_ndjson, "parquet": _encode_parquet}
+
+
+class ExportService:
+    """
+    Export process data / WIP history as CSV, NDJSON or Parquet.
+    """
+
+    def __init__(self, export_dir: Optional[str] = None):
+        self.export_dir = export_dir or settings.EXPORT_DIR or os.path.join(
+            tempfile.gettempdir(), "f2x-neurohub-exports"
+        )
+
+    # ------------------------------------------------------------------
+    # Rows
+    # ------------------------------------------------------------------
+
+    def count(self, db: Session, query: ExportQuery) -> int:
+        """Number of rows an export would contain."""
+        statement = _statement(query).order_by(None)
+        return db.execute(select(func.count()).select_from(statement.subquery())).scalar_one()
+
+    def measurement_columns(self, db: Session, query: ExportQuery) -> List[str]:
+        """Flattened measurement columns, in first-seen order."""
+        statement = _statement(query)
+        measurements = statement.selected_columns.measurements
+        codes: Dict[str, None] = {}
+        for row in _stream(db, statement.with_only_columns(measurements)):
+            codes.update(dict.fromkeys(flatten_measurements(row["measurements"])))
+        return [f"{MEASUREMENT_PREFIX}{code}" for code in codes]
+
+    def iter_rows(self, db: Session, query: ExportQuery) -> Iterator[Dict[str, Any]]:
+        """Stream export rows with measurements flattened into columns."""
+        for row in _stream(db, _statement(query)):
+            data = dict(row)
+            for code, value in flatten_measurements(data.pop("measurements")).items():
+                data[f"{MEASUREMENT_PREFIX}{code}"] = value
+            yield data
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def stream(
+        self,
+        db: Session,
+        query: ExportQuery,
+        format: str = "csv",
+        compress: bool = True,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> Iterator[bytes]:
+        """
+        Encode an export as a stream of byte chunks.
+
+        Args:
+            db: Database session (kept busy until the stream is exhausted)
+            query: Rows to export
+            format: "csv", "ndjson" or "parquet"
+            compress: gzip csv / ndjson output (parquet is always compressed)
+            progress: Called with the number of rows encoded so far, once per batch
+
+        Returns:
+            Iterator of encoded chunks
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        encode = self._encoder(format)
+        columns = list(BASE_COLUMNS) + self.measurement_columns(db, query)
+
+        def batches() -> Iterator[List[Dict[str, Any]]]:
+            done = 0
+            for batch in _batches(self.iter_rows(db, query)):
+                yield batch
+                done += len(batch)
+                if progress:
+                    progress(done)
+
+        chunks = encode(columns, batches())
+        if compress and format != "parquet":
+            chunks = gzip_chunks(chunks)
+        return chunks
+
+    @staticmethod
+    def filename(query: ExportQuery, format: str, compress: bool) -> str:
+        """Download file name of an export."""
+        name = query.source
+        if query.start_date:
+            name += f"_{query.start_date:%Y%m%d}"
+        if query.end_date:
+            name += f"_{query.end_date:%Y%m%d}"
+        name += f".{format}"
+        if compress and format != "parquet":
+            name += ".gz"
+        return name
+
+    @staticmethod
+    def media_type(format: str, compress: bool) -> str:
+        """Content type of an export file."""
+        if compress and format != "parquet":
+            return "application/gzip"
+        return MEDIA_TYPES[format]
+
+    @staticmethod
+    def _encoder(format: str) -> Callable:
+        if format not in _ENCODERS:
+            raise ValueError(
+                f"Invalid export format: {format}. Valid values: {', '.join(EXPORT_FORMATS)}"
+            )
+        if format == "parquet":
+            _pyarrow()
+        return _ENCODERS[format]
+
+    # ------------------------------------------------------------------
+    # Background jobs
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def job_params(query: ExportQuery, format: str, compress: bool) -> Dict[str, Any]:
+        """ProcessJob params of an export (JSON-compatible)."""
+        params = {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in asdict(query).items()
+        }
+        return {**params, "format": format, "compress": compress}
+
+    @staticmethod
+    def job_query(params: Dict[str, Any]) -> ExportQuery:
+        """Rebuild the ExportQuery of a ProcessJob from its params."""
+        return ExportQuery(
+            source=params.get("source", "process_data"),
+            start_date=datetime.fromisoformat(params["start_date"]) if params.get("start_date") else None,
+            end_date=datetime.fromisoformat(params["end_date"]) if params.get("end_date") else None,
+            process_id=params.get("process_id"),
+            lot_id=params.get("lot_id"),
+        )
+
+    def queue_job(self, db: Session, query: ExportQuery, format: str = "csv", compress: bool = True) -> ProcessJob:
+        """
+        Create a DATA_EXPORT ProcessJob and dispatch its Celery task.
+
+        The job row is committed under a pre-generated task id before the
+        task is sent, so a worker never picks up a job it cannot see yet.
+
+        Args:
+            db: Database session
+            query: Rows to export
+            format: "csv", "ndjson" or "parquet"
+            compress: gzip csv / ndjson output
+
+        Returns:
+            The queued ProcessJob
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        from app.tasks import process_tasks
+
+        self._encoder(format)
+        job = ProcessJob(
+            task_id=str(uuid.uuid4()),
+            job_type="DATA_EXPORT",
+            status="QUEUED",
+            params=self.job_params(query, format, compress),
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        try:
+            process_tasks.export_process_data.apply_async(
+                kwargs={"job_id": job.id}, task_id=job.task_id
+            )
+        except Exception as exc:
+            job.status = "FAILED"
+            job.error_message = f"Dispatch failed: {exc}"
+            db.commit()
+            raise
+        return job
+
+    def job_path(self, job: ProcessJob) -> str:
+        """Path of a job's export file."""
+        return os.path.join(self.export_dir, f"export_{job.id}")
+
+    def run_job(
+        self,
+        session_factory: sessionmaker,
+        job_id: int,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Write a job's export to disk, recording progress on its ProcessJob.
+
+        Rows are read in one session (the server-side cursor must stay
+        open) while job status and progress are committed in another.
+
+        Args:
+            session_factory: Creates the two sessions
+            job_id: ProcessJob of type DATA_EXPORT
+            on_progress: Also called with each progress update
+
+        Returns:
+            Job result: file name, size, row count, media type
+
+        Raises:
+            ValueError: If the job does not exist
+        """
+        with session_factory() as jobs, session_factory() as reader:
+            job = jobs.get(ProcessJob, job_id)
+            if job is None:
+                raise ValueError(f"Export job {job_id} not found")
+            params = job.params or {}
+            format = params.get("format", "csv")
+            compress = params.get("compress", True)
+            path = self.job_path(job)
+
+            try:
+                query = self.job_query(params)
+                total = self.count(reader, query)
+                self._update_job(jobs, job, "PROCESSING", {"progress": 0, "rows": 0, "total_rows": total})
+                last_report = 0
+
+                def progress(rows: int) -> None:
+                    nonlocal last_report
+                    if rows - last_report < _PROGRESS_EVERY and rows < total:
+                        return
+                    last_report = rows
+                    state = {
+                        "progress": min(99, rows * 100 // total) if total else 99,
+                        "rows": rows,
+                        "total_rows": total,
+                    }
+                    self._update_job(jobs, job, "PROCESSING", state)
+                    if on_progress:
+                        on_progress(state)
+
+                os.makedirs(self.export_dir, exist_ok=True)
+                partial = f"{path}.part"
+                with open(partial, "wb") as file:
+                    for chunk in self.stream(reader, query, format, compress, progress):
+                        file.write(chunk)
+                os.replace(partial, path)
+            except Exception as exc:
+                logger.exception("Export job %s failed", job_id)
+                if os.path.exists(f"{path}.part"):
+                    os.remove(f"{path}.part")
+                job.status = "FAILED"
+                job.error_message = str(exc)
+                jobs.commit()
+                raise
+
+            result = {
+                "progress": 100,
+                "rows": total,
+                "total_rows": total,
+                "filename": self.filename(query, format, compress),
+                "media_type": self.media_type(format, compress),
+                "file_size": os.path.getsize(path),
+                "download_url": f"{settings.API_V1_PREFIX}/async/exports/{job.id}/download",
+            }
+            self._update_job(jobs, job, "COMPLETED", result)
+            return result
+
+    @staticmethod
+    def _update_job(db: Session, job: ProcessJob, status: str, result: Dict[str, Any]) -> None:
+        job.status = status
+        job.result = result
+        db.commit()
+
+
+# Singleton instance
+export_service = ExportService()
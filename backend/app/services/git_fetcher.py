@@ -0,0 +1,449 @@
+"""
+GitHub fetch engine shared by Git sync and sequence uploads.
+
+Downloads repository folders as ZIP packages with as few round trips as
+possible:
+    - Repository archive (zipball) endpoint first: one request per commit,
+      spooled to a temporary file and re-packed entry by entry
+    - Contents API fallback: one pooled client, bounded concurrent downloads,
+      files written into the output ZIP as they arrive
+    - Conditional requests (ETag / If-None-Match) for commit and folder
+      lookups, so unchanged polls are answered with 304
+    - Per-commit LRU cache of folder packages
+
+The API base URL is configurable so the engine can be exercised against a
+local stand-in server in tests.
+"""
+
+import asyncio
+import io
+import logging
+import re
+import shutil
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+_COMMIT_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+_CHUNK_SIZE = 64 * 1024
+
+
+class GitFetchError(ValueError):
+    """Raised when the Git host returns an error or the path has no files."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class CommitInfo:
+    """Latest commit lookup result."""
+    sha: str
+    data: Dict[str, Any]
+    not_modified: bool = False
+
+
+class FolderZipCache:
+    """
+    Thread-safe LRU cache of folder packages keyed by commit SHA.
+
+    Only immutable refs (full commit SHAs) are cached, so entries never
+    need invalidation.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self._entries: "OrderedDict[Tuple[str, str, str, str], bytes]" = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, str, str]) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Tuple[str, str, str, str], value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared across fetcher instances (service polling and upload endpoint)
+folder_zip_cache = FolderZipCache()
+
+
+def is_commit_sha(ref: Optional[str]) -> bool:
+    """Check if a ref is a full (immutable) commit SHA."""
+    return bool(ref) and bool(_COMMIT_SHA_PATTERN.match(ref))
+
+
+class GitHubFetcher:
+    """
+    Pooled, conditional GitHub client.
+
+    One instance owns one ``httpx.AsyncClient``; use it as an async context
+    manager or call ``aclose()`` when done. Auth tokens are passed per call
+    so a single fetcher can serve several sync configurations.
+
+    Example:
+        async with GitHubFetcher() as fetcher:
+            commit = await fetcher.get_latest_commit("owner", "repo", "main")
+            zip_data = await fetcher.download_folder_as_zip(
+                "owner", "repo", commit.sha, "sequences/my_sequence"
+            )
+    """
+
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: float = 30.0,
+        user_agent: str = "F2X-NeuroHub-GitSync",
+        cache: Optional[FolderZipCache] = None,
+        max_cached_archives: int = 2,
+        max_validators: int = 256,
+    ):
+        self.api_url = (api_url or settings.GITHUB_API_URL).rstrip("/")
+        self.max_concurrency = max_concurrency or settings.GIT_FETCH_CONCURRENCY
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.cache = cache if cache is not None else folder_zip_cache
+        self._client: Optional["httpx.AsyncClient"] = None
+        # url -> (etag, payload) for conditional requests, least recently used first
+        self._validators: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._max_validators = max_validators
+        # (owner, repo, sha) -> spooled archive file, reused across folders
+        self._archives: "OrderedDict[Tuple[str, str, str], IO[bytes]]" = OrderedDict()
+        self._max_cached_archives = max_cached_archives
+
+    async def __aenter__(self) -> "GitHubFetcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Lazily created pooled client."""
+        if self._client is None or self._client.is_closed:
+            import httpx  # Imported on first use (keeps API startup fast)
+
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency * 2,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                headers={"User-Agent": self.user_agent},
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client and drop spooled archives."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        for archive in self._archives.values():
+            archive.close()
+        self._archives.clear()
+
+    # =========================================================================
+    # Request Helpers
+    # =========================================================================
+
+    def _headers(self, auth_token: Optional[str]) -> Dict[str, str]:
+        headers = {"Accept": "application/vnd.github.v3+json"}
+        if auth_token:
+            headers["Authorization"] = f"token {auth_token}"
+        return headers
+
+    async def _get_json_conditional(
+        self, url: str, auth_token: Optional[str] = None
+    ) -> Tuple[Any, bool]:
+        """
+        GET a JSON document, revalidating with a stored ETag.
+
+        Returns:
+            Tuple of (payload, not_modified)
+        """
+        headers = self._headers(auth_token)
+        cached = self._validators.get(url)
+        if cached:
+            self._validators.move_to_end(url)
+            headers["If-None-Match"] = cached[0]
+
+        response = await self.client.get(url, headers=headers)
+
+        if response.status_code == 304 and cached:
+            return cached[1], True
+        if response.status_code != 200:
+            self._raise_for_status(response)
+
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._validators[url] = (etag, payload)
+            self._validators.move_to_end(url)
+            while len(self._validators) > self._max_validators:
+                self._validators.popitem(last=False)
+        return payload, False
+
+    @staticmethod
+    def _raise_for_status(response: "httpx.Response") -> None:
+        if response.status_code == 404:
+            raise GitFetchError("Not found", status_code=404)
+        if response.status_code == 403:
+            raise GitFetchError("GitHub API rate limit exceeded", status_code=403)
+        raise GitFetchError(
+            f"GitHub API error: {response.status_code}",
+            status_code=response.status_code,
+        )
+
+    # =========================================================================
+    # Metadata
+    # =========================================================================
+
+    async def get_latest_commit(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        auth_token: Optional[str] = None,
+    ) -> CommitInfo:
+        """Get the head commit of a branch (conditional on the last ETag)."""
+        url = f"{self.api_url}/repos/{owner}/{repo}/commits/{branch}"
+        try:
+            data, not_modified = await self._get_json_conditional(url, auth_token)
+        except GitFetchError as e:
+            if e.status_code == 404:
+                raise GitFetchError(f"Branch '{branch}' not found", status_code=404)
+            raise
+        return CommitInfo(sha=data["sha"], data=data, not_modified=not_modified)
+
+    async def list_folder(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        folder_path: str,
+        auth_token: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List a folder via the contents API. Missing paths yield []."""
+        url = self._contents_url(owner, repo, ref, folder_path)
+        try:
+            data, _ = await self._get_json_conditional(url, auth_token)
+        except GitFetchError as e:
+            if e.status_code == 404:
+                return []
+            raise
+        return data if isinstance(data, list) else [data]
+
+    def _contents_url(self, owner: str, repo: str, ref: str, path: str) -> str:
+        url = f"{self.api_url}/repos/{owner}/{repo}/contents"
+        if path:
+            url = f"{url}/{path.strip('/')}"
+        if ref:
+            url = f"{url}?ref={ref}"
+        return url
+
+    # =========================================================================
+    # Folder Download
+    # =========================================================================
+
+    async def download_folder_as_zip(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        folder_path: str,
+        auth_token: Optional[str] = None,
+    ) -> bytes:
+        """
+        Download a repository folder as a ZIP package.
+
+        Paths inside the package are relative to ``folder_path``. Results
+        for full commit SHAs are served from the per-commit cache.
+
+        Raises:
+            GitFetchError: On host errors, 404 when the folder does not exist
+        """
+        folder_path = (folder_path or "").strip("/")
+        cache_key = (owner, repo, ref, folder_path)
+        if is_commit_sha(ref):
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            zip_data = await self._download_from_archive(
+                owner, repo, ref, folder_path, auth_token
+            )
+        except GitFetchError as e:
+            if e.status_code is None:
+                raise
+            logger.info(
+                f"Archive download unavailable for {owner}/{repo}@{ref} "
+                f"({e}), falling back to contents API"
+            )
+            zip_data = await self._download_from_contents(
+                owner, repo, ref, folder_path, auth_token
+            )
+
+        if zip_data is None:
+            raise GitFetchError(f"Path not found: {folder_path}", status_code=404)
+
+        if is_commit_sha(ref):
+            self.cache.set(cache_key, zip_data)
+        return zip_data
+
+    async def _get_archive(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        auth_token: Optional[str],
+    ) -> IO[bytes]:
+        """Stream the repository zipball into a spooled temporary file."""
+        key = (owner, repo, ref)
+        archive = self._archives.get(key)
+        if archive is not None:
+            self._archives.move_to_end(key)
+            archive.seek(0)
+            return archive
+
+        url = f"{self.api_url}/repos/{owner}/{repo}/zipball/{ref}"
+        archive = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+        try:
+            async with self.client.stream(
+                "GET", url, headers=self._headers(auth_token)
+            ) as response:
+                if response.status_code != 200:
+                    self._raise_for_status(response)
+                async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                    archive.write(chunk)
+        except BaseException:
+            archive.close()
+            raise
+
+        # Branch archives can change, only keep immutable ones around
+        if is_commit_sha(ref):
+            self._archives[key] = archive
+            while len(self._archives) > self._max_cached_archives:
+                _, evicted = self._archives.popitem(last=False)
+                evicted.close()
+        archive.seek(0)
+        return archive
+
+    async def _download_from_archive(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        folder_path: str,
+        auth_token: Optional[str],
+    ) -> Optional[bytes]:
+        """Re-pack a folder of the repository zipball (None if the folder is absent)."""
+        archive = await self._get_archive(owner, repo, ref, auth_token)
+        try:
+            output = io.BytesIO()
+            found = False
+            with zipfile.ZipFile(archive, "r") as source, \
+                    zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as target:
+                names = source.namelist()
+                if not names:
+                    raise GitFetchError("Empty repository archive")
+                # zipball entries live under a single "<owner>-<repo>-<sha>/" root
+                root = names[0].split("/", 1)[0] + "/"
+                prefix = f"{root}{folder_path}/" if folder_path else root
+
+                for info in source.infolist():
+                    if info.is_dir() or not info.filename.startswith(prefix):
+                        continue
+                    rel_path = info.filename[len(prefix):]
+                    with source.open(info) as src, target.open(rel_path, "w") as dst:
+                        shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+                    found = True
+        except zipfile.BadZipFile:
+            raise GitFetchError("Invalid repository archive", status_code=502)
+        finally:
+            if (owner, repo, ref) not in self._archives:
+                archive.close()
+
+        if not found:
+            return None
+        return output.getvalue()
+
+    async def _download_from_contents(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        folder_path: str,
+        auth_token: Optional[str],
+    ) -> bytes:
+        """Walk the folder with the contents API and download concurrently."""
+        headers = self._headers(auth_token)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        output = io.BytesIO()
+        file_count = 0
+
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as target:
+
+            async def download_file(item: Dict[str, Any]) -> None:
+                nonlocal file_count
+                async with semaphore:
+                    response = await self.client.get(item["download_url"], headers=headers)
+                if response.status_code != 200:
+                    raise GitFetchError(
+                        f"Failed to download file: {item['path']}",
+                        status_code=502,
+                    )
+                rel_path = item["path"][len(folder_path):].lstrip("/") if folder_path else item["path"]
+                # writestr does not await, so concurrent writers never interleave
+                target.writestr(rel_path, response.content)
+                file_count += 1
+
+            async def walk(path: str) -> None:
+                url = self._contents_url(owner, repo, ref, path)
+                async with semaphore:
+                    response = await self.client.get(url, headers=headers)
+                if response.status_code != 200:
+                    if response.status_code == 404:
+                        raise GitFetchError(f"Path not found: {path}", status_code=404)
+                    self._raise_for_status(response)
+                contents = response.json()
+                if not isinstance(contents, list):
+                    contents = [contents]
+
+                tasks = []
+                for item in contents:
+                    if item["type"] == "file":
+                        tasks.append(download_file(item))
+                    elif item["type"] == "dir":
+                        tasks.append(walk(item["path"]))
+                await asyncio.gather(*tasks)
+
+            await walk(folder_path)
+
+        if file_count == 0:
+            raise GitFetchError("No files found in the specified path")
+        return output.getvalue()
@@ -14,7 +14,6 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-import httpx
 import yaml
 
 from app.crud.git_sync import git_sync_crud
@@ -26,6 +25,7 @@ from app.schemas.git_sync import (
     GitSyncResultResponse,
     GitSyncStatusResponse,
 )
+from app.services.git_fetcher import GitHubFetcher
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +43,7 @@ class GitSyncService:
     def __init__(self):
         self._polling_tasks: Dict[int, asyncio.Task] = {}
         self._running = False
+        self._fetcher: Optional[GitHubFetcher] = None
 
     # =========================================================================
     # GitHub API Helpers
@@ -64,130 +65,12 @@ class GitSyncService:
 
         return owner, repo
 
-    async def _get_latest_commit(
-        self,
-        owner: str,
-        repo: str,
-        branch: str,
-        auth_token: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Get latest commit info from GitHub."""
-        url = f"https://api.github.com/repos/{owner}/{repo}/commits/{branch}"
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "F2X-NeuroHub-GitSync",
-        }
-
-        if auth_token:
-            headers["Authorization"] = f"token {auth_token}"
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-
-            if response.status_code == 404:
-                raise ValueError(f"Branch '{branch}' not found")
-            elif response.status_code == 403:
-                raise ValueError("GitHub API rate limit exceeded")
-            elif response.status_code != 200:
-                raise ValueError(f"GitHub API error: {response.status_code}")
-
-            return response.json()
-
-    async def _list_folder_contents(
-        self,
-        owner: str,
-        repo: str,
-        branch: str,
-        folder_path: str,
-        auth_token: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """List contents of a folder in the repo."""
-        url = f"https://api.github.com/repos/{owner}/{repo}/contents/{folder_path}"
-        if branch:
-            url = f"{url}?ref={branch}"
-
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "F2X-NeuroHub-GitSync",
-        }
-
-        if auth_token:
-            headers["Authorization"] = f"token {auth_token}"
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-
-            if response.status_code == 404:
-                return []
-            elif response.status_code != 200:
-                raise ValueError(f"GitHub API error: {response.status_code}")
-
-            return response.json()
-
-    async def _download_folder_as_zip(
-        self,
-        owner: str,
-        repo: str,
-        branch: str,
-        folder_path: str,
-        auth_token: Optional[str] = None,
-    ) -> bytes:
-        """Download a folder from GitHub as a ZIP file."""
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "F2X-NeuroHub-GitSync",
-        }
-
-        if auth_token:
-            headers["Authorization"] = f"token {auth_token}"
-
-        async def fetch_contents(path: str) -> List[Dict]:
-            url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
-            if branch:
-                url = f"{url}?ref={branch}"
-
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=headers)
-                if response.status_code != 200:
-                    return []
-                data = response.json()
-                return data if isinstance(data, list) else [data]
-
-        async def download_file(download_url: str) -> bytes:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(download_url, headers=headers)
-                return response.content if response.status_code == 200 else b""
-
-        async def process_contents(path: str, files: Dict[str, bytes]) -> None:
-            contents = await fetch_contents(path)
-
-            for item in contents:
-                item_path = item["path"]
-                if folder_path:
-                    rel_path = item_path[len(folder_path):].lstrip("/")
-                else:
-                    rel_path = item_path
-
-                if item["type"] == "file":
-                    file_content = await download_file(item["download_url"])
-                    if file_content:
-                        files[rel_path] = file_content
-                elif item["type"] == "dir":
-                    await process_contents(item_path, files)
-
-        files: Dict[str, bytes] = {}
-        await process_contents(folder_path, files)
-
-        if not files:
-            raise ValueError("No files found in the specified path")
-
-        # Create ZIP
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            for file_path, content in files.items():
-                zf.writestr(file_path, content)
-
-        return zip_buffer.getvalue()
+    @property
+    def fetcher(self) -> GitHubFetcher:
+        """Shared pooled fetcher (keeps ETags and archives between polls)."""
+        if self._fetcher is None:
+            self._fetcher = GitHubFetcher()
+        return self._fetcher
 
     # =========================================================================
     # Sync Operations
@@ -199,19 +82,19 @@ class GitSyncService:
             owner, repo = self._parse_github_url(config.repository_url)
             auth_token = config.auth_token if config.auth_type == "token" else None
 
-            # Get latest commit
-            commit_data = await self._get_latest_commit(
+            # Get latest commit (304 when the branch head has not moved)
+            commit = await self.fetcher.get_latest_commit(
                 owner, repo, config.branch, auth_token
             )
 
-            remote_sha = commit_data["sha"]
+            remote_sha = commit.sha
             has_updates = config.last_commit_sha != remote_sha
 
             # List sequences in folder
             sequences_changed = []
             if has_updates and config.folder_path:
-                contents = await self._list_folder_contents(
-                    owner, repo, config.branch, config.folder_path, auth_token
+                contents = await self.fetcher.list_folder(
+                    owner, repo, remote_sha, config.folder_path, auth_token
                 )
                 sequences_changed = [
                     item["name"] for item in contents
@@ -278,10 +161,10 @@ class GitSyncService:
             auth_token = config.auth_token if config.auth_type == "token" else None
 
             # Get latest commit
-            commit_data = await self._get_latest_commit(
+            commit = await self.fetcher.get_latest_commit(
                 owner, repo, config.branch, auth_token
             )
-            remote_sha = commit_data["sha"]
+            remote_sha = commit.sha
 
             # Check if update needed
             if not force and config.last_commit_sha == remote_sha:
@@ -291,10 +174,11 @@ class GitSyncService:
                 result.duration_seconds = time.time() - start_time
                 return result
 
-            # List sequences in folder
+            # List sequences in folder (pinned to the commit so every
+            # download below comes from the same archive)
             folder_path = config.folder_path or ""
-            contents = await self._list_folder_contents(
-                owner, repo, config.branch, folder_path, auth_token
+            contents = await self.fetcher.list_folder(
+                owner, repo, remote_sha, folder_path, auth_token
             )
 
             sequence_folders = [
@@ -311,8 +195,8 @@ class GitSyncService:
 
                     try:
                         # Download sequence folder as ZIP
-                        zip_data = await self._download_folder_as_zip(
-                            owner, repo, config.branch, seq_path, auth_token
+                        zip_data = await self.fetcher.download_folder_as_zip(
+                            owner, repo, remote_sha, seq_path, auth_token
                         )
 
                         # Parse manifest
@@ -421,14 +305,15 @@ class GitSyncService:
         owner, repo = self._parse_github_url(config.repository_url)
         auth_token = config.auth_token if config.auth_type == "token" else None
 
-        commit_data = await self._get_latest_commit(
+        commit = await self.fetcher.get_latest_commit(
             owner, repo, config.branch, auth_token
         )
+        commit_data = commit.data
 
         # List sequences
         folder_path = config.folder_path or ""
-        contents = await self._list_folder_contents(
-            owner, repo, config.branch, folder_path, auth_token
+        contents = await self.fetcher.list_folder(
+            owner, repo, commit.sha, folder_path, auth_token
         )
         sequences = [item["name"] for item in contents if item["type"] == "dir"]
 
@@ -469,6 +354,10 @@ class GitSyncService:
             task.cancel()
 
         self._polling_tasks.clear()
+
+        if self._fetcher is not None:
+            await self._fetcher.aclose()
+            self._fetcher = None
         logger.info("Stopped Git sync background polling")
 
     def _start_polling_task(self, config: GitSyncConfig) -> None:
@@ -484,10 +373,14 @@ class GitSyncService:
         """Polling loop for a single config."""
         while self._running:
             try:
-                # Check for updates
-                status = await self.check_for_updates(config)
+                # Conditional check: an unchanged branch head costs a 304
+                owner, repo = self._parse_github_url(config.repository_url)
+                auth_token = config.auth_token if config.auth_type == "token" else None
+                commit = await self.fetcher.get_latest_commit(
+                    owner, repo, config.branch, auth_token
+                )
 
-                if status.has_updates and config.auto_upload:
+                if commit.sha != config.last_commit_sha and config.auto_upload:
                     logger.info(f"Updates detected for {config.name}, syncing...")
                     await self.sync_sequences(config)
 
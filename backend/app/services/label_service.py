@@ -0,0 +1,448 @@
+"""
+Label rendering service for barcodes and label sheets.
+
+Rendered labels are content-addressed: the cache key is a hash of
+(kind, data, symbology, options), so a given label is rasterized once and
+afterwards served from an in-memory LRU or the on-disk cache. The key
+doubles as a strong ETag, letting browsers cache barcode images for good.
+
+Batch rendering builds a whole LOT's labels as one multi-label ZPL stream
+or one multi-page PDF. Missing barcodes are rasterized in a process pool
+(python-barcode/qrcode + PIL are CPU-bound and hold the GIL).
+
+Example:
+    png = label_service.render_png("WIP-KR01PSA2511-001", "qr")
+    zpl = label_service.render_zpl_batch("WIP_LABEL", wip_ids)
+    pdf = label_service.render_pdf(wip_ids, "code128")
+"""
+
+import hashlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.config import settings
+from app.utils.barcode_generator import render_barcode_png
+
+logger = logging.getLogger(__name__)
+
+SYMBOLOGIES = ("code128", "qr")
+
+# Batches smaller than this are rasterized inline (pool overhead dominates)
+_POOL_MIN_BATCH = 8
+
+# PDF page resolution; python-barcode renders at 300 dpi
+_PDF_RESOLUTION = 300.0
+
+# Zebra label templates (60mm x 30mm), keyed by PrintLog label_type
+ZPL_TEMPLATES: Dict[str, str] = {
+    "WIP_LABEL": """^XA
+^MMT
+^PW472
+^LL236
+^PR1,1
+~SD29
+
+^FO30,30^A0N,16,16^FDF2X NEUROHUB - WIP LABEL^FS
+
+^FO30,65^A0N,14,14^FDWIP ID:^FS
+^FO30,85^A0N,24,24^FD{value}^FS
+
+^FO340,65^BQN,2,5^FDQA,{value}^FS
+
+^PQ1
+^XZ""",
+    "SERIAL_LABEL": """^XA
+^MMT
+^PW472
+^LL236
+^PR1,1
+~SD29
+
+^FO30,30^A0N,16,16^FDF2X NEUROHUB - SERIAL LABEL^FS
+
+^FO30,65^A0N,14,14^FDSerial No:^FS
+^FO30,85^A0N,20,20^FD{value}^FS
+
+^FO340,65^BQN,2,5^FDQA,{value}^FS
+
+^PQ1
+^XZ""",
+    "LOT_LABEL": """^XA
+^MMT
+^PW472
+^LL236
+^PR1,1
+~SD29
+
+^FO30,30^A0N,16,16^FDF2X NEUROHUB - LOT LABEL^FS
+
+^FO30,65^A0N,14,14^FDLOT No:^FS
+^FO30,85^A0N,24,24^FD{value}^FS
+
+^FO340,65^BQN,2,5^FDQA,{value}^FS
+
+^PQ1
+^XZ""",
+}
+
+
+def label_key(kind: str, data: Any, symbology: str = "", options: Optional[dict] = None) -> str:
+    """
+    Content address of a rendered label.
+
+    Args:
+        kind: Output kind ("png", "zpl", "pdf")
+        data: Encoded value(s)
+        symbology: Barcode type or label template name
+        options: Rendering options
+
+    Returns:
+        Hex digest usable as cache key and ETag
+    """
+    payload = json.dumps([kind, data, symbology, options or {}], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+class LabelCache:
+    """
+    Thread-safe two-level cache of rendered labels.
+
+    Memory is an LRU bounded by total bytes; the disk level keeps labels
+    under ``<cache_dir>/<key[:2]>/<key>``. Entries are immutable
+    (content-addressed), so nothing is ever invalidated, but the disk level
+    is bounded by disk_max_bytes: once this process's estimate of the
+    directory size passes it, the least recently used files (by mtime, which
+    a disk hit refreshes) are deleted down to 90% of the limit. The
+    directory may be shared by several workers; each prune rescans it.
+    """
+
+    def __init__(self, cache_dir: Optional[str], max_bytes: int, disk_max_bytes: int = 0):
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._max_bytes = max_bytes
+        self._cache_dir = cache_dir
+        self._disk_max_bytes = disk_max_bytes
+        self._disk_size: Optional[int] = None  # Last scan plus own writes since
+        self._lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+
+    def _path(self, key: str) -> Optional[str]:
+        if not self._cache_dir:
+            return None
+        return os.path.join(self._cache_dir, key[:2], key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(path)  # Recently used: pruned last
+        except OSError:
+            pass
+        self._remember(key, value)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        self._remember(key, value)
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Label cache write failed for {key}: {e}")
+            return
+
+        if self._disk_max_bytes:
+            with self._lock:
+                if self._disk_size is not None:
+                    self._disk_size += len(value)
+                full = self._disk_size is None or self._disk_size > self._disk_max_bytes
+            if full:
+                self.prune()
+
+    def prune(self) -> int:
+        """
+        Delete the least recently used disk entries beyond disk_max_bytes.
+
+        Returns:
+            Number of files deleted
+        """
+        if not self._cache_dir or not self._prune_lock.acquire(blocking=False):
+            return 0
+        try:
+            entries = []
+            for directory, _, names in os.walk(self._cache_dir):
+                for name in names:
+                    path = os.path.join(directory, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            deleted = 0
+            if self._disk_max_bytes and total > self._disk_max_bytes:
+                target = self._disk_max_bytes * 0.9
+                for _, size, path in sorted(entries):
+                    if total <= target:
+                        break
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        continue
+                    total -= size
+                    deleted += 1
+                logger.info(f"Pruned {deleted} labels from the disk cache")
+
+            with self._lock:
+                self._disk_size = total
+            return deleted
+        finally:
+            self._prune_lock.release()
+
+    def _remember(self, key: str, value: bytes) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += len(value)
+            while self._size > self._max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop the in-memory level (disk entries stay valid)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class LabelService:
+    """
+    Render barcode PNGs, label ZPL and label sheets with caching.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
+        if cache_dir is None:
+            cache_dir = settings.LABEL_CACHE_DIR or os.path.join(
+                tempfile.gettempdir(), "f2x-neurohub-labels"
+            )
+        self.cache = LabelCache(
+            cache_dir, max_bytes or settings.LABEL_CACHE_MAX_BYTES, settings.LABEL_CACHE_DISK_MAX_BYTES
+        )
+        self._workers = workers if workers is not None else settings.LABEL_RENDER_WORKERS
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Single labels
+    # ------------------------------------------------------------------
+
+    def png_key(self, data: str, symbology: str = "code128", options: Optional[dict] = None) -> str:
+        """Cache key / ETag of a barcode PNG (without rendering it)."""
+        self._check_symbology(symbology)
+        return label_key("png", data, symbology, options)
+
+    def render_png(self, data: str, symbology: str = "code128", options: Optional[dict] = None) -> bytes:
+        """
+        Get a barcode PNG, rendering it on cache miss.
+
+        Args:
+            data: Value to encode
+            symbology: "code128" or "qr"
+            options: Options passed to generate_barcode_image
+
+        Returns:
+            PNG image data
+        """
+        key = self.png_key(data, symbology, options)
+        return self._get_or_render(key, lambda: render_barcode_png(data, symbology, options))
+
+    def render_zpl(self, label_type: str, value: str) -> str:
+        """
+        Get the ZPL of one label.
+
+        Args:
+            label_type: Template name (WIP_LABEL, SERIAL_LABEL, LOT_LABEL)
+            value: Value printed and encoded on the label
+
+        Returns:
+            ZPL string
+        """
+        template = self._template(label_type)
+        key = label_key("zpl", value, label_type)
+        return self._get_or_render(key, lambda: template.format(value=value).encode()).decode()
+
+    # ------------------------------------------------------------------
+    # Batches
+    # ------------------------------------------------------------------
+
+    def batch_key(self, kind: str, values: Sequence[str], symbology: str, options: Optional[dict] = None) -> str:
+        """Cache key / ETag of a label batch (without rendering it)."""
+        return label_key(kind, list(values), symbology, options)
+
+    def render_zpl_batch(self, label_type: str, values: Sequence[str]) -> str:
+        """
+        Render labels as one multi-label ZPL stream.
+
+        Args:
+            label_type: Template name (WIP_LABEL, SERIAL_LABEL, LOT_LABEL)
+            values: Values, one label each, in print order
+
+        Returns:
+            Concatenated ZPL formats
+        """
+        return "\n".join(self.render_zpl(label_type, value) for value in values)
+
+    def render_png_batch(
+        self, values: Sequence[str], symbology: str = "code128", options: Optional[dict] = None
+    ) -> List[bytes]:
+        """
+        Get barcode PNGs for many values, rasterizing misses in parallel.
+
+        Args:
+            values: Values to encode
+            symbology: "code128" or "qr"
+            options: Options passed to generate_barcode_image
+
+        Returns:
+            PNG image data, in the order of values
+        """
+        keys = [self.png_key(value, symbology, options) for value in values]
+        images: List[Optional[bytes]] = [self.cache.get(key) for key in keys]
+
+        missing = [i for i, image in enumerate(images) if image is None]
+        if missing:
+            rendered = self._rasterize([values[i] for i in missing], symbology, options)
+            for i, image in zip(missing, rendered):
+                self.cache.set(keys[i], image)
+                images[i] = image
+        return images
+
+    def render_pdf(
+        self, values: Sequence[str], symbology: str = "code128", options: Optional[dict] = None
+    ) -> bytes:
+        """
+        Render barcodes as one multi-page PDF (one label per page).
+
+        Args:
+            values: Values to encode, in page order
+            symbology: "code128" or "qr"
+            options: Options passed to generate_barcode_image
+
+        Returns:
+            PDF document data
+
+        Raises:
+            ValueError: If values is empty
+        """
+        if not values:
+            raise ValueError("At least one label is required")
+        key = self.batch_key("pdf", values, symbology, options)
+
+        def build() -> bytes:
+            from PIL import Image  # Imported on first use (keeps API startup fast)
+
+            pages = [
+                Image.open(io.BytesIO(png)).convert("RGB")
+                for png in self.render_png_batch(values, symbology, options)
+            ]
+            output = io.BytesIO()
+            pages[0].save(
+                output, format="PDF", save_all=True,
+                append_images=pages[1:], resolution=_PDF_RESOLUTION,
+            )
+            return output.getvalue()
+
+        return self._get_or_render(key, build)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_or_render(self, key: str, render: Callable[[], bytes]) -> bytes:
+        value = self.cache.get(key)
+        if value is None:
+            value = render()
+            self.cache.set(key, value)
+        return value
+
+    def _rasterize(self, values: List[str], symbology: str, options: Optional[dict]) -> List[bytes]:
+        if len(values) >= _POOL_MIN_BATCH and self._workers > 1:
+            try:
+                pool = self._get_pool()
+                return list(pool.map(render_barcode_png, values, repeat(symbology), repeat(options)))
+            except Exception as e:
+                # Fall back to rendering in-process (e.g. broken pool)
+                logger.warning(f"Label render pool failed, rendering inline: {e}")
+                self.shutdown()
+        return [render_barcode_png(value, symbology, options) for value in values]
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn: forking a multi-threaded server process is unsafe
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the rasterization process pool (restarted on demand)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _check_symbology(symbology: str) -> None:
+        if symbology not in SYMBOLOGIES:
+            raise ValueError(
+                f"Invalid barcode_type: {symbology}. Valid values: {', '.join(SYMBOLOGIES)}"
+            )
+
+    @staticmethod
+    def _template(label_type: str) -> str:
+        try:
+            return ZPL_TEMPLATES[label_type]
+        except KeyError:
+            raise ValueError(
+                f"Invalid label_type: {label_type}. Valid values: {', '.join(ZPL_TEMPLATES)}"
+            ) from None
+
+
+# Singleton instance
+label_service = LabelService()
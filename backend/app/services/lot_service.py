@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from datetime import date
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError, InternalError
@@ -34,15 +34,34 @@ class LotService(BaseService[Lot]):
         db: Session,
         skip: int = 0,
         limit: int = 100,
-        status: Optional[LotStatus] = None
+        status: Optional[LotStatus] = None,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[LotInDB]:
         """
         List all LOTs with pagination and optional status filter.
         """
         try:
             if status:
-                return crud.get_by_status(db, status=status.value, skip=skip, limit=limit)
-            return crud.get_multi(db, skip=skip, limit=limit)
+                return crud.get_by_status(db, status=status.value, skip=skip, limit=limit, after=after)
+            return crud.get_multi(db, skip=skip, limit=limit, after=after)
+        except SQLAlchemyError as e:
+            self.handle_sqlalchemy_error(e, operation="list")
+
+    def get_lot_rows(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[LotStatus] = None,
+        after: Optional[Sequence[Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List LOTs like get_lots, as response rows (no ORM hydration).
+        """
+        try:
+            return crud.get_multi_rows(
+                db, status=status.value if status else None, skip=skip, limit=limit, after=after
+            )
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="list")
 
@@ -62,12 +81,14 @@ class LotService(BaseService[Lot]):
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_by_number")
 
-    def get_active_lots(self, db: Session, skip: int = 0, limit: int = 100) -> List[LotInDB]:
+    def get_active_lots(
+        self, db: Session, skip: int = 0, limit: int = 100, after: Optional[Sequence[Any]] = None
+    ) -> List[LotInDB]:
         """
         Get active LOTs (CREATED or IN_PROGRESS).
         """
         try:
-            return crud.get_active(db, skip=skip, limit=limit)
+            return crud.get_active(db, skip=skip, limit=limit, after=after)
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_active")
 
@@ -77,7 +98,8 @@ class LotService(BaseService[Lot]):
         start_date: date,
         end_date: date,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[LotInDB]:
         """
         Get LOTs within production date range.
@@ -88,7 +110,8 @@ class LotService(BaseService[Lot]):
                 start_date=start_date,
                 end_date=end_date,
                 skip=skip,
-                limit=limit
+                limit=limit,
+                after=after,
             )
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_by_date_range")
@@ -98,7 +121,8 @@ class LotService(BaseService[Lot]):
         db: Session,
         product_model_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[LotInDB]:
         """
         Get LOTs filtered by product model.
@@ -108,7 +132,8 @@ class LotService(BaseService[Lot]):
                 db,
                 product_model_id=product_model_id,
                 skip=skip,
-                limit=limit
+                limit=limit,
+                after=after,
             )
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_by_product_model")
@@ -118,13 +143,14 @@ class LotService(BaseService[Lot]):
         db: Session,
         status: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[LotInDB]:
         """
         Get LOTs filtered by status.
         """
         try:
-            return crud.get_by_status(db, status=status, skip=skip, limit=limit)
+            return crud.get_by_status(db, status=status, skip=skip, limit=limit, after=after)
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_by_status")
 
@@ -140,6 +166,18 @@ class LotService(BaseService[Lot]):
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get")
 
+    def get_wip_ids(self, db: Session, lot_id: int) -> List[str]:
+        """
+        Get the WIP IDs of a LOT in sequence order.
+        """
+        try:
+            self.validate_not_none(crud.get(db, lot_id=lot_id), lot_id, LotNotFoundException)
+            return wip_crud.get_wip_ids_by_lot(db, lot_id)
+        except LotNotFoundException:
+            raise
+        except SQLAlchemyError as e:
+            self.handle_sqlalchemy_error(e, operation="get_wip_ids")
+
     def create_lot(self, db: Session, lot_in: LotCreate) -> LotInDB:
         """
         Create new LOT.
@@ -1,9 +1,10 @@
 from datetime import date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from app import crud
+from app.core.alert_notifications import alert_notifier
 from app.models.alert import AlertType, AlertSeverity, AlertStatus
 from app.schemas.alert import (
     AlertCreate,
@@ -34,14 +35,12 @@ class NotificationService:
         lot_id: Optional[int] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        after: Optional[Sequence[Any]] = None,
+        approximate_total: bool = False,
     ) -> AlertListResponse:
         """Retrieve a paginated list of alerts with filtering."""
         try:
-            # Get filtered alerts
-            alerts = crud.alert.get_multi(
-                db,
-                skip=skip,
-                limit=limit,
+            filters = dict(
                 status=status,
                 severity=severity,
                 alert_type=alert_type,
@@ -50,21 +49,14 @@ class NotificationService:
                 end_date=end_date,
             )
 
+            # Get filtered alerts
+            alerts = crud.alert.get_multi(db, skip=skip, limit=limit, after=after, **filters)
+
             # Get total count (for pagination)
-            total = crud.alert.get_multi(
-                db,
-                skip=0,
-                limit=10000,  # Get all for count
-                status=status,
-                severity=severity,
-                alert_type=alert_type,
-                lot_id=lot_id,
-                start_date=start_date,
-                end_date=end_date,
-            )
+            total = crud.alert.count(db, approximate=approximate_total, **filters)
 
-            # Get unread count
-            unread_count = crud.alert.get_unread_count(db)
+            # Get unread count (cached, see app.core.alert_notifications)
+            unread_count = alert_notifier.unread_count(db)
 
             # Convert to response format with related entity names
             alert_responses = []
@@ -79,7 +71,7 @@ class NotificationService:
 
             return AlertListResponse(
                 alerts=alert_responses,
-                total=len(total),
+                total=total,
                 unread_count=unread_count,
                 skip=skip,
                 limit=limit,
@@ -89,9 +81,9 @@ class NotificationService:
             raise DatabaseException(message=f"Database error: {str(e)}")
 
     def get_unread_count(self, db: Session) -> Dict[str, int]:
-        """Get count of unread alerts."""
+        """Get count of unread alerts (cached, see app.core.alert_notifications)."""
         try:
-            count = crud.alert.get_unread_count(db)
+            count = alert_notifier.unread_count(db)
             return {"unread_count": count}
         except SQLAlchemyError as e:
             raise DatabaseException(message=f"Database error: {str(e)}")
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models.print_log import PrintLog, PrintStatus
+from app.services.label_service import label_service
 
 logger = logging.getLogger(__name__)
 
@@ -327,63 +328,15 @@ class PrinterService:
 
     def _generate_wip_zpl(self, wip_id: str) -> str:
         """Generate ZPL for WIP label (60mm x 30mm)."""
-        zpl = f"""^XA
-^MMT
-^PW472
-^LL236
-^PR1,1
-~SD29
-
-^FO30,30^A0N,16,16^FDF2X NEUROHUB - WIP LABEL^FS
-
-^FO30,65^A0N,14,14^FDWIP ID:^FS
-^FO30,85^A0N,24,24^FD{wip_id}^FS
-
-^FO340,65^BQN,2,5^FDQA,{wip_id}^FS
-
-^PQ1
-^XZ"""
-        return zpl
+        return label_service.render_zpl("WIP_LABEL", wip_id)
 
     def _generate_serial_zpl(self, serial_number: str) -> str:
         """Generate ZPL for Serial label (60mm x 30mm)."""
-        zpl = f"""^XA
-^MMT
-^PW472
-^LL236
-^PR1,1
-~SD29
-
-^FO30,30^A0N,16,16^FDF2X NEUROHUB - SERIAL LABEL^FS
-
-^FO30,65^A0N,14,14^FDSerial No:^FS
-^FO30,85^A0N,20,20^FD{serial_number}^FS
-
-^FO340,65^BQN,2,5^FDQA,{serial_number}^FS
-
-^PQ1
-^XZ"""
-        return zpl
+        return label_service.render_zpl("SERIAL_LABEL", serial_number)
 
     def _generate_lot_zpl(self, lot_number: str) -> str:
         """Generate ZPL for LOT label (60mm x 30mm)."""
-        zpl = f"""^XA
-^MMT
-^PW472
-^LL236
-^PR1,1
-~SD29
-
-^FO30,30^A0N,16,16^FDF2X NEUROHUB - LOT LABEL^FS
-
-^FO30,65^A0N,14,14^FDLOT No:^FS
-^FO30,85^A0N,24,24^FD{lot_number}^FS
-
-^FO340,65^BQN,2,5^FDQA,{lot_number}^FS
-
-^PQ1
-^XZ"""
-        return zpl
+        return label_service.render_zpl("LOT_LABEL", lot_number)
 
 
 # Singleton instance
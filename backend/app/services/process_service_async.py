@@ -1,74 +1,51 @@
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+"""
+Async process start/complete (착공/완공) on the async engine.
+
+Shop-floor scan bursts (shift changes) saturate Starlette's threadpool when
+every start/complete holds a worker thread for its whole database round
+trip. The async variants run on AsyncSessionLocal / the asyncpg engine, so
+a waiting request only holds a coroutine.
+
+The business rules are not re-implemented: ProcessService runs unchanged
+on the async session's connection through ``AsyncSession.run_sync``, so
+sequence validation, re-start, WIP history, serial conversion and
+auto-print behave exactly as on the sync path. Every database call inside
+it awaits the async driver; only auto-print's printer socket is blocking.
+
+Responses are fully built inside run_sync, so nothing is lazy-loaded
+after it returns.
+"""
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from app.models.process import Process
-from app.models.process_data import ProcessData
-from app.models.lot import Lot
+from app.schemas.process_operations import (
+    ProcessCompleteRequest,
+    ProcessCompleteResponse,
+    ProcessStartRequest,
+    ProcessStartResponse,
+)
+from app.services.process_service import ProcessService, process_service
+
 
 class AsyncProcessService:
     """
-    Service for handling process operations asynchronously.
-    Designed for high-concurrency environments using SQLAlchemy AsyncSession.
+    Process operations on an AsyncSession, with the full ProcessService rules.
+
+    Args:
+        service: Sync ProcessService holding the business rules
     """
-    
-    async def start_process_async(
-        self,
-        db: AsyncSession,
-        lot_id: int,
-        process_id: int,
-        operator_id: int
-    ) -> ProcessData:
-        """
-        Start a process execution asynchronously.
-        """
-        # Fetch related data
-        result = await db.execute(select(Process).where(Process.id == process_id))
-        process = result.scalar_one_or_none()
-        
-        if not process:
-            raise ValueError(f"Process {process_id} not found")
 
-        # Create process data
-        process_data = ProcessData(
-            lot_id=lot_id,
-            process_id=process_id,
-            operator_id=operator_id,
-            created_at=datetime.now(timezone.utc)
-        )
-        db.add(process_data)
-        await db.commit()
-        await db.refresh(process_data)
-        
-        return process_data
+    def __init__(self, service: ProcessService = process_service):
+        self.service = service
+
+    async def start_process(self, db: AsyncSession, request: ProcessStartRequest) -> ProcessStartResponse:
+        """Register process start (착공 등록). See ProcessService.start_process."""
+        return await db.run_sync(self.service.start_process, request)
+
+    async def complete_process(self, db: AsyncSession, request: ProcessCompleteRequest) -> ProcessCompleteResponse:
+        """Register process completion (완공 등록). See ProcessService.complete_process."""
+        return await db.run_sync(self.service.complete_process, request)
+
 
-    async def complete_process_async(
-        self,
-        db: AsyncSession,
-        process_data_id: int,
-        result_status: str,
-        measurements: Dict[str, Any]
-    ) -> ProcessData:
-        """
-        Complete a process execution asynchronously.
-        """
-        result = await db.execute(select(ProcessData).where(ProcessData.id == process_data_id))
-        process_data = result.scalar_one_or_none()
-        
-        if not process_data:
-            raise ValueError(f"ProcessData {process_data_id} not found")
-            
-        process_data.result = result_status
-        process_data.measurements = measurements
-        process_data.completed_at = datetime.now(timezone.utc)
-        
-        # Calculate duration
-        if process_data.created_at:
-            duration = (process_data.completed_at - process_data.created_at).total_seconds()
-            process_data.duration_seconds = duration
-            
-        await db.commit()
-        await db.refresh(process_data)
-        
-        return process_data
+# Singleton instance
+async_process_service = AsyncProcessService()
@@ -0,0 +1,595 @@
+"""
+Production reports served from materialized daily snapshots.
+
+Closed days are aggregated into DailyReportSnapshot rows by the nightly
+app.tasks.report_tasks.materialize_daily_reports task. A report over a
+date range then reads one snapshot row per day; only today (and a closed
+day the task has not covered yet) is aggregated live from process_data,
+with the same two grouped queries the task uses.
+
+Days are calendar days in settings.REPORT_TIMEZONE, both for bucketing
+started_at and for deciding which days are closed, independent of the
+database session's and the host's time zones. Executions uploaded late or
+corrected after midnight still reach their day: every run rewrites the
+last REPORT_SNAPSHOT_GRACE_DAYS closed days; older snapshots are kept.
+
+Reports:
+    - daily_production: per process and production line for one day
+    - process_performance: per process over a date range
+    - defect_analysis: per process and defect type over a date range
+    - lot_progress: LOTs by production date (live)
+    - wip_status: active WIP items (live)
+
+Each report returns one page of flat rows, ready for the desktop client's
+Excel/PDF exporters, and a summary over all rows:
+    {"items": [...], "total": 12, "skip": 0, "limit": 100, "summary": {...}}
+
+Example:
+    report = report_service.process_performance(db, date(2025, 11, 1), date(2025, 11, 30))
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import case, func, literal_column, select, true
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.lot import Lot, LotStatus
+from app.models.process import Process
+from app.models.process_data import ProcessData, ProcessResult
+from app.models.product_model import ProductModel
+from app.models.production_line import ProductionLine
+from app.models.report_snapshot import DailyReportSnapshot
+from app.models.wip_item import WIPItem, WIPStatus
+
+logger = logging.getLogger(__name__)
+
+# Failed executions recorded without a defect code
+UNSPECIFIED_DEFECT = "UNSPECIFIED"
+
+_ONE_DAY = timedelta(days=1)
+
+# Snapshot payload of one day: {"production": [...], "defects": [...]}
+DayAggregates = Dict[str, List[Dict[str, Any]]]
+
+
+def _zone() -> ZoneInfo:
+    return ZoneInfo(settings.REPORT_TIMEZONE)
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=_zone())
+
+
+def _days(start: date, end: date) -> Iterator[date]:
+    day = start
+    while day <= end:
+        yield day
+        day += _ONE_DAY
+
+
+def _rate(part: float, whole: float) -> float:
+    return round(part / whole * 100, 2) if whole else 0.0
+
+
+def _average(total: float, count: int) -> float:
+    return round(total / count, 2) if count else 0.0
+
+
+def _page(items: List[Dict[str, Any]], skip: int, limit: int, summary: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+    return {
+        "items": items[skip:skip + limit],
+        "total": len(items),
+        "skip": skip,
+        "limit": limit,
+        "summary": summary,
+        **extra,
+    }
+
+
+class ReportService:
+    """Daily snapshot materialization and the report queries built on it."""
+
+    # Aggregation
+
+    def today(self) -> date:
+        """Current day in the report time zone (the first day not closed)."""
+        return datetime.now(_zone()).date()
+
+    def aggregate_days(self, db: Session, start: date, end: date) -> Dict[date, DayAggregates]:
+        """
+        Aggregate process_data of [start, end] per day with two grouped queries.
+
+        Args:
+            db: Database session
+            start: First day (inclusive)
+            end: Last day (inclusive)
+
+        Returns:
+            Snapshot payload per day; days without executions have empty lists
+        """
+        window = (
+            ProcessData.started_at >= _midnight(start),
+            ProcessData.started_at < _midnight(end + _ONE_DAY),
+        )
+        day = func.date(func.timezone(settings.REPORT_TIMEZONE, ProcessData.started_at)).label("day")
+        aggregates: Dict[date, DayAggregates] = {
+            each: {"production": [], "defects": []} for each in _days(start, end)
+        }
+
+        production = db.execute(
+            select(
+                day,
+                ProcessData.process_id,
+                Process.process_code,
+                Process.process_name_en,
+                Lot.production_line_id,
+                ProductionLine.line_code,
+                func.count().label("started"),
+                func.count(ProcessData.completed_at).label("completed"),
+                func.count().filter(ProcessData.result == ProcessResult.PASS.value).label("pass_count"),
+                func.count().filter(ProcessData.result == ProcessResult.FAIL.value).label("fail_count"),
+                func.count().filter(ProcessData.result == ProcessResult.REWORK.value).label("rework_count"),
+                func.coalesce(func.sum(ProcessData.duration_seconds), 0).label("duration_sum"),
+                func.count(ProcessData.duration_seconds).label("duration_count"),
+            )
+            .select_from(ProcessData)
+            .join(Process, Process.id == ProcessData.process_id)
+            .join(Lot, Lot.id == ProcessData.lot_id)
+            .outerjoin(ProductionLine, ProductionLine.id == Lot.production_line_id)
+            .where(*window)
+            .group_by(
+                day,
+                ProcessData.process_id,
+                Process.process_code,
+                Process.process_name_en,
+                Lot.production_line_id,
+                ProductionLine.line_code,
+            )
+            .order_by(day, Process.process_code, ProductionLine.line_code)
+        )
+        for row in production:
+            aggregates[row.day]["production"].append({
+                "process_id": row.process_id,
+                "process_code": row.process_code,
+                "process_name": row.process_name_en,
+                "line_id": row.production_line_id,
+                "line_code": row.line_code,
+                "started": row.started,
+                "completed": row.completed,
+                "pass_count": row.pass_count,
+                "fail_count": row.fail_count,
+                "rework_count": row.rework_count,
+                "duration_sum": int(row.duration_sum),
+                "duration_count": row.duration_count,
+            })
+
+        # defects holds defect codes or {"defect_code": ...} objects
+        defect = func.jsonb_array_elements(ProcessData.defects).table_valued("value").lateral("defect")
+        defect_type = func.coalesce(
+            case(
+                (func.jsonb_typeof(defect.c.value) == "object", defect.c.value.op("->>")("defect_code")),
+                else_=defect.c.value.op("#>>")(literal_column("'{}'")),
+            ),
+            UNSPECIFIED_DEFECT,
+        ).label("defect_type")
+        defects = db.execute(
+            select(
+                day,
+                ProcessData.process_id,
+                Process.process_code,
+                Process.process_name_en,
+                defect_type,
+                func.count().label("defect_count"),
+            )
+            .select_from(ProcessData)
+            .join(Process, Process.id == ProcessData.process_id)
+            .outerjoin(defect, true())
+            .where(*window, ProcessData.result == ProcessResult.FAIL.value)
+            .group_by(day, ProcessData.process_id, Process.process_code, Process.process_name_en, defect_type)
+            .order_by(day, Process.process_code, defect_type)
+        )
+        for row in defects:
+            aggregates[row.day]["defects"].append({
+                "process_id": row.process_id,
+                "process_code": row.process_code,
+                "process_name": row.process_name_en,
+                "defect_type": row.defect_type,
+                "defect_count": row.defect_count,
+            })
+
+        return aggregates
+
+    def materialize(self, db: Session, start: date, end: date) -> int:
+        """
+        Write snapshots for the closed days of [start, end].
+
+        Days without a snapshot and the last REPORT_SNAPSHOT_GRACE_DAYS
+        closed days are (re)aggregated; older snapshots are kept. Commits.
+
+        Args:
+            db: Database session on the primary
+            start: First day (inclusive)
+            end: Last day (inclusive); clamped to yesterday
+
+        Returns:
+            Number of snapshots written or rewritten
+        """
+        today = self.today()
+        end = min(end, today - _ONE_DAY)
+        if start > end:
+            return 0
+
+        kept = set(db.scalars(
+            select(DailyReportSnapshot.report_date)
+            .where(
+                DailyReportSnapshot.report_date.between(start, end),
+                DailyReportSnapshot.report_date < today - timedelta(days=settings.REPORT_SNAPSHOT_GRACE_DAYS),
+            )
+        ))
+        days = [day for day in _days(start, end) if day not in kept]
+        if not days:
+            return 0
+
+        aggregates = self.aggregate_days(db, days[0], days[-1])
+        statement = postgresql.insert(DailyReportSnapshot).values(
+            [{"report_date": day, **aggregates[day]} for day in days]
+        )
+        result = db.execute(statement.on_conflict_do_update(
+            index_elements=[DailyReportSnapshot.report_date],
+            set_={
+                "production": statement.excluded.production,
+                "defects": statement.excluded.defects,
+                "created_at": func.now(),
+            },
+        ))
+        db.commit()
+        return result.rowcount
+
+    def load_days(self, db: Session, start: date, end: date) -> List[DayAggregates]:
+        """
+        Aggregates of each day of [start, end], up to today.
+
+        Snapshots are read in one range scan; days without one are
+        aggregated live.
+        """
+        end = min(end, self.today())
+        if start > end:
+            return []
+
+        by_day: Dict[date, DayAggregates] = {
+            snapshot.report_date: {"production": snapshot.production, "defects": snapshot.defects}
+            for snapshot in db.scalars(
+                select(DailyReportSnapshot)
+                .where(DailyReportSnapshot.report_date.between(start, end))
+            )
+        }
+        missing = [day for day in _days(start, end) if day not in by_day]
+        if missing:
+            live = self.aggregate_days(db, missing[0], missing[-1])
+            by_day.update((day, live[day]) for day in missing)
+
+        return [by_day[day] for day in _days(start, end)]
+
+    # Reports
+
+    def daily_production(
+        self,
+        db: Session,
+        day: date,
+        line_id: Optional[int] = None,
+        process_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """Production per process and production line for one day."""
+        rows = [
+            row
+            for aggregates in self.load_days(db, day, day)
+            for row in aggregates["production"]
+            if (process_id is None or row["process_id"] == process_id)
+            and (line_id is None or row["line_id"] == line_id)
+        ]
+        items = [
+            {
+                "process_code": row["process_code"],
+                "process_name": row["process_name"],
+                "line_code": row["line_code"],
+                "started": row["started"],
+                "completed": row["completed"],
+                "pass_count": row["pass_count"],
+                "fail_count": row["fail_count"],
+                "rework_count": row["rework_count"],
+                "pass_rate": _rate(row["pass_count"], row["completed"]),
+                "avg_cycle_time": _average(row["duration_sum"], row["duration_count"]),
+            }
+            for row in sorted(rows, key=lambda row: (row["process_code"], row["line_code"] or ""))
+        ]
+
+        completed = sum(row["completed"] for row in rows)
+        total_pass = sum(row["pass_count"] for row in rows)
+        summary = {
+            "total_started": sum(row["started"] for row in rows),
+            "total_completed": completed,
+            "total_pass": total_pass,
+            "total_fail": sum(row["fail_count"] for row in rows),
+            "pass_rate": _rate(total_pass, completed),
+            "avg_cycle_time": _average(
+                sum(row["duration_sum"] for row in rows), sum(row["duration_count"] for row in rows)
+            ),
+        }
+        return _page(items, skip, limit, summary, date=day.isoformat())
+
+    def process_performance(
+        self,
+        db: Session,
+        start: date,
+        end: date,
+        process_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """Throughput, yield and cycle time per process over a date range."""
+        self.check_range(start, end)
+        days = self.load_days(db, start, end)
+        by_process = self._production_by_process(days, process_id)
+
+        items = []
+        for totals in sorted(by_process.values(), key=lambda totals: totals["process_code"]):
+            items.append({
+                "process_code": totals["process_code"],
+                "process_name": totals["process_name"],
+                "total_count": totals["started"],
+                "completed": totals["completed"],
+                "pass_count": totals["pass_count"],
+                "fail_count": totals["fail_count"],
+                "rework_count": totals["rework_count"],
+                "yield_rate": _rate(totals["pass_count"], totals["pass_count"] + totals["fail_count"]),
+                "avg_cycle_time": _average(totals["duration_sum"], totals["duration_count"]),
+                "throughput_per_day": _average(totals["completed"], len(days)),
+            })
+
+        total_processed = sum(item["total_count"] for item in items)
+        top_performers = sorted(items, key=lambda item: item["yield_rate"], reverse=True)[:5]
+        summary = {
+            "total_processed": total_processed,
+            "avg_throughput": _average(total_processed, len(items)),
+            "avg_yield": _average(sum(item["yield_rate"] for item in items), len(items)),
+            "top_performers": [
+                {"process": item["process_name"], "yield_rate": item["yield_rate"]}
+                for item in top_performers
+            ],
+        }
+        return _page(items, skip, limit, summary, date_range=self._date_range(start, end))
+
+    def defect_analysis(
+        self,
+        db: Session,
+        start: date,
+        end: date,
+        process_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """Defect counts per process and defect type over a date range."""
+        self.check_range(start, end)
+        days = self.load_days(db, start, end)
+        inspected = {
+            key: totals["pass_count"] + totals["fail_count"]
+            for key, totals in self._production_by_process(days, process_id).items()
+        }
+
+        by_type: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        for aggregates in days:
+            for row in aggregates["defects"]:
+                if process_id is not None and row["process_id"] != process_id:
+                    continue
+                key = (row["process_id"], row["defect_type"])
+                if key not in by_type:
+                    by_type[key] = {
+                        "process_code": row["process_code"],
+                        "process_name": row["process_name"],
+                        "defect_type": row["defect_type"],
+                        "defect_count": 0,
+                        "total_count": inspected.get(row["process_id"], 0),
+                    }
+                by_type[key]["defect_count"] += row["defect_count"]
+
+        items = sorted(
+            by_type.values(),
+            key=lambda item: (-item["defect_count"], item["process_code"], item["defect_type"]),
+        )
+        for item in items:
+            item["defect_rate"] = _rate(item["defect_count"], item["total_count"])
+
+        total_defects = sum(item["defect_count"] for item in items)
+        counts: Dict[str, int] = defaultdict(int)
+        for item in items:
+            counts[item["defect_type"]] += item["defect_count"]
+        summary = {
+            "total_defects": total_defects,
+            "defect_rate": _rate(total_defects, sum(inspected.values())),
+            "by_type": dict(counts),
+            "top_defects": [
+                {"type": defect_type, "count": count}
+                for defect_type, count in sorted(counts.items(), key=lambda pair: pair[1], reverse=True)[:10]
+            ],
+        }
+        return _page(items, skip, limit, summary, date_range=self._date_range(start, end))
+
+    def lot_progress(
+        self,
+        db: Session,
+        start: date,
+        end: date,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """LOTs by production date with quantities, newest first (live)."""
+        self.check_range(start, end)
+        filters = [Lot.production_date.between(start, end)]
+        if status:
+            filters.append(Lot.status == status)
+
+        by_status = dict(db.execute(
+            select(Lot.status, func.count()).where(*filters).group_by(Lot.status)
+        ).all())
+        total = sum(by_status.values())
+
+        rows = db.execute(
+            select(
+                Lot.lot_number,
+                ProductModel.model_code,
+                ProductionLine.line_code,
+                Lot.production_date,
+                Lot.status,
+                Lot.target_quantity,
+                Lot.actual_quantity,
+                Lot.passed_quantity,
+                Lot.failed_quantity,
+            )
+            .join(ProductModel, ProductModel.id == Lot.product_model_id)
+            .outerjoin(ProductionLine, ProductionLine.id == Lot.production_line_id)
+            .where(*filters)
+            .order_by(Lot.production_date.desc(), Lot.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        items = [
+            {
+                "lot_number": row.lot_number,
+                "model_code": row.model_code,
+                "line_code": row.line_code,
+                "production_date": row.production_date.isoformat(),
+                "status": row.status,
+                "target_quantity": row.target_quantity,
+                "actual_quantity": row.actual_quantity,
+                "passed_quantity": row.passed_quantity,
+                "failed_quantity": row.failed_quantity,
+                "progress": _rate(row.actual_quantity, row.target_quantity),
+                "yield_rate": _rate(row.passed_quantity, row.passed_quantity + row.failed_quantity),
+            }
+            for row in rows
+        ]
+
+        completed = by_status.get(LotStatus.COMPLETED.value, 0) + by_status.get(LotStatus.CLOSED.value, 0)
+        summary = {
+            "total_lots": total,
+            "completed_lots": completed,
+            "in_progress_lots": by_status.get(LotStatus.IN_PROGRESS.value, 0),
+            "completion_rate": _rate(completed, total),
+        }
+        return {
+            "items": items,
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+            "summary": summary,
+            "date_range": self._date_range(start, end),
+        }
+
+    def wip_status(
+        self,
+        db: Session,
+        process_id: Optional[int] = None,
+        line_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """Active (not yet converted) WIP items with their current process (live)."""
+        filters = [WIPItem.status != WIPStatus.CONVERTED.value]
+        if process_id is not None:
+            filters.append(WIPItem.current_process_id == process_id)
+        if line_id is not None:
+            filters.append(Lot.production_line_id == line_id)
+
+        def grouped(*columns):
+            return db.execute(
+                select(*columns, func.count())
+                .select_from(WIPItem)
+                .join(Lot, Lot.id == WIPItem.lot_id)
+                .outerjoin(Process, Process.id == WIPItem.current_process_id)
+                .where(*filters)
+                .group_by(*columns)
+            ).all()
+
+        by_status = dict(grouped(WIPItem.status))
+        by_process: Dict[str, int] = {}
+        for process_name, count in grouped(Process.process_name_en):
+            by_process[process_name or "Unassigned"] = count
+
+        rows = db.execute(
+            select(
+                WIPItem.wip_id,
+                Lot.lot_number,
+                WIPItem.status,
+                Process.process_code,
+                Process.process_name_en,
+                ProductionLine.line_code,
+                WIPItem.updated_at,
+            )
+            .join(Lot, Lot.id == WIPItem.lot_id)
+            .outerjoin(Process, Process.id == WIPItem.current_process_id)
+            .outerjoin(ProductionLine, ProductionLine.id == Lot.production_line_id)
+            .where(*filters)
+            .order_by(WIPItem.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        items = [
+            {
+                "wip_id": row.wip_id,
+                "lot_number": row.lot_number,
+                "status": row.status,
+                "process_code": row.process_code,
+                "process_name": row.process_name_en,
+                "line_code": row.line_code,
+                "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+            }
+            for row in rows
+        ]
+
+        total = sum(by_status.values())
+        summary = {"total_wip": total, "by_status": by_status, "by_process": by_process}
+        return {"items": items, "total": total, "skip": skip, "limit": limit, "summary": summary}
+
+    # Helpers
+
+    @staticmethod
+    def check_range(start: date, end: date) -> None:
+        """Raise ValueError unless start..end is a valid report date range."""
+        if start > end:
+            raise ValueError("start_date must be on or before end_date")
+        if (end - start).days + 1 > settings.REPORT_MAX_RANGE_DAYS:
+            raise ValueError(f"Date range must not exceed {settings.REPORT_MAX_RANGE_DAYS} days")
+
+    @staticmethod
+    def _date_range(start: date, end: date) -> Dict[str, str]:
+        return {"start": start.isoformat(), "end": end.isoformat()}
+
+    @staticmethod
+    def _production_by_process(days: List[DayAggregates], process_id: Optional[int]) -> Dict[int, Dict[str, Any]]:
+        """Production rows of all days and lines summed per process."""
+        by_process: Dict[int, Dict[str, Any]] = {}
+        counters = ("started", "completed", "pass_count", "fail_count", "rework_count", "duration_sum", "duration_count")
+        for aggregates in days:
+            for row in aggregates["production"]:
+                if process_id is not None and row["process_id"] != process_id:
+                    continue
+                totals = by_process.setdefault(row["process_id"], {
+                    "process_code": row["process_code"],
+                    "process_name": row["process_name"],
+                    **{counter: 0 for counter in counters},
+                })
+                for counter in counters:
+                    totals[counter] += row[counter]
+        return by_process
+
+
+report_service = ReportService()
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
@@ -45,12 +45,13 @@ class SerialService(BaseService[Serial]):
         db: Session,
         skip: int = 0,
         limit: int = 50,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[SerialInDB]:
         """List all serials with optional filtering and pagination."""
         try:
             return crud.serial.get_multi(
-                db, skip=skip, limit=limit, status=status
+                db, skip=skip, limit=limit, status=status, after=after
             )
         except ValueError as e:
             self.log_error(e, "list_serials", {"status": status})
@@ -62,11 +63,12 @@ class SerialService(BaseService[Serial]):
         self,
         db: Session,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[SerialInDB]:
         """Get FAILED serials available for rework."""
         try:
-            return crud.serial.get_failed(db, skip=skip, limit=limit)
+            return crud.serial.get_failed(db, skip=skip, limit=limit, after=after)
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_failed")
 
@@ -89,11 +91,12 @@ class SerialService(BaseService[Serial]):
         db: Session,
         lot_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[SerialListItem]:
         """Get all serials in a specific lot."""
         try:
-            return crud.serial.get_by_lot(db, lot_id=lot_id, skip=skip, limit=limit)
+            return crud.serial.get_by_lot(db, lot_id=lot_id, skip=skip, limit=limit, after=after)
         except SQLAlchemyError as e:
             self.handle_sqlalchemy_error(e, operation="get_by_lot")
 
@@ -102,11 +105,12 @@ class SerialService(BaseService[Serial]):
         db: Session,
         status_filter: str,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Sequence[Any]] = None,
     ) -> List[SerialInDB]:
         """Get serials filtered by status."""
         try:
-            return crud.serial.get_by_status(db, status=status_filter, skip=skip, limit=limit)
+            return crud.serial.get_by_status(db, status=status_filter, skip=skip, limit=limit, after=after)
         except ValueError as e:
             self.log_error(e, "get_by_status", {"status": status_filter})
             raise ValidationException(message=str(e))
@@ -172,9 +176,8 @@ class SerialService(BaseService[Serial]):
 
             # Use transaction context manager for atomic operation
             with self.transaction(db):
-                # 4. Determine next sequence
-                current_count = crud.serial.count_by_lot(db, lot_id=lot.id)
-                next_sequence = current_count + 1
+                # 4. Allocate next sequence (atomic per-LOT counter)
+                next_sequence = crud.serial.next_sequence(db, lot_id=lot.id)
 
                 self.check_business_rule(
                     next_sequence <= lot.target_quantity,
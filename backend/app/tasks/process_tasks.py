@@ -30,25 +30,16 @@ def complete_process_batch(self, lot_id: int, process_id: int, batch_data: List[
     return {"status": "completed", "processed_count": total, "results": results}
 
 @celery_app.task(bind=True)
-def export_process_data(self, start_date: str, end_date: str, format: str = "csv"):
+def export_process_data(self, job_id: int):
     """
-    Simulate a long-running data export.
+    Write a DATA_EXPORT job's file to EXPORT_DIR.
+
+    Progress is recorded on the job's ProcessJob and mirrored to the task state.
     """
-    self.update_state(state='PROGRESS', meta={'progress': 0})
-    
-    # Simulate data gathering
-    time.sleep(2)
-    self.update_state(state='PROGRESS', meta={'progress': 30})
-    
-    # Simulate file generation
-    time.sleep(2)
-    self.update_state(state='PROGRESS', meta={'progress': 70})
-    
-    # Simulate upload
-    time.sleep(1)
-    
-    return {
-        "download_url": f"https://storage.example.com/exports/process_data_{start_date}_{end_date}.{format}",
-        "record_count": 15420,
-        "file_size_mb": 4.2
-    }
+    from app.database import JobsSessionLocal
+    from app.services.export_service import export_service
+
+    def report(state: Dict[str, Any]) -> None:
+        self.update_state(state='PROGRESS', meta=state)
+
+    return export_service.run_job(JobsSessionLocal, job_id, on_progress=report)
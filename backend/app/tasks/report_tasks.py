@@ -0,0 +1,29 @@
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from app.core.celery_app import celery_app
+
+
+@celery_app.task(bind=True)
+def materialize_daily_reports(self, days: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Write daily report snapshots for the last closed days.
+
+    Scheduled nightly by celery beat; a missed night is filled in by the
+    next run (up to REPORT_SNAPSHOT_BACKFILL_DAYS back), and the last
+    REPORT_SNAPSHOT_GRACE_DAYS days are refreshed.
+    """
+    from app.config import settings
+    from app.database import JobsSessionLocal
+    from app.services.report_service import report_service
+
+    end = report_service.today() - timedelta(days=1)
+    start = end - timedelta(days=(days or settings.REPORT_SNAPSHOT_BACKFILL_DAYS) - 1)
+
+    db = JobsSessionLocal()
+    try:
+        written = report_service.materialize(db, start, end)
+    finally:
+        db.close()
+
+    return {"start": start.isoformat(), "end": end.isoformat(), "written": written}
@@ -21,25 +21,37 @@ Functions:
     - generate_qr_code: Generate QR code as PNG image
     - generate_zpl_barcode: Generate ZPL command for Zebra printers
     - generate_barcode_image: Generic barcode generator (dispatches to specific type)
+    - render_barcode_png: PNG bytes for a barcode (picklable, for process pools)
 """
 
 import io
 from io import BytesIO
 from typing import Optional, Literal
 
-try:
-    import barcode
-    from barcode.writer import ImageWriter
-except ImportError:
-    barcode = None
-    ImageWriter = None
 
-try:
-    import qrcode
-    from qrcode.image.pil import PilImage
-except ImportError:
-    qrcode = None
-    PilImage = None
+def _import_barcode():
+    """Import python-barcode on first use (keeps API startup fast)."""
+    try:
+        import barcode
+        from barcode.writer import ImageWriter
+    except ImportError:
+        raise ImportError(
+            "python-barcode is required for barcode generation. "
+            "Install it with: pip install python-barcode[images]"
+        ) from None
+    return barcode, ImageWriter
+
+
+def _import_qrcode():
+    """Import qrcode on first use (keeps API startup fast)."""
+    try:
+        import qrcode
+    except ImportError:
+        raise ImportError(
+            "qrcode is required for QR code generation. "
+            "Install it with: pip install qrcode[pil]"
+        ) from None
+    return qrcode
 
 
 # Barcode generation constants
@@ -82,11 +94,7 @@ def generate_code128_barcode(
         ...     writer_options={"module_width": 0.3, "module_height": 10.0}
         ... )
     """
-    if barcode is None or ImageWriter is None:
-        raise ImportError(
-            "python-barcode is required for barcode generation. "
-            "Install it with: pip install python-barcode[images]"
-        )
+    barcode, ImageWriter = _import_barcode()
 
     if not data:
         raise ValueError("data is required for barcode generation")
@@ -159,11 +167,7 @@ def generate_qr_code(
         ...     error_correction="H"
         ... )
     """
-    if qrcode is None:
-        raise ImportError(
-            "qrcode is required for QR code generation. "
-            "Install it with: pip install qrcode[pil]"
-        )
+    qrcode = _import_qrcode()
 
     if not data:
         raise ValueError("data is required for QR code generation")
@@ -359,3 +363,25 @@ def generate_barcode_image(
             f"Invalid barcode_type: {barcode_type}. "
             f"Valid values: code128, qr"
         )
+
+
+def render_barcode_png(
+    data: str,
+    barcode_type: Literal["code128", "qr"] = "code128",
+    options: Optional[dict] = None,
+) -> bytes:
+    """
+    Render a barcode to PNG bytes.
+
+    Module-level wrapper around generate_barcode_image so it can be
+    submitted to a process pool for batch rasterization.
+
+    Args:
+        data: Data to encode
+        barcode_type: Type of barcode ("code128" or "qr", default: "code128")
+        options: Additional arguments passed to generate_barcode_image
+
+    Returns:
+        PNG image data
+    """
+    return generate_barcode_image(data, barcode_type=barcode_type, **(options or {})).getvalue()
@@ -0,0 +1,365 @@
+"""
+Bulk synthetic production data for benchmarks and performance seeding.
+
+Generates LOTs of 100 units that went through the eight-process line the
+way the shop floor records it: WIP processes 1-6 write WIP level
+process_data plus wip_process_history, the unit converts to a serial, and
+processes 7-8 write SERIAL level process_data. About 5% of units fail at a
+random process and stop there. The newest LOT is left in progress with its
+remaining WIPs CREATED, ready for start/complete benchmarks.
+
+Rows are built in Python with explicit primary keys and written table by
+table: COPY on PostgreSQL, multi-row INSERT elsewhere. A million
+process_data rows load in minutes instead of hours through the ORM.
+
+Example:
+    >>> counts = generate(
+    ...     db, 1_000_000, processes={n: n for n in range(1, 9)},
+    ...     operator_ids=[operator.id], product_model_id=model.id,
+    ... )
+    >>> counts["process_data"]
+    1000000
+"""
+
+import csv
+import io
+import json
+import random
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from sqlalchemy import Table, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.models import Lot, ProcessData, Serial, WIPItem, WIPProcessHistory
+
+UNITS_PER_LOT = 100
+WIP_PROCESSES = range(1, 7)
+SERIAL_PROCESSES = range(7, 9)
+FAIL_RATE = 0.05
+
+# Seconds per process on the line, in process number order
+DURATIONS = {1: 60, 2: 180, 3: 45, 4: 240, 5: 300, 6: 180, 7: 30, 8: 60}
+
+FAILURE_REASONS = {
+    1: "Laser marking too shallow",
+    2: "Assembly defect",
+    3: "Sensor test failed",
+    4: "Firmware upload error",
+    5: "Robot assembly misaligned",
+    6: "Voltage out of range",
+    7: "Label misprinted",
+    8: "Visual inspection failed",
+}
+
+_NULL = "\\N"
+
+
+def generate_measurements(process_number: int, is_fail: bool = False, rng: Any = random) -> dict:
+    """Generate realistic measurements data for each process."""
+
+    if process_number == 1:  # Laser Marking
+        laser_power = rng.uniform(80, 100) if not is_fail else rng.uniform(60, 75)
+        marking_depth = rng.uniform(0.1, 0.3) if not is_fail else rng.uniform(0.05, 0.08)
+        return {
+            "laser_power": {"value": round(laser_power, 1), "unit": "%", "min": 80, "max": 100},
+            "marking_depth": {"value": round(marking_depth, 2), "unit": "mm", "min": 0.1, "max": 0.3}
+        }
+
+    elif process_number == 2:  # LMA Assembly
+        assembly_time = rng.uniform(150, 210) if not is_fail else rng.uniform(250, 300)
+        torque_value = rng.uniform(4.5, 5.5) if not is_fail else rng.uniform(3.0, 4.0)
+        return {
+            "assembly_time": {"value": round(assembly_time, 1), "unit": "sec", "min": 150, "max": 210},
+            "torque_value": {"value": round(torque_value, 2), "unit": "Nm", "min": 4.5, "max": 5.5}
+        }
+
+    elif process_number == 3:  # Sensor Inspection
+        temp_measured = rng.uniform(59.0, 61.0) if not is_fail else rng.uniform(55.0, 57.0)
+        i2c_ok = True if not is_fail else False
+        return {
+            "temp_sensor": {
+                "measured": round(temp_measured, 1),
+                "target": 60.0,
+                "tolerance": 1.0,
+                "unit": "°C",
+                "pass": abs(temp_measured - 60.0) <= 1.0
+            },
+            "tof_sensor": {"i2c_ok": i2c_ok, "status": "OK" if i2c_ok else "FAIL"}
+        }
+
+    elif process_number == 4:  # Firmware Upload
+        versions = ["v2.1.5", "v2.1.6", "v2.2.0"]
+        upload_time = rng.uniform(200, 260) if not is_fail else rng.uniform(400, 500)
+        success = True if not is_fail else False
+        return {
+            "firmware_version": rng.choice(versions),
+            "upload_time": {"value": round(upload_time, 0), "unit": "sec", "max": 300},
+            "upload_success": success,
+            "checksum_verified": success
+        }
+
+    elif process_number == 5:  # Robot Assembly
+        assembly_time = rng.uniform(280, 320) if not is_fail else rng.uniform(350, 400)
+        cable_ok = True if not is_fail else False
+        return {
+            "assembly_time": {"value": round(assembly_time, 1), "unit": "sec", "min": 270, "max": 330},
+            "cable_connection": "OK" if cable_ok else "FAIL",
+            "alignment_check": "PASS" if not is_fail else "FAIL"
+        }
+
+    elif process_number == 6:  # Performance Test
+        voltage = rng.uniform(11.8, 12.2) if not is_fail else rng.uniform(11.0, 11.5)
+        current = rng.uniform(4.8, 5.2) if not is_fail else rng.uniform(5.5, 6.0)
+        force = rng.uniform(20, 25) if not is_fail else rng.uniform(15, 18)
+        return {
+            "voltage": {"value": round(voltage, 2), "unit": "V", "min": 11.8, "max": 12.2},
+            "current": {"value": round(current, 2), "unit": "A", "min": 4.8, "max": 5.2},
+            "force": {"value": round(force, 1), "unit": "kgf", "min": 20, "max": 25}
+        }
+
+    elif process_number == 7:  # Label Printing
+        print_quality = rng.uniform(95, 100) if not is_fail else rng.uniform(70, 85)
+        barcode_ok = True if not is_fail else False
+        return {
+            "print_quality": {"value": round(print_quality, 1), "unit": "%", "min": 90},
+            "barcode_verified": barcode_ok,
+            "label_position": "OK" if not is_fail else "MISALIGNED"
+        }
+
+    elif process_number == 8:  # Packaging
+        weight = rng.uniform(495, 510) if not is_fail else rng.uniform(480, 490)
+        defects = [] if not is_fail else [rng.choice(["scratch", "dent", "contamination"])]
+        return {
+            "weight_check": {"value": round(weight, 1), "unit": "g", "min": 495, "max": 510},
+            "visual_defects": defects,
+            "packaging_complete": len(defects) == 0
+        }
+
+    return {"test": "value"}
+
+
+class _Batches:
+    """Per-table row buffers written once they hold chunk_size rows."""
+
+    # Referenced tables first so foreign keys hold at every write
+    TABLES = (Lot, Serial, WIPItem, ProcessData, WIPProcessHistory)
+
+    def __init__(self, db: Session, chunk_size: int):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.copy = db.get_bind().dialect.name == "postgresql"
+        self.rows: Dict[Table, List[Dict[str, Any]]] = {model.__table__: [] for model in self.TABLES}
+        self.counts = {model.__tablename__: 0 for model in self.TABLES}
+
+    def add(self, model, row: Dict[str, Any]) -> None:
+        self.rows[model.__table__].append(row)
+        self.counts[model.__tablename__] += 1
+
+    def flush(self, force: bool = False) -> None:
+        """Write the buffers; called between LOTs so every buffered row is complete."""
+        if not force and all(len(rows) < self.chunk_size for rows in self.rows.values()):
+            return
+        for table, rows in self.rows.items():
+            if rows:
+                self._write(table, rows)
+                rows.clear()
+
+    def _write(self, table: Table, rows: List[Dict[str, Any]]) -> None:
+        if not self.copy:
+            self.db.execute(insert(table), rows)
+            return
+        columns = list(rows[0])
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([_copy_value(row[name]) for name in columns])
+        buffer.seek(0)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '{_NULL}')",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+
+def _copy_value(value: Any) -> Any:
+    if value is None:
+        return _NULL
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "value"):  # Enum members
+        return value.value
+    return value
+
+
+def _next_id(db: Session, model) -> int:
+    return (db.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def _sync_sequences(db: Session) -> None:
+    """Move PostgreSQL id sequences past the explicitly assigned keys."""
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    for model in _Batches.TABLES:
+        name = model.__tablename__
+        db.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 1) FROM {name}))"
+        ))
+
+
+def generate(
+    db: Session,
+    process_data_rows: int,
+    *,
+    processes: Mapping[int, int],
+    operator_ids: Sequence[int],
+    product_model_id: int,
+    production_line_id: Optional[int] = None,
+    lot_prefix: str = "KR01PSA",
+    days: int = 30,
+    seed: int = 0,
+    chunk_size: int = 50_000,
+) -> Dict[str, int]:
+    """
+    Bulk-load LOTs, WIPs, serials and their process history.
+
+    Args:
+        db: Database session; the caller commits
+        process_data_rows: Number of process_data rows to generate
+        processes: Process number (1-8) to processes.id
+        operator_ids: Users the executions are spread over
+        product_model_id: Product model of every LOT
+        production_line_id: Optional production line of every LOT
+        lot_prefix: Country, line and model part of the LOT numbers
+        days: Production days the LOTs are spread over, ending today
+        seed: Random seed; the same arguments give the same data
+        chunk_size: Rows buffered per table between writes
+
+    Returns:
+        Rows written per table
+    """
+    missing = set(range(1, 9)) - set(processes)
+    if missing:
+        raise ValueError(f"Missing process numbers: {sorted(missing)}")
+
+    rng = random.Random(seed)
+    batches = _Batches(db, chunk_size)
+    ids = {model: _next_id(db, model) for model in _Batches.TABLES}
+    now = datetime.now(timezone.utc)
+    # Failed units stop early, so a few more LOTs than this are usually needed
+    expected_lots = max(1, -(-process_data_rows // (len(DURATIONS) * UNITS_PER_LOT)))
+    remaining = process_data_rows
+    lot_index = 0
+
+    while remaining > 0:
+        age = max(0, expected_lots - 1 - lot_index) * days // expected_lots
+        production_date = date.today() - timedelta(days=age)
+        lot_id = ids[Lot]
+        ids[Lot] += 1
+        lot_index += 1
+        lot_number = f"{lot_prefix}{production_date:%y%m}{lot_id:03d}"
+        day_start = datetime.combine(production_date, datetime.min.time(), timezone.utc)
+        passed = failed = 0
+        batches.add(Lot, {
+            "id": lot_id, "lot_number": lot_number, "product_model_id": product_model_id,
+            "production_line_id": production_line_id, "production_date": production_date,
+            "target_quantity": UNITS_PER_LOT, "status": "COMPLETED",
+            "created_at": day_start, "updated_at": now, "closed_at": None,
+        })
+
+        for sequence in range(1, UNITS_PER_LOT + 1):
+            wip_pk = ids[WIPItem]
+            ids[WIPItem] += 1
+            wip = {
+                "id": wip_pk, "wip_id": f"WIP-{lot_number}-{sequence:03d}", "lot_id": lot_id,
+                "sequence_in_lot": sequence, "status": "CREATED", "current_process_id": None,
+                "serial_id": None, "converted_at": None, "completed_at": None,
+                "created_at": day_start, "updated_at": day_start,
+            }
+            batches.add(WIPItem, wip)
+            if remaining <= 0:
+                continue  # Units of the newest LOT that have not started yet
+
+            fail_at = rng.randint(1, 8) if rng.random() < FAIL_RATE else None
+            steps = min(remaining, fail_at or 8)
+            remaining -= steps
+            started = day_start + timedelta(seconds=rng.randint(0, 80_000))
+            executions = []
+            for number in range(1, steps + 1):
+                failed_here = number == fail_at
+                completed = started + timedelta(seconds=DURATIONS[number])
+                executions.append({
+                    "process_id": processes[number],
+                    "operator_id": rng.choice(operator_ids),
+                    "result": "FAIL" if failed_here else "PASS",
+                    "measurements": generate_measurements(number, failed_here, rng),
+                    "defects": [{"defect_code": f"P{number}-FAIL"}] if failed_here else [],
+                    "notes": None,
+                    "started_at": started,
+                    "completed_at": completed,
+                    "duration_seconds": DURATIONS[number],
+                    "created_at": completed,
+                })
+                started = completed + timedelta(seconds=rng.randint(10, 600))
+
+            last = executions[-1]
+            unit_failed = fail_at is not None and steps == fail_at
+            serial_id = None
+            if steps >= 7:
+                serial_id = ids[Serial]
+                ids[Serial] += 1
+                finished = steps == 8 or unit_failed
+                batches.add(Serial, {
+                    "id": serial_id, "serial_number": f"{lot_number}{sequence:03d}", "lot_id": lot_id,
+                    "sequence_in_lot": sequence,
+                    "status": "FAILED" if unit_failed else ("PASSED" if finished else "IN_PROGRESS"),
+                    "rework_count": 0,
+                    "failure_reason": FAILURE_REASONS[fail_at] if unit_failed else None,
+                    "created_at": executions[6]["started_at"], "updated_at": last["completed_at"],
+                    "completed_at": last["completed_at"] if finished else None,
+                })
+                converted = executions[5]["completed_at"]
+                wip.update(status="CONVERTED", serial_id=serial_id, converted_at=converted, completed_at=converted)
+            elif unit_failed:
+                wip.update(status="FAILED")
+            elif steps == 6:
+                wip.update(status="COMPLETED", completed_at=last["completed_at"])
+            else:
+                wip.update(status="IN_PROGRESS")
+            wip.update(current_process_id=processes[steps], updated_at=last["completed_at"])
+            if unit_failed:
+                failed += 1
+            elif steps == 8:
+                passed += 1
+
+            for number, execution in enumerate(executions, start=1):
+                if number in WIP_PROCESSES:
+                    batches.add(WIPProcessHistory, {
+                        "id": ids[WIPProcessHistory], "wip_item_id": wip_pk,
+                        "equipment_id": None, "process_session_id": None, **execution,
+                    })
+                    ids[WIPProcessHistory] += 1
+                batches.add(ProcessData, {
+                    "id": ids[ProcessData], "lot_id": lot_id, "wip_id": wip_pk,
+                    "serial_id": serial_id if number in SERIAL_PROCESSES else None,
+                    "data_level": "SERIAL" if number in SERIAL_PROCESSES else "WIP",
+                    "equipment_id": None, "process_session_id": None, **execution,
+                })
+                ids[ProcessData] += 1
+
+        # The LOT row is still buffered, so its totals can be filled in now
+        lot = batches.rows[Lot.__table__][-1]
+        lot.update(actual_quantity=passed + failed, passed_quantity=passed, failed_quantity=failed)
+        if remaining <= 0:
+            lot.update(status="IN_PROGRESS")
+        batches.flush()
+
+    batches.flush(force=True)
+    _sync_sequences(db)
+    return batches.counts
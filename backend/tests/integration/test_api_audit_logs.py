@@ -1,11 +1,17 @@
 """Integration tests for Audit Logs API endpoints.
 
-Tests audit log retrieval, filtering, and pagination
+Tests audit log retrieval, filtering, pagination and field change search
 for /api/v1/audit-logs/* endpoints.
 """
 
+from datetime import datetime, timedelta
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import AuditLog
 
 
 class TestAuditLogsAPI:
@@ -325,3 +331,101 @@ class TestAuditLogsAPI:
         """Test getting user activity with invalid user ID."""
         response = client.get("/api/v1/audit-logs/user/0")
         assert response.status_code == 422
+
+
+@pytest.fixture
+def lot_updates(db: Session, test_admin_user):
+    """Four UPDATEs of LOT 1 and one of LOT 2, one minute apart."""
+    start = datetime(2025, 11, 20, 8, 0)
+    changes = [
+        (1, {"target_quantity": 100, "status": "CREATED"}, {"target_quantity": 50, "status": "CREATED"}),
+        (1, {"target_quantity": 50, "status": "CREATED"}, {"target_quantity": 50, "status": "IN_PROGRESS"}),
+        (1, {"target_quantity": 50, "status": "IN_PROGRESS"}, {"target_quantity": 80, "status": "IN_PROGRESS"}),
+        (1, {"target_quantity": 80, "closed": False}, {"target_quantity": 80, "closed": True, "notes": None}),
+        (2, {"target_quantity": 100}, {"target_quantity": 50}),
+    ]
+    logs = [
+        AuditLog(
+            user_id=test_admin_user.id, entity_type="lots", entity_id=entity_id, action="UPDATE",
+            old_values=old, new_values=new, created_at=start + timedelta(minutes=n),
+        )
+        for n, (entity_id, old, new) in enumerate(changes)
+    ]
+    db.add_all(logs)
+    db.commit()
+    return logs
+
+
+class TestFieldChangeSearch:
+    """Test GET /audit-logs/changes against get_changed_fields()."""
+
+    def search(self, client: TestClient, headers: dict, **params) -> list:
+        response = client.get("/api/v1/audit-logs/changes", params=params, headers=headers)
+        assert response.status_code == 200, response.text
+        return [log["id"] for log in response.json()]
+
+    def test_matches_get_changed_fields(self, client, auth_headers_admin, lot_updates):
+        for field in ("target_quantity", "status", "closed", "notes"):
+            expected = [log.id for log in reversed(lot_updates) if field in log.get_changed_fields()]
+            assert self.search(client, auth_headers_admin, field=field) == expected, field
+
+    def test_value_filters(self, client, auth_headers_admin, lot_updates):
+        ids = [log.id for log in lot_updates]
+
+        assert self.search(client, auth_headers_admin, field="target_quantity", new_value="50") == [ids[4], ids[0]]
+        assert self.search(
+            client, auth_headers_admin, field="target_quantity", new_value="50", entity_type="lots", entity_id=1,
+        ) == [ids[0]]
+        assert self.search(client, auth_headers_admin, field="target_quantity", old_value="50") == [ids[2]]
+        assert self.search(client, auth_headers_admin, field="status", new_value="IN_PROGRESS") == [ids[1]]
+        assert self.search(client, auth_headers_admin, field="closed", new_value="true") == [ids[3]]
+        assert self.search(client, auth_headers_admin, field="notes", new_value="null") == [ids[3]]
+
+    def test_date_range_and_cursor(self, client, auth_headers_admin, lot_updates):
+        ids = [log.id for log in lot_updates]
+        response = client.get("/api/v1/audit-logs/changes", headers=auth_headers_admin, params={
+            "field": "target_quantity",
+            "start_date": "2025-11-20T08:00:00",
+            "end_date": "2025-11-20T08:03:00",
+            "limit": 1,
+        })
+        assert [log["id"] for log in response.json()] == [ids[2]]
+
+        response = client.get("/api/v1/audit-logs/changes", headers=auth_headers_admin, params={
+            "field": "target_quantity", "limit": 1, "cursor": response.headers["X-Next-Cursor"],
+        })
+        assert [log["id"] for log in response.json()] == [ids[0]]
+
+    def test_invalid_date_range(self, client, auth_headers_admin):
+        response = client.get("/api/v1/audit-logs/changes", headers=auth_headers_admin, params={
+            "field": "status", "start_date": "2025-11-21T00:00:00", "end_date": "2025-11-20T00:00:00",
+        })
+        assert response.status_code == 400
+
+    def test_field_is_required(self, client, auth_headers_admin):
+        response = client.get("/api/v1/audit-logs/changes", headers=auth_headers_admin)
+        assert response.status_code == 422
+
+
+class TestAuditLogIndexes:
+    """Change and entity history searches are answered from their indexes."""
+
+    def plan(self, db: Session, sql: str) -> str:
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in db.execute(text(f"EXPLAIN {sql}")))
+        db.rollback()
+        return plan
+
+    def test_change_search_uses_gin_index(self, db: Session, lot_updates):
+        plan = self.plan(db, (
+            "SELECT id FROM audit_logs WHERE audit_changed_values(old_values, new_values) "
+            "@> '{\"target_quantity\": {\"new\": 50}}'"
+        ))
+        assert "idx_audit_logs_changes" in plan
+
+    def test_entity_history_uses_covering_index(self, db: Session, lot_updates):
+        plan = self.plan(db, (
+            "SELECT action, user_id, created_at FROM audit_logs "
+            "WHERE entity_type = 'lots' AND entity_id = 1 ORDER BY created_at DESC, id DESC"
+        ))
+        assert "idx_audit_logs_entity_history" in plan
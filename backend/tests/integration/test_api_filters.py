@@ -0,0 +1,214 @@
+"""Integration tests for compiled dynamic filters and saved filter caching.
+
+Tests POST /api/v1/search/process-data/filter and
+/api/v1/search/filters/{id}/apply: AND / OR trees, measurement predicates,
+index warnings, keyset pagination, statement reuse and cached saved-filter
+pages invalidated by writes of any API process.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.crud import filters as filters_crud
+from app.models import Lot, LotStatus, ProcessData, ProductModel, ProductionLine
+from app.models.process import Process
+
+API = "/api/v1/search"
+START = datetime(2025, 11, 20, 8, 0)
+
+
+@pytest.fixture
+def filter_data(db: Session, test_operator_user):
+    """Twelve executions over two processes; every fourth fails with a high voltage."""
+    product_model = ProductModel(
+        model_code="PSA", model_name="Filter Model", category="Test", status="ACTIVE", specifications={},
+    )
+    line = ProductionLine(line_code="LINE-A", line_name="Line A")
+    processes = [
+        Process(
+            process_number=number, process_code=f"P{number:02d}",
+            process_name_ko=f"공정 {number}", process_name_en=f"Process {number}",
+            process_type="MANUFACTURING", sort_order=number, quality_criteria={},
+        )
+        for number in (1, 2)
+    ]
+    db.add_all([product_model, line, *processes])
+    db.flush()
+    lot = Lot(
+        lot_number="KR01PSA2511", product_model_id=product_model.id, production_line_id=line.id,
+        production_date=date(2025, 11, 20), target_quantity=100, status=LotStatus.IN_PROGRESS,
+    )
+    db.add(lot)
+    db.flush()
+
+    def execute(n: int) -> None:
+        failed = n % 4 == 0
+        db.add(ProcessData(
+            lot_id=lot.id, process_id=processes[n % 2].id, operator_id=test_operator_user.id,
+            data_level="LOT", result="FAIL" if failed else "PASS",
+            measurements={"voltage": 5.5 if failed else 3.3, "operator_checked": n % 3 == 0},
+            defects=[], started_at=START + timedelta(minutes=n),
+        ))
+
+    for n in range(12):
+        execute(n)
+    db.commit()
+    return {"lot": lot, "processes": processes, "execute": execute}
+
+
+def apply_filter(client, headers, filters, **options) -> dict:
+    response = client.post(f"{API}/process-data/filter", json={"filters": filters, **options}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+class TestDynamicFilters:
+    """Test suite for POST /search/process-data/filter."""
+
+    def test_and_or_tree(self, client, auth_headers_operator, filter_data):
+        process_1 = filter_data["processes"][1].id
+        data = apply_filter(client, auth_headers_operator, [
+            {"field": "lot_id", "operator": "eq", "value": filter_data["lot"].id},
+            {"op": "or", "filters": [
+                {"field": "process_id", "operator": "eq", "value": process_1},
+                {"field": "started_at", "operator": "between",
+                 "value": [START.isoformat(), (START + timedelta(minutes=2)).isoformat()]},
+            ]},
+        ])
+
+        assert data["total"] == 7
+        assert sorted(item["id"] for item in data["items"]) == [item["id"] for item in data["items"]]
+        assert data["warnings"] == []
+
+    def test_measurement_predicates(self, client, auth_headers_operator, filter_data):
+        contains = apply_filter(client, auth_headers_operator, [
+            {"field": "measurements.voltage", "operator": "eq", "value": 5.5},
+            {"field": "measurements.operator_checked", "operator": "exists"},
+        ])
+        ranged = apply_filter(client, auth_headers_operator, [
+            {"field": "measurements.voltage", "operator": "gt", "value": 5},
+        ])
+
+        assert contains["total"] == ranged["total"] == 3
+        assert {item["result"] for item in contains["items"]} == {"FAIL"}
+        assert contains["warnings"] == []
+        assert "'measurements.voltage gt' cannot use an index" in ranged["warnings"]
+
+    def test_full_scan_warning(self, client, auth_headers_operator, filter_data):
+        data = apply_filter(client, auth_headers_operator, [{"field": "result", "operator": "eq", "value": "FAIL"}])
+
+        assert data["total"] == 3
+        assert data["warnings"] == [
+            "'result eq' cannot use an index",
+            "No index-backed predicate: the filter scans the whole process_data table",
+        ]
+
+    def test_keyset_pagination(self, client, auth_headers_operator, filter_data):
+        seen, cursor = [], None
+        while True:
+            data = apply_filter(
+                client, auth_headers_operator, [], sort_by="started_at", sort_order="desc",
+                limit=5, cursor=cursor, include_total=False,
+            )
+            seen.extend(item["started_at"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert len(seen) == 12
+        assert seen == sorted(seen, reverse=True)
+        assert data["total"] is None
+
+    @pytest.mark.parametrize("filters", [
+        [{"field": "notes", "operator": "icontains", "value": "drift"}],
+        [{"field": "password_hash", "operator": "eq", "value": "x"}],
+        [{"field": "lot_id", "operator": "eq", "value": "KR01"}],
+        [{"field": "measurements.voltage", "operator": "in", "value": [1]}],
+    ])
+    def test_invalid_filters(self, client, auth_headers_operator, filters):
+        response = client.post(f"{API}/process-data/filter", json={"filters": filters}, headers=auth_headers_operator)
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "VAL_001"
+
+    def test_same_shape_reuses_compiled_statement(self, client, auth_headers_operator, filter_data):
+        apply_filter(client, auth_headers_operator, [{"field": "process_id", "operator": "in", "value": [1]}])
+        hits = filters_crud._compile.cache_info().hits
+
+        apply_filter(client, auth_headers_operator, [{"field": "process_id", "operator": "in", "value": [2, 3]}])
+
+        assert filters_crud._compile.cache_info().hits == hits + 1
+
+
+class TestSavedFilters:
+    """Test saved filter pages are cached until the next process data write."""
+
+    def test_cached_until_write(self, client, db, auth_headers_operator, filter_data, monkeypatch):
+        response = client.post(f"{API}/filters/save", headers=auth_headers_operator, json={
+            "name": "Failures",
+            "filters": [{"field": "measurements.voltage", "operator": "eq", "value": 5.5}],
+            "sort_by": "started_at",
+            "sort_order": "desc",
+        })
+        assert response.status_code == 200, response.text
+        filter_id = response.json()["id"]
+
+        runs = []
+        run = filters_crud.run
+        monkeypatch.setattr(filters_crud, "run", lambda *args, **kw: runs.append(args) or run(*args, **kw))
+
+        def apply() -> dict:
+            response = client.post(f"{API}/filters/{filter_id}/apply", headers=auth_headers_operator)
+            assert response.status_code == 200, response.text
+            return response.json()
+
+        first, second = apply(), apply()
+        assert first == second
+        assert first["total"] == 3
+        assert len(runs) == 1
+
+        filter_data["execute"](12)
+        db.commit()
+
+        assert apply()["total"] == 4
+        assert len(runs) == 2
+
+    def test_write_by_other_process_is_not_served_from_cache(
+        self, client, db, auth_headers_operator, filter_data, monkeypatch
+    ):
+        response = client.post(f"{API}/filters/save", headers=auth_headers_operator, json={
+            "name": "Voltage", "filters": [{"field": "measurements.voltage", "operator": "eq", "value": 5.5}],
+        })
+        filter_id = response.json()["id"]
+        runs = []
+        run = filters_crud.run
+        monkeypatch.setattr(filters_crud, "run", lambda *args, **kw: runs.append(args) or run(*args, **kw))
+
+        client.post(f"{API}/filters/{filter_id}/apply", headers=auth_headers_operator)
+        # Committed by another API process: only the shared version moves here
+        db.execute(text("UPDATE resource_versions SET version = version + 1 WHERE resource = 'process_data'"))
+        db.commit()
+        client.post(f"{API}/filters/{filter_id}/apply", headers=auth_headers_operator)
+
+        assert len(runs) == 2
+
+    def test_invalid_filter_is_not_saved(self, client, auth_headers_operator):
+        response = client.post(f"{API}/filters/save", headers=auth_headers_operator, json={
+            "name": "Substring", "filters": [{"field": "notes", "operator": "contains", "value": "x"}],
+        })
+        assert response.status_code == 400
+
+
+class TestMeasurementIndex:
+    """Measurement containment is answered from the GIN index."""
+
+    def test_containment_uses_gin_index(self, db: Session, filter_data):
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in db.execute(text(
+            "EXPLAIN SELECT id FROM process_data WHERE measurements @> '{\"voltage\": 5.5}'"
+        )))
+        db.rollback()
+
+        assert "idx_process_data_measurements" in plan
@@ -0,0 +1,152 @@
+"""Integration tests for keyset (cursor) pagination of list endpoints.
+
+Walks /api/v1/lots, /process-data and /alerts page by page through the
+X-Next-Cursor response header, and checks invalid cursors and planner
+estimated totals.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Alert, Lot, LotStatus, ProcessData, ProductModel, ProductionLine
+from app.models.alert import AlertSeverity, AlertType
+from app.models.process import Process
+
+API = "/api/v1"
+START = datetime(2025, 11, 20, 8, 0)
+
+
+@pytest.fixture
+def paged_data(db: Session, test_operator_user):
+    """Seven LOTs over three production dates, nine executions and five alerts."""
+    product_model = ProductModel(
+        model_code="PSA", model_name="Paging Model", category="Test", status="ACTIVE", specifications={},
+    )
+    line = ProductionLine(line_code="LINE-A", line_name="Line A")
+    process = Process(
+        process_number=1, process_code="P01", process_name_ko="공정 1", process_name_en="Process 1",
+        process_type="MANUFACTURING", sort_order=1, quality_criteria={},
+    )
+    db.add_all([product_model, line, process])
+    db.flush()
+
+    lots = [
+        Lot(
+            lot_number=f"KR01PSA25{n:02d}", product_model_id=product_model.id, production_line_id=line.id,
+            production_date=date(2025, 11, 20) + timedelta(days=n % 3), target_quantity=100,
+            status=LotStatus.IN_PROGRESS if n % 2 else LotStatus.CREATED,
+        )
+        for n in range(7)
+    ]
+    db.add_all(lots)
+    db.flush()
+
+    db.add_all([
+        ProcessData(
+            lot_id=lots[0].id, process_id=process.id, operator_id=test_operator_user.id,
+            data_level="LOT", result="PASS", measurements={}, defects=[],
+            started_at=START + timedelta(minutes=n),
+        )
+        for n in range(9)
+    ])
+    db.add_all([
+        Alert(
+            alert_type=AlertType.MANUAL, severity=AlertSeverity.MEDIUM,
+            title=f"Alert {n}", message="Paging test",
+        )
+        for n in range(5)
+    ])
+    db.commit()
+    return {"lots": lots}
+
+
+def walk(client, headers, url: str, limit: int, items=lambda data: data, **params) -> list:
+    """Follow X-Next-Cursor until the last page; return every item in order."""
+    seen, cursor, pages = [], None, 0
+    while True:
+        query = {"limit": limit, **params}
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get(url, params=query, headers=headers)
+        assert response.status_code == 200, response.text
+        page = items(response.json())
+        assert len(page) <= limit
+        seen.extend(page)
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return seen
+        assert pages < 50, "cursor did not advance"
+
+
+class TestKeysetPagination:
+    """Test suite for cursor pagination through X-Next-Cursor."""
+
+    def test_lots_newest_first(self, client, auth_headers_operator, paged_data):
+        lots = walk(client, auth_headers_operator, f"{API}/lots/", limit=3)
+
+        ids = [lot["id"] for lot in lots]
+        assert sorted(ids, reverse=True) == ids
+        assert set(ids) == {lot.id for lot in paged_data["lots"]}
+
+    def test_lots_by_status_with_date_ties(self, client, auth_headers_operator, paged_data):
+        lots = walk(client, auth_headers_operator, f"{API}/lots/", limit=2, status="CREATED")
+
+        keys = [(lot["production_date"], lot["lot_number"]) for lot in lots]
+        assert keys == sorted(keys, reverse=True)
+        assert len(keys) == len(set(keys)) == 4
+
+    def test_process_data(self, client, auth_headers_operator, paged_data):
+        records = walk(client, auth_headers_operator, f"{API}/process-data/", limit=4)
+
+        ids = [record["id"] for record in records]
+        assert len(ids) == len(set(ids)) == 9
+        assert sorted(ids, reverse=True) == ids
+
+    def test_alerts(self, client, auth_headers_admin, paged_data):
+        alerts = walk(
+            client, auth_headers_admin, f"{API}/alerts/", limit=2, items=lambda data: data["alerts"],
+        )
+
+        assert len({alert["id"] for alert in alerts}) == 5
+
+    def test_full_last_page_has_no_cursor_after_it(self, client, auth_headers_operator, paged_data):
+        response = client.get(f"{API}/lots/", params={"limit": 7}, headers=auth_headers_operator)
+        cursor = response.headers["X-Next-Cursor"]
+
+        response = client.get(f"{API}/lots/", params={"limit": 7, "cursor": cursor}, headers=auth_headers_operator)
+
+        assert response.status_code == 200
+        assert response.json() == []
+        assert "X-Next-Cursor" not in response.headers
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", "WzEsMiwzXQ"])
+    def test_invalid_cursor(self, client, auth_headers_operator, cursor):
+        response = client.get(f"{API}/lots/", params={"cursor": cursor}, headers=auth_headers_operator)
+
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "VAL_001"
+
+
+class TestApproximateTotal:
+    """Test planner-estimated totals on list endpoints with counts."""
+
+    def test_alerts(self, client, auth_headers_admin, paged_data):
+        exact = client.get(f"{API}/alerts/", headers=auth_headers_admin).json()
+        estimated = client.get(
+            f"{API}/alerts/", params={"approximate_total": True}, headers=auth_headers_admin,
+        ).json()
+
+        assert exact["total"] == 5
+        assert isinstance(estimated["total"], int)
+        assert estimated["alerts"] == exact["alerts"]
+
+    def test_error_logs(self, client, auth_headers_admin):
+        response = client.get(
+            f"{API}/error-logs/", params={"approximate_total": True}, headers=auth_headers_admin,
+        )
+
+        assert response.status_code == 200, response.text
+        assert isinstance(response.json()["total"], int)
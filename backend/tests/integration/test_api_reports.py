@@ -0,0 +1,244 @@
+"""Integration tests for Reports API endpoints.
+
+Tests /api/v1/reports/* against live aggregation and daily snapshots:
+closed days read from snapshots must match live aggregation, recently
+closed days are refreshed while older snapshots are kept, days follow the
+report time zone, and today stays live.
+"""
+
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models import (
+    DailyReportSnapshot, Lot, LotStatus, ProcessData, ProductModel, ProductionLine, WIPItem, WIPStatus,
+)
+from app.config import settings
+from app.models.process import Process
+from app.services.report_service import report_service
+
+API = "/api/v1/reports"
+ZONE = ZoneInfo(settings.REPORT_TIMEZONE)
+TODAY = report_service.today()
+TWO_DAYS_AGO = TODAY - timedelta(days=2)
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+@pytest.fixture
+def report_data(db: Session, test_operator_user):
+    """Two processes on one line with executions on two closed days and today."""
+    product_model = ProductModel(
+        model_code="PSA", model_name="Report Model", category="Test", status="ACTIVE", specifications={},
+    )
+    line = ProductionLine(line_code="LINE-A", line_name="Line A")
+    processes = [
+        Process(
+            process_number=number, process_code=f"P{number:02d}",
+            process_name_ko=f"공정 {number}", process_name_en=f"Process {number}",
+            process_type="MANUFACTURING", sort_order=number, quality_criteria={},
+        )
+        for number in (1, 2)
+    ]
+    db.add_all([product_model, line, *processes])
+    db.flush()
+    lot = Lot(
+        lot_number="KR01PSA2511", product_model_id=product_model.id, production_line_id=line.id,
+        production_date=TWO_DAYS_AGO, target_quantity=100, actual_quantity=40,
+        passed_quantity=30, failed_quantity=10, status=LotStatus.IN_PROGRESS,
+    )
+    db.add(lot)
+    db.flush()
+    db.add_all([
+        WIPItem(wip_id="WIP-KR01PSA2511-001", lot_id=lot.id, sequence_in_lot=1,
+                status=WIPStatus.IN_PROGRESS.value, current_process_id=processes[0].id),
+        WIPItem(wip_id="WIP-KR01PSA2511-002", lot_id=lot.id, sequence_in_lot=2,
+                status=WIPStatus.CONVERTED.value, current_process_id=processes[1].id),
+    ])
+
+    def execute(day: date, process: Process, result: str, defects=None, duration: int = 30, at: time = time(12, 0)):
+        started = datetime.combine(day, at, tzinfo=ZONE)
+        db.add(ProcessData(
+            lot_id=lot.id, process_id=process.id, operator_id=test_operator_user.id,
+            data_level="LOT", result=result, measurements={}, defects=defects or [],
+            started_at=started, completed_at=started + timedelta(seconds=duration),
+            duration_seconds=duration,
+        ))
+
+    p01, p02 = processes
+    for _ in range(3):
+        execute(TWO_DAYS_AGO, p01, "PASS")
+    execute(TWO_DAYS_AGO, p01, "FAIL", [{"defect_code": "SCRATCH"}], duration=90)
+    execute(TWO_DAYS_AGO, p02, "FAIL", ["CRACK", "SCRATCH"])
+    execute(YESTERDAY, p01, "PASS")
+    execute(YESTERDAY, p02, "FAIL")
+    execute(TODAY, p01, "PASS")
+    db.commit()
+    return {"lot": lot, "line": line, "processes": processes, "execute": execute}
+
+
+def get(client: TestClient, headers: dict, report: str, **params) -> dict:
+    response = client.get(f"{API}/{report}", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+class TestDailyReportSnapshots:
+    """Test materialization of closed days."""
+
+    def test_snapshots_match_live_aggregation(self, db: Session, report_data):
+        live = report_service.aggregate_days(db, TWO_DAYS_AGO, YESTERDAY)
+
+        assert report_service.materialize(db, TWO_DAYS_AGO, TODAY) == 2
+        snapshots = {s.report_date: s for s in db.query(DailyReportSnapshot).all()}
+
+        assert set(snapshots) == {TWO_DAYS_AGO, YESTERDAY}
+        for day, snapshot in snapshots.items():
+            assert snapshot.production == live[day]["production"]
+            assert snapshot.defects == live[day]["defects"]
+
+    def test_recent_days_are_refreshed(self, db: Session, report_data):
+        report_service.materialize(db, TWO_DAYS_AGO, YESTERDAY)
+        report_data["execute"](YESTERDAY, report_data["processes"][0], "PASS")  # Uploaded late
+        db.commit()
+
+        assert report_service.materialize(db, TWO_DAYS_AGO, YESTERDAY) == 2
+        started = sum(row["started"] for row in report_service.load_days(db, YESTERDAY, YESTERDAY)[0]["production"])
+        assert started == 3
+
+    def test_older_snapshots_are_kept(self, db: Session, report_data, monkeypatch):
+        monkeypatch.setattr(settings, "REPORT_SNAPSHOT_GRACE_DAYS", 1)
+        report_service.materialize(db, TWO_DAYS_AGO, YESTERDAY)
+        report_data["execute"](TWO_DAYS_AGO, report_data["processes"][0], "PASS")
+        db.commit()
+
+        assert report_service.materialize(db, TWO_DAYS_AGO, YESTERDAY) == 1
+        started = sum(row["started"] for row in report_service.load_days(db, TWO_DAYS_AGO, TWO_DAYS_AGO)[0]["production"])
+        assert started == 5
+
+    def test_days_follow_the_report_time_zone(self, db: Session, report_data):
+        p01 = report_data["processes"][0]
+        report_data["execute"](YESTERDAY, p01, "PASS", at=time(0, 30))
+        report_data["execute"](YESTERDAY, p01, "PASS", at=time(23, 30))
+        db.commit()
+
+        aggregates = report_service.aggregate_days(db, TWO_DAYS_AGO, YESTERDAY)
+
+        started = {day: sum(row["started"] for row in days["production"]) for day, days in aggregates.items()}
+        assert started == {TWO_DAYS_AGO: 5, YESTERDAY: 4}
+
+    def test_days_without_data_get_an_empty_snapshot(self, db: Session, report_data):
+        report_service.materialize(db, TWO_DAYS_AGO - timedelta(days=5), TWO_DAYS_AGO - timedelta(days=1))
+
+        assert db.query(DailyReportSnapshot).count() == 5
+        assert all(s.production == [] and s.defects == [] for s in db.query(DailyReportSnapshot))
+
+
+class TestReportsAPI:
+    """Test suite for Reports API endpoints."""
+
+    @pytest.mark.parametrize("materialized", [False, True])
+    def test_daily_production(self, client, db, auth_headers_admin, report_data, materialized):
+        if materialized:
+            report_service.materialize(db, TWO_DAYS_AGO, YESTERDAY)
+
+        data = get(client, auth_headers_admin, "daily-production", date=TWO_DAYS_AGO.isoformat())
+
+        assert data["total"] == 2
+        p01 = data["items"][0]
+        assert p01["process_code"] == "P01" and p01["line_code"] == "LINE-A"
+        assert (p01["started"], p01["pass_count"], p01["fail_count"]) == (4, 3, 1)
+        assert p01["avg_cycle_time"] == 45.0
+        assert data["summary"] == {
+            "total_started": 5, "total_completed": 5, "total_pass": 3, "total_fail": 2,
+            "pass_rate": 60.0, "avg_cycle_time": 42.0,
+        }
+
+    def test_daily_production_today_is_live(self, client, db, auth_headers_admin, report_data):
+        report_service.materialize(db, TWO_DAYS_AGO, TODAY)
+        report_data["execute"](TODAY, report_data["processes"][1], "PASS")
+        db.commit()
+
+        data = get(client, auth_headers_admin, "daily-production", date=TODAY.isoformat())
+
+        assert data["summary"]["total_started"] == 2
+        assert db.query(DailyReportSnapshot).filter_by(report_date=TODAY).count() == 0
+
+    def test_process_performance(self, client, db, auth_headers_admin, report_data):
+        report_service.materialize(db, TWO_DAYS_AGO, YESTERDAY)
+
+        data = get(client, auth_headers_admin, "process-performance",
+                   start_date=TWO_DAYS_AGO.isoformat(), end_date=TODAY.isoformat())
+
+        by_code = {item["process_code"]: item for item in data["items"]}
+        assert by_code["P01"]["total_count"] == 6
+        assert by_code["P01"]["yield_rate"] == pytest.approx(83.33)
+        assert by_code["P02"]["yield_rate"] == 0.0
+        assert data["summary"]["total_processed"] == 8
+        assert data["summary"]["top_performers"][0]["process"] == "Process 1"
+
+    def test_defect_analysis(self, client, db, auth_headers_admin, report_data):
+        report_service.materialize(db, TWO_DAYS_AGO, YESTERDAY)
+
+        data = get(client, auth_headers_admin, "defect-analysis",
+                   start_date=TWO_DAYS_AGO.isoformat(), end_date=TODAY.isoformat())
+
+        assert data["summary"]["by_type"] == {"SCRATCH": 2, "CRACK": 1, "UNSPECIFIED": 1}
+        assert data["summary"]["total_defects"] == 4
+        assert data["summary"]["top_defects"][0] == {"type": "SCRATCH", "count": 2}
+        p02 = [item for item in data["items"] if item["process_code"] == "P02"]
+        assert {item["total_count"] for item in p02} == {2}
+
+    def test_process_filter_and_pagination(self, client, auth_headers_admin, report_data):
+        process_id = report_data["processes"][1].id
+
+        first = get(client, auth_headers_admin, "defect-analysis", start_date=TWO_DAYS_AGO.isoformat(),
+                    end_date=TODAY.isoformat(), process_id=process_id, limit=2)
+        second = get(client, auth_headers_admin, "defect-analysis", start_date=TWO_DAYS_AGO.isoformat(),
+                     end_date=TODAY.isoformat(), process_id=process_id, skip=2, limit=2)
+
+        assert first["total"] == second["total"] == 3
+        assert len(first["items"]) == 2 and len(second["items"]) == 1
+        assert first["summary"] == second["summary"]
+
+    def test_lot_progress(self, client, auth_headers_admin, report_data):
+        data = get(client, auth_headers_admin, "lot-progress",
+                   start_date=TWO_DAYS_AGO.isoformat(), end_date=TODAY.isoformat())
+
+        assert data["total"] == 1
+        assert data["items"][0]["progress"] == 40.0
+        assert data["items"][0]["yield_rate"] == 75.0
+        assert data["summary"]["in_progress_lots"] == 1
+
+    def test_wip_status(self, client, auth_headers_admin, report_data):
+        data = get(client, auth_headers_admin, "wip-status")
+
+        assert data["total"] == 1
+        assert data["items"][0]["wip_id"] == "WIP-KR01PSA2511-001"
+        assert data["summary"] == {
+            "total_wip": 1, "by_status": {"IN_PROGRESS": 1}, "by_process": {"Process 1": 1},
+        }
+
+    def test_invalid_date_range(self, client, auth_headers_admin):
+        response = client.get(
+            f"{API}/process-performance",
+            params={"start_date": TODAY.isoformat(), "end_date": YESTERDAY.isoformat()},
+            headers=auth_headers_admin,
+        )
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "VAL_001"
+
+    def test_materialize_requires_manager(self, client, db, auth_headers_operator, auth_headers_manager, report_data):
+        params = {"start_date": TWO_DAYS_AGO.isoformat()}
+
+        assert client.post(f"{API}/snapshots", params=params, headers=auth_headers_operator).status_code == 403
+        response = client.post(f"{API}/snapshots", params=params, headers=auth_headers_manager)
+
+        assert response.status_code == 200
+        assert response.json()["written"] == 2
+
+    def test_requires_authentication(self, client):
+        response = client.get(f"{API}/wip-status")
+        assert response.status_code == 401
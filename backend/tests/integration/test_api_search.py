@@ -0,0 +1,149 @@
+"""Integration tests for the unified Search API.
+
+Tests /api/v1/search: notes full-text search through the stored notes_tsv
+column, identifier substring search through the trigram indexes, ranking and
+keyset pagination across entity types.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import Lot, LotStatus, ProcessData, ProductModel, ProductionLine, Serial, SerialStatus, WIPItem, WIPStatus
+from app.models.process import Process
+
+API = "/api/v1/search"
+
+
+@pytest.fixture
+def search_data(db: Session, test_operator_user):
+    """One LOT with three WIP items, two serials and notes on four executions."""
+    product_model = ProductModel(
+        model_code="PSA", model_name="Search Model", category="Test", status="ACTIVE", specifications={},
+    )
+    line = ProductionLine(line_code="LINE-A", line_name="Line A")
+    process = Process(
+        process_number=1, process_code="P01", process_name_ko="공정 1", process_name_en="Process 1",
+        process_type="MANUFACTURING", sort_order=1, quality_criteria={},
+    )
+    db.add_all([product_model, line, process])
+    db.flush()
+    lot = Lot(
+        lot_number="KR01PSA2511", product_model_id=product_model.id, production_line_id=line.id,
+        production_date=date.today(), target_quantity=100, status=LotStatus.IN_PROGRESS,
+    )
+    db.add(lot)
+    db.flush()
+    db.add_all([
+        WIPItem(wip_id=f"WIP-KR01PSA2511-{n:03d}", lot_id=lot.id, sequence_in_lot=n,
+                status=WIPStatus.IN_PROGRESS.value)
+        for n in (1, 2, 3)
+    ])
+    db.add_all([
+        Serial(serial_number=f"KR01PSA2511{n:03d}", lot_id=lot.id, sequence_in_lot=n, status=SerialStatus.CREATED)
+        for n in (1, 2)
+    ])
+    started = datetime.now() - timedelta(hours=1)
+    for notes in (
+        "Voltage drift on channel 2, voltage recalibrated",
+        "Voltage drift observed",
+        "Label misprint",
+        None,
+    ):
+        db.add(ProcessData(
+            lot_id=lot.id, process_id=process.id, operator_id=test_operator_user.id, data_level="LOT",
+            result="PASS", measurements={}, defects=[], notes=notes, started_at=started,
+        ))
+    db.commit()
+    return lot
+
+
+def search(client, headers, **params) -> dict:
+    response = client.get(API, params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+class TestSearchAPI:
+    """Test suite for GET /api/v1/search."""
+
+    def test_notes_are_ranked(self, client, auth_headers_operator, search_data):
+        data = search(client, auth_headers_operator, q="voltage drifting", types="process_data")
+
+        labels = [item["label"] for item in data["items"]]
+        assert labels == ["Voltage drift on channel 2, voltage recalibrated", "Voltage drift observed"]
+        assert data["items"][0]["rank"] > data["items"][1]["rank"]
+        assert data["next_cursor"] is None
+
+    def test_identifier_substring(self, client, auth_headers_operator, search_data):
+        data = search(client, auth_headers_operator, q="PSA2511-00", types=["wip"])
+        assert sorted(item["label"] for item in data["items"]) == [
+            "WIP-KR01PSA2511-001", "WIP-KR01PSA2511-002", "WIP-KR01PSA2511-003",
+        ]
+
+        data = search(client, auth_headers_operator, q="psa2511")
+        assert {item["type"] for item in data["items"]} == {"lot", "serial", "wip"}
+        assert data["items"][0] == {
+            "type": "lot", "id": search_data.id, "label": "KR01PSA2511", "rank": data["items"][0]["rank"],
+        }
+
+    def test_like_wildcards_are_literal(self, client, auth_headers_operator, search_data):
+        assert search(client, auth_headers_operator, q="PSA%11", types="lot")["items"] == []
+
+    def test_keyset_pagination_visits_every_hit_once(self, client, auth_headers_operator, search_data):
+        everything = search(client, auth_headers_operator, q="PSA2511", limit=100)["items"]
+        pages, cursor = [], None
+        while True:
+            params = {"q": "PSA2511", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            data = search(client, auth_headers_operator, **params)
+            pages.extend(data["items"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert len(everything) == 6
+        assert [(item["type"], item["id"]) for item in pages] == [(item["type"], item["id"]) for item in everything]
+
+    @pytest.mark.parametrize("params", [{"types": "equipment"}, {"cursor": "not-a-cursor"}])
+    def test_invalid_parameters(self, client, auth_headers_operator, params):
+        response = client.get(API, params={"q": "PSA", **params}, headers=auth_headers_operator)
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "VAL_001"
+
+    def test_process_data_search_pages_by_header(self, client, auth_headers_operator, search_data):
+        first = client.get(f"{API}/process-data", params={"q": "voltage", "limit": 1}, headers=auth_headers_operator)
+        second = client.get(
+            f"{API}/process-data",
+            params={"q": "voltage", "limit": 1, "cursor": first.headers["X-Next-Cursor"]},
+            headers=auth_headers_operator,
+        )
+
+        assert first.status_code == second.status_code == 200
+        assert [row["notes"] for row in first.json() + second.json()] == [
+            "Voltage drift on channel 2, voltage recalibrated", "Voltage drift observed",
+        ]
+        assert "X-Next-Cursor" not in second.headers
+
+    def test_requires_authentication(self, client):
+        assert client.get(API, params={"q": "PSA"}).status_code == 401
+
+
+class TestSearchIndexes:
+    """The search predicates are answered from the GIN indexes."""
+
+    @pytest.mark.parametrize("query, index", [
+        ("SELECT id FROM process_data WHERE notes_tsv @@ plainto_tsquery('english', 'voltage')",
+         "idx_process_data_notes_tsv"),
+        ("SELECT id FROM wip_items WHERE wip_id ILIKE '%PSA2511-00%'", "idx_wip_items_wip_id_trgm"),
+        ("SELECT id FROM serials WHERE serial_number ILIKE '%2511001%'", "idx_serials_serial_number_trgm"),
+    ])
+    def test_index_is_used(self, db: Session, search_data, query, index):
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in db.execute(text(f"EXPLAIN {query}")))
+        db.rollback()
+
+        assert index in plan
@@ -8,8 +8,8 @@ client = TestClient(app)
 
 @pytest.fixture
 def mock_celery():
-    with patch("app.api.v1.async_operations.complete_process_batch") as mock_batch, \
-         patch("app.api.v1.async_operations.export_process_data") as mock_export:
+    with patch("app.tasks.process_tasks.complete_process_batch") as mock_batch, \
+         patch("app.tasks.process_tasks.export_process_data") as mock_export:
         
         # Setup mock return values for .delay()
         mock_task = MagicMock()
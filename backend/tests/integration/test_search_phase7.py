@@ -30,7 +30,7 @@ def test_dynamic_filter(db, normal_user_token_headers):
         headers=normal_user_token_headers
     )
     assert response.status_code == 200
-    assert isinstance(response.json(), list)
+    assert isinstance(response.json()["items"], list)
 
 def test_saved_filters(db, normal_user_token_headers):
     # 1. Save a filter
@@ -68,4 +68,4 @@ def test_saved_filters(db, normal_user_token_headers):
         headers=normal_user_token_headers
     )
     assert response.status_code == 200
-    assert isinstance(response.json(), list)
+    assert isinstance(response.json()["items"], list)
@@ -0,0 +1,164 @@
+"""
+Workload engine routing.
+
+Runs against two database instances: the test database as primary and a
+"replica" (TEST_REPLICA_DATABASE_URL, default a second database on the
+same server, created if missing). Tests:
+    - Operations / analytics / jobs pools and their statement timeouts
+    - Analytics reads from the replica, falling back to the primary when
+      it lags or is unreachable
+    - Per-pool checkout metrics, including pool timeouts
+    - Analytics endpoints use the analytics pool
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+
+from app import database
+from app.config import settings
+from app.database import ANALYTICS, JOBS, OPERATIONS, AnalyticsSessionLocal, JobsSessionLocal, SessionLocal
+from tests.conftest import TEST_DATABASE_URL
+
+REPLICA_DATABASE_URL = os.environ.get(
+    "TEST_REPLICA_DATABASE_URL",
+    make_url(TEST_DATABASE_URL).set(database="f2x_neurohub_mes_replica").render_as_string(hide_password=False),
+)
+
+
+@pytest.fixture(scope="module")
+def replica_url() -> str:
+    """URL of the replica database, creating the database if needed."""
+    url = make_url(REPLICA_DATABASE_URL)
+    admin = create_engine(url.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    try:
+        with admin.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": url.database}
+            ).scalar()
+            if not exists:
+                conn.execute(text(f'CREATE DATABASE "{url.database}"'))
+    except OperationalError as e:
+        pytest.skip(f"Replica database unavailable: {e}")
+    finally:
+        admin.dispose()
+    return REPLICA_DATABASE_URL
+
+
+@pytest.fixture
+def workloads(monkeypatch):
+    """Fresh analytics/jobs engines and replica state, disposed afterwards."""
+    engines = {}
+    monkeypatch.setattr(database, "_workload_engines", engines)
+    monkeypatch.setattr(database, "_replica_state", {})
+    monkeypatch.setattr(settings, "DB_ANALYTICS_URL", None)
+    monkeypatch.setattr(settings, "DB_REPLICA_CHECK_INTERVAL", 0)
+    yield
+    for engine in engines.values():
+        engine.dispose()
+
+
+@pytest.fixture
+def with_replica(workloads, replica_url, monkeypatch):
+    monkeypatch.setattr(settings, "DB_ANALYTICS_URL", replica_url)
+
+
+def current_database(session_factory) -> str:
+    with session_factory() as session:
+        return session.execute(text("SELECT current_database()")).scalar()
+
+
+def statement_timeout(session_factory) -> str:
+    with session_factory() as session:
+        return session.execute(text("SHOW statement_timeout")).scalar()
+
+
+class TestWorkloadPools:
+    """Test each workload gets its own pool and limits."""
+
+    def test_separate_pools(self, workloads):
+        engines = {workload: database.get_workload_engine(workload) for workload in (OPERATIONS, ANALYTICS, JOBS)}
+
+        assert len({id(engine.pool) for engine in engines.values()}) == 3
+        assert engines[OPERATIONS] is database.get_engine()
+        assert engines[ANALYTICS].pool.size() == settings.DB_ANALYTICS_POOL_SIZE
+        assert engines[JOBS].pool.size() == settings.DB_JOBS_POOL_SIZE
+        with pytest.raises(ValueError):
+            database.get_workload_engine("reports")
+
+    def test_statement_timeouts(self, workloads, monkeypatch):
+        monkeypatch.setattr(settings, "DB_ANALYTICS_STATEMENT_TIMEOUT_MS", 120_000)
+
+        assert statement_timeout(SessionLocal) == f"{settings.DB_OPS_STATEMENT_TIMEOUT_MS // 1000}s"
+        assert statement_timeout(AnalyticsSessionLocal) == "2min"
+        assert statement_timeout(JobsSessionLocal) == "0"
+
+    def test_pool_metrics(self, workloads, monkeypatch):
+        monkeypatch.setattr(settings, "DB_JOBS_POOL_SIZE", 1)
+        monkeypatch.setattr(settings, "DB_JOBS_MAX_OVERFLOW", 0)
+        monkeypatch.setattr(settings, "DB_POOL_TIMEOUT", 1)
+        engine = database.get_workload_engine(JOBS)
+
+        with engine.connect() as held:
+            held.execute(text("SELECT 1"))
+            jobs = database.pool_metrics()["pools"][JOBS]
+            assert jobs["checked_out"] == 1
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        jobs = database.pool_metrics()["pools"][JOBS]
+        assert jobs["checked_out"] == 0
+        assert jobs["checkouts"] == 2
+        assert jobs["timeouts"] == 1
+        assert jobs["wait_ms_max"] >= 1000
+
+    def test_analytics_endpoints_use_analytics_pool(self, client, workloads, auth_headers_admin):
+        response = client.get("/api/v1/analytics/realtime-status", headers=auth_headers_admin)
+        assert response.status_code == 200
+
+        pools = client.get("/health/detailed").json()["checks"]["database"]["pools"]["pools"]
+        assert pools[ANALYTICS]["checkouts"] >= 1
+        assert JOBS not in pools
+
+
+class TestReplicaRouting:
+    """Test analytics reads go to the replica only while it is usable."""
+
+    def test_analytics_reads_from_replica(self, with_replica, replica_url):
+        replica, primary = make_url(replica_url).database, make_url(TEST_DATABASE_URL).database
+
+        assert current_database(AnalyticsSessionLocal) == replica
+        assert current_database(SessionLocal) == primary
+        assert current_database(JobsSessionLocal) == primary
+        assert database.pool_metrics()["replica"] == {"healthy": True, "lag_seconds": 0.0, "error": None}
+
+    def test_lagging_replica_falls_back_to_primary(self, with_replica, replica_url, monkeypatch):
+        replica, primary = make_url(replica_url).database, make_url(TEST_DATABASE_URL).database
+        lag = {"seconds": settings.DB_ANALYTICS_MAX_REPLICA_LAG + 90}
+        monkeypatch.setattr(database, "_replica_lag", lambda conn: lag["seconds"])
+
+        assert current_database(AnalyticsSessionLocal) == primary
+        assert database.pool_metrics()["replica"]["healthy"] is False
+
+        lag["seconds"] = 1.0  # Caught up again
+        assert current_database(AnalyticsSessionLocal) == replica
+
+    def test_unreachable_replica_falls_back_to_primary(self, workloads, monkeypatch):
+        url = make_url(TEST_DATABASE_URL).set(port=1).render_as_string(hide_password=False)
+        monkeypatch.setattr(settings, "DB_ANALYTICS_URL", url)
+
+        assert current_database(AnalyticsSessionLocal) == make_url(TEST_DATABASE_URL).database
+        replica = database.pool_metrics()["replica"]
+        assert replica["healthy"] is False
+        assert replica["error"]
+
+    def test_replica_check_is_cached(self, with_replica, monkeypatch):
+        monkeypatch.setattr(settings, "DB_REPLICA_CHECK_INTERVAL", 60)
+        checks = []
+        monkeypatch.setattr(database, "_replica_lag", lambda conn: checks.append(1) or 0.0)
+
+        for _ in range(3):
+            current_database(AnalyticsSessionLocal)
+        assert len(checks) == 1
@@ -0,0 +1,249 @@
+"""
+Sync vs async shop-floor hot path.
+
+Drives scan -> start -> complete (WIP routes) followed by start -> complete
+(process operation routes) from many stations at once, against an app
+serving the hot path routes either from their sync endpoints (Starlette
+threadpool, sync engine) or their async variants (async engine), and
+compares latency percentiles and throughput.
+
+Both variants run the same business rules, so the parity tests check that
+their results and errors are identical; the load test prints the
+comparison and fails if the async path drops requests.
+
+Override the station count with HOT_PATH_STATIONS.
+"""
+
+import asyncio
+import os
+import time
+from datetime import date
+from typing import Dict, List
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.api.v1 import process_operations, wip_items
+from app.config import settings
+from app.core import deps
+from app.database import dispose_engines
+from app.main import app as main_app
+from app.models import Lot, LotStatus, ProcessData, ProductModel, WIPItem, WIPProcessHistory, WIPStatus
+from app.models.process import Process
+
+STATIONS = int(os.environ.get("HOT_PATH_STATIONS", "200"))
+
+API = settings.API_V1_PREFIX
+
+# (path, sync endpoint, async variant)
+HOT_PATHS = [
+    (f"{API}/wip-items/{{wip_id}}/scan", wip_items.scan_wip_barcode, wip_items.scan_wip_barcode_async),
+    (f"{API}/wip-items/{{wip_id}}/start-process", wip_items.start_wip_process, wip_items.start_wip_process_async),
+    (f"{API}/wip-items/{{wip_id}}/complete-process", wip_items.complete_wip_process, wip_items.complete_wip_process_async),
+    (f"{API}/process-operations/start", process_operations.start_process, process_operations.start_process_async),
+    (f"{API}/process-operations/complete", process_operations.complete_process, process_operations.complete_process_async),
+]
+
+
+def hot_path_app(use_async: bool) -> FastAPI:
+    """App serving only the hot path routes, configured as in app.main."""
+    routes = {route.path: route for route in main_app.routes if hasattr(route, "response_model")}
+    app = FastAPI(exception_handlers=dict(main_app.exception_handlers))
+    for path, sync_endpoint, async_endpoint in HOT_PATHS:
+        route = routes[path]
+        app.add_api_route(
+            path,
+            async_endpoint if use_async else sync_endpoint,
+            methods=list(route.methods),
+            response_model=route.response_model,
+            status_code=route.status_code,
+        )
+    return app
+
+
+@pytest.fixture
+def shop_floor(db: Session, test_operator_user, operator_token) -> Dict:
+    """Two manufacturing processes and one WIP item per station."""
+    product_model = ProductModel(
+        model_code="PSA", model_name="Floor Model", category="Test",
+        status="ACTIVE", specifications={},
+    )
+    # WIP routes take the process primary key and only accept 1-6
+    processes = [
+        Process(
+            id=number, process_number=number, process_code=f"P{number:02d}",
+            process_name_ko=f"공정 {number}", process_name_en=f"Process {number}",
+            process_type="MANUFACTURING", sort_order=number, quality_criteria={},
+        )
+        for number in (1, 2)
+    ]
+    db.add_all([product_model, *processes])
+    db.flush()
+
+    wips = []
+    for lot_index in range((STATIONS + 99) // 100):
+        lot = Lot(
+            lot_number=f"KR01PSA2511{lot_index + 1:02d}", product_model_id=product_model.id,
+            production_date=date(2025, 11, 1), target_quantity=100,
+            status=LotStatus.IN_PROGRESS,
+        )
+        db.add(lot)
+        db.flush()
+        for sequence in range(1, min(100, STATIONS - lot_index * 100) + 1):
+            wip = WIPItem(
+                wip_id=f"WIP-{lot.lot_number}-{sequence:03d}", lot_id=lot.id,
+                sequence_in_lot=sequence, status=WIPStatus.CREATED.value,
+            )
+            db.add(wip)
+            wips.append(wip)
+    db.commit()
+
+    yield {
+        "wips": [(wip.id, wip.wip_id) for wip in wips],
+        "operator": test_operator_user,
+        "headers": {"Authorization": f"Bearer {operator_token}"},
+    }
+
+    asyncio.run(dispose_engines())
+
+
+def reset_floor(db: Session) -> None:
+    db.execute(ProcessData.__table__.delete())
+    db.execute(WIPProcessHistory.__table__.delete())
+    db.execute(update(WIPItem).values(
+        status=WIPStatus.CREATED.value, current_process_id=None, completed_at=None,
+    ))
+    db.commit()
+
+
+async def station(client: httpx.AsyncClient, floor: Dict, wip: tuple, samples: List[tuple]) -> None:
+    """One station's scan -> start -> complete cycle over both processes."""
+    wip_pk, wip_id = wip
+    operator = floor["operator"]
+    steps = [
+        (f"{API}/wip-items/{wip_id}/scan", {"params": {"process_id": 1}}, 200),
+        (f"{API}/wip-items/{wip_pk}/start-process",
+         {"json": {"process_id": 1, "operator_id": operator.id}}, 200),
+        (f"{API}/wip-items/{wip_pk}/complete-process",
+         {"params": {"process_id": 1, "operator_id": operator.id},
+          "json": {"result": "PASS", "measurements": {"voltage": 3.3}}}, 200),
+        (f"{API}/process-operations/start",
+         {"json": {"wip_id": wip_id, "process_id": "2", "worker_id": operator.username}}, 201),
+        (f"{API}/process-operations/complete",
+         {"json": {"wip_id": wip_id, "process_id": "2", "worker_id": operator.username, "result": "PASS"}}, 200),
+    ]
+    for url, kwargs, expected in steps:
+        started = time.perf_counter()
+        response = await client.post(url, headers=floor["headers"], **kwargs)
+        samples.append((time.perf_counter() - started, response.status_code == expected))
+        if response.status_code != expected:
+            return  # The rest of the cycle depends on this step
+
+
+def run_floor(use_async: bool, floor: Dict, wips: List[tuple]) -> Dict[str, float]:
+    """Run every station concurrently; return latency percentiles, throughput and errors."""
+    samples: List[tuple] = []
+
+    async def main() -> float:
+        transport = httpx.ASGITransport(app=hot_path_app(use_async))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(station(client, floor, wip, samples) for wip in wips))
+            elapsed = time.perf_counter() - started
+        await dispose_engines()
+        return elapsed
+
+    elapsed = asyncio.run(main())
+    latencies = sorted(latency for latency, _ in samples)
+    return {
+        "requests": len(samples),
+        "errors": sum(not ok for _, ok in samples),
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1000,
+        "rps": sum(ok for _, ok in samples) / elapsed,
+    }
+
+
+class TestHotPathParity:
+    """Test the async variants apply the same rules as the sync endpoints."""
+
+    @pytest.mark.parametrize("use_async", [False, True], ids=["sync", "async"])
+    def test_station_cycle(self, db, shop_floor, use_async):
+        wip_pk, _ = shop_floor["wips"][0]
+        assert run_floor(use_async, shop_floor, shop_floor["wips"][:1])["errors"] == 0
+
+        db.expire_all()
+        assert db.get(WIPItem, wip_pk).status == WIPStatus.COMPLETED.value
+        results = db.query(ProcessData.process_id, ProcessData.result).filter(
+            ProcessData.wip_id == wip_pk, ProcessData.completed_at.isnot(None)
+        ).order_by(ProcessData.process_id).all()
+        assert [tuple(row) for row in results] == [(1, "PASS"), (2, "PASS")]
+        assert db.query(WIPProcessHistory).filter(WIPProcessHistory.wip_item_id == wip_pk).count() == 2
+
+    def test_errors_match(self, shop_floor):
+        wip_pk, wip_id = shop_floor["wips"][0]
+        operator = shop_floor["operator"]
+        requests = [
+            ("POST", f"{API}/wip-items/WIP-NOPE/scan", {}),
+            ("POST", f"{API}/wip-items/{wip_pk}/start-process",
+             {"json": {"process_id": 2, "operator_id": operator.id}}),
+            ("POST", f"{API}/process-operations/start",
+             {"json": {"wip_id": wip_id, "process_id": "2", "worker_id": operator.username}}),
+            ("POST", f"{API}/process-operations/complete",
+             {"json": {"wip_id": wip_id, "process_id": "1", "worker_id": "nobody", "result": "PASS"}}),
+            ("POST", f"{API}/process-operations/start", {"json": {"wip_id": wip_id}, "headers": {}}),
+        ]
+
+        async def responses(use_async: bool):
+            transport = httpx.ASGITransport(app=hot_path_app(use_async))
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                out = []
+                for method, url, kwargs in requests:
+                    kwargs = {"headers": shop_floor["headers"], **kwargs}
+                    response = await client.request(method, url, **kwargs)
+                    body = response.json()
+                    body.pop("timestamp", None)
+                    body.pop("trace_id", None)
+                    out.append((response.status_code, body))
+            await dispose_engines()
+            return out
+
+        sync_responses = asyncio.run(responses(False))
+        assert [status for status, _ in sync_responses] == [404, 400, 400, 404, 401]
+        assert asyncio.run(responses(True)) == sync_responses
+
+    def test_route_selection(self, monkeypatch):
+        monkeypatch.setattr(settings, "ASYNC_HOT_PATHS", ["wip-items.scan"])
+        assert deps.hot_path("wip-items.scan", wip_items.scan_wip_barcode_async)(
+            wip_items.scan_wip_barcode
+        ) is wip_items.scan_wip_barcode_async
+        assert deps.hot_path("wip-items.start-process", wip_items.start_wip_process_async)(
+            wip_items.start_wip_process
+        ) is wip_items.start_wip_process
+
+
+@pytest.mark.slow
+class TestHotPathLoad:
+    """Compare sync and async hot paths with every station working at once."""
+
+    def test_concurrent_stations(self, db, shop_floor):
+        results = {}
+        for name, use_async in (("sync", False), ("async", True)):
+            reset_floor(db)
+            results[name] = run_floor(use_async, shop_floor, shop_floor["wips"])
+
+        print(f"\n{STATIONS} stations, {STATIONS * 5} requests per path")
+        print(f"{'path':<6} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>8} {'errors':>7}")
+        for name, result in results.items():
+            print(
+                f"{name:<6} {result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} "
+                f"{result['rps']:>8.1f} {result['errors']:>7}"
+            )
+
+        # The sync path is only reported: with more stations than threadpool
+        # workers it can stall on pool checkout until requests time out.
+        assert results["async"]["errors"] == 0
+        assert results["async"]["requests"] == STATIONS * 5
@@ -0,0 +1,107 @@
+"""
+Offset versus keyset pagination of the process data list.
+
+Bulk-loads PAGINATION_ROWS process_data rows with app.utils.bulk_data, then
+times a 10-row page of crud.process_data.get_multi at page 1 and at page
+PAGINATION_DEEP_PAGE (default 10,000) both ways:
+    - offset: skip = page * limit; the database reads and discards every
+      row before the page
+    - keyset: after = sort key of the previous page's last row; an index
+      range scan that starts at the page
+
+Prints the comparison and fails if the pages differ, if the deep keyset page
+is not faster than the deep offset page, or if it is not roughly as fast as
+the first page.
+"""
+
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.models import ProcessData, ProductModel, ProductionLine
+from app.models.process import Process
+from app.utils import bulk_data
+
+ROWS = int(os.environ.get("PAGINATION_ROWS", "110000"))
+DEEP_PAGE = int(os.environ.get("PAGINATION_DEEP_PAGE", "10000"))
+LIMIT = 10
+REPEATS = 5
+# A deep keyset page may take this many times the first page (plus 2 ms of noise)
+FLAT_FACTOR = 3
+
+
+@pytest.fixture
+def process_history(db: Session, test_operator_user) -> None:
+    product_model = ProductModel(
+        model_code="PSA", model_name="Paging Model", category="Test", status="ACTIVE", specifications={},
+    )
+    line = ProductionLine(line_code="KR01", line_name="Line 1")
+    processes = [
+        Process(
+            id=number, process_number=number, process_code=f"P{number:02d}",
+            process_name_ko=f"공정 {number}", process_name_en=f"Process {number}",
+            process_type="SERIAL_CONVERSION" if number == 7 else "MANUFACTURING",
+            sort_order=number, quality_criteria={},
+        )
+        for number in range(1, 9)
+    ]
+    db.add_all([product_model, line, *processes])
+    db.flush()
+
+    bulk_data.generate(
+        db, ROWS, processes={number: number for number in range(1, 9)},
+        operator_ids=[test_operator_user.id], product_model_id=product_model.id, production_line_id=line.id,
+    )
+    db.commit()
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("ANALYZE"))
+        db.commit()
+
+
+def timed(fetch: Callable[[], List[ProcessData]]) -> Dict:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        rows = fetch()
+        timings.append(time.perf_counter() - started)
+    return {"ms": statistics.median(timings) * 1000, "ids": [row.id for row in rows]}
+
+
+@pytest.mark.slow
+def test_deep_keyset_page_is_flat(db: Session, process_history):
+    deep_page = min(DEEP_PAGE, ROWS // LIMIT - 1)
+    skip = deep_page * LIMIT
+    # Sort key of the row just before the deep page, as its cursor would carry
+    previous = db.execute(
+        select(ProcessData.created_at, ProcessData.id)
+        .order_by(ProcessData.created_at.desc(), ProcessData.id.desc())
+        .offset(skip - 1).limit(1)
+    ).one()
+
+    results = {
+        "offset page 1": timed(lambda: crud.process_data.get_multi(db, skip=0, limit=LIMIT)),
+        "keyset page 1": timed(lambda: crud.process_data.get_multi(db, limit=LIMIT, after=None)),
+        f"offset page {deep_page:,}": timed(lambda: crud.process_data.get_multi(db, skip=skip, limit=LIMIT)),
+        f"keyset page {deep_page:,}": timed(
+            lambda: crud.process_data.get_multi(db, limit=LIMIT, after=tuple(previous))
+        ),
+    }
+
+    print(f"\n{ROWS:,} process_data rows, {LIMIT} per page, newest first")
+    for name, outcome in results.items():
+        print(f"{name:<22}{outcome['ms']:>10.2f} ms")
+
+    first, deep_offset, deep_keyset = (
+        results["keyset page 1"], results[f"offset page {deep_page:,}"], results[f"keyset page {deep_page:,}"]
+    )
+    assert results["offset page 1"]["ids"] == first["ids"]
+    assert deep_keyset["ids"] == deep_offset["ids"]
+    assert len(deep_keyset["ids"]) == LIMIT
+    assert deep_keyset["ms"] < deep_offset["ms"]
+    assert deep_keyset["ms"] <= first["ms"] * FLAT_FACTOR + 2
@@ -5,23 +5,39 @@ This module tests that CRUD operations maintain efficient query counts
 and don't introduce N+1 query problems.
 """
 
+import json
+import time
+import uuid
 import pytest
 from contextlib import contextmanager
-from typing import Generator, Dict, Any
-from sqlalchemy import event
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Generator, Dict, Any, List
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import event, insert
 from sqlalchemy.orm import Session
 from sqlalchemy.engine import Engine
 
-from app.database import SessionLocal
+from app.database import Base, SessionLocal
+from app.core.responses import trusted_json
+from app.crud import audit_log as crud_audit_log
+from app.crud import error_log as crud_error_log
 from app.crud import lot as crud_lot
 from app.crud import serial as crud_serial
 from app.crud import process_data as crud_process_data
+from app.crud import wip_item as crud_wip_item
+from app.models import AuditLog, Equipment, ErrorLog, Process, ProductModel, ProductionLine, User, WIPItem
 from app.models.lot import Lot, LotStatus
 from app.models.serial import Serial
 from app.models.process_data import ProcessData
-from app.schemas.lot import LotCreate
+from app.schemas.audit_log import AuditLogInDB
+from app.schemas.error_log import ErrorLogResponse
+from app.schemas.lot import LotCreate, LotInDB
 from app.schemas.serial import SerialCreate
-from app.schemas.process_data import ProcessDataCreate
+from app.schemas.process_data import ProcessDataCreate, ProcessDataInDB
+from app.schemas.wip_item import WIPItemInDB
+from tests.conftest import TestSessionLocal, test_engine
 
 
 @contextmanager
@@ -310,6 +326,99 @@ class TestEdgeCases:
             _ = fetched.product_model.model_code  # Should work normally
 
 
+@lru_cache
+def _list_adapter(schema) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def render_validated(schema, objects) -> bytes:
+    """Render ORM objects like a response_model route: validate, serialize, encode."""
+    adapter = _list_adapter(schema)
+    content = adapter.dump_python(adapter.validate_python(objects, from_attributes=True), mode="json")
+    return JSONResponse(content).body
+
+
+def best_of(runs: int, render) -> tuple:
+    """Run render() `runs` times; return (fastest seconds, last body)."""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        body = render()
+        timings.append(time.perf_counter() - started)
+    return min(timings), body
+
+
+@pytest.mark.slow
+class TestListResponsePerformance:
+    """Benchmark the row/orjson response path against ORM + response_model."""
+
+    @pytest.mark.parametrize("rows", [50, 500, 5000])
+    def test_process_data_list(self, bench_db: Session, process_data_rows, rows: int):
+        def current():
+            bench_db.expunge_all()
+            return render_validated(ProcessDataInDB, crud_process_data.get_multi(bench_db, limit=rows))
+
+        def fast():
+            bench_db.expunge_all()
+            return trusted_json(crud_process_data.get_multi_rows(bench_db, limit=rows)).body
+
+        current_seconds, current_body = best_of(3, current)
+        fast_seconds, fast_body = best_of(3, fast)
+        print(
+            f"\nprocess_data x{rows}: response_model {current_seconds * 1000:.1f} ms, "
+            f"rows {fast_seconds * 1000:.1f} ms ({current_seconds / fast_seconds:.1f}x)"
+        )
+
+        assert json.loads(fast_body) == json.loads(current_body)
+        assert len(json.loads(fast_body)) == rows
+        if rows >= 500:
+            assert fast_seconds < current_seconds
+
+    def test_projections_match_response_models(self, bench_db: Session, process_data_rows):
+        lot = bench_db.query(Lot).first()
+        user = bench_db.query(User).first()
+        for sequence in range(1, 6):
+            bench_db.add(WIPItem(
+                wip_id=f"WIP-KR01PSA251101-{sequence:03d}", lot_id=lot.id, sequence_in_lot=sequence,
+                status="IN_PROGRESS" if sequence % 2 else "CREATED",
+            ))
+            bench_db.add(AuditLog(
+                user_id=user.id, entity_type="lots", entity_id=lot.id, action="UPDATE",
+                old_values={"sequence": 0}, new_values={"sequence": sequence}, created_at=datetime.now(timezone.utc),
+            ))
+            bench_db.add(ErrorLog(
+                trace_id=uuid.uuid4(), error_code="RES_002", message="Lot not found",
+                path="/api/v1/lots/999", method="GET", status_code=404,
+                user_id=user.id if sequence % 2 else None, details={"resource_id": 999},
+            ))
+        lot.actual_quantity, lot.passed_quantity, lot.failed_quantity = 3, 2, 1
+        bench_db.commit()
+        lot_id = lot.id
+        bench_db.expunge_all()
+
+        cases = [
+            (LotInDB, crud_lot.get_multi(bench_db), crud_lot.get_multi_rows(bench_db)),
+            (WIPItemInDB, crud_wip_item.get_multi(bench_db), crud_wip_item.get_multi_rows(bench_db)),
+            (
+                WIPItemInDB,
+                crud_wip_item.get_by_lot(bench_db, lot_id),
+                crud_wip_item.get_multi_rows(bench_db, lot_id=lot_id),
+            ),
+            (AuditLogInDB, crud_audit_log.get_multi(bench_db), crud_audit_log.get_multi_rows(bench_db)),
+        ]
+        for schema, objects, rows in cases:
+            assert json.loads(trusted_json(rows).body) == json.loads(render_validated(schema, objects))
+
+        error_logs = [
+            ErrorLogResponse(**log.to_dict(), username=log.user.username if log.user else None)
+            for log in crud_error_log.get_multi(bench_db, min_status_code=400)
+        ]
+        error_rows = crud_error_log.get_multi_rows(bench_db, min_status_code=400)
+        assert json.loads(trusted_json(error_rows).body) == [
+            log.model_dump(mode="json") for log in error_logs
+        ]
+
+
 @pytest.fixture
 def db():
     """Provide a database session for tests."""
@@ -442,6 +551,82 @@ def test_process_data_list(
     return process_data
 
 
+@pytest.fixture
+def bench_db() -> Generator[Session, None, None]:
+    """Provide a session on an emptied test database."""
+    def clear():
+        with test_engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+
+    clear()
+    session = TestSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        clear()
+
+
+@pytest.fixture
+def process_data_rows(bench_db: Session) -> int:
+    """Insert 5,000 LOT-level PASS/REWORK process data records with measurements."""
+    product_model = ProductModel(
+        model_code="PSA", model_name="Bench Model", category="Test",
+        status="ACTIVE", specifications={},
+    )
+    production_line = ProductionLine(line_code="KR01", line_name="Line 1")
+    operator = User(
+        username="bench", email="bench@example.com", password_hash="x",
+        full_name="Bench Operator", role="OPERATOR", is_active=True,
+    )
+    equipment = Equipment(
+        equipment_code="EQ-01", equipment_name="Tester", equipment_type="TESTER",
+        status="AVAILABLE", is_active=True,
+    )
+    processes = [
+        Process(
+            process_number=number, process_code=f"P{number:02d}",
+            process_name_ko=f"공정 {number}", process_name_en=f"Process {number}",
+            process_type="MANUFACTURING", sort_order=number, quality_criteria={},
+        )
+        for number in range(1, 9)
+    ]
+    bench_db.add_all([product_model, production_line, operator, equipment, *processes])
+    bench_db.flush()
+    lot = Lot(
+        lot_number="KR01PSA251101", product_model_id=product_model.id,
+        production_line_id=production_line.id, production_date=date(2025, 11, 1),
+        target_quantity=100, status=LotStatus.IN_PROGRESS,
+    )
+    bench_db.add(lot)
+    bench_db.flush()
+
+    started = datetime(2025, 11, 1, 8, 0, tzinfo=timezone.utc)
+    bench_db.execute(insert(ProcessData).execution_options(render_nulls=True), [
+        {
+            "lot_id": lot.id,
+            "process_id": processes[i % len(processes)].id,
+            "operator_id": operator.id,
+            "equipment_id": equipment.id if i % 2 else None,
+            "data_level": "LOT",
+            # FAIL rows need dict defects to pass ProcessDataInDB's create-time rules
+            "result": "REWORK" if i % 3 == 2 else "PASS",
+            "measurements": {
+                f"m{k}": {"value": round(i * 0.01 + k, 3), "unit": "V", "min": 0.0, "max": 99.0}
+                for k in range(8)
+            },
+            "defects": None,
+            "started_at": started + timedelta(seconds=i),
+            "completed_at": started + timedelta(seconds=i + 30) if i % 10 else None,
+            "created_at": started + timedelta(seconds=i),
+        }
+        for i in range(5000)
+    ])
+    bench_db.commit()
+    return 5000
+
+
 if __name__ == "__main__":
     # Run performance tests
     pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+30-day report: daily snapshots versus the raw process_data table.
+
+Builds REPORT_ROWS_PER_DAY executions per day for 30 days, then times the
+30-day process performance report three ways:
+    - snapshots: 29 closed days read from daily_report_snapshots, today live
+    - raw aggregation: the same grouped queries over all 30 days of process_data
+    - raw rows: every execution loaded and summarized in Python, the way the
+      client summarized scraped list endpoints
+
+Prints the comparison and fails if the snapshot report is not faster than
+both raw approaches or returns different numbers.
+"""
+
+import os
+import statistics
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models import Lot, LotStatus, ProcessData, ProductModel, ProductionLine
+from app.models.process import Process
+from app.services.report_service import report_service
+
+ROWS_PER_DAY = int(os.environ.get("REPORT_ROWS_PER_DAY", "2000"))
+DAYS = 30
+REPEATS = 3
+
+END = date.today()
+START = END - timedelta(days=DAYS - 1)
+
+
+@pytest.fixture
+def month_of_executions(db: Session, test_operator_user) -> None:
+    """ROWS_PER_DAY executions per day over 8 processes, 5% failed with a defect."""
+    product_model = ProductModel(
+        model_code="PSA", model_name="Report Model", category="Test", status="ACTIVE", specifications={},
+    )
+    line = ProductionLine(line_code="LINE-A", line_name="Line A")
+    processes = [
+        Process(
+            process_number=number, process_code=f"P{number:02d}",
+            process_name_ko=f"공정 {number}", process_name_en=f"Process {number}",
+            process_type="MANUFACTURING", sort_order=number, quality_criteria={},
+        )
+        for number in range(1, 9)
+    ]
+    db.add_all([product_model, line, *processes])
+    db.flush()
+    lot = Lot(
+        lot_number="KR01PSA2511", product_model_id=product_model.id, production_line_id=line.id,
+        production_date=START, target_quantity=100, status=LotStatus.IN_PROGRESS,
+    )
+    db.add(lot)
+    db.flush()
+
+    for offset in range(DAYS):
+        day_start = datetime.combine(START + timedelta(days=offset), datetime.min.time())
+        rows = []
+        for n in range(ROWS_PER_DAY):
+            failed = n % 20 == 0
+            started = day_start + timedelta(seconds=n * 86000 // ROWS_PER_DAY)
+            rows.append({
+                "lot_id": lot.id,
+                "process_id": processes[n % len(processes)].id,
+                "operator_id": test_operator_user.id,
+                "data_level": "LOT",
+                "result": "FAIL" if failed else "PASS",
+                "measurements": {"voltage": 3.3},
+                "defects": [{"defect_code": f"D{n % 3}"}] if failed else [],
+                "started_at": started,
+                "completed_at": started + timedelta(seconds=30),
+                "duration_seconds": 30,
+            })
+        db.execute(insert(ProcessData), rows)
+    db.commit()
+
+    report_service.materialize(db, START, END)
+
+
+def timed(run: Callable[[], Dict]) -> Dict:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - started)
+    return {"ms": statistics.median(timings) * 1000, "result": result}
+
+
+def yield_by_process(report: Dict) -> Dict[str, float]:
+    return {item["process_code"]: item["yield_rate"] for item in report["items"]}
+
+
+def raw_rows_report(db: Session) -> Dict:
+    """Load every execution and summarize in Python (the pre-snapshot client approach)."""
+    counts = defaultdict(lambda: {"pass": 0, "fail": 0})
+    rows = db.execute(
+        select(ProcessData, Process.process_code)
+        .join(Process, Process.id == ProcessData.process_id)
+        .where(
+            ProcessData.started_at >= datetime.combine(START, datetime.min.time()),
+            ProcessData.started_at < datetime.combine(END + timedelta(days=1), datetime.min.time()),
+        )
+    )
+    for process_data, process_code in rows:
+        counts[process_code]["pass" if process_data.result == "PASS" else "fail"] += 1
+    return {"items": [
+        {"process_code": code, "yield_rate": round(c["pass"] / (c["pass"] + c["fail"]) * 100, 2)}
+        for code, c in counts.items()
+    ]}
+
+
+def test_30_day_report_from_snapshots(db: Session, month_of_executions):
+    def raw_aggregation() -> Dict:
+        days = list(report_service.aggregate_days(db, START, END).values())
+        by_process = report_service._production_by_process(days, None)
+        return {"items": [
+            {"process_code": t["process_code"],
+             "yield_rate": round(t["pass_count"] / (t["pass_count"] + t["fail_count"]) * 100, 2)}
+            for t in by_process.values()
+        ]}
+
+    results = {
+        "snapshots": timed(lambda: report_service.process_performance(db, START, END)),
+        "raw aggregation": timed(raw_aggregation),
+        "raw rows": timed(lambda: raw_rows_report(db)),
+    }
+
+    print(f"\n30-day process performance report ({ROWS_PER_DAY * DAYS} executions)")
+    for name, outcome in results.items():
+        print(f"{name:<18}{outcome['ms']:>10.1f} ms")
+
+    expected = yield_by_process(results["snapshots"]["result"])
+    assert yield_by_process(results["raw aggregation"]["result"]) == expected
+    assert yield_by_process(results["raw rows"]["result"]) == expected
+    assert results["snapshots"]["ms"] < results["raw aggregation"]["ms"]
+    assert results["snapshots"]["ms"] < results["raw rows"]["ms"]
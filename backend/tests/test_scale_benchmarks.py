@@ -0,0 +1,257 @@
+"""
+Top endpoints at 10k / 100k / 1M process_data rows.
+
+Bulk-loads a production history with app.utils.bulk_data (COPY on
+PostgreSQL), then times the endpoints the shop floor and dashboards hit
+most: dashboard summary, measurement history, serial trace, WIP statistics
+and WIP start / complete. Every endpoint has a median latency budget per
+scale and a query budget per request; the query budget does not grow with
+the data, so an N+1 shows up at any scale.
+
+Results are written as JSON to BENCHMARK_REPORT (default
+benchmark_report.json) with the commit they ran on. Point
+BENCHMARK_BASELINE at the report of an earlier commit to also fail on
+latency regressions beyond BENCHMARK_TOLERANCE (default 0.25) and on any
+query count increase.
+
+Scales default to 10000; run the larger ones with e.g.
+BENCHMARK_SCALES=10000,100000,1000000. BENCHMARK_LATENCY_FACTOR scales the
+latency budgets for slower machines.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import Callable, Dict, Generator, List, NamedTuple
+
+import pytest
+from sqlalchemy import event, func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.cache import clear_cache
+from app.models import Lot, LotStatus, ProductModel, ProductionLine, Serial, SerialStatus, WIPItem, WIPStatus
+from app.models.process import Process
+from app.utils import bulk_data
+
+SCALES = [int(scale) for scale in os.environ.get("BENCHMARK_SCALES", "10000").split(",")]
+REPEATS = int(os.environ.get("BENCHMARK_REPEATS", "5"))
+REPORT = os.environ.get("BENCHMARK_REPORT", "benchmark_report.json")
+BASELINE = os.environ.get("BENCHMARK_BASELINE")
+TOLERANCE = float(os.environ.get("BENCHMARK_TOLERANCE", "0.25"))
+LATENCY_FACTOR = float(os.environ.get("BENCHMARK_LATENCY_FACTOR", "1"))
+
+API = settings.API_V1_PREFIX
+
+
+class Budget(NamedTuple):
+    queries: int  # per request, at every scale
+    ms: Dict[int, float]  # median latency up to each scale; beyond the largest, its budget
+
+
+BUDGETS = {
+    "dashboard_summary": Budget(queries=12, ms={10_000: 150, 100_000: 300, 1_000_000: 1000}),
+    "measurement_history": Budget(queries=8, ms={10_000: 200, 100_000: 500, 1_000_000: 2000}),
+    "serial_trace": Budget(queries=15, ms={10_000: 100, 100_000: 100, 1_000_000: 150}),
+    "wip_statistics": Budget(queries=4, ms={10_000: 100, 100_000: 300, 1_000_000: 1000}),
+    "wip_start": Budget(queries=12, ms={10_000: 150, 100_000: 150, 1_000_000: 200}),
+    "wip_complete": Budget(queries=18, ms={10_000: 200, 100_000: 200, 1_000_000: 300}),
+}
+
+
+def latency_budget(name: str, scale: int) -> float:
+    budgets = BUDGETS[name].ms
+    fitting = [budgets[size] for size in sorted(budgets) if size >= scale]
+    return (fitting[0] if fitting else budgets[max(budgets)]) * LATENCY_FACTOR
+
+
+def current_commit() -> str:
+    commit = os.environ.get("BENCHMARK_COMMIT")
+    if commit:
+        return commit
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+@contextmanager
+def count_queries() -> Generator[Dict[str, int], None, None]:
+    """Count statements on every engine (the analytics engine included)."""
+    stats = {"count": 0}
+
+    def receive_after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats["count"] += 1
+
+    event.listen(Engine, "after_cursor_execute", receive_after_cursor_execute)
+    try:
+        yield stats
+    finally:
+        event.remove(Engine, "after_cursor_execute", receive_after_cursor_execute)
+
+
+def measure(requests: List[Callable]) -> Dict:
+    """Send each request once with caches cleared; median / max latency and max query count."""
+    timings, queries = [], []
+    for send in requests:
+        clear_cache()
+        with count_queries() as stats:
+            started = time.perf_counter()
+            response = send()
+            timings.append(time.perf_counter() - started)
+        assert response.status_code in (200, 201), response.text
+        queries.append(stats["count"])
+    return {
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "max_ms": round(max(timings) * 1000, 2),
+        "queries": max(queries),
+    }
+
+
+@pytest.fixture(scope="module")
+def report() -> Generator[Dict, None, None]:
+    """Machine-readable results of this run, written when the module finishes."""
+    results = {
+        "commit": current_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "repeats": REPEATS,
+        "scales": {},
+    }
+    yield results
+    with open(REPORT, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nBenchmark report written to {os.path.abspath(REPORT)}")
+
+
+def load_floor(db: Session, operator_id: int, rows: int) -> Dict:
+    """Bulk-load `rows` process_data rows, plus a LOT of fresh WIPs for start / complete."""
+    product_model = ProductModel(
+        model_code="PSA", model_name="Scale Model", category="Test", status="ACTIVE", specifications={},
+    )
+    line = ProductionLine(line_code="KR01", line_name="Line 1")
+    # WIP routes take the process primary key, so ids match process numbers
+    processes = [
+        Process(
+            id=number, process_number=number, process_code=f"P{number:02d}",
+            process_name_ko=f"공정 {number}", process_name_en=f"Process {number}",
+            process_type="SERIAL_CONVERSION" if number == 7 else "MANUFACTURING",
+            sort_order=number, quality_criteria={},
+        )
+        for number in range(1, 9)
+    ]
+    db.add_all([product_model, line, *processes])
+    db.flush()
+
+    started = time.perf_counter()
+    counts = bulk_data.generate(
+        db, rows, processes={number: number for number in range(1, 9)},
+        operator_ids=[operator_id], product_model_id=product_model.id, production_line_id=line.id,
+    )
+    db.commit()
+    load_s = time.perf_counter() - started
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("ANALYZE"))
+        db.commit()
+
+    fresh = Lot(
+        lot_number="KR01PSB2511", product_model_id=product_model.id, production_line_id=line.id,
+        production_date=date.today(), target_quantity=100, status=LotStatus.IN_PROGRESS,
+    )
+    db.add(fresh)
+    db.flush()
+    wips = [
+        WIPItem(wip_id=f"WIP-KR01PSB2511-{n:03d}", lot_id=fresh.id, sequence_in_lot=n, status=WIPStatus.CREATED.value)
+        for n in range(1, REPEATS + 1)
+    ]
+    db.add_all(wips)
+    db.commit()
+
+    passed = select(Serial.serial_number).where(Serial.status == SerialStatus.PASSED).order_by(Serial.id)
+    total = db.scalar(select(func.count()).select_from(passed.subquery()))
+    serial_numbers = db.scalars(passed.offset(total // 2).limit(REPEATS)).all()
+
+    return {
+        "counts": counts,
+        "load_s": load_s,
+        "wips": [wip.id for wip in wips],
+        "serial_numbers": serial_numbers,
+    }
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("scale", SCALES, ids=lambda scale: f"{scale:_}")
+def test_top_endpoints_at_scale(client, db, test_operator_user, auth_headers_operator, report, scale):
+    floor = load_floor(db, test_operator_user.id, scale)
+    operator_id = test_operator_user.id
+
+    def get(url: str, **params) -> Callable:
+        return lambda: client.get(url, params=params, headers=auth_headers_operator)
+
+    def start(wip_pk: int) -> Callable:
+        return lambda: client.post(
+            f"{API}/wip-items/{wip_pk}/start-process", headers=auth_headers_operator,
+            json={"process_id": 1, "operator_id": operator_id},
+        )
+
+    def complete(wip_pk: int) -> Callable:
+        return lambda: client.post(
+            f"{API}/wip-items/{wip_pk}/complete-process", headers=auth_headers_operator,
+            params={"process_id": 1, "operator_id": operator_id},
+            json={"result": "PASS", "measurements": bulk_data.generate_measurements(1)},
+        )
+
+    endpoints = {
+        "dashboard_summary": [get(f"{API}/dashboard/summary")] * REPEATS,
+        "measurement_history": [get(f"{API}/process-data/measurements/history", limit=50)] * REPEATS,
+        "serial_trace": [get(f"{API}/serials/{number}/trace") for number in floor["serial_numbers"]],
+        "wip_statistics": [get(f"{API}/wip-items/statistics")] * REPEATS,
+        "wip_start": [start(wip_pk) for wip_pk in floor["wips"]],
+        "wip_complete": [complete(wip_pk) for wip_pk in floor["wips"]],
+    }
+    results = {name: measure(requests) for name, requests in endpoints.items()}
+    for name, result in results.items():
+        result["budget_ms"] = latency_budget(name, scale)
+        result["budget_queries"] = BUDGETS[name].queries
+
+    report["scales"][str(scale)] = {
+        "rows": floor["counts"],
+        "load_s": round(floor["load_s"], 2),
+        "endpoints": results,
+    }
+
+    print(f"\n{scale:,} process_data rows loaded in {floor['load_s']:.1f}s")
+    print(f"{'endpoint':<22}{'p50 ms':>10}{'max ms':>10}{'budget':>10}{'queries':>9}")
+    for name, result in results.items():
+        print(
+            f"{name:<22}{result['p50_ms']:>10.1f}{result['max_ms']:>10.1f}"
+            f"{result['budget_ms']:>10.0f}{result['queries']:>5}/{result['budget_queries']:<3}"
+        )
+
+    failures = [
+        f"{name}: {result['queries']} queries > {result['budget_queries']}"
+        for name, result in results.items() if result["queries"] > result["budget_queries"]
+    ] + [
+        f"{name}: {result['p50_ms']} ms > {result['budget_ms']} ms"
+        for name, result in results.items() if result["p50_ms"] > result["budget_ms"]
+    ]
+
+    if BASELINE:
+        with open(BASELINE, encoding="utf-8") as f:
+            baseline = json.load(f)["scales"].get(str(scale), {}).get("endpoints", {})
+        for name, before in baseline.items():
+            after = results.get(name)
+            if after is None:
+                continue
+            if after["queries"] > before["queries"]:
+                failures.append(f"{name}: {before['queries']} -> {after['queries']} queries")
+            if after["p50_ms"] > before["p50_ms"] * (1 + TOLERANCE):
+                failures.append(f"{name}: {before['p50_ms']} -> {after['p50_ms']} ms")
+
+    assert not failures, "\n".join(failures)
@@ -0,0 +1,88 @@
+"""
+Cold start benchmark for API workers.
+
+Imports ``app.main`` in a fresh interpreter under ``python -X importtime``
+and fails if a worker's cold start regresses:
+    - heavy optional dependencies are imported at startup again
+    - database engines are created at import time
+    - the application's own import time exceeds the budget
+
+The budget covers what the application adds on top of its frameworks
+(FastAPI, SQLAlchemy, Pydantic are preloaded and excluded). Override it
+with STARTUP_IMPORT_BUDGET_SECONDS on slow CI machines.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+STARTUP_IMPORT_BUDGET_SECONDS = float(os.environ.get("STARTUP_IMPORT_BUDGET_SECONDS", "2.0"))
+
+# Loaded on first use, never by importing the app
+DEFERRED_MODULES = ("celery", "httpx", "PIL", "barcode", "qrcode", "psutil")
+
+FRAMEWORK_MODULES = (
+    "fastapi",
+    "fastapi.routing",
+    "pydantic",
+    "pydantic_settings",
+    "sqlalchemy.orm",
+    "sqlalchemy.ext.asyncio",
+    "starlette.middleware.cors",
+)
+
+_PROBE = f"""
+import json, sys
+import {", ".join(FRAMEWORK_MODULES)}
+import app.main
+import app.database
+print(json.dumps({{
+    "deferred": [m for m in {DEFERRED_MODULES!r} if m in sys.modules],
+    "engine_created": app.database._engine is not None,
+}}))
+"""
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s+app\.main$")
+
+
+def _cold_import():
+    """Import app.main in a fresh interpreter; return (probe result, seconds)."""
+    env = {**os.environ, "DEBUG": "true", "PYTHONDONTWRITEBYTECODE": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    cumulative_us = next(
+        int(match.group(2))
+        for match in map(_IMPORTTIME_LINE.match, proc.stderr.splitlines())
+        if match
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1]), cumulative_us / 1e6
+
+
+@pytest.mark.slow
+class TestColdStart:
+    """Test API worker cold start stays fast and side-effect free."""
+
+    def test_cold_start(self):
+        probe, seconds = _cold_import()
+
+        assert probe["deferred"] == [], f"imported at startup: {probe['deferred']}"
+        assert not probe["engine_created"], "database engine created at import time"
+        assert seconds < STARTUP_IMPORT_BUDGET_SECONDS, (
+            f"app.main import took {seconds:.2f}s "
+            f"(budget {STARTUP_IMPORT_BUDGET_SECONDS:.2f}s)"
+        )
@@ -0,0 +1,132 @@
+"""
+Bytes on the wire and end-to-end latency of the top polled endpoints.
+
+Requests each endpoint with identity, gzip and (when brotli is installed)
+br encoding through the full application, measures the encoded body size
+and server time, and estimates end-to-end latency over plant Wi-Fi as
+server time + round trip + transfer time. Prints the comparison and fails
+if compression does not shrink the large responses or makes them slower
+end to end.
+
+Override the link model with TRANSPORT_WIFI_MBPS / TRANSPORT_RTT_MS and the
+data volume with TRANSPORT_ROWS.
+"""
+
+import os
+import statistics
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.middleware import compression
+from app.models import Lot, LotStatus, ProcessData, ProductModel, WIPItem, WIPStatus
+from app.models.process import Process
+
+ROWS = int(os.environ.get("TRANSPORT_ROWS", "500"))
+WIFI_MBPS = float(os.environ.get("TRANSPORT_WIFI_MBPS", "5"))
+RTT_MS = float(os.environ.get("TRANSPORT_RTT_MS", "20"))
+REPEATS = 3
+
+API = settings.API_V1_PREFIX
+
+# Polled by the desktop client, tablet scanner and dashboard
+POLLED_ENDPOINTS = [
+    f"{API}/wip-items/statistics",
+    f"{API}/wip-items/?limit={ROWS}",
+    f"{API}/lots/",
+    f"{API}/processes/",
+    f"{API}/process-data/?limit=100",
+    f"{API}/dashboard/lots",
+]
+
+ENCODINGS = ["identity", "gzip"] + (["br"] if compression.brotli else [])
+
+
+@pytest.fixture
+def polled_data(db: Session, test_operator_user) -> None:
+    """In-progress WIP items across LOTs of 100, with measurement history."""
+    product_model = ProductModel(
+        model_code="PSA", model_name="Transport Model", category="Test",
+        status="ACTIVE", specifications={},
+    )
+    processes = [
+        Process(
+            process_number=number, process_code=f"P{number:02d}",
+            process_name_ko=f"공정 {number}", process_name_en=f"Process {number}",
+            process_type="MANUFACTURING", sort_order=number, quality_criteria={},
+        )
+        for number in range(1, 9)
+    ]
+    db.add_all([product_model, *processes])
+    db.flush()
+
+    started = datetime(2025, 11, 1, 8, 0)
+    for lot_index in range((ROWS + 99) // 100):
+        lot = Lot(
+            lot_number=f"KR01PSA2511{lot_index + 1:02d}", product_model_id=product_model.id,
+            production_date=date(2025, 11, 1), target_quantity=100,
+            status=LotStatus.IN_PROGRESS,
+        )
+        db.add(lot)
+        db.flush()
+        for sequence in range(1, min(100, ROWS - lot_index * 100) + 1):
+            process = processes[sequence % len(processes)]
+            db.add(WIPItem(
+                wip_id=f"WIP-{lot.lot_number}-{sequence:03d}", lot_id=lot.id,
+                sequence_in_lot=sequence, status=WIPStatus.IN_PROGRESS.value,
+                current_process_id=process.id,
+            ))
+            db.add(ProcessData(
+                lot_id=lot.id, process_id=process.id, operator_id=test_operator_user.id,
+                data_level="LOT", result="PASS",
+                measurements={"voltage": 3.3 + sequence / 1000, "current": 0.12, "temperature": 24.5},
+                started_at=started + timedelta(seconds=sequence),
+                completed_at=started + timedelta(seconds=sequence + 30),
+                duration_seconds=30,
+            ))
+    db.commit()
+
+
+def measure(client: TestClient, url: str, headers: Dict[str, str], encoding: str) -> Dict[str, float]:
+    """Median server time and encoded body size of one endpoint."""
+    timings: List[float] = []
+    size = 0
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        with client.stream("GET", url, headers={**headers, "Accept-Encoding": encoding}) as response:
+            body = b"".join(response.iter_raw())
+        timings.append(time.perf_counter() - started)
+        assert response.status_code == 200, f"{url}: {response.status_code}"
+        size = len(body)
+    server_ms = statistics.median(timings) * 1000
+    transfer_ms = size * 8 / (WIFI_MBPS * 1_000_000) * 1000
+    return {"bytes": size, "server_ms": server_ms, "e2e_ms": server_ms + RTT_MS + transfer_ms}
+
+
+def test_polled_endpoints_bytes_and_latency(client, polled_data, auth_headers_admin):
+    results = {
+        url: {encoding: measure(client, url, auth_headers_admin, encoding) for encoding in ENCODINGS}
+        for url in POLLED_ENDPOINTS
+    }
+
+    print(f"\nPolled endpoints over {WIFI_MBPS:g} Mbit/s, {RTT_MS:g} ms RTT ({ROWS} rows)")
+    print(f"{'endpoint':<44}{'encoding':>10}{'bytes':>10}{'server ms':>11}{'e2e ms':>9}")
+    for url, by_encoding in results.items():
+        for encoding, result in by_encoding.items():
+            print(
+                f"{url.removeprefix(API):<44}{encoding:>10}{result['bytes']:>10}"
+                f"{result['server_ms']:>11.1f}{result['e2e_ms']:>9.1f}"
+            )
+
+    for url, by_encoding in results.items():
+        identity = by_encoding["identity"]
+        if identity["bytes"] < settings.COMPRESSION_MIN_SIZE:
+            continue
+        for encoding in ENCODINGS[1:]:
+            assert by_encoding[encoding]["bytes"] < identity["bytes"] / 2, f"{url} {encoding}"
+            assert by_encoding[encoding]["e2e_ms"] <= identity["e2e_ms"], f"{url} {encoding}"
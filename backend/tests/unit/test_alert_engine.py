@@ -0,0 +1,306 @@
+"""
+Unit tests for the event-driven alert rule engine.
+
+Tests:
+    - Sliding windows expire old buckets
+    - Failure rate, consecutive failure, cycle-time drift and event count rules
+    - Rules fire once per breach and respect cooldowns
+    - Alerts are written through crud.alert and de-duplicated across processes
+    - Completion and equipment events are taken from committed sessions and
+      evaluated on the engine's thread
+    - Event count thresholds are split across API workers
+    - Evaluation latency and queue metrics
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import threading
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.analytics.alert_engine import (
+    DEFAULT_RULES,
+    AlertEngine,
+    AlertEvent,
+    AlertRule,
+    SlidingWindow,
+)
+from app.models import Alert, Equipment, Lot, ProcessData, ProductModel, ProductionLine
+from app.models.alert import AlertSeverity, AlertType
+from app.models.process import Process
+from tests.conftest import TestSessionLocal
+
+T0 = 1_800_000_000.0
+
+
+def rule(**overrides) -> AlertRule:
+    values = dict(
+        name="failure_rate", event="completion", metric="failure_rate", threshold=0.5,
+        scope="process_id", min_events=4, window_seconds=600, cooldown_seconds=300,
+        alert_type=AlertType.QUALITY_THRESHOLD, severity=AlertSeverity.MEDIUM,
+        title="Process {key} failing", message="{value:.0%} of {events} runs failed",
+    )
+    values.update(overrides)
+    return AlertRule(**values)
+
+
+def completion(at: float, failed: bool = False, process_id: int = 1, **fields) -> AlertEvent:
+    return AlertEvent(kind="completion", at=at, process_id=process_id, failed=failed, **fields)
+
+
+@pytest.fixture
+def processes(db: Session) -> None:
+    """Processes 1 and 2, which the alerts reference."""
+    db.add_all([
+        Process(
+            id=number, process_number=number, process_code=f"P{number:02d}",
+            process_name_ko=f"공정 {number}", process_name_en=f"Process {number}",
+            process_type="MANUFACTURING", sort_order=number, quality_criteria={},
+        )
+        for number in (1, 2)
+    ])
+    db.commit()
+
+
+@pytest.fixture
+def engine(processes) -> AlertEngine:
+    return AlertEngine(rules=[rule()], session_factory=TestSessionLocal)
+
+
+class TestSlidingWindow:
+    """Test bucketed window counters."""
+
+    def test_expires_old_buckets(self):
+        window = SlidingWindow(60)
+        window.add(T0, failed=True, duration=10)
+        window.add(T0 + 30, duration=20)
+
+        assert (window.count, window.failed, window.total, window.timed) == (2, 1, 30, 2)
+
+        window.advance(T0 + 61)
+        assert (window.count, window.failed, window.total) == (1, 0, 20)
+
+        window.advance(T0 + 3600)
+        assert (window.count, window.failed, window.total, window.timed) == (0, 0, 0, 0)
+
+
+class TestRules:
+    """Test rule evaluation."""
+
+    def test_failure_rate_fires_once_per_breach(self, engine: AlertEngine, db: Session):
+        fired = [engine.publish(completion(T0 + n, failed=n != 1)) for n in range(6)]
+
+        assert [len(alerts) for alerts in fired] == [0, 0, 0, 1, 0, 0]
+        alert = db.query(Alert).one()
+        assert alert.title == "Process 1 failing"
+        assert alert.process_id == 1
+        assert alert.alert_type == AlertType.QUALITY_THRESHOLD
+
+    def test_cooldown(self, engine: AlertEngine):
+        for n in range(4):
+            engine.publish(completion(T0 + n, failed=True))
+        for n in range(4):
+            engine.publish(completion(T0 + 10 + n))  # Recovers, re-arms
+
+        assert engine.publish(completion(T0 + 20, failed=True)) == []
+        assert engine.metrics()["rules"][0]["suppressed"] == 1
+
+    def test_keys_are_independent(self, engine: AlertEngine):
+        for n in range(4):
+            engine.publish(completion(T0 + n, failed=True, process_id=1))
+            engine.publish(completion(T0 + n, failed=False, process_id=2))
+
+        assert engine.metrics()["rules"][0]["fired"] == 1
+        assert engine.metrics()["rules"][0]["keys"] == 2
+
+    def test_consecutive_failures(self, db: Session):
+        engine = AlertEngine(
+            rules=[rule(name="streak", metric="consecutive_failures", threshold=3, scope="equipment_id",
+                        alert_type=AlertType.EQUIPMENT_FAILURE, title="Equipment {key} failing")],
+            session_factory=TestSessionLocal,
+        )
+        results = [True, True, False, True, True, True]
+
+        fired = [engine.publish(completion(T0 + n, failed=f, equipment_id=7)) for n, f in enumerate(results)]
+
+        assert [len(alerts) for alerts in fired] == [0, 0, 0, 0, 0, 1]
+        assert fired[-1][0].equipment_id == "7"
+
+    def test_cycle_time_drift(self, processes):
+        engine = AlertEngine(
+            rules=[rule(name="drift", metric="cycle_time_drift", threshold=0.5, min_events=3,
+                        baseline_events=10, window_seconds=60)],
+            session_factory=TestSessionLocal,
+        )
+        for n in range(10):
+            assert engine.publish(completion(T0 + n * 60, duration=100)) == []
+
+        fired = [engine.publish(completion(T0 + 600 + n, duration=200)) for n in range(3)]
+
+        assert [len(alerts) for alerts in fired] == [0, 0, 1]
+
+    def test_event_count_with_match(self, db: Session):
+        server_errors = next(r for r in DEFAULT_RULES if r.name == "server_errors")
+        engine = AlertEngine(rules=[server_errors], session_factory=TestSessionLocal)
+
+        for n in range(20):
+            engine.publish(AlertEvent(kind="error", at=T0 + n, error_code="RES_002", status_code=404))
+        fired = [
+            engine.publish(AlertEvent(kind="error", at=T0 + 20 + n, error_code="SRV_001", status_code=500))
+            for n in range(10)
+        ]
+
+        assert [len(alerts) for alerts in fired] == [0] * 9 + [1]
+        assert db.query(Alert).one().alert_type == AlertType.SYSTEM_ERROR
+
+    def test_event_count_is_split_across_workers(self, db: Session):
+        server_errors = next(r for r in DEFAULT_RULES if r.name == "server_errors")
+        engine = AlertEngine(rules=[server_errors, rule()], session_factory=TestSessionLocal, workers=4)
+
+        fired = [
+            engine.publish(AlertEvent(kind="error", at=T0 + n, error_code="SRV_001", status_code=500))
+            for n in range(3)
+        ]
+
+        assert [len(alerts) for alerts in fired] == [0, 0, 1]
+        thresholds = {r["name"]: r["threshold"] for r in engine.metrics()["rules"]}
+        assert thresholds == {"server_errors": 3, "failure_rate": 0.5}
+
+    def test_invalid_rule(self):
+        with pytest.raises(ValueError):
+            rule(metric="p95")
+        with pytest.raises(ValueError):
+            AlertEngine(rules=[rule(), rule()])
+
+
+class TestPersistence:
+    """Test alert writes and de-duplication."""
+
+    def test_duplicate_from_another_process_is_suppressed(self, db: Session, processes):
+        workers = [AlertEngine(rules=[rule()], session_factory=TestSessionLocal) for _ in range(2)]
+
+        for engine in workers:
+            for n in range(4):
+                engine.publish(completion(T0 + n, failed=True))
+
+        assert db.query(Alert).count() == 1
+        assert [engine.metrics()["rules"][0]["fired"] for engine in workers] == [1, 0]
+        assert workers[1].metrics()["rules"][0]["suppressed"] == 1
+
+
+class TestSessionEvents:
+    """Test events collected from committed sessions."""
+
+    @pytest.fixture
+    def started(self, db: Session):
+        engine = AlertEngine(
+            rules=[
+                rule(min_events=2),
+                next(r for r in DEFAULT_RULES if r.name == "equipment_down"),
+            ],
+            session_factory=TestSessionLocal,
+        )
+        engine.start()
+        yield engine
+        engine.stop()
+
+    @pytest.fixture
+    def lot(self, db: Session, test_operator_user) -> dict:
+        product_model = ProductModel(
+            model_code="PSA", model_name="Alert Model", category="Test", status="ACTIVE", specifications={},
+        )
+        line = ProductionLine(line_code="LINE-A", line_name="Line A")
+        process = Process(
+            process_number=1, process_code="P01", process_name_ko="공정 1", process_name_en="Process 1",
+            process_type="MANUFACTURING", sort_order=1, quality_criteria={},
+        )
+        db.add_all([product_model, line, process])
+        db.flush()
+        lot = Lot(
+            lot_number="KR01PSA2501", product_model_id=product_model.id, production_line_id=line.id,
+            production_date=datetime(2026, 1, 17).date(), target_quantity=10,
+        )
+        db.add(lot)
+        db.commit()
+        return {"lot": lot, "process": process, "operator": test_operator_user}
+
+    def test_completions(self, db: Session, started: AlertEngine, lot: dict):
+        now = datetime.now(timezone.utc)
+        records = [
+            ProcessData(
+                lot_id=lot["lot"].id, process_id=lot["process"].id, operator_id=lot["operator"].id,
+                data_level="LOT", result="FAIL", measurements={}, defects=[],
+                started_at=now - timedelta(minutes=5),
+            )
+            for _ in range(2)
+        ]
+        db.add_all(records)
+        db.commit()
+        started.drain()
+        assert started.metrics()["events"]["completion"] == 0  # Not completed yet
+
+        for record in records:
+            record.completed_at = now
+        db.commit()
+        started.drain()
+
+        assert started.metrics()["events"]["completion"] == 2
+        assert db.query(Alert).filter(Alert.process_id == lot["process"].id).count() == 1
+
+    def test_rolled_back_changes_are_ignored(self, db: Session, started: AlertEngine):
+        equipment = Equipment(equipment_code="EQ-01", equipment_name="Press", equipment_type="PRESS")
+        db.add(equipment)
+        db.commit()
+
+        equipment.status = "OUT_OF_SERVICE"
+        db.flush()
+        db.rollback()
+        started.drain()
+        assert db.query(Alert).count() == 0
+
+        equipment.status = "OUT_OF_SERVICE"
+        db.commit()
+        started.drain()
+
+        alert = db.query(Alert).one()
+        assert alert.alert_type == AlertType.EQUIPMENT_FAILURE
+        assert alert.equipment_id == str(equipment.id)
+
+    def test_rules_run_on_the_engine_thread(self, db: Session, started: AlertEngine, monkeypatch):
+        threads = []
+        publish = started.publish
+
+        def recording(alert_event):
+            threads.append(threading.current_thread().name)
+            return publish(alert_event)
+
+        monkeypatch.setattr(started, "publish", recording)
+        db.add(Equipment(equipment_code="EQ-01", equipment_name="Press", equipment_type="PRESS"))
+        db.commit()
+        started.drain()
+
+        assert threads == ["alert-engine"]
+
+
+class TestMetrics:
+    """Test evaluation latency metrics."""
+
+    def test_latency(self, engine: AlertEngine):
+        for n in range(50):
+            engine.publish(completion(T0 + n))
+
+        metrics = engine.metrics()
+        stats = metrics["rules"][0]
+        assert metrics["events"]["completion"] == 50
+        assert stats["evaluations"] == 50
+        assert 0 <= stats["p50_us"] <= stats["p99_us"] <= stats["max_us"]
+
+    def test_full_queue_drops_events(self):
+        engine = AlertEngine(rules=[rule()], queue_size=2)  # Not started: nothing consumes
+
+        submitted = [engine.submit(completion(T0 + n)) for n in range(3)]
+
+        assert submitted == [True, True, False]
+        assert engine.metrics()["queued"] == 2
+        assert engine.metrics()["dropped"] == 1
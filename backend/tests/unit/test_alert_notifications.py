@@ -0,0 +1,184 @@
+"""
+Unit tests for the cached unread-alert counter and alert push stream.
+
+Tests:
+    - Unread count is cached until the alerts version changes
+    - Writes committed by another process trigger a recount
+    - Polls publish alerts and count changes committed by any process
+    - Subscribers receive messages; slow subscribers keep the latest
+    - Server-sent events stream format
+"""
+
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.alert_notifications import AlertNotifier
+from app.crud import alert as alert_crud
+from app.models import Alert
+from app.models.alert import AlertSeverity, AlertType
+from app.schemas.alert import AlertCreate
+from tests.conftest import TestSessionLocal
+
+
+def new_alert(db: Session, title: str = "Defect detected") -> Alert:
+    return alert_crud.create(db, alert_in=AlertCreate(
+        alert_type=AlertType.DEFECT_DETECTED, severity=AlertSeverity.HIGH,
+        title=title, message="Defect in process 3",
+    ))
+
+
+def read_in_other_process(alert_ids: list) -> None:
+    """Mark alerts read without this process's session events, then bump the version."""
+    with TestSessionLocal() as other:
+        other.execute(
+            text("UPDATE alerts SET status = 'READ' WHERE id IN ({})".format(
+                ", ".join(str(alert_id) for alert_id in alert_ids)
+            ))
+        )
+        other.execute(text("UPDATE resource_versions SET version = version + 1 WHERE resource = 'alerts'"))
+        other.commit()
+
+
+async def first_poll(notifier: AlertNotifier) -> None:
+    """Wait for the poller started by subscribe() to record the current state."""
+    while notifier._version is None:
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def notifier(db: Session) -> AlertNotifier:
+    return AlertNotifier(poll_interval=3600, session_factory=TestSessionLocal)
+
+
+@pytest.fixture
+def counts(monkeypatch) -> list:
+    """Record every COUNT query of the unread count."""
+    calls = []
+    count = alert_crud.get_unread_count
+
+    def counting(db):
+        calls.append(db)
+        return count(db)
+
+    monkeypatch.setattr(alert_crud, "get_unread_count", counting)
+    return calls
+
+
+class TestUnreadCount:
+    """Test the cached counter."""
+
+    def test_cached_until_alerts_change(self, db: Session, notifier: AlertNotifier, counts: list):
+        first = new_alert(db)
+        assert [notifier.unread_count(db) for _ in range(3)] == [1, 1, 1]
+        assert len(counts) == 1
+
+        new_alert(db, title="Second")
+        assert notifier.unread_count(db) == 2
+
+        alert_crud.mark_as_read(db, alert_id=first.id, read_by_id=None)
+        assert notifier.unread_count(db) == 1
+        assert len(counts) == 3
+
+    def test_rolled_back_changes_keep_the_cache(self, db: Session, notifier: AlertNotifier, counts: list):
+        assert notifier.unread_count(db) == 0
+
+        db.add(Alert(
+            alert_type=AlertType.SYSTEM_ERROR, severity=AlertSeverity.LOW,
+            title="Rolled back", message="Never committed",
+        ))
+        db.flush()
+        db.rollback()
+
+        assert notifier.unread_count(db) == 0
+        assert len(counts) == 1
+
+    def test_write_by_other_process_recounts(self, db: Session, notifier: AlertNotifier):
+        alerts = [new_alert(db, title=f"Alert {n}") for n in range(3)]
+        assert notifier.unread_count(db) == 3
+
+        read_in_other_process([a.id for a in alerts[:2]])
+        db.rollback()  # End the read transaction
+
+        assert notifier.unread_count(db) == 1
+
+
+class TestPush:
+    """Test messages to subscribers."""
+
+    async def test_poll_publishes_changes_by_any_process(self, db: Session, notifier: AlertNotifier):
+        old = new_alert(db, title="Before subscribing")
+        notifier.unread_count(db)
+        queue = notifier.subscribe()
+        await first_poll(notifier)  # Nothing published
+        assert queue.empty()
+
+        alert = new_alert(db)
+        db.rollback()
+        notifier.poll(db)
+        await asyncio.sleep(0)
+
+        messages = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [m["type"] for m in messages] == ["alert_created", "unread_count"]
+        assert messages[0]["alert"]["id"] == alert.id
+        assert messages[0]["alert"]["title"] == "Defect detected"
+        assert messages[1]["unread_count"] == 2
+
+        read_in_other_process([old.id, alert.id])
+        db.rollback()
+        notifier.poll(db)
+        notifier.poll(db)  # Unchanged version: nothing published
+        await asyncio.sleep(0)
+
+        messages = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert messages == [{"type": "unread_count", "unread_count": 0}]
+
+        notifier.unsubscribe(queue)
+        new_alert(db)
+        db.rollback()
+        notifier.poll(db)
+        await asyncio.sleep(0)
+        assert queue.empty()
+
+    async def test_poller_runs_while_subscribed(self, db: Session, notifier: AlertNotifier):
+        queue = notifier.subscribe()
+        poller = notifier._poller
+        assert poller is not None and not poller.done()
+
+        await first_poll(notifier)
+
+        notifier.unsubscribe(queue)
+        await asyncio.wait([poller], timeout=1)
+        assert poller.cancelled()
+        assert notifier._poller is None and notifier._version is None
+
+    async def test_slow_subscriber_keeps_latest(self, db: Session):
+        notifier = AlertNotifier(poll_interval=3600, queue_size=2, session_factory=TestSessionLocal)
+        queue = notifier.subscribe()
+
+        for count in range(5):
+            notifier.publish({"type": "unread_count", "unread_count": count})
+        await asyncio.sleep(0)
+
+        assert [queue.get_nowait()["unread_count"] for _ in range(2)] == [3, 4]
+        notifier.unsubscribe(queue)
+
+    async def test_stream(self, db: Session):
+        notifier = AlertNotifier(poll_interval=3600, session_factory=TestSessionLocal)
+        stream = notifier.stream(unread_count=4, keepalive=0.01)
+
+        assert await stream.__anext__() == (
+            'event: unread_count\ndata: {"type": "unread_count", "unread_count": 4}\n\n'
+        )
+        assert await stream.__anext__() == ": keepalive\n\n"
+
+        notifier.publish({"type": "alert_created", "alert": {"id": 7}})
+        chunk = await stream.__anext__()
+        assert chunk.startswith("event: alert_created\n")
+        assert json.loads(chunk.split("data: ", 1)[1]) == {"type": "alert_created", "alert": {"id": 7}}
+
+        await stream.aclose()
+        assert not notifier._subscribers
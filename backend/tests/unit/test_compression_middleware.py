@@ -0,0 +1,146 @@
+"""
+Unit tests for CompressionMiddleware.
+
+Tests:
+    - Accept-Encoding negotiation (q-values, identity, wildcard)
+    - Size threshold and already-compressed media types
+    - Per-route opt-out with no_compression
+    - Streaming responses are compressed chunk by chunk
+    - ETags of compressed responses are weakened, also on their 304s
+"""
+
+import gzip
+import zlib
+
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.deps import no_compression
+from app.middleware import compression
+from app.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+LARGE = {"items": [{"id": i, "status": "IN_PROGRESS", "process": "P01"} for i in range(200)]}
+
+
+@pytest.fixture
+def raw_client() -> TestClient:
+    """App with a few representative routes behind the middleware."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    def large():
+        return LARGE
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/png")
+    def png():
+        return Response(content=b"\x89PNG" + bytes(4000), media_type="image/png")
+
+    @app.get("/opt-out", dependencies=[Depends(no_compression)])
+    def opt_out():
+        return LARGE
+
+    @app.get("/etag")
+    def etag(request: Request):
+        if '"abc"' in request.headers.get("if-none-match", "").replace("W/", ""):
+            return Response(status_code=304, headers={"ETag": '"abc"'})
+        return Response(content=b"x" * 2000, media_type="text/plain", headers={"ETag": '"abc"'})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((f"row {i}\n" * 50 for i in range(20)), media_type="text/csv")
+
+    return TestClient(app)
+
+
+def fetch_raw(client: TestClient, path: str, accept_encoding: str):
+    """GET without transparent decoding; returns (response, raw body)."""
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestNegotiation:
+    """Test content coding selection."""
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("", None),
+            ("identity", None),
+            ("gzip", "gzip"),
+            ("gzip;q=0", None),
+            ("deflate, gzip;q=0.5", "gzip"),
+            ("*", "br" if compression.brotli else "gzip"),
+        ],
+    )
+    def test_negotiate(self, header, expected):
+        assert negotiate_encoding(header) == expected
+
+    def test_prefers_brotli_when_available(self, monkeypatch):
+        monkeypatch.setattr(compression, "brotli", object())
+        assert negotiate_encoding("gzip, deflate, br") == "br"
+        assert negotiate_encoding("gzip, br;q=0.5") == "gzip"
+
+
+class TestCompressionMiddleware:
+    """Test which responses are compressed and how."""
+
+    def test_large_json_is_gzipped(self, raw_client):
+        response, body = fetch_raw(raw_client, "/large", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(body)
+        assert gzip.decompress(body) == raw_client.get("/large", headers={"Accept-Encoding": "identity"}).content
+        assert len(body) < len(gzip.decompress(body)) / 3
+
+    @pytest.mark.parametrize("path", ["/small", "/png", "/opt-out"])
+    def test_skipped(self, raw_client, path):
+        response, _ = fetch_raw(raw_client, path, "gzip")
+        assert "content-encoding" not in response.headers
+
+    def test_identity_client_gets_plain_body(self, raw_client):
+        response, body = fetch_raw(raw_client, "/large", "identity")
+        assert "content-encoding" not in response.headers
+        assert body.startswith(b'{"items"')
+
+    def test_streaming_response(self, raw_client):
+        response, body = fetch_raw(raw_client, "/stream", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        assert decoder.decompress(body).decode() == "".join(f"row {i}\n" * 50 for i in range(20))
+        assert decoder.eof
+
+    def test_etag_is_weakened(self, raw_client):
+        response, _ = fetch_raw(raw_client, "/etag", "gzip")
+        assert response.headers["etag"] == 'W/"abc"'
+
+        response, _ = fetch_raw(raw_client, "/etag", "identity")
+        assert response.headers["etag"] == '"abc"'
+
+    @pytest.mark.parametrize("held", ['W/"abc"', '"abc"'])
+    def test_not_modified_repeats_the_etag_the_client_holds(self, raw_client, held):
+        response = raw_client.get("/etag", headers={"Accept-Encoding": "gzip", "If-None-Match": held})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == held
+
+
+class TestApplicationCompression:
+    """Test the middleware as configured in app.main."""
+
+    def test_large_response_is_compressed(self, client, auth_headers_admin):
+        response = client.get(
+            "/api/v1/openapi.json", headers={**auth_headers_admin, "Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["info"]["title"]
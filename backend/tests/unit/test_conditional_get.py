@@ -0,0 +1,201 @@
+"""
+Unit tests for the conditional_get (ETag / 304) dependency.
+
+Tests:
+    - ETag and Cache-Control on polled GET endpoints
+    - 304 Not Modified until the tracked resource changes
+    - Authentication is checked before a 304 is sent
+    - Cached dashboard aggregates are dropped on change
+    - Changes committed by other API processes (shared resource_versions)
+    - Async endpoints revalidate on the async session, without a sync one
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_db
+from app.main import app
+from app.models import Lot, LotStatus, Process, ProductModel, WIPItem, WIPStatus
+
+
+@pytest.fixture
+def process(db: Session) -> Process:
+    process = Process(
+        process_code="P01",
+        process_name_ko="공정 1",
+        process_name_en="Process 1",
+        process_number=1,
+        process_type="MANUFACTURING",
+        sort_order=1,
+        is_active=True,
+    )
+    db.add(process)
+    db.commit()
+    return process
+
+
+def bump_in_other_process(db: Session, *resources: str) -> None:
+    """Change versions like a write committed by another API process."""
+    db.execute(
+        text("UPDATE resource_versions SET version = version + 1 WHERE resource IN :resources")
+        .bindparams(bindparam("resources", expanding=True)),
+        {"resources": list(resources)},
+    )
+    db.commit()
+
+
+def add_in_progress_wip(db: Session, process: Process) -> None:
+    """Helper to add one IN_PROGRESS WIP item at a process."""
+    lot = db.query(Lot).first()
+    if lot is None:
+        product_model = ProductModel(
+            model_code="PSA", model_name="Test Model", category="Test",
+            status="ACTIVE", specifications={},
+        )
+        db.add(product_model)
+        db.flush()
+        lot = Lot(
+            lot_number="WF-KR-251125D-001",
+            product_model_id=product_model.id,
+            production_date=date(2025, 11, 25),
+            target_quantity=10,
+            status=LotStatus.IN_PROGRESS.value,
+        )
+        db.add(lot)
+        db.flush()
+
+    sequence = db.query(WIPItem).filter_by(lot_id=lot.id).count() + 1
+    db.add(WIPItem(
+        wip_id=f"WIP-{lot.lot_number}-{sequence:03d}",
+        lot_id=lot.id,
+        sequence_in_lot=sequence,
+        status=WIPStatus.IN_PROGRESS.value,
+        current_process_id=process.id,
+    ))
+    db.commit()
+
+
+class TestConditionalGet:
+    """Test ETag revalidation on list endpoints."""
+
+    def test_not_modified_until_resource_changes(
+        self, client, db: Session, process, auth_headers_admin
+    ):
+        url = "/api/v1/processes/"
+        first = client.get(url, headers=auth_headers_admin)
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == "private, no-cache"
+        etag = first.headers["ETag"]
+
+        cached = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+
+        paged = client.get(
+            url, params={"limit": 5},
+            headers={**auth_headers_admin, "If-None-Match": etag},
+        )
+        assert paged.status_code == 200
+        assert paged.headers["ETag"] != etag
+
+        process.process_name_en = "Renamed"
+        db.commit()
+        changed = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()[0]["process_name_en"] == "Renamed"
+
+    def test_unrelated_change_keeps_etag(self, client, db: Session, process, auth_headers_admin):
+        url = "/api/v1/equipment/"
+        etag = client.get(url, headers=auth_headers_admin).headers["ETag"]
+
+        process.process_name_en = "Renamed"
+        db.commit()
+
+        cached = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert cached.status_code == 304
+
+    def test_change_in_other_process(self, client, db: Session, process, auth_headers_admin):
+        url = "/api/v1/processes/"
+        etag = client.get(url, headers=auth_headers_admin).headers["ETag"]
+
+        bump_in_other_process(db, "processes")
+
+        changed = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+    def test_authentication_checked_before_not_modified(self, client, process, auth_headers_admin):
+        url = "/api/v1/processes/"
+        etag = client.get(url, headers=auth_headers_admin).headers["ETag"]
+
+        anonymous = client.get(url, headers={"If-None-Match": etag})
+        assert anonymous.status_code == 401
+
+    def test_public_endpoint(self, client, process):
+        url = "/api/v1/processes/active"
+        etag = client.get(url).headers["ETag"]
+
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+
+class TestAsyncConditionalGet:
+    """Test ETag revalidation on async endpoints."""
+
+    def test_sequence_list_uses_only_the_async_session(self, client, db: Session, auth_headers_admin):
+        def no_sync_session():
+            raise AssertionError("sync session requested by an async endpoint")
+            yield
+
+        db.execute(text("INSERT INTO resource_versions (resource, version) VALUES ('sequences', 1)"))
+        db.commit()
+        app.dependency_overrides[get_db] = no_sync_session
+        url = "/api/v1/sequences"
+        first = client.get(url, headers=auth_headers_admin)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        cached = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert cached.status_code == 304
+
+        bump_in_other_process(db, "sequences")
+        changed = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert changed.status_code == 200
+
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 401
+
+
+class TestDashboardConditionalGet:
+    """Test dashboard ETags stay consistent with its in-memory cache."""
+
+    def test_change_invalidates_cached_aggregate(
+        self, client, db: Session, process, auth_headers_admin
+    ):
+        url = "/api/v1/dashboard/process-wip"
+        first = client.get(url, headers=auth_headers_admin)
+        assert first.json()["total_wip"] == 0
+        etag = first.headers["ETag"]
+
+        add_in_progress_wip(db, process)
+
+        changed = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["total_wip"] == 1
+
+    def test_change_in_other_process_invalidates_cached_aggregate(
+        self, client, db: Session, process, auth_headers_admin
+    ):
+        url = "/api/v1/dashboard/process-wip"
+        add_in_progress_wip(db, process)
+        etag = client.get(url, headers=auth_headers_admin).headers["ETag"]
+
+        # Another process adds a WIP item; this process's cache still has 1
+        db.execute(text("UPDATE wip_items SET status = 'CREATED'"))
+        bump_in_other_process(db, "wip_items")
+
+        changed = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["total_wip"] == 0
@@ -0,0 +1,147 @@
+"""
+Unit tests for ProcessHeader CRUD counters, statistics and slot claims.
+
+Tests:
+    - Atomic counter increments (no lost updates under concurrency)
+    - Grouped statistics
+    - Atomic lowest-free-slot claims
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.crud import process_header as header_crud
+from app.models import Process
+from app.models.process_header import HeaderStatus, ProcessHeader
+from app.schemas.process_header import ProcessHeaderOpen
+from tests.conftest import TestSessionLocal
+
+WORKERS = 12
+
+
+def run_concurrently(task, count: int) -> list:
+    """Run task(session, i) for i in range(count), each in its own session/thread."""
+    def run(i):
+        session = TestSessionLocal()
+        try:
+            return task(session, i)
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        return list(pool.map(run, range(count)))
+
+
+@pytest.fixture
+def process(db: Session) -> Process:
+    process = Process(
+        process_code="P01",
+        process_name_ko="공정 1",
+        process_name_en="Process 1",
+        process_number=1,
+        process_type="MANUFACTURING",
+        sort_order=1,
+        is_active=True,
+    )
+    db.add(process)
+    db.commit()
+    return process
+
+
+def open_header(db: Session, process: Process, batch_id: str, station_id: str = "ST-01"):
+    return header_crud.open_or_get(
+        db, ProcessHeaderOpen(station_id=station_id, batch_id=batch_id, process_id=process.id)
+    )
+
+
+class TestCounters:
+    """Test atomic header counters."""
+
+    def test_concurrent_increments_are_not_lost(self, db: Session, process):
+        header, _ = open_header(db, process, "B1")
+        header_id = header.id
+        results = ["PASS", "FAIL", "REWORK", "PASS"] * 15
+
+        run_concurrently(
+            lambda session, i: header_crud.increment_counts(session, header_id, results[i]),
+            len(results),
+        )
+
+        db.refresh(header)
+        assert (header.total_count, header.pass_count, header.fail_count) == (60, 30, 15)
+
+    def test_increment_missing_header(self, db: Session):
+        assert header_crud.increment_counts(db, 999999, "PASS") is None
+
+
+class TestStats:
+    """Test grouped header statistics."""
+
+    def test_stats(self, db: Session, process):
+        first, _ = open_header(db, process, "B1", station_id="ST-01")
+        second, _ = open_header(db, process, "B2", station_id="ST-02")
+        third, _ = open_header(db, process, "B3", station_id="ST-02")
+        header_crud.add_counts(db, first.id, total=4, passed=3, failed=1)
+        header_crud.add_counts(db, second.id, total=6, passed=6)
+        header_crud.close(db, second.id)
+        header_crud.cancel(db, third.id)
+
+        stats = header_crud.get_stats(db)
+
+        assert stats["total_headers"] == 3
+        assert (stats["open_headers"], stats["closed_headers"], stats["cancelled_headers"]) == (1, 1, 1)
+        assert (stats["total_items_processed"], stats["total_pass"], stats["total_fail"]) == (10, 9, 1)
+        assert stats["overall_pass_rate"] == 90.0
+        assert stats["by_station"]["ST-02"] == {
+            "total_headers": 2, "total_items": 6, "pass_count": 6, "fail_count": 0, "pass_rate": 100.0,
+        }
+        assert stats["by_process"][process.id]["total_headers"] == 3
+
+        filtered = header_crud.get_stats(db, station_id="ST-01")
+        assert filtered["total_headers"] == 1
+        assert filtered["overall_pass_rate"] == 75.0
+
+    def test_empty_stats(self, db: Session):
+        stats = header_crud.get_stats(db)
+
+        assert stats["total_headers"] == 0
+        assert stats["total_items_processed"] == 0
+        assert stats["overall_pass_rate"] == 0.0
+        assert stats["by_station"] == {}
+
+
+class TestSlots:
+    """Test lowest-free-slot claims."""
+
+    def test_claims_lowest_free_slot(self, db: Session, process):
+        first, created = open_header(db, process, "B1")
+        second, _ = open_header(db, process, "B2")
+        assert created
+        assert (first.slot_id, second.slot_id) == (1, 2)
+
+        again, created = open_header(db, process, "B1")
+        assert again.id == first.id and not created
+
+        header_crud.close(db, first.id)
+        assert header_crud.get_available_slot(db, "ST-01") == 1
+        assert open_header(db, process, "B3")[0].slot_id == 1
+
+    def test_concurrent_claims_get_distinct_slots(self, db: Session, process):
+        process_id = process.id
+        headers = run_concurrently(
+            lambda session, i: header_crud.open_or_get(
+                session,
+                ProcessHeaderOpen(station_id="ST-01", batch_id=f"B{i}", process_id=process_id),
+            )[0].slot_id,
+            12,
+        )
+
+        assert sorted(headers) == list(range(1, 13))
+        with pytest.raises(ValueError):
+            open_header(db, process, "B13")
+        assert header_crud.get_available_slot(db, "ST-01") is None
+        assert db.query(ProcessHeader).filter(
+            ProcessHeader.status == HeaderStatus.OPEN.value
+        ).count() == 12
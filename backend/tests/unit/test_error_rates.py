@@ -0,0 +1,151 @@
+"""
+Unit tests for the rolling error rate aggregator and the hourly error summary.
+
+Tests:
+    - Per-minute counts and the fixed-size ring
+    - Flushes write only new counts, summed per hour
+    - Flushes of several processes add up in error_log_hourly
+    - Failed flushes keep their counts pending
+    - Error statistics read the hourly summary
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.error_rates import UNMATCHED_PATH, ErrorRateAggregator, error_rates
+from app.crud import error_log as error_log_crud
+from app.models import ErrorLogHourly
+
+LOT = "/api/v1/lots/{lot_id}"
+# 10:15 UTC, so minutes up to 10:59 fall into the same hour
+AT = datetime(2026, 1, 17, 10, 15, tzinfo=timezone.utc).timestamp()
+HOUR = datetime(2026, 1, 17, 10, tzinfo=timezone.utc)
+
+
+def aggregator(window_minutes: int = 120) -> ErrorRateAggregator:
+    return ErrorRateAggregator(window_minutes=window_minutes, flush_interval=60.0)
+
+
+def hourly_rows(db: Session) -> dict:
+    rows = db.execute(select(ErrorLogHourly)).scalars().all()
+    return {
+        (row.hour.replace(tzinfo=timezone.utc), row.error_code, row.path, row.method, row.status_code): row.count
+        for row in rows
+    }
+
+
+class TestRecord:
+    """Test per-minute counting."""
+
+    def test_counts_by_key(self):
+        rates = aggregator()
+        for minute in range(3):
+            rates.record("RES_002", LOT, "GET", 404, at=AT + minute * 60)
+        rates.record("VAL_001", LOT, "PUT", 422, at=AT)
+
+        assert rates.counts(AT, AT + 3 * 60) == {
+            ("RES_002", LOT, "GET", 404): 3,
+            ("VAL_001", LOT, "PUT", 422): 1,
+        }
+        assert rates.counts(AT + 60, AT + 2 * 60) == {("RES_002", LOT, "GET", 404): 1}
+
+    def test_ring_reuses_slots_after_the_window(self):
+        rates = aggregator(window_minutes=60)
+        rates.record("RES_002", LOT, "GET", 404, at=AT)
+
+        rates.record("RES_002", LOT, "GET", 404, at=AT + 60 * 60)
+        rates.record("RES_002", LOT, "GET", 404, at=AT - 60)
+
+        assert rates.counts(AT - 3600, AT + 2 * 3600) == {("RES_002", LOT, "GET", 404): 1}
+
+    def test_minimum_window(self):
+        with pytest.raises(ValueError):
+            aggregator(window_minutes=59)
+
+
+class TestFlush:
+    """Test flushing to error_log_hourly."""
+
+    def test_sums_minutes_per_hour(self, db: Session):
+        rates = aggregator()
+        rates.record("RES_002", LOT, "GET", 404, at=AT)
+        rates.record("RES_002", LOT, "GET", 404, at=AT + 60)
+        rates.record("RES_002", LOT, "GET", 404, at=AT + 50 * 60)
+        rates.record("SRV_001", UNMATCHED_PATH, "POST", 500, at=AT)
+
+        assert rates.flush(db) == 4
+        assert hourly_rows(db) == {
+            (HOUR, "RES_002", LOT, "GET", 404): 2,
+            (HOUR + timedelta(hours=1), "RES_002", LOT, "GET", 404): 1,
+            (HOUR, "SRV_001", UNMATCHED_PATH, "POST", 500): 1,
+        }
+
+    def test_only_new_counts_are_written(self, db: Session):
+        rates = aggregator()
+        rates.record("RES_002", LOT, "GET", 404, at=AT)
+        rates.flush(db)
+
+        rates.record("RES_002", LOT, "GET", 404, at=AT)
+        assert rates.flush(db) == 1
+        assert rates.flush(db) == 0
+
+        assert hourly_rows(db) == {(HOUR, "RES_002", LOT, "GET", 404): 2}
+
+    def test_processes_add_up(self, db: Session):
+        workers = [aggregator(), aggregator()]
+        for count, rates in enumerate(workers, start=1):
+            for _ in range(count):
+                rates.record("RES_002", LOT, "GET", 404, at=AT)
+            rates.flush(db)
+
+        assert hourly_rows(db) == {(HOUR, "RES_002", LOT, "GET", 404): 3}
+
+    def test_failed_flush_keeps_counts(self, db: Session, monkeypatch):
+        rates = aggregator()
+        rates.record("RES_002", LOT, "GET", 404, at=AT)
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(error_log_crud, "add_hourly_counts", fail)
+        with pytest.raises(RuntimeError):
+            rates.flush(db)
+        monkeypatch.undo()
+
+        assert rates.flush(db) == 1
+        assert hourly_rows(db) == {(HOUR, "RES_002", LOT, "GET", 404): 1}
+
+
+class TestStats:
+    """Test error statistics from the hourly summary."""
+
+    @pytest.fixture(autouse=True)
+    def clean_rates(self):
+        error_rates.reset()
+        yield
+        error_rates.reset()
+
+    def test_stats_endpoint(self, client, auth_headers_admin, db: Session):
+        now = datetime.now(timezone.utc).timestamp()
+        for _ in range(3):
+            error_rates.record("RES_002", LOT, "GET", 404, at=now)
+        error_rates.record("VAL_001", LOT, "PUT", 422, at=now)
+        error_rates.record("RES_002", LOT, "GET", 404, at=now - 30 * 3600)
+
+        response = client.get("/api/v1/error-logs/stats", params={"hours": 24}, headers=auth_headers_admin)
+
+        assert response.status_code == 200, response.text
+        stats = response.json()
+        assert stats["total_errors"] == 4
+        assert [(item["error_code"], item["count"]) for item in stats["by_error_code"]] == [
+            ("RES_002", 3), ("VAL_001", 1),
+        ]
+        assert [item["count"] for item in stats["by_hour"]] == [4]
+        assert stats["top_paths"][0] == {"path": LOT, "method": "GET", "count": 3}
+
+        stats = error_log_crud.get_stats(db, hours=48)
+        assert stats["total_errors"] == 5
+        assert len(stats["by_hour"]) == 2
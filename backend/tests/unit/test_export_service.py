@@ -0,0 +1,336 @@
+"""
+Unit tests for the streaming process data export.
+
+Tests:
+    - Measurement flattening and CSV / NDJSON / Parquet encoding
+    - Filters and the WIP process history source
+    - Constant memory while streaming
+    - Background export jobs with progress and Range downloads
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import Lot, LotStatus, ProductModel, WIPItem, WIPStatus
+from app.models.equipment import Equipment
+from app.models.job import ProcessJob
+from app.models.process import Process
+from app.models.process_data import ProcessData
+from app.models.user import User
+from app.models.wip_process_history import WIPProcessHistory
+from app.services import export_service as export_module
+from app.services.export_service import ExportQuery, ExportService, flatten_measurements
+from tests.conftest import TestSessionLocal
+
+STARTED = datetime(2025, 11, 1, 8, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def service(tmp_path) -> ExportService:
+    return ExportService(export_dir=str(tmp_path))
+
+
+@pytest.fixture
+def seed(db: Session):
+    """LOT with two processes, an operator and equipment; returns an insert helper."""
+    product_model = ProductModel(
+        model_code="PSA", model_name="Export Model", category="Test",
+        status="ACTIVE", specifications={},
+    )
+    operator = User(
+        username="exporter", email="exporter@example.com", password_hash="x",
+        full_name="Export Operator", role="OPERATOR", is_active=True,
+    )
+    equipment = Equipment(
+        equipment_code="EQ-01", equipment_name="Tester", equipment_type="TESTER",
+        status="AVAILABLE", is_active=True,
+    )
+    processes = [
+        Process(
+            process_number=number, process_code=f"P{number:02d}",
+            process_name_ko=f"공정 {number}", process_name_en=f"Process {number}",
+            process_type="MANUFACTURING", sort_order=number, quality_criteria={},
+        )
+        for number in (1, 2)
+    ]
+    db.add_all([product_model, operator, equipment, *processes])
+    db.flush()
+    lot = Lot(
+        lot_number="KR01PSA251101", product_model_id=product_model.id,
+        production_date=date(2025, 11, 1), target_quantity=100,
+        status=LotStatus.IN_PROGRESS,
+    )
+    db.add(lot)
+    db.commit()
+
+    def insert_rows(count: int) -> None:
+        db.execute(insert(ProcessData).execution_options(render_nulls=True), [
+            {
+                "lot_id": lot.id,
+                "process_id": processes[i % 2].id,
+                "operator_id": operator.id,
+                "equipment_id": equipment.id if i % 2 else None,
+                "data_level": "LOT",
+                "result": "PASS",
+                # Both stored measurement formats
+                "measurements": (
+                    {"voltage": {"value": i * 0.5, "unit": "V"}, "temp": 20 + i}
+                    if i % 2 else
+                    {"items": [{"code": "voltage", "value": i * 0.5}, {"code": "current", "value": 1.5}]}
+                ),
+                "defects": None,
+                "started_at": STARTED + timedelta(seconds=i),
+                "completed_at": STARTED + timedelta(seconds=i + 30),
+                "duration_seconds": 30,
+            }
+            for i in range(count)
+        ])
+        db.commit()
+
+    insert_rows.lot = lot
+    insert_rows.processes = processes
+    insert_rows.operator = operator
+    return insert_rows
+
+
+def read_csv(data: bytes):
+    return list(csv.DictReader(io.StringIO(data.decode())))
+
+
+class TestEncoding:
+    """Test row flattening and output formats."""
+
+    def test_flatten_measurements(self):
+        assert flatten_measurements(None) == {}
+        assert flatten_measurements({"items": [{"code": "V", "value": 1.0}]}) == {"V": 1.0}
+        assert flatten_measurements({"V": {"value": 2.0, "unit": "V"}, "T": 3}) == {"V": 2.0, "T": 3}
+
+    def test_csv_flattens_measurements(self, db, seed, service):
+        seed(4)
+        rows = read_csv(b"".join(service.stream(db, ExportQuery(), "csv", compress=False)))
+
+        assert len(rows) == 4
+        assert list(rows[0])[-3:] == ["m.voltage", "m.current", "m.temp"]
+        assert rows[0]["process_code"] == "P01"
+        assert rows[0]["lot_number"] == "KR01PSA251101"
+        assert rows[0]["m.current"] == "1.5"
+        assert rows[1]["operator"] == "exporter"
+        assert rows[1]["equipment_code"] == "EQ-01"
+        assert rows[1]["m.voltage"] == "0.5"
+        assert rows[1]["m.temp"] == "21"
+        assert rows[1]["m.current"] == ""
+
+    def test_gzip_ndjson_round_trip(self, db, seed, service):
+        seed(6)
+        data = b"".join(service.stream(db, ExportQuery(), "ndjson", compress=True))
+        records = [json.loads(line) for line in gzip.decompress(data).splitlines()]
+
+        assert [record["id"] for record in records] == sorted(record["id"] for record in records)
+        assert records[0]["started_at"] == "2025-11-01T08:00:00Z"
+        assert records[5]["m.voltage"] == 2.5
+        assert service.media_type("ndjson", True) == "application/gzip"
+        assert service.filename(ExportQuery(start_date=STARTED), "ndjson", True) == "process_data_20251101.ndjson.gz"
+
+    def test_filters(self, db, seed, service):
+        seed(10)
+        query = ExportQuery(
+            process_id=seed.processes[1].id,
+            start_date=STARTED + timedelta(seconds=2),
+            end_date=STARTED + timedelta(seconds=7),
+        )
+        rows = read_csv(b"".join(service.stream(db, query, "csv", compress=False)))
+
+        assert service.count(db, query) == 3
+        assert [row["m.voltage"] for row in rows] == ["1.5", "2.5", "3.5"]
+
+    def test_wip_history_source(self, db, seed, service):
+        wip = WIPItem(
+            wip_id="WIP-KR01PSA251101-001", lot_id=seed.lot.id, sequence_in_lot=1,
+            status=WIPStatus.IN_PROGRESS.value,
+        )
+        db.add(wip)
+        db.flush()
+        db.add(WIPProcessHistory(
+            wip_item_id=wip.id, process_id=seed.processes[0].id, operator_id=seed.operator.id,
+            result="PASS", measurements={"voltage": 3.3}, started_at=STARTED,
+        ))
+        db.commit()
+
+        rows = read_csv(b"".join(service.stream(db, ExportQuery(source="wip_history"), "csv", compress=False)))
+
+        assert len(rows) == 1
+        assert rows[0]["wip_id"] == "WIP-KR01PSA251101-001"
+        assert rows[0]["data_level"] == "WIP"
+        assert rows[0]["m.voltage"] == "3.3"
+
+    def test_invalid_arguments(self, db, service):
+        with pytest.raises(ValueError):
+            ExportQuery(source="lots")
+        with pytest.raises(ValueError):
+            ExportQuery(start_date=STARTED, end_date=STARTED - timedelta(days=1))
+        with pytest.raises(ValueError):
+            service.stream(db, ExportQuery(), "xlsx")
+
+    def test_parquet_row_groups(self, db, seed, service, monkeypatch):
+        pq = pytest.importorskip("pyarrow.parquet")
+        monkeypatch.setattr(export_module, "BATCH_SIZE", 4)
+        seed(10)
+        data = b"".join(service.stream(db, ExportQuery(), "parquet"))
+        parquet = pq.ParquetFile(io.BytesIO(data))
+
+        assert parquet.metadata.num_rows == 10
+        assert parquet.metadata.num_row_groups == 3
+        assert parquet.read().column("m.voltage").to_pylist()[1] == 0.5
+
+    def test_memory_is_constant(self, db, seed, service, monkeypatch):
+        monkeypatch.setattr(export_module, "BATCH_SIZE", 200)
+
+        def peak(rows: int) -> int:
+            db.execute(ProcessData.__table__.delete())
+            db.commit()
+            seed(rows)
+            tracemalloc.start()
+            try:
+                for _ in service.stream(db, ExportQuery(), "csv", compress=True):
+                    pass
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small, large = peak(1000), peak(10000)
+        assert large < small * 1.5, f"peak {large} bytes for 10x the rows of {small} bytes"
+
+
+@pytest.fixture
+def queued_job(db, seed, service):
+    """A DATA_EXPORT job for 10 rows, queued with a mocked Celery task."""
+    seed(10)
+    seen_by_worker = []
+
+    def dispatch(kwargs, task_id):
+        with TestSessionLocal() as worker:
+            seen_by_worker.append(worker.get(ProcessJob, kwargs["job_id"]))
+
+    with patch("app.tasks.process_tasks.export_process_data") as task:
+        task.apply_async.side_effect = dispatch
+        job = service.queue_job(db, ExportQuery(), "csv", compress=True)
+    task.apply_async.assert_called_once_with(kwargs={"job_id": job.id}, task_id=job.task_id)
+    # Committed before dispatch, so a worker can load it as soon as the task is sent
+    assert seen_by_worker[0] is not None
+    return job
+
+
+class TestExportJobs:
+    """Test background export jobs and downloads."""
+
+    def test_run_job(self, db, queued_job, service, monkeypatch):
+        monkeypatch.setattr(export_module, "BATCH_SIZE", 3)
+        monkeypatch.setattr(export_module, "_PROGRESS_EVERY", 3)
+        progress = []
+
+        result = service.run_job(TestSessionLocal, queued_job.id, on_progress=progress.append)
+
+        assert [state["rows"] for state in progress] == [3, 6, 9, 10]
+        assert result["rows"] == 10
+        assert result["filename"] == "process_data.csv.gz"
+        with open(service.job_path(queued_job), "rb") as file:
+            assert len(read_csv(gzip.decompress(file.read()))) == 10
+        assert not os.path.exists(f"{service.job_path(queued_job)}.part")
+
+        db.expire_all()
+        job = db.get(ProcessJob, queued_job.id)
+        assert job.task_id == queued_job.task_id
+        assert job.status == "COMPLETED"
+        assert job.result["progress"] == 100
+
+    def test_failed_job(self, db, queued_job, service, monkeypatch):
+        def fail(*args, **kwargs):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(service, "stream", fail)
+        with pytest.raises(RuntimeError):
+            service.run_job(TestSessionLocal, queued_job.id)
+
+        db.expire_all()
+        job = db.get(ProcessJob, queued_job.id)
+        assert job.status == "FAILED"
+        assert job.error_message == "disk full"
+
+    def test_missing_job(self, service):
+        with pytest.raises(ValueError, match="Export job 999999 not found"):
+            service.run_job(TestSessionLocal, 999999)
+
+    def test_dispatch_failure_fails_job(self, db, seed, service):
+        seed(1)
+        with patch("app.tasks.process_tasks.export_process_data") as task:
+            task.apply_async.side_effect = ConnectionError("broker down")
+            with pytest.raises(ConnectionError):
+                service.queue_job(db, ExportQuery(), "csv")
+
+        job = db.query(ProcessJob).one()
+        assert job.status == "FAILED"
+        assert job.error_message == "Dispatch failed: broker down"
+
+    def test_download_supports_range(self, client, db, queued_job, service, auth_headers_admin, monkeypatch):
+        monkeypatch.setattr(export_module.export_service, "export_dir", service.export_dir)
+        url = f"/api/v1/async/exports/{queued_job.id}/download"
+
+        assert client.get(url, headers=auth_headers_admin).status_code == 409
+        service.run_job(TestSessionLocal, queued_job.id)
+
+        full = client.get(url, headers=auth_headers_admin)
+        assert full.status_code == 200
+        assert full.headers["content-type"] == "application/gzip"
+        assert full.headers["accept-ranges"] == "bytes"
+
+        partial = client.get(url, headers={**auth_headers_admin, "Range": "bytes=10-"})
+        assert partial.status_code == 206
+        assert partial.content == full.content[10:]
+
+        status = client.get(f"/api/v1/async/jobs/{queued_job.id}", headers=auth_headers_admin)
+        assert status.json()["status"] == "COMPLETED"
+
+
+class TestExportEndpoint:
+    """Test the streamed / queued process data export endpoint."""
+
+    def test_small_export_streams(self, client, seed, auth_headers_admin):
+        seed(5)
+        response = client.get(
+            "/api/v1/process-data/export", params={"gzip": False}, headers=auth_headers_admin
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="process_data.csv"' in response.headers["content-disposition"]
+        assert len(read_csv(response.content)) == 5
+
+    def test_large_export_is_queued(self, client, db, seed, auth_headers_admin, monkeypatch):
+        monkeypatch.setattr(settings, "EXPORT_STREAM_MAX_ROWS", 3)
+        seed(5)
+        with patch("app.tasks.process_tasks.export_process_data") as task:
+            response = client.get(
+                "/api/v1/process-data/export", params={"format": "ndjson"}, headers=auth_headers_admin
+            )
+
+        assert response.status_code == 202
+        job = db.get(ProcessJob, response.json()["job_id"])
+        task.apply_async.assert_called_once_with(kwargs={"job_id": job.id}, task_id=job.task_id)
+        assert job.params["format"] == "ndjson"
+
+    def test_invalid_format(self, client, seed, auth_headers_admin):
+        response = client.get(
+            "/api/v1/process-data/export", params={"format": "xlsx"}, headers=auth_headers_admin
+        )
+        assert response.status_code == 400
@@ -0,0 +1,267 @@
+"""
+Unit tests for the GitHub fetch engine.
+
+Runs the fetcher against a local HTTP stand-in for the GitHub API that
+serves commits (with ETags), zipball archives, the contents API and raw
+file downloads.
+"""
+
+import io
+import json
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.services.git_fetcher import FolderZipCache, GitFetchError, GitHubFetcher
+
+
+COMMIT_SHA = "a" * 40
+
+REPO_FILES = {
+    "README.md": b"# repo",
+    "sequences/psa_test/manifest.yaml": b"name: psa_test\nversion: 1.0.0\n",
+    "sequences/psa_test/main.py": b"print('main')\n",
+    "sequences/psa_test/lib/helpers.py": b"def helper():\n    pass\n",
+    "sequences/other/manifest.yaml": b"name: other\n",
+}
+
+
+class GitHubStandIn:
+    """Minimal GitHub API stand-in running on a background thread."""
+
+    def __init__(self, archive_enabled: bool = True):
+        self.archive_enabled = archive_enabled
+        self.requests = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stand_in.requests.append(self.path)
+                stand_in.handle(self)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def count(self, fragment: str) -> int:
+        return sum(1 for path in self.requests if fragment in path)
+
+    def _send(self, handler, status, body=b"", headers=None):
+        handler.send_response(status)
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _send_json(self, handler, payload, headers=None):
+        self._send(
+            handler, 200, json.dumps(payload).encode(),
+            {"Content-Type": "application/json", **(headers or {})},
+        )
+
+    def _zipball(self) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("owner-repo-aaaaaaa/", b"")
+            for path, content in REPO_FILES.items():
+                zf.writestr(f"owner-repo-aaaaaaa/{path}", content)
+        return buffer.getvalue()
+
+    def _contents(self, path: str):
+        prefix = f"{path}/" if path else ""
+        entries = {}
+        for file_path in REPO_FILES:
+            if not file_path.startswith(prefix):
+                continue
+            head = file_path[len(prefix):].split("/", 1)
+            item_path = f"{prefix}{head[0]}"
+            if len(head) == 1:
+                entries[item_path] = {
+                    "name": head[0], "path": item_path, "type": "file",
+                    "download_url": f"{self.base_url}/raw/{item_path}",
+                }
+            else:
+                entries[item_path] = {"name": head[0], "path": item_path, "type": "dir"}
+        return list(entries.values())
+
+    def handle(self, handler):
+        parsed = urlparse(handler.path)
+        path = parsed.path
+
+        if path == "/repos/owner/repo/commits/main":
+            etag = f'"{COMMIT_SHA}"'
+            if handler.headers.get("If-None-Match") == etag:
+                return self._send(handler, 304)
+            return self._send_json(
+                handler,
+                {"sha": COMMIT_SHA, "commit": {"message": "init"}},
+                {"ETag": etag},
+            )
+
+        if path.startswith("/repos/owner/repo/zipball/"):
+            if not self.archive_enabled:
+                return self._send(handler, 404)
+            return self._send(
+                handler, 200, self._zipball(), {"Content-Type": "application/zip"}
+            )
+
+        if path.startswith("/repos/owner/repo/contents"):
+            assert parse_qs(parsed.query).get("ref")
+            folder = path[len("/repos/owner/repo/contents"):].strip("/")
+            contents = self._contents(folder)
+            if not contents:
+                return self._send(handler, 404)
+            return self._send_json(handler, contents, {"ETag": f'"{folder}"'})
+
+        if path.startswith("/raw/"):
+            content = REPO_FILES.get(path[len("/raw/"):])
+            if content is None:
+                return self._send(handler, 404)
+            return self._send(handler, 200, content)
+
+        return self._send(handler, 404)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _zip_names(zip_data: bytes) -> dict:
+    with zipfile.ZipFile(io.BytesIO(zip_data)) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+@pytest.fixture
+def stand_in():
+    with GitHubStandIn() as server:
+        yield server
+
+
+@pytest.fixture
+def stand_in_without_archive():
+    with GitHubStandIn(archive_enabled=False) as server:
+        yield server
+
+
+class TestArchiveDownload:
+    """Folder download through the zipball endpoint."""
+
+    async def test_extracts_folder_relative_to_path(self, stand_in):
+        async with GitHubFetcher(api_url=stand_in.base_url, cache=FolderZipCache()) as fetcher:
+            zip_data = await fetcher.download_folder_as_zip(
+                "owner", "repo", COMMIT_SHA, "sequences/psa_test"
+            )
+
+        files = _zip_names(zip_data)
+        assert files == {
+            "manifest.yaml": REPO_FILES["sequences/psa_test/manifest.yaml"],
+            "main.py": REPO_FILES["sequences/psa_test/main.py"],
+            "lib/helpers.py": REPO_FILES["sequences/psa_test/lib/helpers.py"],
+        }
+        assert stand_in.count("/contents") == 0
+
+    async def test_archive_downloaded_once_per_commit(self, stand_in):
+        async with GitHubFetcher(api_url=stand_in.base_url, cache=FolderZipCache()) as fetcher:
+            await fetcher.download_folder_as_zip("owner", "repo", COMMIT_SHA, "sequences/psa_test")
+            await fetcher.download_folder_as_zip("owner", "repo", COMMIT_SHA, "sequences/other")
+
+        assert stand_in.count("/zipball/") == 1
+
+    async def test_commit_results_cached_across_fetchers(self, stand_in):
+        cache = FolderZipCache()
+        async with GitHubFetcher(api_url=stand_in.base_url, cache=cache) as fetcher:
+            first = await fetcher.download_folder_as_zip("owner", "repo", COMMIT_SHA, "sequences/other")
+        async with GitHubFetcher(api_url=stand_in.base_url, cache=cache) as fetcher:
+            second = await fetcher.download_folder_as_zip("owner", "repo", COMMIT_SHA, "sequences/other")
+
+        assert first == second
+        assert stand_in.count("/zipball/") == 1
+
+    async def test_branch_refs_not_cached(self, stand_in):
+        cache = FolderZipCache()
+        async with GitHubFetcher(api_url=stand_in.base_url, cache=cache) as fetcher:
+            await fetcher.download_folder_as_zip("owner", "repo", "main", "sequences/other")
+            await fetcher.download_folder_as_zip("owner", "repo", "main", "sequences/other")
+
+        assert stand_in.count("/zipball/") == 2
+
+    async def test_missing_folder_raises_not_found(self, stand_in):
+        async with GitHubFetcher(api_url=stand_in.base_url, cache=FolderZipCache()) as fetcher:
+            with pytest.raises(GitFetchError, match="Path not found: missing") as exc_info:
+                await fetcher.download_folder_as_zip("owner", "repo", COMMIT_SHA, "missing")
+
+        assert exc_info.value.status_code == 404
+        assert stand_in.count("/contents") == 0
+
+
+class TestContentsFallback:
+    """Folder download through the contents API when archives fail."""
+
+    async def test_falls_back_to_contents_api(self, stand_in_without_archive):
+        server = stand_in_without_archive
+        async with GitHubFetcher(
+            api_url=server.base_url, cache=FolderZipCache(), max_concurrency=2
+        ) as fetcher:
+            zip_data = await fetcher.download_folder_as_zip(
+                "owner", "repo", COMMIT_SHA, "sequences/psa_test"
+            )
+
+        assert set(_zip_names(zip_data)) == {"manifest.yaml", "main.py", "lib/helpers.py"}
+        assert server.count("/raw/") == 3
+
+    async def test_missing_path_raises_not_found(self, stand_in_without_archive):
+        server = stand_in_without_archive
+        async with GitHubFetcher(api_url=server.base_url, cache=FolderZipCache()) as fetcher:
+            with pytest.raises(GitFetchError) as exc_info:
+                await fetcher.download_folder_as_zip("owner", "repo", COMMIT_SHA, "missing")
+
+        assert exc_info.value.status_code == 404
+
+
+class TestConditionalRequests:
+    """ETag revalidation for metadata lookups."""
+
+    async def test_latest_commit_revalidates_with_etag(self, stand_in):
+        async with GitHubFetcher(api_url=stand_in.base_url) as fetcher:
+            first = await fetcher.get_latest_commit("owner", "repo", "main")
+            second = await fetcher.get_latest_commit("owner", "repo", "main")
+
+        assert first.sha == second.sha == COMMIT_SHA
+        assert first.not_modified is False
+        assert second.not_modified is True
+        assert second.data["commit"]["message"] == "init"
+
+    async def test_unknown_branch_raises(self, stand_in):
+        async with GitHubFetcher(api_url=stand_in.base_url) as fetcher:
+            with pytest.raises(GitFetchError, match="Branch 'dev' not found"):
+                await fetcher.get_latest_commit("owner", "repo", "dev")
+
+    async def test_list_folder_missing_path_is_empty(self, stand_in):
+        async with GitHubFetcher(api_url=stand_in.base_url) as fetcher:
+            assert await fetcher.list_folder("owner", "repo", COMMIT_SHA, "missing") == []
+            names = [item["name"] for item in await fetcher.list_folder(
+                "owner", "repo", COMMIT_SHA, "sequences"
+            )]
+
+        assert sorted(names) == ["other", "psa_test"]
+
+    async def test_validators_are_bounded(self, stand_in):
+        async with GitHubFetcher(api_url=stand_in.base_url, max_validators=2) as fetcher:
+            for folder in ["sequences", "sequences/psa_test", "sequences", "sequences/other"]:
+                await fetcher.list_folder("owner", "repo", COMMIT_SHA, folder)
+
+        # Least recently used validator (psa_test) was evicted
+        assert [urlparse(url).path.rsplit("/", 1)[1] for url in fetcher._validators] == [
+            "sequences", "other",
+        ]
@@ -0,0 +1,287 @@
+"""
+Unit tests for IdempotencyMiddleware and the idempotency key store.
+
+Tests:
+    - Retries with the same key replay the stored response
+    - Concurrent duplicates run the endpoint once, within and across workers
+    - Error responses are not stored
+    - Keys are scoped to the authenticated caller and bound to the request
+    - Claims are renewed while the original runs, abandoned ones taken over
+    - Expired keys are swept
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+import httpx
+from fastapi import FastAPI, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.security import create_access_token, create_station_api_key
+from app.crud import idempotency_key as idempotency_crud
+from app.database import AsyncSessionLocal, dispose_engines
+from app.middleware.idempotency import IdempotencyMiddleware
+from app.models import IdempotencyKey
+
+
+def completion_app(calls: List[Dict], delay: float = 0.0) -> FastAPI:
+    """App with a completion endpoint counting how often it really runs."""
+    app = FastAPI()
+
+    @app.post("/complete")
+    async def complete(payload: Dict):
+        calls.append(payload)
+        await asyncio.sleep(delay)
+        if payload.get("fail") and len(calls) == 1:
+            raise HTTPException(status_code=400, detail="No active process found")
+        return {"completed": payload["wip_id"], "run": len(calls)}
+
+    return app
+
+
+def post_all(apps: List, requests: List[Dict]) -> List[httpx.Response]:
+    """Send requests concurrently, spreading them over the given ASGI apps (workers)."""
+
+    async def main() -> List[httpx.Response]:
+        clients = [
+            httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+            for app in apps
+        ]
+        try:
+            return await asyncio.gather(*(
+                clients[index % len(clients)].post("/complete", **request)
+                for index, request in enumerate(requests)
+            ))
+        finally:
+            for client in clients:
+                await client.aclose()
+            await dispose_engines()
+
+    return asyncio.run(main())
+
+
+STATION_1 = create_station_api_key("STATION-01")
+
+
+def request(key: str, wip_id: str = "WIP-1", token: str = STATION_1, **payload) -> Dict:
+    return {
+        "json": {"wip_id": wip_id, **payload},
+        "headers": {"Idempotency-Key": key, "Authorization": f"Bearer {token}"},
+    }
+
+
+class TestIdempotencyMiddleware:
+    """Test response replay by Idempotency-Key."""
+
+    def test_retry_replays_stored_response(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls))
+
+        first, = post_all([app], [request("k1")])
+        retry, = post_all([app], [request("k1")])
+
+        assert len(calls) == 1
+        assert retry.status_code == first.status_code == 200
+        assert retry.json() == first.json() == {"completed": "WIP-1", "run": 1}
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+
+    def test_requests_without_key_are_not_affected(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls))
+
+        post_all([app], [{"json": {"wip_id": "WIP-1"}}] * 2)
+
+        assert len(calls) == 2
+        assert db.query(IdempotencyKey).count() == 0
+
+    def test_concurrent_duplicates_run_once(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls, delay=0.2))
+
+        responses = post_all([app], [request("k1")] * 5)
+
+        assert len(calls) == 1
+        assert {response.status_code for response in responses} == {200}
+        assert sum(response.headers.get("Idempotent-Replayed") == "true" for response in responses) == 4
+
+    def test_concurrent_duplicates_across_workers_run_once(self, db: Session):
+        calls = []
+        endpoint = completion_app(calls, delay=0.3)
+        workers = [IdempotencyMiddleware(endpoint, poll_interval=0.02) for _ in range(2)]
+
+        responses = post_all(workers, [request("k1")] * 4)
+
+        assert len(calls) == 1
+        assert [response.json()["run"] for response in responses] == [1, 1, 1, 1]
+
+    def test_error_response_is_not_stored(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls))
+
+        failed, = post_all([app], [request("k1", fail=True)])
+        retry, = post_all([app], [request("k1", fail=True)])
+
+        assert failed.status_code == 400
+        assert retry.status_code == 200
+        assert len(calls) == 2
+
+    def test_key_is_scoped_to_caller(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls))
+
+        post_all([app], [request("k1", token=STATION_1)])
+        other, = post_all([app], [request("k1", token=create_station_api_key("STATION-02"))])
+        user, = post_all([app], [request("k1", token=create_access_token(subject=1))])
+
+        assert len(calls) == 3
+        assert "Idempotent-Replayed" not in other.headers
+        assert "Idempotent-Replayed" not in user.headers
+
+    def test_key_survives_token_refresh(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls))
+
+        post_all([app], [request("k1", token=create_access_token(subject=1))])
+        refreshed = create_access_token(subject=1, expires_delta=timedelta(hours=2))
+        retry, = post_all([app], [request("k1", token=refreshed)])
+
+        assert len(calls) == 1
+        assert retry.headers["Idempotent-Replayed"] == "true"
+
+    def test_key_reused_for_different_request(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls))
+
+        post_all([app], [request("k1", wip_id="WIP-1")])
+        reused, = post_all([app], [request("k1", wip_id="WIP-2")])
+
+        assert reused.status_code == 422
+        assert reused.json()["error_code"] == "VAL_001"
+        assert len(calls) == 1
+
+    def test_invalid_key(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls))
+
+        response, = post_all([app], [request("x" * 256)])
+
+        assert response.status_code == 400
+        assert calls == []
+
+
+class TestIdempotencyKeyStore:
+    """Test claim leases, the TTL sweep and expired key reuse."""
+
+    def test_claim_is_a_lease_extended_on_completion(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls), ttl_seconds=3600)
+        post_all([app], [request("k1")])
+
+        async def claim() -> None:
+            async with AsyncSessionLocal() as session:
+                await idempotency_crud.claim(session, "in-flight", "hash", lease_seconds=5)
+            await dispose_engines()
+
+        asyncio.run(claim())
+        now = datetime.now(timezone.utc)
+        remaining = {
+            row.status_code: row.expires_at.replace(tzinfo=timezone.utc) - now
+            for row in db.query(IdempotencyKey)
+        }
+        assert timedelta(minutes=59) < remaining[200] <= timedelta(hours=1)
+        assert remaining[None] <= timedelta(seconds=5)
+
+    def test_abandoned_claim_is_taken_over(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls), wait_timeout=0.2, poll_interval=0.02)
+        post_all([app], [request("k1")])
+
+        # The claiming worker died: the row stays in flight
+        db.query(IdempotencyKey).update({"status_code": None})
+        db.commit()
+        busy, = post_all([app], [request("k1")])
+
+        db.query(IdempotencyKey).update({"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)})
+        db.commit()
+        retry, = post_all([app], [request("k1")])
+
+        assert busy.status_code == 409
+        assert retry.status_code == 200
+        assert "Idempotent-Replayed" not in retry.headers
+        assert len(calls) == 2
+
+    def test_long_request_keeps_its_claim(self, db: Session):
+        calls = []
+        endpoint = completion_app(calls, delay=1.0)
+        original, duplicate = (
+            IdempotencyMiddleware(endpoint, wait_timeout=0.1, lease_seconds=0.3, poll_interval=0.02)
+            for _ in range(2)
+        )
+
+        async def main():
+            clients = [
+                httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+                for app in (original, duplicate)
+            ]
+            first = asyncio.create_task(clients[0].post("/complete", **request("k1")))
+            await asyncio.sleep(0.6)  # Past the first lease
+            retry = await clients[1].post("/complete", **request("k1"))
+            await first
+            replay = await clients[1].post("/complete", **request("k1"))
+            for client in clients:
+                await client.aclose()
+            await dispose_engines()
+            return retry, replay
+
+        retry, replay = asyncio.run(main())
+
+        assert retry.status_code == 409
+        assert replay.headers["Idempotent-Replayed"] == "true"
+        assert len(calls) == 1
+
+    def test_taken_over_claim_is_not_completed(self, db: Session):
+        first_claim = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+        async def main():
+            async with AsyncSessionLocal() as session:
+                await idempotency_crud.claim(session, "k1", "hash", lease_seconds=1, now=first_claim)
+                # Lease expired: a retry takes the key over
+                assert await idempotency_crud.claim(session, "k1", "hash", lease_seconds=60) is None
+                stale = await idempotency_crud.complete(
+                    session, "k1", first_claim, 200, "application/json", b"{}", ttl_seconds=3600
+                )
+                renewed = await idempotency_crud.renew(session, "k1", first_claim, lease_seconds=60)
+            await dispose_engines()
+            return stale, renewed
+
+        assert asyncio.run(main()) == (False, False)
+        row = db.query(IdempotencyKey).one()
+        assert row.status_code is None
+        assert row.created_at.replace(tzinfo=timezone.utc) > first_claim
+
+    def test_purge_expired(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls))
+        post_all([app], [request("k1"), request("k2")])
+
+        async def purge(now: datetime) -> int:
+            async with AsyncSessionLocal() as session:
+                purged = await idempotency_crud.purge_expired(session, now)
+            await dispose_engines()
+            return purged
+
+        assert asyncio.run(purge(datetime.now(timezone.utc))) == 0
+        assert asyncio.run(purge(datetime.now(timezone.utc) + timedelta(days=2))) == 2
+        assert db.query(IdempotencyKey).count() == 0
+
+    def test_expired_key_runs_again(self, db: Session):
+        calls = []
+        app = IdempotencyMiddleware(completion_app(calls), ttl_seconds=0)
+
+        post_all([app], [request("k1")])
+        retry, = post_all([app], [request("k1")])
+
+        assert len(calls) == 2
+        assert "Idempotent-Replayed" not in retry.headers
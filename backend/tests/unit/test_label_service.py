@@ -0,0 +1,192 @@
+"""
+Unit tests for the cached label rendering service and label endpoints.
+
+Tests:
+    - Content-addressed PNG cache (memory LRU and size-bounded disk)
+    - ZPL templates and multi-label ZPL batches
+    - Multi-page PDF sheets, rasterized in a process pool
+    - Barcode ETag / immutable caching and LOT label batch endpoint
+"""
+
+import os
+import re
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Lot, LotStatus, ProductModel, WIPItem, WIPStatus
+from app.services import label_service as label_module
+from app.services.label_service import LabelCache, LabelService, label_service
+from app.services.printer_service import printer_service
+
+WIP_IDS = [f"WIP-KR01PSA2511-{i:03d}" for i in range(1, 11)]
+
+
+def count_pdf_pages(pdf: bytes) -> int:
+    return len(re.findall(rb"/Type\s*/Page\b(?!s)", pdf))
+
+
+@pytest.fixture
+def service(tmp_path) -> LabelService:
+    service = LabelService(cache_dir=str(tmp_path), max_bytes=1 << 20, workers=1)
+    yield service
+    service.shutdown()
+
+
+class TestLabelCache:
+    """Test the two-level content-addressed cache."""
+
+    def test_png_rendered_once_then_read_from_disk(self, service, tmp_path, monkeypatch):
+        first = service.render_png(WIP_IDS[0], "qr")
+        assert first.startswith(b"\x89PNG")
+        assert service.render_png(WIP_IDS[0], "qr") is first
+
+        def fail(*args, **kwargs):
+            raise AssertionError("label was re-rendered")
+
+        monkeypatch.setattr(label_module, "render_barcode_png", fail)
+        restarted = LabelService(cache_dir=str(tmp_path), workers=1)
+        assert restarted.render_png(WIP_IDS[0], "qr") == first
+
+    def test_key_depends_on_data_symbology_and_options(self, service):
+        keys = {
+            service.png_key(WIP_IDS[0], "qr"),
+            service.png_key(WIP_IDS[0], "code128"),
+            service.png_key(WIP_IDS[1], "qr"),
+            service.png_key(WIP_IDS[0], "qr", {"box_size": 4}),
+        }
+        assert len(keys) == 4
+        with pytest.raises(ValueError):
+            service.png_key(WIP_IDS[0], "ean13")
+
+    def test_memory_bounded_by_bytes(self):
+        cache = LabelCache(cache_dir=None, max_bytes=10)
+        cache.set("a", b"12345")
+        cache.set("b", b"12345")
+        cache.set("c", b"12345")
+
+        assert cache.get("a") is None
+        assert cache.get("c") == b"12345"
+
+    def test_disk_pruned_least_recently_used_first(self, tmp_path):
+        cache = LabelCache(cache_dir=str(tmp_path), max_bytes=10, disk_max_bytes=130)
+        for n, key in enumerate(["aa1", "bb2", "cc3", "dd4"]):
+            cache.set(key, bytes(30))
+            os.utime(tmp_path / key[:2] / key, (1000 + n, 1000 + n))
+        cache.clear()
+
+        assert cache.get("aa1") == bytes(30)  # Disk hit: used again
+        cache.set("ee5", bytes(30))  # 150 bytes on disk: pruned below 117
+
+        remaining = sorted(path.name for path in tmp_path.rglob("*") if path.is_file())
+        assert remaining == ["aa1", "dd4", "ee5"]
+
+
+class TestZpl:
+    """Test ZPL rendering and batching."""
+
+    def test_printer_service_uses_templates(self):
+        zpl = printer_service._generate_wip_zpl(WIP_IDS[0])
+
+        assert zpl.startswith("^XA") and zpl.endswith("^XZ")
+        assert f"^FDQA,{WIP_IDS[0]}^FS" in zpl
+        assert "LOT LABEL" in printer_service._generate_lot_zpl("KR01PSA2511")
+
+    def test_batch_is_one_stream(self, service):
+        zpl = service.render_zpl_batch("WIP_LABEL", WIP_IDS)
+
+        assert zpl.count("^XA") == len(WIP_IDS)
+        assert zpl.index(WIP_IDS[0]) < zpl.index(WIP_IDS[-1])
+
+    def test_unknown_template(self, service):
+        with pytest.raises(ValueError):
+            service.render_zpl("BOX_LABEL", "X")
+
+
+class TestPdf:
+    """Test multi-page PDF sheets."""
+
+    def test_one_page_per_label(self, service):
+        pdf = service.render_pdf(WIP_IDS[:3], "code128")
+
+        assert pdf.startswith(b"%PDF")
+        assert count_pdf_pages(pdf) == 3
+
+    def test_process_pool_matches_inline_rendering(self, service, tmp_path):
+        pooled = LabelService(cache_dir=str(tmp_path / "pooled"), workers=2)
+        try:
+            images = pooled.render_png_batch(WIP_IDS, "qr")
+        finally:
+            pooled.shutdown()
+
+        assert images == [service.render_png(wip_id, "qr") for wip_id in WIP_IDS]
+
+
+@pytest.fixture
+def lot_with_wips(db: Session, tmp_path, monkeypatch) -> Lot:
+    monkeypatch.setattr(label_service, "cache", LabelCache(str(tmp_path), 1 << 20))
+    product_model = ProductModel(
+        model_code="PSA", model_name="Test Model", category="Test",
+        status="ACTIVE", specifications={},
+    )
+    db.add(product_model)
+    db.flush()
+    lot = Lot(
+        lot_number="WF-KR-251125D-001",
+        product_model_id=product_model.id,
+        production_date=date(2025, 11, 25),
+        target_quantity=10,
+        status=LotStatus.IN_PROGRESS.value,
+    )
+    db.add(lot)
+    db.flush()
+    for sequence, wip_id in enumerate(WIP_IDS[:3], start=1):
+        db.add(WIPItem(
+            wip_id=wip_id, lot_id=lot.id, sequence_in_lot=sequence,
+            status=WIPStatus.CREATED.value,
+        ))
+    db.commit()
+    return lot
+
+
+class TestLabelEndpoints:
+    """Test barcode caching headers and the LOT label batch."""
+
+    def test_barcode_is_immutable_and_revalidated(
+        self, client, lot_with_wips, auth_headers_admin
+    ):
+        url = f"/api/v1/wip-items/barcode/{WIP_IDS[0]}"
+        first = client.get(url, params={"barcode_type": "qr"}, headers=auth_headers_admin)
+        assert first.status_code == 200
+        assert first.headers["content-type"] == "image/png"
+        assert "immutable" in first.headers["Cache-Control"]
+        etag = first.headers["ETag"]
+
+        cached = client.get(
+            url, params={"barcode_type": "qr"},
+            headers={**auth_headers_admin, "If-None-Match": etag},
+        )
+        assert cached.status_code == 304
+
+        missing = client.get(
+            "/api/v1/wip-items/barcode/WIP-NONE", params={"barcode_type": "qr"},
+            headers={**auth_headers_admin, "If-None-Match": "*"},
+        )
+        assert missing.status_code == 404
+
+    def test_lot_labels(self, client, lot_with_wips, auth_headers_admin):
+        url = f"/api/v1/lots/{lot_with_wips.id}/labels"
+        zpl = client.get(url, headers=auth_headers_admin)
+        assert zpl.status_code == 200
+        assert zpl.text.count("^XA") == 3
+
+        pdf = client.get(url, params={"format": "pdf"}, headers=auth_headers_admin)
+        assert pdf.headers["content-type"] == "application/pdf"
+        assert count_pdf_pages(pdf.content) == 3
+
+        cached = client.get(
+            url, params={"format": "pdf"},
+            headers={**auth_headers_admin, "If-None-Match": pdf.headers["ETag"]},
+        )
+        assert cached.status_code == 304
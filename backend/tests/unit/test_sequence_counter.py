@@ -0,0 +1,158 @@
+"""
+Unit tests for the sequence counter allocator.
+
+Tests:
+    - Block leasing and rollback of allocations
+    - Seeding from numbers that predate the counter
+    - Gap-free, collision-free numbering under concurrent allocation
+    - LOT / WIP / serial numbering through the allocator
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.crud import sequence_counter
+from app.crud import wip_item as wip_crud
+from app.models import Lot, LotStatus, ProductModel, ProductionLine, Serial, WIPItem, WIPStatus
+from app.schemas.lot import LotCreate
+from app.services.serial_service import serial_service
+from tests.conftest import TestSessionLocal
+
+WORKERS = 12
+
+
+def run_concurrently(task, count: int) -> list:
+    """Run task(i) for i in range(count), each in its own session/thread."""
+    def run(i):
+        session = TestSessionLocal()
+        try:
+            return task(session, i)
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        return list(pool.map(run, range(count)))
+
+
+@pytest.fixture
+def lot(db: Session) -> Lot:
+    product_model = ProductModel(
+        model_code="PSA", model_name="Test Model", category="Test",
+        status="ACTIVE", specifications={},
+    )
+    production_line = ProductionLine(line_code="KR01", line_name="Line 1")
+    db.add_all([product_model, production_line])
+    db.flush()
+    lot = Lot(
+        lot_number="KR01PSA251101",
+        product_model_id=product_model.id,
+        production_line_id=production_line.id,
+        production_date=date(2025, 11, 25),
+        target_quantity=500,
+        status=LotStatus.CREATED.value,
+    )
+    db.add(lot)
+    db.commit()
+    return lot
+
+
+class TestAllocate:
+    """Test allocation semantics."""
+
+    def test_block_leasing(self, db: Session):
+        assert sequence_counter.allocate(db, "test", 100) == range(1, 101)
+        assert sequence_counter.allocate(db, "test") == range(101, 102)
+        assert sequence_counter.allocate(db, "other") == range(1, 2)
+        db.commit()
+
+        assert sequence_counter.peek(db, "test") == 101
+        with pytest.raises(ValueError):
+            sequence_counter.allocate(db, "test", 0)
+
+    def test_rollback_releases_numbers(self, db: Session):
+        sequence_counter.allocate(db, "test", 5)
+        db.commit()
+
+        sequence_counter.allocate(db, "test", 10)
+        db.rollback()
+
+        assert sequence_counter.allocate(db, "test") == range(6, 7)
+
+    def test_seed_used_only_once(self, db: Session):
+        calls = []
+
+        def seed():
+            calls.append(1)
+            return 41
+
+        assert sequence_counter.allocate(db, "test", seed=seed)[0] == 42
+        assert sequence_counter.allocate(db, "test", seed=seed)[0] == 43
+        assert len(calls) == 1
+
+    def test_concurrent_allocation_is_gap_free(self, db: Session):
+        def task(session, i):
+            numbers = sequence_counter.allocate(session, "stress", 1 + i % 3)
+            session.commit()
+            return list(numbers)
+
+        results = run_concurrently(task, 120)
+
+        numbers = sorted(n for block in results for n in block)
+        assert numbers == list(range(1, len(numbers) + 1))
+        assert all(block == list(range(block[0], block[-1] + 1)) for block in results)
+
+
+class TestNumbering:
+    """Test LOT / WIP / serial numbering under concurrency."""
+
+    def test_concurrent_lot_creation(self, db: Session, lot: Lot):
+        lot_in = LotCreate(
+            product_model_id=lot.product_model_id,
+            production_line_id=lot.production_line_id,
+            production_date=date(2025, 11, 25),
+            target_quantity=10,
+        )
+        numbers = run_concurrently(lambda session, i: crud.lot.create(session, lot_in).lot_number, 40)
+
+        # Existing KR01PSA251101 seeds the counter
+        assert sorted(numbers) == [f"KR01PSA2511{seq:02d}" for seq in range(2, 42)]
+
+    def test_concurrent_wip_batches(self, db: Session, lot: Lot):
+        lot_id = lot.id
+        batches = run_concurrently(
+            lambda session, i: [w.sequence_in_lot for w in wip_crud.create_batch(session, lot_id, 10)],
+            10,
+        )
+
+        sequences = sorted(s for batch in batches for s in batch)
+        assert sequences == list(range(1, 101))
+        assert all(batch == list(range(batch[0], batch[0] + 10)) for batch in batches)
+
+        # WIP sequences are 3 digits (max 100 per LOT); a rejected batch releases its block
+        with pytest.raises(ValueError):
+            wip_crud.create_batch(db, lot_id, 1)
+        assert sequence_counter.peek(db, sequence_counter.wip_scope(lot_id)) == 100
+
+    def test_concurrent_serial_conversion(self, db: Session, lot: Lot):
+        for sequence in range(1, 41):
+            db.add(WIPItem(
+                wip_id=f"WIP-KR01PSA251101-{sequence:03d}",
+                lot_id=lot.id,
+                sequence_in_lot=sequence,
+                status=WIPStatus.COMPLETED.value,
+            ))
+        db.commit()
+
+        serial_numbers = run_concurrently(
+            lambda session, i: serial_service.generate_from_wip(
+                session, f"WIP-KR01PSA251101-{i + 1:03d}", print_label=False
+            ).serial_number,
+            40,
+        )
+
+        assert sorted(serial_numbers) == [f"KR01PSA251101{seq:03d}" for seq in range(1, 41)]
+        assert db.query(Serial).filter(Serial.lot_id == lot.id).count() == 40
@@ -0,0 +1,241 @@
+"""
+Unit tests for SQL-aggregated WIP statistics and their conditional GET.
+
+Tests:
+    - get_statistics totals, by_lot and by_process from grouped SQL
+    - change_tracker versions bumped after commit (outside the write), not on rollback,
+      and shared by sessions; ETags also expire after ETAG_MAX_AGE_SECONDS
+    - /wip-items/statistics ETag and 304 Not Modified, also across API processes
+"""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core import change_tracker as change_tracker_module
+from app.core.change_tracker import change_tracker
+from app.crud import wip_item as wip_crud
+from app.models import Lot, LotStatus, Process, ProductModel, WIPItem, WIPStatus
+from tests.conftest import TestSessionLocal
+
+
+def create_lot(db: Session, lot_number: str) -> Lot:
+    """Helper to create a LOT (and its product model) for tests."""
+    product_model = db.query(ProductModel).filter_by(model_code="PSA").first()
+    if product_model is None:
+        product_model = ProductModel(
+            model_code="PSA", model_name="Test Model", category="Test",
+            status="ACTIVE", specifications={},
+        )
+        db.add(product_model)
+        db.flush()
+
+    lot = Lot(
+        lot_number=lot_number,
+        product_model_id=product_model.id,
+        production_date=date(2025, 11, 25),
+        target_quantity=10,
+        status=LotStatus.IN_PROGRESS.value,
+    )
+    db.add(lot)
+    db.commit()
+    return lot
+
+
+def create_process(db: Session, process_number: int) -> Process:
+    """Helper to create a Process for tests."""
+    process = Process(
+        process_code=f"P{process_number:02d}",
+        process_name_ko=f"공정 {process_number}",
+        process_name_en=f"Process {process_number}",
+        process_number=process_number,
+        process_type="MANUFACTURING",
+        sort_order=process_number,
+        is_active=True,
+    )
+    db.add(process)
+    db.commit()
+    return process
+
+
+def add_wips(db: Session, lot: Lot, statuses, process: Process = None) -> None:
+    """Helper to add WIP items with the given statuses."""
+    start = db.query(WIPItem).filter_by(lot_id=lot.id).count()
+    for offset, wip_status in enumerate(statuses, start=1):
+        db.add(WIPItem(
+            wip_id=f"WIP-{lot.lot_number}-{start + offset:03d}",
+            lot_id=lot.id,
+            sequence_in_lot=start + offset,
+            status=wip_status.value,
+            current_process_id=process.id if process else None,
+        ))
+    db.commit()
+
+
+@pytest.fixture
+def wip_data(db: Session):
+    lot_a = create_lot(db, "WF-KR-251125D-001")
+    lot_b = create_lot(db, "WF-KR-251125D-002")
+    p1 = create_process(db, 1)
+    p2 = create_process(db, 2)
+
+    add_wips(db, lot_a, [WIPStatus.IN_PROGRESS] * 3, p1)
+    add_wips(db, lot_a, [WIPStatus.IN_PROGRESS], p2)
+    add_wips(db, lot_a, [WIPStatus.COMPLETED, WIPStatus.CONVERTED], p2)
+    add_wips(db, lot_b, [WIPStatus.CREATED, WIPStatus.CREATED, WIPStatus.FAILED])
+    return {"lot_a": lot_a, "lot_b": lot_b, "p1": p1, "p2": p2}
+
+
+class TestGetStatistics:
+    """Test grouped SQL statistics."""
+
+    def test_totals_and_groups(self, db: Session, wip_data):
+        stats = wip_crud.get_statistics(db)
+
+        assert stats["total"] == 9
+        assert stats["created"] == 2
+        assert stats["in_progress"] == 4
+        assert stats["completed"] == 1
+        assert stats["converted"] == 1
+        assert stats["failed"] == 1
+
+        lots = {lot["lot_number"]: lot for lot in stats["by_lot"]}
+        lot_a = lots["WF-KR-251125D-001"]
+        assert lot_a["total_quantity"] == 6
+        assert lot_a["completed_quantity"] == 2
+        assert lot_a["in_progress_quantity"] == 4
+        assert lot_a["current_process_id"] == wip_data["p1"].id
+        assert lot_a["current_process"] == "공정 1"
+        assert lots["WF-KR-251125D-002"]["current_process"] is None
+
+        p2 = stats["by_process"][wip_data["p2"].id]
+        assert (p2["count"], p2["in_progress"], p2["completed"]) == (3, 1, 2)
+
+    def test_filters(self, db: Session, wip_data):
+        by_lot = wip_crud.get_statistics(db, lot_id=wip_data["lot_b"].id)
+        by_process = wip_crud.get_statistics(db, process_id=wip_data["p1"].id)
+
+        assert by_lot["total"] == 3
+        assert [lot["lot_id"] for lot in by_lot["by_lot"]] == [wip_data["lot_b"].id]
+        assert by_process["total"] == 3
+        assert list(by_process["by_process"]) == [wip_data["p1"].id]
+
+
+class TestChangeTracker:
+    """Test change versions follow committed transactions."""
+
+    def test_commit_bumps_and_rollback_does_not(self, db: Session, wip_data):
+        version = change_tracker.version(db, "wip_items")
+
+        wip = db.query(WIPItem).first()
+        wip.status = WIPStatus.FAILED.value
+        db.flush()
+        db.rollback()
+        assert change_tracker.version(db, "wip_items") == version
+
+        db.execute(update(WIPItem).values(status=WIPStatus.CREATED.value))
+        db.commit()
+        assert change_tracker.version(db, "wip_items") == version + 1
+
+    def test_versions_are_shared_by_sessions(self, db: Session, wip_data):
+        other = TestSessionLocal()
+        try:
+            version = change_tracker.version(other, "wip_items")
+            other.commit()
+
+            wip = db.query(WIPItem).first()
+            wip.status = WIPStatus.FAILED.value
+            db.commit()
+
+            assert change_tracker.version(other, "wip_items") == version + 1
+        finally:
+            other.close()
+
+    def test_bumped_after_the_write_commits(self, db: Session, wip_data, monkeypatch):
+        version = change_tracker.version(db, "wip_items")
+        failed = db.query(WIPItem).filter_by(status=WIPStatus.FAILED.value).count()
+        increment = change_tracker_module._increment
+        seen_at_bump = []
+
+        def spy(connection, resources):
+            # The write is already committed (and its locks released) when versions move
+            with TestSessionLocal() as other:
+                seen_at_bump.append(other.query(WIPItem).filter_by(status=WIPStatus.FAILED.value).count())
+            increment(connection, resources)
+
+        monkeypatch.setattr(change_tracker_module, "_increment", spy)
+        wip = db.query(WIPItem).filter(WIPItem.status != WIPStatus.FAILED.value).first()
+        wip.status = WIPStatus.FAILED.value
+        db.commit()
+
+        assert seen_at_bump == [failed + 1]
+        assert change_tracker.version(db, "wip_items") == version + 1
+
+    def test_failed_bump_keeps_the_write(self, db: Session, wip_data, monkeypatch):
+        version = change_tracker.version(db, "wip_items")
+
+        def fail(connection, resources):
+            raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(change_tracker_module, "_increment", fail)
+        db.execute(update(WIPItem).values(status=WIPStatus.FAILED.value))
+        db.commit()
+
+        assert change_tracker.version(db, "wip_items") == version
+        assert db.query(WIPItem).filter_by(status=WIPStatus.FAILED.value).count() == 9
+
+    def test_etag_expires_after_max_age(self, db: Session, wip_data, monkeypatch):
+        monkeypatch.setattr(settings, "ETAG_MAX_AGE_SECONDS", 60)
+        clock = [6000.0]
+        monkeypatch.setattr(change_tracker_module, "time", SimpleNamespace(time=lambda: clock[0]))
+
+        first = change_tracker.etag(db, ["wip_items"], "/statistics")
+        clock[0] += 59
+        assert change_tracker.etag(db, ["wip_items"], "/statistics") == first
+        clock[0] += 1
+        assert change_tracker.etag(db, ["wip_items"], "/statistics") != first
+
+
+class TestStatisticsEndpoint:
+    """Test ETag / 304 on the statistics endpoint."""
+
+    def test_not_modified_until_wip_changes(self, client, db: Session, wip_data, auth_headers_admin):
+        url = "/api/v1/wip-items/statistics"
+        first = client.get(url, headers=auth_headers_admin)
+        assert first.status_code == 200
+        assert first.json()["total"] == 9
+        etag = first.headers["ETag"]
+
+        cached = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+
+        filtered = client.get(
+            url, params={"lot_id": wip_data["lot_b"].id},
+            headers={**auth_headers_admin, "If-None-Match": etag},
+        )
+        assert filtered.status_code == 200
+
+        add_wips(db, wip_data["lot_b"], [WIPStatus.CREATED])
+        changed = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["total"] == 10
+        assert changed.headers["ETag"] != etag
+
+    def test_write_by_other_process_changes_etag(self, client, db: Session, wip_data, auth_headers_admin):
+        url = "/api/v1/wip-items/statistics"
+        etag = client.get(url, headers=auth_headers_admin).headers["ETag"]
+
+        # A WIP write committed by another API process: only the shared version moves
+        db.execute(text("DELETE FROM wip_items WHERE status = 'CREATED'"))
+        db.execute(text("UPDATE resource_versions SET version = version + 1 WHERE resource = 'wip_items'"))
+        db.commit()
+
+        changed = client.get(url, headers={**auth_headers_admin, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["total"] < 9
@@ -20,6 +20,7 @@ from services.work_service import WorkService
 from services.barcode_service import BarcodeService
 from services.completion_watcher import CompletionWatcher
 from services.tcp_server import TCPServer
+from services.history_manager import get_history_manager
 
 # Import viewmodels
 from viewmodels.main_viewmodel import MainViewModel
@@ -204,6 +205,10 @@ def main():
 
         # Run application
         exit_code = app.exec()
+
+        # Persist any queued history events before exiting
+        get_history_manager().close()
+
         logger.info(f"Application exited with code: {exit_code}")
         return exit_code
 
@@ -0,0 +1,192 @@
+"""
+Table Models - Virtualized item models for large list views.
+
+QTableWidget creates one QTableWidgetItem per cell up front, which stalls
+the UI once views hold thousands of rows. These models keep the raw records
+and compute cell values lazily in data(), so Qt only asks for the rows that
+are actually visible. New records are inserted with beginInsertRows() and
+filtering is done by a proxy model instead of rebuilding the list.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Iterable, List, Optional, Sequence, TypeVar
+
+from PySide6.QtCore import (
+    QAbstractTableModel, QModelIndex, QPersistentModelIndex,
+    QSortFilterProxyModel, Qt
+)
+from PySide6.QtGui import QBrush
+
+T = TypeVar("T")
+
+_ModelIndex = QModelIndex | QPersistentModelIndex
+
+
+@dataclass(frozen=True)
+class Column(Generic[T]):
+    """
+    Column definition for RecordTableModel.
+
+    Attributes:
+        header: Header label
+        value: Returns the display text for a record
+        alignment: Text alignment for the column
+        foreground: Optional callback returning a (cached) brush for a record
+        sort_key: Optional callback returning the sort value for a record
+    """
+    header: str
+    value: Callable[[T], str]
+    alignment: Qt.AlignmentFlag = Qt.AlignLeft | Qt.AlignVCenter
+    foreground: Optional[Callable[[T], Optional[QBrush]]] = None
+    sort_key: Optional[Callable[[T], Any]] = None
+
+
+class RecordTableModel(QAbstractTableModel, Generic[T]):
+    """
+    Read-only table model over a list of records.
+
+    Cell text, alignment and colors are computed on demand from the column
+    definitions. The raw record for a row is available via ``record()`` and
+    under ``RecordTableModel.RecordRole``.
+    """
+
+    RecordRole = Qt.UserRole + 1
+    SortRole = Qt.UserRole + 2
+
+    def __init__(
+        self,
+        columns: Sequence[Column[T]],
+        max_rows: Optional[int] = None,
+        parent: Optional[Any] = None
+    ) -> None:
+        """
+        Initialize RecordTableModel.
+
+        Args:
+            columns: Column definitions
+            max_rows: Trim oldest rows beyond this count on insert (None = unlimited)
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._records: List[T] = []
+        self._max_rows = max_rows
+
+    # =========================================================================
+    # Record API
+    # =========================================================================
+
+    def records(self) -> List[T]:
+        """Return all records (model order)."""
+        return list(self._records)
+
+    def record(self, row: int) -> T:
+        """Return the record at a model row."""
+        return self._records[row]
+
+    def set_records(self, records: Iterable[T]) -> None:
+        """Replace all records with a single model reset."""
+        self.beginResetModel()
+        self._records = list(records)
+        if self._max_rows is not None:
+            del self._records[self._max_rows:]
+        self.endResetModel()
+
+    def prepend_records(self, records: Sequence[T]) -> None:
+        """Insert records at the top (newest-first views)."""
+        if not records:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(records) - 1)
+        self._records[0:0] = records
+        self.endInsertRows()
+        self._trim_tail()
+
+    def append_records(self, records: Sequence[T]) -> None:
+        """Insert records at the bottom."""
+        if not records:
+            return
+        first = len(self._records)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self._records.extend(records)
+        self.endInsertRows()
+        self._trim_tail()
+
+    def clear(self) -> None:
+        """Remove all records."""
+        self.set_records([])
+
+    def _trim_tail(self) -> None:
+        if self._max_rows is None or len(self._records) <= self._max_rows:
+            return
+        self.beginRemoveRows(QModelIndex(), self._max_rows, len(self._records) - 1)
+        del self._records[self._max_rows:]
+        self.endRemoveRows()
+
+    # =========================================================================
+    # QAbstractTableModel
+    # =========================================================================
+
+    def rowCount(self, parent: _ModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent: _ModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: _ModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        record = self._records[index.row()]
+        column = self._columns[index.column()]
+
+        if role == Qt.DisplayRole:
+            return column.value(record)
+        if role == Qt.TextAlignmentRole:
+            return column.alignment
+        if role == Qt.ForegroundRole and column.foreground is not None:
+            return column.foreground(record)
+        if role == self.SortRole:
+            return column.sort_key(record) if column.sort_key else column.value(record)
+        if role == self.RecordRole:
+            return record
+        return None
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
+    ) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._columns[section].header
+        return None
+
+    def flags(self, index: _ModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class RecordFilterProxyModel(QSortFilterProxyModel):
+    """
+    Proxy model filtering RecordTableModel rows with a record predicate.
+
+    Changing the predicate re-filters in place; the source model and the
+    view's column layout are left untouched.
+    """
+
+    def __init__(self, parent: Optional[Any] = None) -> None:
+        super().__init__(parent)
+        self._predicate: Optional[Callable[[Any], bool]] = None
+        self.setSortRole(RecordTableModel.SortRole)
+
+    def set_predicate(self, predicate: Optional[Callable[[Any], bool]]) -> None:
+        """Set the row predicate (None shows all rows)."""
+        self._predicate = predicate
+        self.invalidateRowsFilter()
+
+    def record(self, proxy_row: int) -> Any:
+        """Return the source record for a proxy row."""
+        source_index = self.mapToSource(self.index(proxy_row, 0))
+        return self.sourceModel().record(source_index.row())
+
+    def filterAcceptsRow(self, source_row: int, source_parent: _ModelIndex) -> bool:
+        if self._predicate is None:
+            return True
+        return self._predicate(self.sourceModel().record(source_row))
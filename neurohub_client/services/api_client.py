@@ -1,17 +1,44 @@
 """
 Simplified REST API Client with JWT authentication support.
 """
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout, HTTPError
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 
+# Maximum number of GET responses kept for ETag revalidation
+RESPONSE_CACHE_SIZE = 64
+
+# Keep-alive connection pool: the client talks to a single backend host,
+# with polling timers and worker threads issuing requests concurrently
+POOL_CONNECTIONS = 2
+POOL_MAXSIZE = 16
+
+
+def make_idempotency_key(*parts: Any) -> str:
+    """
+    Derive a stable Idempotency-Key from the data identifying an operation.
+
+    Re-submitting the same event (e.g. the same completion file or equipment
+    message after a timeout) yields the same key, so the backend replays the
+    first response instead of running the operation twice.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 class APIClient:
     """Simplified API client with JWT authentication and retry logic."""
 
@@ -19,21 +46,38 @@ class APIClient:
         self._base_url = base_url.rstrip('/')
         self.token: Optional[str] = None
         self.session = self._create_session()
+        # (url, params) -> (etag, raw body) of the last 200 response with an ETag
+        self._response_cache: "OrderedDict[Tuple[str, Tuple], Tuple[str, bytes]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def get_base_url(self) -> str:
         """Get the API base URL."""
         return self._base_url
 
     def _create_session(self) -> requests.Session:
-        """Create session with retry strategy."""
+        """
+        Create session with retry strategy and pooled keep-alive connections.
+
+        Accept-Encoding lists every coding urllib3 can decode here (gzip,
+        deflate, plus br/zstd when their packages are installed); responses
+        are decompressed transparently.
+        """
         session = requests.Session()
+        session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+        })
         retry = Retry(
             total=3,
             backoff_factor=0.3,
             status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET", "POST", "PUT", "DELETE"]
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retry,
+        )
         session.mount('http://', adapter)
         session.mount('https://', adapter)
         return session
@@ -41,78 +85,177 @@ class APIClient:
     def set_token(self, token: str):
         """Set JWT token for authenticated requests."""
         self.token = token
+        self.clear_response_cache()
 
     def clear_token(self):
         """Clear JWT token."""
         self.token = None
+        self.clear_response_cache()
+
+    def clear_response_cache(self):
+        """Drop cached GET responses (e.g. when the user changes)."""
+        with self._cache_lock:
+            self._response_cache.clear()
+
+    def _cached_response(self, key: Tuple[str, Tuple]) -> Optional[Tuple[str, bytes]]:
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None:
+                self._response_cache.move_to_end(key)
+            return entry
+
+    def _store_response(self, key: Tuple[str, Tuple], etag: str, body: bytes):
+        with self._cache_lock:
+            self._response_cache[key] = (etag, body)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
 
     def _headers(self) -> Dict[str, str]:
-        """Get headers with JWT token."""
-        headers = {"Content-Type": "application/json"}
+        """Get per-request headers (JWT token); common headers live on the session."""
+        headers = {}
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
         return headers
 
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        """GET request with error handling."""
+        """
+        GET request with error handling.
+
+        Responses carrying an ETag are cached; repeated requests send it as
+        If-None-Match and a 304 Not Modified is answered from the cache.
+        """
         url = f"{self._base_url}{endpoint}"
+        cache_key = (url, tuple(sorted((params or {}).items())))
+        cached = self._cached_response(cache_key)
+        headers = self._headers()
+        if cached:
+            headers["If-None-Match"] = cached[0]
 
-        # Debug logging - request details
-        logger.debug(f"=== API GET Request ===")
-        logger.debug(f"URL: {url}")
-        logger.debug(f"Params: {params}")
-        logger.debug(f"Headers: {self._headers()}")
+        logger.debug("API GET %s params=%s", url, params)
 
         try:
-            response = self.session.get(url, headers=self._headers(), params=params, timeout=10)
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
+            if response.status_code == 304 and cached:
+                logger.debug("Not modified: %s", endpoint)
+                # Decode a fresh copy so callers never share mutable results
+                return json.loads(cached[1])
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"Response Status: {response.status_code}")
-            logger.debug(f"Response Data: {result}")
+            etag = response.headers.get("ETag")
+            if etag:
+                self._store_response(cache_key, etag, response.content)
+            self._log_response(response)
             return result
         except ConnectionError as e:
-            logger.error(f"Connection error: {e}")
+            logger.error("Connection error: %s", e)
             raise ConnectionError(f"백엔드 서버에 연결할 수 없습니다: {self._base_url}")
         except Timeout as e:
-            logger.error(f"Timeout error: {e}")
+            logger.error("Timeout error: %s", e)
             raise Timeout("서버 응답 시간이 초과되었습니다 (10초)")
         except HTTPError as e:
-            logger.error(f"HTTP error: {e}")
+            logger.error("HTTP error: %s", e)
             self._handle_http_error(e, endpoint)
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             raise
 
-    def post(self, endpoint: str, data: Dict[str, Any]) -> Any:
-        """POST request with error handling."""
+    def get_if_changed(
+        self,
+        endpoint: str,
+        etag: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Conditional GET using If-None-Match.
+
+        Args:
+            endpoint: API endpoint
+            etag: ETag from the previous response (None for first request)
+            params: Query parameters
+
+        Returns:
+            (data, etag): data is None if the server answered 304 Not Modified
+        """
         url = f"{self._base_url}{endpoint}"
+        headers = self._headers()
+        if etag:
+            headers["If-None-Match"] = etag
 
-        # Debug logging - request details
-        logger.debug(f"=== API POST Request ===")
-        logger.debug(f"URL: {url}")
-        logger.debug(f"Data: {data}")
-        logger.debug(f"Headers: {self._headers()}")
+        try:
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
+            if response.status_code == 304:
+                logger.debug("Not modified: %s", endpoint)
+                return None, response.headers.get("ETag", etag)
+            response.raise_for_status()
+            return response.json(), response.headers.get("ETag")
+        except ConnectionError as e:
+            logger.error("Connection error: %s", e)
+            raise ConnectionError(f"백엔드 서버에 연결할 수 없습니다: {self._base_url}")
+        except Timeout as e:
+            logger.error("Timeout error: %s", e)
+            raise Timeout("서버 응답 시간이 초과되었습니다 (10초)")
+        except HTTPError as e:
+            logger.error("HTTP error: %s", e)
+            self._handle_http_error(e, endpoint)
+
+    def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        idempotency_key: Optional[str] = None
+    ) -> Any:
+        """
+        POST request with error handling.
+
+        Every POST carries an Idempotency-Key (a fresh one unless given), so
+        the automatic retries after 5xx/connection errors, which resend the
+        same headers, are replayed by the backend instead of run twice.
+
+        Args:
+            endpoint: API endpoint
+            data: JSON body
+            idempotency_key: Key identifying the operation across re-submissions
+                (see make_idempotency_key)
+        """
+        url = f"{self._base_url}{endpoint}"
+        headers = self._headers()
+        headers["Idempotency-Key"] = idempotency_key or uuid.uuid4().hex
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API POST %s data=%s", url, data)
 
         try:
-            response = self.session.post(url, json=data, headers=self._headers(), timeout=10)
+            response = self.session.post(url, json=data, headers=headers, timeout=10)
             response.raise_for_status()
             result = response.json()
-            logger.debug(f"Response Status: {response.status_code}")
-            logger.debug(f"Response Data: {result}")
+            self._log_response(response)
             return result
         except ConnectionError as e:
-            logger.error(f"Connection error: {e}")
+            logger.error("Connection error: %s", e)
             raise ConnectionError(f"백엔드 서버에 연결할 수 없습니다: {self._base_url}")
         except Timeout as e:
-            logger.error(f"Timeout error: {e}")
+            logger.error("Timeout error: %s", e)
             raise Timeout("서버 응답 시간이 초과되었습니다 (10초)")
         except HTTPError as e:
-            logger.error(f"HTTP error: {e}")
+            logger.error("HTTP error: %s", e)
             self._handle_http_error(e, endpoint)
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             raise
 
+    @staticmethod
+    def _log_response(response: requests.Response):
+        """Debug-log a response's status and size on the wire (never its body)."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Response %s %s: %s bytes (%s)",
+                response.status_code,
+                response.url,
+                response.headers.get("Content-Length", "?"),
+                response.headers.get("Content-Encoding", "identity"),
+            )
+
     def _extract_error_detail(self, error: HTTPError) -> str:
         """
         Extract detailed error message from HTTP error response.
@@ -142,7 +285,7 @@ class APIClient:
             if 'detail' in error_json:
                 return error_json['detail']
         except Exception as parse_err:
-            logger.debug(f"Failed to parse error response JSON: {parse_err}")
+            logger.debug("Failed to parse error response JSON: %s", parse_err)
 
         # Fallback to response text (truncated)
         try:
@@ -158,7 +301,7 @@ class APIClient:
         error_detail = self._extract_error_detail(error)
 
         # Log the full error for debugging
-        logger.error(f"HTTP {status_code} on {endpoint}: {error_detail}")
+        logger.error("HTTP %s on %s: %s", status_code, endpoint, error_detail)
 
         # Map status codes to user-friendly messages
         if status_code == 400:
@@ -315,3 +458,17 @@ class APIClient:
                 - alerts: Problem WIPs (long waiting time, etc.)
         """
         return self.get("/api/v1/wip-items/statistics")
+
+    def get_wip_statistics_if_changed(
+        self, etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Get WIP statistics only if they changed since the given ETag.
+
+        Args:
+            etag: ETag of the statistics the caller already has
+
+        Returns:
+            (statistics, etag): statistics is None if unchanged
+        """
+        return self.get_if_changed("/api/v1/wip-items/statistics", etag)
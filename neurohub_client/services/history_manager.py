@@ -1,16 +1,18 @@
 """
 History Manager - Tracks work start/complete/error events with file persistence.
 """
-import json
 import logging
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Sequence, Union
 
 from PySide6.QtCore import QObject, Signal
 
+from services.history_store import HistoryStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,13 +56,28 @@ class WorkEvent:
             "duration_seconds": self.duration_seconds,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkEvent":
+        """Create from dictionary (inverse of to_dict)."""
+        return cls(
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            event_type=EventType(data['event_type']),
+            wip_id=data['wip_id'],
+            lot_number=data['lot_number'],
+            result=EventResult(data['result']),
+            message=data['message'],
+            process_name=data.get('process_name') or '',
+            duration_seconds=data.get('duration_seconds'),
+        )
+
 
 class HistoryManager(QObject):
     """
     Manages work history events with file persistence.
 
-    Stores events in JSON files organized by date, maintains in-memory cache,
-    and persists to disk automatically.
+    Stores events in an append-only SQLite log (see HistoryStore) written off
+    the GUI thread, and keeps the most recent events in an in-memory cache.
+    Legacy ``*_events.json`` day files are imported once on startup.
     """
 
     # Signals
@@ -74,7 +91,7 @@ class HistoryManager(QObject):
         parent: Optional[QObject] = None
     ) -> None:
         super().__init__(parent)
-        self._events: List[WorkEvent] = []
+        self._events: Deque[WorkEvent] = deque(maxlen=max_events)  # Most recent first
         self._max_events: int = max_events
 
         # Setup history directory
@@ -88,7 +105,13 @@ class HistoryManager(QObject):
         self._history_dir: Path = history_path
         self._history_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load today's events from file
+        self._store = HistoryStore(self._history_dir)
+        try:
+            self._store.import_legacy_files()
+        except Exception as e:
+            logger.error(f"Failed to import legacy history files: {e}")
+
+        # Load today's events from the store
         self._load_today_events()
 
     def add_start_event(
@@ -189,83 +212,39 @@ class HistoryManager(QObject):
         self._add_event(event)
 
     def _add_event(self, event: WorkEvent) -> None:
-        """Add event to history, maintain max size, and save to file."""
-        self._events.insert(0, event)  # Most recent first
-
-        # Trim to max size
-        if len(self._events) > self._max_events:
-            self._events = self._events[:self._max_events]
-
-        # Save to file
-        self._save_today_events()
+        """Add event to history cache and queue it for persistence."""
+        self._events.appendleft(event)  # Bounded deque trims the oldest
+        self._store.append(event.to_dict())
 
         self.event_added.emit(event)
 
-    def _get_today_filename(self) -> Path:
-        """Get today's history file path."""
-        today = datetime.now().strftime("%Y-%m-%d")
-        return self._history_dir / f"{today}_events.json"
+    @staticmethod
+    def _today() -> str:
+        """Get today's date string (YYYY-MM-DD)."""
+        return datetime.now().strftime("%Y-%m-%d")
 
     def _load_today_events(self) -> None:
-        """Load today's events from file."""
-        file_path = self._get_today_filename()
-
-        if not file_path.exists():
-            logger.info(f"No history file found for today: {file_path}")
-            return
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            self._events = []
-            for event_dict in data.get('events', []):
-                try:
-                    timestamp = datetime.fromisoformat(event_dict['timestamp'])
-                    event = WorkEvent(
-                        timestamp=timestamp,
-                        event_type=EventType(event_dict['event_type']),
-                        wip_id=event_dict['wip_id'],
-                        lot_number=event_dict['lot_number'],
-                        result=EventResult(event_dict['result']),
-                        message=event_dict['message'],
-                        process_name=event_dict.get('process_name', ''),
-                        duration_seconds=event_dict.get('duration_seconds'),
-                    )
-                    self._events.append(event)
-                except Exception as e:
-                    logger.warning(f"Failed to parse event: {e}")
-                    continue
-
-            # Ensure most recent first
-            self._events.sort(key=lambda e: e.timestamp, reverse=True)
-            logger.info(f"Loaded {len(self._events)} events from {file_path}")
-
-        except Exception as e:
-            logger.error(f"Failed to load history from {file_path}: {e}")
-
-    def _save_today_events(self) -> None:
-        """Save today's events to file."""
-        file_path = self._get_today_filename()
-
-        try:
-            data = {
-                'date': datetime.now().strftime("%Y-%m-%d"),
-                'count': len(self._events),
-                'events': [e.to_dict() for e in self._events]
-            }
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            logger.debug(f"Saved {len(self._events)} events to {file_path}")
-
-        except Exception as e:
-            logger.error(f"Failed to save history to {file_path}: {e}")
+        """Load today's most recent events from the store."""
+        events = self._to_events(
+            self._store.query(date=self._today(), limit=self._max_events)
+        )
+        self._events = deque(events, maxlen=self._max_events)
+        logger.info(f"Loaded {len(events)} events for today")
+
+    @staticmethod
+    def _to_events(rows: List[Dict[str, Any]]) -> List[WorkEvent]:
+        """Convert stored rows to WorkEvent objects, skipping bad rows."""
+        events = []
+        for row in rows:
+            try:
+                events.append(WorkEvent.from_dict(row))
+            except Exception as e:
+                logger.warning(f"Failed to parse event: {e}")
+        return events
 
     def get_all_events(self) -> List[WorkEvent]:
         """Get all events (most recent first)."""
-        return self._events.copy()
+        return list(self._events)
 
     def get_events_by_type(self, event_type: EventType) -> List[WorkEvent]:
         """Get events filtered by type."""
@@ -292,17 +271,14 @@ class HistoryManager(QObject):
         return len(self.get_error_events())
 
     def clear(self) -> None:
-        """Clear all events from memory and file."""
+        """Clear today's events from memory and storage."""
         self._events.clear()
 
-        # Also delete the file
-        file_path = self._get_today_filename()
         try:
-            if file_path.exists():
-                file_path.unlink()
-                logger.info(f"Cleared history file: {file_path}")
+            deleted = self._store.delete_date(self._today())
+            logger.info(f"Cleared {deleted} history events for today")
         except Exception as e:
-            logger.error(f"Failed to delete history file: {e}")
+            logger.error(f"Failed to clear history: {e}")
 
         self.history_cleared.emit()
 
@@ -318,44 +294,55 @@ class HistoryManager(QObject):
             date_str: Date string in YYYY-MM-DD format
 
         Returns:
-            List of WorkEvent objects for that date
+            List of WorkEvent objects for that date (most recent first)
         """
-        file_path = self._history_dir / f"{date_str}_events.json"
-
-        if not file_path.exists():
-            logger.warning(f"History file not found: {file_path}")
-            return []
-
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            events = []
-            for event_dict in data.get('events', []):
-                try:
-                    timestamp = datetime.fromisoformat(event_dict['timestamp'])
-                    event = WorkEvent(
-                        timestamp=timestamp,
-                        event_type=EventType(event_dict['event_type']),
-                        wip_id=event_dict['wip_id'],
-                        lot_number=event_dict['lot_number'],
-                        result=EventResult(event_dict['result']),
-                        message=event_dict['message'],
-                        process_name=event_dict.get('process_name', ''),
-                        duration_seconds=event_dict.get('duration_seconds'),
-                    )
-                    events.append(event)
-                except Exception as e:
-                    logger.warning(f"Failed to parse event: {e}")
-                    continue
-
+            events = self._to_events(self._store.query(date=date_str))
             logger.info(f"Loaded {len(events)} events from {date_str}")
             return events
-
         except Exception as e:
-            logger.error(f"Failed to load history from {file_path}: {e}")
+            logger.error(f"Failed to load history for {date_str}: {e}")
             return []
 
+    def query_events(
+        self,
+        date: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        results: Optional[Sequence[EventResult]] = None,
+        event_types: Optional[Sequence[EventType]] = None,
+        wip_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[WorkEvent]:
+        """
+        Query stored events with range and filter conditions.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+            start: Inclusive start time
+            end: Exclusive end time
+            results: Restrict to these results
+            event_types: Restrict to these event types
+            wip_id: Restrict to a WIP ID
+            limit: Maximum number of events
+            offset: Number of events to skip
+
+        Returns:
+            List of WorkEvent objects (most recent first)
+        """
+        rows = self._store.query(
+            date=date,
+            start=start.isoformat() if start else None,
+            end=end.isoformat() if end else None,
+            results=[r.value for r in results] if results else None,
+            event_types=[t.value for t in event_types] if event_types else None,
+            wip_id=wip_id,
+            limit=limit,
+            offset=offset,
+        )
+        return self._to_events(rows)
+
     def get_available_dates(self) -> List[str]:
         """
         Get list of all available history dates.
@@ -363,16 +350,19 @@ class HistoryManager(QObject):
         Returns:
             List of date strings in YYYY-MM-DD format, sorted newest first
         """
-        dates = []
         try:
-            for file_path in sorted(self._history_dir.glob("*_events.json"), reverse=True):
-                # Extract date from filename (YYYY-MM-DD_events.json)
-                date_str = file_path.stem.replace("_events", "")
-                dates.append(date_str)
+            return self._store.get_available_dates()
         except Exception as e:
             logger.error(f"Failed to get available dates: {e}")
+            return []
+
+    def flush(self) -> None:
+        """Block until queued events are persisted."""
+        self._store.flush()
 
-        return dates
+    def close(self) -> None:
+        """Persist queued events and release the store."""
+        self._store.close()
 
 
 # Singleton instance
@@ -0,0 +1,321 @@
+"""
+History Store - Append-only, indexed event log backed by SQLite (WAL).
+
+Appends are queued and written by a background thread in batches, so the
+GUI thread never waits on disk I/O. Queries use indexes on date, timestamp,
+result and WIP ID instead of re-parsing whole day files.
+"""
+import json
+import logging
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_date TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    wip_id TEXT NOT NULL DEFAULT '',
+    lot_number TEXT NOT NULL DEFAULT '',
+    result TEXT NOT NULL,
+    message TEXT NOT NULL DEFAULT '',
+    process_name TEXT NOT NULL DEFAULT '',
+    duration_seconds INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_events_date_timestamp ON events (event_date, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events (timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_result ON events (result, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_wip_id ON events (wip_id, timestamp);
+CREATE TABLE IF NOT EXISTS imported_files (
+    filename TEXT PRIMARY KEY,
+    event_count INTEGER NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "timestamp", "event_type", "wip_id", "lot_number", "result",
+    "message", "process_name", "duration_seconds",
+)
+
+_INSERT_SQL = (
+    "INSERT INTO events (event_date, timestamp, event_type, wip_id, lot_number, "
+    "result, message, process_name, duration_seconds) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_STOP = object()
+
+
+def _to_row(event: Dict[str, Any]) -> tuple:
+    """Convert an event dict (WorkEvent.to_dict()) to an insert row."""
+    timestamp = event["timestamp"]
+    return (
+        timestamp[:10],
+        timestamp,
+        event["event_type"],
+        event.get("wip_id") or "",
+        event.get("lot_number") or "",
+        event["result"],
+        event.get("message") or "",
+        event.get("process_name") or "",
+        event.get("duration_seconds"),
+    )
+
+
+class HistoryStore:
+    """
+    Append-only event store.
+
+    Events are plain dicts in ``WorkEvent.to_dict()`` format. ``append`` is
+    O(1) and non-blocking; reads flush pending writes first so callers
+    always see their own events.
+    """
+
+    def __init__(self, history_dir: Union[str, Path], batch_size: int = 256) -> None:
+        self._history_dir = Path(history_dir)
+        self._history_dir.mkdir(parents=True, exist_ok=True)
+        self._db_path = self._history_dir / DB_FILENAME
+        self._batch_size = batch_size
+
+        # Reader connection is shared by callers and guarded by a lock;
+        # the writer thread owns its own connection.
+        self._read_lock = threading.Lock()
+        self._reader = self._connect()
+        self._reader.executescript(_SCHEMA)
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="history-writer", daemon=True
+        )
+        self._writer.start()
+
+    @property
+    def db_path(self) -> Path:
+        """Path of the SQLite database file."""
+        return self._db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Queue an event for writing (returns immediately)."""
+        self._queue.put(_to_row(event))
+
+    def flush(self) -> None:
+        """Block until all queued events are written."""
+        if self._writer.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending events and stop the writer thread."""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        with self._read_lock:
+            self._reader.close()
+
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                batch = [item]
+                # Drain whatever else is already queued into one transaction
+                while len(batch) < self._batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                rows = [row for row in batch if row is not _STOP]
+                try:
+                    if rows:
+                        with conn:
+                            conn.executemany(_INSERT_SQL, rows)
+                except Exception as e:
+                    logger.error(f"Failed to write {len(rows)} history events: {e}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+
+                if len(rows) != len(batch):
+                    return
+        finally:
+            conn.close()
+
+    def delete_date(self, date_str: str) -> int:
+        """Delete all events of a date (YYYY-MM-DD). Returns deleted count."""
+        self.flush()
+        with self._read_lock, self._reader:
+            cursor = self._reader.execute(
+                "DELETE FROM events WHERE event_date = ?", (date_str,)
+            )
+            return cursor.rowcount
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def query(
+        self,
+        date: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        results: Optional[Sequence[str]] = None,
+        event_types: Optional[Sequence[str]] = None,
+        wip_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query events, most recent first.
+
+        Args:
+            date: Restrict to a date (YYYY-MM-DD)
+            start: Inclusive lower bound on ISO timestamp
+            end: Exclusive upper bound on ISO timestamp
+            results: Restrict to these result values
+            event_types: Restrict to these event types
+            wip_id: Restrict to a WIP ID
+            limit: Maximum number of events
+            offset: Number of events to skip
+
+        Returns:
+            List of event dicts
+        """
+        where, params = self._build_where(date, start, end, results, event_types, wip_id)
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM events{where} ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+
+        self.flush()
+        with self._read_lock:
+            rows = self._reader.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(
+        self,
+        date: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        results: Optional[Sequence[str]] = None,
+        event_types: Optional[Sequence[str]] = None,
+        wip_id: Optional[str] = None,
+    ) -> int:
+        """Count events matching the same filters as ``query``."""
+        where, params = self._build_where(date, start, end, results, event_types, wip_id)
+        self.flush()
+        with self._read_lock:
+            row = self._reader.execute(f"SELECT COUNT(*) FROM events{where}", params).fetchone()
+        return row[0]
+
+    def get_available_dates(self) -> List[str]:
+        """Dates that have events, newest first (served from the date index)."""
+        self.flush()
+        with self._read_lock:
+            rows = self._reader.execute(
+                "SELECT DISTINCT event_date FROM events ORDER BY event_date DESC"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _build_where(
+        date: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+        results: Optional[Sequence[str]],
+        event_types: Optional[Sequence[str]],
+        wip_id: Optional[str],
+    ) -> tuple:
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        if date is not None:
+            clauses.append("event_date = ?")
+            params.append(date)
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("timestamp < ?")
+            params.append(end)
+        if results:
+            clauses.append(f"result IN ({', '.join('?' for _ in results)})")
+            params.extend(results)
+        if event_types:
+            clauses.append(f"event_type IN ({', '.join('?' for _ in event_types)})")
+            params.extend(event_types)
+        if wip_id is not None:
+            clauses.append("wip_id = ?")
+            params.append(wip_id)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    # =========================================================================
+    # Legacy Import
+    # =========================================================================
+
+    def import_legacy_files(self, files: Optional[Iterable[Path]] = None) -> int:
+        """
+        Import legacy ``*_events.json`` day files (once per file).
+
+        Args:
+            files: Files to import (default: all in the history directory)
+
+        Returns:
+            Number of events imported
+        """
+        if files is None:
+            files = sorted(self._history_dir.glob("*_events.json"))
+
+        with self._read_lock:
+            imported = {
+                row[0] for row in self._reader.execute("SELECT filename FROM imported_files")
+            }
+
+        total = 0
+        for file_path in files:
+            if file_path.name in imported:
+                continue
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.error(f"Failed to read legacy history {file_path}: {e}")
+                continue
+
+            rows = []
+            for event_dict in data.get('events', []):
+                try:
+                    rows.append(_to_row(event_dict))
+                except (KeyError, TypeError) as e:
+                    logger.warning(f"Skipping malformed event in {file_path.name}: {e}")
+
+            with self._read_lock, self._reader:
+                self._reader.executemany(_INSERT_SQL, rows)
+                self._reader.execute(
+                    "INSERT INTO imported_files (filename, event_count) VALUES (?, ?)",
+                    (file_path.name, len(rows)),
+                )
+            total += len(rows)
+            logger.info(f"Imported {len(rows)} events from {file_path.name}")
+
+        return total
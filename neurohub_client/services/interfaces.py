@@ -54,13 +54,20 @@ class IAPIClient(Protocol):
         """
         ...
 
-    def post(self, endpoint: str, data: Dict[str, Any]) -> Any:
+    def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        idempotency_key: Optional[str] = None
+    ) -> Any:
         """
         Perform POST request.
 
         Args:
             endpoint: API endpoint path
             data: Request body data
+            idempotency_key: Idempotency-Key for safe re-submission
+                (generated per call if omitted)
 
         Returns:
             Response data (JSON decoded)
@@ -182,13 +189,20 @@ class IWorkService(Protocol):
         """
         ...
 
-    def start_work_sync(self, worker_id: str, wip_id: str) -> Dict[str, Any]:
+    def start_work_sync(
+        self,
+        worker_id: str,
+        wip_id: str,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Start work synchronously (for TCP server use).
 
         Args:
             worker_id: Worker identifier
             wip_id: WIP ID (required)
+            idempotency_key: Key of the triggering message, so a re-sent
+                START is not registered twice
 
         Returns:
             Dict with 'success' (bool) and 'error' or 'data'
@@ -19,6 +19,7 @@ from typing import Any, Dict, List, Optional
 from PySide6.QtCore import QObject, Signal
 
 from utils.logger import setup_logger
+from .api_client import make_idempotency_key
 
 logger = setup_logger()
 
@@ -281,7 +282,10 @@ class TCPServer:
                             worker_id = self._auth_service.get_current_user_id()
                             api_result = self._work_service.start_work_sync(
                                 worker_id=worker_id,
-                                wip_id=start_data.wip_id
+                                wip_id=start_data.wip_id,
+                                idempotency_key=make_idempotency_key(
+                                    "start", worker_id, json_data
+                                )
                             )
 
                             if api_result.get("success"):
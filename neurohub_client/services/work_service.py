@@ -12,6 +12,7 @@ from PySide6.QtCore import QObject, Signal
 from utils.exception_handler import safe_cleanup
 from utils.wip_validator import validate_wip_id
 
+from .api_client import make_idempotency_key
 from .workers import APIWorker
 
 logger = logging.getLogger(__name__)
@@ -87,7 +88,8 @@ class WorkService(QObject):
     def start_work_sync(
         self,
         worker_id: str,
-        wip_id: str
+        wip_id: str,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Start work synchronously - for TCP server use.
@@ -95,6 +97,8 @@ class WorkService(QObject):
         Args:
             worker_id: Worker ID
             wip_id: WIP ID (required)
+            idempotency_key: Key of the triggering message, so a re-sent
+                START is answered from the first request
 
         Returns:
             Dict with 'success' (bool) and 'error' (str) or 'data' (dict)
@@ -119,7 +123,9 @@ class WorkService(QObject):
             logger.debug(f"Start work data (sync): {data}")
 
             # Synchronous API call
-            result = self.api_client.post("/api/v1/process-operations/start", data)
+            result = self.api_client.post(
+                "/api/v1/process-operations/start", data, idempotency_key=idempotency_key
+            )
 
             logger.info(f"Start work success (sync): {result}")
             return {"success": True, "data": result}
@@ -167,14 +173,19 @@ class WorkService(QObject):
                 "defect_data": json_data.get('defect_data')
             }
 
-            logger.debug(f"Complete work data: {data}")
+            logger.debug("Complete work data: %s", data)
 
+            # Same completion event -> same key: a re-submitted file or
+            # equipment message is replayed by the backend, not completed twice
             worker = APIWorker(
                 api_client=self.api_client,
                 operation="complete_work",
                 method="POST",
                 endpoint="/api/v1/process-operations/complete",
-                data=data
+                data=data,
+                idempotency_key=make_idempotency_key(
+                    "complete", self.config.process_db_id, json_data
+                )
             )
             worker.success.connect(self._on_api_success)
             worker.error.connect(self._on_api_error)
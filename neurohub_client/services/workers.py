@@ -49,7 +49,8 @@ class APIWorker(QThread):
         method: str = "GET",
         endpoint: str = "",
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
     ) -> None:
         super().__init__()
         self.api_client: Any = api_client
@@ -58,6 +59,7 @@ class APIWorker(QThread):
         self.endpoint: str = endpoint
         self.data: Optional[Dict[str, Any]] = data
         self.params: Optional[Dict[str, Any]] = params
+        self.idempotency_key: Optional[str] = idempotency_key
         self._is_cancelled: bool = False
 
     def run(self) -> None:
@@ -74,7 +76,9 @@ class APIWorker(QThread):
             if self.method == "GET":
                 result = self.api_client.get(self.endpoint, self.params)
             elif self.method == "POST":
-                result = self.api_client.post(self.endpoint, self.data)
+                result = self.api_client.post(
+                    self.endpoint, self.data, idempotency_key=self.idempotency_key
+                )
             elif self.method == "PUT":
                 result = self.api_client.put(self.endpoint, self.data)
             elif self.method == "DELETE":
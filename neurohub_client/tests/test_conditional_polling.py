@@ -0,0 +1,151 @@
+"""
+Tests for conditional GET (If-None-Match) polling and the APIClient response cache.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtWidgets import QApplication
+
+from services.api_client import APIClient
+from viewmodels.wip_dashboard_viewmodel import WIPDashboardViewModel
+
+STATS = {"total": 3, "by_lot": [], "by_process": {}}
+ETAG = '"abc123-1"'
+
+
+class StatisticsServer:
+    """Local server answering /statistics with an ETag and 304s."""
+
+    def __init__(self):
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append(self.headers.get("If-None-Match"))
+                if self.headers.get("If-None-Match") == ETAG:
+                    self.send_response(304)
+                    self.send_header("ETag", ETAG)
+                    self.end_headers()
+                    return
+                body = json.dumps(STATS).encode()
+                self.send_response(200)
+                self.send_header("ETag", ETAG)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    stats_server = StatisticsServer()
+    yield stats_server
+    stats_server.close()
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def _wait_for_worker(viewmodel, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while viewmodel.worker.isRunning() and time.monotonic() < deadline:
+        viewmodel.worker.wait(50)
+    QCoreApplication.processEvents()
+
+
+class TestAPIClientConditionalGet:
+    """Test APIClient.get_if_changed."""
+
+    def test_returns_data_then_not_modified(self, server):
+        client = APIClient(server.base_url)
+
+        data, etag = client.get_wip_statistics_if_changed()
+        assert data == STATS
+        assert etag == ETAG
+
+        data, etag = client.get_wip_statistics_if_changed(etag)
+        assert data is None
+        assert etag == ETAG
+        assert server.requests == [None, ETAG]
+
+
+class TestAPIClientResponseCache:
+    """Test APIClient.get sends validators automatically."""
+
+    def test_get_revalidates_cached_response(self, server):
+        client = APIClient(server.base_url)
+
+        first = client.get("/api/v1/processes/")
+        second = client.get("/api/v1/processes/")
+
+        assert first == second == STATS
+        assert first is not second
+        assert server.requests == [None, ETAG]
+
+    def test_cache_is_keyed_by_params_and_cleared_on_login(self, server):
+        client = APIClient(server.base_url)
+
+        client.get("/api/v1/lots/", params={"status": "CREATED"})
+        client.get("/api/v1/lots/", params={"status": "CLOSED"})
+        client.set_token("token")
+        client.get("/api/v1/lots/", params={"status": "CREATED"})
+
+        assert server.requests == [None, None, None]
+
+
+class TestDashboardPolling:
+    """Test WIPDashboardViewModel background polling."""
+
+    def test_poll_runs_on_worker_and_skips_unchanged(self, qapp):
+        api_client = Mock()
+        api_client.get_wip_statistics_if_changed.return_value = (STATS, ETAG)
+        viewmodel = WIPDashboardViewModel(api_client)
+        updates = []
+        viewmodel.statistics_updated.connect(updates.append)
+
+        viewmodel.refresh_statistics()
+        _wait_for_worker(viewmodel)
+        assert updates == [STATS]
+
+        api_client.get_wip_statistics_if_changed.return_value = (None, ETAG)
+        viewmodel.refresh_statistics()
+        _wait_for_worker(viewmodel)
+
+        api_client.get_wip_statistics_if_changed.assert_called_with(ETAG)
+        assert updates == [STATS]
+        assert viewmodel.current_statistics == STATS
+        viewmodel.cleanup()
+
+    def test_error_is_reported(self, qapp):
+        api_client = Mock()
+        api_client.get_wip_statistics_if_changed.side_effect = Exception("down")
+        viewmodel = WIPDashboardViewModel(api_client)
+        errors = []
+        viewmodel.error_occurred.connect(errors.append)
+
+        viewmodel.refresh_statistics()
+        _wait_for_worker(viewmodel)
+
+        assert len(errors) == 1
+        assert "실패" in errors[0]
+        viewmodel.cleanup()
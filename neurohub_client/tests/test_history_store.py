@@ -0,0 +1,158 @@
+"""
+Tests for the append-only history store and HistoryManager persistence.
+"""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.history_manager import EventResult, EventType, HistoryManager, WorkEvent
+from services.history_store import HistoryStore
+
+
+def _event(timestamp: datetime, result: str = "PASS", wip_id: str = "WIP-001") -> dict:
+    return WorkEvent(
+        timestamp=timestamp,
+        event_type=EventType.COMPLETE,
+        wip_id=wip_id,
+        lot_number="LOT-001",
+        result=EventResult(result),
+        message="done",
+        process_name="Laser",
+        duration_seconds=12,
+    ).to_dict()
+
+
+@pytest.fixture
+def store(tmp_path):
+    history_store = HistoryStore(tmp_path)
+    yield history_store
+    history_store.close()
+
+
+class TestHistoryStore:
+    """Test HistoryStore appends and indexed queries."""
+
+    def test_append_and_query_most_recent_first(self, store):
+        base = datetime(2025, 11, 25, 9, 0, 0)
+        for i in range(5):
+            store.append(_event(base + timedelta(minutes=i)))
+
+        events = store.query(date="2025-11-25")
+
+        assert len(events) == 5
+        assert events[0]["timestamp"] == (base + timedelta(minutes=4)).isoformat()
+        assert events[-1]["timestamp"] == base.isoformat()
+
+    def test_filters_and_pagination(self, store):
+        base = datetime(2025, 11, 25, 9, 0, 0)
+        for i in range(10):
+            store.append(_event(
+                base + timedelta(minutes=i),
+                result="FAIL" if i % 2 else "PASS",
+                wip_id=f"WIP-{i % 3}",
+            ))
+
+        assert store.count(results=["FAIL"]) == 5
+        assert store.count(wip_id="WIP-0") == 4
+        assert store.count(
+            start=(base + timedelta(minutes=2)).isoformat(),
+            end=(base + timedelta(minutes=5)).isoformat(),
+        ) == 3
+
+        page = store.query(limit=3, offset=3)
+        assert [e["timestamp"] for e in page] == [
+            (base + timedelta(minutes=m)).isoformat() for m in (6, 5, 4)
+        ]
+
+    def test_available_dates_newest_first(self, store):
+        store.append(_event(datetime(2025, 11, 25, 9, 0)))
+        store.append(_event(datetime(2025, 12, 1, 9, 0)))
+        store.append(_event(datetime(2025, 11, 27, 9, 0)))
+
+        assert store.get_available_dates() == ["2025-12-01", "2025-11-27", "2025-11-25"]
+
+    def test_delete_date(self, store):
+        store.append(_event(datetime(2025, 11, 25, 9, 0)))
+        store.append(_event(datetime(2025, 11, 26, 9, 0)))
+
+        assert store.delete_date("2025-11-25") == 1
+        assert store.get_available_dates() == ["2025-11-26"]
+
+    def test_events_survive_reopen(self, tmp_path):
+        first = HistoryStore(tmp_path)
+        first.append(_event(datetime(2025, 11, 25, 9, 0)))
+        first.close()
+
+        second = HistoryStore(tmp_path)
+        try:
+            assert second.count() == 1
+        finally:
+            second.close()
+
+    def test_legacy_import_runs_once(self, tmp_path):
+        legacy = {
+            "date": "2025-11-25",
+            "count": 2,
+            "events": [
+                _event(datetime(2025, 11, 25, 10, 0)),
+                _event(datetime(2025, 11, 25, 9, 0), result="FAIL"),
+            ],
+        }
+        (tmp_path / "2025-11-25_events.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+        store = HistoryStore(tmp_path)
+        try:
+            assert store.import_legacy_files() == 2
+            assert store.import_legacy_files() == 0
+            assert store.count(date="2025-11-25") == 2
+        finally:
+            store.close()
+
+
+class TestHistoryManagerPersistence:
+    """Test HistoryManager on top of the store."""
+
+    def test_events_persist_and_reload(self, tmp_path):
+        manager = HistoryManager(max_events=3, history_dir=tmp_path)
+        for i in range(5):
+            manager.add_complete_event(f"WIP-{i}", "LOT-001", "PASS", process_name="Laser")
+
+        assert manager.get_event_count() == 3
+        assert manager.get_all_events()[0].wip_id == "WIP-4"
+        manager.close()
+
+        reloaded = HistoryManager(max_events=10, history_dir=tmp_path)
+        try:
+            today = datetime.now().strftime("%Y-%m-%d")
+            assert [e.wip_id for e in reloaded.get_all_events()] == [
+                "WIP-4", "WIP-3", "WIP-2", "WIP-1", "WIP-0"
+            ]
+            assert reloaded.get_available_dates() == [today]
+            assert len(reloaded.load_events_by_date(today)) == 5
+        finally:
+            reloaded.close()
+
+    def test_query_events_by_result(self, tmp_path):
+        manager = HistoryManager(history_dir=tmp_path)
+        try:
+            manager.add_complete_event("WIP-1", "LOT-001", "PASS")
+            manager.add_complete_event("WIP-2", "LOT-001", "FAIL")
+            manager.add_error_event("WIP-3", "LOT-001", "Timeout")
+
+            failed = manager.query_events(results=[EventResult.FAIL, EventResult.ERROR])
+
+            assert [e.wip_id for e in failed] == ["WIP-3", "WIP-2"]
+        finally:
+            manager.close()
+
+    def test_clear_removes_today(self, tmp_path):
+        manager = HistoryManager(history_dir=tmp_path)
+        try:
+            manager.add_start_event("WIP-1", "LOT-001")
+            manager.clear()
+
+            assert manager.get_event_count() == 0
+            assert manager.get_available_dates() == []
+        finally:
+            manager.close()
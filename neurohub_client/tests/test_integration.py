@@ -72,6 +72,9 @@ def mock_api_client():
         ],
         "alerts": []
     }
+    client.get_wip_statistics_if_changed.return_value = (
+        client.get_wip_statistics.return_value, '"stats-1"'
+    )
 
     return client
 
@@ -268,21 +271,21 @@ class TestWIPScanIntegration:
 class TestWIPDashboardIntegration:
     """Integration tests for WIP Dashboard workflow."""
 
-    def test_dashboard_viewmodel_to_page_integration(self, qapp, mock_api_client, app_config):
+    def test_dashboard_viewmodel_to_page_integration(self, qapp, mock_api_client, app_config, qtbot):
         """Test ViewModel to Page signal integration."""
-        # Create ViewModel and Page
+        # Create ViewModel and Page (starts the first background poll)
         viewmodel = WIPDashboardViewModel(mock_api_client)
         page = WIPDashboardPage(viewmodel, app_config)
 
         # Verify signal connections
         assert viewmodel.statistics_updated.receivers(viewmodel.statistics_updated) > 0
 
-        # Trigger statistics refresh
-        viewmodel.refresh_statistics()
+        # Wait for the poll worker to deliver statistics
+        qtbot.waitUntil(lambda: page.lot_model.rowCount() == 1)
 
         # Verify UI updated
         assert "100" in page.total_label.text()
-        assert page.lot_table.rowCount() == 1
+        assert page.lot_model.rowCount() == 1
 
     def test_dashboard_auto_refresh(self, qapp, mock_api_client, app_config, qtbot):
         """Test dashboard auto-refresh functionality."""
@@ -0,0 +1,103 @@
+"""
+Tests for streaming report export: page-by-page writing, progress, cancel.
+"""
+import csv
+
+import pytest
+
+from utils.export_utils import CSVExporter, ExcelExporter, ExportCancelled, PDFExporter
+from utils.report_generator import ReportData
+
+REPORT = ReportData(
+    report_type="wip_status",
+    generated_at="2025-11-20T09:30:00",
+    generated_by="system",
+    summary={"total_wip": 2500, "by_status": {"IN_PROGRESS": 2500}},
+)
+
+
+class Pages:
+    """Row pages generated on demand, counting how many were consumed."""
+
+    def __init__(self, total: int = 2500, page_size: int = 1000):
+        self.total = total
+        self.page_size = page_size
+        self.consumed = 0
+
+    def __iter__(self):
+        for start in range(0, self.total, self.page_size):
+            self.consumed += 1
+            yield [
+                {"wip_id": f"WIP-{n:05d}", "status": "IN_PROGRESS", "process_name": "Process 1"}
+                for n in range(start, min(start + self.page_size, self.total))
+            ]
+
+
+class TestCSVExport:
+    """Test CSV export streams every page."""
+
+    def test_writes_all_pages_and_reports_progress(self, tmp_path):
+        path = tmp_path / "report.csv"
+        progress = []
+
+        rows = CSVExporter.export_stream(
+            REPORT, Pages(), str(path), total=2500, on_progress=lambda *p: progress.append(p)
+        )
+
+        assert rows == 2500
+        assert progress == [(1000, 2500), (2000, 2500), (2500, 2500)]
+        lines = list(csv.reader(path.open(encoding="utf-8-sig")))
+        assert ["total_wip", "2500"] in lines
+        assert lines[-1] == ["WIP-02499", "IN_PROGRESS", "Process 1"]
+
+    def test_cancel_stops_fetching_and_removes_file(self, tmp_path):
+        path = tmp_path / "report.csv"
+        pages = Pages()
+        progress = []
+
+        with pytest.raises(ExportCancelled):
+            CSVExporter.export_stream(
+                REPORT, pages, str(path), total=2500,
+                on_progress=lambda *p: progress.append(p),
+                is_cancelled=lambda: len(progress) >= 1,
+            )
+
+        assert pages.consumed == 1
+        assert not path.exists()
+        assert not list(tmp_path.iterdir())
+
+    def test_empty_report(self, tmp_path):
+        path = tmp_path / "report.csv"
+
+        assert CSVExporter.export_stream(REPORT, [], str(path)) == 0
+        assert "상세 데이터" not in path.read_text(encoding="utf-8-sig")
+
+
+class TestExcelExport:
+    """Test Excel export with a write-only workbook."""
+
+    def test_streams_rows_with_named_styles(self, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl")
+        path = tmp_path / "report.xlsx"
+
+        assert ExcelExporter.export_stream(REPORT, Pages(), str(path), total=2500) == 2500
+
+        workbook = openpyxl.load_workbook(path)
+        sheet = workbook["보고서"]
+        rows = list(sheet.iter_rows(values_only=True))
+        assert rows[-1] == ("WIP-02499", "IN_PROGRESS", "Process 1")
+        assert {"report_header", "report_cell"} <= set(workbook.named_styles)
+        assert sheet.cell(row=sheet.max_row, column=1).style == "report_cell"
+
+
+class TestPDFExport:
+    """Test PDF export only fetches the rows it renders."""
+
+    def test_reads_first_page_only(self, tmp_path):
+        pytest.importorskip("reportlab")
+        path = tmp_path / "report.pdf"
+        pages = Pages()
+
+        assert PDFExporter.export_stream(REPORT, pages, str(path), total=2500) == 50
+        assert pages.consumed == 1
+        assert path.read_bytes().startswith(b"%PDF")
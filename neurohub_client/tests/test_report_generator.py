@@ -0,0 +1,45 @@
+"""
+Tests for ReportGenerator paging through server-side reports.
+"""
+from utils.report_generator import PAGE_SIZE, ReportGenerator
+
+SUMMARY = {"total_wip": 2500, "by_status": {"IN_PROGRESS": 2500}, "by_process": {}}
+
+
+class FakeAPIClient:
+    """Serves a report of `total` rows in pages, recording the requests."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.requests = []
+
+    def get(self, endpoint, params=None):
+        self.requests.append((endpoint, params))
+        skip, limit = params["skip"], params["limit"]
+        items = [{"wip_id": f"WIP-{n}"} for n in range(skip, min(skip + limit, self.total))]
+        return {"items": items, "total": self.total, "skip": skip, "limit": limit, "summary": SUMMARY}
+
+
+class TestReportGenerator:
+    """Test reports are fetched page by page with the server's summary."""
+
+    def test_fetches_all_pages(self):
+        api_client = FakeAPIClient(total=2500)
+
+        report = ReportGenerator(api_client).generate_wip_status_report(process_id=3)
+
+        assert len(report.data) == 2500
+        assert report.data[-1] == {"wip_id": "WIP-2499"}
+        assert report.summary == SUMMARY
+        assert [params["skip"] for _, params in api_client.requests] == [0, PAGE_SIZE, 2 * PAGE_SIZE]
+        assert all(params["process_id"] == 3 for _, params in api_client.requests)
+        assert report.filters == {"process_id": 3}
+
+    def test_empty_report(self):
+        api_client = FakeAPIClient(total=0)
+
+        report = ReportGenerator(api_client).generate_process_performance_report("2025-11-01", "2025-11-30")
+
+        assert report.data == []
+        assert len(api_client.requests) == 1
+        assert api_client.requests[0][0] == "/api/v1/reports/process-performance"
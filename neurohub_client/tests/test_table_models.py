@@ -0,0 +1,145 @@
+"""
+Tests for the virtualized table models and the history page built on them.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from models.table_models import Column, RecordFilterProxyModel, RecordTableModel
+from services.history_manager import EventResult, EventType, WorkEvent
+from utils.theme_manager import get_theme
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+COLUMNS = [
+    Column("Name", lambda r: r["name"]),
+    Column("Value", lambda r: str(r["value"]), Qt.AlignCenter,
+           foreground=lambda r: get_theme().get_qt_brush("colors.success.main")),
+]
+
+
+def _records(count: int, start: int = 0) -> list:
+    return [{"name": f"item-{i}", "value": i} for i in range(start, start + count)]
+
+
+class TestRecordTableModel:
+    """Test lazy data lookups and incremental row changes."""
+
+    def test_data_is_computed_from_records(self, qapp):
+        model = RecordTableModel(COLUMNS)
+        model.set_records(_records(3))
+
+        assert model.rowCount() == 3
+        assert model.columnCount() == 2
+        assert model.headerData(1, Qt.Horizontal) == "Value"
+        assert model.data(model.index(2, 0)) == "item-2"
+        assert model.data(model.index(1, 1), Qt.TextAlignmentRole) == Qt.AlignCenter
+        assert model.data(model.index(0, 1), RecordTableModel.RecordRole) == {"name": "item-0", "value": 0}
+
+    def test_foreground_brush_is_shared(self, qapp):
+        model = RecordTableModel(COLUMNS)
+        model.set_records(_records(2))
+
+        first = model.data(model.index(0, 1), Qt.ForegroundRole)
+        second = model.data(model.index(1, 1), Qt.ForegroundRole)
+
+        assert first is second
+        assert model.data(model.index(0, 0), Qt.ForegroundRole) is None
+
+    def test_prepend_emits_insert_only(self, qapp):
+        model = RecordTableModel(COLUMNS)
+        model.set_records(_records(3))
+        inserted, resets = [], []
+        model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+        model.modelReset.connect(lambda: resets.append(True))
+
+        model.prepend_records(_records(1, start=10))
+
+        assert inserted == [(0, 0)]
+        assert resets == []
+        assert model.record(0)["name"] == "item-10"
+
+    def test_max_rows_trims_tail(self, qapp):
+        model = RecordTableModel(COLUMNS, max_rows=3)
+        model.set_records(_records(3))
+
+        model.prepend_records(_records(2, start=10))
+
+        assert model.rowCount() == 3
+        assert [r["value"] for r in model.records()] == [10, 11, 0]
+
+
+class TestRecordFilterProxyModel:
+    """Test predicate filtering without touching the source model."""
+
+    def test_predicate_filters_and_maps_records(self, qapp):
+        model = RecordTableModel(COLUMNS)
+        model.set_records(_records(10))
+        proxy = RecordFilterProxyModel()
+        proxy.setSourceModel(model)
+
+        proxy.set_predicate(lambda r: r["value"] % 2 == 0)
+        assert proxy.rowCount() == 5
+        assert proxy.record(1)["value"] == 2
+
+        model.prepend_records([{"name": "new", "value": 100}])
+        assert proxy.rowCount() == 6
+        assert proxy.record(0)["name"] == "new"
+
+        proxy.set_predicate(None)
+        assert proxy.rowCount() == 11
+
+
+class TestHistoryPageModel:
+    """Test HistoryPage renders large days through the model."""
+
+    @pytest.fixture
+    def page(self, qapp, tmp_path, monkeypatch):
+        from services import history_manager as history_module
+        from views.pages.history_page import HistoryPage
+
+        manager = history_module.HistoryManager(history_dir=tmp_path)
+        monkeypatch.setattr("views.pages.history_page.get_history_manager", lambda: manager)
+
+        base = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        results = [EventResult.PASS, EventResult.FAIL, EventResult.ERROR, EventResult.SUCCESS]
+        for i in range(100_000):
+            manager._store.append(WorkEvent(
+                timestamp=base + timedelta(milliseconds=i),
+                event_type=EventType.COMPLETE,
+                wip_id=f"WIP-{i}",
+                lot_number="LOT-001",
+                result=results[i % 4],
+                message="done",
+            ).to_dict())
+
+        page = HistoryPage(config=None)
+        yield page, manager
+        page.deleteLater()
+        manager.close()
+
+    def test_large_day_filter_and_incremental_insert(self, page):
+        page, manager = page
+
+        assert page.model.rowCount() == 100_000
+        assert page.total_label.text() == "전체: 100000"
+        assert page.success_label.text() == "성공: 50000"
+
+        page.filter_combo.setCurrentIndex(2)  # 실패/에러
+        assert page.proxy_model.rowCount() == 50_000
+
+        inserted = []
+        page.model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+        manager.add_error_event("WIP-NEW", "LOT-001", "Timeout")
+
+        assert inserted == [(0, 0)]
+        assert page.proxy_model.rowCount() == 50_001
+        assert page.proxy_model.record(0).wip_id == "WIP-NEW"
+        assert page.error_label.text() == "실패: 50001"
@@ -0,0 +1,141 @@
+"""
+Tests for the APIClient transport: compression negotiation, keep-alive reuse
+and Idempotency-Key headers on writes.
+"""
+import gzip
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from services.api_client import APIClient, make_idempotency_key
+
+STATS = {"by_process": {f"P{n:02d}": {"in_progress": n, "waiting": 10 - n} for n in range(1, 9)},
+         "by_lot": [{"lot_number": f"KR01PSA2511{n:02d}", "progress": n} for n in range(50)]}
+
+
+class CompressingServer:
+    """Local HTTP/1.1 server gzipping responses when the client accepts it."""
+
+    def __init__(self):
+        self.requests = []  # (client port, request headers)
+        self.wire_bytes = []
+        self.failures = 0  # Answer this many requests with 503 first
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self):
+                server.requests.append((self.client_address[1], dict(self.headers)))
+                length = int(self.headers.get("Content-Length", 0))
+                if length:
+                    self.rfile.read(length)
+                if server.failures:
+                    server.failures -= 1
+                    self.send_response(503)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = json.dumps(STATS).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                server.wire_bytes.append(len(body))
+
+            do_GET = _reply
+            do_POST = _reply
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    compressing_server = CompressingServer()
+    yield compressing_server
+    compressing_server.close()
+
+
+class TestAPIClientTransport:
+    """Test APIClient negotiates compression and reuses connections."""
+
+    def test_accepts_and_decodes_gzip(self, server):
+        client = APIClient(server.base_url)
+
+        assert client.get("/api/v1/wip-items/statistics") == STATS
+
+        _, headers = server.requests[0]
+        assert "gzip" in headers["Accept-Encoding"]
+        assert "Content-Type" not in headers
+        assert server.wire_bytes[0] < len(json.dumps(STATS)) / 2
+
+    def test_reuses_keep_alive_connection(self, server):
+        client = APIClient(server.base_url)
+        client.set_token("token")
+
+        for _ in range(5):
+            client.get("/api/v1/wip-items/statistics")
+        client.post("/api/v1/wip-items/WIP-1/scan", {})
+
+        assert len(server.requests) == 6
+        assert len({port for port, _ in server.requests}) == 1
+        assert server.requests[-1][1]["Authorization"] == "Bearer token"
+
+    def test_debug_logging_omits_payloads(self, server, caplog):
+        client = APIClient(server.base_url)
+        client.set_token("secret-token")
+
+        with caplog.at_level(logging.DEBUG, logger="services.api_client"):
+            client.post("/api/v1/wip-items/WIP-1/scan", {"process_id": 1})
+
+        assert "gzip" in caplog.text
+        assert "secret-token" not in caplog.text
+        assert "by_lot" not in caplog.text
+
+
+class TestIdempotencyKeys:
+    """Test POSTs carry an Idempotency-Key that survives retries."""
+
+    def test_retry_reuses_key(self, server):
+        client = APIClient(server.base_url)
+        server.failures = 1
+
+        assert client.post("/api/v1/process-operations/complete", {"wip_id": "WIP-1"}) == STATS
+
+        keys = [headers["Idempotency-Key"] for _, headers in server.requests]
+        assert len(keys) == 2
+        assert keys[0] == keys[1]
+
+    def test_each_call_gets_a_new_key_unless_given(self, server):
+        client = APIClient(server.base_url)
+
+        client.post("/api/v1/process-operations/start", {"wip_id": "WIP-1"})
+        client.post("/api/v1/process-operations/start", {"wip_id": "WIP-1"})
+        client.post("/api/v1/process-operations/start", {"wip_id": "WIP-1"}, idempotency_key="event-1")
+
+        keys = [headers["Idempotency-Key"] for _, headers in server.requests]
+        assert keys[0] != keys[1]
+        assert keys[2] == "event-1"
+
+    def test_make_idempotency_key_is_stable(self):
+        event = {"wip_id": "WIP-1", "result": "PASS", "measurements": {"v": 3.3, "a": 0.1}}
+        reordered = {"measurements": {"a": 0.1, "v": 3.3}, "result": "PASS", "wip_id": "WIP-1"}
+
+        assert make_idempotency_key("complete", 3, event) == make_idempotency_key("complete", 3, reordered)
+        assert make_idempotency_key("complete", 3, event) != make_idempotency_key("complete", 4, event)
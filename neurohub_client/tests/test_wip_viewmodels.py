@@ -512,7 +512,7 @@ class TestWIPDashboardViewModel:
     def test_start_auto_refresh(self, viewmodel, mock_api_client):
         """Test starting auto-refresh."""
         # Setup mock
-        mock_api_client.get_wip_statistics.return_value = {"total_wip": 0}
+        mock_api_client.get_wip_statistics_if_changed.return_value = ({"total_wip": 0}, None)
 
         # Execute
         viewmodel.start_auto_refresh()
@@ -554,8 +554,8 @@ class TestWIPDashboardViewModel:
         # Timer should not be started
         assert not viewmodel.refresh_timer.isActive()
 
-    def test_refresh_statistics_success(self, viewmodel, mock_api_client):
-        """Test successful statistics refresh."""
+    def test_refresh_statistics_success(self, viewmodel, mock_api_client, qtbot):
+        """Test successful statistics refresh on the worker thread."""
         # Setup mock
         mock_stats = {
             "total_wip": 100,
@@ -563,35 +563,47 @@ class TestWIPDashboardViewModel:
             "by_lot": [],
             "alerts": []
         }
-        mock_api_client.get_wip_statistics.return_value = mock_stats
+        mock_api_client.get_wip_statistics_if_changed.return_value = (mock_stats, '"v1"')
 
-        # Capture signal
+        # Execute
+        with qtbot.waitSignal(viewmodel.statistics_updated) as blocker:
+            viewmodel.refresh_statistics()
+
+        # Verify
+        assert blocker.args == [mock_stats]
+        assert viewmodel.current_statistics == mock_stats
+        mock_api_client.get_wip_statistics_if_changed.assert_called_once_with(None)
+
+    def test_refresh_statistics_not_modified(self, viewmodel, mock_api_client, qtbot):
+        """Test 304 responses keep current statistics without emitting."""
+        mock_stats = {"total_wip": 100}
+        mock_api_client.get_wip_statistics_if_changed.return_value = (mock_stats, '"v1"')
+        with qtbot.waitSignal(viewmodel.statistics_updated):
+            viewmodel.refresh_statistics()
+
+        # Second poll: server answers 304
+        mock_api_client.get_wip_statistics_if_changed.return_value = (None, '"v1"')
         stats_data = []
         viewmodel.statistics_updated.connect(lambda stats: stats_data.append(stats))
-
-        # Execute
         viewmodel.refresh_statistics()
+        qtbot.waitUntil(lambda: not viewmodel.worker.isRunning())
+        qtbot.wait(10)
 
-        # Verify
+        mock_api_client.get_wip_statistics_if_changed.assert_called_with('"v1"')
+        assert stats_data == []
         assert viewmodel.current_statistics == mock_stats
-        assert stats_data == [mock_stats]
-        mock_api_client.get_wip_statistics.assert_called_once()
 
-    def test_refresh_statistics_error(self, viewmodel, mock_api_client):
+    def test_refresh_statistics_error(self, viewmodel, mock_api_client, qtbot):
         """Test statistics refresh with error."""
         # Setup mock to raise exception
-        mock_api_client.get_wip_statistics.side_effect = Exception("API Error")
-
-        # Capture error signal
-        error_msgs = []
-        viewmodel.error_occurred.connect(lambda msg: error_msgs.append(msg))
+        mock_api_client.get_wip_statistics_if_changed.side_effect = Exception("API Error")
 
         # Execute
-        viewmodel.refresh_statistics()
+        with qtbot.waitSignal(viewmodel.error_occurred) as blocker:
+            viewmodel.refresh_statistics()
 
         # Verify
-        assert len(error_msgs) == 1
-        assert "실패" in error_msgs[0]
+        assert "실패" in blocker.args[0]
 
     def test_get_process_wip_counts(self, viewmodel):
         """Test getting WIP counts by process."""
@@ -1,14 +1,103 @@
 """
-Export utilities for Excel and PDF generation.
+Export utilities for Excel, CSV and PDF generation.
 
-Provides functions to export ReportData to Excel and PDF formats.
+Provides functions to export ReportData to Excel, CSV and PDF formats.
+
+Exports stream: rows are consumed page by page (see
+ReportGenerator.open_report) and written as they arrive, so memory stays
+constant regardless of report size:
+    - Excel uses an openpyxl write-only workbook with shared named styles
+    - CSV is written row by row
+    - PDF only renders its first PDF_MAX_ROWS rows and stops fetching
+
+export_stream() reports progress as (rows written, total rows) after each
+page and stops with ExportCancelled when is_cancelled() returns True. The
+file is written next to the target and only moved into place when the
+export completes.
 """
+import csv
+import importlib.util
 import logging
+import os
+from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime
-from typing import Any
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Rows sampled to size Excel columns (write-only sheets fix widths up front)
+WIDTH_SAMPLE_ROWS = 200
+
+# Rows rendered into the PDF data table
+PDF_MAX_ROWS = 50
+
+ProgressCallback = Callable[[int, int], None]
+CancelCheck = Callable[[], bool]
+Pages = Iterable[List[Dict[str, Any]]]
+
+
+class ExportCancelled(Exception):
+    """Raised by export_stream() when the export is cancelled."""
+
+
+def _stream_rows(
+    pages: Pages,
+    total: Optional[int],
+    on_progress: Optional[ProgressCallback],
+    is_cancelled: Optional[CancelCheck]
+) -> Iterator[Dict[str, Any]]:
+    """Rows of all pages, reporting progress and checking for cancellation per page."""
+    written = 0
+    page_iterator = iter(pages)
+    while True:
+        # Checked before each page is fetched
+        if is_cancelled and is_cancelled():
+            raise ExportCancelled()
+        page = next(page_iterator, None)
+        if page is None:
+            return
+        yield from page
+        written += len(page)
+        if on_progress:
+            on_progress(written, total if total is not None else written)
+
+
+def _info_rows(report_data: Any) -> List[List[Any]]:
+    """Report type, generation time and date range as (label, value) rows."""
+    rows = [
+        ["보고서 종류", report_data.report_type],
+        ["생성 시간", datetime.fromisoformat(report_data.generated_at).strftime("%Y-%m-%d %H:%M:%S")],
+    ]
+    if report_data.date_range_start:
+        if report_data.date_range_end and report_data.date_range_end != report_data.date_range_start:
+            rows.append(["기간", f"{report_data.date_range_start} ~ {report_data.date_range_end}"])
+        else:
+            rows.append(["기간", report_data.date_range_start])
+    return rows
+
+
+def _summary_rows(report_data: Any) -> List[List[Any]]:
+    """Scalar summary values as (key, value) rows."""
+    return [
+        [key, value]
+        for key, value in (report_data.summary or {}).items()
+        if not isinstance(value, (dict, list))
+    ]
+
+
+@contextmanager
+def _atomic_file(file_path: str) -> Iterator[str]:
+    """Yield a temporary path that replaces file_path only if the block succeeds."""
+    part_path = f"{file_path}.part"
+    try:
+        yield part_path
+        os.replace(part_path, file_path)
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
 
 class ExcelExporter:
     """Export data to Excel format."""
@@ -25,145 +114,184 @@ class ExcelExporter:
         Requires:
             openpyxl: pip install openpyxl
         """
+        ExcelExporter.export_stream(report_data, [report_data.data or []], file_path)
+
+    @staticmethod
+    def export_stream(
+        report_data: Any,
+        pages: Pages,
+        file_path: str,
+        total: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[CancelCheck] = None
+    ) -> int:
+        """
+        Stream report rows into an Excel file.
+
+        Args:
+            report_data: ReportData instance (metadata and summary)
+            pages: Row pages, consumed once
+            file_path: Output file path
+            total: Total rows, for progress
+            on_progress: Called with (rows written, total) after each page
+            is_cancelled: Checked before each page
+
+        Returns:
+            Number of data rows written
+
+        Raises:
+            ExportCancelled: If is_cancelled() returned True
+
+        Requires:
+            openpyxl: pip install openpyxl (falls back to CSV)
+        """
         try:
             from openpyxl import Workbook
-            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
             from openpyxl.utils import get_column_letter
 
         except ImportError:
             logger.error("openpyxl not installed. Run: pip install openpyxl")
             # Fallback to CSV
-            ExcelExporter._export_to_csv(report_data, file_path.replace('.xlsx', '.csv'))
-            return
-
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "보고서"
+            return CSVExporter.export_stream(
+                report_data, pages, file_path.replace('.xlsx', '.csv'), total, on_progress, is_cancelled
+            )
 
-        # Styles
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
-
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+        rows = _stream_rows(pages, total, on_progress, is_cancelled)
+        sample = list(islice(rows, WIDTH_SAMPLE_ROWS))
+        columns = list(sample[0].keys()) if sample else []
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("보고서")
+
+        # Named styles are stored once and shared by every cell
+        thin = Side(style='thin')
+        border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        header_style = NamedStyle(
+            name="report_header",
+            font=Font(bold=True, color="FFFFFF"),
+            fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+            alignment=Alignment(horizontal="center", vertical="center"),
+            border=border
         )
+        cell_style = NamedStyle(name="report_cell", border=border)
+        wb.add_named_style(header_style)
+        wb.add_named_style(cell_style)
+
+        def styled(value: Any, style: NamedStyle) -> WriteOnlyCell:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style.name
+            return cell
+
+        # Column widths from the header block and the sampled rows
+        info_rows = _info_rows(report_data)
+        summary_rows = _summary_rows(report_data)
+        widths: Dict[int, int] = {}
+        for values in chain(info_rows, summary_rows, [columns], ([row.get(c, "") for c in columns] for row in sample)):
+            for col_idx, value in enumerate(values, start=1):
+                widths[col_idx] = max(widths.get(col_idx, 0), len(str(value)))
+        for col_idx, width in widths.items():
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 2, 50)
 
         # Write header info
-        ws['A1'] = "보고서 종류"
-        ws['B1'] = report_data.report_type
-        ws['A2'] = "생성 시간"
-        ws['B2'] = datetime.fromisoformat(report_data.generated_at).strftime("%Y-%m-%d %H:%M:%S")
-
-        if report_data.date_range_start:
-            ws['A3'] = "기간"
-            if report_data.date_range_end and report_data.date_range_end != report_data.date_range_start:
-                ws['B3'] = f"{report_data.date_range_start} ~ {report_data.date_range_end}"
-            else:
-                ws['B3'] = report_data.date_range_start
+        for info_row in info_rows:
+            ws.append(info_row)
+        for _ in range(4 - len(info_rows)):
+            ws.append([])
 
         # Write summary
-        row = 5
-        ws[f'A{row}'] = "요약"
-        ws[f'A{row}'].font = header_font
-        ws[f'A{row}'].fill = header_fill
-        row += 1
-
-        if report_data.summary:
-            for key, value in report_data.summary.items():
-                if not isinstance(value, (dict, list)):
-                    ws[f'A{row}'] = key
-                    ws[f'B{row}'] = value
-                    row += 1
+        ws.append([styled("요약", header_style)])
+        for summary_row in summary_rows:
+            ws.append(summary_row)
 
         # Write data table
-        if report_data.data:
-            row += 2
-            ws[f'A{row}'] = "상세 데이터"
-            ws[f'A{row}'].font = header_font
-            ws[f'A{row}'].fill = header_fill
-            row += 1
-
-            # Determine columns
-            if report_data.data:
-                columns = list(report_data.data[0].keys())
-
-                # Write column headers
-                for col_idx, col_name in enumerate(columns, start=1):
-                    cell = ws.cell(row=row, column=col_idx, value=col_name)
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = header_alignment
-                    cell.border = border
-
-                row += 1
-
-                # Write data rows
-                for data_row in report_data.data:
-                    for col_idx, col_name in enumerate(columns, start=1):
-                        value = data_row.get(col_name, "")
-                        cell = ws.cell(row=row, column=col_idx, value=value)
-                        cell.border = border
-
-                    row += 1
-
-        # Auto-adjust column widths
-        for col in ws.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except (TypeError, AttributeError):
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column].width = adjusted_width
+        written = 0
+        if columns:
+            ws.append([])
+            ws.append([])
+            ws.append([styled("상세 데이터", header_style)])
+            ws.append([styled(column, header_style) for column in columns])
+
+            for data_row in chain(sample, rows):
+                ws.append([styled(data_row.get(column, ""), cell_style) for column in columns])
+                written += 1
+
+        with _atomic_file(file_path) as part_path:
+            wb.save(part_path)
+        logger.info(f"Exported {written} rows to Excel: {file_path}")
+        return written
+
+
+class CSVExporter:
+    """Export data to CSV format (UTF-8 with BOM, opens in Excel)."""
 
-        # Save workbook
-        wb.save(file_path)
-        logger.info(f"Exported report to Excel: {file_path}")
+    @staticmethod
+    def export_report(report_data: Any, file_path: str) -> None:
+        """
+        Export report to CSV file.
+
+        Args:
+            report_data: ReportData instance
+            file_path: Output file path
+        """
+        CSVExporter.export_stream(report_data, [report_data.data or []], file_path)
 
     @staticmethod
-    def _export_to_csv(report_data: Any, file_path: str) -> None:
-        """Fallback CSV export if openpyxl not available."""
-        import csv
+    def export_stream(
+        report_data: Any,
+        pages: Pages,
+        file_path: str,
+        total: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[CancelCheck] = None
+    ) -> int:
+        """
+        Stream report rows into a CSV file.
 
-        with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
+        Arguments, return value and exceptions as ExcelExporter.export_stream.
+        """
+        rows = _stream_rows(pages, total, on_progress, is_cancelled)
+        written = 0
 
-            # Write header
-            writer.writerow(["보고서 종류", report_data.report_type])
-            writer.writerow(["생성 시간", report_data.generated_at])
-            writer.writerow([])
+        with _atomic_file(file_path) as part_path:
+            with open(part_path, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.writer(f)
 
-            # Write summary
-            writer.writerow(["요약"])
-            if report_data.summary:
-                for key, value in report_data.summary.items():
-                    if not isinstance(value, (dict, list)):
-                        writer.writerow([key, value])
+                # Write header
+                writer.writerow(["보고서 종류", report_data.report_type])
+                writer.writerow(["생성 시간", report_data.generated_at])
+                writer.writerow([])
 
-            writer.writerow([])
+                # Write summary
+                writer.writerow(["요약"])
+                writer.writerows(_summary_rows(report_data))
 
-            # Write data
-            if report_data.data:
-                writer.writerow(["상세 데이터"])
-                columns = list(report_data.data[0].keys())
-                writer.writerow(columns)
+                writer.writerow([])
 
-                for row in report_data.data:
-                    writer.writerow([row.get(col, "") for col in columns])
+                # Write data
+                first = next(rows, None)
+                if first is not None:
+                    writer.writerow(["상세 데이터"])
+                    columns = list(first.keys())
+                    writer.writerow(columns)
 
-        logger.info(f"Exported report to CSV (fallback): {file_path}")
+                    for row in chain([first], rows):
+                        writer.writerow([row.get(col, "") for col in columns])
+                        written += 1
+
+        logger.info(f"Exported {written} rows to CSV: {file_path}")
+        return written
 
 
 class PDFExporter:
     """Export data to PDF format."""
 
+    @staticmethod
+    def available() -> bool:
+        """Whether reportlab is installed (otherwise a text file is written)."""
+        return importlib.util.find_spec("reportlab") is not None
+
     @staticmethod
     def export_report(report_data: Any, file_path: str) -> None:
         """
@@ -176,40 +304,69 @@ class PDFExporter:
         Requires:
             reportlab: pip install reportlab
         """
-        try:
-            from reportlab.lib.pagesizes import A4, landscape
-            from reportlab.lib import colors
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
-            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-
-            # Try to register Korean font (if available)
-            try:
-                # Common Korean font locations
-                font_paths = [
-                    "C:/Windows/Fonts/malgun.ttf",  # Windows
-                    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",  # Linux
-                    "/Library/Fonts/AppleGothic.ttf"  # Mac
-                ]
-                for font_path in font_paths:
-                    try:
-                        pdfmetrics.registerFont(TTFont('Korean', font_path))
-                        korean_available = True
-                        break
-                    except Exception:
-                        continue
-                else:
-                    korean_available = False
-            except Exception:
-                korean_available = False
+        PDFExporter.export_stream(report_data, [report_data.data or []], file_path)
 
-        except ImportError:
+    @staticmethod
+    def export_stream(
+        report_data: Any,
+        pages: Pages,
+        file_path: str,
+        total: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[CancelCheck] = None
+    ) -> int:
+        """
+        Export a report to PDF, reading only the rows the PDF shows.
+
+        The data table holds the first PDF_MAX_ROWS rows; later pages are
+        never fetched. Without reportlab all rows are streamed to a text
+        file instead. Arguments and exceptions as ExcelExporter.export_stream.
+
+        Returns:
+            Number of data rows written
+        """
+        rows = _stream_rows(pages, total, on_progress, is_cancelled)
+        if not PDFExporter.available():
             logger.error("reportlab not installed. Run: pip install reportlab")
             # Fallback to text file
-            PDFExporter._export_to_text(report_data, file_path.replace('.pdf', '.txt'))
-            return
+            return PDFExporter._export_to_text(report_data, rows, file_path.replace('.pdf', '.txt'))
+
+        first_rows = list(islice(rows, PDF_MAX_ROWS))
+        with _atomic_file(file_path) as part_path:
+            PDFExporter._build(replace(report_data, data=first_rows), part_path)
+        logger.info(f"Exported report to PDF: {file_path}")
+        return len(first_rows)
+
+    @staticmethod
+    def _build(report_data: Any, file_path: str) -> None:
+        """Render the report with reportlab (report_data.data holds the table rows)."""
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        # Try to register Korean font (if available)
+        try:
+            # Common Korean font locations
+            font_paths = [
+                "C:/Windows/Fonts/malgun.ttf",  # Windows
+                "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",  # Linux
+                "/Library/Fonts/AppleGothic.ttf"  # Mac
+            ]
+            for font_path in font_paths:
+                try:
+                    pdfmetrics.registerFont(TTFont('Korean', font_path))
+                    korean_available = True
+                    break
+                except Exception:
+                    continue
+            else:
+                korean_available = False
+        except Exception:
+            korean_available = False
 
         # Create PDF
         doc = SimpleDocTemplate(file_path, pagesize=landscape(A4))
@@ -224,30 +381,15 @@ class PDFExporter:
                 fontName='Korean',
                 fontSize=18
             )
-            normal_style = ParagraphStyle(
-                'CustomNormal',
-                parent=styles['Normal'],
-                fontName='Korean',
-                fontSize=10
-            )
         else:
             title_style = styles['Heading1']
-            normal_style = styles['Normal']
 
         # Title
         elements.append(Paragraph(f"보고서: {report_data.report_type}", title_style))
         elements.append(Spacer(1, 0.2 * inch))
 
         # Header info
-        info_data = [
-            ["생성 시간", datetime.fromisoformat(report_data.generated_at).strftime("%Y-%m-%d %H:%M:%S")]
-        ]
-
-        if report_data.date_range_start:
-            if report_data.date_range_end and report_data.date_range_end != report_data.date_range_start:
-                info_data.append(["기간", f"{report_data.date_range_start} ~ {report_data.date_range_end}"])
-            else:
-                info_data.append(["기간", report_data.date_range_start])
+        info_data = _info_rows(report_data)[1:]
 
         info_table = Table(info_data, colWidths=[2*inch, 4*inch])
         info_table.setStyle(TableStyle([
@@ -265,35 +407,30 @@ class PDFExporter:
         elements.append(Paragraph("요약", title_style))
         elements.append(Spacer(1, 0.1 * inch))
 
-        if report_data.summary:
-            summary_data = []
-            for key, value in report_data.summary.items():
-                if not isinstance(value, (dict, list)):
-                    summary_data.append([str(key), str(value)])
-
-            if summary_data:
-                summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
-                summary_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
-                    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Korean' if korean_available else 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                elements.append(summary_table)
+        summary_data = [[str(key), str(value)] for key, value in _summary_rows(report_data)]
+        if summary_data:
+            summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
+            summary_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, -1), 'Korean' if korean_available else 'Helvetica'),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]))
+            elements.append(summary_table)
 
         elements.append(Spacer(1, 0.3 * inch))
 
-        # Data table (first 50 rows for PDF)
+        # Data table (first PDF_MAX_ROWS rows)
         if report_data.data:
-            elements.append(Paragraph("상세 데이터 (최대 50행)", title_style))
+            elements.append(Paragraph(f"상세 데이터 (최대 {PDF_MAX_ROWS}행)", title_style))
             elements.append(Spacer(1, 0.1 * inch))
 
             columns = list(report_data.data[0].keys())[:8]  # Limit columns for PDF
             data_rows = [columns]
 
-            for row in report_data.data[:50]:  # Limit to 50 rows
+            for row in report_data.data[:PDF_MAX_ROWS]:
                 data_rows.append([str(row.get(col, ""))[:30] for col in columns])  # Truncate long text
 
             data_table = Table(data_rows)
@@ -310,33 +447,29 @@ class PDFExporter:
 
         # Build PDF
         doc.build(elements)
-        logger.info(f"Exported report to PDF: {file_path}")
 
     @staticmethod
-    def _export_to_text(report_data: Any, file_path: str) -> None:
+    def _export_to_text(report_data: Any, rows: Iterator[Dict[str, Any]], file_path: str) -> int:
         """Fallback text export if reportlab not available."""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(f"보고서 종류: {report_data.report_type}\n")
-            f.write(f"생성 시간: {report_data.generated_at}\n")
-
-            if report_data.date_range_start:
-                f.write(f"기간: {report_data.date_range_start}")
-                if report_data.date_range_end and report_data.date_range_end != report_data.date_range_start:
-                    f.write(f" ~ {report_data.date_range_end}")
-                f.write("\n")
-
-            f.write("\n=== 요약 ===\n")
-            if report_data.summary:
-                for key, value in report_data.summary.items():
-                    if not isinstance(value, (dict, list)):
-                        f.write(f"{key}: {value}\n")
-
-            f.write("\n=== 상세 데이터 ===\n")
-            if report_data.data:
-                columns = list(report_data.data[0].keys())
-                f.write("\t".join(columns) + "\n")
-
-                for row in report_data.data:
-                    f.write("\t".join(str(row.get(col, "")) for col in columns) + "\n")
+        written = 0
+        with _atomic_file(file_path) as part_path:
+            with open(part_path, 'w', encoding='utf-8') as f:
+                for label, value in _info_rows(report_data):
+                    f.write(f"{label}: {value}\n")
+
+                f.write("\n=== 요약 ===\n")
+                for key, value in _summary_rows(report_data):
+                    f.write(f"{key}: {value}\n")
+
+                f.write("\n=== 상세 데이터 ===\n")
+                first = next(rows, None)
+                if first is not None:
+                    columns = list(first.keys())
+                    f.write("\t".join(columns) + "\n")
+
+                    for row in chain([first], rows):
+                        f.write("\t".join(str(row.get(col, "")) for col in columns) + "\n")
+                        written += 1
 
         logger.info(f"Exported report to text (fallback): {file_path}")
+        return written
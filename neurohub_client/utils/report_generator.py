@@ -6,14 +6,32 @@ Generates various production reports including:
 - LOT progress report
 - WIP status report
 - Process performance report
+- Defect analysis report
+
+Reports are aggregated by the server (/api/v1/reports/*): each response is
+a page of flat rows plus a summary over all rows, so only the rows are
+paged through here and nothing is summarized locally. open_report() fetches
+only the first page; the rest are fetched while an export consumes them.
 """
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Rows requested per report page (server maximum)
+PAGE_SIZE = 1000
+
+# Report type -> (endpoint, filters holding the start and end of its date range)
+REPORTS = {
+    "daily_production": ("/api/v1/reports/daily-production", ("date", "date")),
+    "lot_progress": ("/api/v1/reports/lot-progress", ("start_date", "end_date")),
+    "wip_status": ("/api/v1/reports/wip-status", (None, None)),
+    "process_performance": ("/api/v1/reports/process-performance", ("start_date", "end_date")),
+    "defect_analysis": ("/api/v1/reports/defect-analysis", ("start_date", "end_date")),
+}
+
 
 @dataclass
 class ReportData:
@@ -28,6 +46,14 @@ class ReportData:
     summary: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class ReportStream:
+    """Report whose rows are fetched page by page while they are consumed."""
+    report: ReportData  # Metadata and server summary; data holds the first page
+    total: int  # Rows in all pages
+    pages: Iterator[List[Dict[str, Any]]]  # Row pages, starting with the first
+
+
 class ReportGenerator:
     """Generate production reports."""
 
@@ -68,10 +94,7 @@ class ReportGenerator:
             }
             params = {k: v for k, v in params.items() if v is not None}
 
-            data = self.api_client.get("/api/v1/reports/daily-production", params=params)
-
-            # Calculate summary
-            summary = self._calculate_daily_summary(data)
+            data, summary = self._fetch_report("/api/v1/reports/daily-production", params)
 
             return ReportData(
                 report_type="daily_production",
@@ -115,10 +138,7 @@ class ReportGenerator:
             }
             params = {k: v for k, v in params.items() if v is not None}
 
-            data = self.api_client.get("/api/v1/reports/lot-progress", params=params)
-
-            # Calculate summary
-            summary = self._calculate_lot_summary(data)
+            data, summary = self._fetch_report("/api/v1/reports/lot-progress", params)
 
             return ReportData(
                 report_type="lot_progress",
@@ -159,10 +179,7 @@ class ReportGenerator:
             }
             params = {k: v for k, v in params.items() if v is not None}
 
-            data = self.api_client.get("/api/v1/reports/wip-status", params=params)
-
-            # Calculate summary
-            summary = self._calculate_wip_summary(data)
+            data, summary = self._fetch_report("/api/v1/reports/wip-status", params)
 
             return ReportData(
                 report_type="wip_status",
@@ -204,10 +221,7 @@ class ReportGenerator:
             }
             params = {k: v for k, v in params.items() if v is not None}
 
-            data = self.api_client.get("/api/v1/reports/process-performance", params=params)
-
-            # Calculate summary
-            summary = self._calculate_performance_summary(data)
+            data, summary = self._fetch_report("/api/v1/reports/process-performance", params)
 
             return ReportData(
                 report_type="process_performance",
@@ -251,10 +265,7 @@ class ReportGenerator:
             }
             params = {k: v for k, v in params.items() if v is not None}
 
-            data = self.api_client.get("/api/v1/reports/defect-analysis", params=params)
-
-            # Calculate summary
-            summary = self._calculate_defect_summary(data)
+            data, summary = self._fetch_report("/api/v1/reports/defect-analysis", params)
 
             return ReportData(
                 report_type="defect_analysis",
@@ -271,162 +282,68 @@ class ReportGenerator:
             logger.error(f"Failed to generate defect analysis report: {e}")
             raise
 
-    # Summary calculation methods
-
-    def _calculate_daily_summary(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate daily production summary."""
-        if not data:
-            return {
-                "total_started": 0,
-                "total_completed": 0,
-                "total_pass": 0,
-                "total_fail": 0,
-                "pass_rate": 0.0,
-                "avg_cycle_time": 0.0
-            }
-
-        total_started = len([d for d in data if d.get("status") in ["IN_PROGRESS", "COMPLETED"]])
-        total_completed = len([d for d in data if d.get("status") == "COMPLETED"])
-        total_pass = len([d for d in data if d.get("result") == "PASS"])
-        total_fail = len([d for d in data if d.get("result") == "FAIL"])
-
-        pass_rate = (total_pass / total_completed * 100) if total_completed > 0 else 0.0
-
-        # Calculate average cycle time
-        cycle_times = [
-            d.get("cycle_time", 0)
-            for d in data
-            if d.get("cycle_time") is not None and d.get("status") == "COMPLETED"
-        ]
-        avg_cycle_time = sum(cycle_times) / len(cycle_times) if cycle_times else 0.0
-
-        return {
-            "total_started": total_started,
-            "total_completed": total_completed,
-            "total_pass": total_pass,
-            "total_fail": total_fail,
-            "pass_rate": round(pass_rate, 2),
-            "avg_cycle_time": round(avg_cycle_time, 2)
-        }
-
-    def _calculate_lot_summary(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate LOT progress summary."""
-        if not data:
-            return {
-                "total_lots": 0,
-                "completed_lots": 0,
-                "in_progress_lots": 0,
-                "completion_rate": 0.0
-            }
-
-        total_lots = len(data)
-        completed_lots = len([d for d in data if d.get("status") == "COMPLETED"])
-        in_progress_lots = len([d for d in data if d.get("status") == "IN_PROGRESS"])
-
-        completion_rate = (completed_lots / total_lots * 100) if total_lots > 0 else 0.0
-
-        return {
-            "total_lots": total_lots,
-            "completed_lots": completed_lots,
-            "in_progress_lots": in_progress_lots,
-            "completion_rate": round(completion_rate, 2)
-        }
-
-    def _calculate_wip_summary(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate WIP status summary."""
-        if not data:
-            return {
-                "total_wip": 0,
-                "by_status": {},
-                "by_process": {}
-            }
+    def open_report(self, report_type: str, **filters: Any) -> ReportStream:
+        """
+        Open a report: fetch its first page and summary only.
 
-        total_wip = len(data)
-
-        # Group by status
-        by_status = {}
-        for item in data:
-            status = item.get("status", "UNKNOWN")
-            by_status[status] = by_status.get(status, 0) + 1
-
-        # Group by process
-        by_process = {}
-        for item in data:
-            process = item.get("process_name", "Unknown")
-            by_process[process] = by_process.get(process, 0) + 1
-
-        return {
-            "total_wip": total_wip,
-            "by_status": by_status,
-            "by_process": by_process
-        }
-
-    def _calculate_performance_summary(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate process performance summary."""
-        if not data:
-            return {
-                "total_processed": 0,
-                "avg_throughput": 0.0,
-                "avg_yield": 0.0,
-                "top_performers": []
-            }
+        Iterating the returned pages fetches the remaining pages one at a
+        time, so consumers can write any number of rows in constant memory.
 
-        total_processed = sum(d.get("total_count", 0) for d in data)
-        avg_throughput = total_processed / len(data) if data else 0.0
+        Args:
+            report_type: Key of REPORTS (e.g. "wip_status")
+            **filters: Report filters; None values are dropped
 
-        # Calculate average yield
-        yields = [d.get("yield_rate", 0) for d in data if d.get("yield_rate") is not None]
-        avg_yield = sum(yields) / len(yields) if yields else 0.0
+        Returns:
+            ReportStream
+        """
+        if report_type not in REPORTS:
+            raise ValueError(f"Unknown report type: {report_type}")
+        endpoint, (start_key, end_key) = REPORTS[report_type]
+        params = {k: v for k, v in filters.items() if v is not None}
+
+        first = self._get_page(endpoint, params, 0)
+        report = ReportData(
+            report_type=report_type,
+            generated_at=datetime.now().isoformat(),
+            generated_by="system",
+            date_range_start=params.get(start_key),
+            date_range_end=params.get(end_key),
+            filters=params,
+            data=first["items"],
+            summary=first["summary"]
+        )
+        return ReportStream(report, first["total"], self._iter_pages(endpoint, params, first))
+
+    def _get_page(self, endpoint: str, params: Dict[str, Any], skip: int) -> Dict[str, Any]:
+        return self.api_client.get(endpoint, params={**params, "skip": skip, "limit": PAGE_SIZE})
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        first: Dict[str, Any]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the rows of each page, fetching the next page only when asked for."""
+        page = first
+        fetched = 0
+        while page["items"]:
+            yield page["items"]
+            fetched += len(page["items"])
+            if fetched >= page["total"]:
+                return
+            page = self._get_page(endpoint, params, fetched)
+
+    def _fetch_report(self, endpoint: str, params: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Fetch all rows of a report page by page.
 
-        # Top performers (by yield rate)
-        sorted_data = sorted(data, key=lambda x: x.get("yield_rate", 0), reverse=True)
-        top_performers = [
-            {
-                "process": d.get("process_name", "Unknown"),
-                "yield_rate": d.get("yield_rate", 0)
-            }
-            for d in sorted_data[:5]
-        ]
-
-        return {
-            "total_processed": total_processed,
-            "avg_throughput": round(avg_throughput, 2),
-            "avg_yield": round(avg_yield, 2),
-            "top_performers": top_performers
-        }
-
-    def _calculate_defect_summary(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate defect analysis summary."""
-        if not data:
-            return {
-                "total_defects": 0,
-                "defect_rate": 0.0,
-                "by_type": {},
-                "top_defects": []
-            }
+        Args:
+            endpoint: Report endpoint
+            params: Report filters
 
-        total_defects = sum(d.get("defect_count", 0) for d in data)
-        total_inspected = sum(d.get("total_count", 0) for d in data)
-
-        defect_rate = (total_defects / total_inspected * 100) if total_inspected > 0 else 0.0
-
-        # Group by defect type
-        by_type = {}
-        for item in data:
-            defect_type = item.get("defect_type", "Unknown")
-            count = item.get("defect_count", 0)
-            by_type[defect_type] = by_type.get(defect_type, 0) + count
-
-        # Top defects
-        top_defects = sorted(
-            [{"type": k, "count": v} for k, v in by_type.items()],
-            key=lambda x: x["count"],
-            reverse=True
-        )[:10]
-
-        return {
-            "total_defects": total_defects,
-            "defect_rate": round(defect_rate, 2),
-            "by_type": by_type,
-            "top_defects": top_defects
-        }
+        Returns:
+            (rows, summary computed by the server over all rows)
+        """
+        first = self._get_page(endpoint, params, 0)
+        rows = [row for page in self._iter_pages(endpoint, params, first) for row in page]
+        return rows, first["summary"]
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QBrush, QColor
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,7 @@ class ThemeManager:
     _instance: Optional['ThemeManager'] = None
     _theme_data: Dict[str, Any] = {}
     _resolved_cache: Dict[str, str] = {}
+    _brush_cache: Dict[str, QBrush] = {}
 
     def __new__(cls) -> 'ThemeManager':
         """Singleton pattern to ensure only one theme manager exists."""
@@ -55,6 +56,7 @@ class ThemeManager:
             with open(theme_path, 'r', encoding='utf-8') as f:
                 self._theme_data = json.load(f)
             self._resolved_cache = {}
+            self._brush_cache = {}
             loaded_name = self._theme_data.get('theme_name', theme_name)
             logger.info("Theme loaded: %s", loaded_name)
         except (OSError, json.JSONDecodeError) as e:
@@ -655,6 +657,26 @@ QFrame[variant="toast-info"] {{
         color_hex = self.get(key_path, default)
         return QColor(color_hex)
 
+    def get_qt_brush(self, key_path: str, default: str = "#000000") -> QBrush:
+        """
+        Get theme color as a cached QBrush.
+
+        Item models return brushes from data() for every visible cell, so
+        brushes are built once per theme instead of per call.
+
+        Args:
+            key_path: Dot-separated path (e.g., 'colors.success.main')
+            default: Default color hex if key not found
+
+        Returns:
+            Shared QBrush object (do not modify)
+        """
+        brush = self._brush_cache.get(key_path)
+        if brush is None:
+            brush = QBrush(self.get_qt_color(key_path, default))
+            self._brush_cache[key_path] = brush
+        return brush
+
     def apply_to_app(self, app: QApplication) -> None:
         """
         Apply generated QSS to the application.
@@ -2,15 +2,37 @@
 ViewModel for WIP Dashboard.
 
 Handles WIP statistics retrieval and real-time updates.
+Polling runs on a worker thread with conditional GET (If-None-Match), so an
+unchanged dashboard costs one empty 304 response per tick.
 """
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
 
 logger = logging.getLogger(__name__)
 
 
+class WIPStatisticsWorker(QThread):
+    """Background worker for a single conditional statistics poll."""
+
+    loaded = Signal(object, object)  # statistics (None if unchanged), ETag
+    error = Signal(str)              # error message
+
+    def __init__(self, api_client: Any, etag: Optional[str] = None) -> None:
+        super().__init__()
+        self.api_client = api_client
+        self.etag = etag
+
+    def run(self) -> None:
+        """Fetch statistics if changed since ``etag``."""
+        try:
+            stats, etag = self.api_client.get_wip_statistics_if_changed(self.etag)
+            self.loaded.emit(stats, etag)
+        except Exception as e:
+            self.error.emit(f"통계 조회 실패: {str(e)}")
+
+
 class WIPDashboardViewModel(QObject):
     """ViewModel for WIP Dashboard screen."""
 
@@ -33,6 +55,8 @@ class WIPDashboardViewModel(QObject):
         self.api_client = api_client
         self.refresh_interval = refresh_interval
         self.current_statistics: Dict[str, Any] = {}
+        self.worker: Optional[WIPStatisticsWorker] = None
+        self._etag: Optional[str] = None
 
         # Auto-refresh timer
         self.refresh_timer = QTimer()
@@ -63,18 +87,32 @@ class WIPDashboardViewModel(QObject):
             logger.info(f"Refresh interval updated: {interval_ms}ms")
 
     def refresh_statistics(self) -> None:
-        """Refresh WIP statistics."""
-        try:
-            logger.debug("Refreshing WIP statistics")
-            stats = self.api_client.get_wip_statistics()
-            self.current_statistics = stats
-            self.statistics_updated.emit(stats)
-            logger.debug("Statistics updated successfully")
-
-        except Exception as e:
-            error_msg = f"통계 조회 실패: {str(e)}"
-            logger.error(error_msg)
-            self.error_occurred.emit(error_msg)
+        """Refresh WIP statistics in the background (skipped if a poll is in flight)."""
+        if self.worker and self.worker.isRunning():
+            logger.debug("Statistics poll still running, skipping refresh")
+            return
+
+        logger.debug("Refreshing WIP statistics")
+        self.worker = WIPStatisticsWorker(self.api_client, self._etag)
+        self.worker.loaded.connect(self._on_statistics_loaded)
+        self.worker.error.connect(self._on_statistics_error)
+        self.worker.start()
+
+    def _on_statistics_loaded(self, stats: Optional[Dict[str, Any]], etag: Optional[str]) -> None:
+        """Handle poll result (stats is None when unchanged)."""
+        self._etag = etag
+        if stats is None:
+            logger.debug("Statistics not modified")
+            return
+
+        self.current_statistics = stats
+        self.statistics_updated.emit(stats)
+        logger.debug("Statistics updated successfully")
+
+    def _on_statistics_error(self, error_msg: str) -> None:
+        """Handle poll error."""
+        logger.error(error_msg)
+        self.error_occurred.emit(error_msg)
 
     def get_process_wip_counts(self) -> List[tuple]:
         """
@@ -118,3 +156,5 @@ class WIPDashboardViewModel(QObject):
     def cleanup(self) -> None:
         """Clean up resources."""
         self.stop_auto_refresh()
+        if self.worker and self.worker.isRunning():
+            self.worker.wait(3000)
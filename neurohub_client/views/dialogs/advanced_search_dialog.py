@@ -8,13 +8,16 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from PySide6.QtCore import QDate, Qt, Signal
+from PySide6.QtCore import QDate, QModelIndex, Qt, Signal
+from PySide6.QtGui import QBrush
 from PySide6.QtWidgets import (
-    QCheckBox, QComboBox, QDateEdit, QDialog, QFileDialog, QFormLayout,
-    QGroupBox, QHBoxLayout, QHeaderView, QLabel, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QTabWidget, QVBoxLayout, QWidget
+    QAbstractItemView, QCheckBox, QComboBox, QDateEdit, QDialog, QFileDialog,
+    QFormLayout, QGroupBox, QHBoxLayout, QHeaderView, QLabel, QLineEdit,
+    QPushButton, QTableView, QTableWidget, QTableWidgetItem, QTabWidget,
+    QVBoxLayout, QWidget
 )
 
+from models.table_models import Column, RecordTableModel
 from utils.exception_handler import safe_slot
 from utils.theme_manager import get_theme
 from widgets.toast_notification import Toast
@@ -22,6 +25,57 @@ from widgets.toast_notification import Toast
 logger = logging.getLogger(__name__)
 theme = get_theme()
 
+_STATUS_COLORS = {
+    "PASS": ("colors.semantic.success", "#10B981"),
+    "FAIL": ("colors.semantic.error", "#EF4444"),
+    "IN_PROGRESS": ("colors.semantic.warning", "#F59E0B"),
+}
+
+
+def _format_time(value: Optional[str]) -> str:
+    """Format an ISO timestamp as 'YYYY-MM-DD HH:MM'."""
+    if not value:
+        return ""
+    return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M")
+
+
+def _calculate_elapsed(start_time: Optional[str], complete_time: Optional[str]) -> str:
+    """Calculate elapsed time between start and complete."""
+    if not start_time:
+        return "-"
+
+    try:
+        start = datetime.fromisoformat(start_time)
+        end = datetime.fromisoformat(complete_time) if complete_time else datetime.now()
+
+        elapsed = end - start
+        total_seconds = int(elapsed.total_seconds())
+
+        hours = total_seconds // 3600
+        minutes = (total_seconds % 3600) // 60
+
+        return f"{hours}h {minutes}m"
+
+    except Exception:
+        return "-"
+
+
+def _status_brush(result: Dict[str, Any]) -> Optional[QBrush]:
+    color = _STATUS_COLORS.get(result.get("status", ""))
+    return theme.get_qt_brush(*color) if color else None
+
+
+RESULT_COLUMNS = [
+    Column("Serial 번호", lambda r: r.get("serial_number", "")),
+    Column("LOT 번호", lambda r: r.get("lot_number", "")),
+    Column("제품", lambda r: r.get("product_name", "")),
+    Column("공정", lambda r: r.get("process_name", "")),
+    Column("상태", lambda r: r.get("status", ""), foreground=_status_brush),
+    Column("시작 시간", lambda r: _format_time(r.get("start_time"))),
+    Column("완료 시간", lambda r: _format_time(r.get("complete_time"))),
+    Column("경과 시간", lambda r: _calculate_elapsed(r.get("start_time"), r.get("complete_time"))),
+]
+
 
 class AdvancedSearchDialog(QDialog):
     """Advanced search dialog with multiple filter criteria."""
@@ -89,22 +143,24 @@ class AdvancedSearchDialog(QDialog):
         self.result_count_label.setProperty("variant", "caption")
         results_layout.addWidget(self.result_count_label)
 
-        # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(8)
-        self.results_table.setHorizontalHeaderLabels([
-            "Serial 번호", "LOT 번호", "제품", "공정", "상태",
-            "시작 시간", "완료 시간", "경과 시간"
-        ])
+        # Results table (virtualized: cells are computed on demand)
+        self.results_model = RecordTableModel(RESULT_COLUMNS, parent=self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
 
         header = self.results_table.horizontalHeader()
         header.setStretchLastSection(True)
-        for i in range(7):
-            header.setSectionResizeMode(i, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(120)
 
-        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
+        vertical_header = self.results_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(28)
+
+        self.results_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.results_table.setAlternatingRowColors(True)
+        self.results_table.setWordWrap(False)
         self.results_table.doubleClicked.connect(self._on_result_double_clicked)
 
         results_layout.addWidget(self.results_table)
@@ -331,81 +387,8 @@ class AdvancedSearchDialog(QDialog):
         Args:
             results: List of WIP result dictionaries
         """
-        self.results_table.setRowCount(0)
         self.result_count_label.setText(f"검색 결과: {len(results)}건")
-
-        for result in results:
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-
-            # Serial number
-            serial = result.get("serial_number", "")
-            self.results_table.setItem(row, 0, QTableWidgetItem(serial))
-
-            # LOT number
-            lot = result.get("lot_number", "")
-            self.results_table.setItem(row, 1, QTableWidgetItem(lot))
-
-            # Product
-            product = result.get("product_name", "")
-            self.results_table.setItem(row, 2, QTableWidgetItem(product))
-
-            # Process
-            process = result.get("process_name", "")
-            self.results_table.setItem(row, 3, QTableWidgetItem(process))
-
-            # Status
-            status = result.get("status", "")
-            status_item = QTableWidgetItem(status)
-
-            # Color code status
-            if status == "PASS":
-                status_item.setForeground(theme.get_qt_color("colors.semantic.success", "#10B981"))
-            elif status == "FAIL":
-                status_item.setForeground(theme.get_qt_color("colors.semantic.error", "#EF4444"))
-            elif status == "IN_PROGRESS":
-                status_item.setForeground(theme.get_qt_color("colors.semantic.warning", "#F59E0B"))
-
-            self.results_table.setItem(row, 4, status_item)
-
-            # Start time
-            start_time = result.get("start_time", "")
-            if start_time:
-                start_time = datetime.fromisoformat(start_time).strftime("%Y-%m-%d %H:%M")
-            self.results_table.setItem(row, 5, QTableWidgetItem(start_time))
-
-            # Complete time
-            complete_time = result.get("complete_time", "")
-            if complete_time:
-                complete_time = datetime.fromisoformat(complete_time).strftime("%Y-%m-%d %H:%M")
-            self.results_table.setItem(row, 6, QTableWidgetItem(complete_time))
-
-            # Elapsed time
-            elapsed = self._calculate_elapsed(
-                result.get("start_time"),
-                result.get("complete_time")
-            )
-            self.results_table.setItem(row, 7, QTableWidgetItem(elapsed))
-
-    def _calculate_elapsed(self, start_time: Optional[str], complete_time: Optional[str]) -> str:
-        """Calculate elapsed time between start and complete."""
-        if not start_time:
-            return "-"
-
-        try:
-            start = datetime.fromisoformat(start_time)
-            end = datetime.fromisoformat(complete_time) if complete_time else datetime.now()
-
-            elapsed = end - start
-            total_seconds = int(elapsed.total_seconds())
-
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-
-            return f"{hours}h {minutes}m"
-
-        except Exception:
-            return "-"
+        self.results_model.set_records(results)
 
     def _add_to_history(self, criteria: Dict[str, Any], result_count: int) -> None:
         """Add search to history."""
@@ -442,11 +425,10 @@ class AdvancedSearchDialog(QDialog):
         return ", ".join(parts) if parts else "전체 검색"
 
     @safe_slot("결과 선택 실패")
-    def _on_result_double_clicked(self) -> None:
+    def _on_result_double_clicked(self, index: QModelIndex) -> None:
         """Handle result double-click."""
-        current_row = self.results_table.currentRow()
-        if current_row >= 0 and current_row < len(self.search_results):
-            result = self.search_results[current_row]
+        if index.isValid():
+            result = self.results_model.record(index.row())
             self.result_selected.emit(result)
             Toast.info(self, f"선택: {result.get('serial_number', '')}")
 
@@ -528,7 +510,7 @@ class AdvancedSearchDialog(QDialog):
                     result.get("status", ""),
                     result.get("start_time", ""),
                     result.get("complete_time", ""),
-                    self._calculate_elapsed(
+                    _calculate_elapsed(
                         result.get("start_time"),
                         result.get("complete_time")
                     )
@@ -1,9 +1,13 @@
 """
 Report Dialog for generating and exporting production reports.
+
+Generating a report fetches only its summary and first page for the
+preview. Exports run on a ReportExportWorker thread that streams the
+report page by page into the file, with progress and cancel.
 """
 import logging
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from PySide6.QtCore import QDate, QThread, Signal
 from PySide6.QtWidgets import (
@@ -12,7 +16,7 @@ from PySide6.QtWidgets import (
 )
 
 from utils.exception_handler import safe_slot
-from utils.export_utils import ExcelExporter, PDFExporter
+from utils.export_utils import CSVExporter, ExcelExporter, ExportCancelled, PDFExporter
 from utils.report_generator import ReportData, ReportGenerator
 from utils.theme_manager import get_theme
 from widgets.toast_notification import Toast
@@ -40,22 +44,11 @@ class ReportGenerationWorker(QThread):
         self.kwargs = kwargs
 
     def run(self) -> None:
-        """Execute report generation."""
+        """Execute report generation (summary and first page only)."""
         try:
             self.progress.emit(10, "보고서 생성 중...")
 
-            if self.report_type == "daily_production":
-                report = self.report_generator.generate_daily_production_report(**self.kwargs)
-            elif self.report_type == "lot_progress":
-                report = self.report_generator.generate_lot_progress_report(**self.kwargs)
-            elif self.report_type == "wip_status":
-                report = self.report_generator.generate_wip_status_report(**self.kwargs)
-            elif self.report_type == "process_performance":
-                report = self.report_generator.generate_process_performance_report(**self.kwargs)
-            elif self.report_type == "defect_analysis":
-                report = self.report_generator.generate_defect_analysis_report(**self.kwargs)
-            else:
-                raise ValueError(f"Unknown report type: {self.report_type}")
+            report = self.report_generator.open_report(self.report_type, **self.kwargs).report
 
             self.progress.emit(90, "보고서 처리 중...")
             self.progress.emit(100, "완료")
@@ -67,6 +60,60 @@ class ReportGenerationWorker(QThread):
             self.error.emit(error_msg)
 
 
+class ReportExportWorker(QThread):
+    """Background worker streaming a report into an Excel, CSV or PDF file."""
+
+    EXPORTERS = {"excel": ExcelExporter, "csv": CSVExporter, "pdf": PDFExporter}
+
+    progress = Signal(int, int)  # Rows written, total rows
+    finished = Signal(str, int)  # File path, rows written
+    cancelled = Signal()
+    error = Signal(str)          # Error message
+
+    def __init__(
+        self,
+        report_generator: ReportGenerator,
+        report_type: str,
+        kwargs: Dict[str, Any],
+        export_format: str,
+        file_path: str
+    ) -> None:
+        super().__init__()
+        self.report_generator = report_generator
+        self.report_type = report_type
+        self.kwargs = kwargs
+        self.exporter = self.EXPORTERS[export_format]
+        self.file_path = file_path
+        self._is_cancelled = False
+
+    def run(self) -> None:
+        """Fetch the report page by page and write each page as it arrives."""
+        try:
+            stream = self.report_generator.open_report(self.report_type, **self.kwargs)
+            rows = self.exporter.export_stream(
+                stream.report,
+                stream.pages,
+                self.file_path,
+                total=stream.total,
+                on_progress=self.progress.emit,
+                is_cancelled=lambda: self._is_cancelled
+            )
+            self.finished.emit(self.file_path, rows)
+
+        except ExportCancelled:
+            logger.info(f"Report export cancelled: {self.file_path}")
+            self.cancelled.emit()
+
+        except Exception as e:
+            error_msg = f"내보내기 실패: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            self.error.emit(error_msg)
+
+    def cancel(self) -> None:
+        """Stop the export before the next page; the partial file is removed."""
+        self._is_cancelled = True
+
+
 class ReportDialog(QDialog):
     """Report generation and export dialog."""
 
@@ -92,7 +139,9 @@ class ReportDialog(QDialog):
         self.config = config
         self.report_generator = ReportGenerator(api_client)
         self.current_report: ReportData = None
+        self.current_request: Optional[tuple] = None  # (report_type, kwargs) of current_report
         self.worker: ReportGenerationWorker = None
+        self.export_worker: Optional[ReportExportWorker] = None
 
         self.setWindowTitle("보고서 생성")
         self.setMinimumSize(800, 600)
@@ -176,6 +225,12 @@ class ReportDialog(QDialog):
         self.export_pdf_btn.setEnabled(False)
         button_layout.addWidget(self.export_pdf_btn)
 
+        self.cancel_export_btn = QPushButton("내보내기 취소")
+        self.cancel_export_btn.setProperty("variant", "secondary")
+        self.cancel_export_btn.clicked.connect(self._on_cancel_export_clicked)
+        self.cancel_export_btn.setVisible(False)
+        button_layout.addWidget(self.cancel_export_btn)
+
         close_btn = QPushButton("닫기")
         close_btn.setProperty("variant", "secondary")
         close_btn.clicked.connect(self.reject)
@@ -330,6 +385,7 @@ class ReportDialog(QDialog):
             return
 
         # Start worker
+        self.current_request = (report_type, kwargs)
         self.worker = ReportGenerationWorker(self.report_generator, report_type, **kwargs)
         self.worker.progress.connect(self._on_progress)
         self.worker.finished.connect(self._on_report_generated)
@@ -416,21 +472,11 @@ class ReportDialog(QDialog):
             self,
             "Excel 내보내기",
             file_name,
-            "Excel Files (*.xlsx);;All Files (*)"
+            "Excel Files (*.xlsx);;CSV Files (*.csv);;All Files (*)"
         )
 
         if file_path:
-            try:
-                self._export_to_excel(file_path)
-                Toast.success(self, f"Excel로 내보냈습니다: {file_path}")
-            except Exception as e:
-                logger.error(f"Excel export failed: {e}")
-                Toast.danger(self, f"Excel 내보내기 실패: {str(e)}")
-
-    def _export_to_excel(self, file_path: str) -> None:
-        """Export report to Excel file."""
-        ExcelExporter.export_report(self.current_report, file_path)
-        logger.info(f"Exported report to Excel: {file_path}")
+            self._start_export("csv" if file_path.lower().endswith(".csv") else "excel", file_path)
 
     @safe_slot("PDF 내보내기 실패")
     def _on_export_pdf_clicked(self) -> None:
@@ -450,14 +496,66 @@ class ReportDialog(QDialog):
         )
 
         if file_path:
-            try:
-                self._export_to_pdf(file_path)
-                Toast.success(self, f"PDF로 내보냈습니다: {file_path}")
-            except Exception as e:
-                logger.error(f"PDF export failed: {e}")
-                Toast.danger(self, f"PDF 내보내기 실패: {str(e)}")
-
-    def _export_to_pdf(self, file_path: str) -> None:
-        """Export report to PDF file."""
-        PDFExporter.export_report(self.current_report, file_path)
-        logger.info(f"Exported report to PDF: {file_path}")
+            self._start_export("pdf", file_path)
+
+    def _start_export(self, export_format: str, file_path: str) -> None:
+        """Stream the current report into file_path on a worker thread."""
+        if self.export_worker and self.export_worker.isRunning():
+            Toast.warning(self, "내보내기 중입니다. 잠시만 기다려 주세요.")
+            return
+
+        report_type, kwargs = self.current_request
+        self.export_worker = ReportExportWorker(
+            self.report_generator, report_type, kwargs, export_format, file_path
+        )
+        self.export_worker.progress.connect(self._on_export_progress)
+        self.export_worker.finished.connect(self._on_export_finished)
+        self.export_worker.cancelled.connect(self._on_export_cancelled)
+        self.export_worker.error.connect(self._on_export_error)
+
+        self._set_exporting(True)
+        self.export_worker.start()
+
+    def _set_exporting(self, exporting: bool) -> None:
+        """Toggle buttons and progress bar while an export runs."""
+        self.progress_bar.setVisible(exporting)
+        self.progress_bar.setValue(0)
+        self.cancel_export_btn.setVisible(exporting)
+        self.cancel_export_btn.setEnabled(exporting)
+        self.generate_btn.setEnabled(not exporting)
+        self.export_excel_btn.setEnabled(not exporting)
+        self.export_pdf_btn.setEnabled(not exporting)
+
+    def _on_export_progress(self, rows: int, total: int) -> None:
+        """Handle export progress update."""
+        self.progress_bar.setValue(rows * 100 // total if total else 100)
+        logger.debug(f"Report export: {rows}/{total} rows")
+
+    def _on_cancel_export_clicked(self) -> None:
+        """Handle cancel export button click."""
+        if self.export_worker and self.export_worker.isRunning():
+            self.export_worker.cancel()
+            self.cancel_export_btn.setEnabled(False)
+
+    def _on_export_finished(self, file_path: str, rows: int) -> None:
+        """Handle export completion."""
+        self._set_exporting(False)
+        logger.info(f"Exported report ({rows} rows): {file_path}")
+        Toast.success(self, f"내보냈습니다: {file_path}")
+
+    def _on_export_cancelled(self) -> None:
+        """Handle export cancellation."""
+        self._set_exporting(False)
+        Toast.info(self, "내보내기를 취소했습니다")
+
+    def _on_export_error(self, error_msg: str) -> None:
+        """Handle export error."""
+        self._set_exporting(False)
+        Toast.danger(self, error_msg)
+
+    def reject(self) -> None:
+        """Cancel a running export before closing."""
+        if self.export_worker and self.export_worker.isRunning():
+            self.export_worker.cancel()
+            self.export_worker.wait()
+        super().reject()
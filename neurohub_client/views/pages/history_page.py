@@ -5,12 +5,14 @@ from datetime import datetime
 from typing import Any, Optional, Set
 
 from PySide6.QtCore import QDate, Qt, Slot
-from PySide6.QtGui import QColor, QTextCharFormat
+from PySide6.QtGui import QBrush, QColor, QTextCharFormat
 from PySide6.QtWidgets import (
-    QCalendarWidget, QComboBox, QDialog, QFrame, QHBoxLayout, QHeaderView,
-    QLabel, QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget
+    QAbstractItemView, QCalendarWidget, QComboBox, QDialog, QFrame,
+    QHBoxLayout, QHeaderView, QLabel, QPushButton, QTableView, QVBoxLayout,
+    QWidget
 )
 
+from models.table_models import Column, RecordFilterProxyModel, RecordTableModel
 from services.history_manager import (
     EventResult, EventType, WorkEvent, get_history_manager
 )
@@ -18,6 +20,53 @@ from utils.theme_manager import get_theme
 
 theme = get_theme()
 
+# Success: SUCCESS, PASS / Fail: FAIL, ERROR
+SUCCESS_RESULTS = {EventResult.SUCCESS, EventResult.PASS}
+FAIL_RESULTS = {EventResult.FAIL, EventResult.ERROR}
+
+_FILTERS = {
+    "all": None,
+    "success": lambda event: event.result in SUCCESS_RESULTS,
+    "error": lambda event: event.result in FAIL_RESULTS,
+}
+
+_TYPE_TEXT = {
+    EventType.START: "착공",
+    EventType.COMPLETE: "완공",
+    EventType.ERROR: "에러",
+}
+
+_RESULT_TEXT = {
+    EventResult.SUCCESS: "성공",
+    EventResult.PASS: "PASS",
+    EventResult.FAIL: "FAIL",
+    EventResult.ERROR: "에러",
+}
+
+_RESULT_COLOR_KEYS = {
+    EventResult.SUCCESS: 'colors.success.main',
+    EventResult.PASS: 'colors.success.main',
+    EventResult.FAIL: 'colors.warning.main',
+    EventResult.ERROR: 'colors.danger.main',
+}
+
+
+def _result_brush(event: WorkEvent) -> Optional[QBrush]:
+    key = _RESULT_COLOR_KEYS.get(event.result)
+    return theme.get_qt_brush(key) if key else None
+
+
+HISTORY_COLUMNS = [
+    Column("시간", lambda e: e.timestamp.strftime("%H:%M:%S"), Qt.AlignCenter,
+           sort_key=lambda e: e.timestamp),
+    Column("유형", lambda e: _TYPE_TEXT.get(e.event_type, str(e.event_type)), Qt.AlignCenter),
+    Column("WIP/LOT", lambda e: e.wip_id or e.lot_number or "-", Qt.AlignCenter),
+    Column("결과", lambda e: _RESULT_TEXT.get(e.result, str(e.result)), Qt.AlignCenter,
+           foreground=_result_brush),
+    Column("공정", lambda e: e.process_name or "-", Qt.AlignCenter),
+    Column("메시지", lambda e: e.message),
+]
+
 
 class HistoryPage(QWidget):
     """Page displaying work history with filtering."""
@@ -28,7 +77,10 @@ class HistoryPage(QWidget):
         self.history_manager = get_history_manager()
         self._current_filter: str = "all"
         self._current_date: Optional[str] = None  # None means today
+        self._loaded_date: Optional[str] = None  # Date currently in the model
         self._available_dates: Set[str] = set()
+        self._success_count: int = 0
+        self._fail_count: int = 0
         self._setup_ui()
         self._connect_signals()
         self._load_available_dates()
@@ -194,17 +246,18 @@ class HistoryPage(QWidget):
         stats_layout.addStretch()
         layout.addWidget(stats_frame)
 
-        # Table
-        self.table = QTableWidget()
+        # Table (virtualized: rows are rendered from the model on demand)
+        self.model = RecordTableModel(HISTORY_COLUMNS, parent=self)
+        self.proxy_model = RecordFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+
+        self.table = QTableView()
         self.table.setObjectName("history_table")
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "시간", "유형", "WIP/LOT", "결과", "공정", "메시지"
-        ])
+        self.table.setModel(self.proxy_model)
 
         # Table styling
         self.table.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {bg_default};
                 border: 1px solid {border_default};
                 border-radius: 6px;
@@ -212,15 +265,15 @@ class HistoryPage(QWidget):
                 color: {text_primary};
                 font-size: 12px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 8px;
                 border-bottom: 1px solid {border_default};
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {bg_default};
                 color: {text_primary};
             }}
-            QTableWidget::item:focus {{
+            QTableView::item:focus {{
                 background-color: {bg_default};
                 border: none;
                 outline: none;
@@ -237,20 +290,25 @@ class HistoryPage(QWidget):
         """)
 
         # Header settings
+        # ResizeToContents measures every row, so fixed widths are used for
+        # the short columns to keep large days responsive.
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Time
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # Type
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # WIP/LOT
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Result
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Process
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        for column, width in enumerate((90, 70, 160, 80, 120)):
+            header.resizeSection(column, width)
         header.setSectionResizeMode(5, QHeaderView.Stretch)  # Message
 
-        self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.NoSelection)  # No selection highlighting
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(32)
+
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)  # No selection highlighting
         self.table.setAlternatingRowColors(True)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)  # Read-only
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # Read-only
         self.table.setFocusPolicy(Qt.NoFocus)  # No focus indicator
+        self.table.setWordWrap(False)
 
         layout.addWidget(self.table)
 
@@ -261,11 +319,20 @@ class HistoryPage(QWidget):
 
     @Slot(object)
     def _on_event_added(self, event: WorkEvent) -> None:
-        """Handle new event added."""
-        _ = event  # Unused but required by signal
-        # Reload available dates (for calendar validation)
-        self._load_available_dates()
-        self._refresh_table()
+        """Handle new event added (inserted as a single row)."""
+        event_date = event.timestamp.strftime("%Y-%m-%d")
+        self._available_dates.add(event_date)
+
+        if self._current_date is not None:
+            return  # Viewing a past date
+        if event_date != self._loaded_date:
+            # Day rolled over while viewing "today"
+            self._refresh_table()
+            return
+
+        self.model.prepend_records([event])
+        self._count_results([event])
+        self._update_stats()
 
     def _load_available_dates(self) -> None:
         """Cache available history dates (for calendar validation)."""
@@ -295,7 +362,7 @@ class HistoryPage(QWidget):
         """Handle filter change."""
         filters = ["all", "success", "error"]
         self._current_filter = filters[index] if index < len(filters) else "all"
-        self._refresh_table()
+        self.proxy_model.set_predicate(_FILTERS[self._current_filter])
 
     def _on_clear_clicked(self) -> None:
         """Handle clear button click."""
@@ -303,100 +370,31 @@ class HistoryPage(QWidget):
         self._load_available_dates()  # Refresh date combo
 
     def _refresh_table(self) -> None:
-        """Refresh table with current events."""
-        # Get events based on date filter
-        if self._current_date is None:
-            # Today - use in-memory cache
-            all_events = self.history_manager.get_all_events()
-        else:
-            # Load from specific date file
-            all_events = self.history_manager.load_events_by_date(self._current_date)
-
-        # Apply result filter
-        # Success: SUCCESS, PASS / Fail: FAIL, ERROR
-        success_results = {EventResult.SUCCESS, EventResult.PASS}
-        fail_results = {EventResult.FAIL, EventResult.ERROR}
-
-        if self._current_filter == "success":
-            events = [e for e in all_events if e.result in success_results]
-        elif self._current_filter == "error":
-            events = [e for e in all_events if e.result in fail_results]
-        else:
-            events = all_events
-
-        # Update stats
-        success_count = len([e for e in all_events if e.result in success_results])
-        fail_count = len([e for e in all_events if e.result in fail_results])
-
-        self.total_label.setText(f"전체: {len(all_events)}")
-        self.success_label.setText(f"성공: {success_count}")
-        self.error_label.setText(f"실패: {fail_count}")
-
-        # Populate table
-        self.table.setRowCount(len(events))
-
-        success_main = theme.get('colors.success.main')
-        danger_main = theme.get('colors.danger.main')
-        warning_main = theme.get('colors.warning.main')
-        brand = theme.get('colors.brand.main')
-
-        for row, event in enumerate(events):
-            # Time
-            time_item = QTableWidgetItem(event.timestamp.strftime("%H:%M:%S"))
-            time_item.setTextAlignment(Qt.AlignCenter)
-            time_item.setFlags(time_item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
-            self.table.setItem(row, 0, time_item)
-
-            # Type
-            type_text = {
-                EventType.START: "착공",
-                EventType.COMPLETE: "완공",
-                EventType.ERROR: "에러",
-            }.get(event.event_type, str(event.event_type))
-            type_item = QTableWidgetItem(type_text)
-            type_item.setTextAlignment(Qt.AlignCenter)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
-            self.table.setItem(row, 1, type_item)
-
-            # WIP/LOT
-            wip_lot = event.wip_id or event.lot_number or "-"
-            wip_item = QTableWidgetItem(wip_lot)
-            wip_item.setTextAlignment(Qt.AlignCenter)
-            wip_item.setFlags(wip_item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
-            self.table.setItem(row, 2, wip_item)
-
-            # Result with color
-            result_text = {
-                EventResult.SUCCESS: "성공",
-                EventResult.PASS: "PASS",
-                EventResult.FAIL: "FAIL",
-                EventResult.ERROR: "에러",
-            }.get(event.result, str(event.result))
-            result_item = QTableWidgetItem(result_text)
-            result_item.setTextAlignment(Qt.AlignCenter)
-            result_item.setFlags(result_item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
-
-            if event.result == EventResult.SUCCESS:
-                result_item.setForeground(QColor(success_main))
-            elif event.result == EventResult.PASS:
-                result_item.setForeground(QColor(success_main))
-            elif event.result == EventResult.FAIL:
-                result_item.setForeground(QColor(warning_main))
-            elif event.result == EventResult.ERROR:
-                result_item.setForeground(QColor(danger_main))
-
-            self.table.setItem(row, 3, result_item)
-
-            # Process
-            process_item = QTableWidgetItem(event.process_name or "-")
-            process_item.setTextAlignment(Qt.AlignCenter)
-            process_item.setFlags(process_item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
-            self.table.setItem(row, 4, process_item)
-
-            # Message
-            message_item = QTableWidgetItem(event.message)
-            message_item.setFlags(message_item.flags() & ~Qt.ItemIsEditable & ~Qt.ItemIsSelectable)
-            self.table.setItem(row, 5, message_item)
+        """Reload the model with the selected date's events."""
+        date_str = self._current_date or datetime.now().strftime("%Y-%m-%d")
+        events = self.history_manager.load_events_by_date(date_str)
+
+        self._loaded_date = date_str
+        self._success_count = 0
+        self._fail_count = 0
+        self._count_results(events)
+
+        self.model.set_records(events)
+        self._update_stats()
+
+    def _count_results(self, events: Any) -> None:
+        """Accumulate success/fail counters."""
+        for event in events:
+            if event.result in SUCCESS_RESULTS:
+                self._success_count += 1
+            elif event.result in FAIL_RESULTS:
+                self._fail_count += 1
+
+    def _update_stats(self) -> None:
+        """Update stats labels from the counters."""
+        self.total_label.setText(f"전체: {self.model.rowCount()}")
+        self.success_label.setText(f"성공: {self._success_count}")
+        self.error_label.setText(f"실패: {self._fail_count}")
 
     def cleanup(self) -> None:
         """Cleanup resources."""
@@ -9,11 +9,11 @@ from typing import Any, Dict
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPainter
 from PySide6.QtWidgets import (
-    QCheckBox, QGroupBox, QHBoxLayout, QHeaderView, QLabel, QListWidget,
-    QListWidgetItem, QPushButton, QTableWidget, QTableWidgetItem,
-    QVBoxLayout, QWidget
+    QAbstractItemView, QCheckBox, QGroupBox, QHBoxLayout, QHeaderView, QLabel,
+    QListWidget, QListWidgetItem, QPushButton, QTableView, QVBoxLayout, QWidget
 )
 
+from models.table_models import Column, RecordTableModel
 from utils.exception_handler import safe_slot
 from utils.theme_manager import get_theme
 from widgets.toast_notification import Toast
@@ -33,6 +33,21 @@ logger = logging.getLogger(__name__)
 theme = get_theme()
 
 
+def _lot_progress(lot_data: Dict[str, Any]) -> str:
+    total = lot_data.get("total_quantity", 0)
+    if total > 0:
+        return f"{int(lot_data.get('completed_quantity', 0) / total * 100)}%"
+    return "--"
+
+
+LOT_COLUMNS = [
+    Column("LOT 번호", lambda lot: lot.get("lot_number", "")),
+    Column("총 수량", lambda lot: str(lot.get("total_quantity", 0))),
+    Column("완료", lambda lot: str(lot.get("completed_quantity", 0))),
+    Column("진행률", _lot_progress),
+]
+
+
 class WIPDashboardPage(QWidget):
     """WIP Dashboard page with statistics and charts."""
 
@@ -118,11 +133,10 @@ class WIPDashboardPage(QWidget):
         lot_group = QGroupBox("LOT별 진행률")
         lot_layout = QVBoxLayout(lot_group)
 
-        self.lot_table = QTableWidget()
-        self.lot_table.setColumnCount(4)
-        self.lot_table.setHorizontalHeaderLabels([
-            "LOT 번호", "총 수량", "완료", "진행률"
-        ])
+        self.lot_model = RecordTableModel(LOT_COLUMNS, parent=self)
+        self.lot_table = QTableView()
+        self.lot_table.setModel(self.lot_model)
+        self.lot_table.verticalHeader().setVisible(False)
 
         header = self.lot_table.horizontalHeader()
         header.setStretchLastSection(False)
@@ -131,8 +145,8 @@ class WIPDashboardPage(QWidget):
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
 
-        self.lot_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.lot_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.lot_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.lot_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.lot_table.setAlternatingRowColors(True)
 
         lot_layout.addWidget(self.lot_table)
@@ -212,35 +226,7 @@ class WIPDashboardPage(QWidget):
 
     def _update_lot_table(self, stats: Dict[str, Any]) -> None:
         """Update LOT progress table."""
-        by_lot = stats.get("by_lot", [])
-
-        # Clear table
-        self.lot_table.setRowCount(0)
-
-        # Populate table
-        for lot_data in by_lot:
-            row = self.lot_table.rowCount()
-            self.lot_table.insertRow(row)
-
-            # LOT 번호
-            lot_number = lot_data.get("lot_number", "")
-            self.lot_table.setItem(row, 0, QTableWidgetItem(lot_number))
-
-            # 총 수량
-            total = lot_data.get("total_quantity", 0)
-            self.lot_table.setItem(row, 1, QTableWidgetItem(str(total)))
-
-            # 완료
-            completed = lot_data.get("completed_quantity", 0)
-            self.lot_table.setItem(row, 2, QTableWidgetItem(str(completed)))
-
-            # 진행률
-            if total > 0:
-                progress = int(completed / total * 100)
-                progress_text = f"{progress}%"
-            else:
-                progress_text = "--"
-            self.lot_table.setItem(row, 3, QTableWidgetItem(progress_text))
+        self.lot_model.set_records(stats.get("by_lot", []))
 
     def _update_alerts(self, stats: Dict[str, Any]) -> None:
         """Update alert list."""